@@ -21,7 +21,7 @@ from src.backend.config import get_config  # Access application configuration se
 from src.backend.utils.logging.logger import get_logger  # Configure logging for the DAG
 from src.backend.airflow.plugins.custom_operators.quality_operators import DataQualityValidationOperator, QualityBasedBranchOperator, load_validation_rules  # Use custom quality operators for data validation
 from src.backend.airflow.plugins.custom_operators.healing_operators import DataQualityHealingOperator, PipelineHealingOperator  # Use custom healing operators for self-healing capabilities
-from src.backend.utils.storage.bigquery_client import BigQueryClient  # Interact with BigQuery for data processing
+from src.backend.utils.storage.bigquery_client import create_bigquery_client  # Interact with BigQuery for data processing
 from src.backend.utils.storage.gcs_client import GCSClient  # Interact with GCS for data access
 from src.backend.utils.monitoring.metric_client import MetricClient  # Report processing metrics to monitoring system
 
@@ -111,12 +111,12 @@ def transform_data(context: dict, dataset_id: str) -> dict:
     source_data_location = context['ti'].xcom_pull(task_ids='extract_data', key='source_data_location') or transformation_config.get('source_data_location')
 
     # Initialize BigQuery client for data access
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
 
     # Execute transformation SQL or custom transformation logic
     if transformation_config.get('transformation_type') == 'sql':
         transformation_sql = transformation_config.get('transformation_sql')
-        transformed_data = bq_client.execute_query(transformation_sql, source_data_location)
+        transformed_data = bq_client.execute_query(transformation_sql, {"source_data_location": source_data_location})
     else:
         # Implement custom transformation logic here
         transformed_data = None
@@ -141,7 +141,7 @@ def enrich_data(context: dict, dataset_id: str) -> dict:
     transformed_data_location = context['ti'].xcom_pull(task_ids='transform_data', key='transformed_data_location')
 
     # Initialize BigQuery client for data access
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
 
     # For each enrichment source:
     for source in enrichment_config.get('enrichment_sources', []):
@@ -199,7 +199,7 @@ def load_processed_data(context: dict, dataset_id: str) -> dict:
     processed_data_location = context['ti'].xcom_pull(task_ids='heal_data_quality_issues', key='healed_data_location')
 
     # Initialize BigQuery client
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
 
     # Configure loading options (write disposition, partitioning, clustering)
     # Execute load operation to target table
@@ -188,6 +188,18 @@ def cleanup_old_data(context: dict) -> dict:
     # Return cleanup statistics
     return {'metrics_deleted': metrics_deleted, 'alerts_deleted': alerts_deleted}
 
+def maintain_metric_rollups(context: dict) -> dict:
+    """Establish metric rollup coverage and compact settled rollups"""
+    metrics_repo = MetricsRepository()
+    result = metrics_repo.maintain_metric_rollups()
+
+    # Log maintenance statistics
+    logger.info(f"Metric rollups cover from {result['coverage_start']}, compacted {result['compacted']}")
+
+    # Return maintenance results
+    return {'coverage_start': str(result['coverage_start']), 'backfilled': result['backfilled'],
+            'compacted': result['compacted']}
+
 def train_anomaly_detection_models(context: dict) -> dict:
     """Periodically train or update anomaly detection models"""
     # Check if training is due based on schedule
@@ -261,6 +273,15 @@ with dag:
         dag=dag
     )
 
+    # Task to maintain metric rollups
+    maintain_rollups_task = PythonOperator(
+        task_id='maintain_metric_rollups',
+        python_callable=maintain_metric_rollups,
+        provide_context=True,
+        trigger_rule=TriggerRule.ALL_DONE,
+        dag=dag
+    )
+
     # Task to train anomaly detection models
     train_models_task = PythonOperator(
         task_id='train_anomaly_detection_models',
@@ -273,5 +294,5 @@ with dag:
     # Define task dependencies
     collect_metrics_task >> detect_anomalies_task >> generate_alerts_task >> send_notifications_task
     generate_alerts_task >> update_dashboards_task
-    update_dashboards_task >> cleanup_old_data_task
+    update_dashboards_task >> cleanup_old_data_task >> maintain_rollups_task
     train_models_task
\ No newline at end of file
@@ -102,7 +102,7 @@ class EnhancedBigQueryHook(BigQueryHook):
         self.location = location
 
         # Initialize BigQueryClient for enhanced operations
-        self._bq_client = bigquery_client.BigQueryClient(project=self.project_id, location=self.location)
+        self._bq_client = bigquery_client.create_bigquery_client(project_id=self.project_id, location=self.location)
 
         # Initialize MetricClient for performance tracking
         self._metric_client = metric_client.MetricClient(project_id=self.project_id)
@@ -134,8 +134,11 @@ class EnhancedBigQueryHook(BigQueryHook):
         # Start performance tracking
         start_time = time.time()
 
+        # Build the job configuration from the legacy SQL flag and any extra job settings
+        job_config = bigquery_client.BigQueryJobConfig(use_legacy_sql=use_legacy_sql, **(job_config_args or {}))
+
         # Execute query using BigQueryClient
-        results = self._bq_client.execute_query(sql, query_params=formatted_params, use_legacy_sql=use_legacy_sql, timeout=timeout, job_config_args=job_config_args)
+        results = self._bq_client.execute_query(sql, parameters=formatted_params, timeout=timeout, job_config=job_config)
 
         # Record query performance metrics
         duration = time.time() - start_time
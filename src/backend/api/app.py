@@ -13,6 +13,8 @@ from fastapi.responses import JSONResponse  # fastapi version: ^0.95.0
 from ..config import get_config  # src/backend/config.py
 from ..constants import API_VERSION, API_PREFIX  # src/backend/constants.py
 from ..utils.logging.logger import get_logger, setup_logging  # src/backend/utils/logging/logger.py
+from ..utils.monitoring.profiler import start_sampling_profiler, stop_sampling_profiler  # src/backend/utils/monitoring/profiler.py
+from ..utils.storage.write_buffer import flush_write_buffers  # src/backend/utils/storage/write_buffer.py
 from .routes import routers  # src/backend/api/routes/__init__.py
 from .middleware import AuthMiddleware, setup_cors_middleware, ErrorMiddleware, LoggingMiddleware  # src/backend/api/middleware/__init__.py
 from .models.response_models import HealthCheckResponse  # src/backend/api/models/response_models.py
@@ -52,6 +54,19 @@ def create_app() -> FastAPI:
     for router in routers:
         fast_app.include_router(router, prefix=API_PREFIX)
 
+    # Start the sampling profiler if monitoring.profiling.sampling.enabled is set
+    @fast_app.on_event("startup")
+    async def start_background_services() -> None:
+        """Starts background services enabled in the configuration"""
+        start_sampling_profiler()
+
+    # Stop background services so their last results are reported and buffered rows are written
+    @fast_app.on_event("shutdown")
+    async def stop_background_services() -> None:
+        """Stops background services started with the application"""
+        stop_sampling_profiler()
+        flush_write_buffers()
+
     # Add health check endpoint
     @fast_app.get("/health", tags=["System"])
     async def get_health(request: Request) -> HealthCheckResponse:
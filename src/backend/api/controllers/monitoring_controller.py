@@ -11,6 +11,8 @@ from ..models.request_models import PaginationParams, DateRangeParams, AlertConf
 from ..models.response_models import PipelineMetricListResponse, PipelineMetricResponse, AlertListResponse, AlertResponse, MetricTimeSeriesResponse, AlertConfigResponse, DataResponse
 from ..models.error_models import ResourceNotFoundError, ValidationError
 from ..utils.response_utils import create_response_metadata, create_success_response, create_list_response
+from ...utils.storage.keyset_pagination import get_next_cursor
+from ...utils.errors.error_types import ValidationError as CursorValidationError
 from ...utils.logging.logger import logger  # Logging functionality
 
 
@@ -154,8 +156,12 @@ async def get_alerts_controller(
         start_date = date_range.start_date
         end_date = date_range.end_date
         
-        # Call monitoring_service.get_alerts with the parameters
-        alerts, total_count = await get_alerts(page, page_size, start_date, end_date, severity, status, component, pipeline_id)
+        # Call monitoring_service.get_alerts with the parameters, resuming after the cursor if given
+        alerts, total_count = await get_alerts(page, page_size, start_date, end_date, severity, status, component, pipeline_id,
+                                               cursor=pagination.cursor)
+        
+        # Alerts are listed newest first by creation time, with the alert ID as tiebreaker
+        next_cursor = get_next_cursor(alerts, "created_at", "alert_id", page_size)
         
         # Create response metadata with pagination information
         metadata = create_response_metadata()
@@ -168,8 +174,13 @@ async def get_alerts_controller(
             total_items=total_count,
             request=Request,  # Assuming Request is available in this context
             message="Alerts retrieved successfully",
-            request_id=metadata.request_id
+            request_id=metadata.request_id,
+            next_cursor=next_cursor
         )
+    except CursorValidationError as e:
+        # Handle malformed cursors or cursors issued for another sort order
+        logger.error(f"Invalid alert list cursor: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         # Handle exceptions and return appropriate error responses
         logger.error(f"Error listing alerts: {e}")
@@ -25,6 +25,7 @@ class PaginationParams(BaseModel):
     page_size: int = Field(20, ge=1, le=100, description="Number of items per page")
     sort_by: Optional[str] = Field(None, description="Field to sort by")
     descending: Optional[bool] = Field(False, description="Sort in descending order if true")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over page")
     
     @validator('page', 'page_size', pre=True)
     def validate_pagination(cls, v, values):
@@ -58,6 +58,7 @@ class PaginationMetadata(BaseModel):
     total_pages: int
     next_page: Optional[str] = None
     previous_page: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 # Generic paginated response for list endpoints
 class PaginatedResponse(Generic[T], BaseModel):
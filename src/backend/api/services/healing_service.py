@@ -16,6 +16,7 @@ from src.backend.self_healing.ai import pattern_recognizer  # Use pattern recogn
 from src.backend.self_healing.ai import root_cause_analyzer  # Use root cause analysis for identifying underlying issues
 from src.backend.self_healing.correction import data_corrector  # Apply corrections to data quality issues
 from src.backend.self_healing.correction import pipeline_adjuster  # Apply corrections to pipeline execution issues
+from src.backend.self_healing.correction import issue_coalescer  # Share one analysis across duplicate issues
 from src.backend.self_healing.config import healing_config  # Access and update self-healing configuration
 from src.backend.db.models import issue_pattern  # Access and manage issue pattern data
 from src.backend.db.models import healing_action  # Access and manage healing action data
@@ -375,7 +376,12 @@ class HealingService:
         self._pipeline_adjuster = pipeline_adjuster.PipelineAdjuster(self._config)
         self._healing_repository = healing_repository.HealingRepository()
         self._gcs_client = gcs_client.GCSClient()
-        self._bq_client = bigquery_client.BigQueryClient()
+        self._bq_client = bigquery_client.create_bigquery_client()
+        # Near-identical issues within the window share one classification, analysis and correction
+        self._coalescer = issue_coalescer.IssueCoalescer(
+            name="healing_service",
+            window_seconds=self._config.get("coalescing_window_seconds", issue_coalescer.DEFAULT_COALESCING_WINDOW_SECONDS)
+        )
         logger.info("HealingService initialized")
 
     def classify_issue(self, issue_data: dict) -> issue_classifier.IssueClassification:
@@ -447,8 +453,7 @@ class HealingService:
         if not isinstance(quality_issue_data, dict):
             logger.error("Invalid quality_issue_data format. Must be a dictionary.")
             raise ValueError("Invalid quality_issue_data format. Must be a dictionary.")
-        # TODO: Implement data quality issue processing logic
-        return {"status": "Not implemented"}
+        return self._process_issue(quality_issue_data, "data_quality")
 
     def process_pipeline_failure(self, pipeline_failure_data: dict) -> dict:
         """Process and correct a pipeline execution failure
@@ -463,8 +468,58 @@ class HealingService:
         if not isinstance(pipeline_failure_data, dict):
             logger.error("Invalid pipeline_failure_data format. Must be a dictionary.")
             raise ValueError("Invalid pipeline_failure_data format. Must be a dictionary.")
-        # TODO: Implement pipeline failure processing logic
-        return {"status": "Not implemented"}
+        return self._process_issue(pipeline_failure_data, "pipeline")
+
+    def get_coalescing_stats(self) -> dict:
+        """Get statistics about analyses shared between duplicate issues
+
+        Returns:
+            dict: Issues seen, analyses run, coalesced issues and coalescing ratio
+        """
+        return self._coalescer.get_stats()
+
+    def _process_issue(self, issue_data: dict, issue_category: str) -> dict:
+        """Process an issue once per fingerprint, sharing the result with duplicates
+
+        Args:
+            issue_data (dict): issue_data
+            issue_category (str): data_quality or pipeline
+
+        Returns:
+            dict: Processing result
+        """
+        issue_id = issue_data.get("issue_id") or str(uuid.uuid4())
+        fingerprint = issue_coalescer.issue_fingerprint({"issue_category": issue_category, **issue_data})
+        coalesced = self._coalescer.run(fingerprint, self._analyze_and_correct, issue_data, issue_id=issue_id,
+                                        target=issue_coalescer.recovery_target(issue_data))
+        result = dict(coalesced.result)
+        result["issue_id"] = issue_id
+        if coalesced.coalesced:
+            result["coalesced_with"] = coalesced.leader_id
+        return result
+
+    def _analyze_and_correct(self, issue_data: dict) -> dict:
+        """Classify an issue, match its pattern and correct it
+
+        Args:
+            issue_data (dict): issue_data
+
+        Returns:
+            dict: Processing result
+        """
+        classification = self.classify_issue(issue_data)
+        pattern, pattern_confidence = self.recognize_pattern(issue_data)
+        if classification is None or pattern is None:
+            success, correction_details = False, {"reason": "No classification or matching pattern"}
+        else:
+            success, correction_details = self.correct_issue(issue_data, classification, pattern)
+        return {
+            "status": "corrected" if success else "not_corrected",
+            "classification": classification.to_dict() if classification is not None else None,
+            "pattern_id": getattr(pattern, "pattern_id", None),
+            "pattern_confidence": pattern_confidence,
+            "correction_details": correction_details
+        }
 
     def reload_models(self) -> bool:
         """Reload AI models used by the healing service
@@ -22,6 +22,7 @@ from ...db.models.alert import Alert
 from ...utils.storage.bigquery_client import BigQueryClient
 from ...utils.monitoring.metric_client import MetricClient
 from ...utils.errors.error_types import ResourceNotFoundError, ValidationError
+from ...utils.concurrency.request_coalescer import SingleFlight, StaleWhileRevalidateCache
 
 # Initialize module logger
 logger = get_logger(__name__)
@@ -31,6 +32,15 @@ DEFAULT_PAGE_SIZE = 20
 DEFAULT_METRICS_LIMIT = 1000
 DEFAULT_TIME_WINDOW_HOURS = 24
 
+# Dashboard summary caching: fresh for max age, then served stale while one refresh runs
+DASHBOARD_MAX_AGE_CONFIG_KEY = "monitoring.dashboard.max_age_seconds"
+DASHBOARD_STALE_CONFIG_KEY = "monitoring.dashboard.stale_while_revalidate_seconds"
+DASHBOARD_WORKERS_CONFIG_KEY = "monitoring.dashboard.max_workers"
+DEFAULT_DASHBOARD_MAX_AGE_SECONDS = 15.0
+DEFAULT_DASHBOARD_STALE_SECONDS = 60.0
+DEFAULT_DASHBOARD_WORKERS = 8
+DASHBOARD_SUMMARY_KEY = "dashboard_summary"
+
 
 class MonitoringService:
     """Service class for monitoring and alerting functionality"""
@@ -56,7 +66,20 @@ class MonitoringService:
         self._metric_client = metric_client
 
         # Load monitoring configuration from application config
-        self._config = get_config().get("monitoring", {})
+        config = get_config()
+        self._config = config.get("monitoring", {})
+
+        # Dashboard sub-queries run concurrently, identical in-flight requests are shared,
+        # and summaries are served stale while a single background refresh runs
+        self._dashboard_queries = SingleFlight(
+            name="dashboard-query",
+            max_workers=int(config.get(DASHBOARD_WORKERS_CONFIG_KEY, DEFAULT_DASHBOARD_WORKERS))
+        )
+        self._dashboard_cache = StaleWhileRevalidateCache(
+            max_age_seconds=float(config.get(DASHBOARD_MAX_AGE_CONFIG_KEY, DEFAULT_DASHBOARD_MAX_AGE_SECONDS)),
+            stale_while_revalidate_seconds=float(config.get(DASHBOARD_STALE_CONFIG_KEY, DEFAULT_DASHBOARD_STALE_SECONDS)),
+            singleflight=SingleFlight(name="dashboard-summary", max_workers=2)
+        )
 
         # Log successful initialization
         logger.info("MonitoringService initialized")
@@ -125,8 +148,8 @@ class MonitoringService:
         # Return time series data dictionary
         return formatted_data
 
-    def get_alerts(self, page: int, page_size: int, start_time: datetime.datetime = None, end_time: datetime.datetime = None, severity: str = None, status: str = None, component: str = None, pipeline_id: str = None) -> Tuple[List[Alert], int]:
-        """Retrieves a paginated list of alerts with optional filtering"""
+    def get_alerts(self, page: int, page_size: int, start_time: datetime.datetime = None, end_time: datetime.datetime = None, severity: str = None, status: str = None, component: str = None, pipeline_id: str = None, cursor: str = None) -> Tuple[List[Alert], int]:
+        """Retrieves a paginated list of alerts with optional filtering, by page or by cursor"""
         # Build search criteria based on filters
         search_criteria = {
             "start_time": start_time,
@@ -143,7 +166,7 @@ class MonitoringService:
 
         # Use alert repository to search alerts
         alerts, total_count = self._alert_repository.search_alerts(
-            search_criteria=search_criteria, offset=offset, limit=limit
+            search_criteria=search_criteria, offset=offset, limit=limit, after=cursor
         )
 
         # Return tuple of alerts list and total count
@@ -275,27 +298,42 @@ class MonitoringService:
         # Return system metrics dictionary
         return formatted_metrics
 
-    def get_dashboard_summary(self) -> Dict[str, Any]:
-        """Retrieves a summary of monitoring data for the dashboard"""
-        # Collect pipeline health metrics
-        pipeline_health = self._metric_processor.get_pipeline_health_metrics()
-
-        # Collect alert statistics
-        alert_stats = self.get_alert_statistics()
-
-        # Collect anomaly statistics
-        anomaly_stats = self._anomaly_detector.get_anomaly_statistics()
-
-        # Collect recent executions data
-        recent_executions = self._metric_processor.get_recent_executions()
+    def get_dashboard_summary(self, max_age_seconds: float = None) -> Dict[str, Any]:
+        """Retrieves a summary of monitoring data for the dashboard
+
+        Concurrent viewers share one in-flight load, and a summary older than the max age
+        is still returned while a single background refresh replaces it.
+        """
+        return self._dashboard_cache.get(DASHBOARD_SUMMARY_KEY, self._load_dashboard_summary, max_age_seconds)
+
+    async def get_dashboard_summary_async(self, max_age_seconds: float = None) -> Dict[str, Any]:
+        """Retrieves the dashboard summary without blocking the event loop"""
+        return await self._dashboard_cache.get_async(DASHBOARD_SUMMARY_KEY, self._load_dashboard_summary, max_age_seconds)
+
+    def invalidate_dashboard_summary(self) -> None:
+        """Drops the cached dashboard summary so the next request reloads it"""
+        self._dashboard_cache.invalidate(DASHBOARD_SUMMARY_KEY)
+
+    def get_dashboard_cache_stats(self) -> Dict[str, Any]:
+        """Retrieves hit, stale hit, miss and coalescing counters of the dashboard cache"""
+        return self._dashboard_cache.get_stats()
+
+    def _load_dashboard_summary(self) -> Dict[str, Any]:
+        """Loads the dashboard summary, running the independent sub-queries concurrently"""
+        # Start all sub-queries at once so the load takes as long as the slowest one
+        futures = {
+            "pipeline_health": self._dashboard_queries.submit(
+                "pipeline_health", self._metric_processor.get_pipeline_health_metrics),
+            "alert_statistics": self._dashboard_queries.submit(
+                "alert_statistics", self.get_alert_statistics),
+            "anomaly_statistics": self._dashboard_queries.submit(
+                "anomaly_statistics", self._anomaly_detector.get_anomaly_statistics),
+            "recent_executions": self._dashboard_queries.submit(
+                "recent_executions", self._metric_processor.get_recent_executions),
+        }
 
         # Combine data into dashboard summary
-        dashboard_summary = {
-            "pipeline_health": pipeline_health,
-            "alert_statistics": alert_stats,
-            "anomaly_statistics": anomaly_stats,
-            "recent_executions": recent_executions,
-        }
+        dashboard_summary = {name: future.result() for name, future in futures.items()}
 
         # Return dashboard summary dictionary
         return dashboard_summary
@@ -20,7 +20,7 @@ from src.backend.utils.logging.logger import get_logger  # src/backend/utils/log
 from src.backend.db.repositories.quality_repository import QualityRepository  # src/backend/db/repositories/quality_repository.py
 from src.backend.quality.engines.validation_engine import ValidationEngine, ValidationResult, ValidationSummary  # src/backend/quality/engines/validation_engine.py
 from src.backend.quality.engines.quality_scorer import QualityScorer, ScoringModel  # src/backend/quality/engines/quality_scorer.py
-from src.backend.utils.storage.bigquery_client import BigQueryClient  # src/backend/utils/storage/bigquery_client.py
+from src.backend.utils.storage.bigquery_client import BigQueryClient, create_bigquery_client  # src/backend/utils/storage/bigquery_client.py
 from src.backend.api.models.data_models import QualityRule, QualityValidation  # src/backend/api/models/data_models.py
 from src.backend.api.models.error_models import ResourceNotFoundError, ValidationError  # src/backend/api/models/error_models.py
 from src.backend.self_healing.ai.issue_classifier import classify_quality_issue  # src/backend/self_healing/ai/issue_classifier.py
@@ -45,7 +45,7 @@ def get_quality_rules(
     logger.info(f"Request for quality rules with filters: page={page}, page_size={page_size}, "
                 f"target_dataset={target_dataset}, target_table={target_table}, rule_type={rule_type}, is_active={is_active}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     page = page if page is not None else 1
@@ -70,7 +70,7 @@ def get_quality_rule_by_id(rule_id: str) -> Optional[QualityRule]:
     """Retrieves a specific quality rule by ID"""
     logger.info(f"Request for quality rule by ID: {rule_id}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     rule = repository.get_rule_by_id(rule_id)
@@ -86,7 +86,7 @@ def create_quality_rule(rule_data: QualityRule) -> QualityRule:
     if not rule_data.rule_name or not rule_data.target_dataset or not rule_data.target_table or not rule_data.rule_type:
         raise ValidationError("Missing required fields in rule data")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     # Generate rule_id if not provided
@@ -110,7 +110,7 @@ def update_quality_rule(rule_id: str, rule_update: QualityRule) -> QualityRule:
     """Updates an existing quality rule"""
     logger.info(f"Request to update quality rule: {rule_id}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     # Get existing rule by ID
@@ -144,7 +144,7 @@ def delete_quality_rule(rule_id: str) -> bool:
     """Deletes a quality rule"""
     logger.info(f"Request to delete quality rule: {rule_id}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     # Get existing rule by ID
@@ -171,7 +171,7 @@ def get_quality_validations(
     logger.info(f"Request for quality validations with filters: page={page}, page_size={page_size}, "
                 f"start_date={start_date}, end_date={end_date}, execution_id={execution_id}, rule_id={rule_id}, status={status}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     page = page if page is not None else 1
@@ -200,7 +200,7 @@ def get_validation_by_id(validation_id: str) -> Optional[QualityValidation]:
     """Retrieves a specific validation result by ID"""
     logger.info(f"Request for validation by ID: {validation_id}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     validation = repository.get_validation_by_id(validation_id)
@@ -218,7 +218,7 @@ def execute_validation(
     logger.info(f"Request to execute validation for dataset: {dataset}, table: {table}, "
                 f"execution_id={execution_id}, rule_ids={rule_ids}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
     validation_engine = ValidationEngine(config=get_config())
 
@@ -263,7 +263,7 @@ def get_quality_score(
     """Retrieves the quality score for a dataset"""
     logger.info(f"Request for quality score for dataset: {dataset}, table: {table}, as_of_date={as_of_date}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     # Prepare filters for dataset, table, and date
@@ -297,7 +297,7 @@ def get_quality_issues(
     logger.info(f"Request for quality issues: dataset={dataset}, table={table}, severity={severity}, "
                 f"is_resolved={is_resolved}, start_date={start_date}, end_date={end_date}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     page = page if page is not None else 1
@@ -341,7 +341,7 @@ def get_validation_trend(
     """Retrieves validation pass/fail trend over time"""
     logger.info(f"Request for validation trend: dataset={dataset}, table={table}, interval={interval}, num_intervals={num_intervals}")
 
-    bq_client = BigQueryClient()
+    bq_client = create_bigquery_client()
     repository = QualityRepository(bq_client=bq_client)
 
     # Validate interval parameter (hourly, daily, weekly)
@@ -458,7 +458,7 @@ class QualityService:
         self._config = config if config is not None else get_config()
 
         # Initialize BigQueryClient if not provided
-        self._bq_client = bq_client if bq_client is not None else BigQueryClient()
+        self._bq_client = bq_client if bq_client is not None else create_bigquery_client()
 
         # Initialize QualityRepository with BigQueryClient
         self._repository = QualityRepository(bq_client=self._bq_client)
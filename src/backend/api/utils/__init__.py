@@ -30,6 +30,11 @@ from .pagination_utils import (
     apply_pagination,
     get_pagination_params
 )
+from ...utils.storage.keyset_pagination import (
+    encode_cursor,
+    decode_cursor,
+    get_next_cursor
+)
 
 # Response formatting utilities
 from .response_utils import (
@@ -95,6 +100,9 @@ __all__ = [
     "calculate_pagination",
     "apply_pagination",
     "get_pagination_params",
+    "encode_cursor",
+    "decode_cursor",
+    "get_next_cursor",
     "create_response_metadata",
     "create_success_response",
     "create_list_response",
@@ -3,6 +3,11 @@ Utility functions for handling pagination in API responses for the self-healing
 
 This module provides helper functions to create pagination metadata, calculate
 pagination parameters, and generate pagination links for list endpoints.
+
+Two pagination modes are supported. Offset mode uses page numbers and LIMIT/OFFSET.
+Cursor mode passes an opaque cursor token carrying the last row's sort key and ID, so
+deep pages cost the same as the first one; when a list response includes a next_cursor,
+its next_page link carries that cursor instead of a page number.
 """
 
 from typing import Dict, Optional, Tuple, Any
@@ -13,6 +18,12 @@ from fastapi import Request  # fastapi ^0.95.0
 
 from ..models.response_models import PaginationMetadata
 from ..models.request_models import PaginationParams
+from ...utils.storage.keyset_pagination import resolve_cursor, build_keyset_condition
+
+try:
+    import sqlalchemy  # sqlalchemy ^2.0.0
+except ImportError:  # pragma: no cover - only needed for SQLAlchemy queries
+    sqlalchemy = None
 
 # Default pagination parameters
 DEFAULT_PAGE = '1'
@@ -26,7 +37,8 @@ def create_pagination_metadata(
     total_items: int,
     request: Request,
     sort_by: Optional[str] = None,
-    descending: Optional[bool] = None
+    descending: Optional[bool] = None,
+    next_cursor: Optional[str] = None
 ) -> PaginationMetadata:
     """
     Creates pagination metadata for list responses.
@@ -38,6 +50,7 @@ def create_pagination_metadata(
         request: FastAPI request object for link generation.
         sort_by: Field used for sorting (optional).
         descending: Whether sorting is in descending order (optional).
+        next_cursor: Cursor for the following page in cursor mode (optional).
 
     Returns:
         PaginationMetadata: Pagination metadata for the response.
@@ -51,7 +64,7 @@ def create_pagination_metadata(
 
     # Generate next and previous page links
     next_page, previous_page = get_pagination_links(
-        request, page, page_size, total_pages, sort_by, descending
+        request, page, page_size, total_pages, sort_by, descending, next_cursor
     )
 
     # Create and return the pagination metadata
@@ -61,7 +74,8 @@ def create_pagination_metadata(
         total_items=total_items,
         total_pages=total_pages,
         next_page=next_page,
-        previous_page=previous_page
+        previous_page=previous_page,
+        next_cursor=next_cursor
     )
 
 
@@ -71,11 +85,15 @@ def get_pagination_links(
     page_size: int,
     total_pages: int,
     sort_by: Optional[str] = None,
-    descending: Optional[bool] = None
+    descending: Optional[bool] = None,
+    next_cursor: Optional[str] = None
 ) -> Tuple[Optional[str], Optional[str]]:
     """
     Generates next and previous page links for pagination.
 
+    In cursor mode the next link carries the cursor and no page number, and no
+    previous link is generated because cursors only move forward.
+
     Args:
         request: FastAPI request object.
         page: Current page number.
@@ -83,6 +101,7 @@ def get_pagination_links(
         total_pages: Total number of pages.
         sort_by: Field used for sorting (optional).
         descending: Whether sorting is in descending order (optional).
+        next_cursor: Cursor for the following page in cursor mode (optional).
 
     Returns:
         Tuple[Optional[str], Optional[str]]: Tuple of (next_page, previous_page) links.
@@ -96,6 +115,25 @@ def get_pagination_links(
     next_page = None
     previous_page = None
 
+    # Generate cursor link when the caller paginates by cursor
+    if next_cursor is not None or 'cursor' in query_params:
+        if next_cursor:
+            next_page_params = {k: v for k, v in query_params.items() if k != 'page'}
+            next_page_params['cursor'] = next_cursor
+            next_page_params['page_size'] = str(page_size)
+
+            if sort_by is not None:
+                next_page_params['sort_by'] = sort_by
+
+            if descending is not None:
+                next_page_params['descending'] = str(descending).lower()
+
+            next_page = urllib.parse.urlunparse(
+                (parsed_url.scheme, parsed_url.netloc, parsed_url.path,
+                 parsed_url.params, urllib.parse.urlencode(next_page_params), parsed_url.fragment)
+            )
+        return next_page, previous_page
+
     # Generate next page link
     if page < total_pages:
         next_page_params = query_params.copy()
@@ -165,37 +203,74 @@ def calculate_pagination(pagination: PaginationParams, total_items: int) -> Dict
     # Calculate total pages
     total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
     
+    # A cursor replaces the offset: repositories resume after the cursor position
+    cursor = getattr(pagination, 'cursor', None)
+    if cursor:
+        offset = 0
+    
     # Return calculated pagination parameters
     return {
         'page': page,
         'page_size': page_size,
         'offset': offset,
         'limit': limit,
-        'total_pages': total_pages
+        'total_pages': total_pages,
+        'after': cursor
     }
 
 
-def apply_pagination(query: Any, offset: int, limit: int, sort_by: Optional[str] = None, descending: Optional[bool] = None) -> Any:
+def apply_pagination(
+    query: Any,
+    offset: int,
+    limit: int,
+    sort_by: Optional[str] = None,
+    descending: Optional[bool] = None,
+    after: Optional[Any] = None,
+    id_field: str = 'id'
+) -> Any:
     """
     Applies pagination parameters to a database query.
 
+    When a cursor is given the query is filtered to rows after the cursor position
+    (keyset pagination) and the offset is ignored. Either way the ID field is added as
+    a tiebreaker to the sort so that pages never overlap or skip rows.
+
     Args:
         query: Database query object (e.g., SQLAlchemy query).
         offset: Number of records to skip.
         limit: Maximum number of records to return.
-        sort_by: Field to sort by (optional).
+        sort_by: Field to sort by (optional, required for cursor mode).
         descending: Whether to sort in descending order (optional).
+        after: Cursor token or (sort_value, id) tuple of the last row of the previous page (optional).
+        id_field: Unique field used as tiebreaker and cursor ID.
 
     Returns:
         Any: Query with pagination applied.
+
+    Raises:
+        RuntimeError: If a cursor is given but sqlalchemy is not installed; falling back to
+            the offset would silently return the first page again.
     """
+    direction = "DESC" if descending else "ASC"
+
+    # Apply keyset filter if a cursor is given
+    if after is not None and sort_by:
+        position = resolve_cursor(after, sort_by)
+        if position is not None:
+            if sqlalchemy is None:
+                raise RuntimeError("Cursor pagination of database queries requires sqlalchemy")
+            condition, _ = build_keyset_condition(sort_by, id_field, position, bool(descending))
+            predicate = sqlalchemy.text(
+                condition.replace("@", ":")
+            ).bindparams(cursor_sort_key=position[0], cursor_id=position[1])
+            query = query.filter(predicate)
+            offset = 0
+
     # Apply sorting if specified
     if sort_by:
         try:
-            if descending:
-                query = query.order_by(f"{sort_by} DESC")
-            else:
-                query = query.order_by(f"{sort_by} ASC")
+            order = f"{sort_by} {direction}, {id_field} {direction}"
+            query = query.order_by(sqlalchemy.text(order) if sqlalchemy is not None else order)
         except Exception:
             # If sorting fails, continue without sorting
             pass
@@ -225,6 +300,7 @@ def get_pagination_params(request: Request) -> Dict[str, Any]:
     page_size_str = request.query_params.get('page_size', DEFAULT_PAGE_SIZE)
     sort_by = request.query_params.get('sort_by')
     descending_str = request.query_params.get('descending', 'false')
+    cursor = request.query_params.get('cursor') or None
     
     # Convert and validate page
     try:
@@ -250,5 +326,6 @@ def get_pagination_params(request: Request) -> Dict[str, Any]:
         'page': page,
         'page_size': page_size,
         'sort_by': sort_by,
-        'descending': descending
+        'descending': descending,
+        'cursor': cursor
     }
\ No newline at end of file
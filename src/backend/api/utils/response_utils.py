@@ -97,7 +97,8 @@ def create_list_response(
     request_id: Optional[str] = None,
     sort_by: Optional[str] = None,
     descending: Optional[bool] = None,
-    additional_info: Optional[Dict[str, Any]] = None
+    additional_info: Optional[Dict[str, Any]] = None,
+    next_cursor: Optional[str] = None
 ) -> PaginatedResponse:
     """
     Creates a standardized paginated list response.
@@ -113,6 +114,7 @@ def create_list_response(
         sort_by: Field used for sorting
         descending: Whether sorting is in descending order
         additional_info: Additional metadata information
+        next_cursor: Cursor for the following page in cursor mode
 
     Returns:
         PaginatedResponse: Paginated list response
@@ -130,7 +132,8 @@ def create_list_response(
         total_items=total_items,
         request=request,
         sort_by=sort_by,
-        descending=descending
+        descending=descending,
+        next_cursor=next_cursor
     )
     
     # Create and return paginated response
@@ -65,6 +65,7 @@ HEALING_STATUS_APPROVED = "APPROVED"
 HEALING_STATUS_REJECTED = "REJECTED"
 
 # Alert Status Constants
+ALERT_STATUS_NEW = "NEW"
 ALERT_STATUS_ACTIVE = "ACTIVE"
 ALERT_STATUS_ACKNOWLEDGED = "ACKNOWLEDGED"
 ALERT_STATUS_RESOLVED = "RESOLVED"
@@ -135,6 +136,14 @@ class AlertSeverity(enum.Enum):
     INFO = "INFO"
 
 
+class NotificationChannel(enum.Enum):
+    """Enumeration of alert notification channels."""
+    TEAMS = NOTIFICATION_TYPE_TEAMS
+    EMAIL = NOTIFICATION_TYPE_EMAIL
+    SMS = NOTIFICATION_TYPE_SMS
+    WEBHOOK = NOTIFICATION_TYPE_WEBHOOK
+
+
 class DataSourceType(enum.Enum):
     """Enumeration of possible data source types."""
     GCS = "GCS"
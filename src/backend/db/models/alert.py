@@ -15,7 +15,7 @@ import uuid
 from typing import Dict, List, Optional, Any, Union
 
 from ...constants import AlertSeverity, NotificationChannel
-from ...logging_config import get_logger
+from ...utils.logging.logger import get_logger
 
 # Configure logger
 logger = get_logger(__name__)
@@ -27,6 +27,12 @@ logger = get_logger(__name__)
 # Define the table name constant
 PIPELINE_METRIC_TABLE_NAME = "pipeline_metrics"
 
+# Rollup tables are named with the tier suffix, e.g. pipeline_metric_rollups_1h
+PIPELINE_METRIC_ROLLUP_TABLE_PREFIX = "pipeline_metric_rollups"
+
+# Records the time from which the rollup tiers are complete
+PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME = "pipeline_metric_rollup_coverage"
+
 
 def generate_metric_id() -> str:
     """
@@ -59,6 +65,39 @@ def get_pipeline_metric_table_schema() -> List[SchemaField]:
     ]
 
 
+def get_pipeline_metric_rollup_table_schema() -> List[SchemaField]:
+    """
+    Returns the BigQuery table schema shared by the metric rollup tier tables.
+    
+    Returns:
+        list: List of SchemaField objects defining the table schema
+    """
+    return [
+        get_schema_field("metric_name", "STRING", "REQUIRED", "Name of the metric"),
+        get_schema_field("labels", "STRING", "NULLABLE", "Canonical JSON string of the metric labels"),
+        get_schema_field("bucket_start", "TIMESTAMP", "REQUIRED", "Start of the rollup bucket"),
+        get_schema_field("count", "INTEGER", "REQUIRED", "Number of values in the bucket"),
+        get_schema_field("sum", "FLOAT", "REQUIRED", "Sum of values in the bucket"),
+        get_schema_field("min", "FLOAT", "NULLABLE", "Minimum value in the bucket"),
+        get_schema_field("max", "FLOAT", "NULLABLE", "Maximum value in the bucket"),
+        get_schema_field("sketch", "STRING", "NULLABLE", "JSON-serialized mergeable quantile sketch of the values"),
+        get_schema_field("created_at", "TIMESTAMP", "NULLABLE", "Time when this partial rollup was written")
+    ]
+
+
+def get_pipeline_metric_rollup_coverage_table_schema() -> List[SchemaField]:
+    """
+    Returns the BigQuery table schema for recorded metric rollup coverage.
+    
+    Returns:
+        list: List of SchemaField objects defining the table schema
+    """
+    return [
+        get_schema_field("coverage_start", "TIMESTAMP", "REQUIRED", "Time from which every rollup tier is complete"),
+        get_schema_field("recorded_at", "TIMESTAMP", "NULLABLE", "Time when the coverage was recorded")
+    ]
+
+
 class MetricCategory(enum.Enum):
     """
     Enumeration of metric categories for pipeline metrics.
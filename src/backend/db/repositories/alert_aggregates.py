@@ -0,0 +1,670 @@
+"""
+Incrementally maintained alert aggregates.
+
+AlertRepository statistics (counts by status, severity and component, trends,
+notification and resolution-time statistics) used to run a GROUP BY over the raw alerts
+table for every request. AlertAggregateStore keeps those aggregates in memory instead:
+
+- Counters are kept per (hourly bucket of created_at, status, severity, component),
+  notification outcomes per (bucket, channel), and resolution times per (bucket, severity)
+  as mergeable aggregates with quantile sketches.
+- The store remembers a compact state per alert (bucket, status, severity, component,
+  resolution time, notification counts, updated_at). Every create or update subtracts the
+  alert's previous contribution and adds the new one, so status transitions move counts
+  between keys instead of double counting. Updates older than the alert's recorded
+  updated_at are ignored, which makes replays and late, out-of-order updates harmless.
+- An apply can be undone by restoring the states captured before it, so a write that the
+  write buffer refuses or dead-letters is rolled back.
+- Window queries use whole buckets where possible and the per-alert states of the
+  partially covered boundary bucket, so results match the raw query exactly.
+- The per-alert states and a watermark of the newest applied update are checkpointed to
+  a JSON file. After a restart the counters are rebuilt from the checkpoint and only
+  alerts updated after the watermark are read from BigQuery.
+
+Alerts older than the retention period are pruned, so windows longer than the retention
+(or unbounded windows) are answered by the raw queries.
+"""
+
+import collections
+import datetime
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ...utils.logging.logger import get_logger
+from ...utils.storage.atomic_file import write_json_atomic
+from .metric_rollups import RollupAggregate, to_utc_naive, truncate_timestamp
+
+# Configure module logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_BUCKET_SECONDS = 3600
+DEFAULT_RETENTION_HOURS = 24 * 30
+DEFAULT_RESOLVED_STATUS = "RESOLVED"
+CHECKPOINT_VERSION = 1
+
+# Severity order used by the raw severity queries
+SEVERITY_ORDER = {'CRITICAL': 1, 'HIGH': 2, 'MEDIUM': 3, 'LOW': 4}
+
+# Aggregation dimensions and their position in a counter key
+DIMENSIONS = {'status': 0, 'severity': 1, 'component': 2}
+
+# Compact per-alert state; notifications holds (channel, successes, failures) tuples
+AlertState = collections.namedtuple(
+    'AlertState',
+    ['created_at', 'status', 'severity', 'component', 'updated_at', 'resolution_seconds', 'notifications']
+)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime.datetime]:
+    """Parses a datetime or ISO string into naive UTC"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    return to_utc_naive(value)
+
+
+def _enum_value(value: Any) -> Any:
+    """Returns the stored value of an enum member, or the value itself"""
+    return getattr(value, 'value', value)
+
+
+def _summarize_notifications(notifications: Any) -> Tuple[Tuple[str, int, int], ...]:
+    """Reduces notification records to (channel, successes, failures) per channel"""
+    if isinstance(notifications, str):
+        notifications = json.loads(notifications) if notifications else []
+    outcomes: Dict[str, List[int]] = {}
+    for notification in notifications or []:
+        if isinstance(notification, dict):
+            channel, success = notification.get('channel'), notification.get('success')
+        else:
+            channel, success = notification.channel, notification.success
+        counts = outcomes.setdefault(str(_enum_value(channel)), [0, 0])
+        counts[0 if success in (True, 'true') else 1] += 1
+    return tuple((channel, counts[0], counts[1]) for channel, counts in sorted(outcomes.items()))
+
+
+def alert_state(alert: Any, resolved_status: str = DEFAULT_RESOLVED_STATUS) -> Tuple[str, AlertState]:
+    """
+    Extracts the aggregated fields of an alert.
+
+    Args:
+        alert: Alert object, or an alert row dictionary as stored in BigQuery
+        resolved_status: Status value of resolved alerts
+
+    Returns:
+        Tuple of (alert_id, AlertState)
+    """
+    get = alert.get if isinstance(alert, dict) else (lambda field: getattr(alert, field, None))
+
+    created_at = _parse_timestamp(get('created_at'))
+    resolved_at = _parse_timestamp(get('resolved_at'))
+    status = get('status')
+    resolution_seconds = None
+    if status == resolved_status and resolved_at is not None:
+        # TIMESTAMP_DIFF(..., SECOND) truncates to whole seconds
+        resolution_seconds = float(int((resolved_at - created_at).total_seconds()))
+
+    state = AlertState(
+        created_at=created_at,
+        status=status,
+        severity=_enum_value(get('severity')),
+        component=get('component'),
+        updated_at=_parse_timestamp(get('updated_at')) or created_at,
+        resolution_seconds=resolution_seconds,
+        notifications=_summarize_notifications(get('notifications'))
+    )
+    return get('alert_id'), state
+
+
+class AlertAggregateStore:
+    """In-memory, incrementally maintained aggregates over the alerts table"""
+
+    def __init__(self, bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+                 retention_hours: int = DEFAULT_RETENTION_HOURS,
+                 clock: Callable[[], datetime.datetime] = None,
+                 resolved_status: str = DEFAULT_RESOLVED_STATUS):
+        """
+        Initializes an empty store.
+
+        Args:
+            bucket_seconds: Width of the time buckets
+            retention_hours: Age after which alerts are pruned from the store
+            clock: Returns the current time as naive UTC (defaults to utcnow)
+            resolved_status: Status value of resolved alerts, whose resolution times are tracked
+        """
+        self.bucket_seconds = bucket_seconds
+        self.retention_hours = retention_hours
+        self.resolved_status = resolved_status
+        self._clock = clock or datetime.datetime.utcnow
+        self._lock = threading.RLock()
+
+        self._states: Dict[str, AlertState] = {}
+        self._members: Dict[datetime.datetime, set] = collections.defaultdict(set)
+        self._counts: Dict[datetime.datetime, collections.Counter] = collections.defaultdict(collections.Counter)
+        self._notifications: Dict[datetime.datetime, Dict[str, List[int]]] = collections.defaultdict(dict)
+        self._resolutions: Dict[datetime.datetime, Dict[str, RollupAggregate]] = collections.defaultdict(dict)
+        self._stale_resolution_buckets: set = set()
+
+        self.ready = False
+        self.watermark: Optional[datetime.datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def covers(self, time_window_hours: Optional[int]) -> bool:
+        """
+        Checks whether a window can be answered from the store.
+
+        Args:
+            time_window_hours: Requested window, None for all alerts
+
+        Returns:
+            True if the store is loaded and the window is within the retention period
+        """
+        return self.ready and time_window_hours is not None and 0 < time_window_hours <= self.retention_hours
+
+    def apply(self, alert: Any) -> bool:
+        """
+        Applies a created or updated alert.
+
+        Args:
+            alert: Alert object or alert row dictionary
+
+        Returns:
+            True if the aggregates changed, False for stale or out-of-retention updates
+        """
+        alert_id, state = alert_state(alert, self.resolved_status)
+        if not alert_id or state.created_at is None:
+            return False
+
+        with self._lock:
+            previous = self._states.get(alert_id)
+            if previous is not None and previous.updated_at and state.updated_at and state.updated_at < previous.updated_at:
+                return False
+
+            if previous is not None:
+                self._retract(alert_id, previous)
+            if state.created_at >= self._retention_start():
+                self._contribute(alert_id, state)
+            if state.updated_at and (self.watermark is None or state.updated_at > self.watermark):
+                self.watermark = state.updated_at
+            return True
+
+    def apply_all(self, alerts: Iterable[Any]) -> int:
+        """
+        Applies many alerts.
+
+        Args:
+            alerts: Alert objects or alert row dictionaries
+
+        Returns:
+            Number of alerts that changed the aggregates
+        """
+        return sum(1 for alert in alerts if self.apply(alert))
+
+    def rebuild(self, alerts: Iterable[Any]) -> int:
+        """
+        Replaces the aggregates with the given alerts and marks the store ready.
+
+        Args:
+            alerts: Every alert within the retention period
+
+        Returns:
+            Number of alerts loaded
+        """
+        with self._lock:
+            self._reset()
+            loaded = self.apply_all(alerts)
+            self.ready = True
+        logger.info(f"Rebuilt alert aggregates from {loaded} alerts")
+        return loaded
+
+    def remove(self, alert_id: str) -> None:
+        """
+        Removes an alert from the aggregates.
+
+        Args:
+            alert_id: ID of the alert to remove
+        """
+        with self._lock:
+            previous = self._states.get(alert_id)
+            if previous is not None:
+                self._retract(alert_id, previous)
+
+    def get_states(self, alert_ids: Iterable[str]) -> Dict[str, Optional[AlertState]]:
+        """
+        Captures the recorded state of alerts, so that later applies can be undone.
+
+        Args:
+            alert_ids: IDs of the alerts
+
+        Returns:
+            Alert ID to its recorded state, or None if it is not in the store
+        """
+        with self._lock:
+            return {alert_id: self._states.get(alert_id) for alert_id in alert_ids}
+
+    def restore(self, states: Dict[str, Optional[AlertState]]) -> None:
+        """
+        Puts back alert states captured by get_states, undoing the applies made since.
+
+        Args:
+            states: Alert ID to the state to restore, None to remove the alert
+        """
+        with self._lock:
+            for alert_id, state in states.items():
+                current = self._states.get(alert_id)
+                if current is not None:
+                    self._retract(alert_id, current)
+                if state is not None and state.created_at >= self._retention_start():
+                    self._contribute(alert_id, state)
+
+    def drop_before(self, cutoff: datetime.datetime) -> int:
+        """
+        Removes alerts created before a cutoff, mirroring deletions from the table.
+
+        Args:
+            cutoff: Alerts created before this time are removed
+
+        Returns:
+            Number of alerts removed
+        """
+        cutoff = to_utc_naive(cutoff)
+        with self._lock:
+            expired = [alert_id for alert_id, state in self._states.items() if state.created_at < cutoff]
+            for alert_id in expired:
+                self._retract(alert_id, self._states[alert_id])
+        return len(expired)
+
+    def prune(self) -> int:
+        """
+        Removes alerts that fell out of the retention period.
+
+        Returns:
+            Number of alerts removed
+        """
+        return self.drop_before(self._retention_start())
+
+    def count_by(self, dimension: str, time_window_hours: int) -> Dict[str, int]:
+        """
+        Counts alerts created within a window, grouped by one dimension.
+
+        Args:
+            dimension: 'status', 'severity' or 'component'
+            time_window_hours: Window ending now
+
+        Returns:
+            Dictionary of dimension value to count, ordered like the raw queries
+        """
+        position = DIMENSIONS[dimension]
+        totals = collections.Counter()
+        for key, count in self.window_counts(time_window_hours).items():
+            totals[key[position]] += count
+
+        if dimension == 'severity':
+            ordered = sorted(totals.items(), key=lambda item: SEVERITY_ORDER.get(item[0], 5))
+        else:
+            ordered = totals.most_common()
+        return dict(ordered)
+
+    def window_counts(self, time_window_hours: int) -> collections.Counter:
+        """
+        Counts alerts created within a window per (status, severity, component).
+
+        Args:
+            time_window_hours: Window ending now
+
+        Returns:
+            Counter keyed by (status, severity, component)
+        """
+        start = self._clock() - datetime.timedelta(hours=time_window_hours)
+        totals = collections.Counter()
+        with self._lock:
+            full_buckets, partial_states = self._window(start)
+            for bucket in full_buckets:
+                totals.update(self._counts[bucket])
+            for state in partial_states:
+                totals[(state.status, state.severity, state.component)] += 1
+        return +totals
+
+    def trend(self, interval: str, num_intervals: int, severity: Any = None) -> List[Tuple[str, int]]:
+        """
+        Counts alerts per hourly, daily or weekly interval, formatted like the raw trend query.
+
+        Args:
+            interval: 'hourly', 'daily' or 'weekly'
+            num_intervals: Number of intervals ending now
+            severity: Optional severity filter
+
+        Returns:
+            Sorted list of (time_interval, alert_count)
+        """
+        hours = {'hourly': 1, 'daily': 24, 'weekly': 24 * 7}[interval] * num_intervals
+        start = self._clock() - datetime.timedelta(hours=hours)
+        severity = _enum_value(severity)
+        totals = collections.Counter()
+
+        with self._lock:
+            full_buckets, partial_states = self._window(start)
+            for bucket in full_buckets:
+                for (status, alert_severity, component), count in self._counts[bucket].items():
+                    if severity is None or alert_severity == severity:
+                        totals[self._interval_label(bucket, interval)] += count
+            for state in partial_states:
+                if severity is None or state.severity == severity:
+                    totals[self._interval_label(state.created_at, interval)] += 1
+
+        return sorted((label, count) for label, count in totals.items() if count > 0)
+
+    def notification_stats(self, time_window_hours: int) -> Dict[str, Any]:
+        """
+        Summarizes notification outcomes per channel for alerts created within a window.
+
+        Args:
+            time_window_hours: Window ending now
+
+        Returns:
+            Dictionary shaped like AlertRepository.get_notification_stats
+        """
+        start = self._clock() - datetime.timedelta(hours=time_window_hours)
+        outcomes: Dict[str, List[int]] = collections.defaultdict(lambda: [0, 0])
+        with self._lock:
+            full_buckets, partial_states = self._window(start)
+            for bucket in full_buckets:
+                for channel, (success, failure) in self._notifications[bucket].items():
+                    outcomes[channel][0] += success
+                    outcomes[channel][1] += failure
+            for state in partial_states:
+                for channel, success, failure in state.notifications:
+                    outcomes[channel][0] += success
+                    outcomes[channel][1] += failure
+
+        stats = {'channels': {}, 'total_success': 0, 'total_failure': 0, 'total_notifications': 0}
+        for channel, (success, failure) in sorted(outcomes.items(), key=lambda item: -sum(item[1])):
+            total = success + failure
+            if total == 0:
+                continue
+            stats['channels'][channel] = {
+                'success': success,
+                'failure': failure,
+                'total': total,
+                'success_rate': success / total
+            }
+            stats['total_success'] += success
+            stats['total_failure'] += failure
+            stats['total_notifications'] += total
+
+        if stats['total_notifications'] > 0:
+            stats['overall_success_rate'] = stats['total_success'] / stats['total_notifications']
+        else:
+            stats['overall_success_rate'] = 0
+        return stats
+
+    def resolution_stats(self, time_window_hours: int) -> Dict[str, Any]:
+        """
+        Summarizes resolution times per severity for alerts created within a window.
+
+        Medians and 95th percentiles come from quantile sketches and are approximate,
+        like the APPROX_QUANTILES of the raw query.
+
+        Args:
+            time_window_hours: Window ending now
+
+        Returns:
+            Dictionary shaped like AlertRepository.get_resolution_time_stats
+        """
+        start = self._clock() - datetime.timedelta(hours=time_window_hours)
+        aggregates: Dict[str, RollupAggregate] = {}
+        with self._lock:
+            full_buckets, partial_states = self._window(start)
+            for bucket in full_buckets:
+                self._refresh_resolutions(bucket)
+                for severity, aggregate in self._resolutions.get(bucket, {}).items():
+                    aggregates.setdefault(severity, RollupAggregate()).merge(aggregate)
+            for state in partial_states:
+                if state.resolution_seconds is not None:
+                    aggregates.setdefault(state.severity, RollupAggregate()).add(state.resolution_seconds)
+
+        stats = {
+            'by_severity': {},
+            'total_resolved': 0,
+            'overall_avg_seconds': 0,
+            'overall_min_seconds': float('inf'),
+            'overall_max_seconds': 0
+        }
+        total_seconds = 0.0
+        for severity in sorted(aggregates, key=lambda value: SEVERITY_ORDER.get(value, 5)):
+            aggregate = aggregates[severity]
+            if aggregate.count == 0:
+                continue
+            avg_seconds = aggregate.value('avg')
+            stats['by_severity'][severity] = {
+                'count': aggregate.count,
+                'avg_seconds': avg_seconds,
+                'min_seconds': aggregate.min,
+                'max_seconds': aggregate.max,
+                'median_seconds': aggregate.sketch.quantile(0.5),
+                'p95_seconds': aggregate.sketch.quantile(0.95),
+                'avg_minutes': avg_seconds / 60,
+                'avg_hours': avg_seconds / 3600
+            }
+            stats['total_resolved'] += aggregate.count
+            total_seconds += aggregate.sum
+            stats['overall_min_seconds'] = min(stats['overall_min_seconds'], aggregate.min)
+            stats['overall_max_seconds'] = max(stats['overall_max_seconds'], aggregate.max)
+
+        if stats['total_resolved'] > 0:
+            stats['overall_avg_seconds'] = total_seconds / stats['total_resolved']
+            stats['overall_avg_minutes'] = stats['overall_avg_seconds'] / 60
+            stats['overall_avg_hours'] = stats['overall_avg_seconds'] / 3600
+        else:
+            stats['overall_min_seconds'] = 0
+        return stats
+
+    def compare_counts(self, raw_rows: Iterable[Dict[str, Any]], time_window_hours: int) -> Dict[str, Any]:
+        """
+        Compares the counters with counts computed from the raw table.
+
+        Args:
+            raw_rows: Rows with status, severity, component and count columns
+            time_window_hours: Window the raw counts were computed for
+
+        Returns:
+            Dictionary with consistent flag, totals and the mismatching keys
+        """
+        expected = collections.Counter()
+        for row in raw_rows:
+            expected[(row['status'], row['severity'], row['component'])] += row['count']
+        actual = self.window_counts(time_window_hours)
+
+        mismatches = [
+            {'status': key[0], 'severity': key[1], 'component': key[2],
+             'expected': expected.get(key, 0), 'actual': actual.get(key, 0)}
+            for key in sorted(set(expected) | set(actual), key=lambda key: tuple(str(part) for part in key))
+            if expected.get(key, 0) != actual.get(key, 0)
+        ]
+        return {
+            'consistent': not mismatches,
+            'expected_total': sum(expected.values()),
+            'actual_total': sum(actual.values()),
+            'mismatches': mismatches
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the per-alert states; counters are rebuilt from them on load.
+
+        Returns:
+            JSON-serializable checkpoint dictionary
+        """
+        def encode(value: Optional[datetime.datetime]) -> Optional[str]:
+            return value.isoformat() if value is not None else None
+
+        with self._lock:
+            return {
+                'version': CHECKPOINT_VERSION,
+                'bucket_seconds': self.bucket_seconds,
+                'watermark': encode(self.watermark),
+                'alerts': {
+                    alert_id: [encode(state.created_at), state.status, state.severity, state.component,
+                               encode(state.updated_at), state.resolution_seconds,
+                               [list(notification) for notification in state.notifications]]
+                    for alert_id, state in self._states.items()
+                }
+            }
+
+    def load_dict(self, data: Dict[str, Any]) -> int:
+        """
+        Restores the store from a checkpoint dictionary and marks it ready.
+
+        Args:
+            data: Dictionary produced by to_dict
+
+        Returns:
+            Number of alerts restored
+        """
+        if data.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported alert aggregate checkpoint version: {data.get('version')}")
+
+        with self._lock:
+            self._reset()
+            for alert_id, fields in data.get('alerts', {}).items():
+                created_at, status, severity, component, updated_at, resolution_seconds, notifications = fields
+                state = AlertState(
+                    created_at=_parse_timestamp(created_at),
+                    status=status,
+                    severity=severity,
+                    component=component,
+                    updated_at=_parse_timestamp(updated_at),
+                    resolution_seconds=resolution_seconds,
+                    notifications=tuple(tuple(notification) for notification in notifications)
+                )
+                if state.created_at >= self._retention_start():
+                    self._contribute(alert_id, state)
+            self.watermark = _parse_timestamp(data.get('watermark'))
+            self.ready = True
+            return len(self._states)
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Atomically writes a checkpoint file.
+
+        Args:
+            path: Checkpoint file path
+        """
+        write_json_atomic(path, self.to_dict(), prefix='.alert_aggregates.')
+        logger.debug(f"Checkpointed {len(self)} alert aggregate states to {path}")
+
+    def load_checkpoint(self, path: str) -> bool:
+        """
+        Restores the store from a checkpoint file if one exists.
+
+        Args:
+            path: Checkpoint file path
+
+        Returns:
+            True if a checkpoint was loaded
+        """
+        if not path or not os.path.exists(path):
+            return False
+        with open(path) as handle:
+            restored = self.load_dict(json.load(handle))
+        logger.info(f"Restored {restored} alert aggregate states from {path}")
+        return True
+
+    def _reset(self) -> None:
+        """Clears every aggregate"""
+        self._states.clear()
+        self._members.clear()
+        self._counts.clear()
+        self._notifications.clear()
+        self._resolutions.clear()
+        self._stale_resolution_buckets.clear()
+        self.watermark = None
+
+    def _retention_start(self) -> datetime.datetime:
+        """Returns the creation time before which alerts are not kept"""
+        return self._clock() - datetime.timedelta(hours=self.retention_hours)
+
+    def _bucket(self, timestamp: datetime.datetime) -> datetime.datetime:
+        """Returns the bucket holding a creation time"""
+        return truncate_timestamp(timestamp, self.bucket_seconds)
+
+    def _contribute(self, alert_id: str, state: AlertState) -> None:
+        """Adds an alert's contribution to the aggregates"""
+        bucket = self._bucket(state.created_at)
+        self._states[alert_id] = state
+        self._members[bucket].add(alert_id)
+        self._counts[bucket][(state.status, state.severity, state.component)] += 1
+        for channel, success, failure in state.notifications:
+            counts = self._notifications[bucket].setdefault(channel, [0, 0])
+            counts[0] += success
+            counts[1] += failure
+        if state.resolution_seconds is not None and bucket not in self._stale_resolution_buckets:
+            self._resolutions[bucket].setdefault(state.severity, RollupAggregate()).add(state.resolution_seconds)
+
+    def _retract(self, alert_id: str, state: AlertState) -> None:
+        """Removes an alert's contribution from the aggregates"""
+        bucket = self._bucket(state.created_at)
+        del self._states[alert_id]
+        self._members[bucket].discard(alert_id)
+
+        key = (state.status, state.severity, state.component)
+        self._counts[bucket][key] -= 1
+        if self._counts[bucket][key] <= 0:
+            del self._counts[bucket][key]
+        for channel, success, failure in state.notifications:
+            counts = self._notifications[bucket][channel]
+            counts[0] -= success
+            counts[1] -= failure
+            if counts == [0, 0]:
+                del self._notifications[bucket][channel]
+        if state.resolution_seconds is not None:
+            # Sketches cannot subtract values; the bucket is re-derived from its members when read
+            self._stale_resolution_buckets.add(bucket)
+
+        if not self._members[bucket]:
+            for aggregates in (self._members, self._counts, self._notifications, self._resolutions):
+                aggregates.pop(bucket, None)
+            self._stale_resolution_buckets.discard(bucket)
+
+    def _refresh_resolutions(self, bucket: datetime.datetime) -> None:
+        """Re-derives the resolution aggregates of a bucket after a retraction"""
+        if bucket not in self._stale_resolution_buckets:
+            return
+        aggregates: Dict[str, RollupAggregate] = {}
+        for alert_id in self._members.get(bucket, ()):
+            state = self._states[alert_id]
+            if state.resolution_seconds is not None:
+                aggregates.setdefault(state.severity, RollupAggregate()).add(state.resolution_seconds)
+        self._resolutions[bucket] = aggregates
+        self._stale_resolution_buckets.discard(bucket)
+
+    def _window(self, start: datetime.datetime) -> Tuple[List[datetime.datetime], List[AlertState]]:
+        """Splits a window into fully covered buckets and the states of the partial boundary bucket"""
+        start = to_utc_naive(start)
+        width = datetime.timedelta(seconds=self.bucket_seconds)
+        full_buckets, partial_states = [], []
+        for bucket in list(self._members):
+            if bucket >= start:
+                full_buckets.append(bucket)
+            elif bucket + width > start:
+                partial_states.extend(
+                    state for state in (self._states[alert_id] for alert_id in self._members[bucket])
+                    if state.created_at >= start
+                )
+        return full_buckets, partial_states
+
+    @staticmethod
+    def _interval_label(timestamp: datetime.datetime, interval: str) -> str:
+        """Formats a time like the FORMAT_TIMESTAMP expressions of the raw trend query"""
+        if interval == 'hourly':
+            return timestamp.strftime('%Y-%m-%d %H:00:00')
+        if interval == 'weekly':
+            # DATE_TRUNC(..., WEEK) starts weeks on Sunday
+            timestamp = timestamp - datetime.timedelta(days=(timestamp.weekday() + 1) % 7)
+        return timestamp.strftime('%Y-%m-%d')
@@ -8,6 +8,8 @@ for alert correlation, notification tracking, and advanced filtering.
 
 import datetime
 import json
+import threading
+import time
 import typing
 import pandas as pd
 from typing import Dict, List, Optional, Any, Union, Tuple
@@ -16,6 +18,9 @@ from ...constants import AlertSeverity, NotificationChannel
 from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ...utils.storage.bigquery_client import BigQueryClient
+from ...utils.storage.keyset_pagination import build_keyset_condition, build_keyset_order_by
+from ...utils.storage.query_cache import QueryResultCache, get_query_cache
+from ...utils.storage.write_buffer import WriteBuffer, get_write_buffer
 from ..models.alert import (
     Alert, 
     get_alert_table_schema, 
@@ -25,15 +30,34 @@ from ..models.alert import (
     ALERT_STATUS_RESOLVED,
     ALERT_STATUS_SUPPRESSED
 )
+from .alert_aggregates import AlertAggregateStore, DEFAULT_RETENTION_HOURS
 
 # Configure module logger
 logger = get_logger(__name__)
 
+# Configuration keys for the incrementally maintained alert aggregates
+AGGREGATES_ENABLED_CONFIG_KEY = "alerts.aggregates.enabled"
+AGGREGATES_RETENTION_HOURS_CONFIG_KEY = "alerts.aggregates.retention_hours"
+AGGREGATES_CHECKPOINT_PATH_CONFIG_KEY = "alerts.aggregates.checkpoint_path"
+AGGREGATES_CHECKPOINT_INTERVAL_CONFIG_KEY = "alerts.aggregates.checkpoint_interval_seconds"
+AGGREGATES_REFRESH_INTERVAL_CONFIG_KEY = "alerts.aggregates.refresh_interval_seconds"
+AGGREGATES_VERIFY_INTERVAL_CONFIG_KEY = "alerts.aggregates.verify_interval_seconds"
+
+# Default settings
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 300
+DEFAULT_AGGREGATES_REFRESH_INTERVAL_SECONDS = 60
+DEFAULT_AGGREGATES_VERIFY_INTERVAL_SECONDS = 3600
+
+# Columns needed to maintain the alert aggregates
+AGGREGATE_COLUMNS = "alert_id, created_at, updated_at, resolved_at, status, severity, component, notifications"
+
 
 class AlertRepository:
     """Repository for managing alerts in BigQuery"""
 
-    def __init__(self, bq_client: BigQueryClient, dataset_id: str = None, project_id: str = None):
+    def __init__(self, bq_client: BigQueryClient, dataset_id: str = None, project_id: str = None,
+                 query_cache: QueryResultCache = None, write_buffer: WriteBuffer = None,
+                 aggregates: AlertAggregateStore = None):
         """
         Initializes the AlertRepository with BigQuery client and configuration.
 
@@ -41,8 +65,14 @@ class AlertRepository:
             bq_client: BigQuery client for database operations
             dataset_id: BigQuery dataset ID (defaults to config value if not provided)
             project_id: GCP project ID (defaults to config value if not provided)
+            query_cache: Result cache for aggregation queries (defaults to the shared cache)
+            write_buffer: Micro-batching buffer for inserts (defaults to the client's shared buffer)
+            aggregates: In-memory alert aggregates serving the statistics methods (created from
+                config if not provided; disabled with alerts.aggregates.enabled)
         """
         self._bq_client = bq_client
+        self._query_cache = query_cache or get_query_cache()
+        self._write_buffer = write_buffer or get_write_buffer(bq_client)
         
         # Get configuration
         config = get_config()
@@ -57,6 +87,32 @@ class AlertRepository:
         if not self._project_id:
             raise ValueError("GCP project ID is required")
         
+        # Incrementally maintained aggregates, loaded on first use
+        self._aggregates = aggregates
+        if self._aggregates is None and bool(config.get(AGGREGATES_ENABLED_CONFIG_KEY, True)):
+            self._aggregates = AlertAggregateStore(
+                retention_hours=int(config.get(AGGREGATES_RETENTION_HOURS_CONFIG_KEY, DEFAULT_RETENTION_HOURS)),
+                resolved_status=ALERT_STATUS_RESOLVED
+            )
+        self._aggregates_lock = threading.Lock()
+        self._checkpoint_path = config.get(AGGREGATES_CHECKPOINT_PATH_CONFIG_KEY, None)
+        self._checkpoint_interval = float(
+            config.get(AGGREGATES_CHECKPOINT_INTERVAL_CONFIG_KEY, DEFAULT_CHECKPOINT_INTERVAL_SECONDS)
+        )
+        self._last_checkpoint = time.monotonic()
+        # Alerts written by other processes are caught up every refresh interval, and the
+        # aggregates are verified against the table (and rebuilt on a mismatch) every verify interval
+        self._refresh_interval = float(
+            config.get(AGGREGATES_REFRESH_INTERVAL_CONFIG_KEY, DEFAULT_AGGREGATES_REFRESH_INTERVAL_SECONDS)
+        )
+        self._verify_interval = float(
+            config.get(AGGREGATES_VERIFY_INTERVAL_CONFIG_KEY, DEFAULT_AGGREGATES_VERIFY_INTERVAL_SECONDS)
+        )
+        self._last_refresh = self._last_verify = time.monotonic()
+
+        # Callbacks notified of every alert created or updated through this repository
+        self._alert_listeners: List[typing.Callable[[Alert], None]] = []
+        
         # Ensure alert table exists
         if self.ensure_table_exists():
             logger.info(f"Alert repository initialized with dataset {self._dataset_id}")
@@ -99,12 +155,314 @@ class AlertRepository:
             logger.error(f"Error ensuring alerts table exists: {e}")
             return False
 
-    def create_alert(self, alert: Alert) -> str:
+    def _invalidate_cached_queries(self) -> None:
+        """
+        Invalidates cached query results that read the alert table after a write.
+        """
+        self._query_cache.invalidate_table(f"{self._project_id}.{self._dataset_id}.{ALERT_TABLE_NAME}")
+
+    def _write_rows(self, rows: List[Dict[str, Any]], insert_ids: List[str], durable: bool,
+                    on_rejected: typing.Callable[[List[str]], None] = None) -> None:
+        """
+        Writes alert rows through the write buffer.
+
+        Args:
+            rows: Alert rows to insert
+            insert_ids: Alert IDs used to deduplicate retried inserts
+            durable: Whether to block until the rows have been written
+            on_rejected: Called with the IDs of alerts whose rows the buffer dead-letters
+        """
+        written = self._write_buffer.append(
+            self._dataset_id,
+            ALERT_TABLE_NAME,
+            rows,
+            insert_ids=insert_ids,
+            project=self._project_id,
+            wait=durable,
+            on_delivered=self._invalidate_cached_queries,
+            on_rejected=on_rejected
+        )
+        if not written:
+            raise RuntimeError(f"Failed to write {len(rows)} alerts to {ALERT_TABLE_NAME}")
+
+    def _write_alerts(self, alerts: List[Alert], durable: bool) -> None:
+        """
+        Writes created alerts, keeping the aggregates in step with the rows the buffer accepts.
+
+        The alerts are applied to the aggregates before the rows are handed to the buffer and
+        rolled back if the buffer refuses them or later dead-letters them, so the aggregates
+        never count an alert that is not written.
+
+        Args:
+            alerts: Alerts to insert
+            durable: Whether to block until the rows have been written
+        """
+        alert_ids = [alert.alert_id for alert in alerts]
+        previous = self._apply_to_aggregates(alerts)
+
+        def rollback(rejected_ids: List[str]) -> None:
+            if previous:
+                self._aggregates.restore({alert_id: previous[alert_id] for alert_id in rejected_ids if alert_id in previous})
+
+        try:
+            self._write_rows([alert.to_bigquery_row() for alert in alerts], alert_ids, durable, on_rejected=rollback)
+        except Exception:
+            rollback(alert_ids)
+            raise
+        self._notify_alert_listeners(alerts)
+
+    def add_alert_listener(self, listener: typing.Callable[[Alert], None]) -> None:
+        """
+        Registers a callback invoked with each alert after it is created or updated.
+
+        Args:
+            listener: Callback receiving the alert as it was written
+        """
+        self._alert_listeners.append(listener)
+
+    def _notify_alert_listeners(self, alerts: List[Alert]) -> None:
+        """
+        Passes created or updated alerts to the registered listeners.
+
+        Args:
+            alerts: Alerts as they were written
+        """
+        for listener in list(self._alert_listeners):
+            for alert in alerts:
+                try:
+                    listener(alert)
+                except Exception as e:
+                    logger.error(f"Error notifying alert listener for {alert.alert_id}: {e}")
+
+    def _record_alerts(self, alerts: List[Alert]) -> None:
+        """
+        Applies updated alerts to the in-memory aggregates and listeners.
+
+        Args:
+            alerts: Alerts as they were written
+        """
+        self._notify_alert_listeners(alerts)
+        self._apply_to_aggregates(alerts)
+
+    def _apply_to_aggregates(self, alerts: List[Alert]) -> Optional[Dict[str, Any]]:
+        """
+        Applies alerts to the in-memory aggregates.
+
+        Args:
+            alerts: Alerts to apply
+
+        Returns:
+            States of the alerts before they were applied, for AlertAggregateStore.restore,
+            or None if the aggregates are not loaded
+        """
+        if self._aggregates is None or not self._aggregates.ready:
+            # Not loaded yet; the initial load reads these alerts from the table
+            return None
+        try:
+            previous = self._aggregates.get_states(alert.alert_id for alert in alerts)
+            self._aggregates.apply_all(alerts)
+            self._maybe_checkpoint_aggregates()
+            return previous
+        except Exception as e:
+            logger.error(f"Error updating alert aggregates: {e}")
+            return None
+
+    def _get_aggregates(self, time_window_hours: Optional[int], refresh: bool = True) -> Optional[AlertAggregateStore]:
+        """
+        Returns the in-memory aggregates if they can answer a statistics query.
+
+        Args:
+            time_window_hours: Window of the statistics query, None for all alerts
+            refresh: Whether to run a due catch-up or verification first
+
+        Returns:
+            Loaded aggregate store covering the window, or None to query the table
+        """
+        if self._aggregates is None or time_window_hours is None:
+            return None
+        if not self._aggregates.ready:
+            if not self._load_aggregates():
+                return None
+        elif refresh:
+            self._ensure_aggregates_fresh()
+        return self._aggregates if self._aggregates.covers(time_window_hours) else None
+
+    def _ensure_aggregates_fresh(self) -> None:
+        """
+        Verifies the aggregates against the table every verify interval, and otherwise
+        catches them up with alerts updated elsewhere every refresh interval.
+        """
+        now = time.monotonic()
+        if now - self._last_verify >= self._verify_interval:
+            self._last_verify = now
+            self.verify_alert_aggregates(self._aggregates.retention_hours, repair=True)
+        elif now - self._last_refresh >= self._refresh_interval:
+            self.refresh_alert_aggregates()
+
+    def refresh_alert_aggregates(self) -> int:
+        """
+        Applies alerts created or updated since the watermark, e.g. by other processes.
+
+        Returns:
+            Number of alerts that changed the aggregates, or -1 if they could not be read
+        """
+        if self._aggregates is None or not self._aggregates.ready:
+            return 0
+        with self._aggregates_lock:
+            self._last_refresh = time.monotonic()
+            try:
+                self._write_buffer.flush((self._project_id, self._dataset_id, ALERT_TABLE_NAME))
+                applied = self._aggregates.apply_all(self._query_aggregate_rows(self._aggregates.watermark))
+                self._aggregates.prune()
+            except Exception as e:
+                logger.error(f"Error refreshing alert aggregates: {e}")
+                return -1
+        if applied:
+            logger.info(f"Caught up alert aggregates with {applied} alerts updated elsewhere")
+        return applied
+
+    def _query_aggregate_rows(self, updated_since: Optional[datetime.datetime] = None) -> typing.Iterable[Dict[str, Any]]:
+        """
+        Reads the aggregate columns of alerts within the retention period.
+
+        Args:
+            updated_since: Only read alerts updated at or after this time (all alerts if None)
+
+        Returns:
+            Alert rows
+        """
+        query = f"""
+        SELECT {AGGREGATE_COLUMNS}
+        FROM `{self._project_id}.{self._dataset_id}.{ALERT_TABLE_NAME}`
+        WHERE created_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @hours HOUR)
+        """
+        query_params = [{
+            "name": "hours",
+            "parameterType": {"type": "INT64"},
+            "parameterValue": {"value": self._aggregates.retention_hours}
+        }]
+        if updated_since is not None:
+            query += "AND updated_at >= @watermark\n"
+            query_params.append({
+                "name": "watermark",
+                "parameterType": {"type": "TIMESTAMP"},
+                "parameterValue": {"value": updated_since.isoformat()}
+            })
+        return self._bq_client.query(query, query_params)
+
+    def _load_aggregates(self, from_checkpoint: bool = True) -> bool:
+        """
+        Loads the aggregates from the last checkpoint plus newer updates, or from the table.
+
+        Args:
+            from_checkpoint: Whether a checkpoint may be used instead of a full rebuild
+
+        Returns:
+            True if the aggregates are ready
+        """
+        with self._aggregates_lock:
+            if self._aggregates.ready and from_checkpoint:
+                return True
+            try:
+                # Buffered rows must be visible to the catch-up query
+                self._write_buffer.flush((self._project_id, self._dataset_id, ALERT_TABLE_NAME))
+
+                restored = False
+                if self._checkpoint_path and from_checkpoint:
+                    try:
+                        restored = self._aggregates.load_checkpoint(self._checkpoint_path)
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Ignoring unreadable alert aggregate checkpoint {self._checkpoint_path}: {e}")
+
+                if restored and self._aggregates.watermark is not None:
+                    applied = self._aggregates.apply_all(self._query_aggregate_rows(self._aggregates.watermark))
+                    self._aggregates.prune()
+                    logger.info(f"Caught up alert aggregates with {applied} alerts updated since the checkpoint")
+                else:
+                    self._aggregates.rebuild(self._query_aggregate_rows())
+                self._last_refresh = self._last_verify = time.monotonic()
+                return True
+            except Exception as e:
+                logger.error(f"Error loading alert aggregates, falling back to table queries: {e}")
+                return False
+
+    def _maybe_checkpoint_aggregates(self) -> None:
+        """
+        Checkpoints the aggregates when the checkpoint interval has elapsed.
+        """
+        if not self._checkpoint_path or time.monotonic() - self._last_checkpoint < self._checkpoint_interval:
+            return
+        self.checkpoint_alert_aggregates()
+
+    def checkpoint_alert_aggregates(self) -> bool:
+        """
+        Writes the alert aggregates to the configured checkpoint file.
+
+        Returns:
+            True if a checkpoint was written
+        """
+        if self._aggregates is None or not self._aggregates.ready or not self._checkpoint_path:
+            return False
+        self._last_checkpoint = time.monotonic()
+        try:
+            self._aggregates.prune()
+            self._aggregates.save_checkpoint(self._checkpoint_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error checkpointing alert aggregates to {self._checkpoint_path}: {e}")
+            return False
+
+    def verify_alert_aggregates(self, time_window_hours: int = 24, repair: bool = False) -> Dict[str, Any]:
+        """
+        Checks the in-memory alert aggregates against counts computed from the table.
+
+        Args:
+            time_window_hours: Window to compare
+            repair: Whether to rebuild the aggregates from the table when they differ
+
+        Returns:
+            Dictionary with consistent flag, totals, mismatching (status, severity, component)
+            keys and whether the aggregates were repaired
+        """
+        if self._get_aggregates(time_window_hours, refresh=False) is None:
+            return {'consistent': None, 'mismatches': [], 'repaired': False}
+
+        self._write_buffer.flush((self._project_id, self._dataset_id, ALERT_TABLE_NAME))
+        query = f"""
+        SELECT
+            status,
+            severity,
+            component,
+            COUNT(*) as count
+        FROM `{self._project_id}.{self._dataset_id}.{ALERT_TABLE_NAME}`
+        WHERE created_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @hours HOUR)
+        GROUP BY status, severity, component
+        """
+        query_params = [
+            {"name": "hours", "parameterType": {"type": "INT64"}, "parameterValue": {"value": time_window_hours}}
+        ]
+        report = self._aggregates.compare_counts(self._bq_client.query(query, query_params), time_window_hours)
+        report['repaired'] = False
+
+        if not report['consistent']:
+            logger.warning(
+                f"Alert aggregates differ from {ALERT_TABLE_NAME} for {len(report['mismatches'])} keys "
+                f"({report['actual_total']} vs {report['expected_total']} alerts)"
+            )
+            if repair:
+                report['repaired'] = self._load_aggregates(from_checkpoint=False)
+        return report
+
+    def create_alert(self, alert: Alert, durable: bool = False) -> str:
         """
         Creates a new alert record in the database.
 
+        The row is written through the shared write buffer; pass durable=True to wait
+        until it is in BigQuery, e.g. before querying for it.
+
         Args:
             alert: Alert object to create
+            durable: Whether to block until the row has been written
 
         Returns:
             ID of the created alert record
@@ -114,16 +472,8 @@ class AlertRepository:
             if not alert.alert_id or not alert.alert_type or not alert.description:
                 raise ValueError("Alert requires id, type, and description")
             
-            # Convert to BigQuery row format
-            row = alert.to_bigquery_row()
-            
             # Insert into BigQuery
-            self._bq_client.insert_rows(
-                self._project_id,
-                self._dataset_id,
-                ALERT_TABLE_NAME,
-                [row]
-            )
+            self._write_alerts([alert], durable)
             
             logger.info(f"Created alert: {alert.alert_id} - {alert.severity.value} - {alert.alert_type}")
             return alert.alert_id
@@ -131,12 +481,13 @@ class AlertRepository:
             logger.error(f"Error creating alert: {e}")
             raise
 
-    def batch_create_alerts(self, alerts: List[Alert]) -> List[str]:
+    def batch_create_alerts(self, alerts: List[Alert], durable: bool = True) -> List[str]:
         """
         Creates multiple alert records in a single batch operation.
 
         Args:
             alerts: List of Alert objects to create
+            durable: Whether to block until the rows have been written
 
         Returns:
             List of created alert IDs
@@ -150,16 +501,8 @@ class AlertRepository:
                 if not alert.alert_id or not alert.alert_type or not alert.description:
                     raise ValueError("Each alert requires id, type, and description")
             
-            # Convert to BigQuery row format
-            rows = [alert.to_bigquery_row() for alert in alerts]
-            
             # Insert into BigQuery
-            self._bq_client.insert_rows(
-                self._project_id,
-                self._dataset_id,
-                ALERT_TABLE_NAME,
-                rows
-            )
+            self._write_alerts(alerts, durable)
             
             alert_ids = [alert.alert_id for alert in alerts]
             logger.info(f"Created {len(alerts)} alerts in batch operation")
@@ -265,6 +608,8 @@ class AlertRepository:
                 })
             
             result = self._bq_client.query(query, query_params)
+            self._invalidate_cached_queries()
+            self._record_alerts([alert])
             
             logger.info(f"Updated alert: {alert.alert_id} - Status: {alert.status}")
             return True
@@ -782,6 +1127,10 @@ class AlertRepository:
             Dictionary with status as keys and counts as values
         """
         try:
+            aggregates = self._get_aggregates(time_window_hours)
+            if aggregates is not None:
+                return aggregates.count_by('status', time_window_hours)
+            
             # Construct time window clause
             time_clause = ""
             if time_window_hours:
@@ -834,6 +1183,10 @@ class AlertRepository:
             Dictionary with severity as keys and counts as values
         """
         try:
+            aggregates = self._get_aggregates(time_window_hours)
+            if aggregates is not None:
+                return aggregates.count_by('severity', time_window_hours)
+            
             # Construct time window clause
             time_clause = ""
             if time_window_hours:
@@ -867,7 +1220,12 @@ class AlertRepository:
                 })
             
             # Execute query
-            result = self._bq_client.query(query, query_params)
+            result = self._query_cache.get_or_query(
+                self._bq_client,
+                query,
+                query_params,
+                name="alerts.get_alert_count_by_severity"
+            )
             
             # Process results
             severity_counts = {}
@@ -893,6 +1251,13 @@ class AlertRepository:
             Dictionary with component as keys and counts as values
         """
         try:
+            aggregates = self._get_aggregates(time_window_hours)
+            if aggregates is not None:
+                return {
+                    component or 'unknown': count
+                    for component, count in aggregates.count_by('component', time_window_hours).items()
+                }
+            
             # Construct time window clause
             time_clause = ""
             if time_window_hours:
@@ -954,6 +1319,13 @@ class AlertRepository:
             if interval not in ('hourly', 'daily', 'weekly'):
                 raise ValueError("Interval must be 'hourly', 'daily', or 'weekly'")
             
+            # Serve from the in-memory aggregates when they cover the requested intervals
+            window_hours = {'hourly': 1, 'daily': 24, 'weekly': 24 * 7}[interval] * num_intervals
+            aggregates = self._get_aggregates(window_hours)
+            if aggregates is not None:
+                data = aggregates.trend(interval, num_intervals, severity)
+                return pd.DataFrame(data, columns=['time_interval', 'alert_count'])
+            
             # Determine timestamp format and interval expression
             if interval == 'hourly':
                 timestamp_fmt = "FORMAT_TIMESTAMP('%Y-%m-%d %H:00:00', created_at)"
@@ -1021,18 +1393,26 @@ class AlertRepository:
             logger.error(f"Error getting alert trend: {e}")
             return pd.DataFrame(columns=['time_interval', 'alert_count'])
 
-    def search_alerts(self, search_criteria: Dict[str, Any], limit: int = 100, offset: int = 0) -> List[Alert]:
+    def search_alerts(self, search_criteria: Dict[str, Any], limit: int = 100, offset: int = 0,
+                      after: Union[str, Tuple[datetime.datetime, str]] = None) -> List[Alert]:
         """
         Searches alerts based on multiple criteria.
 
         Args:
             search_criteria: Dictionary of search criteria
             limit: Maximum number of alerts to return
-            offset: Number of alerts to skip for pagination
+            offset: Number of alerts to skip for pagination, ignored when after is given
+            after: Cursor from the previous page, or a (created_at, alert_id) tuple
 
         Returns:
             List of Alert objects matching criteria
+
+        Raises:
+            ValidationError: If after is not a valid cursor
         """
+        # Decode the cursor outside the try block so an invalid cursor is reported, not swallowed
+        cursor_condition, cursor_params = build_keyset_condition("created_at", "alert_id", after)
+
         try:
             # Extract search parameters
             alert_type = search_criteria.get('alert_type')
@@ -1113,6 +1493,11 @@ class AlertRepository:
                     "parameterValue": {"value": f"%{text_search}%"}
                 })
             
+            if cursor_condition:
+                conditions.append(cursor_condition)
+                params.extend(cursor_params)
+                offset = 0
+            
             # Add pagination parameters
             params.append({
                 "name": "limit",
@@ -1133,7 +1518,7 @@ class AlertRepository:
             SELECT * 
             FROM `{self._project_id}.{self._dataset_id}.{ALERT_TABLE_NAME}`
             {where_clause}
-            ORDER BY created_at DESC
+            {build_keyset_order_by("created_at", "alert_id")}
             LIMIT @limit
             OFFSET @offset
             """
@@ -1191,6 +1576,9 @@ class AlertRepository:
             
             # Execute delete query
             self._bq_client.query(delete_query, query_params)
+            self._invalidate_cached_queries()
+            if self._aggregates is not None:
+                self._aggregates.drop_before(cutoff_date)
             
             logger.info(f"Deleted {count} alerts older than {cutoff_date}")
             return count
@@ -1209,6 +1597,10 @@ class AlertRepository:
             Dictionary with notification statistics
         """
         try:
+            aggregates = self._get_aggregates(time_window_hours)
+            if aggregates is not None:
+                return aggregates.notification_stats(time_window_hours)
+            
             # Construct time window clause
             time_clause = ""
             if time_window_hours:
@@ -1295,6 +1687,10 @@ class AlertRepository:
             Dictionary with resolution time statistics
         """
         try:
+            aggregates = self._get_aggregates(time_window_hours)
+            if aggregates is not None:
+                return aggregates.resolution_stats(time_window_hours)
+            
             # Construct time window clause
             time_clause = ""
             if time_window_hours:
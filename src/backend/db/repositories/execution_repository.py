@@ -17,6 +17,10 @@ from ...constants import (  # src/backend/constants.py
 )
 from ...utils.logging.logger import get_logger  # src/backend/utils/logging/logger.py
 from ...utils.storage.bigquery_client import BigQueryClient  # src/backend/utils/storage/bigquery_client.py
+from ...utils.storage.keyset_pagination import (  # src/backend/utils/storage/keyset_pagination.py
+    build_keyset_condition,
+    build_keyset_order_by
+)
 from ..models.pipeline_execution import (  # src/backend/db/models/pipeline_execution.py
     PipelineExecution,
     PIPELINE_EXECUTION_TABLE_NAME,
@@ -178,7 +182,8 @@ class ExecutionRepository:
         start_time_from: datetime = None,
         start_time_to: datetime = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: typing.Union[str, tuple] = None
     ) -> typing.List[PipelineExecution]:
         """
         List pipeline executions with optional filtering.
@@ -189,7 +194,8 @@ class ExecutionRepository:
             start_time_from: Filter by start time from
             start_time_to: Filter by start time to
             limit: Maximum number of results to return
-            offset: Offset for pagination
+            offset: Offset for pagination, ignored when after is given
+            after: Cursor from the previous page, or a (start_time, execution_id) tuple
 
         Returns:
             List of PipelineExecution objects
@@ -207,9 +213,17 @@ class ExecutionRepository:
             query += f" AND start_time >= TIMESTAMP('{start_time_from.isoformat()}')"
         if start_time_to:
             query += f" AND start_time <= TIMESTAMP('{start_time_to.isoformat()}')"
-        query += f" ORDER BY start_time DESC LIMIT {limit} OFFSET {offset}"
 
-        result = self._bq_client.execute_query(query)
+        # Resume after the cursor position when one is given
+        cursor_condition, cursor_params = build_keyset_condition("start_time", "execution_id", after)
+        if cursor_condition:
+            query += f" AND {cursor_condition}"
+            offset = 0
+        query += f" {build_keyset_order_by('start_time', 'execution_id')} LIMIT {limit}"
+        if offset:
+            query += f" OFFSET {offset}"
+
+        result = self._bq_client.execute_query(query, parameters=cursor_params or None)
         return [PipelineExecution.from_bigquery_row(row) for row in result]
 
     @retry(max_attempts=3)
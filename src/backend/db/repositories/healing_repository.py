@@ -1,4 +1,5 @@
 import datetime
+import time
 import typing
 import json
 import pandas as pd
@@ -9,6 +10,21 @@ from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ...utils.storage.bigquery_client import BigQueryClient
 from ...utils.storage.firestore_client import FirestoreClient
+from ...utils.storage.keyset_pagination import build_keyset_condition, build_keyset_order_by
+from ...utils.storage.query_cache import QueryResultCache, get_query_cache
+from ...utils.storage.write_buffer import WriteBuffer, get_write_buffer
+from .pattern_index import (
+    IssuePatternIndex,
+    DEFAULT_REFRESH_INTERVAL_SECONDS,
+    DEFAULT_FULL_RELOAD_INTERVAL_SECONDS
+)
+from .success_rate_store import (
+    DecayedSuccessRateStore,
+    get_success_rate_store,
+    DEFAULT_HALF_LIFE_DAYS,
+    DEFAULT_PRIOR_SUCCESS_RATE,
+    DEFAULT_PRIOR_STRENGTH
+)
 
 from ..models.healing_action import (
     HealingAction, 
@@ -34,11 +50,29 @@ from ..models.issue_pattern import (
 # Initialize logger
 logger = get_logger(__name__)
 
+# Configuration keys for the decayed success rate statistics
+SUCCESS_RATES_HALF_LIFE_CONFIG_KEY = "self_healing.success_rates.half_life_days"
+SUCCESS_RATES_PRIOR_RATE_CONFIG_KEY = "self_healing.success_rates.prior_success_rate"
+SUCCESS_RATES_PRIOR_STRENGTH_CONFIG_KEY = "self_healing.success_rates.prior_strength"
+SUCCESS_RATES_SNAPSHOT_PATH_CONFIG_KEY = "self_healing.success_rates.snapshot_path"
+SUCCESS_RATES_SNAPSHOT_INTERVAL_CONFIG_KEY = "self_healing.success_rates.snapshot_interval_seconds"
+SUCCESS_RATES_REFRESH_INTERVAL_CONFIG_KEY = "self_healing.success_rates.refresh_interval_seconds"
+SUCCESS_RATES_REBUILD_INTERVAL_CONFIG_KEY = "self_healing.success_rates.rebuild_interval_seconds"
+
+# Default settings
+DEFAULT_SUCCESS_RATES_SNAPSHOT_INTERVAL_SECONDS = 300
+DEFAULT_SUCCESS_RATES_REFRESH_INTERVAL_SECONDS = 60
+DEFAULT_SUCCESS_RATES_REBUILD_INTERVAL_SECONDS = 86400
+
+# Outcomes older than this many half-lives weigh less than 0.1% and are not read on rebuild
+SUCCESS_RATES_REBUILD_HALF_LIVES = 10
+
 class HealingRepository:
     """Repository for managing healing actions, issue patterns, and healing executions in BigQuery and Firestore"""
     
     def __init__(self, bq_client: BigQueryClient, fs_client: FirestoreClient, 
-                 dataset_id: str = None, project_id: str = None):
+                 dataset_id: str = None, project_id: str = None, query_cache: QueryResultCache = None,
+                 write_buffer: WriteBuffer = None, success_rates: DecayedSuccessRateStore = None):
         """
         Initializes the HealingRepository with BigQuery and Firestore clients and configuration.
         
@@ -47,20 +81,85 @@ class HealingRepository:
             fs_client: Firestore client for real-time data access
             dataset_id: BigQuery dataset ID (optional, can be loaded from config)
             project_id: GCP project ID (optional, can be loaded from config)
+            query_cache: Result cache for aggregation queries (optional, defaults to the shared cache)
+            write_buffer: Micro-batching buffer for inserts (optional, defaults to the client's shared buffer)
+            success_rates: Decayed success rate store (optional, defaults to the process-wide store loaded on first use)
         """
         self._bq_client = bq_client
         self._fs_client = fs_client
+        self._query_cache = query_cache or get_query_cache()
+        self._write_buffer = write_buffer or get_write_buffer(bq_client)
         
         # Get dataset and project from config if not provided
         config = get_config()
         self._dataset_id = dataset_id or config.get_bigquery_dataset()
         self._project_id = project_id or config.get_gcp_project_id()
         
+        # Resident pattern index used for matching, loaded on first use
+        self._pattern_index = IssuePatternIndex(
+            self._load_issue_patterns,
+            refresh_interval_seconds=config.get(
+                "self_healing.pattern_index.refresh_interval_seconds", DEFAULT_REFRESH_INTERVAL_SECONDS
+            ),
+            full_reload_interval_seconds=config.get(
+                "self_healing.pattern_index.full_reload_interval_seconds", DEFAULT_FULL_RELOAD_INTERVAL_SECONDS
+            )
+        )
+        
+        # Decayed success rate statistics shared by the process, loaded on first use and
+        # caught up with executions completed elsewhere every refresh interval
+        self._success_rates = success_rates or get_success_rate_store(
+            half_life_days=float(config.get(SUCCESS_RATES_HALF_LIFE_CONFIG_KEY, DEFAULT_HALF_LIFE_DAYS)),
+            prior_success_rate=float(config.get(SUCCESS_RATES_PRIOR_RATE_CONFIG_KEY, DEFAULT_PRIOR_SUCCESS_RATE)),
+            prior_strength=float(config.get(SUCCESS_RATES_PRIOR_STRENGTH_CONFIG_KEY, DEFAULT_PRIOR_STRENGTH))
+        )
+        self._success_rates_snapshot_path = config.get(SUCCESS_RATES_SNAPSHOT_PATH_CONFIG_KEY, None)
+        self._success_rates_snapshot_interval = float(
+            config.get(SUCCESS_RATES_SNAPSHOT_INTERVAL_CONFIG_KEY, DEFAULT_SUCCESS_RATES_SNAPSHOT_INTERVAL_SECONDS)
+        )
+        self._success_rates_refresh_interval = float(
+            config.get(SUCCESS_RATES_REFRESH_INTERVAL_CONFIG_KEY, DEFAULT_SUCCESS_RATES_REFRESH_INTERVAL_SECONDS)
+        )
+        self._success_rates_rebuild_interval = float(
+            config.get(SUCCESS_RATES_REBUILD_INTERVAL_CONFIG_KEY, DEFAULT_SUCCESS_RATES_REBUILD_INTERVAL_SECONDS)
+        )
+        
         # Ensure tables exist
         self.ensure_tables_exist()
         
         logger.info(f"HealingRepository initialized with dataset {self._dataset_id}")
 
+    def _invalidate_cached_queries(self, table_name: str) -> None:
+        """
+        Invalidates cached query results that read a table after a write.
+        
+        Args:
+            table_name: Name of the table that was written
+        """
+        self._query_cache.invalidate_table(f"{self._project_id}.{self._dataset_id}.{table_name}")
+
+    def _write_rows(self, table_name: str, rows: List[Dict[str, Any]], insert_ids: List[str],
+                    durable: bool) -> None:
+        """
+        Writes rows through the write buffer, invalidating cached queries once delivered.
+        
+        Args:
+            table_name: Destination table
+            rows: Rows to insert
+            insert_ids: Record IDs used to deduplicate retried inserts
+            durable: Whether to block until the rows have been written
+        """
+        written = self._write_buffer.append(
+            self._dataset_id,
+            table_name,
+            rows,
+            insert_ids=insert_ids,
+            wait=durable,
+            on_delivered=lambda: self._invalidate_cached_queries(table_name)
+        )
+        if not written:
+            raise RuntimeError(f"Failed to write {len(rows)} rows to {table_name}")
+
     def ensure_tables_exist(self) -> bool:
         """
         Ensures that required tables exist in BigQuery for healing data.
@@ -150,6 +249,7 @@ class HealingRepository:
                 HEALING_ACTION_TABLE_NAME,
                 [row]
             )
+            self._invalidate_cached_queries(HEALING_ACTION_TABLE_NAME)
             
             # Store in Firestore for fast access
             self._fs_client.set_document(
@@ -164,12 +264,13 @@ class HealingRepository:
             logger.error(f"Error creating healing action: {str(e)}")
             raise
 
-    def batch_create_healing_actions(self, actions: List[HealingAction]) -> List[HealingAction]:
+    def batch_create_healing_actions(self, actions: List[HealingAction], durable: bool = True) -> List[HealingAction]:
         """
         Creates multiple healing actions in a single batch operation.
         
         Args:
             actions: List of HealingAction objects to create
+            durable: Whether to block until the rows have been written
             
         Returns:
             List of created HealingAction objects
@@ -183,11 +284,7 @@ class HealingRepository:
             
             # Insert rows into BigQuery
             rows = [action.to_dict() for action in actions]
-            self._bq_client.insert_rows(
-                self._dataset_id,
-                HEALING_ACTION_TABLE_NAME,
-                rows
-            )
+            self._write_rows(HEALING_ACTION_TABLE_NAME, rows, [action.action_id for action in actions], durable)
             
             # Store in Firestore for fast access
             for action in actions:
@@ -320,6 +417,7 @@ class HealingRepository:
             
             # Execute update
             self._bq_client.query(query, query_params)
+            self._invalidate_cached_queries(HEALING_ACTION_TABLE_NAME)
             
             # Update in Firestore
             self._fs_client.set_document(
@@ -356,6 +454,7 @@ class HealingRepository:
             ]
             
             self._bq_client.query(query, query_params)
+            self._invalidate_cached_queries(HEALING_ACTION_TABLE_NAME)
             
             # Delete from Firestore
             self._fs_client.delete_document(f"healing_actions/{action_id}")
@@ -495,7 +594,8 @@ class HealingRepository:
         self, 
         active_only: bool = True,
         limit: int = 100, 
-        offset: int = 0
+        offset: int = 0,
+        after: Union[str, Tuple[datetime.datetime, str]] = None
     ) -> List[HealingAction]:
         """
         Retrieves all healing actions with optional filtering.
@@ -503,11 +603,18 @@ class HealingRepository:
         Args:
             active_only: Whether to return only active actions
             limit: Maximum number of actions to return
-            offset: Number of actions to skip
+            offset: Number of actions to skip, ignored when after is given
+            after: Cursor from the previous page, or a (created_at, action_id) tuple
             
         Returns:
             List of HealingAction objects
+
+        Raises:
+            ValidationError: If after is not a valid cursor
         """
+        # Decode the cursor outside the try block so an invalid cursor is reported, not swallowed
+        cursor_condition, cursor_params = build_keyset_condition("created_at", "action_id", after)
+
         try:
             # Build query with filters
             query = f"""
@@ -516,16 +623,25 @@ class HealingRepository:
             """
             
             query_params = []
+            conditions = []
             
             if active_only:
-                query += " WHERE is_active = @is_active"
+                conditions.append("is_active = @is_active")
                 query_params.append(
                     {"name": "is_active", "parameterType": {"type": "BOOL"}, "parameterValue": {"value": True}}
                 )
             
+            if cursor_condition:
+                conditions.append(cursor_condition)
+                query_params.extend(cursor_params)
+                offset = 0
+            
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            
             # Add ordering and pagination
-            query += """
-                ORDER BY created_at DESC
+            query += f"""
+                {build_keyset_order_by("created_at", "action_id")}
                 LIMIT @limit
                 OFFSET @offset
             """
@@ -699,6 +815,8 @@ class HealingRepository:
                 ISSUE_PATTERN_TABLE_NAME,
                 [row]
             )
+            self._invalidate_cached_queries(ISSUE_PATTERN_TABLE_NAME)
+            self._pattern_index.upsert(pattern)
             
             # Store in Firestore for fast access
             self._fs_client.set_document(
@@ -713,12 +831,13 @@ class HealingRepository:
             logger.error(f"Error creating issue pattern: {str(e)}")
             raise
     
-    def batch_create_issue_patterns(self, patterns: List[IssuePattern]) -> List[IssuePattern]:
+    def batch_create_issue_patterns(self, patterns: List[IssuePattern], durable: bool = True) -> List[IssuePattern]:
         """
         Creates multiple issue patterns in a single batch operation.
         
         Args:
             patterns: List of IssuePattern objects to create
+            durable: Whether to block until the rows have been written
             
         Returns:
             List of created IssuePattern objects
@@ -732,11 +851,9 @@ class HealingRepository:
             
             # Insert rows into BigQuery
             rows = [pattern.to_bigquery_row() for pattern in patterns]
-            self._bq_client.insert_rows(
-                self._dataset_id,
-                ISSUE_PATTERN_TABLE_NAME,
-                rows
-            )
+            self._write_rows(ISSUE_PATTERN_TABLE_NAME, rows, [pattern.pattern_id for pattern in patterns], durable)
+            for pattern in patterns:
+                self._pattern_index.upsert(pattern)
             
             # Store in Firestore for fast access
             for pattern in patterns:
@@ -852,6 +969,8 @@ class HealingRepository:
             
             # Execute update
             self._bq_client.query(query, query_params)
+            self._invalidate_cached_queries(ISSUE_PATTERN_TABLE_NAME)
+            self._pattern_index.upsert(pattern)
             
             # Update in Firestore
             self._fs_client.set_document(
@@ -888,6 +1007,8 @@ class HealingRepository:
             ]
             
             self._bq_client.query(query, query_params)
+            self._invalidate_cached_queries(ISSUE_PATTERN_TABLE_NAME)
+            self._pattern_index.remove(pattern_id)
             
             # Delete from Firestore
             self._fs_client.delete_document(f"issue_patterns/{pattern_id}")
@@ -949,32 +1070,45 @@ class HealingRepository:
     def get_all_issue_patterns(
         self, 
         limit: int = 100, 
-        offset: int = 0
+        offset: int = 0,
+        after: Union[str, Tuple[datetime.datetime, str]] = None
     ) -> List[IssuePattern]:
         """
         Retrieves all issue patterns with optional filtering.
         
         Args:
             limit: Maximum number of patterns to return
-            offset: Number of patterns to skip
+            offset: Number of patterns to skip, ignored when after is given
+            after: Cursor from the previous page, or a (created_at, pattern_id) tuple
             
         Returns:
             List of IssuePattern objects
+
+        Raises:
+            ValidationError: If after is not a valid cursor
         """
+        # Decode the cursor outside the try block so an invalid cursor is reported, not swallowed
+        cursor_condition, query_params = build_keyset_condition("created_at", "pattern_id", after)
+
         try:
+            where_clause = f"WHERE {cursor_condition}" if cursor_condition else ""
+            if cursor_condition:
+                offset = 0
+            
             # Build query
             query = f"""
                 SELECT *
                 FROM `{self._project_id}.{self._dataset_id}.{ISSUE_PATTERN_TABLE_NAME}`
-                ORDER BY created_at DESC
+                {where_clause}
+                {build_keyset_order_by("created_at", "pattern_id")}
                 LIMIT @limit
                 OFFSET @offset
             """
             
-            query_params = [
+            query_params.extend([
                 {"name": "limit", "parameterType": {"type": "INT64"}, "parameterValue": {"value": limit}},
                 {"name": "offset", "parameterType": {"type": "INT64"}, "parameterValue": {"value": offset}}
-            ]
+            ])
             
             # Execute query
             results = self._bq_client.query(query, query_params)
@@ -1026,6 +1160,9 @@ class HealingRepository:
         """
         Finds issue patterns that match a given issue.
         
+        Matching runs against the resident pattern index, which holds every pattern and
+        only scores patterns sharing feature keys or values with the issue.
+        
         Args:
             issue_data: Issue data to match against patterns
             min_confidence: Minimum confidence threshold for matches
@@ -1035,22 +1172,10 @@ class HealingRepository:
             List of tuples with (IssuePattern, confidence_score) sorted by confidence
         """
         try:
-            # Get all patterns
-            all_patterns = self.get_all_issue_patterns(limit=1000)
+            # Load the index on first use and pick up patterns updated elsewhere
+            self._pattern_index.ensure_fresh()
             
-            # Check each pattern for a match
-            matches = []
-            for pattern in all_patterns:
-                matches_issue, confidence = pattern.matches_issue(issue_data, min_confidence)
-                if matches_issue:
-                    matches.append((pattern, confidence))
-            
-            # Sort by confidence score (descending)
-            matches.sort(key=lambda x: x[1], reverse=True)
-            
-            # Limit the number of results
-            if limit and limit < len(matches):
-                matches = matches[:limit]
+            matches = self._pattern_index.find_matches(issue_data, min_confidence, limit)
             
             logger.info(f"Found {len(matches)} matching patterns for issue")
             return matches
@@ -1059,6 +1184,33 @@ class HealingRepository:
             logger.error(f"Error finding matching patterns: {str(e)}")
             return []
     
+    def _load_issue_patterns(self, updated_since: datetime.datetime = None) -> List[IssuePattern]:
+        """
+        Loads issue patterns for the pattern index.
+        
+        Args:
+            updated_since: Only load patterns updated at or after this time (all patterns if None)
+            
+        Returns:
+            List of IssuePattern objects
+        """
+        query = f"""
+            SELECT *
+            FROM `{self._project_id}.{self._dataset_id}.{ISSUE_PATTERN_TABLE_NAME}`
+        """
+        query_params = []
+        
+        if updated_since:
+            query += " WHERE updated_at >= @updated_since"
+            query_params.append({
+                "name": "updated_since",
+                "parameterType": {"type": "TIMESTAMP"},
+                "parameterValue": {"value": updated_since.isoformat()}
+            })
+        
+        results = self._bq_client.query(query, query_params)
+        return [IssuePattern.from_bigquery_row(dict(row)) for row in results]
+    
     #
     # Healing Execution Methods
     #
@@ -1068,17 +1220,22 @@ class HealingRepository:
         pattern_id: str, 
         action_id: str, 
         issue_details: Dict[str, Any],
-        validation_id: str = None
+        validation_id: str = None,
+        durable: bool = False
     ) -> HealingExecution:
         """
         Creates a new healing execution record in the database.
         
+        The BigQuery row is written through the shared write buffer; the Firestore
+        document is written immediately for fast access.
+        
         Args:
             execution_id: ID of the pipeline execution
             pattern_id: ID of the detected issue pattern
             action_id: ID of the healing action being applied
             issue_details: Details about the issue being addressed
             validation_id: Optional ID of the validation that triggered healing
+            durable: Whether to block until the BigQuery row has been written
             
         Returns:
             Created HealingExecution object
@@ -1095,11 +1252,7 @@ class HealingRepository:
             
             # Insert into BigQuery
             row = healing_exec.to_bigquery_row()
-            self._bq_client.insert_rows(
-                self._dataset_id,
-                HEALING_EXECUTION_TABLE_NAME,
-                [row]
-            )
+            self._write_rows(HEALING_EXECUTION_TABLE_NAME, [row], [healing_exec.healing_id], durable)
             
             # Store in Firestore for fast access
             self._fs_client.set_document(
@@ -1225,6 +1378,7 @@ class HealingRepository:
             
             # Execute update
             self._bq_client.query(query, query_params)
+            self._invalidate_cached_queries(HEALING_EXECUTION_TABLE_NAME)
             
             # Update in Firestore
             self._fs_client.set_document(
@@ -1303,6 +1457,7 @@ class HealingRepository:
             if result and successful is not None:
                 self.update_issue_pattern_stats(execution.pattern_id, successful)
                 self.update_healing_action_stats(execution.action_id, successful)
+                self._record_execution_outcome(execution)
             
             return result
             
@@ -1310,6 +1465,256 @@ class HealingRepository:
             logger.error(f"Error completing healing execution {healing_id}: {str(e)}")
             return False
     
+    def record_completed_execution(
+        self,
+        execution_id: str,
+        pattern_id: str,
+        action_id: str,
+        confidence_score: float,
+        successful: bool,
+        execution_details: Dict[str, Any] = None,
+        issue_details: Dict[str, Any] = None,
+        validation_id: str = None
+    ) -> Optional[str]:
+        """
+        Records a healing action that has already run, updating the pattern, action and success rate statistics.
+        
+        Args:
+            execution_id: ID of the pipeline execution
+            pattern_id: ID of the issue pattern
+            action_id: ID of the healing action that ran
+            confidence_score: Confidence score the action was applied with
+            successful: Whether the healing was successful
+            execution_details: Optional execution details
+            issue_details: Optional details about the issue, including its issue_category
+            validation_id: Optional ID of the validation that triggered healing
+            
+        Returns:
+            ID of the healing execution, or None if it could not be recorded
+        """
+        try:
+            execution = self.create_healing_execution(execution_id, pattern_id, action_id, issue_details or {}, validation_id)
+            self.start_healing_execution(execution.healing_id, confidence_score)
+            if not self.complete_healing_execution(execution.healing_id, successful, execution_details):
+                return None
+            return execution.healing_id
+        except Exception as e:
+            logger.error(f"Error recording healing execution for execution {execution_id}: {str(e)}")
+            return None
+    
+    #
+    # Success Rate Methods
+    #
+    def get_success_rate(
+        self,
+        action_type: HealingActionType,
+        pattern_id: str = None,
+        issue_category: str = None,
+        prior_strength: float = None
+    ) -> float:
+        """
+        Gets the time-decayed success rate of an action type, optionally for a pattern and issue category.
+        
+        Sparse keys are shrunk towards the rate of the action on the pattern, then of the
+        action type, then towards the configured prior.
+        
+        Args:
+            action_type: Type of healing action
+            pattern_id: ID of the issue pattern (optional)
+            issue_category: Category of the issue (optional)
+            prior_strength: Pseudo-observations given to each prior level (optional)
+            
+        Returns:
+            Success rate between 0.0 and 1.0
+        """
+        self._ensure_success_rates_fresh()
+        return self._success_rates.get_success_rate(action_type, pattern_id, issue_category, prior_strength)
+    
+    def get_success_counts(
+        self,
+        action_type: HealingActionType,
+        pattern_id: str = None,
+        issue_category: str = None
+    ) -> Tuple[float, float]:
+        """
+        Gets the time-decayed success and failure counts of an action type, pattern and issue category.
+        
+        Args:
+            action_type: Type of healing action
+            pattern_id: ID of the issue pattern (optional)
+            issue_category: Category of the issue (optional)
+            
+        Returns:
+            Tuple of decayed (successes, failures)
+        """
+        self._ensure_success_rates_fresh()
+        return self._success_rates.get_counts(action_type, pattern_id, issue_category)
+    
+    def rebuild_success_rates(self) -> bool:
+        """
+        Rebuilds the success rate statistics from the execution history in one pass.
+        
+        Returns:
+            True if the statistics were rebuilt
+        """
+        return self._load_success_rates(from_snapshot=False)
+    
+    def refresh_success_rates(self) -> int:
+        """
+        Adds executions completed since the newest recorded outcome, e.g. by other processes.
+        
+        Returns:
+            Number of outcomes added, or -1 if the history could not be read
+        """
+        store = self._success_rates
+        if store.synced_at is None:
+            return 0 if self._load_success_rates() else -1
+        with store.sync_lock:
+            try:
+                self._write_buffer.flush((self._dataset_id, HEALING_EXECUTION_TABLE_NAME))
+                since = store.watermark or self._success_rates_history_start()
+                recorded = store.record_all(self._query_execution_outcomes(since))
+                store.synced_at = time.monotonic()
+            except Exception as e:
+                logger.error(f"Error catching up success rate statistics: {str(e)}")
+                return -1
+        if recorded:
+            logger.info(f"Caught up success rate statistics with {recorded} healing executions")
+            self.snapshot_success_rates()
+        return recorded
+    
+    def snapshot_success_rates(self) -> bool:
+        """
+        Writes the success rate statistics to the configured snapshot file.
+        
+        Returns:
+            True if a snapshot was written
+        """
+        if self._success_rates.synced_at is None or not self._success_rates_snapshot_path:
+            return False
+        self._success_rates.snapshotted_at = time.monotonic()
+        try:
+            self._success_rates.save_snapshot(self._success_rates_snapshot_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error writing success rate snapshot {self._success_rates_snapshot_path}: {str(e)}")
+            return False
+    
+    def _record_execution_outcome(self, execution: HealingExecution) -> None:
+        """
+        Adds a completed execution to the success rate statistics.
+        
+        Args:
+            execution: Completed healing execution
+        """
+        if self._success_rates.synced_at is None:
+            # The next load reads the outcome from the table
+            return
+        action = self.get_healing_action(execution.action_id)
+        if not action:
+            return
+        self._success_rates.record(
+            action.action_type,
+            execution.pattern_id,
+            (execution.issue_details or {}).get("issue_category"),
+            execution.successful,
+            execution.completion_time
+        )
+        snapshotted_at = self._success_rates.snapshotted_at or self._success_rates.synced_at
+        if (self._success_rates_snapshot_path
+                and time.monotonic() - snapshotted_at >= self._success_rates_snapshot_interval):
+            self.snapshot_success_rates()
+    
+    def _ensure_success_rates_fresh(self) -> None:
+        """
+        Loads the success rate statistics on first use, catches them up every refresh
+        interval and rebuilds them every rebuild interval.
+        """
+        store = self._success_rates
+        now = time.monotonic()
+        if store.synced_at is None:
+            self._load_success_rates()
+        elif store.rebuilt_at is not None and now - store.rebuilt_at >= self._success_rates_rebuild_interval:
+            # Outcomes written elsewhere with completion times behind the watermark are only seen by a rebuild
+            self._load_success_rates(from_snapshot=False)
+        elif now - store.synced_at >= self._success_rates_refresh_interval:
+            self.refresh_success_rates()
+    
+    def _load_success_rates(self, from_snapshot: bool = True) -> bool:
+        """
+        Loads the success rate statistics from the snapshot plus newer outcomes, or from the history.
+        
+        Args:
+            from_snapshot: Whether a snapshot may be used instead of a full rebuild
+            
+        Returns:
+            True if the statistics are ready
+        """
+        store = self._success_rates
+        if store.synced_at is not None and from_snapshot:
+            return True
+        with store.sync_lock:
+            if store.synced_at is not None and from_snapshot:
+                return True
+            try:
+                # Buffered rows must be visible to the history query
+                self._write_buffer.flush((self._dataset_id, HEALING_EXECUTION_TABLE_NAME))
+                
+                restored = False
+                if self._success_rates_snapshot_path and from_snapshot:
+                    try:
+                        restored = store.load_snapshot(self._success_rates_snapshot_path)
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Ignoring unreadable success rate snapshot {self._success_rates_snapshot_path}: {e}")
+                
+                if restored and store.watermark is not None:
+                    recorded = store.record_all(self._query_execution_outcomes(store.watermark))
+                    logger.info(f"Caught up success rate statistics with {recorded} healing executions since the snapshot")
+                else:
+                    recorded = store.rebuild(self._query_execution_outcomes(self._success_rates_history_start()))
+                    logger.info(f"Rebuilt success rate statistics from {recorded} healing executions")
+                store.synced_at = store.rebuilt_at = time.monotonic()
+            except Exception as e:
+                logger.error(f"Error loading success rate statistics, using priors: {str(e)}")
+                return False
+        self.snapshot_success_rates()
+        return True
+    
+    def _success_rates_history_start(self) -> datetime.datetime:
+        """
+        Gets the completion time before which outcomes are too decayed to be read on rebuild.
+        
+        Returns:
+            Naive UTC datetime
+        """
+        return datetime.datetime.utcnow() - datetime.timedelta(
+            days=self._success_rates.half_life_days * SUCCESS_RATES_REBUILD_HALF_LIVES
+        )
+    
+    def _query_execution_outcomes(self, since: datetime.datetime) -> typing.Iterator[Dict[str, Any]]:
+        """
+        Reads the outcomes of healing executions completed after a time.
+        
+        Args:
+            since: Exclusive lower bound on the completion time
+            
+        Returns:
+            Outcome dictionaries as accepted by DecayedSuccessRateStore.record_all
+        """
+        query = f"""
+            SELECT a.action_type, e.pattern_id, JSON_VALUE(e.issue_details, '$.issue_category') AS issue_category,
+                   e.successful, e.completion_time
+            FROM `{self._project_id}.{self._dataset_id}.{HEALING_EXECUTION_TABLE_NAME}` e
+            JOIN `{self._project_id}.{self._dataset_id}.{HEALING_ACTION_TABLE_NAME}` a
+            ON e.action_id = a.action_id
+            WHERE e.successful IS NOT NULL
+            AND e.completion_time > @since
+        """
+        query_params = [
+            {"name": "since", "parameterType": {"type": "TIMESTAMP"}, "parameterValue": {"value": since.isoformat()}}
+        ]
+        return (dict(row) for row in self._bq_client.query(query, query_params))
+    
     def get_healing_executions_by_execution(
         self, 
         execution_id: str,
@@ -1637,7 +2042,9 @@ class HealingRepository:
                 {where_clause}
             """
             
-            results = self._bq_client.query(query, query_params)
+            results = self._query_cache.get_or_query(
+                self._bq_client, query, query_params, name="healing.get_healing_metrics"
+            )
             rows = list(results)
             
             if rows:
@@ -1666,7 +2073,9 @@ class HealingRepository:
                 ORDER BY total_executions DESC
             """
             
-            action_type_results = self._bq_client.query(action_type_query, query_params)
+            action_type_results = self._query_cache.get_or_query(
+                self._bq_client, action_type_query, query_params, name="healing.get_healing_metrics"
+            )
             
             metrics["by_action_type"] = {
                 row["action_type"]: {
@@ -1691,7 +2100,9 @@ class HealingRepository:
                 ORDER BY total_executions DESC
             """
             
-            pattern_type_results = self._bq_client.query(pattern_type_query, query_params)
+            pattern_type_results = self._query_cache.get_or_query(
+                self._bq_client, pattern_type_query, query_params, name="healing.get_healing_metrics"
+            )
             
             metrics["by_pattern_type"] = {
                 row["pattern_type"]: {
@@ -1719,7 +2130,9 @@ class HealingRepository:
                 LIMIT 10
             """
             
-            top_patterns_results = self._bq_client.query(top_patterns_query, query_params)
+            top_patterns_results = self._query_cache.get_or_query(
+                self._bq_client, top_patterns_query, query_params, name="healing.get_healing_metrics"
+            )
             
             metrics["top_patterns"] = [
                 {
@@ -1751,7 +2164,9 @@ class HealingRepository:
                 LIMIT 10
             """
             
-            top_actions_results = self._bq_client.query(top_actions_query, query_params)
+            top_actions_results = self._query_cache.get_or_query(
+                self._bq_client, top_actions_query, query_params, name="healing.get_healing_metrics"
+            )
             
             metrics["top_actions"] = [
                 {
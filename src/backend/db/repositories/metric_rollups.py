@@ -0,0 +1,612 @@
+"""
+Multi-resolution rollups for pipeline metrics.
+
+MetricsRepository keeps three rollup tiers (1 minute, 1 hour, 1 day) next to the raw
+pipeline_metrics table. Each rollup row holds count, sum, min, max and a mergeable
+quantile sketch for one (metric, labels, bucket) and is written as a partial aggregate
+whenever metrics are inserted, so rollups never require a read-modify-write. Queries
+merge partials per bucket.
+
+The planner splits a requested time range into aligned segments, using the coarsest
+tier whose buckets fit entirely inside the range and finer tiers (and finally raw rows)
+for the unaligned edges. Long-range dashboards therefore read a handful of daily rows
+instead of scanning every raw metric.
+"""
+
+import datetime
+import json
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models.pipeline_metric import PIPELINE_METRIC_ROLLUP_TABLE_PREFIX
+
+# Default sketch settings: 1% relative error on every quantile
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees.
+
+    Values are counted in logarithmically sized bins (the DDSketch layout), so any
+    quantile is returned within relative_accuracy of the true value and two sketches
+    merge by adding bin counts. When the number of bins exceeds max_bins the lowest
+    bins are collapsed, which only affects accuracy for the smallest magnitudes.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS):
+        """
+        Initializes an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles (0 < accuracy < 1)
+            max_bins: Maximum number of bins kept per sign
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @property
+    def log_gamma(self) -> float:
+        """Returns the natural log of the bin growth factor, for computing bin indexes in SQL"""
+        return self._log_gamma
+
+    def _index(self, magnitude: float) -> int:
+        """Returns the bin index for a positive magnitude"""
+        return int(math.ceil(math.log(magnitude) / self._log_gamma))
+
+    def _bin_value(self, index: int) -> float:
+        """Returns the representative magnitude of a bin"""
+        return 2.0 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """
+        Adds a value to the sketch.
+
+        Args:
+            value: Value to add
+            weight: Number of occurrences of the value
+        """
+        value = float(value)
+        if math.isnan(value) or weight <= 0:
+            return
+
+        if value > 0:
+            bins = self.positive
+            index = self._index(value)
+            bins[index] = bins.get(index, 0) + weight
+            self._collapse(bins)
+        elif value < 0:
+            bins = self.negative
+            index = self._index(-value)
+            bins[index] = bins.get(index, 0) + weight
+            self._collapse(bins)
+        else:
+            self.zero_count += weight
+
+        self.count += weight
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def add_bin(self, sign: int, index: int, count: int, min_value: float, max_value: float) -> None:
+        """
+        Adds pre-binned values, e.g. counts grouped by bin index in a SQL query.
+
+        Args:
+            sign: Sign of the values (-1, 0 or 1)
+            index: Bin index, ceil(ln(|value|) / log_gamma), ignored for zero
+            count: Number of values in the bin
+            min_value: Smallest value in the bin
+            max_value: Largest value in the bin
+        """
+        if count <= 0:
+            return
+        if sign > 0:
+            self.positive[index] = self.positive.get(index, 0) + count
+            self._collapse(self.positive)
+        elif sign < 0:
+            self.negative[index] = self.negative.get(index, 0) + count
+            self._collapse(self.negative)
+        else:
+            self.zero_count += count
+
+        self.count += count
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Merges another sketch into this one.
+
+        Args:
+            other: Sketch built with the same relative accuracy
+        """
+        if other.count == 0:
+            return
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for index, count in other.positive.items():
+            self.positive[index] = self.positive.get(index, 0) + count
+        for index, count in other.negative.items():
+            self.negative[index] = self.negative.get(index, 0) + count
+        self._collapse(self.positive)
+        self._collapse(self.negative)
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the approximate value at a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Approximate quantile value, or None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Most negative values first: largest magnitude negative bins
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return self._clamp(-self._bin_value(index))
+
+        seen += self.zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._clamp(self._bin_value(index))
+
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        """Keeps bin estimates within the observed range"""
+        return max(self.min, min(self.max, value))
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Folds the lowest bins together when the bin limit is exceeded"""
+        if len(bins) <= self.max_bins:
+            return
+        ordered = sorted(bins)
+        excess = len(bins) - self.max_bins + 1
+        folded = sum(bins.pop(index) for index in ordered[:excess])
+        target = ordered[excess]
+        bins[target] = bins.get(target, 0) + folded
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the sketch to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation of the sketch
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(index): count for index, count in self.positive.items()},
+            "negative": {str(index): count for index, count in self.negative.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], max_bins: int = DEFAULT_MAX_BINS) -> 'QuantileSketch':
+        """
+        Creates a sketch from its dictionary representation.
+
+        Args:
+            data: Dictionary produced by to_dict
+            max_bins: Maximum number of bins kept per sign
+
+        Returns:
+            QuantileSketch instance
+        """
+        sketch = cls(data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY), max_bins)
+        sketch.positive = {int(index): count for index, count in data.get("positive", {}).items()}
+        sketch.negative = {int(index): count for index, count in data.get("negative", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        return sketch
+
+
+class RollupTier:
+    """A rollup resolution and the table that stores it"""
+
+    def __init__(self, name: str, bucket_seconds: int):
+        """
+        Initializes a rollup tier.
+
+        Args:
+            name: Short tier name used as the table suffix (e.g. '1h')
+            bucket_seconds: Width of each rollup bucket in seconds
+        """
+        self.name = name
+        self.bucket_seconds = bucket_seconds
+
+    @property
+    def table_name(self) -> str:
+        """Returns the BigQuery table name for this tier"""
+        return f"{PIPELINE_METRIC_ROLLUP_TABLE_PREFIX}_{self.name}"
+
+    def __repr__(self) -> str:
+        return f"RollupTier({self.name!r}, {self.bucket_seconds})"
+
+
+# Rollup tiers from finest to coarsest
+ROLLUP_TIERS = (
+    RollupTier("1m", 60),
+    RollupTier("1h", 3600),
+    RollupTier("1d", 86400)
+)
+
+
+class RollupAggregate:
+    """Count, sum, min, max and quantile sketch for one rollup bucket"""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        Initializes an empty aggregate.
+
+        Args:
+            relative_accuracy: Relative accuracy of the quantile sketch
+        """
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        """
+        Adds a raw value.
+
+        Args:
+            value: Numeric metric value
+        """
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sketch.add(value)
+
+    def add_summary(self, count: int, total: float, min_value: float, max_value: float,
+                    sign: int = None, bin_index: int = None) -> None:
+        """
+        Adds values already summarized by a query.
+
+        Args:
+            count: Number of values
+            total: Sum of the values
+            min_value: Smallest value
+            max_value: Largest value
+            sign: Sign of the values when they share one sketch bin
+            bin_index: Sketch bin of the values (sketch is left empty if None)
+        """
+        if not count:
+            return
+        self.count += count
+        self.sum += total
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+        if sign is not None and bin_index is not None:
+            self.sketch.add_bin(sign, bin_index, count, min_value, max_value)
+
+    def merge(self, other: 'RollupAggregate') -> None:
+        """
+        Merges another aggregate into this one.
+
+        Args:
+            other: Aggregate to merge
+        """
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def value(self, aggregation: str) -> Optional[float]:
+        """
+        Returns an aggregated value.
+
+        Args:
+            aggregation: One of 'avg', 'sum', 'min', 'max', 'count'
+
+        Returns:
+            Aggregated value, or None for an empty aggregate (count returns 0)
+        """
+        if aggregation == 'count':
+            return self.count
+        if self.count == 0:
+            return None
+        if aggregation == 'sum':
+            return self.sum
+        if aggregation == 'min':
+            return self.min
+        if aggregation == 'max':
+            return self.max
+        return self.sum / self.count
+
+    def to_row(self, metric_name: str, labels: str, bucket_start: datetime.datetime) -> Dict[str, Any]:
+        """
+        Converts the aggregate to a rollup table row.
+
+        Args:
+            metric_name: Name of the metric
+            labels: Canonical labels JSON string
+            bucket_start: Start of the rollup bucket
+
+        Returns:
+            Dictionary formatted for BigQuery insertion
+        """
+        return {
+            "metric_name": metric_name,
+            "labels": labels,
+            "bucket_start": bucket_start.isoformat(),
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "sketch": json.dumps(self.sketch.to_dict()),
+            "created_at": datetime.datetime.now().isoformat()
+        }
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'RollupAggregate':
+        """
+        Creates an aggregate from a rollup table row.
+
+        Args:
+            row: Rollup table row (the sketch column may be omitted)
+
+        Returns:
+            RollupAggregate instance
+        """
+        aggregate = cls()
+        aggregate.count = row.get("count") or 0
+        aggregate.sum = row.get("sum") or 0.0
+        aggregate.min = row.get("min")
+        aggregate.max = row.get("max")
+        sketch = row.get("sketch")
+        if sketch:
+            aggregate.sketch = QuantileSketch.from_dict(json.loads(sketch) if isinstance(sketch, str) else sketch)
+        return aggregate
+
+
+class RollupSegment:
+    """A slice [start, end) of a query range served by one tier or by raw rows"""
+
+    def __init__(self, tier: Optional[RollupTier], start: datetime.datetime, end: datetime.datetime):
+        """
+        Initializes a segment.
+
+        Args:
+            tier: Rollup tier serving the segment, or None for raw metric rows
+            start: Inclusive segment start
+            end: Exclusive segment end
+        """
+        self.tier = tier
+        self.start = start
+        self.end = end
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RollupSegment) and \
+            (self.tier, self.start, self.end) == (other.tier, other.start, other.end)
+
+    def __repr__(self) -> str:
+        tier_name = self.tier.name if self.tier else "raw"
+        return f"RollupSegment({tier_name}, {self.start.isoformat()}, {self.end.isoformat()})"
+
+
+def to_utc_naive(timestamp: datetime.datetime) -> datetime.datetime:
+    """
+    Normalizes a timestamp to naive UTC, the convention BigQuery applies to naive values.
+
+    Args:
+        timestamp: Naive (assumed UTC) or timezone-aware timestamp
+
+    Returns:
+        Naive UTC timestamp
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+def truncate_timestamp(timestamp: datetime.datetime, bucket_seconds: int) -> datetime.datetime:
+    """
+    Truncates a timestamp to the start of its bucket.
+
+    Args:
+        timestamp: Timestamp to truncate
+        bucket_seconds: Bucket width in seconds
+
+    Returns:
+        Naive UTC bucket start aligned to the Unix epoch
+    """
+    timestamp = to_utc_naive(timestamp)
+    elapsed = int((timestamp - _EPOCH).total_seconds() // bucket_seconds) * bucket_seconds
+    return _EPOCH + datetime.timedelta(seconds=elapsed)
+
+
+def canonical_labels(labels: Any) -> str:
+    """
+    Serializes labels so equal label sets produce the same rollup key.
+
+    Args:
+        labels: Labels dictionary or JSON string
+
+    Returns:
+        JSON string with sorted keys ('{}' for no labels)
+    """
+    if isinstance(labels, str):
+        try:
+            labels = json.loads(labels) if labels else {}
+        except json.JSONDecodeError:
+            labels = {}
+    return json.dumps(labels or {}, sort_keys=True, separators=(",", ":"))
+
+
+def to_numeric_value(value: Any) -> Optional[float]:
+    """
+    Converts a metric value to a float if it is numeric.
+
+    Args:
+        value: Metric value (number or numeric string)
+
+    Returns:
+        Float value, or None for booleans, non-numeric and non-finite values
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def build_rollup_rows(
+    metrics: Iterable[Any],
+    tiers: Iterable[RollupTier] = ROLLUP_TIERS
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Aggregates metrics into partial rollup rows for each tier.
+
+    Args:
+        metrics: PipelineMetric objects with numeric values (others are skipped)
+        tiers: Rollup tiers to build rows for
+
+    Returns:
+        Dictionary mapping tier table name to its rollup rows
+    """
+    tiers = list(tiers)
+    aggregates: Dict[Tuple[str, str, str, datetime.datetime], RollupAggregate] = {}
+
+    for metric in metrics:
+        value = to_numeric_value(metric.metric_value)
+        if value is None or not isinstance(metric.timestamp, datetime.datetime):
+            continue
+        labels = canonical_labels(metric.labels)
+        for tier in tiers:
+            key = (tier.table_name, metric.metric_name, labels, truncate_timestamp(metric.timestamp, tier.bucket_seconds))
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregate = aggregates[key] = RollupAggregate()
+            aggregate.add(value)
+
+    rows: Dict[str, List[Dict[str, Any]]] = {tier.table_name: [] for tier in tiers}
+    for (table_name, metric_name, labels, bucket_start), aggregate in aggregates.items():
+        rows[table_name].append(aggregate.to_row(metric_name, labels, bucket_start))
+    return rows
+
+
+def plan_rollup_segments(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    resolution_seconds: int = None,
+    coverage_start: datetime.datetime = None,
+    tiers: Iterable[RollupTier] = ROLLUP_TIERS
+) -> List[RollupSegment]:
+    """
+    Splits [start, end) into segments served by the coarsest usable rollup tier.
+
+    A tier is usable when its bucket width divides the requested resolution, so its
+    buckets can be merged into result buckets. The coarsest usable tier covers every
+    whole bucket inside the range; the unaligned edges are covered recursively by finer
+    tiers and finally by raw rows. Time before coverage_start always reads raw rows.
+
+    Args:
+        start: Inclusive range start
+        end: Exclusive range end
+        resolution_seconds: Requested result bucket width (None for a single aggregate)
+        coverage_start: Earliest time the rollup tables are complete (None for no rollups)
+        tiers: Available rollup tiers
+
+    Returns:
+        Ordered, non-overlapping segments covering the range
+    """
+    start = to_utc_naive(start)
+    end = to_utc_naive(end)
+    if end <= start:
+        return []
+
+    usable = [
+        tier for tier in sorted(tiers, key=lambda tier: tier.bucket_seconds)
+        if resolution_seconds is None or resolution_seconds % tier.bucket_seconds == 0
+    ]
+
+    if coverage_start is None:
+        return [RollupSegment(None, start, end)]
+
+    segments: List[RollupSegment] = []
+
+    coverage_start = to_utc_naive(coverage_start)
+    if start < coverage_start:
+        raw_end = min(end, coverage_start)
+        segments.append(RollupSegment(None, start, raw_end))
+        start = raw_end
+        if start >= end:
+            return segments
+
+    segments.extend(_plan_segments(start, end, usable))
+    return segments
+
+
+def _plan_segments(start: datetime.datetime, end: datetime.datetime,
+                   tiers: List[RollupTier]) -> List[RollupSegment]:
+    """Covers [start, end) with the coarsest of the given tiers, recursing on the edges"""
+    if end <= start:
+        return []
+    if not tiers:
+        return [RollupSegment(None, start, end)]
+
+    tier = tiers[-1]
+    width = datetime.timedelta(seconds=tier.bucket_seconds)
+    aligned_start = truncate_timestamp(start, tier.bucket_seconds)
+    if aligned_start < start:
+        aligned_start += width
+    aligned_end = truncate_timestamp(end, tier.bucket_seconds)
+
+    if aligned_end <= aligned_start:
+        # No whole bucket of this tier fits; try the next finer tier
+        return _plan_segments(start, end, tiers[:-1])
+
+    return (
+        _plan_segments(start, aligned_start, tiers[:-1])
+        + [RollupSegment(tier, aligned_start, aligned_end)]
+        + _plan_segments(aligned_end, end, tiers[:-1])
+    )
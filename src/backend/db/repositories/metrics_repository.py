@@ -9,6 +9,9 @@ monitoring, alerting, and self-healing capabilities.
 
 import datetime
 import json
+import re
+import time
+import uuid
 from typing import Dict, List, Any, Optional, Union, Tuple
 
 import pandas as pd  # version 2.0.0+
@@ -22,12 +25,47 @@ from ...constants import (
 from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ...utils.storage.bigquery_client import BigQueryClient
+from ...utils.storage.query_cache import QueryResultCache, get_query_cache
+from ...utils.storage.write_buffer import WriteBuffer, get_write_buffer
 from ..models.pipeline_metric import (
     PipelineMetric, 
     MetricCategory,
     get_pipeline_metric_table_schema,
-    PIPELINE_METRIC_TABLE_NAME
+    get_pipeline_metric_rollup_table_schema,
+    get_pipeline_metric_rollup_coverage_table_schema,
+    PIPELINE_METRIC_TABLE_NAME,
+    PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME
 )
+from .metric_rollups import (
+    ROLLUP_TIERS,
+    RollupAggregate,
+    RollupTier,
+    QuantileSketch,
+    build_rollup_rows,
+    canonical_labels,
+    plan_rollup_segments,
+    to_utc_naive,
+    truncate_timestamp
+)
+
+# Configuration keys for metric rollups
+ROLLUPS_ENABLED_CONFIG_KEY = "metrics.rollups.enabled"
+ROLLUPS_COVERAGE_START_CONFIG_KEY = "metrics.rollups.coverage_start"
+ROLLUPS_BACKFILL_DAYS_CONFIG_KEY = "metrics.rollups.backfill_days"
+ROLLUPS_SETTLE_SECONDS_CONFIG_KEY = "metrics.rollups.settle_seconds"
+ROLLUPS_COMPACTION_DAYS_CONFIG_KEY = "metrics.rollups.compaction_days"
+
+# Default rollup maintenance settings; rows stay in the streaming buffer, where DML
+# cannot modify them, for up to about 90 minutes after they are inserted
+DEFAULT_ROLLUP_BACKFILL_DAYS = 30
+DEFAULT_ROLLUP_SETTLE_SECONDS = 3 * 3600
+DEFAULT_ROLLUP_COMPACTION_DAYS = 2
+
+# How often a repository without recorded rollup coverage checks for it again
+ROLLUP_COVERAGE_REFRESH_SECONDS = 300
+
+# Label keys are interpolated into JSON paths, so only plain identifiers are accepted
+LABEL_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -37,25 +75,44 @@ class MetricsRepository:
     
     def __init__(
         self, 
-        bq_client: BigQueryClient,
+        bq_client: BigQueryClient = None,
         dataset_id: str = None,
-        project_id: str = None
+        project_id: str = None,
+        query_cache: QueryResultCache = None,
+        write_buffer: WriteBuffer = None
     ):
         """
         Initializes the MetricsRepository with BigQuery client and configuration.
         
         Args:
-            bq_client: BigQuery client instance
+            bq_client: BigQuery client instance, defaults to a client for the configured project
             dataset_id: BigQuery dataset ID, defaults to config value if not provided
             project_id: Google Cloud project ID, defaults to config value if not provided
+            query_cache: Result cache for aggregation queries, defaults to the shared cache
+            write_buffer: Micro-batching buffer for inserts, defaults to the client's shared buffer
         """
-        self._bq_client = bq_client
+        self._bq_client = bq_client or BigQueryClient()
+        self._query_cache = query_cache or get_query_cache()
+        self._write_buffer = write_buffer or get_write_buffer(self._bq_client)
         
         # Get configuration if not provided
         config = get_config()
         self._dataset_id = dataset_id or config.get_bigquery_dataset()
         self._project_id = project_id or config.get_gcp_project_id()
         
+        # Rollups are maintained on write when enabled, and read for time ranges
+        # at or after the coverage start (the point from which they are complete).
+        # Unless configured, the coverage is the one recorded by maintain_metric_rollups
+        self._rollups_enabled = bool(config.get(ROLLUPS_ENABLED_CONFIG_KEY, True))
+        coverage_start = config.get(ROLLUPS_COVERAGE_START_CONFIG_KEY, None)
+        if isinstance(coverage_start, str):
+            coverage_start = datetime.datetime.fromisoformat(coverage_start)
+        self._rollup_coverage_start = coverage_start if isinstance(coverage_start, datetime.datetime) else None
+        self._rollup_coverage_checked_at = None
+        self._rollup_backfill_days = int(config.get(ROLLUPS_BACKFILL_DAYS_CONFIG_KEY, DEFAULT_ROLLUP_BACKFILL_DAYS))
+        self._rollup_settle_seconds = int(config.get(ROLLUPS_SETTLE_SECONDS_CONFIG_KEY, DEFAULT_ROLLUP_SETTLE_SECONDS))
+        self._rollup_compaction_days = int(config.get(ROLLUPS_COMPACTION_DAYS_CONFIG_KEY, DEFAULT_ROLLUP_COMPACTION_DAYS))
+        
         # Ensure metrics table exists
         self.ensure_table_exists()
         
@@ -95,20 +152,170 @@ class MetricsRepository:
             
             if created:
                 logger.info(f"Created metrics table {PIPELINE_METRIC_TABLE_NAME}")
-                return True
+                return self.ensure_rollup_tables_exist()
             else:
                 logger.error(f"Failed to create metrics table {PIPELINE_METRIC_TABLE_NAME}")
                 return False
         
         logger.debug(f"Metrics table {PIPELINE_METRIC_TABLE_NAME} already exists")
+        return self.ensure_rollup_tables_exist()
+    
+    def ensure_rollup_tables_exist(self) -> bool:
+        """
+        Ensures the metric rollup tier tables exist when rollups are enabled.
+        
+        Returns:
+            bool: True if tables exist or were created successfully
+        """
+        if not self._rollups_enabled:
+            return True
+        
+        for tier in ROLLUP_TIERS:
+            if self._bq_client.table_exists(self._dataset_id, tier.table_name):
+                continue
+            
+            logger.info(f"Creating metric rollup table {tier.table_name}")
+            created = self._bq_client.create_table(
+                self._dataset_id,
+                tier.table_name,
+                get_pipeline_metric_rollup_table_schema(),
+                time_partitioning_field="bucket_start",
+                clustering_fields=["metric_name"],
+                description=f"Pipeline metric rollups at {tier.name} resolution"
+            )
+            if not created:
+                logger.error(f"Failed to create metric rollup table {tier.table_name}")
+                return False
+        
+        if not self._bq_client.table_exists(self._dataset_id, PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME):
+            logger.info(f"Creating metric rollup coverage table {PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME}")
+            created = self._bq_client.create_table(
+                self._dataset_id,
+                PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME,
+                get_pipeline_metric_rollup_coverage_table_schema(),
+                description="Time from which the pipeline metric rollups are complete"
+            )
+            if not created:
+                logger.error(f"Failed to create metric rollup coverage table {PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME}")
+                return False
+        
         return True
     
-    def create_metric(self, metric: PipelineMetric) -> str:
+    def _get_rollup_coverage_start(self) -> Optional[datetime.datetime]:
+        """
+        Returns the time from which rollups are complete, or None when they are not read.
+        
+        Without a configured coverage start, the coverage recorded by
+        maintain_metric_rollups is looked up, again at most every few minutes until found.
+        
+        Returns:
+            datetime: Rollup coverage start, or None to read raw rows only
+        """
+        if not self._rollups_enabled:
+            return None
+        if self._rollup_coverage_start is not None:
+            return self._rollup_coverage_start
+        
+        now = time.monotonic()
+        checked_at = self._rollup_coverage_checked_at
+        if checked_at is not None and now - checked_at < ROLLUP_COVERAGE_REFRESH_SECONDS:
+            return None
+        self._rollup_coverage_checked_at = now
+        
+        query = f"""
+        SELECT MIN(coverage_start) AS coverage_start
+        FROM {self._table_ref(PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME)}
+        """
+        try:
+            results = self._bq_client.query(query)
+        except Exception as e:
+            logger.warning(f"Could not read metric rollup coverage, reading raw metrics: {e}")
+            return None
+        
+        if results and results[0].get("coverage_start") is not None:
+            self._rollup_coverage_start = to_utc_naive(results[0]["coverage_start"])
+            logger.info(f"Reading metric rollups from {self._rollup_coverage_start}")
+        return self._rollup_coverage_start
+    
+    def _invalidate_cached_queries(self, table_name: str = PIPELINE_METRIC_TABLE_NAME) -> None:
+        """
+        Invalidates cached query results that read a metrics table after a write.
+        
+        Args:
+            table_name: Name of the table that was written
+        """
+        self._query_cache.invalidate_table(
+            f"{self._project_id}.{self._dataset_id}.{table_name}"
+        )
+    
+    def _table_ref(self, table_name: str) -> str:
+        """
+        Returns the fully qualified reference of a table in the metrics dataset.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            str: Backtick-quoted project.dataset.table reference
+        """
+        return f"`{self._project_id}.{self._dataset_id}.{table_name}`"
+    
+    def _write_rows(self, table_name: str, rows: List[Dict[str, Any]], insert_ids: List[str] = None,
+                    durable: bool = False) -> bool:
+        """
+        Writes rows to a metrics table through the write buffer.
+        
+        Args:
+            table_name: Destination table
+            rows: Rows to insert
+            insert_ids: IDs used to deduplicate retried inserts (generated if None)
+            durable: Whether to block until the rows have been written
+            
+        Returns:
+            bool: True if the rows were buffered, or written when durable
+        """
+        return self._write_buffer.append(
+            self._dataset_id,
+            table_name,
+            rows,
+            insert_ids=insert_ids,
+            wait=durable,
+            on_delivered=lambda: self._invalidate_cached_queries(table_name)
+        )
+    
+    def _write_metric_rollups(self, metrics: List[PipelineMetric], durable: bool = False) -> None:
+        """
+        Writes partial rollup rows for newly inserted metrics.
+        
+        Rollups are derived data, so failures are logged rather than raised; a later
+        backfill_metric_rollups call can rebuild the affected range.
+        
+        Args:
+            metrics: Metrics that were inserted
+            durable: Whether to block until the rows have been written
+        """
+        if not self._rollups_enabled:
+            return
+        
+        for table_name, rows in build_rollup_rows(metrics).items():
+            if not rows:
+                continue
+            try:
+                if not self._write_rows(table_name, rows, durable=durable):
+                    logger.error(f"Failed to write metric rollups to {table_name}")
+            except Exception as e:
+                logger.error(f"Failed to write metric rollups to {table_name}: {e}")
+    
+    def create_metric(self, metric: PipelineMetric, durable: bool = False) -> str:
         """
         Creates a new metric record in the database.
         
+        The row is written through the shared write buffer; pass durable=True to wait
+        until it is in BigQuery, e.g. before querying for it.
+        
         Args:
             metric: PipelineMetric object to create
+            durable: Whether to block until the row has been written
             
         Returns:
             str: ID of the created metric record
@@ -122,13 +329,10 @@ class MetricsRepository:
         row = metric.to_bigquery_row()
         
         # Insert into BigQuery
-        inserted = self._bq_client.insert_rows(
-            self._dataset_id,
-            PIPELINE_METRIC_TABLE_NAME,
-            [row]
-        )
+        inserted = self._write_rows(PIPELINE_METRIC_TABLE_NAME, [row], [metric.metric_id], durable)
         
         if inserted:
+            self._write_metric_rollups([metric], durable)
             logger.info(
                 f"Created metric {metric.metric_id}: {metric.metric_name} "
                 f"for execution {metric.execution_id}"
@@ -138,12 +342,13 @@ class MetricsRepository:
             logger.error(f"Failed to create metric: {metric.metric_name}")
             raise RuntimeError(f"Failed to create metric: {metric.metric_name}")
     
-    def batch_create_metrics(self, metrics: List[PipelineMetric]) -> List[str]:
+    def batch_create_metrics(self, metrics: List[PipelineMetric], durable: bool = True) -> List[str]:
         """
         Creates multiple metric records in a single batch operation.
         
         Args:
             metrics: List of PipelineMetric objects to create
+            durable: Whether to block until the rows have been written
             
         Returns:
             list: List of created metric IDs
@@ -162,13 +367,15 @@ class MetricsRepository:
         rows = [metric.to_bigquery_row() for metric in metrics]
         
         # Insert batch into BigQuery
-        inserted = self._bq_client.insert_rows(
-            self._dataset_id,
+        inserted = self._write_rows(
             PIPELINE_METRIC_TABLE_NAME,
-            rows
+            rows,
+            [metric.metric_id for metric in metrics],
+            durable
         )
         
         if inserted:
+            self._write_metric_rollups(metrics, durable)
             logger.info(f"Created {len(metrics)} metrics in batch")
             return [metric.metric_id for metric in metrics]
         else:
@@ -238,6 +445,7 @@ class MetricsRepository:
         """
         
         deleted = self._bq_client.execute_query(delete_query)
+        self._invalidate_cached_queries()
         
         if not deleted:
             logger.error(f"Failed to delete existing metric: {metric.metric_id}")
@@ -249,6 +457,7 @@ class MetricsRepository:
             PIPELINE_METRIC_TABLE_NAME,
             [row]
         )
+        self._invalidate_cached_queries()
         
         if inserted:
             logger.info(f"Updated metric: {metric.metric_id}")
@@ -464,23 +673,275 @@ class MetricsRepository:
             # Return as-is if conversion fails
             return metric_value
     
+    def _build_label_conditions(self, labels: Optional[Dict[str, str]], params: Dict[str, Any]) -> str:
+        """
+        Builds parameterized label filter conditions.
+        
+        Args:
+            labels: Optional dictionary of labels to filter by
+            params: Query parameters, extended with one parameter per label
+            
+        Returns:
+            str: SQL conditions to append to a WHERE clause
+        """
+        conditions = ""
+        for index, (key, value) in enumerate(sorted((labels or {}).items())):
+            if not LABEL_KEY_PATTERN.match(str(key)):
+                raise ValueError(f"Invalid label key: {key}")
+            param_name = f"label_{index}"
+            conditions += f" AND JSON_VALUE(labels, '$.{key}') = @{param_name}"
+            params[param_name] = str(value)
+        return conditions
+    
+    def _build_label_grouping(
+        self,
+        group_label: Optional[str],
+        group_values: Optional[List[str]],
+        params: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """
+        Builds the column and filter that group rows by the values of one label.
+        
+        Args:
+            group_label: Label key to group by, or None to not group
+            group_values: Label values to keep
+            params: Query parameters, extended with the label values
+            
+        Returns:
+            tuple: (column to append to a SELECT, SQL conditions to append to a WHERE clause)
+        """
+        if group_label is None:
+            return "", ""
+        if not LABEL_KEY_PATTERN.match(str(group_label)):
+            raise ValueError(f"Invalid label key: {group_label}")
+        params["group_values"] = [str(value) for value in group_values or []]
+        expression = f"JSON_VALUE(labels, '$.{group_label}')"
+        return f", {expression} AS group_value", f" AND {expression} IN UNNEST(@group_values)"
+    
+    def _aggregate_metric(
+        self,
+        metric_name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        labels: Dict[str, str] = None,
+        resolution_seconds: int = None,
+        with_sketch: bool = False,
+        group_label: str = None,
+        group_values: List[str] = None
+    ) -> Dict[Any, RollupAggregate]:
+        """
+        Aggregates a metric over a time range, reading rollup tiers where they cover it.
+        
+        Args:
+            metric_name: Name of the metric
+            start_time: Start of the time range (inclusive)
+            end_time: End of the time range (inclusive)
+            labels: Optional dictionary of labels to filter by
+            resolution_seconds: Result bucket width, or None for a single aggregate
+            with_sketch: Whether quantile sketches are needed
+            group_label: Optional label key to aggregate each of group_values separately
+            group_values: Values of group_label to aggregate
+            
+        Returns:
+            dict: Aggregates keyed by bucket start (None when resolution_seconds is None),
+                or by (label value, bucket start) when grouped
+        """
+        # Callers pass inclusive end times; segments are half-open
+        end_exclusive = to_utc_naive(end_time) + datetime.timedelta(microseconds=1)
+        segments = plan_rollup_segments(start_time, end_exclusive, resolution_seconds, self._get_rollup_coverage_start())
+        
+        aggregates: Dict[Any, RollupAggregate] = {}
+        for segment in segments:
+            if segment.tier is None:
+                partials = self._query_raw_aggregates(
+                    metric_name, segment.start, segment.end, labels, resolution_seconds, with_sketch,
+                    group_label, group_values
+                )
+            else:
+                partials = self._query_rollup_aggregates(
+                    segment.tier, metric_name, segment.start, segment.end, labels, resolution_seconds, with_sketch,
+                    group_label, group_values
+                )
+            
+            for bucket_start, partial in partials:
+                aggregate = aggregates.get(bucket_start)
+                if aggregate is None:
+                    aggregates[bucket_start] = partial
+                else:
+                    aggregate.merge(partial)
+        
+        return aggregates
+    
+    def _query_rollup_aggregates(
+        self,
+        tier: RollupTier,
+        metric_name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        labels: Dict[str, str],
+        resolution_seconds: Optional[int],
+        with_sketch: bool,
+        group_label: str = None,
+        group_values: List[str] = None
+    ) -> List[Tuple[Any, RollupAggregate]]:
+        """
+        Reads partial aggregates from a rollup tier for an aligned segment.
+        
+        Args:
+            tier: Rollup tier to read
+            metric_name: Name of the metric
+            start_time: Segment start (inclusive, aligned to the tier)
+            end_time: Segment end (exclusive, aligned to the tier)
+            labels: Optional dictionary of labels to filter by
+            resolution_seconds: Result bucket width, or None for a single aggregate
+            with_sketch: Whether to read quantile sketches
+            group_label: Optional label key to aggregate each of group_values separately
+            group_values: Values of group_label to aggregate
+            
+        Returns:
+            list: (bucket start, aggregate) pairs, keyed by (label value, bucket start) when grouped
+        """
+        params = {"metric_name": metric_name, "start_time": start_time, "end_time": end_time}
+        sketch_column = ", sketch" if with_sketch else ""
+        group_column, group_conditions = self._build_label_grouping(group_label, group_values, params)
+        query = f"""
+        SELECT bucket_start, count, sum, min, max{sketch_column}{group_column}
+        FROM {self._table_ref(tier.table_name)}
+        WHERE
+            metric_name = @metric_name
+            AND bucket_start >= @start_time
+            AND bucket_start < @end_time
+        """ + self._build_label_conditions(labels, params) + group_conditions
+        
+        results = self._query_cache.get_or_query(self._bq_client, query, params, name="metrics.rollups")
+        
+        partials = []
+        for row in results:
+            bucket_start = None
+            if resolution_seconds:
+                bucket_start = truncate_timestamp(row["bucket_start"], resolution_seconds)
+            key = (row["group_value"], bucket_start) if group_label is not None else bucket_start
+            partials.append((key, RollupAggregate.from_row(row)))
+        return partials
+    
+    def _query_raw_aggregates(
+        self,
+        metric_name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        labels: Dict[str, str],
+        resolution_seconds: Optional[int],
+        with_sketch: bool,
+        group_label: str = None,
+        group_values: List[str] = None
+    ) -> List[Tuple[Any, RollupAggregate]]:
+        """
+        Aggregates raw metric rows for a segment not covered by rollups.
+        
+        When sketches are needed, values are grouped by sketch bin in the query so only
+        bin counts, not individual values, are returned.
+        
+        Args:
+            metric_name: Name of the metric
+            start_time: Segment start (inclusive)
+            end_time: Segment end (exclusive)
+            labels: Optional dictionary of labels to filter by
+            resolution_seconds: Result bucket width, or None for a single aggregate
+            with_sketch: Whether to build quantile sketches
+            group_label: Optional label key to aggregate each of group_values separately
+            group_values: Values of group_label to aggregate
+            
+        Returns:
+            list: (bucket start, aggregate) pairs, keyed by (label value, bucket start) when grouped
+        """
+        params = {"metric_name": metric_name, "start_time": start_time, "end_time": end_time}
+        label_conditions = self._build_label_conditions(labels, params)
+        group_column, group_conditions = self._build_label_grouping(group_label, group_values, params)
+        label_conditions += group_conditions
+        
+        if resolution_seconds:
+            bucket_expression = "TIMESTAMP_SECONDS(DIV(UNIX_SECONDS(timestamp), @resolution) * @resolution)"
+            params["resolution"] = int(resolution_seconds)
+        else:
+            bucket_expression = "CAST(NULL AS TIMESTAMP)"
+        
+        select_columns = "bucket_start"
+        group_by = "bucket_start"
+        if group_label is not None:
+            select_columns += ", group_value"
+            group_by += ", group_value"
+        if with_sketch:
+            # Same bin index as QuantileSketch, so bin counts merge with rollup sketches
+            params["log_gamma"] = QuantileSketch().log_gamma
+            group_by += ", value_sign, bin_index"
+            select_columns += """,
+            SIGN(value) AS value_sign,
+            IF(value = 0, 0, CAST(CEIL(LN(ABS(value)) / @log_gamma) AS INT64)) AS bin_index"""
+        
+        query = f"""
+        SELECT
+            {select_columns},
+            COUNT(*) AS count,
+            SUM(value) AS sum,
+            MIN(value) AS min,
+            MAX(value) AS max
+        FROM (
+            SELECT
+                {bucket_expression} AS bucket_start,
+                SAFE_CAST(metric_value AS FLOAT64) AS value{group_column}
+            FROM {self._table_ref(PIPELINE_METRIC_TABLE_NAME)}
+            WHERE
+                metric_name = @metric_name
+                AND timestamp >= @start_time
+                AND timestamp < @end_time{label_conditions}
+        )
+        WHERE value IS NOT NULL AND NOT IS_NAN(value) AND NOT IS_INF(value)
+        GROUP BY {group_by}
+        """
+        
+        results = self._query_cache.get_or_query(self._bq_client, query, params, name="metrics.rollups")
+        
+        aggregates: Dict[Any, RollupAggregate] = {}
+        for row in results:
+            bucket_start = row.get("bucket_start")
+            if bucket_start is not None:
+                bucket_start = to_utc_naive(bucket_start)
+            key = (row["group_value"], bucket_start) if group_label is not None else bucket_start
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregate = aggregates[key] = RollupAggregate()
+            aggregate.add_summary(
+                row["count"],
+                row["sum"],
+                row["min"],
+                row["max"],
+                sign=int(row["value_sign"]) if with_sketch else None,
+                bin_index=int(row["bin_index"]) if with_sketch else None
+            )
+        return list(aggregates.items())
+    
     def get_metric_time_series(
         self,
         metric_name: str,
         start_time: datetime.datetime,
         end_time: datetime.datetime,
         labels: Dict[str, str] = None,
-        aggregation: str = 'avg'
+        aggregation: str = 'avg',
+        resolution_seconds: int = 3600
     ) -> pd.DataFrame:
         """
         Retrieves time series data for a specific metric.
         
+        Whole buckets inside the rollup coverage are read from the coarsest rollup tier
+        whose bucket width divides the resolution; the remaining edges read raw rows.
+        
         Args:
             metric_name: Name of the metric
             start_time: Start of the time range
             end_time: End of the time range
             labels: Optional dictionary of labels to filter by
             aggregation: Aggregation function ('avg', 'sum', 'min', 'max', 'count')
+            resolution_seconds: Width of each time series bucket in seconds
             
         Returns:
             pandas.DataFrame: DataFrame with time series data
@@ -491,65 +952,91 @@ class MetricsRepository:
             logger.warning(f"Invalid aggregation: {aggregation}, using 'avg'")
             aggregation = 'avg'
         
-        # Map aggregation to SQL function
-        agg_functions = {
-            'avg': 'AVG',
-            'sum': 'SUM',
-            'min': 'MIN',
-            'max': 'MAX',
-            'count': 'COUNT'
-        }
-        agg_function = agg_functions[aggregation]
+        aggregates = self._aggregate_metric(
+            metric_name,
+            start_time,
+            end_time,
+            labels,
+            resolution_seconds=resolution_seconds
+        )
         
-        # Format datetime objects for BigQuery
-        start_str = start_time.isoformat()
-        end_str = end_time.isoformat()
+        if not aggregates:
+            logger.warning(f"No time series data found for metric: {metric_name}")
+            return pd.DataFrame(columns=['timestamp', 'value'])
         
-        # Build base query
-        query = f"""
-        SELECT
-            TIMESTAMP_TRUNC(timestamp, HOUR) as time_bucket,
-            {agg_function}(CAST(metric_value AS FLOAT64)) as value
-        FROM `{self._project_id}.{self._dataset_id}.{PIPELINE_METRIC_TABLE_NAME}`
-        WHERE 
-            metric_name = '{metric_name}'
-            AND timestamp BETWEEN '{start_str}' AND '{end_str}'
-        """
+        df = pd.DataFrame([
+            {'timestamp': bucket_start, 'value': aggregate.value(aggregation)}
+            for bucket_start, aggregate in sorted(aggregates.items())
+        ])
+        df = df.set_index('timestamp')
         
-        # Add label filtering if provided
-        if labels and len(labels) > 0:
-            # Add each label as a separate condition
-            for key, value in labels.items():
-                query += f" AND JSON_EXTRACT(labels, '$.{key}') = '{value}'"
+        logger.info(
+            f"Retrieved time series for {metric_name} with {len(df)} data points"
+        )
         
-        # Complete the query
-        query += """
-        GROUP BY time_bucket
-        ORDER BY time_bucket
+        return df
+    
+    def get_metric_time_series_by_label(
+        self,
+        metric_name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        label_key: str,
+        label_values: List[str],
+        aggregation: str = 'avg',
+        resolution_seconds: int = 3600
+    ) -> Dict[str, pd.DataFrame]:
         """
+        Retrieves the time series of a metric for many values of one label at once.
         
-        results = self._bq_client.query(query)
+        Every value is read by the same grouped queries, so the cost does not grow with
+        one query per value.
         
-        if not results:
-            logger.warning(f"No time series data found for metric: {metric_name}")
-            return pd.DataFrame(columns=['timestamp', 'value'])
+        Args:
+            metric_name: Name of the metric
+            start_time: Start of the time range
+            end_time: End of the time range
+            label_key: Label identifying each series, such as 'pipeline_id'
+            label_values: Values of the label to retrieve
+            aggregation: Aggregation function ('avg', 'sum', 'min', 'max', 'count')
+            resolution_seconds: Width of each time series bucket in seconds
+            
+        Returns:
+            dict: DataFrame with time series data per label value that has data
+        """
+        valid_aggregations = ['avg', 'sum', 'min', 'max', 'count']
+        if aggregation not in valid_aggregations:
+            logger.warning(f"Invalid aggregation: {aggregation}, using 'avg'")
+            aggregation = 'avg'
+        if not label_values:
+            return {}
         
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
+        aggregates = self._aggregate_metric(
+            metric_name,
+            start_time,
+            end_time,
+            resolution_seconds=resolution_seconds,
+            group_label=label_key,
+            group_values=label_values
+        )
         
-        # Rename columns
-        if 'time_bucket' in df.columns:
-            df = df.rename(columns={'time_bucket': 'timestamp'})
+        rows: Dict[str, List[Dict[str, Any]]] = {}
+        for (label_value, bucket_start), aggregate in sorted(aggregates.items()):
+            rows.setdefault(label_value, []).append(
+                {'timestamp': bucket_start, 'value': aggregate.value(aggregation)}
+            )
         
-        # Set timestamp as index
-        if 'timestamp' in df.columns:
-            df = df.set_index('timestamp')
+        series = {
+            label_value: pd.DataFrame(label_rows).set_index('timestamp')
+            for label_value, label_rows in rows.items()
+        }
         
         logger.info(
-            f"Retrieved time series for {metric_name} with {len(df)} data points"
+            f"Retrieved time series for {metric_name} for {len(series)} of {len(label_values)} "
+            f"{label_key} values"
         )
         
-        return df
+        return series
     
     def get_metric_statistics(
         self,
@@ -594,7 +1081,11 @@ class MetricsRepository:
             for key, value in labels.items():
                 query += f" AND JSON_EXTRACT(labels, '$.{key}') = '{value}'"
         
-        results = self._bq_client.query(query)
+        results = self._query_cache.get_or_query(
+            self._bq_client,
+            query,
+            name="metrics.get_metric_statistics"
+        )
         
         if not results or len(results) == 0:
             logger.warning(f"No statistics available for metric: {metric_name}")
@@ -629,6 +1120,9 @@ class MetricsRepository:
         """
         Calculates percentile values for a specific metric.
         
+        Percentiles come from merged quantile sketches and are accurate to within 1%
+        relative error.
+        
         Args:
             metric_name: Name of the metric
             start_time: Start of the time range
@@ -649,46 +1143,15 @@ class MetricsRepository:
                 logger.warning(f"Invalid percentile: {p}, must be between 0 and 100")
                 return {}
         
-        # Format datetime objects for BigQuery
-        start_str = start_time.isoformat()
-        end_str = end_time.isoformat()
+        merged = RollupAggregate()
+        for aggregate in self._aggregate_metric(metric_name, start_time, end_time, labels, with_sketch=True).values():
+            merged.merge(aggregate)
         
-        # Build query
-        query = f"""
-        SELECT
-            APPROX_QUANTILES(CAST(metric_value AS FLOAT64), 100) as quantiles
-        FROM `{self._project_id}.{self._dataset_id}.{PIPELINE_METRIC_TABLE_NAME}`
-        WHERE 
-            metric_name = '{metric_name}'
-            AND timestamp BETWEEN '{start_str}' AND '{end_str}'
-        """
-        
-        # Add label filtering if provided
-        if labels and len(labels) > 0:
-            # Add each label as a separate condition
-            for key, value in labels.items():
-                query += f" AND JSON_EXTRACT(labels, '$.{key}') = '{value}'"
-        
-        results = self._bq_client.query(query)
-        
-        if not results or len(results) == 0 or 'quantiles' not in results[0]:
+        if merged.count == 0:
             logger.warning(f"No percentile data available for metric: {metric_name}")
             return {p: None for p in percentiles}
         
-        # Extract quantiles
-        quantiles = results[0]['quantiles']
-        
-        # Calculate requested percentiles
-        percentile_values = {}
-        for p in percentiles:
-            if not quantiles or len(quantiles) < 100:
-                percentile_values[p] = None
-            else:
-                # Convert percentile to index in quantiles array
-                idx = min(p, 99)  # Ensure within bounds
-                percentile_values[p] = quantiles[idx]
-        
-        return percentile_values
+        return {p: merged.sketch.quantile(p / 100.0) for p in percentiles}
     
     def compare_metric_periods(
         self,
@@ -721,77 +1184,11 @@ class MetricsRepository:
             logger.warning(f"Invalid aggregation: {aggregation}, using 'avg'")
             aggregation = 'avg'
         
-        # Map aggregation to SQL function
-        agg_functions = {
-            'avg': 'AVG',
-            'sum': 'SUM',
-            'min': 'MIN',
-            'max': 'MAX',
-            'count': 'COUNT'
-        }
-        agg_function = agg_functions[aggregation]
-        
-        # Format datetime objects for BigQuery
-        period1_start_str = period1_start.isoformat()
-        period1_end_str = period1_end.isoformat()
-        period2_start_str = period2_start.isoformat()
-        period2_end_str = period2_end.isoformat()
-        
-        # Build query for both periods
-        query = f"""
-        WITH period1 AS (
-            SELECT
-                {agg_function}(CAST(metric_value AS FLOAT64)) as value
-            FROM `{self._project_id}.{self._dataset_id}.{PIPELINE_METRIC_TABLE_NAME}`
-            WHERE 
-                metric_name = '{metric_name}'
-                AND timestamp BETWEEN '{period1_start_str}' AND '{period1_end_str}'
-        """
-        
-        # Add label filtering for period 1 if provided
-        if labels and len(labels) > 0:
-            # Add each label as a separate condition
-            for key, value in labels.items():
-                query += f" AND JSON_EXTRACT(labels, '$.{key}') = '{value}'"
-        
-        query += f"""
-        ),
-        period2 AS (
-            SELECT
-                {agg_function}(CAST(metric_value AS FLOAT64)) as value
-            FROM `{self._project_id}.{self._dataset_id}.{PIPELINE_METRIC_TABLE_NAME}`
-            WHERE 
-                metric_name = '{metric_name}'
-                AND timestamp BETWEEN '{period2_start_str}' AND '{period2_end_str}'
-        """
-        
-        # Add label filtering for period 2 if provided
-        if labels and len(labels) > 0:
-            # Add each label as a separate condition
-            for key, value in labels.items():
-                query += f" AND JSON_EXTRACT(labels, '$.{key}') = '{value}'"
-        
-        query += """
-        )
-        SELECT
-            (SELECT value FROM period1) as period1_value,
-            (SELECT value FROM period2) as period2_value
-        """
-        
-        results = self._bq_client.query(query)
-        
-        if not results or len(results) == 0:
-            logger.warning(f"No comparison data available for metric: {metric_name}")
-            return {
-                'period1_value': None,
-                'period2_value': None,
-                'absolute_change': None,
-                'percentage_change': None
-            }
-        
-        # Extract values
-        period1_value = results[0].get('period1_value')
-        period2_value = results[0].get('period2_value')
+        period_values = []
+        for period_start, period_end in ((period1_start, period1_end), (period2_start, period2_end)):
+            aggregate = self._aggregate_metric(metric_name, period_start, period_end, labels).get(None)
+            period_values.append((aggregate or RollupAggregate()).value(aggregation))
+        period1_value, period2_value = period_values
         
         # Calculate changes
         absolute_change = None
@@ -980,13 +1377,17 @@ class MetricsRepository:
         Returns:
             dict: Dictionary with trend analysis results
         """
+        # Hourly trends read hourly buckets; daily and weekly trends can use daily rollups
+        resolution_seconds = 3600 if interval == 'hourly' else 86400
+        
         # Get time series data
         df = self.get_metric_time_series(
             metric_name,
             start_time,
             end_time,
             labels,
-            aggregation='avg'
+            aggregation='avg',
+            resolution_seconds=resolution_seconds
         )
         
         if df.empty or 'value' not in df.columns:
@@ -1004,14 +1405,14 @@ class MetricsRepository:
         
         # Resample data based on specified interval
         if interval == 'hourly':
-            resampling = 'H'
+            resampling = 'h'
         elif interval == 'daily':
             resampling = 'D'
         elif interval == 'weekly':
             resampling = 'W'
         else:
             logger.warning(f"Invalid interval: {interval}, using 'hourly'")
-            resampling = 'H'
+            resampling = 'h'
         
         if 'timestamp' in df.columns:
             df = df.set_index('timestamp')
@@ -1204,6 +1605,315 @@ class MetricsRepository:
         """
         
         self._bq_client.execute_query(delete_query)
+        self._invalidate_cached_queries()
         
         logger.info(f"Deleted {count} metrics older than {cutoff_str}")
-        return count
\ No newline at end of file
+        return count
+    
+    def _get_rollup_tier(self, tier_name: str) -> RollupTier:
+        """
+        Returns a rollup tier by name.
+        
+        Args:
+            tier_name: Tier name ('1m', '1h' or '1d')
+            
+        Returns:
+            RollupTier: Matching tier
+        """
+        for tier in ROLLUP_TIERS:
+            if tier.name == tier_name:
+                return tier
+        raise ValueError(f"Unknown rollup tier: {tier_name}")
+    
+    @staticmethod
+    def _align_rollup_range(
+        tier: RollupTier,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
+        """
+        Widens a time range to whole buckets of a tier.
+        
+        Args:
+            tier: Rollup tier
+            start_time: Start of the time range
+            end_time: End of the time range
+            
+        Returns:
+            tuple: Aligned (start, exclusive end)
+        """
+        aligned_start = truncate_timestamp(start_time, tier.bucket_seconds)
+        aligned_end = truncate_timestamp(end_time, tier.bucket_seconds)
+        if aligned_end < to_utc_naive(end_time):
+            aligned_end += datetime.timedelta(seconds=tier.bucket_seconds)
+        return aligned_start, aligned_end
+    
+    def _replace_rollup_range(
+        self,
+        tier: RollupTier,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        aggregates: Dict[Tuple[str, str, datetime.datetime], RollupAggregate]
+    ) -> int:
+        """
+        Replaces all rollup rows of a tier in an aligned range with the given aggregates.
+        
+        The new rows are loaded into a staging table and swapped in by a single MERGE
+        that deletes the old rows of the range and inserts the staged ones, so readers
+        see either the old or the new rows of the range, never a mix or a gap.
+        
+        Args:
+            tier: Rollup tier
+            start_time: Aligned range start (inclusive)
+            end_time: Aligned range end (exclusive)
+            aggregates: Aggregates keyed by (metric name, canonical labels, bucket start)
+            
+        Returns:
+            int: Number of rollup rows written
+        """
+        params = {"start_time": start_time, "end_time": end_time}
+        rows = [
+            aggregate.to_row(metric_name, labels, bucket_start)
+            for (metric_name, labels, bucket_start), aggregate in aggregates.items()
+        ]
+        
+        if not rows:
+            delete_query = f"""
+            DELETE FROM {self._table_ref(tier.table_name)}
+            WHERE bucket_start >= @start_time AND bucket_start < @end_time
+            """
+            self._bq_client.execute_query(delete_query, parameters=params)
+            self._invalidate_cached_queries(tier.table_name)
+            return 0
+        
+        schema = get_pipeline_metric_rollup_table_schema()
+        columns = [field.name for field in schema]
+        staging_table = f"{tier.table_name}_staging_{uuid.uuid4().hex}"
+        try:
+            self._bq_client.load_table_from_dataframe(self._dataset_id, staging_table, rows, schema=schema)
+            merge_query = f"""
+            MERGE INTO {self._table_ref(tier.table_name)} T
+            USING {self._table_ref(staging_table)} S
+            ON FALSE
+            WHEN NOT MATCHED BY SOURCE AND T.bucket_start >= @start_time AND T.bucket_start < @end_time THEN
+                DELETE
+            WHEN NOT MATCHED THEN
+                INSERT ({", ".join(columns)}) VALUES ({", ".join(f"S.{column}" for column in columns)})
+            """
+            self._bq_client.execute_query(merge_query, parameters=params)
+        finally:
+            self._bq_client.execute_query(f"DROP TABLE IF EXISTS {self._table_ref(staging_table)}")
+        
+        self._invalidate_cached_queries(tier.table_name)
+        return len(rows)
+    
+    def compact_metric_rollups(
+        self,
+        tier_name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime
+    ) -> int:
+        """
+        Merges the partial rows written per insert into one row per metric, labels and bucket.
+        
+        Args:
+            tier_name: Tier to compact ('1m', '1h' or '1d')
+            start_time: Start of the time range (widened to whole buckets)
+            end_time: End of the time range (widened to whole buckets)
+            
+        Returns:
+            int: Number of rollup rows after compaction
+        """
+        tier = self._get_rollup_tier(tier_name)
+        start_time, end_time = self._align_rollup_range(tier, start_time, end_time)
+        
+        query = f"""
+        SELECT metric_name, labels, bucket_start, count, sum, min, max, sketch
+        FROM {self._table_ref(tier.table_name)}
+        WHERE bucket_start >= @start_time AND bucket_start < @end_time
+        """
+        results = self._bq_client.query(query, {"start_time": start_time, "end_time": end_time})
+        
+        aggregates: Dict[Tuple[str, str, datetime.datetime], RollupAggregate] = {}
+        for row in results:
+            key = (row["metric_name"], canonical_labels(row.get("labels")), to_utc_naive(row["bucket_start"]))
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregates[key] = RollupAggregate.from_row(row)
+            else:
+                aggregate.merge(RollupAggregate.from_row(row))
+        
+        if len(aggregates) == len(results):
+            logger.debug(f"Rollup table {tier.table_name} already compact for {start_time} - {end_time}")
+            return len(results)
+        
+        written = self._replace_rollup_range(tier, start_time, end_time, aggregates)
+        logger.info(f"Compacted {len(results)} rollup rows into {written} in {tier.table_name}")
+        return written
+    
+    def backfill_metric_rollups(
+        self,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime
+    ) -> Dict[str, int]:
+        """
+        Rebuilds all rollup tiers for a time range from the raw metrics table.
+        
+        maintain_metric_rollups uses this to populate rollups for history recorded before
+        they were enabled; run it directly after raw metrics were updated.
+        
+        Args:
+            start_time: Start of the time range (widened to whole buckets per tier)
+            end_time: End of the time range (widened to whole buckets per tier)
+            
+        Returns:
+            dict: Number of rollup rows written per tier name
+        """
+        log_gamma = QuantileSketch().log_gamma
+        written = {}
+        
+        for tier in ROLLUP_TIERS:
+            tier_start, tier_end = self._align_rollup_range(tier, start_time, end_time)
+            query = f"""
+            SELECT
+                metric_name,
+                labels,
+                bucket_start,
+                SIGN(value) AS value_sign,
+                IF(value = 0, 0, CAST(CEIL(LN(ABS(value)) / @log_gamma) AS INT64)) AS bin_index,
+                COUNT(*) AS count,
+                SUM(value) AS sum,
+                MIN(value) AS min,
+                MAX(value) AS max
+            FROM (
+                SELECT
+                    metric_name,
+                    labels,
+                    TIMESTAMP_SECONDS(DIV(UNIX_SECONDS(timestamp), @resolution) * @resolution) AS bucket_start,
+                    SAFE_CAST(metric_value AS FLOAT64) AS value
+                FROM {self._table_ref(PIPELINE_METRIC_TABLE_NAME)}
+                WHERE timestamp >= @start_time AND timestamp < @end_time
+            )
+            WHERE value IS NOT NULL AND NOT IS_NAN(value) AND NOT IS_INF(value)
+            GROUP BY metric_name, labels, bucket_start, value_sign, bin_index
+            """
+            params = {
+                "start_time": tier_start,
+                "end_time": tier_end,
+                "resolution": tier.bucket_seconds,
+                "log_gamma": log_gamma
+            }
+            
+            aggregates: Dict[Tuple[str, str, datetime.datetime], RollupAggregate] = {}
+            for row in self._bq_client.query(query, params):
+                key = (row["metric_name"], canonical_labels(row.get("labels")), to_utc_naive(row["bucket_start"]))
+                aggregate = aggregates.get(key)
+                if aggregate is None:
+                    aggregate = aggregates[key] = RollupAggregate()
+                aggregate.add_summary(
+                    row["count"],
+                    row["sum"],
+                    row["min"],
+                    row["max"],
+                    sign=int(row["value_sign"]),
+                    bin_index=int(row["bin_index"])
+                )
+            
+            written[tier.name] = self._replace_rollup_range(tier, tier_start, tier_end, aggregates)
+            logger.info(f"Backfilled {written[tier.name]} rollup rows in {tier.table_name}")
+        
+        return written
+    
+    def maintain_metric_rollups(self, now: datetime.datetime = None) -> Dict[str, Any]:
+        """
+        Establishes rollup coverage and compacts settled rollups; run on a schedule.
+        
+        Rollups written on insert are not read until coverage is recorded. Once the day of
+        the earliest of them has settled, history from metrics.rollups.backfill_days ago up
+        to the end of that day is rebuilt from raw metrics and its start is recorded as the
+        coverage start, which every repository then reads. Each run also compacts the
+        partial rows of the last metrics.rollups.compaction_days settled days.
+        
+        Args:
+            now: Current time, defaults to the current UTC time
+            
+        Returns:
+            dict: Coverage start, backfilled rows per tier and compacted rows per tier
+        """
+        result = {"coverage_start": None, "backfilled": {}, "compacted": {}}
+        if not self._rollups_enabled:
+            return result
+        
+        day_tier = self._get_rollup_tier("1d")
+        now = to_utc_naive(now or datetime.datetime.utcnow())
+        settled_day_end = truncate_timestamp(
+            now - datetime.timedelta(seconds=self._rollup_settle_seconds), day_tier.bucket_seconds
+        )
+        
+        # Look the recorded coverage up again rather than waiting for the refresh interval
+        self._rollup_coverage_checked_at = None
+        coverage_start = self._get_rollup_coverage_start()
+        if coverage_start is None:
+            coverage_start, result["backfilled"] = self._establish_rollup_coverage(now, settled_day_end)
+            if coverage_start is None:
+                return result
+        result["coverage_start"] = coverage_start
+        
+        compaction_start = max(
+            settled_day_end - datetime.timedelta(days=self._rollup_compaction_days),
+            truncate_timestamp(coverage_start, day_tier.bucket_seconds)
+        )
+        if compaction_start < settled_day_end:
+            for tier in ROLLUP_TIERS:
+                result["compacted"][tier.name] = self.compact_metric_rollups(
+                    tier.name, compaction_start, settled_day_end
+                )
+        
+        return result
+    
+    def _establish_rollup_coverage(
+        self,
+        now: datetime.datetime,
+        settled_day_end: datetime.datetime
+    ) -> Tuple[Optional[datetime.datetime], Dict[str, int]]:
+        """
+        Backfills the history before rollups were written on insert and records the coverage.
+        
+        Args:
+            now: Current time
+            settled_day_end: End of the last day whose rows can be modified by DML
+            
+        Returns:
+            tuple: (Recorded coverage start or None if not yet possible, backfilled rows per tier)
+        """
+        day_tier = self._get_rollup_tier("1d")
+        first_query = f"""
+        SELECT MIN(bucket_start) AS first_bucket
+        FROM {self._table_ref(ROLLUP_TIERS[0].table_name)}
+        """
+        results = self._bq_client.query(first_query)
+        first_bucket = results[0].get("first_bucket") if results else None
+        if first_bucket is None:
+            logger.info("No metric rollups written yet, rollup coverage not established")
+            return None, {}
+        
+        # Rollups written on insert are complete from the first of them on
+        first_day = truncate_timestamp(first_bucket, day_tier.bucket_seconds)
+        backfill_end = first_day + datetime.timedelta(seconds=day_tier.bucket_seconds)
+        if backfill_end > settled_day_end:
+            logger.info(f"Waiting for metric rollups written before {backfill_end} to settle before backfilling")
+            return None, {}
+        
+        backfill_start = min(
+            truncate_timestamp(now - datetime.timedelta(days=self._rollup_backfill_days), day_tier.bucket_seconds),
+            first_day
+        )
+        backfilled = self.backfill_metric_rollups(backfill_start, backfill_end)
+        
+        row = {"coverage_start": backfill_start.isoformat(), "recorded_at": now.isoformat()}
+        if not self._bq_client.insert_rows(self._dataset_id, PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME, [row]):
+            raise RuntimeError(f"Failed to record metric rollup coverage in {PIPELINE_METRIC_ROLLUP_COVERAGE_TABLE_NAME}")
+        
+        self._rollup_coverage_start = backfill_start
+        logger.info(f"Recorded metric rollup coverage from {backfill_start}")
+        return backfill_start, backfilled
@@ -0,0 +1,336 @@
+"""
+Resident, indexed store of issue patterns for fast pattern matching.
+
+HealingRepository keeps one IssuePatternIndex per repository instance so matching an
+issue does not re-read the issue pattern table. The index loads every pattern once,
+then applies incremental refreshes keyed by updated_at plus the repository's own writes.
+Patterns are posted under each feature key and (key, value) pair, so a lookup only scores
+patterns that share features with the issue instead of scanning the whole table.
+"""
+
+import datetime
+import heapq
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from ...utils.logging.logger import get_logger
+from ..models.issue_pattern import IssuePattern
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default refresh settings
+DEFAULT_REFRESH_INTERVAL_SECONDS = 30.0
+DEFAULT_FULL_RELOAD_INTERVAL_SECONDS = 3600.0
+
+# A pattern can only match without any equal feature value when its threshold is at most
+# this score: matches_issue averages key overlap (at most 1.0) and value agreement (0.0 here)
+KEY_ONLY_MATCH_MAX_SCORE = 0.5
+
+
+def _feature_value_key(value: Any) -> Hashable:
+    """
+    Converts a feature value into a hashable posting key that preserves equality.
+
+    Args:
+        value: Feature value from a pattern or an issue
+
+    Returns:
+        The value itself when hashable, otherwise a canonical JSON string
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return ("__json__", json.dumps(value, sort_keys=True, default=str))
+
+
+def _sort_timestamp(value: Optional[datetime.datetime]) -> float:
+    """
+    Returns a sortable timestamp for tie-breaking, treating missing values as oldest.
+    """
+    if not isinstance(value, datetime.datetime):
+        return 0.0
+    try:
+        return value.timestamp()
+    except (OverflowError, OSError, ValueError):
+        return 0.0
+
+
+class IssuePatternIndex:
+    """In-memory inverted index over issue pattern features"""
+
+    def __init__(
+        self,
+        loader: Callable[[Optional[datetime.datetime]], Iterable[IssuePattern]],
+        refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        full_reload_interval_seconds: float = DEFAULT_FULL_RELOAD_INTERVAL_SECONDS
+    ):
+        """
+        Initializes the index.
+
+        Args:
+            loader: Callable returning patterns updated after the given time, or all patterns for None
+            refresh_interval_seconds: Minimum time between incremental refreshes
+            full_reload_interval_seconds: Time between full reloads, which pick up deletions made elsewhere
+        """
+        self._loader = loader
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._full_reload_interval_seconds = full_reload_interval_seconds
+
+        self._patterns: Dict[str, IssuePattern] = {}
+        self._pattern_keys: Dict[str, frozenset] = {}
+        # Postings each pattern was indexed under, since callers may mutate features in place
+        self._pattern_postings: Dict[str, Tuple[str, List[Tuple[str, Hashable]]]] = {}
+        self._by_key: Dict[str, Set[str]] = {}
+        self._by_value: Dict[Tuple[str, Hashable], Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._low_threshold_ids: Set[str] = set()
+
+        self._watermark: Optional[datetime.datetime] = None
+        self._last_refresh: Optional[float] = None
+        self._last_full_reload: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def loaded(self) -> bool:
+        """Returns True once the initial full load has completed"""
+        return self._last_full_reload is not None
+
+    def ensure_fresh(self) -> None:
+        """
+        Loads the index on first use and refreshes it when the refresh interval has elapsed.
+        """
+        now = time.monotonic()
+        if self._last_full_reload is None or now - self._last_full_reload >= self._full_reload_interval_seconds:
+            self.reload()
+        elif now - self._last_refresh >= self._refresh_interval_seconds:
+            self.refresh()
+
+    def reload(self) -> int:
+        """
+        Replaces the index contents with a full load of all patterns.
+
+        Returns:
+            Number of patterns loaded
+        """
+        patterns = list(self._loader(None))
+        with self._lock:
+            self._clear()
+            for pattern in patterns:
+                self._add(pattern)
+            self._last_full_reload = self._last_refresh = time.monotonic()
+            count = len(self._patterns)
+        logger.info(f"Loaded {count} issue patterns into the pattern index")
+        return count
+
+    def refresh(self) -> int:
+        """
+        Applies patterns updated since the last seen updated_at.
+
+        Returns:
+            Number of patterns added or replaced
+        """
+        # Re-read the watermark itself so rows written in the same instant are not missed
+        patterns = list(self._loader(self._watermark))
+        with self._lock:
+            for pattern in patterns:
+                self._add(pattern)
+            self._last_refresh = time.monotonic()
+        if patterns:
+            logger.debug(f"Refreshed {len(patterns)} issue patterns in the pattern index")
+        return len(patterns)
+
+    def upsert(self, pattern: IssuePattern) -> None:
+        """
+        Adds or replaces a pattern after a write through the repository.
+
+        Args:
+            pattern: Pattern to index
+        """
+        with self._lock:
+            self._add(pattern)
+
+    def remove(self, pattern_id: str) -> bool:
+        """
+        Removes a pattern from the index.
+
+        Args:
+            pattern_id: ID of the pattern to remove
+
+        Returns:
+            True if the pattern was indexed
+        """
+        with self._lock:
+            return self._remove(pattern_id)
+
+    def get(self, pattern_id: str) -> Optional[IssuePattern]:
+        """
+        Returns an indexed pattern by ID.
+
+        Args:
+            pattern_id: ID of the pattern
+
+        Returns:
+            IssuePattern if indexed, None otherwise
+        """
+        return self._patterns.get(pattern_id)
+
+    def get_by_type(self, pattern_type: str) -> List[IssuePattern]:
+        """
+        Returns all indexed patterns of a pattern type.
+
+        Args:
+            pattern_type: Pattern type (data_quality, pipeline, system, resource)
+
+        Returns:
+            List of matching IssuePattern objects
+        """
+        with self._lock:
+            return [self._patterns[pattern_id] for pattern_id in self._by_type.get(pattern_type, ())]
+
+    def find_matches(
+        self,
+        issue_data: Dict[str, Any],
+        min_confidence: float = None,
+        limit: int = 10
+    ) -> List[Tuple[IssuePattern, float]]:
+        """
+        Finds the best matching patterns for an issue.
+
+        Scores are identical to IssuePattern.matches_issue, but only patterns sharing a
+        feature value with the issue are scored, plus patterns sharing a feature key when
+        the effective threshold is low enough for a key-only match to pass.
+
+        Args:
+            issue_data: Issue data to match against patterns
+            min_confidence: Minimum confidence threshold, defaults to each pattern's threshold
+            limit: Maximum number of matches to return (None or 0 for all)
+
+        Returns:
+            List of (IssuePattern, confidence_score) tuples sorted by confidence
+        """
+        if not issue_data:
+            return []
+
+        issue_keys = frozenset(issue_data.keys())
+
+        with self._lock:
+            # Count equal feature values per pattern from the (key, value) postings
+            value_matches: Dict[str, int] = {}
+            for key, value in issue_data.items():
+                for pattern_id in self._by_value.get((key, _feature_value_key(value)), ()):
+                    value_matches[pattern_id] = value_matches.get(pattern_id, 0) + 1
+
+            candidates = set(value_matches)
+            if min_confidence is not None:
+                key_only_ids = None if min_confidence > KEY_ONLY_MATCH_MAX_SCORE else self._patterns.keys()
+            else:
+                key_only_ids = self._low_threshold_ids
+            if key_only_ids:
+                for key in issue_keys:
+                    candidates.update(self._by_key.get(key, set()).intersection(key_only_ids))
+
+            scored = []
+            for pattern_id in candidates:
+                pattern = self._patterns[pattern_id]
+                pattern_keys = self._pattern_keys[pattern_id]
+                common = len(pattern_keys & issue_keys)
+                if not common:
+                    continue
+
+                key_similarity = common / len(pattern_keys | issue_keys)
+                value_similarity = value_matches.get(pattern_id, 0) / common
+                score = (key_similarity + value_similarity) / 2.0
+
+                threshold = min_confidence if min_confidence is not None else pattern.confidence_threshold
+                if score >= threshold:
+                    # Newer patterns win ties, as in the previous created_at DESC scan
+                    scored.append((score, _sort_timestamp(pattern.created_at), pattern_id))
+
+            if limit:
+                top = heapq.nlargest(limit, scored)
+            else:
+                top = sorted(scored, reverse=True)
+            return [(self._patterns[pattern_id], score) for score, _, pattern_id in top]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns index statistics.
+
+        Returns:
+            Dictionary with pattern, key and posting counts and the refresh watermark
+        """
+        with self._lock:
+            return {
+                "patterns": len(self._patterns),
+                "feature_keys": len(self._by_key),
+                "feature_values": len(self._by_value),
+                "low_threshold_patterns": len(self._low_threshold_ids),
+                "watermark": self._watermark.isoformat() if self._watermark else None
+            }
+
+    def _clear(self) -> None:
+        """Empties all index structures (lock held)"""
+        self._patterns.clear()
+        self._pattern_keys.clear()
+        self._pattern_postings.clear()
+        self._by_key.clear()
+        self._by_value.clear()
+        self._by_type.clear()
+        self._low_threshold_ids.clear()
+        self._watermark = None
+
+    def _add(self, pattern: IssuePattern) -> None:
+        """Indexes a pattern, replacing any previous version (lock held)"""
+        pattern_id = pattern.pattern_id
+        self._remove(pattern_id)
+
+        features = pattern.features if isinstance(pattern.features, dict) else {}
+        value_keys = [(key, _feature_value_key(value)) for key, value in features.items()]
+        self._patterns[pattern_id] = pattern
+        self._pattern_keys[pattern_id] = frozenset(features.keys())
+        self._pattern_postings[pattern_id] = (pattern.pattern_type, value_keys)
+        for value_key in value_keys:
+            self._by_key.setdefault(value_key[0], set()).add(pattern_id)
+            self._by_value.setdefault(value_key, set()).add(pattern_id)
+        self._by_type.setdefault(pattern.pattern_type, set()).add(pattern_id)
+        if pattern.confidence_threshold is not None and pattern.confidence_threshold <= KEY_ONLY_MATCH_MAX_SCORE:
+            self._low_threshold_ids.add(pattern_id)
+
+        updated_at = pattern.updated_at
+        if isinstance(updated_at, datetime.datetime):
+            try:
+                if self._watermark is None or updated_at > self._watermark:
+                    self._watermark = updated_at
+            except TypeError:
+                # Mixed naive and aware timestamps; keep the existing watermark
+                pass
+
+    def _remove(self, pattern_id: str) -> bool:
+        """Removes a pattern and its postings (lock held)"""
+        if self._patterns.pop(pattern_id, None) is None:
+            return False
+
+        self._pattern_keys.pop(pattern_id, None)
+        pattern_type, value_keys = self._pattern_postings.pop(pattern_id)
+        for value_key in value_keys:
+            self._discard_posting(self._by_key, value_key[0], pattern_id)
+            self._discard_posting(self._by_value, value_key, pattern_id)
+        self._discard_posting(self._by_type, pattern_type, pattern_id)
+        self._low_threshold_ids.discard(pattern_id)
+        return True
+
+    @staticmethod
+    def _discard_posting(postings: Dict[Any, Set[str]], key: Any, pattern_id: str) -> None:
+        """Removes a pattern from a posting list, dropping the list when it becomes empty"""
+        members = postings.get(key)
+        if members is not None:
+            members.discard(pattern_id)
+            if not members:
+                del postings[key]
@@ -7,6 +7,7 @@ import pandas as pd
 from db.models.pipeline_definition import PipelineDefinition, PIPELINE_DEFINITION_TABLE_NAME
 from db.models.pipeline_execution import PipelineExecution, PipelineStatus, PIPELINE_EXECUTION_TABLE_NAME
 from utils.storage.bigquery_client import BigQueryClient
+from utils.storage.keyset_pagination import build_keyset_condition, build_keyset_order_by
 from utils.logging.logger import get_logger
 from utils.errors.error_types import ResourceError, DataError
 from config import get_config
@@ -385,7 +386,8 @@ class PipelineRepository:
         start_date: datetime.datetime = None,
         end_date: datetime.datetime = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after: Union[str, tuple] = None
     ) -> List[PipelineExecution]:
         """List pipeline executions with optional filtering.
         
@@ -395,7 +397,8 @@ class PipelineRepository:
             start_date: Filter by start date (inclusive)
             end_date: Filter by end date (inclusive)
             limit: Maximum number of results to return
-            offset: Offset for pagination
+            offset: Offset for pagination, ignored when after is given
+            after: Cursor from the previous page, or a (start_time, execution_id) tuple
             
         Returns:
             List of pipeline execution objects
@@ -425,7 +428,16 @@ class PipelineRepository:
             query += " AND start_time <= @end_date"
             query_params.append({"name": "end_date", "parameterType": {"type": "TIMESTAMP"}, "parameterValue": {"value": end_date.isoformat()}})
         
-        query += f" ORDER BY start_time DESC LIMIT {limit} OFFSET {offset}"
+        # Resume after the cursor position when one is given
+        cursor_condition, cursor_params = build_keyset_condition("start_time", "execution_id", after)
+        if cursor_condition:
+            query += f" AND {cursor_condition}"
+            query_params.extend(cursor_params)
+            offset = 0
+        
+        query += f" {build_keyset_order_by('start_time', 'execution_id')} LIMIT {limit}"
+        if offset:
+            query += f" OFFSET {offset}"
         
         results = self._bq_client.query(query, query_params)
         
@@ -25,8 +25,9 @@ from db.models.quality_validation import (
     get_quality_validation_table_schema,
     QUALITY_VALIDATION_TABLE_NAME
 )
-from utils.storage.bigquery_client import BigQueryClient
+from utils.storage.bigquery_client import create_bigquery_client
 from utils.storage.firestore_client import FirestoreClient
+from utils.storage.query_cache import get_query_cache
 from utils.logging.logger import get_logger
 from constants import (
     ValidationRuleType, 
@@ -48,7 +49,7 @@ QUALITY_VALIDATIONS_COLLECTION = "quality_validations"
 class QualityRepository:
     """Repository for managing quality rules and validation results in the self-healing data pipeline"""
     
-    def __init__(self, bq_client=None, fs_client=None, project_id=None, dataset_id=None):
+    def __init__(self, bq_client=None, fs_client=None, project_id=None, dataset_id=None, query_cache=None):
         """Initialize the quality repository with database clients
 
         Args:
@@ -56,15 +57,19 @@ class QualityRepository:
             fs_client (FirestoreClient, optional): Firestore client. Defaults to None (will create new instance).
             project_id (str, optional): GCP project ID. Defaults to None (will get from config).
             dataset_id (str, optional): BigQuery dataset ID. Defaults to None (will get from config).
+            query_cache (QueryResultCache, optional): Result cache for trend queries. Defaults to None (shared cache).
         """
         config = get_config()
         
         # Set BigQuery client
-        self._bq_client = bq_client or BigQueryClient()
+        self._bq_client = bq_client or create_bigquery_client()
         
         # Set Firestore client
         self._fs_client = fs_client or FirestoreClient()
         
+        # Set query result cache
+        self._query_cache = query_cache or get_query_cache()
+        
         # Set project and dataset IDs
         self._project_id = project_id or config.get_gcp_project_id()
         self._dataset_id = dataset_id or config.get_bigquery_dataset()
@@ -161,6 +166,7 @@ class QualityRepository:
         # Insert into BigQuery
         rules_table_id = f"{self._project_id}.{self._dataset_id}.{QUALITY_RULE_TABLE_NAME}"
         self._bq_client.insert_rows(rules_table_id, [rule.to_bigquery_row()])
+        self._query_cache.invalidate_table(rules_table_id)
         
         # Store in Firestore for faster retrieval
         self._fs_client.set_document(
@@ -312,9 +318,11 @@ class QualityRepository:
             {"name": "rule_id", "parameterType": {"type": "STRING"}, "parameterValue": {"value": rule_id}}
         ]
         self._bq_client.query(delete_query, delete_params)
+        self._query_cache.invalidate_table(rules_table_id)
         
         # Then insert the updated rule
         self._bq_client.insert_rows(rules_table_id, [rule.to_bigquery_row()])
+        self._query_cache.invalidate_table(rules_table_id)
         
         # Update in Firestore
         self._fs_client.set_document(
@@ -352,6 +360,7 @@ class QualityRepository:
         ]
         
         self._bq_client.query(query, query_params)
+        self._query_cache.invalidate_table(rules_table_id)
         
         # Delete from Firestore
         self._fs_client.delete_document(QUALITY_RULES_COLLECTION, rule_id)
@@ -526,6 +535,7 @@ class QualityRepository:
         # Store in BigQuery
         validations_table_id = f"{self._project_id}.{self._dataset_id}.{QUALITY_VALIDATION_TABLE_NAME}"
         self._bq_client.insert_rows(validations_table_id, [validation.to_bigquery_row()])
+        self._query_cache.invalidate_table(validations_table_id)
         
         # Store in Firestore for faster retrieval
         self._fs_client.set_document(
@@ -727,9 +737,11 @@ class QualityRepository:
             {"name": "validation_id", "parameterType": {"type": "STRING"}, "parameterValue": {"value": validation_id}}
         ]
         self._bq_client.query(delete_query, delete_params)
+        self._query_cache.invalidate_table(validations_table_id)
         
         # Then insert the updated validation
         self._bq_client.insert_rows(validations_table_id, [validation.to_bigquery_row()])
+        self._query_cache.invalidate_table(validations_table_id)
         
         # Update in Firestore
         self._fs_client.set_document(
@@ -999,11 +1011,16 @@ class QualityRepository:
         ORDER BY time_period ASC
         """
         
-        # Execute query
-        results = self._bq_client.query(query, query_params)
+        # Execute query, serving repeated dashboard requests from the result cache
+        results = self._query_cache.get_or_query(
+            self._bq_client,
+            query,
+            query_params,
+            name="quality.get_quality_trend"
+        )
         
         # Convert to pandas DataFrame
-        df = results.to_dataframe()
+        df = pd.DataFrame(results)
         
         logger.debug(f"Retrieved quality trend data with {len(df)} time periods")
         return df
@@ -0,0 +1,363 @@
+"""
+Exponentially time-decayed success statistics of healing executions.
+
+ConfidenceScorer needs the historical success rate of an action for a given issue pattern
+and issue category on every healing decision. DecayedSuccessRateStore keeps decayed success
+and failure counters per (action type, pattern, issue category) in memory instead of
+querying every past execution:
+
+- Recording an outcome is O(1): a counter stores its decayed weights as of its last update,
+  so adding an observation decays the existing weights to the observation time and adds one.
+  Outcomes older than the last update are added with their own decay, so history can be
+  replayed in any order and a rebuild is a single pass.
+- Rollup counters per (action type, pattern) and per action type are updated alongside, and
+  a lookup is O(1): the action type rate is shrunk towards the global prior, the pattern rate
+  towards the action type rate, and the key rate towards the pattern rate (a hierarchical
+  Beta-Binomial posterior mean), so sparse keys fall back to what is known about their parents.
+- The counters and the time of the newest recorded outcome are snapshotted to a JSON file,
+  so after a restart only executions completed after that watermark need to be read.
+
+get_success_rate_store returns the process-wide store, so every HealingRepository and
+ConfidenceScorer in a process reads and updates the same counters.
+"""
+
+import datetime
+import json
+import math
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ...utils.logging.logger import get_logger
+from ...utils.storage.atomic_file import write_json_atomic
+from .metric_rollups import to_utc_naive
+
+# Configure module logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_HALF_LIFE_DAYS = 14.0
+DEFAULT_PRIOR_SUCCESS_RATE = 0.75
+DEFAULT_PRIOR_STRENGTH = 5.0
+SNAPSHOT_VERSION = 1
+
+# Counter key: (action type, pattern ID, issue category); None marks a rollup level
+SuccessKey = Tuple[str, Optional[str], Optional[str]]
+
+# Process-wide store returned by get_success_rate_store
+_success_rate_store = None
+_success_rate_store_lock = threading.Lock()
+
+
+def _enum_value(value: Any) -> Any:
+    """Returns the stored value of an enum member, or the value itself"""
+    return getattr(value, 'value', value)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime.datetime]:
+    """Parses a datetime or ISO string into naive UTC"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    return to_utc_naive(value)
+
+
+class _DecayedCounter:
+    """
+    Success and failure weights decayed to the time of the last update
+    """
+    __slots__ = ('successes', 'failures', 'updated_at')
+
+    def __init__(self, successes: float = 0.0, failures: float = 0.0, updated_at: float = 0.0):
+        self.successes = successes
+        self.failures = failures
+        self.updated_at = updated_at
+
+    def add(self, successful: bool, timestamp: float, decay_rate: float) -> None:
+        """Adds one outcome observed at a timestamp (seconds since the epoch)"""
+        if timestamp >= self.updated_at:
+            factor = math.exp(-decay_rate * (timestamp - self.updated_at))
+            self.successes *= factor
+            self.failures *= factor
+            self.updated_at = timestamp
+            weight = 1.0
+        else:
+            weight = math.exp(-decay_rate * (self.updated_at - timestamp))
+        if successful:
+            self.successes += weight
+        else:
+            self.failures += weight
+
+    def weights_at(self, timestamp: float, decay_rate: float) -> Tuple[float, float]:
+        """Returns the (successes, failures) weights decayed to a timestamp"""
+        factor = math.exp(-decay_rate * max(0.0, timestamp - self.updated_at))
+        return self.successes * factor, self.failures * factor
+
+
+class DecayedSuccessRateStore:
+    """
+    Time-decayed success and failure counters per (action type, pattern, issue category)
+    """
+
+    def __init__(self, half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+                 prior_success_rate: float = DEFAULT_PRIOR_SUCCESS_RATE,
+                 prior_strength: float = DEFAULT_PRIOR_STRENGTH,
+                 clock: Callable[[], datetime.datetime] = datetime.datetime.utcnow):
+        """
+        Creates an empty store.
+
+        Args:
+            half_life_days: Age at which an outcome counts half as much as a new one
+            prior_success_rate: Success rate assumed for action types without history
+            prior_strength: Number of pseudo-observations the prior of each level is worth
+            clock: Returns the current naive UTC time
+        """
+        if half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        self.half_life_days = half_life_days
+        self.prior_success_rate = prior_success_rate
+        self.prior_strength = prior_strength
+        self._decay_rate = math.log(2) / (half_life_days * 86400.0)
+        self._clock = clock
+        self._counters: Dict[SuccessKey, _DecayedCounter] = {}
+        self._lock = threading.Lock()
+        self.watermark: Optional[datetime.datetime] = None
+        # Monotonic times of the last load or catch-up from history, full rebuild and snapshot;
+        # kept with the counters so every repository sharing the store shares its schedule
+        self.sync_lock = threading.Lock()
+        self.synced_at: Optional[float] = None
+        self.rebuilt_at: Optional[float] = None
+        self.snapshotted_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    @staticmethod
+    def make_key(action_type: Any, pattern_id: Optional[str] = None,
+                 issue_category: Optional[str] = None) -> SuccessKey:
+        """
+        Builds a counter key.
+
+        Args:
+            action_type: Healing action type (enum member or value)
+            pattern_id: Issue pattern ID
+            issue_category: Issue category
+
+        Returns:
+            Counter key
+        """
+        return (_enum_value(action_type), pattern_id or None, _enum_value(issue_category) or None)
+
+    def record(self, action_type: Any, pattern_id: Optional[str], issue_category: Optional[str],
+               successful: bool, completed_at: Any = None) -> None:
+        """
+        Records the outcome of a healing execution.
+
+        Args:
+            action_type: Healing action type
+            pattern_id: Issue pattern the action was applied to
+            issue_category: Category of the issue
+            successful: Whether the execution succeeded
+            completed_at: Completion time (datetime or ISO string); defaults to now
+        """
+        action, pattern, category = self.make_key(action_type, pattern_id, issue_category)
+        completed = _parse_timestamp(completed_at) or self._clock()
+        timestamp = completed.replace(tzinfo=datetime.timezone.utc).timestamp()
+        with self._lock:
+            for key in {(action, None, None), (action, pattern, None), (action, pattern, category)}:
+                counter = self._counters.get(key)
+                if counter is None:
+                    counter = self._counters[key] = _DecayedCounter(updated_at=timestamp)
+                counter.add(bool(successful), timestamp, self._decay_rate)
+            if self.watermark is None or completed > self.watermark:
+                self.watermark = completed
+
+    def record_all(self, outcomes: Iterable[Dict[str, Any]]) -> int:
+        """
+        Records outcomes in any order.
+
+        Args:
+            outcomes: Dictionaries with action_type, pattern_id, issue_category, successful
+                and completion_time; rows without an outcome are skipped
+
+        Returns:
+            Number of outcomes recorded
+        """
+        recorded = 0
+        for outcome in outcomes:
+            if outcome.get('successful') is None or outcome.get('action_type') is None:
+                continue
+            self.record(outcome['action_type'], outcome.get('pattern_id'), outcome.get('issue_category'),
+                        outcome['successful'], outcome.get('completion_time'))
+            recorded += 1
+        return recorded
+
+    def rebuild(self, outcomes: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replaces every counter with counters built from history in one pass.
+
+        Args:
+            outcomes: Outcome dictionaries as accepted by record_all
+
+        Returns:
+            Number of outcomes recorded
+        """
+        with self._lock:
+            self._counters.clear()
+            self.watermark = None
+        return self.record_all(outcomes)
+
+    def get_counts(self, action_type: Any, pattern_id: Optional[str] = None,
+                   issue_category: Optional[str] = None) -> Tuple[float, float]:
+        """
+        Gets the decayed success and failure weights of a key as of now.
+
+        Args:
+            action_type: Healing action type
+            pattern_id: Issue pattern ID, or None for the action type rollup
+            issue_category: Issue category, or None for the pattern rollup
+
+        Returns:
+            Tuple of decayed (successes, failures)
+        """
+        now = self._clock().replace(tzinfo=datetime.timezone.utc).timestamp()
+        with self._lock:
+            counter = self._counters.get(self.make_key(action_type, pattern_id, issue_category))
+            if counter is None:
+                return 0.0, 0.0
+            return counter.weights_at(now, self._decay_rate)
+
+    def get_success_rate(self, action_type: Any, pattern_id: Optional[str] = None,
+                         issue_category: Optional[str] = None, prior_strength: float = None) -> float:
+        """
+        Gets the posterior mean success rate of a key, shrunk towards its parent levels.
+
+        Args:
+            action_type: Healing action type
+            pattern_id: Issue pattern ID (optional)
+            issue_category: Issue category (optional, used with a pattern ID)
+            prior_strength: Pseudo-observations of each level's prior (defaults to the store's)
+
+        Returns:
+            Success rate between 0.0 and 1.0
+        """
+        strength = self.prior_strength if prior_strength is None else prior_strength
+        action, pattern, category = self.make_key(action_type, pattern_id, issue_category)
+        levels = [(action, None, None)]
+        if pattern is not None:
+            levels.append((action, pattern, None))
+        if category is not None:
+            levels.append((action, pattern, category))
+
+        now = self._clock().replace(tzinfo=datetime.timezone.utc).timestamp()
+        rate = self.prior_success_rate
+        with self._lock:
+            for key in levels:
+                counter = self._counters.get(key)
+                if counter is None:
+                    break
+                successes, failures = counter.weights_at(now, self._decay_rate)
+                total = successes + failures + strength
+                if total > 0:
+                    rate = (successes + rate * strength) / total
+        return rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the counters and watermark.
+
+        Returns:
+            JSON-serializable snapshot
+        """
+        with self._lock:
+            return {
+                'version': SNAPSHOT_VERSION,
+                'half_life_days': self.half_life_days,
+                'watermark': self.watermark.isoformat() if self.watermark else None,
+                'counters': [
+                    [list(key), counter.successes, counter.failures, counter.updated_at]
+                    for key, counter in self._counters.items()
+                ]
+            }
+
+    def load_dict(self, data: Dict[str, Any]) -> int:
+        """
+        Replaces the counters with a snapshot.
+
+        Args:
+            data: Snapshot produced by to_dict
+
+        Returns:
+            Number of counters restored, or 0 if the snapshot is incompatible
+        """
+        if data.get('version') != SNAPSHOT_VERSION or data.get('half_life_days') != self.half_life_days:
+            logger.warning("Ignoring success rate snapshot with a different version or half-life")
+            return 0
+        counters = {
+            tuple(key): _DecayedCounter(successes, failures, updated_at)
+            for key, successes, failures, updated_at in data.get('counters', [])
+        }
+        with self._lock:
+            self._counters = counters
+            self.watermark = _parse_timestamp(data.get('watermark'))
+        return len(counters)
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Atomically writes a snapshot file.
+
+        Args:
+            path: Snapshot file path
+        """
+        write_json_atomic(path, self.to_dict(), prefix='.success_rates.')
+        logger.debug(f"Snapshotted {len(self)} success rate counters to {path}")
+
+    def load_snapshot(self, path: str) -> bool:
+        """
+        Restores the store from a snapshot file if one exists.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            True if a compatible snapshot was loaded
+        """
+        if not path or not os.path.exists(path):
+            return False
+        with open(path) as handle:
+            restored = self.load_dict(json.load(handle))
+        if not restored:
+            return False
+        logger.info(f"Restored {restored} success rate counters from {path}")
+        return True
+
+    def keys(self) -> List[SuccessKey]:
+        """Returns the keys of every counter, including rollups"""
+        with self._lock:
+            return list(self._counters)
+
+
+def get_success_rate_store(half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+                           prior_success_rate: float = DEFAULT_PRIOR_SUCCESS_RATE,
+                           prior_strength: float = DEFAULT_PRIOR_STRENGTH) -> DecayedSuccessRateStore:
+    """
+    Get the process-wide success rate store, creating it on first use
+
+    Args:
+        half_life_days: Half-life read when the store is created
+        prior_success_rate: Prior success rate read when the store is created
+        prior_strength: Prior strength read when the store is created
+
+    Returns:
+        Shared DecayedSuccessRateStore instance
+    """
+    global _success_rate_store
+    with _success_rate_store_lock:
+        if _success_rate_store is None:
+            _success_rate_store = DecayedSuccessRateStore(
+                half_life_days=half_life_days,
+                prior_success_rate=prior_success_rate,
+                prior_strength=prior_strength
+            )
+        return _success_rate_store
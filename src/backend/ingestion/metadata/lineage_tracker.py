@@ -19,7 +19,7 @@ from ...constants import DataSourceType
 from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ...utils.storage.firestore_client import FirestoreClient
-from ...utils.storage.bigquery_client import BigQueryClient
+from ...utils.storage.bigquery_client import create_bigquery_client
 
 # Configure module logger
 logger = get_logger(__name__)
@@ -82,7 +82,7 @@ class LineageTracker:
         self._firestore_client = FirestoreClient()
         
         # Initialize BigQuery client for long-term lineage storage
-        self._bigquery_client = BigQueryClient()
+        self._bigquery_client = create_bigquery_client()
         
         # Get configuration settings
         config = get_config()
@@ -1152,7 +1152,7 @@ class LineageQuery:
             lineage_tracker: The LineageTracker instance to use for queries
         """
         self._lineage_tracker = lineage_tracker
-        self._bigquery_client = BigQueryClient()
+        self._bigquery_client = create_bigquery_client()
     
     def find_data_sources(self, dataset: str, table: str) -> List[Dict[str, Any]]:
         """Finds all original data sources for a dataset.
@@ -28,7 +28,7 @@ from ...constants import (
 from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ...utils.storage.firestore_client import FirestoreClient
-from ...utils.storage.bigquery_client import BigQueryClient
+from ...utils.storage.bigquery_client import create_bigquery_client
 
 # Configure logger for this module
 logger = get_logger(__name__)
@@ -97,7 +97,7 @@ class MetadataTracker:
         # Initialize BigQuery client if enabled
         self._enable_bigquery_storage = config.get("metadata.enable_bigquery_storage", False)
         if self._enable_bigquery_storage:
-            self._bigquery_client = BigQueryClient()
+            self._bigquery_client = create_bigquery_client()
         else:
             self._bigquery_client = None
             
@@ -868,7 +868,7 @@ class MetadataQuery:
         # Initialize BigQuery client for complex queries
         config = get_config()
         if config.get("metadata.enable_bigquery_storage", False):
-            self._bigquery_client = BigQueryClient()
+            self._bigquery_client = create_bigquery_client()
         else:
             self._bigquery_client = None
     
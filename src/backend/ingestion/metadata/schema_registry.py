@@ -20,7 +20,7 @@ from ...constants import DataSourceType, FileFormat
 from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ...utils.storage.firestore_client import FirestoreClient
-from ...utils.storage.bigquery_client import BigQueryClient
+from ...utils.storage.bigquery_client import create_bigquery_client
 from ...utils.schema.schema_utils import (
     detect_schema_format,
     validate_schema,
@@ -100,7 +100,7 @@ class SchemaRegistry:
         # Configure BigQuery storage if enabled
         self._enable_bigquery_storage = config.get("schema_registry.enable_bigquery_storage", True)
         if self._enable_bigquery_storage:
-            self._bigquery_client = BigQueryClient()
+            self._bigquery_client = create_bigquery_client()
         else:
             self._bigquery_client = None
             
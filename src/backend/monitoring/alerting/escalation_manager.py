@@ -7,14 +7,16 @@ import typing
 import datetime
 import time
 import threading
+import heapq
+import itertools
 import json
 
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 
-from ...constants import AlertSeverity, NotificationChannel, ALERT_STATUS_ACKNOWLEDGED, ALERT_STATUS_RESOLVED
+from ...constants import AlertSeverity, NotificationChannel, ALERT_STATUS_ACKNOWLEDGED, ALERT_STATUS_RESOLVED, ALERT_STATUS_SUPPRESSED
 from ...config import get_config
-from ...logging_config import get_logger
+from ...utils.logging.logger import get_logger
 from .notification_router import NotificationRouter
 from ...db.repositories.alert_repository import AlertRepository
 from ...db.models.alert import Alert
@@ -22,6 +24,132 @@ from ...db.models.alert import Alert
 # Initialize module logger
 logger = get_logger(__name__)
 
+# Page size used when rebuilding the escalation schedule from the repository
+SCHEDULE_REBUILD_PAGE_SIZE = 500
+
+# Default interval between schedule reconciliations that pick up alerts written by other processes
+DEFAULT_RECONCILE_INTERVAL_SECONDS = 900
+
+# Alert statuses that stop any further escalation
+TERMINAL_ESCALATION_STATUSES = [ALERT_STATUS_ACKNOWLEDGED, ALERT_STATUS_RESOLVED, ALERT_STATUS_SUPPRESSED]
+
+
+class EscalationScheduler:
+    """
+    Min-heap of alert escalation deadlines with lazy cancellation
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty deadline scheduler
+        """
+        # LD1: Heap entries are (deadline, sequence, alert_id); sequence breaks ties and marks validity
+        self._heap: List[tuple] = []
+        self._entries: Dict[str, tuple] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of alerts with a pending deadline
+        """
+        with self._condition:
+            return len(self._entries)
+
+    def __contains__(self, alert_id: str) -> bool:
+        """
+        Returns whether an alert has a pending deadline
+        """
+        with self._condition:
+            return alert_id in self._entries
+
+    def schedule(self, alert_id: str, deadline: datetime) -> None:
+        """
+        Schedules or reschedules the escalation deadline for an alert in O(log n)
+        """
+        with self._condition:
+            entry = (deadline, next(self._sequence), alert_id)
+            self._entries[alert_id] = entry
+            heapq.heappush(self._heap, entry)
+            # LD1: Wake the waiting thread if the new deadline is now the earliest
+            if self._heap[0] is entry:
+                self._condition.notify_all()
+
+    def cancel(self, alert_id: str) -> bool:
+        """
+        Cancels the pending deadline for an alert; the stale heap entry is skipped when popped
+        """
+        with self._condition:
+            removed = self._entries.pop(alert_id, None) is not None
+            self._compact()
+            return removed
+
+    def next_deadline(self) -> Optional[datetime]:
+        """
+        Returns the earliest pending deadline, if any
+        """
+        with self._condition:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[str]:
+        """
+        Removes and returns the IDs of all alerts whose deadline is at or before now
+        """
+        due = []
+        with self._condition:
+            self._discard_stale()
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                del self._entries[entry[2]]
+                due.append(entry[2])
+                self._discard_stale()
+        return due
+
+    def wait(self, max_wait_seconds: float) -> None:
+        """
+        Sleeps until the next deadline, a schedule change or max_wait_seconds, whichever comes first
+        """
+        with self._condition:
+            self._discard_stale()
+            timeout = max_wait_seconds
+            if self._heap:
+                until_deadline = (self._heap[0][0] - datetime.now()).total_seconds()
+                timeout = max(0.0, min(timeout, until_deadline))
+            if timeout > 0:
+                self._condition.wait(timeout)
+
+    def wake(self) -> None:
+        """
+        Wakes any thread blocked in wait
+        """
+        with self._condition:
+            self._condition.notify_all()
+
+    def clear(self) -> None:
+        """
+        Removes all pending deadlines
+        """
+        with self._condition:
+            self._heap.clear()
+            self._entries.clear()
+            self._condition.notify_all()
+
+    def _discard_stale(self) -> None:
+        """
+        Pops cancelled or superseded entries from the top of the heap
+        """
+        while self._heap and self._entries.get(self._heap[0][2]) is not self._heap[0]:
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        """
+        Rebuilds the heap when stale entries outnumber live ones to keep memory bounded
+        """
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
 
 class EscalationManager:
     """
@@ -44,9 +172,22 @@ class EscalationManager:
         # LD1: Initialize escalation state tracking dictionary
         self._escalation_state: Dict[str, Dict[str, Union[int, datetime]]] = {}
 
-        # LD1: Set check interval from configuration (default 60 seconds)
+        # LD1: Set check interval from configuration (default 60 seconds); with deadline scheduling this
+        # only bounds how long the thread sleeps when nothing is scheduled
         self._check_interval_seconds = config.get('escalation.check_interval_seconds', 60)
 
+        # LD1: Set how often the schedule is reconciled with the repository to pick up alerts
+        # created or closed by other processes
+        self._reconcile_interval_seconds = config.get('escalation.reconcile_interval_seconds',
+                                                      DEFAULT_RECONCILE_INTERVAL_SECONDS)
+        self._last_reconcile = time.monotonic()
+
+        # LD1: Initialize deadline scheduler used instead of polling all active alerts
+        self._scheduler = EscalationScheduler()
+
+        # LD1: Schedule or cancel escalations as alerts are created and change status in this process
+        self._alert_repository.add_alert_listener(self.handle_alert_status_change)
+
         # LD1: Initialize but don't start the escalation monitoring thread
         self._escalation_thread: Optional[threading.Thread] = None
 
@@ -68,6 +209,10 @@ class EscalationManager:
         # LD1: Set running flag to True
         self._running = True
 
+        # LD1: Rebuild pending escalation deadlines from the repository
+        self.rebuild_schedule()
+        self._last_reconcile = time.monotonic()
+
         # LD1: Create and start escalation monitoring thread
         self._escalation_thread = threading.Thread(target=self._escalation_monitor_loop)
         self._escalation_thread.daemon = True  # Allow main thread to exit even if this thread is running
@@ -83,8 +228,9 @@ class EscalationManager:
         """
         Stops the escalation monitoring thread
         """
-        # LD1: Set running flag to False
+        # LD1: Set running flag to False and wake the sleeping monitor thread
         self._running = False
+        self._scheduler.wake()
 
         # LD1: Wait for escalation thread to terminate if it exists
         if self._escalation_thread and self._escalation_thread.is_alive():
@@ -98,7 +244,7 @@ class EscalationManager:
 
     def _escalation_monitor_loop(self) -> None:
         """
-        Background thread function that periodically checks for alerts requiring escalation
+        Background thread function that sleeps until the next escalation deadline and fires due escalations
         """
         # LD1: Log thread start
         logger.info("Escalation monitor thread started")
@@ -106,40 +252,152 @@ class EscalationManager:
         # LD1: While running flag is True:
         while self._running:
             try:
-                # LD1: Fetch active alerts that need escalation check
-                alerts_to_check = self._alert_repository.get_active_alerts()
+                # LD1: Sleep until the earliest deadline or until the schedule changes
+                self._scheduler.wait(self._check_interval_seconds)
+                if not self._running:
+                    break
 
-                # LD1: For each alert, check if escalation is needed
-                for alert in alerts_to_check:
-                    if self.check_alert_escalation(alert):
-                        # LD1: If escalation needed, perform escalation
-                        escalation_level = self.get_escalation_policy(alert.severity).get_escalation_level(
-                            int(((datetime.datetime.now() - alert.created_at).total_seconds()) / 60)
-                        )
-                        self.escalate_alert(alert, escalation_level)
+                # LD1: Process only the alerts whose deadline has passed
+                for alert_id in self._scheduler.pop_due(datetime.now()):
+                    self._process_due_alert(alert_id)
 
-                # LD1: Sleep for check_interval_seconds
-                time.sleep(self._check_interval_seconds)
+                # LD1: Periodically reconcile with the repository for alerts written elsewhere
+                if time.monotonic() - self._last_reconcile >= self._reconcile_interval_seconds:
+                    self._last_reconcile = time.monotonic()
+                    self.rebuild_schedule()
 
             except Exception as e:
                 logger.error(f"Error in escalation monitor loop: {e}")
+                time.sleep(1)
 
         # LD1: Log thread termination
         logger.info("Escalation monitor thread terminated")
 
+    def _process_due_alert(self, alert_id: str) -> None:
+        """
+        Escalates an alert whose deadline has passed and schedules its next deadline
+        """
+        # LD1: Re-read the alert so acknowledgements made by other processes are respected
+        alert = self._alert_repository.get_alert(alert_id)
+        if alert is None or alert.status in TERMINAL_ESCALATION_STATUSES:
+            self.cancel_alert_escalation(alert_id)
+            return
+
+        # LD1: Escalate if the alert has reached a new level
+        if self.check_alert_escalation(alert):
+            escalation_level = self.get_escalation_policy(alert.severity).get_escalation_level(
+                self._get_elapsed_minutes(alert)
+            )
+            if not self.escalate_alert(alert, escalation_level):
+                # LD1: Retry failed notifications after the check interval instead of immediately
+                self._scheduler.schedule(alert_id, datetime.now() + timedelta(seconds=self._check_interval_seconds))
+                return
+
+        # LD1: Schedule the following level, if any
+        self.schedule_alert(alert)
+
+    def schedule_alert(self, alert: Alert) -> Optional[datetime]:
+        """
+        Computes and schedules the next escalation deadline for an alert
+
+        Returns the scheduled deadline, or None if the alert needs no further escalation
+        """
+        # LD1: Acknowledged, resolved or suppressed alerts are never escalated
+        if alert.status in TERMINAL_ESCALATION_STATUSES:
+            self.cancel_alert_escalation(alert.alert_id)
+            return None
+
+        policy = self.get_escalation_policy(alert.severity)
+        elapsed_minutes = self._get_elapsed_minutes(alert)
+
+        # LD1: A level that is already due but not yet escalated fires immediately
+        alert_state = self.get_alert_escalation_state(alert.alert_id)
+        escalated_level = alert_state.get('level', 0) if alert_state else 0
+        if policy.get_escalation_level(elapsed_minutes) > escalated_level:
+            deadline = datetime.now()
+        else:
+            next_minutes = policy.get_next_escalation_minutes(elapsed_minutes)
+            if next_minutes is None:
+                self._scheduler.cancel(alert.alert_id)
+                return None
+            deadline = alert.created_at + timedelta(minutes=next_minutes)
+
+        self._scheduler.schedule(alert.alert_id, deadline)
+        return deadline
+
+    def cancel_alert_escalation(self, alert_id: str) -> bool:
+        """
+        Cancels pending escalation for an alert, used when it is acknowledged or resolved
+        """
+        # LD1: Drop the scheduled deadline and the escalation state for the alert
+        cancelled = self._scheduler.cancel(alert_id)
+        self._escalation_state.pop(alert_id, None)
+        return cancelled
+
+    def handle_alert_status_change(self, alert: Alert) -> None:
+        """
+        Updates the escalation schedule after an alert is created, acknowledged, resolved or suppressed
+        """
+        if alert.status in TERMINAL_ESCALATION_STATUSES:
+            self.cancel_alert_escalation(alert.alert_id)
+        else:
+            self.schedule_alert(alert)
+
+    def rebuild_schedule(self) -> int:
+        """
+        Schedules every active alert in the repository and drops state for alerts that are no longer active
+
+        Entries for alerts closed elsewhere are left in place; they are cancelled when their deadline
+        fires and the alert is re-read. Returns the number of alerts scheduled
+        """
+        scheduled = 0
+        offset = 0
+        active_alert_ids = set()
+
+        # LD1: Page through all active alerts
+        while True:
+            try:
+                alerts = self._alert_repository.get_active_alerts(limit=SCHEDULE_REBUILD_PAGE_SIZE, offset=offset)
+            except Exception as e:
+                logger.error(f"Failed to load active alerts for escalation schedule: {e}")
+                active_alert_ids = None
+                break
+
+            for alert in alerts:
+                active_alert_ids.add(alert.alert_id)
+                if self.schedule_alert(alert) is not None:
+                    scheduled += 1
+
+            if len(alerts) < SCHEDULE_REBUILD_PAGE_SIZE:
+                break
+            offset += SCHEDULE_REBUILD_PAGE_SIZE
+
+        # LD1: Only prune escalation state when the complete active set was read
+        if active_alert_ids is not None:
+            self.cleanup_escalation_state(active_alert_ids)
+
+        logger.info(f"Escalation schedule rebuilt with {scheduled} pending alerts")
+        return scheduled
+
+    def _get_elapsed_minutes(self, alert: Alert) -> int:
+        """
+        Calculates whole minutes elapsed since alert creation
+        """
+        return int((datetime.now() - alert.created_at).total_seconds() / 60)
+
     def check_alert_escalation(self, alert: Alert) -> bool:
         """
         Checks if an alert needs escalation based on severity and time since creation
         """
-        # LD1: Check if alert is already acknowledged or resolved
-        if alert.status in [ALERT_STATUS_ACKNOWLEDGED, ALERT_STATUS_RESOLVED]:
+        # LD1: Check if alert is already acknowledged, resolved or suppressed
+        if alert.status in TERMINAL_ESCALATION_STATUSES:
             return False
 
         # LD1: Get escalation policy for alert severity
         escalation_policy = self.get_escalation_policy(alert.severity)
 
         # LD1: Calculate time elapsed since alert creation
-        elapsed_minutes = int(((datetime.datetime.now() - alert.created_at).total_seconds()) / 60)
+        elapsed_minutes = self._get_elapsed_minutes(alert)
 
         # LD1: Determine current escalation level based on elapsed time
         escalation_level = escalation_policy.get_escalation_level(elapsed_minutes)
@@ -168,7 +426,7 @@ class EscalationManager:
         # LD1: Update alert with escalation information
         success = all(result.success for result in delivery_results.values())
         if success:
-            self.update_escalation_state(alert.alert_id, escalation_level, datetime.datetime.now())
+            self.update_escalation_state(alert.alert_id, escalation_level, datetime.now())
             logger.info(f"Alert {alert.alert_id} escalated to level {escalation_level}")
         else:
             logger.warning(f"Failed to escalate alert {alert.alert_id} to level {escalation_level}")
@@ -259,28 +517,33 @@ class EscalationManager:
         """
         Updates the escalation state for an alert
         """
-        # LD1: Create or update escalation state entry for alert
+        # LD1: Create or update escalation state entry for alert; entries for acknowledged and resolved
+        # alerts are removed by cancel_alert_escalation
         self._escalation_state[alert_id] = {
             "level": level,
             "timestamp": timestamp
         }
 
-        # LD1: Clean up old state entries if needed
-        self.cleanup_escalation_state()
-
-    def cleanup_escalation_state(self) -> int:
+    def cleanup_escalation_state(self, active_alert_ids: Optional[typing.Set[str]] = None) -> int:
         """
-        Removes escalation state entries for resolved alerts
+        Removes escalation state entries for alerts that are resolved or no longer active
+
+        With active_alert_ids, state is kept only for those alerts and alerts still scheduled;
+        otherwise resolved alerts are looked up in the repository
         """
-        # LD1: Get list of resolved alert IDs from repository
-        resolved_alerts = self._alert_repository.get_alerts_by_status(ALERT_STATUS_RESOLVED)
-        resolved_alert_ids = {alert.alert_id for alert in resolved_alerts}
+        # LD1: Find the IDs whose state is no longer needed
+        if active_alert_ids is None:
+            resolved_alerts = self._alert_repository.get_alerts_by_status(ALERT_STATUS_RESOLVED)
+            resolved_alert_ids = {alert.alert_id for alert in resolved_alerts}
+            stale_alert_ids = [alert_id for alert_id in list(self._escalation_state) if alert_id in resolved_alert_ids]
+        else:
+            stale_alert_ids = [alert_id for alert_id in list(self._escalation_state)
+                               if alert_id not in active_alert_ids and alert_id not in self._scheduler]
 
         # LD1: Remove those IDs from escalation_state dictionary
         removed_count = 0
-        for alert_id in list(self._escalation_state.keys()):
-            if alert_id in resolved_alert_ids:
-                del self._escalation_state[alert_id]
+        for alert_id in stale_alert_ids:
+            if self._escalation_state.pop(alert_id, None) is not None:
                 removed_count += 1
 
         # LD1: Return count of removed entries
@@ -370,5 +633,21 @@ class EscalationPolicy:
             else:
                 return level - 1
 
+        # LD1: Every threshold has passed, so the highest level applies
+        if sorted_timeframes:
+            return sorted_timeframes[-1][0]
+
         # LD1: Return 0 if no escalation needed yet
-        return 0
\ No newline at end of file
+        return 0
+
+    def get_next_escalation_minutes(self, elapsed_minutes: int) -> Optional[int]:
+        """
+        Returns the minutes after alert creation at which the next escalation level is reached
+        """
+        # LD1: Find the first threshold that has not yet been reached
+        for level, timeframe in sorted(self.timeframes.items()):
+            if elapsed_minutes < timeframe:
+                return timeframe
+
+        # LD1: Return None when the alert is already at the highest level
+        return None
@@ -13,7 +13,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 from ...constants import AlertSeverity, NotificationChannel
 from ...config import get_config
-from ...logging_config import get_logger
+from ...utils.logging.logger import get_logger
 from ..integrations.teams_notifier import TeamsNotifier
 from ..integrations.email_notifier import EmailNotifier
 
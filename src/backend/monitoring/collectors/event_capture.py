@@ -14,7 +14,7 @@ from google.cloud import pubsub_v1  # package_version: 2.13.0+
 from backend.constants import AlertSeverity, PipelineStatus  # Module containing constants and enums
 from backend.config import get_config  # Function to retrieve configuration settings
 from backend.logging_config import get_logger  # Function to configure logging
-from backend.utils.storage.bigquery_client import BigQueryClient  # Class for interacting with BigQuery
+from backend.utils.storage.bigquery_client import create_bigquery_client  # Class for interacting with BigQuery
 from backend.utils.storage.firestore_client import FirestoreClient  # Class for interacting with Firestore
 from backend.monitoring.analyzers.alert_correlator import AlertCorrelator  # Class for correlating alerts
 
@@ -329,7 +329,7 @@ class EventCapture:
             self._config.update(config_override)
 
         # Initialize BigQuery client for event storage
-        self._bigquery_client = BigQueryClient()
+        self._bigquery_client = create_bigquery_client()
         # Initialize Firestore client for event metadata
         self._firestore_client = FirestoreClient()
         # Initialize Pub/Sub publisher for event notifications
@@ -18,7 +18,7 @@ from google.cloud import logging as cloud_logging  # version 3.5.0+
 from constants import AlertSeverity, PipelineStatus
 from config import get_config
 from logging_config import get_logger
-from utils.storage.bigquery_client import BigQueryClient
+from utils.storage.bigquery_client import create_bigquery_client
 from utils.storage.firestore_client import FirestoreClient
 from utils.logging.log_formatter import JsonFormatter, StructuredFormatter
 from monitoring.analyzers.metric_processor import MetricProcessor
@@ -894,7 +894,7 @@ class LogIngestion:
             self._logging_client = None
         
         try:
-            self._bigquery_client = BigQueryClient()
+            self._bigquery_client = create_bigquery_client()
         except Exception as e:
             logger.warning(f"Error initializing BigQuery client: {e}")
             self._bigquery_client = None
@@ -28,6 +28,7 @@ from ....config import get_config
 from ....logging_config import get_logger
 from ....utils.storage.firestore_client import FirestoreClient
 from ....utils.storage.bigquery_client import BigQueryClient
+from ....utils.storage.write_buffer import WriteBuffer, get_write_buffer
 
 # Module logger
 logger = get_logger(__name__)
@@ -342,7 +343,8 @@ class StateTracker:
         self, 
         firestore_client: FirestoreClient, 
         bigquery_client: BigQueryClient, 
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        write_buffer: Optional[WriteBuffer] = None
     ):
         """Initialize the StateTracker with configuration.
         
@@ -350,6 +352,7 @@ class StateTracker:
             firestore_client: Firestore client for state storage
             bigquery_client: BigQuery client for historical analysis
             config: Optional configuration overrides
+            write_buffer: Buffer batching history inserts, defaults to the client's shared buffer
         """
         # Initialize configuration from application settings
         self._config = get_config().get("monitoring", {}).get("state_tracking", {})
@@ -361,6 +364,8 @@ class StateTracker:
         # Store client instances
         self._firestore_client = firestore_client
         self._bigquery_client = bigquery_client
+        self._write_buffer = write_buffer or get_write_buffer(bigquery_client)
+        self._history_dataset = self._config.get("history_dataset") or get_config().get_bigquery_dataset()
         
         # Initialize other properties
         self._transition_rules = {}  # Format: {component_type: {from_state: [rules]}}
@@ -976,11 +981,15 @@ class StateTracker:
         )
         return False
     
-    def add_state_to_history(self, state: ComponentState) -> bool:
+    def add_state_to_history(self, state: ComponentState, durable: bool = False) -> bool:
         """Add a state transition to the history in BigQuery.
         
+        Rows go through the shared write buffer, so frequent transitions are inserted
+        in batches rather than one streaming insert each.
+        
         Args:
             state: The component state to add to history
+            durable: Whether to block until the row has been written
             
         Returns:
             True if successful, False otherwise
@@ -993,11 +1002,17 @@ class StateTracker:
             if 'metadata' in row and isinstance(row['metadata'], dict):
                 row['metadata'] = json.dumps(row['metadata'])
             
-            # Insert row into BigQuery
-            self._bigquery_client.insert_rows(
-                table=STATE_HISTORY_TABLE,
-                rows=[row]
-            )
+            # Insert row into BigQuery; the ID makes retried inserts of this transition idempotent
+            insert_id = f"{state.state_id}:{state.state}:{row['timestamp']}"
+            if not self._write_buffer.append(
+                self._history_dataset,
+                STATE_HISTORY_TABLE,
+                [row],
+                insert_ids=[insert_id],
+                wait=durable
+            ):
+                logger.error(f"Failed to write state transition to history: {state.component_type}:{state.component_id}")
+                return False
             
             logger.debug(
                 f"Added state transition to history: {state.component_type}:{state.component_id} "
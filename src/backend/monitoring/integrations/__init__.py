@@ -35,6 +35,12 @@ from .logs_analyzer import (  # Internal module for log analysis
     extract_error_patterns,  # Function to extract common error patterns from logs
     identify_root_cause  # Function to identify the root cause of a pipeline failure
 )
+from .log_template_miner import (  # Internal module for incremental log template mining
+    LogTemplateMiner,  # Class for Drain-style online template mining
+    LogTemplateCluster,  # Class representing a mined log template
+    tokenize_log_message,  # Function to mask and tokenize log messages
+    detect_template_anomalies  # Function to detect new templates and template volume spikes
+)
 from ...logging_config import get_logger  # Internal module for logging configuration
 
 # Initialize logger for this module
@@ -63,5 +69,9 @@ __all__ = [
     "LogPattern",
     "RootCauseAnalysis",
     "extract_error_patterns",
-    "identify_root_cause"
+    "identify_root_cause",
+    "LogTemplateMiner",
+    "LogTemplateCluster",
+    "tokenize_log_message",
+    "detect_template_anomalies"
 ]
\ No newline at end of file
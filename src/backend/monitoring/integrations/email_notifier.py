@@ -18,7 +18,7 @@ import jinja2  # version 3.1.2
 
 from ...constants import AlertSeverity, NotificationChannel
 from ...config import get_config
-from ...logging_config import get_logger
+from ...utils.logging.logger import get_logger
 
 # Configure logger
 logger = get_logger(__name__)
@@ -0,0 +1,612 @@
+"""
+Incremental log template mining for the self-healing data pipeline.
+
+Implements a Drain-style online parser: log messages are routed through a fixed-depth
+parse tree keyed by token count and leading tokens, and are merged into the most similar
+template cluster at the leaf. Each message is processed in a single pass without pairwise
+comparisons, the number of clusters is bounded with LRU eviction (globally and per leaf),
+branches left empty by evictions are pruned from the tree, and per-template counts are kept
+in bounded time buckets so they can feed log anomaly detection.
+"""
+
+import re  # standard library
+import json  # standard library
+import os  # standard library
+import uuid  # standard library
+import datetime  # standard library
+import collections  # standard library
+import typing  # standard library
+
+from src.backend.utils.logging.logger import get_logger  # internal
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Constants
+WILDCARD_TOKEN = "<*>"
+DEFAULT_TREE_DEPTH = 3
+DEFAULT_SIMILARITY_THRESHOLD = 0.4
+DEFAULT_MAX_CHILDREN = 100
+DEFAULT_MAX_CLUSTERS = 10000
+DEFAULT_MAX_CLUSTERS_PER_LEAF = 100
+DEFAULT_MAX_EXAMPLES = 3
+DEFAULT_BUCKET_SECONDS = 300
+DEFAULT_MAX_BUCKETS = 288
+DEFAULT_SPIKE_Z_THRESHOLD = 3.0
+DEFAULT_SPIKE_MIN_COUNT = 5
+DEFAULT_NEW_PATTERN_MIN_COUNT = 1
+DEFAULT_MASKING_PATTERNS = [
+    ("<UUID>", r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"),
+    ("<TS>", r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?\b"),
+    ("<IP>", r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"),
+    ("<HEX>", r"\b0x[0-9a-fA-F]+\b"),
+    ("<PATH>", r"(?:gs://|/)[\w\-./]+/[\w\-.]+"),
+    ("<NUM>", r"(?<![\w.])[-+]?\d+(?:\.\d+)?(?![\w.])"),
+]
+TOKEN_SPLIT_PATTERN = re.compile(r"[\s=,;:()\[\]{}\"']+")
+
+
+def tokenize_log_message(message: str, masking_patterns: list = None) -> typing.List[str]:
+    """Masks variable fragments of a log message and splits it into tokens
+
+    Args:
+        message: Raw log message
+        masking_patterns: List of (placeholder, compiled regex) tuples applied in order
+
+    Returns:
+        List of normalized tokens
+    """
+    if not message:
+        return []
+
+    # Replace identifiers, numbers and paths with stable placeholders
+    masked = message.strip()
+    for placeholder, pattern in masking_patterns or []:
+        masked = pattern.sub(placeholder, masked)
+
+    # Split on whitespace and common delimiters, dropping empty tokens
+    return [token for token in TOKEN_SPLIT_PATTERN.split(masked) if token]
+
+
+def compile_masking_patterns(patterns: list = None) -> list:
+    """Compiles masking pattern definitions into (placeholder, regex) tuples
+
+    Args:
+        patterns: List of (placeholder, regex string) tuples, defaults to DEFAULT_MASKING_PATTERNS
+
+    Returns:
+        List of (placeholder, compiled regex) tuples
+    """
+    compiled = []
+    for placeholder, regex in patterns if patterns is not None else DEFAULT_MASKING_PATTERNS:
+        try:
+            compiled.append((placeholder, re.compile(regex)))
+        except re.error:
+            logger.warning(f"Invalid masking pattern for placeholder {placeholder}")
+    return compiled
+
+
+class LogTemplateCluster:
+    """A group of log messages sharing one template"""
+
+    def __init__(self, template_tokens: typing.List[str], cluster_id: str = None):
+        """Initializes a template cluster
+
+        Args:
+            template_tokens: Tokens of the template, variable positions use WILDCARD_TOKEN
+            cluster_id: Unique identifier, generated if not provided
+        """
+        self.cluster_id = cluster_id or str(uuid.uuid4())
+        self.template_tokens = list(template_tokens)
+        # Parse tree path (token count followed by branch tokens) leading to this cluster's leaf
+        self.route: typing.List[typing.Any] = []
+        self.size = 0
+        self.first_seen: typing.Optional[datetime.datetime] = None
+        self.last_seen: typing.Optional[datetime.datetime] = None
+        self.examples: typing.List[str] = []
+        # Ordered bucket start (epoch seconds) -> message count, oldest first
+        self.bucket_counts: typing.Dict[int, int] = collections.OrderedDict()
+
+    @property
+    def template(self) -> str:
+        """Returns the template as a single string"""
+        return " ".join(self.template_tokens)
+
+    def similarity(self, tokens: typing.List[str]) -> typing.Tuple[float, int]:
+        """Calculates the fraction of positions where tokens match the template
+
+        Args:
+            tokens: Tokens of a message with the same length as the template
+
+        Returns:
+            Tuple of (similarity ratio, number of wildcard positions)
+        """
+        matched = 0
+        wildcards = 0
+        for template_token, token in zip(self.template_tokens, tokens):
+            if template_token == WILDCARD_TOKEN:
+                wildcards += 1
+            elif template_token == token:
+                matched += 1
+        return matched / len(tokens) if tokens else 1.0, wildcards
+
+    def merge(self, tokens: typing.List[str]) -> bool:
+        """Generalizes the template with a new message
+
+        Args:
+            tokens: Tokens of the message being merged
+
+        Returns:
+            True if the template changed
+        """
+        changed = False
+        for index, token in enumerate(tokens):
+            if self.template_tokens[index] != token and self.template_tokens[index] != WILDCARD_TOKEN:
+                self.template_tokens[index] = WILDCARD_TOKEN
+                changed = True
+        return changed
+
+    def record(self, message: str, timestamp: datetime.datetime, bucket_seconds: int,
+               max_buckets: int, max_examples: int) -> None:
+        """Records an occurrence of the template
+
+        Args:
+            message: Original log message
+            timestamp: Time of the log entry
+            bucket_seconds: Width of the count buckets in seconds
+            max_buckets: Maximum number of buckets retained per template
+            max_examples: Maximum number of example messages retained
+        """
+        self.size += 1
+        if self.first_seen is None or timestamp < self.first_seen:
+            self.first_seen = timestamp
+        if self.last_seen is None or timestamp > self.last_seen:
+            self.last_seen = timestamp
+        if len(self.examples) < max_examples:
+            self.examples.append(message)
+
+        # Count the occurrence in its time bucket, discarding the oldest buckets
+        bucket = int(timestamp.timestamp()) // bucket_seconds * bucket_seconds
+        self.bucket_counts[bucket] = self.bucket_counts.get(bucket, 0) + 1
+        if len(self.bucket_counts) > max_buckets:
+            for stale_bucket in sorted(self.bucket_counts)[:len(self.bucket_counts) - max_buckets]:
+                del self.bucket_counts[stale_bucket]
+
+    def to_dict(self) -> dict:
+        """Converts the cluster to a dictionary representation
+
+        Returns:
+            Dictionary representation of the cluster
+        """
+        return {
+            "cluster_id": self.cluster_id,
+            "template_tokens": self.template_tokens,
+            "route": self.route,
+            "size": self.size,
+            "first_seen": self.first_seen.isoformat() if self.first_seen else None,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "examples": self.examples,
+            "bucket_counts": [[bucket, count] for bucket, count in sorted(self.bucket_counts.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LogTemplateCluster':
+        """Creates a cluster from a dictionary representation
+
+        Args:
+            data: Dictionary representation of the cluster
+
+        Returns:
+            LogTemplateCluster instance
+        """
+        cluster = cls(data["template_tokens"], data["cluster_id"])
+        cluster.route = list(data.get("route", []))
+        cluster.size = data.get("size", 0)
+        if data.get("first_seen"):
+            cluster.first_seen = datetime.datetime.fromisoformat(data["first_seen"])
+        if data.get("last_seen"):
+            cluster.last_seen = datetime.datetime.fromisoformat(data["last_seen"])
+        cluster.examples = list(data.get("examples", []))
+        cluster.bucket_counts = collections.OrderedDict(
+            (int(bucket), int(count)) for bucket, count in data.get("bucket_counts", [])
+        )
+        return cluster
+
+
+class LogTemplateMiner:
+    """Online Drain-style log template miner with a fixed-depth parse tree"""
+
+    def __init__(self, config: dict = None):
+        """Initializes the miner
+
+        Args:
+            config: Optional configuration with keys depth, similarity_threshold, max_children,
+                max_clusters, max_clusters_per_leaf, max_examples, bucket_seconds, max_buckets
+                and masking_patterns
+        """
+        config = config or {}
+        # Depth counts the root and token-count levels, so at least one token level is required
+        self._depth = max(int(config.get("depth", DEFAULT_TREE_DEPTH)), 3)
+        self._similarity_threshold = float(config.get("similarity_threshold", DEFAULT_SIMILARITY_THRESHOLD))
+        self._max_children = int(config.get("max_children", DEFAULT_MAX_CHILDREN))
+        self._max_clusters = int(config.get("max_clusters", DEFAULT_MAX_CLUSTERS))
+        self._max_clusters_per_leaf = max(int(config.get("max_clusters_per_leaf", DEFAULT_MAX_CLUSTERS_PER_LEAF)), 1)
+        self._max_examples = int(config.get("max_examples", DEFAULT_MAX_EXAMPLES))
+        self._bucket_seconds = int(config.get("bucket_seconds", DEFAULT_BUCKET_SECONDS))
+        self._max_buckets = int(config.get("max_buckets", DEFAULT_MAX_BUCKETS))
+        self._masking_patterns = compile_masking_patterns(config.get("masking_patterns"))
+
+        # Parse tree: token count -> nested dicts of leading tokens -> list of cluster ids,
+        # each leaf list in least recently used order
+        self._root: typing.Dict[int, dict] = {}
+        # Clusters in least recently used order for bounded-memory eviction
+        self._clusters: typing.Dict[str, LogTemplateCluster] = collections.OrderedDict()
+        self._total_messages = 0
+
+    @property
+    def total_messages(self) -> int:
+        """Returns the number of messages processed"""
+        return self._total_messages
+
+    @property
+    def similarity_threshold(self) -> float:
+        """Returns the similarity threshold used to merge messages into clusters"""
+        return self._similarity_threshold
+
+    @property
+    def bucket_seconds(self) -> int:
+        """Returns the width of the per-template count buckets in seconds"""
+        return self._bucket_seconds
+
+    def get_clusters(self) -> typing.List[LogTemplateCluster]:
+        """Returns all clusters ordered by size, largest first"""
+        return sorted(self._clusters.values(), key=lambda cluster: cluster.size, reverse=True)
+
+    def get_cluster(self, cluster_id: str) -> typing.Optional[LogTemplateCluster]:
+        """Returns the cluster with the given id, if it is still resident"""
+        return self._clusters.get(cluster_id)
+
+    def add_log_message(self, message: str,
+                        timestamp: datetime.datetime = None) -> typing.Tuple[LogTemplateCluster, str]:
+        """Adds a log message to the miner, creating or updating a template cluster
+
+        Args:
+            message: Raw log message
+            timestamp: Time of the log entry, defaults to now
+
+        Returns:
+            Tuple of (cluster, change type) where change type is 'created', 'updated' or 'none'
+        """
+        timestamp = timestamp or datetime.datetime.now(datetime.timezone.utc)
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        tokens = tokenize_log_message(message, self._masking_patterns)
+        self._total_messages += 1
+
+        leaf, route = self._get_leaf(tokens, create=True)
+        cluster = self._find_best_cluster(leaf, tokens)
+
+        if cluster is None:
+            cluster = LogTemplateCluster(tokens)
+            cluster.route = route
+            self._clusters[cluster.cluster_id] = cluster
+            leaf.append(cluster.cluster_id)
+            # Bound the clusters compared at one leaf, then the clusters held overall
+            while len(leaf) > self._max_clusters_per_leaf:
+                self._remove_cluster(leaf[0])
+            self._evict_if_needed()
+            change_type = "created"
+        else:
+            change_type = "updated" if cluster.merge(tokens) else "none"
+            self._clusters.move_to_end(cluster.cluster_id)
+            leaf.remove(cluster.cluster_id)
+            leaf.append(cluster.cluster_id)
+
+        cluster.record(message, timestamp, self._bucket_seconds, self._max_buckets, self._max_examples)
+        return cluster, change_type
+
+    def match(self, message: str) -> typing.Optional[LogTemplateCluster]:
+        """Finds the cluster matching a message without modifying the miner
+
+        Args:
+            message: Raw log message
+
+        Returns:
+            Matching cluster or None
+        """
+        tokens = tokenize_log_message(message, self._masking_patterns)
+        leaf, _ = self._get_leaf(tokens, create=False)
+        if leaf is None:
+            return None
+        return self._find_best_cluster(leaf, tokens)
+
+    def get_template_counts(self, start_time: datetime.datetime = None,
+                            end_time: datetime.datetime = None) -> typing.Dict[str, typing.List[typing.Tuple[datetime.datetime, int]]]:
+        """Returns per-template message counts over time
+
+        Args:
+            start_time: Only include buckets starting at or after this time
+            end_time: Only include buckets starting before this time
+
+        Returns:
+            Dictionary mapping cluster id to a list of (bucket start, count) tuples in time order
+        """
+        start_epoch = start_time.timestamp() if start_time else None
+        end_epoch = end_time.timestamp() if end_time else None
+
+        counts = {}
+        for cluster_id, cluster in self._clusters.items():
+            series = []
+            for bucket, count in sorted(cluster.bucket_counts.items()):
+                if start_epoch is not None and bucket < start_epoch:
+                    continue
+                if end_epoch is not None and bucket >= end_epoch:
+                    continue
+                series.append((datetime.datetime.fromtimestamp(bucket, tz=datetime.timezone.utc), count))
+            counts[cluster_id] = series
+        return counts
+
+    def to_dict(self) -> dict:
+        """Converts the miner state, including the parse tree, to a dictionary
+
+        Returns:
+            Dictionary representation of the miner
+        """
+        return {
+            "config": {
+                "depth": self._depth,
+                "similarity_threshold": self._similarity_threshold,
+                "max_children": self._max_children,
+                "max_clusters": self._max_clusters,
+                "max_clusters_per_leaf": self._max_clusters_per_leaf,
+                "max_examples": self._max_examples,
+                "bucket_seconds": self._bucket_seconds,
+                "max_buckets": self._max_buckets,
+                "masking_patterns": [[placeholder, pattern.pattern] for placeholder, pattern in self._masking_patterns],
+            },
+            "total_messages": self._total_messages,
+            "tree": {str(length): node for length, node in self._root.items()},
+            "clusters": [cluster.to_dict() for cluster in self._clusters.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LogTemplateMiner':
+        """Creates a miner from a dictionary representation
+
+        Args:
+            data: Dictionary representation of the miner
+
+        Returns:
+            LogTemplateMiner instance
+        """
+        config = dict(data.get("config", {}))
+        if "masking_patterns" in config:
+            config["masking_patterns"] = [tuple(item) for item in config["masking_patterns"]]
+        miner = cls(config)
+        miner._total_messages = data.get("total_messages", 0)
+        miner._root = {int(length): node for length, node in data.get("tree", {}).items()}
+        for cluster_data in data.get("clusters", []):
+            cluster = LogTemplateCluster.from_dict(cluster_data)
+            miner._clusters[cluster.cluster_id] = cluster
+        return miner
+
+    def save(self, file_path: str) -> bool:
+        """Persists the template tree and clusters to a JSON file
+
+        Args:
+            file_path: Destination file path
+
+        Returns:
+            True if the state was saved
+        """
+        try:
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a truncated state file
+            temp_path = f"{file_path}.tmp"
+            with open(temp_path, "w") as state_file:
+                json.dump(self.to_dict(), state_file)
+            os.replace(temp_path, file_path)
+            logger.debug(f"Saved {len(self._clusters)} log templates to {file_path}")
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to save log template state to {file_path}: {e}")
+            return False
+
+    @classmethod
+    def load(cls, file_path: str, config: dict = None) -> 'LogTemplateMiner':
+        """Loads a miner from a JSON file, returning an empty miner if the file is unavailable
+
+        Args:
+            file_path: Source file path
+            config: Configuration used when no saved state can be loaded
+
+        Returns:
+            LogTemplateMiner instance
+        """
+        if not file_path or not os.path.exists(file_path):
+            return cls(config)
+        try:
+            with open(file_path, "r") as state_file:
+                miner = cls.from_dict(json.load(state_file))
+            logger.info(f"Loaded {len(miner._clusters)} log templates from {file_path}")
+            return miner
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to load log template state from {file_path}: {e}")
+            return cls(config)
+
+    def _get_leaf(self, tokens: typing.List[str], create: bool) -> typing.Tuple[typing.Optional[list], list]:
+        """Walks the parse tree to the leaf holding candidate clusters
+
+        Args:
+            tokens: Message tokens
+            create: Whether missing nodes should be created
+
+        Returns:
+            Tuple of (list of cluster ids at the leaf or None if the path does not exist and
+            create is False, route taken through the tree)
+        """
+        token_count = len(tokens)
+        route: typing.List[typing.Any] = [token_count]
+        node = self._root.get(token_count)
+        if node is None:
+            if not create:
+                return None, route
+            node = self._root[token_count] = {}
+
+        # Route on the leading tokens; the root and token-count levels use two levels of depth
+        prefix_length = min(self._depth - 2, token_count)
+        branch_tokens = tokens[:prefix_length] if prefix_length else [WILDCARD_TOKEN]
+        for index, token in enumerate(branch_tokens):
+            is_last = index == len(branch_tokens) - 1
+            if token not in node:
+                # Tokens containing digits are likely variables and share the wildcard branch
+                if any(char.isdigit() for char in token) or len(node) >= self._max_children:
+                    token = WILDCARD_TOKEN
+            if token not in node:
+                if not create:
+                    return None, route
+                node[token] = [] if is_last else {}
+            route.append(token)
+            node = node[token]
+        return node, route
+
+    def _get_node_path(self, route: list) -> typing.Optional[typing.List[typing.Tuple[dict, typing.Any]]]:
+        """Returns the (parent node, key) pairs along a previously recorded route, if it still exists"""
+        if not route or route[0] not in self._root:
+            return None
+        path = [(self._root, route[0])]
+        node = self._root[route[0]]
+        for token in route[1:]:
+            if not isinstance(node, dict) or token not in node:
+                return None
+            path.append((node, token))
+            node = node[token]
+        return path if isinstance(node, list) else None
+
+    def _find_best_cluster(self, leaf: list, tokens: typing.List[str]) -> typing.Optional[LogTemplateCluster]:
+        """Selects the most similar cluster at a leaf that satisfies the similarity threshold
+
+        Args:
+            leaf: List of cluster ids at the leaf
+            tokens: Message tokens
+
+        Returns:
+            Best matching cluster or None
+        """
+        best_cluster = None
+        best_key = (-1.0, -1)
+        for cluster_id in leaf:
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None:
+                continue
+            similarity, wildcards = cluster.similarity(tokens)
+            # Prefer higher similarity, then the more specific template
+            key = (similarity, -wildcards)
+            if key > best_key:
+                best_key = key
+                best_cluster = cluster
+        if best_cluster is not None and best_key[0] >= self._similarity_threshold:
+            return best_cluster
+        return None
+
+    def _evict_if_needed(self) -> None:
+        """Evicts least recently used clusters until the cluster limit is satisfied"""
+        while len(self._clusters) > self._max_clusters:
+            self._remove_cluster(next(iter(self._clusters)))
+
+    def _remove_cluster(self, cluster_id: str) -> None:
+        """Removes a cluster and prunes the tree branches it leaves empty
+
+        Args:
+            cluster_id: Identifier of the cluster to remove
+        """
+        cluster = self._clusters.pop(cluster_id, None)
+        if cluster is None:
+            return
+        path = self._get_node_path(cluster.route)
+        if path is not None:
+            parent, key = path[-1]
+            leaf = parent[key]
+            if cluster_id in leaf:
+                leaf.remove(cluster_id)
+            # Delete empty nodes from the leaf up, so template churn does not grow the tree
+            for parent, key in reversed(path):
+                if parent[key]:
+                    break
+                del parent[key]
+        logger.debug(f"Evicted log template {cluster_id} ({cluster.template})")
+
+    def get_tree_size(self) -> int:
+        """Counts the nodes and leaves of the parse tree
+
+        Returns:
+            Number of tree nodes below the root
+        """
+        def count(node) -> int:
+            if isinstance(node, list):
+                return 1
+            return 1 + sum(count(child) for child in node.values())
+        return sum(count(node) for node in self._root.values())
+
+
+def detect_template_anomalies(miner: LogTemplateMiner, log_messages: typing.Iterable[typing.Tuple[str, datetime.datetime]],
+                              z_threshold: float = DEFAULT_SPIKE_Z_THRESHOLD, min_count: int = DEFAULT_SPIKE_MIN_COUNT,
+                              new_pattern_min_count: int = DEFAULT_NEW_PATTERN_MIN_COUNT) -> typing.List[dict]:
+    """Feeds log messages into a miner and reports new templates and template volume spikes
+
+    Args:
+        miner: Resident template miner holding the baseline
+        log_messages: Iterable of (message, timestamp) tuples
+        z_threshold: Z-score of the latest bucket against the template history that counts as a spike
+        min_count: Minimum count of the latest bucket for a spike
+        new_pattern_min_count: Minimum occurrences of a newly created template to report it
+
+    Returns:
+        List of anomaly dictionaries with cluster, anomaly_type, anomaly_score, value,
+        expected_value and timestamp
+    """
+    # New templates are only anomalous once the miner has learned a baseline
+    has_baseline = miner.total_messages > 0
+
+    # Feed messages into the miner, tracking templates touched by this batch
+    touched_clusters = set()
+    new_clusters = set()
+    for message, timestamp in log_messages:
+        cluster, change_type = miner.add_log_message(message, timestamp)
+        touched_clusters.add(cluster.cluster_id)
+        if change_type == "created" and has_baseline:
+            new_clusters.add(cluster.cluster_id)
+
+    anomalies = []
+    bucket_seconds = miner.bucket_seconds
+    for cluster_id in touched_clusters:
+        cluster = miner.get_cluster(cluster_id)
+        if cluster is None or not cluster.bucket_counts:
+            continue
+
+        # Identify new error types that have not been seen before
+        if cluster_id in new_clusters and cluster.size >= new_pattern_min_count:
+            anomalies.append({"cluster": cluster, "anomaly_type": "new_log_pattern", "anomaly_score": 1.0,
+                              "value": cluster.size, "expected_value": 0.0, "timestamp": cluster.last_seen})
+            continue
+
+        # Detect unusual spikes in template frequency against its zero-filled bucket history
+        buckets = sorted(cluster.bucket_counts.items())
+        latest_bucket, latest_count = buckets[-1]
+        history_length = (latest_bucket - buckets[0][0]) // bucket_seconds
+        if history_length < 2 or latest_count < min_count:
+            continue
+        history_total = sum(count for bucket, count in buckets[:-1])
+        history_sq_total = sum(count * count for bucket, count in buckets[:-1])
+        mean = history_total / history_length
+        std = max(history_sq_total / history_length - mean * mean, 0.0) ** 0.5
+        z_score = (latest_count - mean) / std if std > 0 else (float("inf") if latest_count > mean else 0.0)
+        if z_score >= z_threshold:
+            anomalies.append({
+                "cluster": cluster, "anomaly_type": "log_volume_spike",
+                "anomaly_score": min(z_score / (z_threshold * 2), 1.0), "value": latest_count, "expected_value": mean,
+                "timestamp": datetime.datetime.fromtimestamp(latest_bucket, tz=datetime.timezone.utc)
+            })
+    return anomalies
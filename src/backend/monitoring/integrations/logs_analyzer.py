@@ -8,6 +8,7 @@ import re  # standard library
 import json  # standard library
 import datetime  # standard library
 import typing  # standard library
+import uuid  # standard library
 import pandas as pd  # version 2.0.0+
 import numpy as np  # version 1.23.0+
 from google.cloud import logging_v2  # version 3.5.0+
@@ -15,12 +16,16 @@ from sklearn.feature_extraction import text  # version 1.2.0+
 
 from src.backend.constants import AlertSeverity, PipelineStatus  # internal
 from src.backend.config import get_config  # internal
-from src.backend.logging_config import get_logger  # internal
+from src.backend.utils.logging.logger import get_logger  # internal
 from src.backend.utils.auth.gcp_auth import get_credentials_for_service  # internal
-from src.backend.utils.storage.bigquery_client import BigQueryClient  # internal
+from src.backend.utils.storage.bigquery_client import create_bigquery_client  # internal
 from src.backend.utils.logging.log_formatter import StructuredFormatter  # internal
 from src.backend.monitoring.collectors.log_ingestion import LogIngestion, parse_log_entry  # internal
 from src.backend.monitoring.analyzers.anomaly_detector import AnomalyRecord  # internal
+from src.backend.monitoring.integrations.log_template_miner import (  # internal
+    LogTemplateMiner, detect_template_anomalies, DEFAULT_SPIKE_Z_THRESHOLD, DEFAULT_SPIKE_MIN_COUNT,
+    DEFAULT_NEW_PATTERN_MIN_COUNT
+)
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -30,6 +35,29 @@ DEFAULT_ANALYSIS_WINDOW_HOURS = 24
 DEFAULT_PATTERN_THRESHOLD = 0.7
 DEFAULT_ERROR_PATTERN_CACHE_SIZE = 100
 DEFAULT_MAX_RESULTS = 1000
+ERROR_SEVERITIES = ("ERROR", "CRITICAL")
+
+
+def get_log_entry_timestamp(log_entry: dict) -> datetime.datetime:
+    """Extracts a timezone-aware timestamp from a log entry
+
+    Args:
+        log_entry: Log entry with an optional timestamp as datetime or ISO string
+
+    Returns:
+        Timestamp of the entry, or the current UTC time if it is missing or invalid
+    """
+    timestamp = log_entry.get("timestamp")
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            timestamp = None
+    if not isinstance(timestamp, datetime.datetime):
+        return datetime.datetime.now(datetime.timezone.utc)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp
 
 
 def extract_error_patterns(log_entries: list, similarity_threshold: float) -> dict:
@@ -42,21 +70,27 @@ def extract_error_patterns(log_entries: list, similarity_threshold: float) -> di
     Returns:
         Dictionary of error patterns with frequency and examples
     """
-    # Filter log entries to include only error and critical levels
-    error_logs = [
-        entry for entry in log_entries
-        if entry.get("severity") in ["ERROR", "CRITICAL"]
-    ]
-
-    # Extract error messages from log entries
-    error_messages = [entry.get("message", "") for entry in error_logs]
-
-    # Tokenize and normalize error messages
-    # Cluster similar error messages using text similarity
-    # Identify common patterns within each cluster
+    # Mine templates incrementally in a single pass; the input may be a generator
+    miner = LogTemplateMiner({"similarity_threshold": similarity_threshold})
+    for entry in log_entries:
+        # Only error and critical levels contribute to error patterns
+        if entry.get("severity") not in ERROR_SEVERITIES:
+            continue
+        miner.add_log_message(entry.get("message", ""), get_log_entry_timestamp(entry))
+
     # Calculate frequency and representative examples for each pattern
-    # Return dictionary of error patterns with metadata
-    return {}
+    total_errors = miner.total_messages
+    return {
+        cluster.cluster_id: {
+            "pattern": cluster.template,
+            "frequency": cluster.size,
+            "percentage": cluster.size / total_errors * 100 if total_errors else 0.0,
+            "examples": list(cluster.examples),
+            "first_seen": cluster.first_seen.isoformat() if cluster.first_seen else None,
+            "last_seen": cluster.last_seen.isoformat() if cluster.last_seen else None,
+        }
+        for cluster in miner.get_clusters()
+    }
 
 
 def calculate_log_statistics(log_entries: list, metrics: list) -> dict:
@@ -158,7 +192,7 @@ class LogsAnalyzer:
         self._log_ingestion = log_ingestion
 
         # Initialize BigQuery client for log queries and storage
-        self._bigquery_client = BigQueryClient()
+        self._bigquery_client = create_bigquery_client()
 
         # Initialize error pattern cache
         self._error_pattern_cache = {}
@@ -166,6 +200,12 @@ class LogsAnalyzer:
         # Set up text vectorizer for pattern analysis
         self._vectorizer = text.TfidfVectorizer()
 
+        # Load the persisted template tree if available so template ids stay stable across restarts
+        self._template_state_path = self._config.get("template_state_path")
+        self._template_miner = LogTemplateMiner.load(
+            self._template_state_path, self._config.get("template_miner", {})
+        )
+
         # Load cached error patterns if available
         # Log successful initialization
         logger.info("LogsAnalyzer initialized")
@@ -294,13 +334,61 @@ class LogsAnalyzer:
         Returns:
             Detected anomalies
         """
-        # Analyze log volume patterns over time
-        # Detect unusual spikes or drops in log frequency
-        # Identify unusual error patterns or new error types
-        # Detect changes in log content distribution
-        # Create AnomalyRecord objects for detected anomalies
-        # Return list of log-based anomalies
-        return []
+        detection_parameters = detection_parameters or {}
+        processed_before = self._template_miner.total_messages
+
+        # Feed entries into the resident template miner and score the templates they touched
+        findings = detect_template_anomalies(
+            self._template_miner,
+            ((entry.get("message", ""), get_log_entry_timestamp(entry)) for entry in log_entries),
+            z_threshold=detection_parameters.get("z_threshold", DEFAULT_SPIKE_Z_THRESHOLD),
+            min_count=detection_parameters.get("min_count", DEFAULT_SPIKE_MIN_COUNT),
+            new_pattern_min_count=detection_parameters.get("new_pattern_min_count", DEFAULT_NEW_PATTERN_MIN_COUNT)
+        )
+        anomalies = [
+            self._create_log_anomaly(finding["cluster"], finding["anomaly_type"], finding["anomaly_score"],
+                                     finding["value"], finding["expected_value"], finding["timestamp"])
+            for finding in findings
+        ]
+
+        # Persist the template tree so counts survive restarts
+        if self._template_state_path and self._template_miner.total_messages > processed_before:
+            self._template_miner.save(self._template_state_path)
+
+        return anomalies
+
+    def _create_log_anomaly(self, cluster, anomaly_type: str, anomaly_score: float, value: float,
+                            expected_value: float, timestamp: datetime.datetime) -> AnomalyRecord:
+        """Creates an AnomalyRecord for a log template
+
+        Args:
+            cluster: Template cluster the anomaly refers to
+            anomaly_type: Type of log anomaly
+            anomaly_score: Normalized anomaly score between 0 and 1
+            value: Observed message count
+            expected_value: Expected message count
+            timestamp: Time of the anomalous bucket
+
+        Returns:
+            AnomalyRecord describing the anomaly
+        """
+        anomaly = AnomalyRecord(
+            anomaly_id=str(uuid.uuid4()),
+            metric_name=f"log_template:{cluster.cluster_id}",
+            anomaly_type=anomaly_type,
+            anomaly_score=anomaly_score,
+            value=value,
+            expected_value=expected_value,
+            timestamp=timestamp,
+        )
+        anomaly.severity = AlertSeverity.HIGH if anomaly_score >= 0.9 else AlertSeverity.MEDIUM
+        anomaly.context = {
+            "template_id": cluster.cluster_id,
+            "template": cluster.template,
+            "examples": list(cluster.examples),
+            "total_occurrences": cluster.size,
+        }
+        return anomaly
 
     def query_logs(self, query_parameters: dict, limit: int) -> list:
         """Queries logs based on specified criteria
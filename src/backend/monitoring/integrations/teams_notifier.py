@@ -13,9 +13,9 @@ import requests
 import datetime
 from typing import Dict, List, Any, Optional, Union
 
-from backend.constants import AlertSeverity, NotificationChannel
-from backend.config import get_config
-from backend.logging_config import get_logger
+from ...constants import AlertSeverity
+from ...config import get_config
+from ...utils.logging.logger import get_logger
 
 # Initialize module logger
 logger = get_logger(__name__)
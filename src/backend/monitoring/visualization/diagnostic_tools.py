@@ -21,7 +21,7 @@ from src.backend.monitoring.integrations.cloud_monitoring import CloudMonitoring
 from src.backend.monitoring.integrations.logs_analyzer import LogsAnalyzer  # internal
 from src.backend.monitoring.analyzers.metric_processor import MetricProcessor  # internal
 from src.backend.monitoring.analyzers.anomaly_detector import AnomalyDetector  # internal
-from src.backend.utils.storage.bigquery_client import BigQueryClient  # internal
+from src.backend.utils.storage.bigquery_client import BigQueryClient, create_bigquery_client  # internal
 from src.backend.db.repositories.execution_repository import ExecutionRepository  # internal
 
 # Initialize logger
@@ -279,7 +279,7 @@ class DiagnosticTools:
         self._logs_analyzer = logs_analyzer or LogsAnalyzer()
         self._metric_processor = metric_processor or MetricProcessor()
         self._anomaly_detector = anomaly_detector or AnomalyDetector()
-        self._bigquery_client = bigquery_client or BigQueryClient()
+        self._bigquery_client = bigquery_client or create_bigquery_client()
         self._execution_repository = execution_repository or ExecutionRepository(bq_client=self._bigquery_client)
 
         # Set up diagnostic parameters based on configuration
@@ -590,7 +590,7 @@ class PerformanceAnalyzer:
         # Store references to provided clients or create new instances if not provided
         self._monitoring_client = monitoring_client or CloudMonitoringClient()
         self._metric_processor = metric_processor or MetricProcessor()
-        self._bigquery_client = bigquery_client or BigQueryClient()
+        self._bigquery_client = bigquery_client or create_bigquery_client()
 
     def analyze_performance_metrics(self, component_id: str, start_time: datetime.datetime, end_time: datetime.datetime, analysis_options: dict = None) -> dict:
         """Analyzes performance metrics for a component or pipeline
@@ -691,7 +691,7 @@ class ImpactAnalyzer:
 
         # Store references to provided repositories or create new instances if not provided
         self._execution_repository = execution_repository or ExecutionRepository(bq_client=bigquery_client)
-        self._bigquery_client = bigquery_client or BigQueryClient()
+        self._bigquery_client = bigquery_client or create_bigquery_client()
 
     def analyze_failure_impact(self, component_id: str, analysis_options: dict = None) -> dict:
         """Analyzes the impact of a component failure
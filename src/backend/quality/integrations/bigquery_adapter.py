@@ -297,7 +297,7 @@ class BigQueryAdapter:
         self._config = config or {}
 
         # Create BigQueryClient for executing queries
-        self._bq_client = bigquery_client.BigQueryClient()
+        self._bq_client = bigquery_client.create_bigquery_client()
 
         # Initialize query cache dictionary
         self._query_cache = {}
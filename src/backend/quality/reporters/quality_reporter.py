@@ -27,7 +27,7 @@ from src.backend.quality.engines.validation_engine import ValidationResult, Vali
 from src.backend.quality.engines.quality_scorer import QualityScore  # ../engines/quality_scorer
 from src.backend.quality.reporters.issue_detector import QualityIssue, IssueDetector  # ./issue_detector
 from src.backend.utils.monitoring.metric_client import MetricClient, METRIC_KIND_GAUGE, VALUE_TYPE_DOUBLE  # ../../utils/monitoring/metric_client
-from src.backend.utils.storage.bigquery_client import BigQueryClient  # ../../utils/storage/bigquery_client
+from src.backend.utils.storage.bigquery_client import create_bigquery_client  # ../../utils/storage/bigquery_client
 from src.backend.utils.storage.gcs_client import GCSClient  # ../../utils/storage/gcs_client
 
 # Initialize logger
@@ -181,7 +181,7 @@ class BigQueryDestination(QualityReportDestination):
         self._table = self._config.get("table")
 
         # Initialize BigQueryClient
-        self._bq_client = BigQueryClient()
+        self._bq_client = create_bigquery_client()
 
         # Ensure dataset and table exist
         self._ensure_dataset_and_table_exist()
@@ -229,7 +229,7 @@ class BigQueryDestination(QualityReportDestination):
 
         # Verify BigQuery client can be initialized
         try:
-            BigQueryClient()
+            create_bigquery_client()
         except Exception as e:
             logger.error(f"Error initializing BigQuery client: {str(e)}")
             return False
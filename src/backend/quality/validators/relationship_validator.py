@@ -17,7 +17,7 @@ from src.backend.quality.engines import validation_engine  # ./validation_engine
 from src.backend.quality.engines.execution_engine import ExecutionContext  # ../engines/execution_engine
 from src.backend.quality.integrations.great_expectations_adapter import GreatExpectationsAdapter  # ../integrations/great_expectations_adapter
 from src.backend.quality.integrations.bigquery_adapter import BigQueryAdapter  # ../integrations/bigquery_adapter
-from src.backend.utils.storage.bigquery_client import BigQueryClient  # ../../utils/storage/bigquery_client.py
+from src.backend.utils.storage.bigquery_client import BigQueryClient, create_bigquery_client  # ../../utils/storage/bigquery_client.py
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -153,7 +153,7 @@ class RelationshipValidator:
         self._bq_adapter = BigQueryAdapter(self._config)
 
         # Create BigQueryClient for cross-table validation operations
-        self._bq_client = BigQueryClient()
+        self._bq_client = create_bigquery_client()
 
         # Initialize validator properties
         logger.info("RelationshipValidator initialized")
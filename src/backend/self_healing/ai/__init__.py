@@ -10,6 +10,9 @@ from src.backend.self_healing.ai import issue_classifier  # Import issue classif
 from src.backend.self_healing.ai import root_cause_analyzer  # Import root cause analysis capabilities
 from src.backend.self_healing.ai import pattern_recognizer  # Import pattern recognition capabilities
 from src.backend.self_healing.ai import predictive_analyzer  # Import predictive analysis capabilities
+from src.backend.self_healing.ai import feature_vectorizer  # Import compiled feature vectorization
+from src.backend.self_healing.ai import causality_graph  # Import the incremental causality graph
+from src.backend.self_healing.ai import series_forecaster  # Import vectorized multi-series forecasting
 
 # Import logging utility for AI module
 from src.backend.utils.logging import logger as logging_util  # Configure logging for the AI module
@@ -30,6 +33,9 @@ Pattern = pattern_recognizer.Pattern  # Represent a recognized pattern of issues
 PatternRecognizer = pattern_recognizer.PatternRecognizer  # Recognize patterns in issues and failures for self-healing
 Prediction = predictive_analyzer.Prediction  # Represent a predicted potential issue or failure
 PredictiveAnalyzer = predictive_analyzer.PredictiveAnalyzer  # Predict potential issues and failures in the pipeline
+HashedFeatureVectorizer = feature_vectorizer.HashedFeatureVectorizer  # Encode batches of issues into dense feature matrices
+CausalityGraph = causality_graph.CausalityGraph  # Link recent events causally with cached ancestor indexes
+SeriesForecaster = series_forecaster.SeriesForecaster  # Fit and forecast trend and seasonality of many series at once
 
 # Export utility functions for external use
 extract_features_from_error = issue_classifier.extract_features_from_error  # Extract features from error data for classification
@@ -37,6 +43,7 @@ calculate_confidence_score = issue_classifier.calculate_confidence_score  # Calc
 map_to_healing_action = issue_classifier.map_to_healing_action  # Map issue types to appropriate healing actions
 serialize_classification = issue_classifier.serialize_classification  # Serialize classification to JSON format
 deserialize_classification = issue_classifier.deserialize_classification  # Deserialize classification from JSON format
+normalize_error_signature = feature_vectorizer.normalize_error_signature  # Normalize error messages to signatures shared by repeats
 
 extract_causal_features = root_cause_analyzer.extract_causal_features  # Extract features from issue data for causality analysis
 build_causality_graph = root_cause_analyzer.build_causality_graph  # Build a graph representing causal relationships between events
@@ -0,0 +1,407 @@
+"""
+Incremental, time-windowed causality graph for root cause analysis.
+
+Events (pipeline failures, quality issues, system alerts) are ingested as they arrive and
+linked to the events that caused them, either explicitly through their "caused_by" IDs or
+through lineage: an event of a component that depends on another component is linked to the
+latest event of that component. Events older than the window expire.
+
+Queries never rebuild the graph. The ancestor index of an event (every ancestor within the
+maximum depth, with its distance in hops) is computed from the indexes of its parents and
+cached. Adding an edge or expiring an event only invalidates the cached indexes of the
+events downstream of the change, so "candidate root causes of X" and "common ancestors of
+A..N" are answered from the cache in the common case.
+"""
+
+import datetime
+import heapq
+import threading
+import typing
+
+import networkx as nx  # version 3.1.x
+
+from src.backend.utils.logging.logger import get_logger  # Configure logging for the causality graph
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_WINDOW_MINUTES = 240
+DEFAULT_HOP_DECAY = 0.8
+
+# Event fields holding the event ID, timestamp, explicit causes and lineage, in order of preference
+EVENT_ID_FIELDS = ["event_id", "issue_id", "id"]
+TIMESTAMP_FIELDS = ["timestamp", "detected_at", "created_at", "event_time"]
+CAUSE_FIELDS = ["caused_by", "parent_ids", "related_event_ids"]
+
+
+def _to_seconds(value: typing.Any) -> float:
+    """Convert a datetime, ISO string or epoch seconds to epoch seconds"""
+    if value is None:
+        return datetime.datetime.now(datetime.timezone.utc).timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+def _first(event: dict, fields: typing.List[str]) -> typing.Any:
+    """Get the first present value of the fields"""
+    return next((event[field] for field in fields if event.get(field) is not None), None)
+
+
+class CausalityGraph:
+    """Long-lived causal DAG of recent events with cached ancestor indexes"""
+
+    def __init__(self, window_minutes: typing.Optional[float] = DEFAULT_WINDOW_MINUTES,
+                 max_depth: typing.Optional[int] = None, hop_decay: float = DEFAULT_HOP_DECAY):
+        """Initialize an empty graph
+
+        Args:
+            window_minutes (float): Age after which events expire; None keeps every event
+            max_depth (int): Maximum hops between an event and the ancestors indexed for it; None for no limit
+            hop_decay (float): Confidence factor applied per hop between a cause and an event
+        """
+        self.window_seconds = None if window_minutes is None else window_minutes * 60.0
+        self.max_depth = max_depth
+        self.hop_decay = hop_decay
+        self._parents: typing.Dict[str, typing.Set[str]] = {}
+        self._children: typing.Dict[str, typing.Set[str]] = {}
+        self._timestamps: typing.Dict[str, float] = {}
+        self._attributes: typing.Dict[str, dict] = {}
+        self._expiry: typing.List[typing.Tuple[float, str]] = []
+        self._latest_by_component: typing.Dict[str, str] = {}
+        self._components: typing.Dict[str, str] = {}
+        self._ancestor_cache: typing.Dict[str, typing.Dict[str, int]] = {}
+        self._lock = threading.RLock()
+        self._latest_time = None
+        self._stats = {"events": 0, "edges": 0, "expired": 0, "cache_hits": 0, "cache_misses": 0,
+                       "invalidations": 0, "rejected_edges": 0}
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._timestamps
+
+    def add_event(self, event_id: str, timestamp: typing.Any = None, causes: typing.Iterable[str] = (),
+                  component: str = None, depends_on: typing.Iterable[str] = (), attributes: dict = None) -> bool:
+        """Add an event and its causal edges
+
+        Args:
+            event_id (str): Unique event ID
+            timestamp (Any): Event time (datetime, ISO string or epoch seconds); defaults to now
+            causes (Iterable[str]): IDs of events that caused this event
+            component (str): Component (dataset, table, task) the event occurred in
+            depends_on (Iterable[str]): Components whose latest event is treated as a cause
+            attributes (dict): Event data returned with query results
+
+        Returns:
+            bool: True if the event was added, False if it was already present or has expired
+        """
+        seconds = _to_seconds(timestamp)
+        with self._lock:
+            self._advance(seconds)
+            if event_id in self._timestamps or self._is_expired(seconds):
+                return False
+            self._timestamps[event_id] = seconds
+            self._parents[event_id] = set()
+            self._children[event_id] = set()
+            self._attributes[event_id] = attributes or {}
+            heapq.heappush(self._expiry, (seconds, event_id))
+            self._stats["events"] += 1
+
+            for cause in causes or ():
+                self._link(cause, event_id)
+            for dependency in depends_on or ():
+                cause = self._latest_by_component.get(dependency)
+                if cause is not None:
+                    self._link(cause, event_id)
+            if component is not None:
+                self._components[event_id] = component
+                latest = self._latest_by_component.get(component)
+                if latest is None or self._timestamps.get(latest, float("-inf")) <= seconds:
+                    self._latest_by_component[component] = event_id
+            return True
+
+    def ingest(self, event: dict) -> typing.Optional[str]:
+        """Add an event given as a dictionary
+
+        Args:
+            event (dict): Event with an ID field (event_id, issue_id or id), a timestamp field,
+                optional caused_by IDs, and optional component and depends_on lineage
+
+        Returns:
+            str: ID of the event, or None if it has no ID
+        """
+        event_id = _first(event, EVENT_ID_FIELDS)
+        if event_id is None:
+            return None
+        causes = _first(event, CAUSE_FIELDS) or ()
+        if isinstance(causes, str):
+            causes = [causes]
+        depends_on = event.get("depends_on") or ()
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        self.add_event(str(event_id), _first(event, TIMESTAMP_FIELDS), causes=[str(cause) for cause in causes],
+                       component=event.get("component"), depends_on=depends_on, attributes=event)
+        return str(event_id)
+
+    def ingest_many(self, events: typing.Iterable[dict]) -> int:
+        """Add events in order
+
+        Args:
+            events (Iterable[dict]): Events as accepted by ingest
+
+        Returns:
+            int: Number of events with an ID
+        """
+        return sum(self.ingest(event) is not None for event in events)
+
+    def add_edge(self, cause_id: str, effect_id: str) -> bool:
+        """Link two events already in the graph
+
+        Args:
+            cause_id (str): ID of the causing event
+            effect_id (str): ID of the resulting event
+
+        Returns:
+            bool: True if the edge was added
+        """
+        with self._lock:
+            return self._link(cause_id, effect_id)
+
+    def expire(self, now: typing.Any = None) -> int:
+        """Remove events older than the window
+
+        Args:
+            now (Any): Current time; defaults to the latest event time seen
+
+        Returns:
+            int: Number of expired events
+        """
+        with self._lock:
+            if now is not None:
+                self._latest_time = max(self._latest_time or float("-inf"), _to_seconds(now))
+            return self._expire()
+
+    def get_ancestors(self, event_id: str) -> typing.Dict[str, int]:
+        """Get the ancestors of an event within the maximum depth
+
+        Args:
+            event_id (str): Event ID
+
+        Returns:
+            dict: Ancestor ID to distance in hops; empty for unknown events
+        """
+        with self._lock:
+            if event_id not in self._timestamps:
+                return {}
+            return dict(self._ancestor_index(event_id))
+
+    def candidate_root_causes(self, event_id: str, limit: int = None) -> typing.List[dict]:
+        """Get the most upstream ancestors of an event, ranked by confidence
+
+        Candidates are ancestors without causes of their own in the graph, and ancestors at
+        the maximum depth, whose causes are not indexed.
+
+        Args:
+            event_id (str): Event ID
+            limit (int): Maximum number of candidates
+
+        Returns:
+            list: Candidates with event_id, hops, timestamp, confidence and attributes
+        """
+        with self._lock:
+            if event_id not in self._timestamps:
+                return []
+            index = self._ancestor_index(event_id)
+            candidates = [
+                self._describe(ancestor, hops)
+                for ancestor, hops in index.items()
+                if not self._parents[ancestor] or (self.max_depth is not None and hops == self.max_depth)
+            ]
+        candidates.sort(key=lambda candidate: (-candidate["confidence"], candidate["timestamp"], candidate["event_id"]))
+        return candidates[:limit] if limit else candidates
+
+    def common_ancestors(self, event_ids: typing.Iterable[str], limit: int = None) -> typing.List[dict]:
+        """Get the ancestors shared by every given event, nearest first
+
+        Args:
+            event_ids (Iterable[str]): Event IDs; unknown IDs are ignored
+            limit (int): Maximum number of ancestors
+
+        Returns:
+            list: Common ancestors with event_id, hops (largest distance to any event),
+                total_hops, is_root, timestamp, confidence and attributes
+        """
+        with self._lock:
+            indexes = [self._ancestor_index(event_id) for event_id in dict.fromkeys(event_ids)
+                       if event_id in self._timestamps]
+            if not indexes:
+                return []
+            indexes.sort(key=len)
+            shared = set(indexes[0])
+            for index in indexes[1:]:
+                shared.intersection_update(index)
+                if not shared:
+                    return []
+            results = []
+            for ancestor in shared:
+                distances = [index[ancestor] for index in indexes]
+                result = self._describe(ancestor, max(distances))
+                result["total_hops"] = sum(distances)
+                result["is_root"] = not self._parents[ancestor]
+                results.append(result)
+        results.sort(key=lambda result: (result["hops"], result["total_hops"], result["timestamp"], result["event_id"]))
+        return results[:limit] if limit else results
+
+    def to_networkx(self, event_ids: typing.Iterable[str] = None) -> nx.DiGraph:
+        """Export the graph, or the events and ancestors of the given events, to networkx
+
+        Args:
+            event_ids (Iterable[str]): Events whose ancestry to export; all events when omitted
+
+        Returns:
+            networkx.DiGraph: Graph with cause -> effect edges and event attributes on nodes
+        """
+        with self._lock:
+            if event_ids is None:
+                nodes = set(self._timestamps)
+            else:
+                nodes = set()
+                for event_id in event_ids:
+                    if event_id in self._timestamps:
+                        nodes.add(event_id)
+                        nodes.update(self._ancestor_index(event_id))
+            graph = nx.DiGraph()
+            for node in nodes:
+                graph.add_node(node, **{**self._attributes[node], "timestamp": self._timestamps[node]})
+            for node in nodes:
+                for parent in self._parents[node]:
+                    if parent in nodes:
+                        graph.add_edge(parent, node)
+        return graph
+
+    def get_stats(self) -> dict:
+        """Get graph size and cache counters
+
+        Returns:
+            dict: Events and edges ingested, events expired and live, cached indexes, cache
+                hits and misses, invalidated indexes and rejected edges
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["live_events"] = len(self._timestamps)
+            stats["cached_indexes"] = len(self._ancestor_cache)
+        return stats
+
+    def _link(self, cause_id: str, effect_id: str) -> bool:
+        """Add a cause -> effect edge and invalidate the indexes it changes; caller holds the lock"""
+        if cause_id not in self._timestamps or effect_id not in self._timestamps or cause_id == effect_id:
+            return False
+        if cause_id in self._parents[effect_id]:
+            return False
+        # Causes cannot follow their effects, and an edge between simultaneous events must not close a cycle
+        cause_time, effect_time = self._timestamps[cause_id], self._timestamps[effect_id]
+        if cause_time > effect_time or (cause_time == effect_time and effect_id in self._ancestor_index(cause_id)):
+            self._stats["rejected_edges"] += 1
+            return False
+        self._parents[effect_id].add(cause_id)
+        self._children[cause_id].add(effect_id)
+        self._stats["edges"] += 1
+        self._invalidate_downstream(effect_id)
+        return True
+
+    def _ancestor_index(self, event_id: str) -> typing.Dict[str, int]:
+        """Get the cached ancestor index of an event, computing missing indexes bottom-up; caller holds the lock"""
+        cached = self._ancestor_cache.get(event_id)
+        if cached is not None:
+            self._stats["cache_hits"] += 1
+            return cached
+        self._stats["cache_misses"] += 1
+        stack = [event_id]
+        while stack:
+            current = stack[-1]
+            if current in self._ancestor_cache:
+                stack.pop()
+                continue
+            missing = [parent for parent in self._parents[current] if parent not in self._ancestor_cache]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            index = {}
+            for parent in self._parents[current]:
+                index[parent] = 1
+            for parent in self._parents[current]:
+                for ancestor, hops in self._ancestor_cache[parent].items():
+                    hops += 1
+                    if (self.max_depth is None or hops <= self.max_depth) and hops < index.get(ancestor, hops + 1):
+                        index[ancestor] = hops
+            self._ancestor_cache[current] = index
+        return self._ancestor_cache[event_id]
+
+    def _invalidate_downstream(self, event_id: str) -> None:
+        """Drop the cached indexes of an event and every event that indexes it; caller holds the lock"""
+        pending = [(event_id, 0)]
+        seen = {event_id}
+        while pending:
+            current, depth = pending.pop()
+            if self._ancestor_cache.pop(current, None) is not None:
+                self._stats["invalidations"] += 1
+            # Events beyond the maximum depth do not index the changed event
+            if self.max_depth is not None and depth >= self.max_depth:
+                continue
+            for child in self._children.get(current, ()):
+                if child not in seen:
+                    seen.add(child)
+                    pending.append((child, depth + 1))
+
+    def _advance(self, seconds: float) -> None:
+        """Move the window forward to an event time and expire old events; caller holds the lock"""
+        if self._latest_time is None or seconds > self._latest_time:
+            self._latest_time = seconds
+            self._expire()
+
+    def _is_expired(self, seconds: float) -> bool:
+        """Check whether an event time lies before the window"""
+        return self.window_seconds is not None and seconds < self._latest_time - self.window_seconds
+
+    def _expire(self) -> int:
+        """Remove events before the window; caller holds the lock"""
+        if self.window_seconds is None or self._latest_time is None:
+            return 0
+        cutoff = self._latest_time - self.window_seconds
+        expired = 0
+        while self._expiry and self._expiry[0][0] < cutoff:
+            _, event_id = heapq.heappop(self._expiry)
+            if event_id not in self._timestamps:
+                continue
+            # Only events downstream of the expired event lose an ancestor
+            self._invalidate_downstream(event_id)
+            for child in self._children.pop(event_id):
+                self._parents[child].discard(event_id)
+            for parent in self._parents.pop(event_id):
+                self._children[parent].discard(event_id)
+            del self._timestamps[event_id]
+            del self._attributes[event_id]
+            component = self._components.pop(event_id, None)
+            if component is not None and self._latest_by_component.get(component) == event_id:
+                del self._latest_by_component[component]
+            expired += 1
+        self._stats["expired"] += expired
+        return expired
+
+    def _describe(self, event_id: str, hops: int) -> dict:
+        """Build the query result entry of an event"""
+        return {
+            "event_id": event_id,
+            "hops": hops,
+            "timestamp": datetime.datetime.fromtimestamp(self._timestamps[event_id], datetime.timezone.utc).isoformat(),
+            "confidence": self.hop_decay ** (hops - 1),
+            "attributes": self._attributes[event_id]
+        }
@@ -0,0 +1,390 @@
+"""
+Compiled, cached feature vectorizer for the self-healing AI models.
+
+A feature spec lists the issue fields a model consumes and how each one is encoded:
+
+- text: the value is normalized to an error signature, tokenized and hashed into a fixed
+  number of buckets (the hashing trick), so high-cardinality strings such as error messages
+  and table names need no vocabulary
+- categorical: the whole value is hashed into a fixed number of buckets
+- numeric: the value is copied as a float
+
+The spec is compiled once into column offsets, and whole batches of issues are encoded into
+one dense NumPy matrix. Hashed encodings are memoized on the raw values and on the
+normalized signature, so a storm of near-identical failures pays the regex and hashing work
+only once.
+"""
+
+import collections
+import re
+import threading
+import typing
+import zlib
+
+import numpy as np  # version 1.24.x
+
+from src.backend.utils.logging.logger import get_logger  # Internal import
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Feature types
+FEATURE_TYPE_TEXT = "text"
+FEATURE_TYPE_CATEGORICAL = "categorical"
+FEATURE_TYPE_NUMERIC = "numeric"
+FEATURE_TYPES = (FEATURE_TYPE_TEXT, FEATURE_TYPE_CATEGORICAL, FEATURE_TYPE_NUMERIC)
+
+# Default settings
+DEFAULT_TEXT_BUCKETS = 1024
+DEFAULT_CATEGORICAL_BUCKETS = 64
+DEFAULT_CACHE_SIZE = 4096
+
+# Feature spec of the issue classifier, matching the fields of extract_features_from_error
+ISSUE_FEATURE_SPEC = [
+    {"name": "error_message", "type": FEATURE_TYPE_TEXT, "buckets": 1024},
+    {"name": "stack_trace", "type": FEATURE_TYPE_TEXT, "buckets": 512},
+    {"name": "pipeline", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 64},
+    {"name": "task", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 64},
+    {"name": "dataset", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 128},
+    {"name": "environment", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 8}
+]
+
+# Feature spec of the root cause analyzer, matching the fields of extract_causal_features
+CAUSAL_FEATURE_SPEC = [
+    {"name": "error_message", "type": FEATURE_TYPE_TEXT, "buckets": 1024},
+    {"name": "stack_trace", "type": FEATURE_TYPE_TEXT, "buckets": 512},
+    {"name": "table", "type": FEATURE_TYPE_TEXT, "buckets": 128},
+    {"name": "pipeline", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 64},
+    {"name": "task", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 64},
+    {"name": "dataset", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 128},
+    {"name": "environment", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 8},
+    {"name": "hour_of_day", "type": FEATURE_TYPE_NUMERIC},
+    {"name": "related_event_count", "type": FEATURE_TYPE_NUMERIC},
+    {"name": "resources.cpu_utilization", "type": FEATURE_TYPE_NUMERIC},
+    {"name": "resources.memory_utilization", "type": FEATURE_TYPE_NUMERIC}
+]
+
+# Volatile parts of error messages replaced by placeholders in the signature, in order
+SIGNATURE_PATTERNS = [
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"), " <uuid> "),
+    (re.compile(r"\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:z|[+-]\d{2}:?\d{2})?"), " <ts> "),
+    (re.compile(r"\b0x[0-9a-f]+\b|\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{8,}\b"), " <hex> "),
+    (re.compile(r"\d+(?:\.\d+)?"), " <num> "),
+    (re.compile(r"\s+"), " ")
+]
+TOKEN_PATTERN = re.compile(r"<[a-z]+>|[a-z_][a-z0-9_]*")
+
+
+def normalize_error_signature(message: str) -> str:
+    """
+    Normalize an error message to a signature shared by repeats of the same failure
+
+    Args:
+        message: Raw error message
+
+    Returns:
+        Lowercase message with IDs, timestamps, hex values and numbers replaced by placeholders
+    """
+    signature = str(message).lower()
+    for pattern, replacement in SIGNATURE_PATTERNS:
+        signature = pattern.sub(replacement, signature)
+    return signature.strip()
+
+
+def _lookup(issue: dict, path: typing.Tuple[str, ...]) -> typing.Any:
+    """
+    Get a possibly nested value of an issue
+
+    Args:
+        issue: Issue data
+        path: Keys leading to the value
+
+    Returns:
+        Value, or None if any key is missing
+    """
+    value = issue
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _hash_token(field: str, token: str) -> int:
+    """
+    Stable 32-bit hash of a field token, identical across processes
+
+    Args:
+        field: Name of the feature the token belongs to
+        token: Token or categorical value
+
+    Returns:
+        Unsigned 32-bit hash
+    """
+    return zlib.crc32(f"{field}\x00{token}".encode("utf-8"))
+
+
+class _CompiledField:
+    """
+    Feature spec entry with its resolved column range
+    """
+    __slots__ = ("name", "path", "type", "buckets", "offset")
+
+    def __init__(self, name: str, feature_type: str, buckets: int, offset: int):
+        self.name = name
+        self.path = tuple(name.split("."))
+        self.type = feature_type
+        self.buckets = buckets
+        self.offset = offset
+
+
+class HashedFeatureVectorizer:
+    """
+    Encodes batches of issues into dense feature matrices from a compiled feature spec
+    """
+
+    def __init__(self, feature_spec: typing.List[dict] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Compile a feature spec
+
+        Args:
+            feature_spec: List of {"name", "type", "buckets"} entries; names may be dotted paths
+                into nested dictionaries, and buckets is ignored for numeric features
+            cache_size: Maximum number of memoized encodings; 0 disables memoization
+        """
+        self._hashed_fields = []
+        self._numeric_fields = []
+        offset = 0
+        for entry in feature_spec or ISSUE_FEATURE_SPEC:
+            name = entry.get("name")
+            feature_type = entry.get("type")
+            if not name:
+                raise ValueError(f"Feature spec entry without a name: {entry}")
+            if feature_type not in FEATURE_TYPES:
+                raise ValueError(f"Unknown type '{feature_type}' for feature {name}; expected one of {FEATURE_TYPES}")
+            if feature_type == FEATURE_TYPE_NUMERIC:
+                self._numeric_fields.append(_CompiledField(name, feature_type, 1, 0))
+                continue
+            default_buckets = DEFAULT_TEXT_BUCKETS if feature_type == FEATURE_TYPE_TEXT else DEFAULT_CATEGORICAL_BUCKETS
+            buckets = int(entry.get("buckets", default_buckets))
+            if buckets < 1:
+                raise ValueError(f"Feature {name} needs at least one bucket")
+            self._hashed_fields.append(_CompiledField(name, feature_type, buckets, offset))
+            offset += buckets
+
+        # Numeric columns follow the hashed blocks
+        self._numeric_offset = offset
+        for index, field in enumerate(self._numeric_fields):
+            field.offset = offset + index
+        self._dimension = offset + len(self._numeric_fields)
+
+        self._cache_size = max(0, cache_size)
+        self._raw_cache: "collections.OrderedDict[tuple, tuple]" = collections.OrderedDict()
+        self._signature_cache: "collections.OrderedDict[tuple, tuple]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"raw_hits": 0, "signature_hits": 0, "misses": 0}
+
+    @property
+    def dimension(self) -> int:
+        """Number of columns of the encoded matrix"""
+        return self._dimension
+
+    def get_feature_ranges(self) -> typing.Dict[str, typing.Tuple[int, int]]:
+        """
+        Get the column range of every feature
+
+        Returns:
+            Dictionary mapping feature name to (start, end) column indexes
+        """
+        return {field.name: (field.offset, field.offset + field.buckets)
+                for field in self._hashed_fields + self._numeric_fields}
+
+    def transform(self, issues: typing.Sequence[dict]) -> np.ndarray:
+        """
+        Encode a batch of issues
+
+        Args:
+            issues: Issue data dictionaries
+
+        Returns:
+            float32 matrix with one row per issue and `dimension` columns
+        """
+        matrix = np.zeros((len(issues), self._dimension), dtype=np.float32)
+        if not len(issues):
+            return matrix
+
+        if self._hashed_fields:
+            encodings = [self._encode_hashed(issue) for issue in issues]
+            lengths = [len(columns) for columns, _ in encodings]
+            if sum(lengths):
+                rows = np.repeat(np.arange(len(issues)), lengths)
+                matrix[rows, np.concatenate([columns for columns, _ in encodings])] = \
+                    np.concatenate([values for _, values in encodings])
+
+        if self._numeric_fields:
+            matrix[:, self._numeric_offset:] = [[self._numeric_value(_lookup(issue, field.path))
+                                                 for field in self._numeric_fields] for issue in issues]
+        return matrix
+
+    def transform_one(self, issue: dict) -> np.ndarray:
+        """
+        Encode a single issue
+
+        Args:
+            issue: Issue data dictionary
+
+        Returns:
+            float32 vector with `dimension` entries
+        """
+        return self.transform([issue])[0]
+
+    def get_stats(self) -> dict:
+        """
+        Get memoization statistics
+
+        Returns:
+            Dictionary with raw and signature cache hits, misses, hit rate and cache sizes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached_raw"] = len(self._raw_cache)
+            stats["cached_signatures"] = len(self._signature_cache)
+        lookups = stats["raw_hits"] + stats["signature_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["raw_hits"] + stats["signature_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear_cache(self):
+        """
+        Drop all memoized encodings
+        """
+        with self._lock:
+            self._raw_cache.clear()
+            self._signature_cache.clear()
+
+    def _encode_hashed(self, issue: dict) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode the hashed features of an issue, memoized on raw values and on the signature
+
+        Args:
+            issue: Issue data dictionary
+
+        Returns:
+            Tuple of column indexes and values of the non-zero hashed features
+        """
+        raw = tuple(_lookup(issue, field.path) for field in self._hashed_fields)
+        try:
+            hash(raw)
+            raw_key = raw
+        except TypeError:
+            # Unhashable values are stringified before being memoized
+            raw_key = tuple(None if value is None else str(value) for value in raw)
+
+        if self._cache_size:
+            with self._lock:
+                encoding = self._raw_cache.get(raw_key)
+                if encoding is not None:
+                    self._raw_cache.move_to_end(raw_key)
+                    self._stats["raw_hits"] += 1
+                    return encoding
+
+        signature = tuple(self._normalize(field, value) for field, value in zip(self._hashed_fields, raw))
+        if self._cache_size:
+            with self._lock:
+                encoding = self._signature_cache.get(signature)
+                if encoding is not None:
+                    self._signature_cache.move_to_end(signature)
+                    self._stats["signature_hits"] += 1
+                    self._remember(self._raw_cache, raw_key, encoding)
+                    return encoding
+
+        encoding = self._encode_signature(signature)
+        if self._cache_size:
+            with self._lock:
+                self._stats["misses"] += 1
+                self._remember(self._signature_cache, signature, encoding)
+                self._remember(self._raw_cache, raw_key, encoding)
+        return encoding
+
+    def _encode_signature(self, signature: tuple) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Hash normalized field values into column indexes and values
+
+        Args:
+            signature: Normalized value of every hashed field
+
+        Returns:
+            Tuple of sorted column indexes and their values
+        """
+        columns = {}
+        for field, value in zip(self._hashed_fields, signature):
+            if not value:
+                continue
+            if field.type == FEATURE_TYPE_CATEGORICAL:
+                columns[field.offset + _hash_token(field.name, value) % field.buckets] = 1.0
+                continue
+
+            # Signed term counts; the sign bit keeps colliding tokens from only adding up
+            counts = {}
+            for token in TOKEN_PATTERN.findall(value):
+                hashed = _hash_token(field.name, token)
+                column = field.offset + hashed % field.buckets
+                counts[column] = counts.get(column, 0.0) + (-1.0 if hashed & 0x80000000 else 1.0)
+            norm = sum(count * count for count in counts.values()) ** 0.5
+            if norm:
+                for column, count in counts.items():
+                    if count:
+                        columns[column] = count / norm
+
+        ordered = sorted(columns)
+        return (np.fromiter(ordered, dtype=np.int64, count=len(ordered)),
+                np.fromiter((columns[column] for column in ordered), dtype=np.float32, count=len(ordered)))
+
+    def _remember(self, cache: collections.OrderedDict, key: tuple, encoding: tuple):
+        """
+        Store an encoding in an LRU cache; caller holds the lock
+
+        Args:
+            cache: Cache to store into
+            key: Cache key
+            encoding: Encoded features
+        """
+        cache[key] = encoding
+        cache.move_to_end(key)
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _normalize(field: _CompiledField, value: typing.Any) -> str:
+        """
+        Normalize a hashed field value
+
+        Args:
+            field: Compiled field
+            value: Raw value
+
+        Returns:
+            Error signature for text fields, lowercase stripped string for categorical fields
+        """
+        if value is None:
+            return ""
+        if field.type == FEATURE_TYPE_TEXT:
+            return normalize_error_signature(value)
+        return str(value).strip().lower()
+
+    @staticmethod
+    def _numeric_value(value: typing.Any) -> float:
+        """
+        Convert a numeric field value, mapping missing or non-numeric values to 0.0
+
+        Args:
+            value: Raw value
+
+        Returns:
+            Float value
+        """
+        if isinstance(value, (list, tuple, set, dict)):
+            return float(len(value))
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
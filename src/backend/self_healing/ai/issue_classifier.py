@@ -22,6 +22,8 @@ from src.backend.utils.logging import logger  # Configure logging for issue clas
 from src.backend.utils.ml import model_utils  # Load and manage ML models for issue classification
 from src.backend.utils.ml import vertex_client  # Interact with Vertex AI for model predictions
 from src.backend.self_healing.config import healing_config  # Access self-healing configuration settings
+from src.backend.self_healing.models.model_pool import get_model_pool  # Share loaded models across the process
+from src.backend.self_healing.ai.feature_vectorizer import HashedFeatureVectorizer, ISSUE_FEATURE_SPEC, DEFAULT_CACHE_SIZE  # Encode issues into model input arrays
 from src.backend.db.models import issue_pattern  # Access issue pattern data from the database
 
 # Initialize logger
@@ -30,6 +32,8 @@ logger = logger.get_logger(__name__)
 # Define global constants
 DEFAULT_CONFIDENCE_THRESHOLD = 0.75
 DEFAULT_MODEL_PATH = model_utils.DEFAULT_MODEL_DIR
+MODEL_NAME = "issue_classifier"
+HISTORICAL_ACCURACY = {"data_quality": 0.8, "pipeline": 0.7}  # Example values
 ISSUE_CATEGORIES = {"data_quality": ["missing_values", "outliers", "format_errors", "schema_drift", "data_corruption", "referential_integrity"], "pipeline": ["resource_exhaustion", "timeout", "dependency_failure", "configuration_error", "permission_error", "service_unavailable"]}
 ACTION_MAPPING = {"missing_values": constants.HealingActionType.DATA_CORRECTION, "outliers": constants.HealingActionType.DATA_CORRECTION, "format_errors": constants.HealingActionType.DATA_CORRECTION, "schema_drift": constants.HealingActionType.SCHEMA_EVOLUTION, "data_corruption": constants.HealingActionType.DATA_CORRECTION, "referential_integrity": constants.HealingActionType.DATA_CORRECTION, "resource_exhaustion": constants.HealingActionType.RESOURCE_SCALING, "timeout": constants.HealingActionType.PARAMETER_ADJUSTMENT, "dependency_failure": constants.HealingActionType.DEPENDENCY_RESOLUTION, "configuration_error": constants.HealingActionType.PARAMETER_ADJUSTMENT, "permission_error": constants.HealingActionType.DEPENDENCY_RESOLUTION, "service_unavailable": constants.HealingActionType.PIPELINE_RETRY}
 
@@ -348,9 +352,13 @@ class IssueClassifier:
         self._confidence_threshold = healing_config.get_confidence_threshold()
         # Determine whether to use local model or Vertex AI
         self._use_vertex_ai = self._config.get("use_vertex_ai", False)
-        # If using local model, load the model
+        self._model_override = None
+        # Compile the model's feature spec once; encodings are memoized across issues
+        self._vectorizer = HashedFeatureVectorizer(self._config.get("feature_spec", ISSUE_FEATURE_SPEC),
+                                                   cache_size=self._config.get("feature_cache_size", DEFAULT_CACHE_SIZE))
+        # If using local model, load the model into the shared pool
         if not self._use_vertex_ai:
-            self._model = self._load_model(self._config.get("model_version"))
+            self._load_model(self._config.get("model_version"))
         # If using Vertex AI, initialize client and get endpoint ID
         else:
             self._vertex_client = vertex_client.VertexAIClient()
@@ -376,6 +384,46 @@ class IssueClassifier:
         else:
             category, issue_type, confidence, description = self.classify_pipeline_issue(issue_data)
 
+        return self._create_classification(issue_data, features, category, issue_type, confidence, description)
+
+    def classify_issues(self, issue_list: list) -> list:
+        """Classify a batch of issues, encoding them together for one call of the local model
+
+        Args:
+            issue_list (list): issue_list
+
+        Returns:
+            list: IssueClassification for each issue, in input order
+        """
+        features_list = [extract_features_from_error(issue_data) for issue_data in issue_list]
+        if self._use_vertex_ai:
+            predictions = [self._predict_with_vertex(features) for features in features_list]
+        else:
+            predictions = self._predict_batch_with_local_model(features_list)
+
+        classifications = []
+        for issue_data, features, prediction in zip(issue_list, features_list, predictions):
+            category = "data_quality" if "data_quality" in issue_data else "pipeline"
+            category, issue_type, confidence, description = self._interpret_prediction(category, prediction, features)
+            classifications.append(
+                self._create_classification(issue_data, features, category, issue_type, confidence, description))
+        return classifications
+
+    def _create_classification(self, issue_data: dict, features: dict, category: str, issue_type: str,
+                               confidence: float, description: str) -> IssueClassification:
+        """Create and record the classification of an issue
+
+        Args:
+            issue_data (dict): issue_data
+            features (dict): features
+            category (str): category
+            issue_type (str): issue_type
+            confidence (float): confidence
+            description (str): description
+
+        Returns:
+            IssueClassification: Classification result
+        """
         # Map issue type to a healing action
         recommended_action = map_to_healing_action(category, issue_type)
 
@@ -423,19 +471,8 @@ class IssueClassifier:
         else:
             prediction = self._predict_with_local_model(model_input)
 
-        # Process prediction results
-        issue_type = prediction.get("issue_type", "unknown")
-        category = "data_quality"
-
-        # Calculate confidence score
-        error_context = {"historical_accuracy": 0.8}  # Example value
-        confidence = calculate_confidence_score(prediction, error_context)
-
-        # Generate human-readable description
-        description = self._generate_description(category, issue_type, features)
-
         # Return classification details
-        return category, issue_type, confidence, description
+        return self._interpret_prediction("data_quality", prediction, features)
 
     def classify_pipeline_issue(self, pipeline_issue_data: dict) -> typing.Tuple[str, str, float, str]:
         """Classify a pipeline execution issue
@@ -458,18 +495,30 @@ class IssueClassifier:
         else:
             prediction = self._predict_with_local_model(model_input)
 
+        # Return classification details
+        return self._interpret_prediction("pipeline", prediction, features)
+
+    def _interpret_prediction(self, category: str, prediction: dict, features: dict) -> typing.Tuple[str, str, float, str]:
+        """Turn a model prediction into classification details
+
+        Args:
+            category (str): category
+            prediction (dict): prediction
+            features (dict): features
+
+        Returns:
+            typing.Tuple[str, str, float, str]: (category, type, confidence, description)
+        """
         # Process prediction results
         issue_type = prediction.get("issue_type", "unknown")
-        category = "pipeline"
 
         # Calculate confidence score
-        error_context = {"historical_accuracy": 0.7}  # Example value
+        error_context = {"historical_accuracy": HISTORICAL_ACCURACY[category]}
         confidence = calculate_confidence_score(prediction, error_context)
 
         # Generate human-readable description
         description = self._generate_description(category, issue_type, features)
 
-        # Return classification details
         return category, issue_type, confidence, description
 
     def get_classification_history(self, filters: dict = None) -> list:
@@ -485,6 +534,17 @@ class IssueClassifier:
         # Return filtered or all classification history
         return list(self._classification_history.values())
 
+    def vectorize_issues(self, issue_list: list) -> np.ndarray:
+        """Encode a batch of issues into the local model's input features
+
+        Args:
+            issue_list (list): Issue data or extracted feature dictionaries
+
+        Returns:
+            np.ndarray: Matrix with one row of features per issue
+        """
+        return self._vectorizer.transform(issue_list)
+
     def set_confidence_threshold(self, threshold: float) -> None:
         """Set the confidence threshold for classifications
 
@@ -497,6 +557,19 @@ class IssueClassifier:
         # Set _confidence_threshold to specified value
         self._confidence_threshold = threshold
 
+    @property
+    def _model(self) -> object:
+        """Model used for local predictions: the instance shared through the model pool unless overridden"""
+        if self._model_override is not None:
+            return self._model_override
+        if self._use_vertex_ai:
+            return None
+        return get_model_pool(self._config).get_active(MODEL_NAME)
+
+    @_model.setter
+    def _model(self, model: object) -> None:
+        self._model_override = model
+
     def reload_model(self, model_version: str = None) -> bool:
         """Reload the classification model, optionally with a specific version
 
@@ -506,11 +579,11 @@ class IssueClassifier:
         Returns:
             bool: True if model loaded successfully
         """
-        # If using local model, unload current model if loaded
+        # Load specified model version or latest if not specified; the pool swaps it in
+        # atomically once loaded, for every analyzer sharing it
         if not self._use_vertex_ai:
-            self._model = None
-        # Load specified model version or latest if not specified
-        self._model = self._load_model(model_version)
+            self._model_override = None
+            self._load_model(model_version)
         # If using Vertex AI, update endpoint ID if needed
         if self._use_vertex_ai:
             self._endpoint_id = self._config.get("vertex_endpoint_id")
@@ -526,16 +599,35 @@ class IssueClassifier:
         Returns:
             dict: Prediction results
         """
+        return self._predict_batch_with_local_model([features])[0]
+
+    def _predict_batch_with_local_model(self, features_list: list) -> list:
+        """Make predictions for several issues with one call of the local model
+
+        Args:
+            features_list (list): features_list
+
+        Returns:
+            list: Prediction results, one per issue
+        """
         # Validate model is loaded
-        if not self._model:
+        model = self._model
+        if not model:
             raise ValueError("Local model not loaded")
-        # Prepare features for model input
-        model_input = features
+        # Prepare features for model input, one row per issue
+        model_input = self.vectorize_issues(features_list)
         # Run prediction with local model
-        prediction = {"issue_type": "unknown", "probability": 0.5}  # Placeholder
-        # Format prediction results
-        # Return prediction dictionary
-        return prediction
+        outputs = np.asarray(model.predict(model_input), dtype=float).reshape(len(features_list), -1)
+        # Format prediction results: the most probable of the classes the model was trained on
+        classes = self._config.get("model_classes") or []
+        predictions = []
+        for scores in outputs:
+            index = int(np.argmax(scores))
+            predictions.append({
+                "issue_type": classes[index] if index < len(classes) else "unknown",
+                "probability": float(scores[index])
+            })
+        return predictions
 
     def _predict_with_vertex(self, features: dict) -> dict:
         """Make a prediction using Vertex AI
@@ -565,13 +657,15 @@ class IssueClassifier:
         Returns:
             object: Loaded model object
         """
+        pool = get_model_pool(self._config)
+        if model_version is None and pool.get_active_version(MODEL_NAME) is not None:
+            # ModelManager already activated the registry's version under the registry model ID
+            return pool.get_active(MODEL_NAME)
+        version = model_version or "latest"
         # Determine model path based on version
-        model_path = model_utils.create_model_path("issue_classifier", model_version)
-        # Load model using model_utils.load_model
-        model = model_utils.load_model(model_path)
-        # Initialize model parameters
-        # Return loaded model
-        return model
+        model_path = model_utils.create_model_path(MODEL_NAME, version)
+        # Load through the shared pool so every analyzer instance uses one loaded copy
+        return pool.activate(MODEL_NAME, version, model_path)
 
     def _determine_severity(self, issue_category: str, issue_type: str, confidence: float, context: dict) -> constants.AlertSeverity:
         """Determine severity level for an issue
@@ -6,10 +6,13 @@ data quality issues, and resource exhaustion before they occur, enabling proacti
 
 import typing
 import datetime
+import math
+import threading
 import uuid
 import json
 
 import numpy as np  # version 1.24.x
+import pandas as pd  # version 2.0.x
 from sklearn.feature_extraction import text  # scikit-learn 1.2.x
 from sklearn.metrics import pairwise  # scikit-learn 1.2.x
 
@@ -20,6 +23,8 @@ from src.backend.utils.logging.logger import get_logger  # Configure logging for
 from src.backend.utils.ml import model_utils  # Load and manage ML models for pattern recognition
 from src.backend.utils.ml import vertex_client  # Interact with Vertex AI for model predictions
 from src.backend.self_healing.config import healing_config  # Access self-healing configuration settings
+from src.backend.self_healing.models.model_pool import get_model_pool  # Share loaded models across the process
+from src.backend.self_healing.ai.series_forecaster import SeriesForecaster, align_series, series_statistics, solve_statistics, to_epoch_seconds  # Fit and forecast many series at once
 from src.backend.db.models import pipeline_metric  # Access pipeline metrics for prediction analysis
 from src.backend.db.models import PipelineMetric, MetricCategory  # Access pipeline metrics for prediction analysis
 from src.backend.db.repositories import metrics_repository  # Retrieve metrics data for prediction analysis
@@ -36,9 +41,51 @@ DEFAULT_PREDICTION_HORIZON = 24
 # Default path for the pattern recognizer model
 DEFAULT_MODEL_PATH = "os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'models', 'predictive_analyzer')"
 
+# Name of the prediction model in the shared model pool
+MODEL_NAME = "predictive_analyzer"
+
 # Supported prediction types
 PREDICTION_TYPES = ["pipeline_failure", "data_quality", "resource_exhaustion", "performance_degradation"]
 
+# Forecast settings per prediction type: the metric forecast, the label identifying the entity,
+# and the threshold the metric must not cross in the given direction. Resource metrics are
+# named after the resource type. Settings can be overridden through config["forecast_settings"].
+FORECAST_SETTINGS = {
+    "pipeline_failure": {"metric_name": "success_rate", "entity_type": "pipeline", "label": "pipeline_id",
+                         "threshold": 0.9, "direction": "below"},
+    "data_quality": {"metric_name": "quality_score", "entity_type": "dataset", "label": "dataset_id",
+                     "threshold": 0.9, "direction": "below"},
+    "resource_exhaustion": {"metric_name": "{resource_type}_utilization", "entity_type": "resource", "label": "resource_id",
+                            "threshold": 90.0, "direction": "above"},
+    "performance_degradation": {"metric_name": "duration_seconds", "entity_type": "pipeline", "label": "pipeline_id",
+                                "threshold": 3600.0, "direction": "above"}
+}
+
+# Default forecast grid: hourly steps, daily seasonality and two weeks of history
+DEFAULT_FORECAST_RESOLUTION_SECONDS = 3600
+DEFAULT_SEASON_LENGTH = 24
+DEFAULT_LOOKBACK_HOURS = 14 * 24
+
+# Seasonal cycles checked by extract_seasonal_patterns, in hourly steps
+SEASONAL_CYCLES = {"daily": 24, "weekly": 168}
+
+# Absolute t statistic above which a trend is considered significant
+TREND_SIGNIFICANCE_T = 2.0
+
+# Healing action recommended per prediction type
+PREDICTION_HEALING_ACTIONS = {
+    "pipeline_failure": HealingActionType.PIPELINE_RETRY,
+    "data_quality": HealingActionType.DATA_CORRECTION,
+    "resource_exhaustion": HealingActionType.RESOURCE_SCALING,
+    "performance_degradation": HealingActionType.PARAMETER_ADJUSTMENT
+}
+
+# Hours before a predicted event within which it is considered imminent
+IMMINENT_HOURS = 6
+
+# Maximum number of predictions kept in the history
+MAX_PREDICTION_HISTORY = 10000
+
 
 def preprocess_time_series_data(time_series_data: 'pandas.DataFrame', prediction_type: str, preprocessing_params: dict) -> 'pandas.DataFrame':
     """Preprocesses time series data for prediction models
@@ -51,15 +98,58 @@ def preprocess_time_series_data(time_series_data: 'pandas.DataFrame', prediction
     Returns:
         pandas.DataFrame: Preprocessed time series data ready for prediction
     """
-    # Validate time_series_data has required columns
-    # Handle missing values through interpolation or imputation
-    # Normalize/standardize numerical features
-    # Apply feature engineering specific to prediction_type
+    params = preprocessing_params or {}
+    timestamp_column = params.get("timestamp_column", "timestamp")
+    value_column = params.get("value_column", "value")
+    resolution_seconds = params.get("resolution_seconds", DEFAULT_FORECAST_RESOLUTION_SECONDS)
+    season_length = params.get("season_length", DEFAULT_SEASON_LENGTH)
+
+    # Validate time_series_data has required columns; repository series are indexed by timestamp
+    frame = time_series_data if timestamp_column in time_series_data.columns else time_series_data.reset_index()
+    if timestamp_column not in frame.columns or value_column not in frame.columns:
+        raise ValueError(f"Time series data requires '{timestamp_column}' and '{value_column}' columns")
+    if frame.empty:
+        return pd.DataFrame(columns=[timestamp_column, value_column])
+
+    # Align points onto the step grid, averaging points within a step
+    origin = _grid_origin(frame[timestamp_column], resolution_seconds)
+    _, steps, matrix = align_series({value_column: (frame[timestamp_column].to_numpy(), frame[value_column].to_numpy())},
+                                    resolution_seconds, origin)
+    # Decompose into trend and seasonality in closed form
+    solution = solve_statistics(series_statistics(matrix, steps, season_length))
+    trend = solution["intercept"][0] + solution["slope"][0] * steps
+    seasonal = solution["seasonal"][0][steps % season_length]
+
+    # Fill short gaps by carrying the last value forward
+    values = pd.Series(matrix[0]).ffill(limit=params.get("max_gap_steps", 3)).to_numpy()
+    result = pd.DataFrame({
+        timestamp_column: pd.to_datetime(origin + steps * resolution_seconds, unit="s"),
+        value_column: values,
+        "trend": trend,
+        "seasonal": seasonal,
+        "residual": values - trend - seasonal
+    })
+    if params.get("normalize"):
+        spread = np.nanstd(values)
+        result[f"{value_column}_normalized"] = (values - np.nanmean(values)) / (spread if spread > 0 else 1.0)
+
+    # Distance to the threshold of the prediction type, positive while the metric is healthy
+    settings = FORECAST_SETTINGS.get(prediction_type)
+    if settings:
+        threshold = params.get("threshold", settings["threshold"])
+        result["threshold_margin"] = (values - threshold) if settings["direction"] == "below" else (threshold - values)
+
     # Create lagged features for time series analysis
-    # Handle categorical variables through encoding
-    # Apply dimensionality reduction if needed
-    # Return preprocessed DataFrame
-    pass
+    for lag in params.get("lags", []):
+        result[f"{value_column}_lag_{lag}"] = result[value_column].shift(lag)
+    return result
+
+
+def _grid_origin(timestamps: typing.Any, resolution_seconds: float) -> float:
+    """Get the start of the day (or of the step, for longer steps) containing the earliest timestamp"""
+    earliest = float(np.nanmin(to_epoch_seconds(np.asarray(timestamps))))
+    alignment = max(86400.0, float(resolution_seconds))
+    return math.floor(earliest / alignment) * alignment
 
 
 def calculate_prediction_confidence(model_output: dict, context: dict) -> float:
@@ -122,13 +212,40 @@ def extract_seasonal_patterns(time_series_data: 'pandas.DataFrame', timestamp_co
     Returns:
         dict: Seasonal pattern information
     """
-    # Convert timestamp column to datetime if needed
-    # Extract time components (hour, day, week, month)
-    # Analyze patterns by time component
-    # Detect daily, weekly, and monthly seasonality
-    # Calculate seasonal indices
-    # Return dictionary with seasonal pattern information
-    pass
+    frame = time_series_data[[timestamp_column, value_column]].dropna()
+    result = {"cycles": {}, "dominant_cycle": None, "data_points": len(frame)}
+    if frame.empty:
+        return result
+
+    # Align onto an hourly grid starting at midnight UTC, so daily phases are hours of the day
+    origin = _grid_origin(frame[timestamp_column], DEFAULT_FORECAST_RESOLUTION_SECONDS)
+    _, steps, matrix = align_series({value_column: (frame[timestamp_column].to_numpy(), frame[value_column].to_numpy())},
+                                    DEFAULT_FORECAST_RESOLUTION_SECONDS, origin)
+    result["phase_start"] = pd.Timestamp(origin, unit="s").isoformat()
+    best_strength = 0.0
+    for name, length in SEASONAL_CYCLES.items():
+        # A cycle needs two full repetitions before its indices mean anything
+        if len(steps) < 2 * length:
+            continue
+        statistics = series_statistics(matrix, steps, length)
+        solution = solve_statistics(statistics)
+        indices = solution["seasonal"][0]
+        # Share of the detrended variance explained by the seasonal indices
+        seasonal_variance = float((statistics["phase_n"][0] * indices ** 2).sum() / statistics["n"][0])
+        residual_variance = float(solution["sigma"][0] ** 2) if np.isfinite(solution["sigma"][0]) else 0.0
+        total = seasonal_variance + residual_variance
+        strength = seasonal_variance / total if total > 0 else 0.0
+        result["cycles"][name] = {
+            "length": length,
+            "indices": indices.tolist(),
+            "strength": strength,
+            "peak_phase": int(np.argmax(indices)),
+            "trough_phase": int(np.argmin(indices))
+        }
+        if strength > best_strength:
+            best_strength = strength
+            result["dominant_cycle"] = name
+    return result
 
 
 def detect_trend(time_series_data: 'pandas.DataFrame', timestamp_column: str, value_column: str) -> dict:
@@ -142,12 +259,37 @@ def detect_trend(time_series_data: 'pandas.DataFrame', timestamp_column: str, va
     Returns:
         dict: Trend information
     """
-    # Sort data by timestamp
-    # Apply trend detection algorithm
-    # Calculate trend direction and magnitude
-    # Determine statistical significance of trend
-    # Return dictionary with trend information
-    pass
+    frame = time_series_data[[timestamp_column, value_column]].dropna()
+    if len(frame) < 3:
+        return {"direction": "unknown", "slope_per_hour": None, "relative_change": None, "r_squared": None,
+                "t_statistic": None, "significant": False, "data_points": len(frame)}
+
+    # Use a grid as fine as the typical spacing of the points, so points rarely share a step
+    seconds = np.sort(to_epoch_seconds(frame[timestamp_column].to_numpy()))
+    spacing = np.diff(seconds)
+    resolution_seconds = max(float(np.median(spacing[spacing > 0])) if (spacing > 0).any() else 1.0, 1.0)
+    origin = float(seconds[0])
+    _, steps, matrix = align_series({value_column: (frame[timestamp_column].to_numpy(), frame[value_column].to_numpy())},
+                                    resolution_seconds, origin)
+    solution = solve_statistics(series_statistics(matrix, steps, season_length=1))
+
+    slope_per_hour = float(solution["slope"][0] * 3600.0 / resolution_seconds)
+    t_statistic = float(solution["t_statistic"][0])
+    significant = bool(abs(t_statistic) >= TREND_SIGNIFICANCE_T)
+    mean = float(np.nanmean(matrix[0]))
+    span_hours = (seconds[-1] - seconds[0]) / 3600.0
+    direction = "stable"
+    if significant:
+        direction = "increasing" if slope_per_hour > 0 else "decreasing"
+    return {
+        "direction": direction,
+        "slope_per_hour": slope_per_hour,
+        "relative_change": float(slope_per_hour * span_hours / abs(mean)) if mean else None,
+        "r_squared": float(solution["r_squared"][0]),
+        "t_statistic": t_statistic,
+        "significant": significant,
+        "data_points": len(frame)
+    }
 
 
 class Prediction:
@@ -285,11 +427,25 @@ class PredictiveAnalyzer:
         self._prediction_horizon = config.get("prediction_horizon", DEFAULT_PREDICTION_HORIZON)
         self._use_vertex_ai = config.get("use_vertex_ai", False)
         self._endpoint_id = config.get("vertex_endpoint_id")
-        self._model = None
+        self._model_override = None
         if not self._use_vertex_ai:
-            self._model = self._load_model(config.get("model_version"))
+            self._load_model(config.get("model_version"))
         self._vertex_client = vertex_client.VertexAIClient()
         self._prediction_history = {}
+        # Forecast models per metric, kept current with update_series between sweeps
+        # The default metrics repository is created when history is first loaded
+        self._metrics_repository = config.get("metrics_repository")
+        overrides = config.get("forecast_settings") or {}
+        self._forecast_settings = {
+            prediction_type: {**settings, **overrides.get(prediction_type, {})}
+            for prediction_type, settings in FORECAST_SETTINGS.items()
+        }
+        self._forecast_resolution = config.get("forecast_resolution_seconds", DEFAULT_FORECAST_RESOLUTION_SECONDS)
+        self._season_length = config.get("forecast_season_length", DEFAULT_SEASON_LENGTH)
+        self._lookback_hours = config.get("forecast_lookback_hours", DEFAULT_LOOKBACK_HOURS)
+        self._forecast_half_life = config.get("forecast_half_life_steps")
+        self._forecasters: typing.Dict[str, SeriesForecaster] = {}
+        self._forecasters_lock = threading.Lock()
 
     def predict_pipeline_failures(self, pipeline_id: str, horizon_hours: int = None, min_confidence: float = None) -> list:
         """Predict potential pipeline failures
@@ -302,15 +458,8 @@ class PredictiveAnalyzer:
         Returns:
             list: List of Prediction objects for potential failures
         """
-        # Retrieve historical pipeline metrics
-        # Preprocess time series data for pipeline metrics
-        # Apply prediction model to preprocessed data
-        # Calculate confidence scores for predictions
-        # Filter predictions by minimum confidence threshold
-        # Create Prediction objects for each potential failure
-        # Store predictions in history
-        # Return list of predictions
-        pass
+        # Forecast the pipeline's success rate through the batch path
+        return self.predict_batch("pipeline_failure", [pipeline_id], horizon_hours=horizon_hours, min_confidence=min_confidence)
 
     def predict_data_quality_issues(self, dataset_id: str, horizon_hours: int = None, min_confidence: float = None) -> list:
         """Predict potential data quality issues
@@ -323,15 +472,8 @@ class PredictiveAnalyzer:
         Returns:
             list: List of Prediction objects for potential quality issues
         """
-        # Retrieve historical data quality metrics
-        # Preprocess time series data for quality metrics
-        # Apply prediction model to preprocessed data
-        # Calculate confidence scores for predictions
-        # Filter predictions by minimum confidence threshold
-        # Create Prediction objects for each potential issue
-        # Store predictions in history
-        # Return list of predictions
-        pass
+        # Forecast the dataset's quality score through the batch path
+        return self.predict_batch("data_quality", [dataset_id], horizon_hours=horizon_hours, min_confidence=min_confidence)
 
     def predict_resource_exhaustion(self, resource_id: str, resource_type: str, horizon_hours: int = None, min_confidence: float = None) -> list:
         """Predict potential resource exhaustion issues
@@ -345,15 +487,91 @@ class PredictiveAnalyzer:
         Returns:
             list: List of Prediction objects for potential resource issues
         """
-        # Retrieve historical resource utilization metrics
-        # Preprocess time series data for resource metrics
-        # Apply prediction model to preprocessed data
-        # Calculate confidence scores for predictions
-        # Filter predictions by minimum confidence threshold
-        # Create Prediction objects for each potential issue
-        # Store predictions in history
-        # Return list of predictions
-        pass
+        # Forecast the resource's utilization through the batch path
+        return self.predict_batch("resource_exhaustion", [resource_id], horizon_hours=horizon_hours,
+                                  min_confidence=min_confidence, resource_type=resource_type)
+
+    def predict_batch(self, prediction_type: str, entity_ids: list = None, series: dict = None, horizon_hours: int = None,
+                      min_confidence: float = None, thresholds: typing.Union[float, dict] = None,
+                      resource_type: str = None) -> list:
+        """Predict issues of one type for many entities at once
+
+        Series passed in, or loaded from the metrics repository for entities without model
+        state, are aligned into one matrix and fitted together. Entities with model state
+        are forecast from it, including points added through update_series since. The
+        horizon of every entity is evaluated at once, and only entities whose probability of
+        crossing the threshold reaches min_confidence produce a prediction.
+
+        Args:
+            prediction_type (str): One of PREDICTION_TYPES
+            entity_ids (list): Entities to predict for; all entities with model state when omitted
+            series (dict): Entity ID to (timestamps, values) history to fit before predicting
+            horizon_hours (int): Prediction horizon in hours
+            min_confidence (float): Minimum confidence threshold for predictions
+            thresholds (float or dict): Threshold for every entity, or per entity ID; defaults to
+                the threshold of the prediction type
+            resource_type (str): Resource type, for resource exhaustion predictions
+
+        Returns:
+            list: Prediction objects, most confident first
+        """
+        if prediction_type not in PREDICTION_TYPES:
+            raise ValueError(f"Invalid prediction type: {prediction_type}. Must be one of {PREDICTION_TYPES}")
+        settings = self._forecast_settings[prediction_type]
+        metric_name = settings["metric_name"].format(resource_type=resource_type or "resource")
+        forecaster = self._get_forecaster(metric_name)
+
+        # Fit the history of entities without model state in one pass
+        if series is None and entity_ids:
+            missing = [entity_id for entity_id in entity_ids if entity_id not in forecaster]
+            if missing:
+                series = self._load_series(metric_name, settings["label"], missing)
+        if series:
+            forecaster.fit(series)
+            if entity_ids is None:
+                entity_ids = list(series)
+
+        # Evaluate the horizon of every entity at once
+        horizon_hours = horizon_hours or self._prediction_horizon
+        min_confidence = self._confidence_threshold if min_confidence is None else min_confidence
+        horizon_steps = math.ceil(horizon_hours * 3600.0 / forecaster.step_seconds)
+        alerts = forecaster.predict_exceedance(settings["threshold"] if thresholds is None else thresholds, horizon_steps,
+                                               min_confidence, settings["direction"], entity_ids)
+
+        predictions = [self._create_forecast_prediction(prediction_type, metric_name, settings, alert, resource_type)
+                       for alert in alerts]
+        logger.info(f"Predicted {len(predictions)} {prediction_type} issues for "
+                    f"{len(entity_ids) if entity_ids is not None else len(forecaster)} entities")
+        return predictions
+
+    def update_series(self, prediction_type: str, entity_ids: typing.Union[str, list], timestamps: typing.Any,
+                      values: typing.Any, resource_type: str = None) -> int:
+        """Add new metric points to the forecast models without refitting
+
+        Args:
+            prediction_type (str): One of PREDICTION_TYPES
+            entity_ids (str or list): Entity ID of each point, or one ID for every point
+            timestamps (Any): Time of each point
+            values (Any): Value of each point
+            resource_type (str): Resource type, for resource exhaustion metrics
+
+        Returns:
+            int: Number of points added
+        """
+        if prediction_type not in PREDICTION_TYPES:
+            raise ValueError(f"Invalid prediction type: {prediction_type}. Must be one of {PREDICTION_TYPES}")
+        metric_name = self._forecast_settings[prediction_type]["metric_name"].format(resource_type=resource_type or "resource")
+        return self._get_forecaster(metric_name).update(entity_ids, timestamps, values)
+
+    def get_forecast_stats(self) -> dict:
+        """Get the size of the forecast models per metric
+
+        Returns:
+            dict: Metric name to forecaster statistics
+        """
+        with self._forecasters_lock:
+            forecasters = dict(self._forecasters)
+        return {metric_name: forecaster.get_stats() for metric_name, forecaster in forecasters.items()}
 
     def predict_based_on_patterns(self, pattern: "Pattern", context: dict) -> list:
         """Predict issues based on recognized patterns
@@ -413,13 +631,31 @@ class PredictiveAnalyzer:
         # Set _confidence_threshold to specified value
         pass
 
+    @property
+    def _model(self) -> object:
+        """Model used for local predictions: the instance shared through the model pool unless overridden"""
+        if self._model_override is not None:
+            return self._model_override
+        if self._use_vertex_ai:
+            return None
+        return get_model_pool(self._config).get_active(MODEL_NAME)
+
+    @_model.setter
+    def _model(self, model: object) -> None:
+        self._model_override = model
+
     def reload_model(self, model_version: str) -> bool:
         """Reload the prediction model, optionally with a specific version"""
-        # If using local model, unload current model if loaded
-        # Load specified model version or latest if not specified
+        # Load specified model version or latest if not specified; the pool swaps it in
+        # atomically once loaded, for every analyzer sharing it
+        if not self._use_vertex_ai:
+            self._model_override = None
+            self._load_model(model_version)
         # If using Vertex AI, update endpoint ID if needed
+        else:
+            self._endpoint_id = self._config.get("vertex_endpoint_id")
         # Return success status
-        pass
+        return True
 
     def _predict_with_local_model(self, features: dict) -> dict:
         """Make a prediction using the local model"""
@@ -440,41 +676,105 @@ class PredictiveAnalyzer:
 
     def _load_model(self, model_version: str) -> object:
         """Internal method to load the prediction model"""
+        pool = get_model_pool(self._config)
+        if model_version is None and pool.get_active_version(MODEL_NAME) is not None:
+            # ModelManager already activated the registry's version under the registry model ID
+            return pool.get_active(MODEL_NAME)
+        version = model_version or "latest"
         # Determine model path based on version
-        # Load model using model_utils.load_model
-        # Initialize model parameters
-        # Return loaded model
-        pass
+        model_path = model_utils.create_model_path(MODEL_NAME, version)
+        # Load through the shared pool so every analyzer instance uses one loaded copy
+        return pool.activate(MODEL_NAME, version, model_path)
 
     def _determine_severity(self, prediction_type: str, confidence: float, context: dict) -> AlertSeverity:
         """Determine severity level for a prediction"""
-        # Consider prediction type criticality
-        # Factor in confidence score
-        # Evaluate context for business impact
-        # Apply severity determination rules
-        # Return appropriate AlertSeverity enum value
-        pass
+        # Imminent, confident predictions of failures and exhaustion are critical
+        hours_until = (context or {}).get("hours_until")
+        imminent = hours_until is not None and hours_until <= IMMINENT_HOURS
+        if confidence >= 0.9 and imminent:
+            return AlertSeverity.CRITICAL if prediction_type in ("pipeline_failure", "resource_exhaustion") else AlertSeverity.HIGH
+        if confidence >= 0.9 or imminent:
+            return AlertSeverity.HIGH
+        if confidence >= 0.8:
+            return AlertSeverity.MEDIUM
+        return AlertSeverity.LOW
 
     def _determine_healing_action(self, prediction_type: str, context: dict) -> HealingActionType:
         """Determine appropriate healing action for a prediction"""
         # Map prediction_type to appropriate healing action
-        # Consider context for action refinement
-        # Apply business rules and constraints
-        # Return recommended HealingActionType
-        pass
+        return PREDICTION_HEALING_ACTIONS.get(prediction_type, HealingActionType.PARAMETER_ADJUSTMENT)
 
     def _generate_description(self, prediction_type: str, evidence: dict, predicted_time: datetime.datetime) -> str:
         """Generate a human-readable description for a prediction"""
-        # Select description template based on prediction_type
-        # Fill template with evidence details
-        # Include predicted time information
-        # Apply natural language generation if needed
-        # Return formatted description
-        pass
+        # Describe the forecast crossing of the metric
+        crossing = "drop below" if evidence.get("direction") == "below" else "exceed"
+        metric_name = evidence.get("metric_name", prediction_type)
+        return (f"{metric_name} of {evidence.get('entity_id')} is forecast to {crossing} {evidence.get('threshold'):g} "
+                f"around {predicted_time:%Y-%m-%d %H:%M} UTC "
+                f"({evidence.get('exceedance_probability', 0.0):.0%} probability, last value {evidence.get('last_value'):g})")
 
     def _update_prediction_history(self, prediction: Prediction) -> None:
         """Update the prediction history with a new prediction"""
         # Add prediction to history dictionary
-        # Trim history if it exceeds maximum size
-        # Update prediction statistics
-        pass
\ No newline at end of file
+        self._prediction_history[prediction.prediction_id] = prediction
+        # Trim history if it exceeds maximum size, dropping the oldest predictions
+        while len(self._prediction_history) > MAX_PREDICTION_HISTORY:
+            del self._prediction_history[next(iter(self._prediction_history))]
+
+    def _get_forecaster(self, metric_name: str) -> SeriesForecaster:
+        """Get the forecast models of a metric, creating them on first use"""
+        with self._forecasters_lock:
+            forecaster = self._forecasters.get(metric_name)
+            if forecaster is None:
+                forecaster = self._forecasters[metric_name] = SeriesForecaster(
+                    step_seconds=self._forecast_resolution,
+                    season_length=self._season_length,
+                    half_life_steps=self._forecast_half_life
+                )
+            return forecaster
+
+    def _load_series(self, metric_name: str, label: str, entity_ids: list) -> dict:
+        """Load the recent history of a metric for entities from the metrics repository in one grouped read"""
+        if self._metrics_repository is None:
+            self._metrics_repository = metrics_repository.MetricsRepository()
+        end_time = datetime.datetime.now()
+        start_time = end_time - datetime.timedelta(hours=self._lookback_hours)
+        frames = self._metrics_repository.get_metric_time_series_by_label(
+            metric_name, start_time, end_time, label, entity_ids,
+            aggregation="avg", resolution_seconds=int(self._forecast_resolution)
+        )
+        return {entity_id: (frame.index.to_numpy(), frame["value"].to_numpy(dtype=float))
+                for entity_id, frame in frames.items() if not frame.empty}
+
+    def _create_forecast_prediction(self, prediction_type: str, metric_name: str, settings: dict, alert: typing.Any,
+                                    resource_type: str = None) -> Prediction:
+        """Create and record the Prediction for a forecast threshold crossing"""
+        hours_until = alert.steps_ahead * self._forecast_resolution / 3600.0
+        evidence = {
+            "entity_id": alert.entity_id,
+            "metric_name": metric_name,
+            "threshold": alert.threshold,
+            "direction": settings["direction"],
+            "forecast_value": alert.forecast_value,
+            "last_value": alert.last_value,
+            "slope_per_hour": alert.slope * 3600.0 / self._forecast_resolution,
+            "hours_until": hours_until,
+            "exceedance_probability": alert.confidence
+        }
+        if resource_type:
+            evidence["resource_type"] = resource_type
+        context = {"hours_until": hours_until, "resource_type": resource_type}
+        prediction = Prediction(
+            prediction_id=None,
+            prediction_type=prediction_type,
+            entity_id=alert.entity_id,
+            entity_type=settings["entity_type"],
+            description=self._generate_description(prediction_type, evidence, alert.predicted_time),
+            confidence=alert.confidence,
+            evidence=evidence,
+            recommended_action=self._determine_healing_action(prediction_type, context),
+            severity=self._determine_severity(prediction_type, alert.confidence, context),
+            predicted_time=alert.predicted_time
+        )
+        self._update_prediction_history(prediction)
+        return prediction
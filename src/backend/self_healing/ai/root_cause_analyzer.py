@@ -23,6 +23,9 @@ from src.backend.utils.logging.logger import get_logger  # Configure logging for
 from src.backend.utils.ml import model_utils  # Load and manage ML models for root cause analysis
 from src.backend.utils.ml import vertex_client  # Interact with Vertex AI for model predictions
 from src.backend.self_healing.config import healing_config  # Access self-healing configuration settings
+from src.backend.self_healing.models.model_pool import get_model_pool  # Share loaded models across the process
+from src.backend.self_healing.ai.feature_vectorizer import HashedFeatureVectorizer, CAUSAL_FEATURE_SPEC, DEFAULT_CACHE_SIZE  # Encode issues into model input arrays
+from src.backend.self_healing.ai.causality_graph import CausalityGraph, DEFAULT_WINDOW_MINUTES  # Maintain causal links between recent events incrementally
 from src.backend.self_healing.ai import issue_classifier  # Use issue classification results for root cause analysis
 from src.backend.self_healing.ai import pattern_recognizer  # Use pattern recognition to assist in root cause analysis
 from src.backend.db.models import issue_pattern  # Access issue pattern data from the database
@@ -34,6 +37,7 @@ logger = get_logger(__name__)
 # Define global constants
 DEFAULT_CONFIDENCE_THRESHOLD = 0.75
 DEFAULT_MODEL_PATH = "os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'models', 'root_cause_analyzer')"
+MODEL_NAME = "root_cause_analyzer"
 CAUSE_CATEGORIES = {"data_quality": ["source_data_issue", "transformation_error", "schema_drift", "data_corruption", "validation_rule_mismatch"], "pipeline": ["resource_exhaustion", "dependency_failure", "configuration_error", "permission_error", "service_unavailable", "timeout"], "system": ["network_issue", "storage_issue", "compute_issue", "service_degradation", "quota_exceeded"]}
 CAUSALITY_GRAPH_DEPTH = 3
 
@@ -47,14 +51,31 @@ def extract_causal_features(issue_data: dict) -> dict:
     Returns:
         dict: Extracted causal features dictionary
     """
-    # Extract error messages and stack traces
-    # Extract component information (pipeline, task, dataset)
     # Extract temporal information (time of occurrence)
-    # Extract context information (environment, resources)
-    # Extract related events and metrics
-    # Extract historical patterns
-    # Return dictionary of extracted causal features
-    pass
+    timestamp = issue_data.get("timestamp") or datetime.datetime.now().isoformat()
+    try:
+        hour_of_day = datetime.datetime.fromisoformat(str(timestamp).replace("Z", "+00:00")).hour
+    except ValueError:
+        hour_of_day = 0
+
+    # Error messages, stack traces and table names are kept as raw text; the feature
+    # vectorizer normalizes and hashes them
+    related_events = issue_data.get("related_events") or []
+    return {
+        "error_message": issue_data.get("error_message", ""),
+        "stack_trace": issue_data.get("stack_trace", ""),
+        "table": issue_data.get("table", issue_data.get("table_name", "")),
+        "pipeline": issue_data.get("pipeline", ""),
+        "task": issue_data.get("task", ""),
+        "dataset": issue_data.get("dataset", ""),
+        "timestamp": timestamp,
+        "hour_of_day": hour_of_day,
+        "environment": issue_data.get("environment") or get_config().get_environment(),
+        "resources": issue_data.get("resources") or {},
+        "metrics": issue_data.get("metrics") or {},
+        "related_events": related_events,
+        "related_event_count": len(related_events)
+    }
 
 
 def build_causality_graph(issue_data: dict, related_events: list, max_depth: int) -> nx.DiGraph:
@@ -68,14 +89,12 @@ def build_causality_graph(issue_data: dict, related_events: list, max_depth: int
     Returns:
         networkx.DiGraph: Directed graph of causal relationships
     """
-    # Initialize directed graph
-    # Add main issue as root node
-    # Add related events as nodes
-    # Establish causal relationships between events
-    # Calculate edge weights based on causal strength
-    # Limit graph depth to max_depth
-    # Return the causality graph
-    pass
+    # Ingest related events, then the main issue, into a throwaway graph without expiry
+    graph = CausalityGraph(window_minutes=None, max_depth=max_depth)
+    graph.ingest_many(related_events or [])
+    issue_id = graph.ingest(issue_data)
+    # Return the main issue with its ancestors within max_depth
+    return graph.to_networkx([issue_id] if issue_id is not None else None)
 
 
 def calculate_cause_confidence(model_output: dict, issue_context: dict) -> float:
@@ -98,22 +117,29 @@ def calculate_cause_confidence(model_output: dict, issue_context: dict) -> float
     pass
 
 
-def find_common_causes(issue_list: list) -> list:
+def find_common_causes(issue_list: list, causality_graph: CausalityGraph = None) -> list:
     """Identifies common causes across multiple related issues
 
     Args:
         issue_list (list): issue_list
+        causality_graph (CausalityGraph): Graph already holding the issues and their events; when
+            omitted, one graph is built from the issues and their "related_events"
 
     Returns:
         list: List of common causes with confidence scores
     """
-    # Extract causal features from each issue
-    # Build individual causality graphs
-    # Merge graphs to find intersections
-    # Identify nodes with highest in-degree as potential common causes
-    # Calculate confidence for each potential common cause
-    # Return list of common causes sorted by confidence
-    pass
+    if causality_graph is None:
+        # Build a single graph for all issues instead of one graph per issue
+        causality_graph = CausalityGraph(window_minutes=None, max_depth=CAUSALITY_GRAPH_DEPTH)
+        for issue in issue_list:
+            causality_graph.ingest_many(issue.get("related_events") or [])
+        issue_ids = [causality_graph.ingest(issue) for issue in issue_list]
+    else:
+        issue_ids = [issue.get("event_id") or issue.get("issue_id") or issue.get("id") for issue in issue_list]
+        issue_ids = [str(issue_id) if issue_id is not None else None for issue_id in issue_ids]
+    # Common ancestors are returned nearest first; rank them by confidence
+    common_causes = causality_graph.common_ancestors([issue_id for issue_id in issue_ids if issue_id is not None])
+    return sorted(common_causes, key=lambda cause: -cause["confidence"])
 
 
 def serialize_root_cause_analysis(analysis: "RootCauseAnalysis") -> str:
@@ -374,9 +400,13 @@ class RootCauseAnalyzer:
         self._confidence_threshold = healing_config.get_confidence_threshold()
         # Determine whether to use local model or Vertex AI
         self._use_vertex_ai = self._config.get("use_vertex_ai", False)
-        # If using local model, load the model
+        self._model_override = None
+        # Compile the model's feature spec once; encodings are memoized across issues
+        self._vectorizer = HashedFeatureVectorizer(self._config.get("feature_spec", CAUSAL_FEATURE_SPEC),
+                                                   cache_size=self._config.get("feature_cache_size", DEFAULT_CACHE_SIZE))
+        # If using local model, load the model into the shared pool
         if not self._use_vertex_ai:
-            self._model = self._load_model(self._config.get("model_version"))
+            self._load_model(self._config.get("model_version"))
         # If using Vertex AI, initialize client and get endpoint ID
         else:
             self._vertex_client = vertex_client.VertexAIClient()
@@ -385,6 +415,11 @@ class RootCauseAnalyzer:
         self._healing_repository = healing_repository
         # Initialize empty dictionary for analysis history
         self._analysis_history = {}
+        # Keep one windowed causality graph for all issues; queries reuse its cached ancestor indexes
+        self._causality_graph = CausalityGraph(
+            window_minutes=self._config.get("causality_window_minutes", DEFAULT_WINDOW_MINUTES),
+            max_depth=self._config.get("causality_graph_depth", CAUSALITY_GRAPH_DEPTH)
+        )
         self.logger = get_logger(__name__)
 
     def analyze_issue(self, issue_data: dict, classification: issue_classifier.IssueClassification) -> "RootCauseAnalysis":
@@ -471,12 +506,68 @@ class RootCauseAnalyzer:
         Returns:
             RootCauseAnalysis: Combined root cause analysis
         """
-        # Analyze each issue individually
-        # Find common causes across issues using find_common_causes
-        # Build combined causality graph
-        # Create RootCauseAnalysis with common causes
-        # Return the combined analysis
-        pass
+        # Add the issues and their related events to the long-lived causality graph
+        issue_ids = []
+        for issue in issue_list:
+            self.ingest_events(issue.get("related_events") or [])
+            issue_id = self._causality_graph.ingest(issue)
+            if issue_id is not None:
+                issue_ids.append(issue_id)
+        # Find common causes across issues using find_common_causes on the shared graph
+        common_causes = find_common_causes(issue_list, self._causality_graph)
+        # Create RootCauseAnalysis with common causes and the combined causality graph
+        return RootCauseAnalysis(
+            analysis_id=str(uuid.uuid4()),
+            issue_id=issue_ids[0] if issue_ids else None,
+            issue_type="related_issues",
+            root_causes=common_causes,
+            causality_graph=self._causality_graph.to_networkx(issue_ids),
+            context={"issue_ids": issue_ids},
+            analysis_time=datetime.datetime.now()
+        )
+
+    def ingest_events(self, events: list) -> int:
+        """Add events to the long-lived causality graph
+
+        Args:
+            events (list): Events or issues with IDs, timestamps and causal links
+
+        Returns:
+            int: Number of events with an ID
+        """
+        return self._causality_graph.ingest_many(events)
+
+    def find_candidate_root_causes(self, issue_id: str, limit: int = None) -> list:
+        """Get candidate root causes of an issue already in the causality graph
+
+        Args:
+            issue_id (str): Issue or event ID
+            limit (int): Maximum number of candidates
+
+        Returns:
+            list: Candidate causes ranked by confidence
+        """
+        return self._causality_graph.candidate_root_causes(issue_id, limit=limit)
+
+    def find_common_ancestors(self, issue_ids: list, limit: int = None) -> list:
+        """Get the events shared by the ancestry of every issue, nearest first
+
+        Args:
+            issue_ids (list): Issue or event IDs
+            limit (int): Maximum number of ancestors
+
+        Returns:
+            list: Common ancestors with their distances and confidence
+        """
+        return self._causality_graph.common_ancestors(issue_ids, limit=limit)
+
+    def get_causality_graph(self) -> CausalityGraph:
+        """Get the long-lived causality graph
+
+        Returns:
+            CausalityGraph: Graph shared by all analyses of this analyzer
+        """
+        return self._causality_graph
 
     def get_analysis_by_id(self, analysis_id: str) -> "RootCauseAnalysis":
         """Get a previous analysis by its ID
@@ -504,6 +595,17 @@ class RootCauseAnalyzer:
         # Return filtered or all analysis history
         pass
 
+    def vectorize_issues(self, issue_list: list) -> np.ndarray:
+        """Encode a batch of issues into model input features
+
+        Args:
+            issue_list (list): Issue data dictionaries
+
+        Returns:
+            np.ndarray: Matrix with one row of causal features per issue
+        """
+        return self._vectorizer.transform([extract_causal_features(issue) for issue in issue_list])
+
     def set_confidence_threshold(self, threshold: float) -> None:
         """Set the confidence threshold for root causes
 
@@ -514,6 +616,19 @@ class RootCauseAnalyzer:
         # Set _confidence_threshold to specified value
         pass
 
+    @property
+    def _model(self) -> object:
+        """Model used for local predictions: the instance shared through the model pool unless overridden"""
+        if self._model_override is not None:
+            return self._model_override
+        if self._use_vertex_ai:
+            return None
+        return get_model_pool(self._config).get_active(MODEL_NAME)
+
+    @_model.setter
+    def _model(self, model: object) -> None:
+        self._model_override = model
+
     def reload_model(self, model_version: str) -> bool:
         """Reload the root cause analysis model
 
@@ -523,11 +638,16 @@ class RootCauseAnalyzer:
         Returns:
             bool: True if model loaded successfully
         """
-        # If using local model, unload current model if loaded
-        # Load specified model version or latest if not specified
+        # Load specified model version or latest if not specified; the pool swaps it in
+        # atomically once loaded, for every analyzer sharing it
+        if not self._use_vertex_ai:
+            self._model_override = None
+            self._load_model(model_version)
         # If using Vertex AI, update endpoint ID if needed
+        else:
+            self._endpoint_id = self._config.get("vertex_endpoint_id")
         # Return success status
-        pass
+        return True
 
     def _predict_with_local_model(self, features: dict) -> dict:
         """Make a prediction using the local model
@@ -569,11 +689,15 @@ class RootCauseAnalyzer:
         Returns:
             object: Loaded model object
         """
+        pool = get_model_pool(self._config)
+        if model_version is None and pool.get_active_version(MODEL_NAME) is not None:
+            # ModelManager already activated the registry's version under the registry model ID
+            return pool.get_active(MODEL_NAME)
+        version = model_version or "latest"
         # Determine model path based on version
-        # Load model using model_utils.load_model
-        # Initialize model parameters
-        # Return loaded model
-        pass
+        model_path = model_utils.create_model_path(MODEL_NAME, version)
+        # Load through the shared pool so every analyzer instance uses one loaded copy
+        return pool.activate(MODEL_NAME, version, model_path)
 
     def _get_related_events(self, issue_data: dict, time_window_minutes: int) -> list:
         """Retrieve events related to an issue for causality analysis
@@ -0,0 +1,628 @@
+"""
+Vectorized multi-series forecasting for predictive analysis.
+
+A prediction sweep covers thousands of pipelines, datasets and resources. Rather than fitting
+every series on its own in pandas, SeriesForecaster aligns all series onto one step grid as
+the rows of a NumPy matrix and keeps, per series, the sufficient statistics of a linear trend
+with a seasonal profile: weighted sums of x, y, x^2, xy and y^2 plus per-phase sums. From
+these, trend and seasonality of every series are solved in closed form at once:
+
+- slope and per-phase levels are the joint least squares fit, with the phase levels
+  eliminated from the normal equations,
+- the residual spread comes from the same sums, without revisiting the points.
+
+New points add to the statistics of their series, so models stay current without refitting,
+and an optional half-life down-weights old points. The forecast horizon is evaluated as one
+(series x steps) matrix of threshold-crossing probabilities, and only series whose
+probability reaches the minimum confidence produce an alert.
+"""
+
+import datetime
+import threading
+import typing
+
+import numpy as np  # version 1.24.x
+from scipy import special  # version 1.10.x
+
+from src.backend.utils.logging.logger import get_logger  # Configure logging for series forecasting
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_STEP_SECONDS = 3600
+DEFAULT_SEASON_LENGTH = 24
+DEFAULT_MIN_POINTS = 12
+
+# Observations a phase needs before its seasonal index is used
+MIN_PHASE_OBSERVATIONS = 2
+
+# Per-series sums kept as model state
+SCALAR_STATISTICS = ("n", "sx", "sxx", "sy", "sxy", "syy")
+PHASE_STATISTICS = ("phase_n", "phase_sx", "phase_sy")
+
+# Directions in which a series can cross its threshold
+CROSSING_DIRECTIONS = ["above", "below"]
+
+# Step marking series without points
+NO_STEP = np.iinfo(np.int64).min
+
+
+class ForecastAlert(typing.NamedTuple):
+    """Series forecast to cross its threshold within the horizon"""
+    entity_id: str
+    confidence: float
+    predicted_time: datetime.datetime
+    steps_ahead: int
+    forecast_value: float
+    threshold: float
+    slope: float
+    last_value: float
+
+
+def to_epoch_seconds(timestamps: typing.Any) -> np.ndarray:
+    """Convert timestamps to epoch seconds; naive datetimes are taken as UTC
+
+    Args:
+        timestamps (Any): Sequence of datetimes, pandas or numpy timestamps, or epoch seconds
+
+    Returns:
+        numpy.ndarray: Float epoch seconds
+    """
+    array = np.asarray(timestamps)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype("datetime64[ns]").astype(np.int64) / 1e9
+    if array.dtype == object:
+        seconds = []
+        for value in array.ravel():
+            if isinstance(value, datetime.datetime):
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=datetime.timezone.utc)
+                seconds.append(value.timestamp())
+            else:
+                seconds.append(float(value))
+        return np.array(seconds, dtype=float)
+    return array.astype(float)
+
+
+def from_epoch_seconds(seconds: float) -> datetime.datetime:
+    """Convert epoch seconds to a naive UTC datetime"""
+    return datetime.datetime.fromtimestamp(float(seconds), datetime.timezone.utc).replace(tzinfo=None)
+
+
+def align_series(series: typing.Mapping[str, tuple], step_seconds: float = DEFAULT_STEP_SECONDS, origin: float = 0.0,
+                 max_steps: int = None) -> typing.Tuple[typing.List[str], np.ndarray, np.ndarray]:
+    """Align series onto one step grid as the rows of a matrix
+
+    Points falling into the same step are averaged; steps without points are NaN.
+
+    Args:
+        series (Mapping): Entity ID to (timestamps, values)
+        step_seconds (float): Width of a grid step in seconds
+        origin (float): Epoch seconds of step 0
+        max_steps (int): Keep only the latest steps of the grid; None keeps every step
+
+    Returns:
+        tuple: Entity IDs, step index of each column, and the (series x steps) value matrix
+    """
+    entity_ids = list(series)
+    if not entity_ids:
+        return [], np.empty(0, dtype=np.int64), np.empty((0, 0))
+    rows, seconds, values = [], [], []
+    for row, entity_id in enumerate(entity_ids):
+        timestamps, series_values = series[entity_id]
+        series_seconds = to_epoch_seconds(timestamps)
+        rows.append(np.full(len(series_seconds), row, dtype=np.int64))
+        seconds.append(series_seconds)
+        values.append(np.asarray(series_values, dtype=float))
+    steps, matrix = align_points(len(entity_ids), np.concatenate(rows), np.concatenate(seconds), np.concatenate(values),
+                                 step_seconds, origin, max_steps)
+    return entity_ids, steps, matrix
+
+
+def align_points(series_count: int, rows: np.ndarray, seconds: np.ndarray, values: np.ndarray,
+                 step_seconds: float = DEFAULT_STEP_SECONDS, origin: float = 0.0,
+                 max_steps: int = None) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Align points given as flat arrays onto one step grid as the rows of a matrix
+
+    Args:
+        series_count (int): Number of series (matrix rows)
+        rows (numpy.ndarray): Row of each point; negative rows are skipped
+        seconds (numpy.ndarray): Epoch seconds of each point
+        values (numpy.ndarray): Value of each point
+        step_seconds (float): Width of a grid step in seconds
+        origin (float): Epoch seconds of step 0
+        max_steps (int): Keep only the latest steps of the grid; None keeps every step
+
+    Returns:
+        tuple: Step index of each column, and the (series x steps) value matrix
+    """
+    steps = np.floor((seconds - origin) / step_seconds).astype(np.int64)
+    valid = np.isfinite(values) & np.isfinite(seconds) & (rows >= 0)
+    if max_steps and valid.any():
+        valid &= steps > steps[valid].max() - max_steps
+    rows, steps, values = rows[valid], steps[valid], values[valid]
+    if not len(steps):
+        return np.empty(0, dtype=np.int64), np.empty((series_count, 0))
+
+    first = steps.min()
+    width = int(steps.max() - first + 1)
+    flat = rows * width + (steps - first)
+    size = series_count * width
+    sums = np.bincount(flat, weights=values, minlength=size)
+    counts = np.bincount(flat, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = sums / counts
+    return np.arange(first, first + width, dtype=np.int64), matrix.reshape(series_count, width)
+
+
+def series_statistics(matrix: np.ndarray, steps: np.ndarray, season_length: int = DEFAULT_SEASON_LENGTH,
+                      decay: float = None, as_of: int = None) -> typing.Dict[str, np.ndarray]:
+    """Compute the trend and seasonal sufficient statistics of every row of a matrix
+
+    Args:
+        matrix (numpy.ndarray): (series x steps) values, NaN where missing
+        steps (numpy.ndarray): Step index of each column
+        season_length (int): Steps per seasonal cycle
+        decay (float): Weight factor per step of age; None weighs every point equally
+        as_of (int): Step the ages are measured from; defaults to the last column
+
+    Returns:
+        dict: Arrays of the scalar statistics (series,) and phase statistics (series x phases)
+    """
+    mask = np.isfinite(matrix)
+    y = np.where(mask, matrix, 0.0)
+    x = steps.astype(float)
+    weights = mask.astype(float)
+    if decay is not None and len(steps):
+        as_of = steps[-1] if as_of is None else as_of
+        weights *= decay ** (as_of - steps).astype(float)
+    weighted_y = weights * y
+    phases = np.zeros((len(steps), season_length))
+    phases[np.arange(len(steps)), steps % season_length] = 1.0
+    weighted_x = weights * x
+    return {
+        "n": weights.sum(axis=1),
+        "sx": weights @ x,
+        "sxx": weights @ (x * x),
+        "sy": weighted_y.sum(axis=1),
+        "sxy": weighted_y @ x,
+        "syy": (weighted_y * y).sum(axis=1),
+        "phase_n": weights @ phases,
+        "phase_sx": weighted_x @ phases,
+        "phase_sy": weighted_y @ phases
+    }
+
+
+def solve_statistics(statistics: typing.Mapping[str, np.ndarray]) -> typing.Dict[str, np.ndarray]:
+    """Solve trend and seasonality of every series in closed form from its statistics
+
+    The model is a slope shared by all points plus one level per phase, fitted jointly by
+    least squares. Phases with fewer than MIN_PHASE_OBSERVATIONS points share one pooled
+    level, so sparse series reduce to a plain linear trend.
+
+    Args:
+        statistics (Mapping): Statistics as returned by series_statistics
+
+    Returns:
+        dict: Arrays of slope, intercept, seasonal indices (series x phases), residual sigma,
+            r_squared, t_statistic of the slope, point count, mean x and within-phase x spread
+    """
+    n = statistics["n"]
+    phase_n, phase_sx, phase_sy = statistics["phase_n"], statistics["phase_sx"], statistics["phase_sy"]
+    used = phase_n >= MIN_PHASE_OBSERVATIONS
+    pool_n = np.where(used, 0.0, phase_n).sum(axis=1)
+    pool_sx = np.where(used, 0.0, phase_sx).sum(axis=1)
+    pool_sy = np.where(used, 0.0, phase_sy).sum(axis=1)
+    pooled = pool_n > 0
+    safe_phase_n = np.where(used, phase_n, 1.0)
+    safe_pool_n = np.where(pooled, pool_n, 1.0)
+
+    def between(a_phase, b_phase, a_pool, b_pool):
+        """Sum over phase groups of the product of group sums divided by the group count"""
+        return (np.where(used, a_phase * b_phase / safe_phase_n, 0.0).sum(axis=1)
+                + np.where(pooled, a_pool * b_pool / safe_pool_n, 0.0))
+
+    # Eliminating the phase levels leaves a regression on the within-phase spread of x and y
+    sxx = np.maximum(statistics["sxx"] - between(phase_sx, phase_sx, pool_sx, pool_sx), 0.0)
+    sxy = statistics["sxy"] - between(phase_sx, phase_sy, pool_sx, pool_sy)
+    syy = np.maximum(statistics["syy"] - between(phase_sy, phase_sy, pool_sy, pool_sy), 0.0)
+    has_spread = sxx > 1e-12 * np.maximum(statistics["sxx"], 1.0)
+    slope = np.where(has_spread, sxy / np.where(has_spread, sxx, 1.0), 0.0)
+    sse = np.maximum(syy - slope * sxy, 0.0)
+
+    safe_n = np.where(n > 0, n, 1.0)
+    intercept = (statistics["sy"] - slope * statistics["sx"]) / safe_n
+    phase_levels = (phase_sy - slope[:, None] * phase_sx) / safe_phase_n
+    pool_level = (pool_sy - slope * pool_sx) / safe_pool_n
+    seasonal = np.where(used, phase_levels, np.where(pooled[:, None] & (phase_n > 0), pool_level[:, None], intercept[:, None]))
+    seasonal = seasonal - intercept[:, None]
+
+    dof = n - 1 - used.sum(axis=1) - pooled
+    sigma = np.where(dof > 0, np.sqrt(sse / np.where(dof > 0, dof, 1.0)), np.nan)
+    total = np.maximum(statistics["syy"] - statistics["sy"] ** 2 / safe_n, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r_squared = np.where(total > 0, 1.0 - sse / np.where(total > 0, total, 1.0), 0.0)
+        slope_error = sigma / np.sqrt(np.where(has_spread, sxx, np.nan))
+        t_statistic = np.where(slope_error > 0, slope / slope_error, np.where(slope != 0, np.inf, 0.0))
+    return {
+        "slope": slope,
+        "intercept": intercept,
+        "seasonal": seasonal,
+        "sigma": sigma,
+        "r_squared": r_squared,
+        "t_statistic": t_statistic,
+        "n": n,
+        "mean_x": statistics["sx"] / safe_n,
+        "sxx": sxx
+    }
+
+
+class SeriesForecaster:
+    """Trend and seasonal model state of many series, updated incrementally and solved in batch"""
+
+    def __init__(self, step_seconds: float = DEFAULT_STEP_SECONDS, season_length: int = DEFAULT_SEASON_LENGTH,
+                 half_life_steps: float = None, min_points: int = DEFAULT_MIN_POINTS, origin: float = None):
+        """Initialize an empty forecaster
+
+        Args:
+            step_seconds (float): Width of a time step in seconds
+            season_length (int): Steps per seasonal cycle; 1 disables seasonality
+            half_life_steps (float): Age in steps at which a point counts half; None never forgets
+            min_points (int): Points a series needs before it is forecast
+            origin (float): Epoch seconds of step 0; defaults to the step of the first point seen
+        """
+        self.step_seconds = float(step_seconds)
+        self.season_length = max(int(season_length), 1)
+        self.decay = None if not half_life_steps else 0.5 ** (1.0 / half_life_steps)
+        self.min_points = min_points
+        self.origin = origin
+        self._index: typing.Dict[str, int] = {}
+        self._entity_ids: typing.List[str] = []
+        self._statistics = {name: np.zeros(0) for name in SCALAR_STATISTICS}
+        self._statistics.update({name: np.zeros((0, self.season_length)) for name in PHASE_STATISTICS})
+        self._as_of = np.zeros(0, dtype=np.int64)
+        self._last_step = np.zeros(0, dtype=np.int64)
+        self._last_value = np.zeros(0)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entity_ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._index
+
+    @property
+    def entity_ids(self) -> typing.List[str]:
+        """IDs of the series with model state"""
+        return list(self._entity_ids)
+
+    def fit(self, series: typing.Mapping[str, tuple], max_steps: int = None) -> int:
+        """Replace the model state of series with a fit of their full history
+
+        Args:
+            series (Mapping): Entity ID to (timestamps, values)
+            max_steps (int): Fit only the latest steps of the aligned grid
+
+        Returns:
+            int: Number of series fitted
+        """
+        with self._lock:
+            self._set_origin([timestamps for timestamps, _ in series.values()])
+            entity_ids, steps, matrix = align_series(series, self.step_seconds, self.origin, max_steps)
+            return self._fit_matrix(entity_ids, steps, matrix)
+
+    def fit_frame(self, frame: typing.Any, entity_column: str, timestamp_column: str = "timestamp",
+                  value_column: str = "value", max_steps: int = None) -> int:
+        """Replace the model state of the series in a long-format DataFrame with a fit of their history
+
+        Args:
+            frame (pandas.DataFrame): One row per entity and point
+            entity_column (str): Column holding the entity ID
+            timestamp_column (str): Column holding the point time
+            value_column (str): Column holding the point value
+            max_steps (int): Fit only the latest steps of the aligned grid
+
+        Returns:
+            int: Number of series fitted
+        """
+        codes, uniques = frame[entity_column].factorize()
+        seconds = to_epoch_seconds(frame[timestamp_column].to_numpy())
+        with self._lock:
+            self._set_origin([seconds])
+            steps, matrix = align_points(len(uniques), codes.astype(np.int64), seconds,
+                                         frame[value_column].to_numpy(dtype=float), self.step_seconds, self.origin, max_steps)
+            return self._fit_matrix([str(entity_id) for entity_id in uniques], steps, matrix)
+
+    def update(self, entity_ids: typing.Sequence[str], timestamps: typing.Any, values: typing.Any) -> int:
+        """Add new points to the model state of their series
+
+        Args:
+            entity_ids (Sequence[str]): Entity ID of each point (a single ID applies to every point)
+            timestamps (Any): Time of each point
+            values (Any): Value of each point
+
+        Returns:
+            int: Number of points added
+        """
+        seconds = np.atleast_1d(to_epoch_seconds(timestamps))
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids] * len(values)
+        valid = np.isfinite(values) & np.isfinite(seconds)
+        if not valid.any():
+            return 0
+        entity_ids = [entity_id for entity_id, keep in zip(entity_ids, valid) if keep]
+        seconds, values = seconds[valid], values[valid]
+
+        with self._lock:
+            if self.origin is None:
+                self.origin = float(np.floor(seconds.min() / self.step_seconds) * self.step_seconds)
+            rows = self._rows(entity_ids)
+            steps = np.floor((seconds - self.origin) / self.step_seconds).astype(np.int64)
+
+            weights = np.ones(len(values))
+            if self.decay is not None:
+                # Move each series' reference step forward, aging its existing statistics
+                as_of = self._as_of.copy()
+                np.maximum.at(as_of, rows, steps)
+                aged = np.unique(rows)
+                previous = self._as_of[aged]
+                factors = self.decay ** (as_of[aged] - np.where(previous == NO_STEP, as_of[aged], previous)).astype(float)
+                for name in SCALAR_STATISTICS:
+                    self._statistics[name][aged] *= factors
+                for name in PHASE_STATISTICS:
+                    self._statistics[name][aged] *= factors[:, None]
+                self._as_of = as_of
+                weights = self.decay ** (as_of[rows] - steps).astype(float)
+
+            x = steps.astype(float)
+            weighted_y = weights * values
+            phases = steps % self.season_length
+            for name, increments in (("n", weights), ("sx", weights * x), ("sxx", weights * x * x),
+                                     ("sy", weighted_y), ("sxy", weighted_y * x), ("syy", weighted_y * values)):
+                np.add.at(self._statistics[name], rows, increments)
+            for name, increments in (("phase_n", weights), ("phase_sx", weights * x), ("phase_sy", weighted_y)):
+                np.add.at(self._statistics[name], (rows, phases), increments)
+
+            # Points are written in step order, so the latest point of each series is written last
+            order = np.argsort(steps, kind="stable")
+            later = steps[order] >= self._last_step[rows[order]]
+            self._last_step[rows[order][later]] = steps[order][later]
+            self._last_value[rows[order][later]] = values[order][later]
+        return len(values)
+
+    def remove(self, entity_ids: typing.Iterable[str]) -> int:
+        """Drop the model state of series
+
+        Args:
+            entity_ids (Iterable[str]): Entity IDs
+
+        Returns:
+            int: Number of series removed
+        """
+        with self._lock:
+            drop = {self._index[entity_id] for entity_id in entity_ids if entity_id in self._index}
+            if not drop:
+                return 0
+            keep = np.array([row for row in range(len(self._entity_ids)) if row not in drop], dtype=np.int64)
+            for name in self._statistics:
+                self._statistics[name] = self._statistics[name][keep]
+            self._as_of, self._last_step, self._last_value = self._as_of[keep], self._last_step[keep], self._last_value[keep]
+            self._entity_ids = [self._entity_ids[row] for row in keep]
+            self._index = {entity_id: row for row, entity_id in enumerate(self._entity_ids)}
+        return len(drop)
+
+    def solve(self, entity_ids: typing.Sequence[str] = None) -> typing.Dict[str, np.ndarray]:
+        """Solve the models of series in closed form
+
+        Args:
+            entity_ids (Sequence[str]): Series to solve; all series when omitted
+
+        Returns:
+            dict: Arrays as returned by solve_statistics, with "entity_ids" and "rows"
+        """
+        with self._lock:
+            rows = self._select(entity_ids)
+            solution = solve_statistics({name: values[rows] for name, values in self._statistics.items()})
+            solution["rows"] = rows
+            solution["entity_ids"] = [self._entity_ids[row] for row in rows]
+            solution["last_step"] = self._last_step[rows]
+            solution["last_value"] = self._last_value[rows]
+        return solution
+
+    def get_model(self, entity_id: str) -> typing.Optional[dict]:
+        """Get the solved model of one series
+
+        Args:
+            entity_id (str): Entity ID
+
+        Returns:
+            dict: Slope and intercept per step, seasonal indices, sigma, r_squared, t_statistic,
+                point count and last value; None for unknown series
+        """
+        if entity_id not in self._index:
+            return None
+        solution = self.solve([entity_id])
+        return {
+            "slope": float(solution["slope"][0]),
+            "slope_per_hour": float(solution["slope"][0] * 3600.0 / self.step_seconds),
+            "intercept": float(solution["intercept"][0]),
+            "seasonal": solution["seasonal"][0].tolist(),
+            "sigma": float(solution["sigma"][0]),
+            "r_squared": float(solution["r_squared"][0]),
+            "t_statistic": float(solution["t_statistic"][0]),
+            "points": float(solution["n"][0]),
+            "last_value": float(solution["last_value"][0])
+        }
+
+    def forecast(self, horizon_steps: int, entity_ids: typing.Sequence[str] = None,
+                 start_step: int = None) -> typing.Tuple[typing.List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Forecast the next steps of series
+
+        Args:
+            horizon_steps (int): Number of steps to forecast
+            entity_ids (Sequence[str]): Series to forecast; all series when omitted
+            start_step (int): Last step before the horizon; defaults to the latest step seen in any series
+
+        Returns:
+            tuple: Entity IDs, forecast steps (horizon,), forecast means and standard
+                deviations (series x horizon)
+        """
+        solution = self.solve(entity_ids)
+        steps = self._horizon(horizon_steps, start_step)
+        mean, std = self._forecast_solution(solution, steps)
+        return solution["entity_ids"], steps, mean, std
+
+    def predict_exceedance(self, thresholds: typing.Union[float, typing.Mapping[str, float], np.ndarray],
+                           horizon_steps: int, min_confidence: float, direction: str = "above",
+                           entity_ids: typing.Sequence[str] = None, start_step: int = None) -> typing.List[ForecastAlert]:
+        """Find series forecast to cross their threshold within the horizon
+
+        The confidence of a series is the highest probability, over the horizon, that its
+        value lies beyond the threshold under the forecast distribution. Only series with
+        enough points whose confidence reaches min_confidence are returned.
+
+        Args:
+            thresholds (float, Mapping or numpy.ndarray): One threshold, thresholds per entity ID,
+                or thresholds aligned with entity_ids; entities missing from a mapping are skipped
+            horizon_steps (int): Number of steps to evaluate
+            min_confidence (float): Minimum crossing probability for an alert
+            direction (str): "above" for upper limits, "below" for lower limits
+            entity_ids (Sequence[str]): Series to evaluate; all series when omitted
+            start_step (int): Last step before the horizon; defaults to the latest step seen in any series
+
+        Returns:
+            list: ForecastAlert per crossing series, most confident first
+        """
+        if direction not in CROSSING_DIRECTIONS:
+            raise ValueError(f"Invalid crossing direction: {direction}. Must be one of {CROSSING_DIRECTIONS}")
+        solution = self.solve(entity_ids)
+        if not len(solution["rows"]) or horizon_steps <= 0:
+            return []
+        if isinstance(thresholds, typing.Mapping):
+            limits = np.array([thresholds.get(entity_id, np.nan) for entity_id in solution["entity_ids"]], dtype=float)
+        else:
+            limits = np.broadcast_to(np.asarray(thresholds, dtype=float), len(solution["rows"]))
+
+        steps = self._horizon(horizon_steps, start_step)
+        mean, std = self._forecast_solution(solution, steps)
+        distance = (mean - limits[:, None]) if direction == "above" else (limits[:, None] - mean)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            probabilities = special.ndtr(distance / np.maximum(std, 1e-12))
+        eligible = (solution["n"] >= self.min_points) & np.isfinite(solution["sigma"]) & np.isfinite(limits)
+        probabilities[~eligible] = 0.0
+        crossing = probabilities >= min_confidence
+        hits = np.flatnonzero(crossing.any(axis=1))
+        if not len(hits):
+            return []
+
+        first = crossing[hits].argmax(axis=1)
+        confidence = probabilities[hits].max(axis=1)
+        alerts = [
+            ForecastAlert(
+                entity_id=solution["entity_ids"][row],
+                confidence=float(confidence[position]),
+                predicted_time=from_epoch_seconds(self.origin + steps[first[position]] * self.step_seconds),
+                steps_ahead=int(steps[first[position]] - steps[0] + 1),
+                forecast_value=float(mean[row, first[position]]),
+                threshold=float(limits[row]),
+                slope=float(solution["slope"][row]),
+                last_value=float(solution["last_value"][row])
+            )
+            for position, row in enumerate(hits)
+        ]
+        alerts.sort(key=lambda alert: (-alert.confidence, alert.steps_ahead, alert.entity_id))
+        return alerts
+
+    def get_stats(self) -> dict:
+        """Get forecaster size and settings
+
+        Returns:
+            dict: Series count, total point weight, latest step, step width and season length
+        """
+        with self._lock:
+            return {
+                "series": len(self._entity_ids),
+                "points": float(self._statistics["n"].sum()),
+                "latest_step": int(self._last_step.max()) if len(self._last_step) else None,
+                "step_seconds": self.step_seconds,
+                "season_length": self.season_length
+            }
+
+    def _fit_matrix(self, entity_ids: typing.List[str], steps: np.ndarray, matrix: np.ndarray) -> int:
+        """Replace the model state of the rows of an aligned matrix; caller holds the lock"""
+        if not entity_ids:
+            return 0
+        rows = self._rows(entity_ids)
+        if not len(steps):
+            self._reset_rows(rows)
+            return len(entity_ids)
+        as_of = int(steps[-1])
+        statistics = series_statistics(matrix, steps, self.season_length, self.decay, as_of)
+        for name, values in statistics.items():
+            self._statistics[name][rows] = values
+
+        mask = np.isfinite(matrix)
+        observed = mask.any(axis=1)
+        last_column = matrix.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+        self._as_of[rows] = as_of
+        self._last_step[rows] = np.where(observed, steps[last_column], NO_STEP)
+        self._last_value[rows] = np.where(observed, matrix[np.arange(len(rows)), last_column], np.nan)
+        logger.debug(f"Fitted {len(entity_ids)} series over {matrix.shape[1]} steps")
+        return len(entity_ids)
+
+    def _set_origin(self, timestamp_arrays: typing.Iterable[typing.Any]) -> None:
+        """Set the origin to the step of the earliest point, if not set; caller holds the lock"""
+        if self.origin is not None:
+            return
+        earliest = [np.nanmin(to_epoch_seconds(timestamps)) for timestamps in timestamp_arrays if len(timestamps)]
+        if earliest:
+            self.origin = float(np.floor(min(earliest) / self.step_seconds) * self.step_seconds)
+
+    def _rows(self, entity_ids: typing.Sequence[str]) -> np.ndarray:
+        """Get the rows of series, appending rows for new ones; caller holds the lock"""
+        new = [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id not in self._index]
+        if new:
+            for entity_id in new:
+                self._index[entity_id] = len(self._entity_ids)
+                self._entity_ids.append(entity_id)
+            for name, values in self._statistics.items():
+                self._statistics[name] = np.concatenate([values, np.zeros((len(new),) + values.shape[1:])])
+            self._as_of = np.concatenate([self._as_of, np.full(len(new), NO_STEP)])
+            self._last_step = np.concatenate([self._last_step, np.full(len(new), NO_STEP)])
+            self._last_value = np.concatenate([self._last_value, np.full(len(new), np.nan)])
+        return np.array([self._index[entity_id] for entity_id in entity_ids], dtype=np.int64)
+
+    def _reset_rows(self, rows: np.ndarray) -> None:
+        """Clear the model state of rows; caller holds the lock"""
+        for values in self._statistics.values():
+            values[rows] = 0.0
+        self._as_of[rows] = NO_STEP
+        self._last_step[rows] = NO_STEP
+        self._last_value[rows] = np.nan
+
+    def _select(self, entity_ids: typing.Optional[typing.Sequence[str]]) -> np.ndarray:
+        """Get the rows of known series, or of all series; caller holds the lock"""
+        if entity_ids is None:
+            return np.arange(len(self._entity_ids), dtype=np.int64)
+        return np.array([self._index[entity_id] for entity_id in entity_ids if entity_id in self._index], dtype=np.int64)
+
+    def _horizon(self, horizon_steps: int, start_step: typing.Optional[int]) -> np.ndarray:
+        """Get the steps of the horizon after the start step"""
+        if start_step is None:
+            with self._lock:
+                observed = self._last_step[self._last_step > NO_STEP]
+            start_step = int(observed.max()) if len(observed) else 0
+        return np.arange(start_step + 1, start_step + 1 + max(int(horizon_steps), 0), dtype=np.int64)
+
+    def _forecast_solution(self, solution: dict, steps: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Evaluate solved models over steps as (series x steps) means and prediction standard deviations"""
+        x = steps.astype(float)
+        mean = solution["intercept"][:, None] + solution["slope"][:, None] * x[None, :]
+        mean += solution["seasonal"][:, steps % self.season_length]
+        n = np.where(solution["n"] > 0, solution["n"], np.nan)
+        sxx = np.where(solution["sxx"] > 0, solution["sxx"], np.inf)
+        leverage = 1.0 + 1.0 / n[:, None] + (x[None, :] - solution["mean_x"][:, None]) ** 2 / sxx[:, None]
+        std = solution["sigma"][:, None] * np.sqrt(leverage)
+        return mean, std
@@ -35,12 +35,19 @@ from .strategy_config import (
     get_strategy_parameters,
     get_default_parameters,
     is_strategy_applicable,
+    get_applicable_strategies,
+    get_compiled_strategies,
     get_strategy_confidence_threshold,
     get_strategy_risk_level,
     get_strategy_max_attempts,
     reload_strategy_config
 )
 
+from .rule_compiler import (
+    CompiledStrategySet,
+    compile_rules
+)
+
 from .risk_management import (
     RiskLevel,
     ImpactCategory,
@@ -81,4 +88,49 @@ def reload_all_configs() -> bool:
         return True
     except Exception as e:
         logger.error(f"Error reloading self-healing configurations: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+
+__all__ = [
+    "get_healing_config",
+    "get_healing_mode",
+    "get_confidence_threshold",
+    "get_max_retry_attempts",
+    "get_approval_required",
+    "is_action_type_enabled",
+    "get_learning_mode",
+    "get_rules_by_type",
+    "get_rule_by_id",
+    "get_rules_by_set",
+    "get_action_parameters",
+    "get_severity_threshold",
+    "reload_healing_config",
+    "HealingConfig",
+    "StrategyCategory",
+    "Strategy",
+    "StrategyConfig",
+    "get_strategy_config",
+    "get_strategies_by_action_type",
+    "get_strategy_by_name",
+    "get_strategy_parameters",
+    "get_default_parameters",
+    "is_strategy_applicable",
+    "get_applicable_strategies",
+    "get_compiled_strategies",
+    "get_strategy_confidence_threshold",
+    "get_strategy_risk_level",
+    "get_strategy_max_attempts",
+    "reload_strategy_config",
+    "CompiledStrategySet",
+    "compile_rules",
+    "RiskLevel",
+    "ImpactCategory",
+    "RiskAssessment",
+    "RiskManager",
+    "calculate_risk_score",
+    "assess_impact",
+    "get_risk_threshold",
+    "requires_approval",
+    "load_risk_config",
+    "reload_all_configs",
+]
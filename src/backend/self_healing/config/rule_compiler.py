@@ -0,0 +1,529 @@
+"""
+Compiler for strategy applicability rules in the self-healing data pipeline.
+
+Applicability rules are compiled once, when the strategy configuration loads, into a tree
+of closures: dotted field paths are split ahead of time, comparison operators are bound to
+their expected values, and conditions repeated across strategies are evaluated at most once
+per context. AND/OR groups reorder their conditions from sampled pass rates so that the
+condition most likely to decide the group runs first. A CompiledStrategySet is an immutable
+snapshot of one strategy configuration and one healing configuration; a reload builds a new
+snapshot instead of mutating the one other threads are evaluating.
+"""
+
+import operator
+import threading
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+from ...utils.logging.logger import get_logger
+
+# Configure module logger
+logger = get_logger(__name__)
+
+# Logical operators of rule groups
+GROUP_OPERATORS = ('AND', 'OR', 'NOT')
+
+# Default sampling settings for learning the condition order
+DEFAULT_SAMPLE_INTERVAL = 16
+DEFAULT_REORDER_SAMPLES = 64
+
+
+def _contains(field_value: Any, expected_value: Any) -> bool:
+    return expected_value in field_value
+
+
+def _not_contains(field_value: Any, expected_value: Any) -> bool:
+    return expected_value not in field_value
+
+
+def _is_in(field_value: Any, expected_value: Any) -> bool:
+    return field_value in expected_value
+
+
+def _not_in(field_value: Any, expected_value: Any) -> bool:
+    return field_value not in expected_value
+
+
+def _startswith(field_value: Any, expected_value: str) -> bool:
+    return str(field_value).startswith(expected_value)
+
+
+def _endswith(field_value: Any, expected_value: str) -> bool:
+    return str(field_value).endswith(expected_value)
+
+
+def _matches(field_value: Any, expected_value: str) -> bool:
+    return expected_value in str(field_value)
+
+
+# Comparison functions (field_value, expected_value) by operator, as in evaluate_condition
+COMPARATORS = {
+    '==': operator.eq, 'eq': operator.eq,
+    '!=': operator.ne, 'ne': operator.ne,
+    '>': operator.gt, 'gt': operator.gt,
+    '>=': operator.ge, 'ge': operator.ge,
+    '<': operator.lt, 'lt': operator.lt,
+    '<=': operator.le, 'le': operator.le,
+    'in': _is_in,
+    'not_in': _not_in,
+    'contains': _contains,
+    'not_contains': _not_contains,
+    'startswith': _startswith,
+    'endswith': _endswith,
+    'matches': _matches
+}
+
+# Operators whose expected value is compared as a string
+STRING_OPERATORS = ('startswith', 'endswith', 'matches')
+
+
+def is_rule_group(rules: Any) -> bool:
+    """Checks if a rule dictionary is a logical group rather than a single condition.
+
+    Args:
+        rules: Rule to check
+
+    Returns:
+        True for groups with an AND/OR/NOT operator or a conditions list
+    """
+    if not isinstance(rules, dict):
+        return False
+    if 'conditions' in rules:
+        return True
+    return 'field' not in rules and rules.get('operator') in GROUP_OPERATORS
+
+
+def compile_field_accessor(field_path: str) -> Callable[[Dict[str, Any]], Any]:
+    """Compiles a dotted field path into a function reading it from a context.
+
+    Args:
+        field_path: Field path using dot notation (e.g., data.user.id)
+
+    Returns:
+        Function returning the field value or None if not found, as get_field_value
+    """
+    if not field_path:
+        return lambda context: None
+
+    parts = tuple(field_path.split('.'))
+    if len(parts) == 1:
+        key = parts[0]
+
+        def get_value(context):
+            return context.get(key) if isinstance(context, dict) else None
+    elif len(parts) == 2:
+        first, second = parts
+
+        def get_value(context):
+            if isinstance(context, dict):
+                value = context.get(first)
+                if isinstance(value, dict):
+                    return value.get(second)
+            return None
+    else:
+        def get_value(context):
+            value = context
+            for part in parts:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(part)
+            return value
+
+    return get_value
+
+
+def _condition_key(rules: Dict[str, Any]) -> Tuple[Any, str, str]:
+    """Identity of a condition, used to share its result between strategies"""
+    value = rules.get('value')
+    return (rules.get('field'), rules.get('operator', '=='), f"{type(value).__name__}:{value!r}")
+
+
+def _prepare_expected(operator_name: str, value: Any) -> Any:
+    """Converts an expected value to the form its comparison runs fastest with"""
+    if operator_name in STRING_OPERATORS:
+        return str(value)
+    if operator_name in ('in', 'not_in') and isinstance(value, (list, tuple, set)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            return value
+    return value
+
+
+class _Group:
+    """An AND/OR group whose condition order is learned from sampled pass rates"""
+
+    __slots__ = ('operator', 'nodes', 'order', 'passes', 'samples', 'cost')
+
+    def __init__(self, group_operator: str, nodes: List['_Node']):
+        self.operator = group_operator
+        self.nodes = nodes
+        self.order = tuple(node.evaluate for node in nodes)
+        self.passes = [0] * len(nodes)
+        self.samples = 0
+        self.cost = sum(node.cost for node in nodes)
+
+    def sample(self, results: List[bool], reorder_samples: int) -> None:
+        """Records the results of every condition for one context and reorders when due"""
+        for index, result in enumerate(results):
+            if result:
+                self.passes[index] += 1
+        self.samples += 1
+        if self.samples >= reorder_samples:
+            self.reorder()
+
+    def reorder(self) -> None:
+        """Puts the cheapest conditions most likely to decide the group first
+
+        An AND group is decided by a failing condition and an OR group by a passing one, so
+        conditions are sorted by cost over the (smoothed) rate at which they decide the group.
+        Counts are then halved so that the order keeps following changes in the traffic.
+        """
+        if self.samples == 0:
+            return
+
+        def rank(index: int) -> float:
+            pass_rate = (self.passes[index] + 0.5) / (self.samples + 1.0)
+            decide_rate = 1.0 - pass_rate if self.operator == 'AND' else pass_rate
+            return self.nodes[index].cost / decide_rate
+
+        ranked = sorted(range(len(self.nodes)), key=rank)
+        nodes = [self.nodes[index] for index in ranked]
+        passes = [self.passes[index] // 2 for index in ranked]
+        # Publish the new order with one assignment; running evaluations keep the old tuple
+        self.nodes, self.passes, self.samples = nodes, passes, self.samples // 2
+        self.order = tuple(node.evaluate for node in nodes)
+
+
+class _Node:
+    """A compiled rule: a fast closure plus the structure needed to sample it"""
+
+    __slots__ = ('evaluate', 'kind', 'children', 'group', 'cost')
+
+    def __init__(self, evaluate: Callable[[Dict[str, Any], list], bool], kind: str,
+                 children: Optional[List['_Node']] = None, group: Optional[_Group] = None, cost: int = 1):
+        self.evaluate = evaluate
+        self.kind = kind
+        self.children = children or []
+        self.group = group
+        self.cost = cost
+
+    def evaluate_sampled(self, context: Dict[str, Any], memo: list, reorder_samples: int) -> bool:
+        """Evaluates every condition without short-circuiting and records group statistics"""
+        if self.kind == 'NOT':
+            return not self.children[0].evaluate_sampled(context, memo, reorder_samples)
+        if self.group is None:
+            return self.evaluate(context, memo)
+        group = self.group
+        nodes = group.nodes
+        results = [node.evaluate_sampled(context, memo, reorder_samples) for node in nodes]
+        group.sample(results, reorder_samples)
+        return all(results) if group.operator == 'AND' else any(results)
+
+
+def _constant(result: bool) -> _Node:
+    """Compiles a rule that always evaluates to result"""
+    return _Node(lambda context, memo: result, 'CONSTANT', cost=0)
+
+
+class RuleCompiler:
+    """Compiles the applicability rules of a set of strategies into shared closures"""
+
+    def __init__(self, shared_conditions: Optional[Dict[Tuple[Any, str, str], int]] = None):
+        """Initialize the compiler.
+
+        Args:
+            shared_conditions: Memo slot of every condition occurring more than once; other
+                conditions are evaluated without a memo lookup
+        """
+        self._shared_conditions = shared_conditions or {}
+
+    @staticmethod
+    def count_conditions(rules: Any, counts: Dict[Tuple[Any, str, str], int]) -> None:
+        """Counts the occurrences of every condition in a rule tree.
+
+        Args:
+            rules: Rule tree
+            counts: Occurrence counts by condition key, updated in place
+        """
+        if is_rule_group(rules):
+            for condition in rules.get('conditions', []) or []:
+                RuleCompiler.count_conditions(condition, counts)
+        elif isinstance(rules, dict) and 'field' in rules:
+            key = _condition_key(rules)
+            counts[key] = counts.get(key, 0) + 1
+        elif isinstance(rules, list):
+            for rule in rules:
+                RuleCompiler.count_conditions(rule, counts)
+
+    def compile(self, rules: Any) -> _Node:
+        """Compiles a rule tree with the same semantics as evaluate_rules.
+
+        Args:
+            rules: Rule tree
+
+        Returns:
+            Compiled rule
+        """
+        if is_rule_group(rules):
+            group_operator = rules.get('operator', 'AND')
+            conditions = rules.get('conditions', []) or []
+            if not conditions:
+                return _constant(True)
+            if group_operator == 'NOT':
+                if len(conditions) != 1:
+                    logger.warning("NOT operator should have exactly one condition")
+                    return _constant(False)
+                return self._compile_not(self.compile(conditions[0]))
+            if group_operator not in ('AND', 'OR'):
+                logger.warning(f"Unknown logical operator: {group_operator}")
+                return _constant(False)
+            return self._compile_group(group_operator, [self.compile(condition) for condition in conditions])
+
+        if isinstance(rules, dict) and 'field' in rules:
+            return self._compile_condition(rules)
+
+        if isinstance(rules, list):
+            if not rules:
+                return _constant(True)
+            return self._compile_group('AND', [self.compile(rule) for rule in rules])
+
+        logger.warning(f"Unknown rule structure: {rules}")
+        return _constant(False)
+
+    def _compile_condition(self, rules: Dict[str, Any]) -> _Node:
+        """Compiles a single field condition"""
+        operator_name = rules.get('operator', '==')
+        compare = COMPARATORS.get(operator_name)
+        if compare is None:
+            logger.warning(f"Unknown operator: {operator_name}")
+            return _constant(False)
+        get_value = compile_field_accessor(rules.get('field'))
+        expected = _prepare_expected(operator_name, rules.get('value'))
+
+        def evaluate(context, memo):
+            value = get_value(context)
+            if value is None:
+                return False
+            try:
+                return bool(compare(value, expected))
+            except TypeError:
+                # Values that cannot be compared do not satisfy the condition
+                return False
+
+        slot = self._shared_conditions.get(_condition_key(rules))
+        if slot is None:
+            return _Node(evaluate, 'CONDITION')
+
+        def evaluate_shared(context, memo):
+            result = memo[slot]
+            if result is None:
+                result = memo[slot] = evaluate(context, memo)
+            return result
+
+        return _Node(evaluate_shared, 'CONDITION')
+
+    @staticmethod
+    def _compile_not(child: _Node) -> _Node:
+        """Compiles the negation of a compiled rule"""
+        evaluate_child = child.evaluate
+        return _Node(lambda context, memo: not evaluate_child(context, memo), 'NOT', [child], cost=child.cost)
+
+    @staticmethod
+    def _compile_group(group_operator: str, nodes: List[_Node]) -> _Node:
+        """Compiles an AND/OR group, collapsing groups of a single condition"""
+        if len(nodes) == 1:
+            return nodes[0]
+        group = _Group(group_operator, nodes)
+        if group_operator == 'AND':
+            def evaluate(context, memo):
+                for evaluate_node in group.order:
+                    if not evaluate_node(context, memo):
+                        return False
+                return True
+        else:
+            def evaluate(context, memo):
+                for evaluate_node in group.order:
+                    if evaluate_node(context, memo):
+                        return True
+                return False
+        return _Node(evaluate, group_operator, nodes, group, cost=group.cost)
+
+
+def compile_rules(rules: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Compiles applicability rules into a predicate over a context.
+
+    Args:
+        rules: Rules in the format accepted by evaluate_rules; empty rules always apply
+
+    Returns:
+        Function returning True if the rules pass for a context
+    """
+    if not rules:
+        return lambda context: True
+    evaluate = RuleCompiler().compile(rules).evaluate
+    return lambda context: evaluate(context, None)
+
+
+class CompiledStrategySet:
+    """Snapshot of compiled applicability rules for every configured strategy."""
+
+    def __init__(self, strategy_config: Dict[str, Any], healing_config: Optional[Dict[str, Any]] = None,
+                 sample_interval: int = DEFAULT_SAMPLE_INTERVAL, reorder_samples: int = DEFAULT_REORDER_SAMPLES):
+        """Compiles the strategies of a configuration.
+
+        Args:
+            strategy_config: Strategy configuration with a 'strategies' list
+            healing_config: Healing configuration; strategies whose action type it explicitly
+                disables are left out of get_applicable_strategies
+            sample_interval: Every how many evaluations one is sampled to learn the condition
+                order; 0 disables learning
+            reorder_samples: Number of samples after which a group reorders its conditions
+        """
+        self.strategy_config = strategy_config
+        self.healing_config = healing_config
+        self._sample_interval = sample_interval
+        self._reorder_samples = max(1, reorder_samples)
+        self._evaluations = 0
+
+        strategies = [strategy for strategy in (strategy_config or {}).get('strategies', []) or []
+                      if isinstance(strategy, dict)]
+        action_types = (healing_config or {}).get('action_types', {}) or {}
+        self._disabled_action_types = frozenset(
+            name for name, settings in action_types.items()
+            if isinstance(settings, dict) and settings.get('enabled', True) is False
+        )
+
+        counts = {}
+        for strategy in strategies:
+            RuleCompiler.count_conditions(strategy.get('applicability_rules') or {}, counts)
+        shared = [key for key, count in counts.items() if count > 1]
+        self._shared_count = len(shared)
+        compiler = RuleCompiler({key: slot for slot, key in enumerate(shared)})
+
+        entries = []
+        self._by_name = {}
+        for strategy in strategies:
+            name = strategy.get('name')
+            if name in self._by_name:
+                # Lookups by name return the first strategy, as get_strategy_by_name
+                continue
+            rules = strategy.get('applicability_rules') or {}
+            node = compiler.compile(rules) if rules else _constant(True)
+            entry = (name, strategy.get('action_type'), node)
+            entries.append(entry)
+            self._by_name[name] = entry
+        self._entries = tuple(entries)
+        logger.debug(f"Compiled applicability rules of {len(entries)} strategies "
+                     f"({self._shared_count} shared conditions)")
+
+    def is_snapshot_of(self, strategy_config: Dict[str, Any], healing_config: Optional[Dict[str, Any]] = None) -> bool:
+        """Checks if the snapshot was compiled from the given configuration objects.
+
+        Args:
+            strategy_config: Current strategy configuration
+            healing_config: Current healing configuration
+
+        Returns:
+            True if both are the objects the snapshot was built from
+        """
+        return strategy_config is self.strategy_config and healing_config is self.healing_config
+
+    def is_applicable(self, strategy_name: str, context: Dict[str, Any]) -> bool:
+        """Checks if a strategy is applicable for a given context.
+
+        Args:
+            strategy_name: The name of the strategy
+            context: Context information for evaluation
+
+        Returns:
+            True if strategy is applicable, False if not or if the strategy is unknown
+        """
+        entry = self._by_name.get(strategy_name)
+        if entry is None:
+            return False
+        memo = [None] * self._shared_count
+        if self._should_sample():
+            return entry[2].evaluate_sampled(context, memo, self._reorder_samples)
+        return entry[2].evaluate(context, memo)
+
+    def get_applicable_strategies(self, context: Dict[str, Any], action_type: Optional[str] = None,
+                                  include_disabled: bool = False) -> List[str]:
+        """Evaluates every strategy against one context.
+
+        Args:
+            context: Context information for evaluation
+            action_type: Only evaluate strategies of this action type value
+            include_disabled: Whether to include strategies of action types disabled in the
+                healing configuration
+
+        Returns:
+            Names of the applicable strategies in configuration order
+        """
+        memo = [None] * self._shared_count
+        disabled = () if include_disabled else self._disabled_action_types
+        sampled = self._should_sample()
+        applicable = []
+        for name, strategy_action_type, node in self._entries:
+            if action_type is not None and strategy_action_type != action_type:
+                continue
+            if strategy_action_type in disabled:
+                continue
+            if sampled:
+                result = node.evaluate_sampled(context, memo, self._reorder_samples)
+            else:
+                result = node.evaluate(context, memo)
+            if result:
+                applicable.append(name)
+        return applicable
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Gets statistics about the compiled strategies.
+
+        Returns:
+            Dictionary with strategy, shared condition and evaluation counts
+        """
+        return {
+            'strategies': len(self._entries),
+            'shared_conditions': self._shared_count,
+            'disabled_action_types': sorted(self._disabled_action_types),
+            'evaluations': self._evaluations
+        }
+
+    def _should_sample(self) -> bool:
+        """Counts an evaluation and decides whether it is sampled; races only skew the count"""
+        self._evaluations += 1
+        return self._sample_interval > 0 and self._evaluations % self._sample_interval == 0
+
+
+class CompiledStrategyCache:
+    """Holds the current CompiledStrategySet and swaps in a new one when a configuration reloads."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._compiled = None
+        self._lock = threading.Lock()
+
+    def get(self, strategy_config: Dict[str, Any], healing_config: Optional[Dict[str, Any]] = None) -> CompiledStrategySet:
+        """Gets the snapshot for the given configurations, compiling it if they changed.
+
+        Args:
+            strategy_config: Current strategy configuration
+            healing_config: Current healing configuration
+
+        Returns:
+            Compiled strategy snapshot
+        """
+        compiled = self._compiled
+        if compiled is not None and compiled.is_snapshot_of(strategy_config, healing_config):
+            return compiled
+        with self._lock:
+            compiled = self._compiled
+            if compiled is None or not compiled.is_snapshot_of(strategy_config, healing_config):
+                compiled = CompiledStrategySet(strategy_config, healing_config)
+                self._compiled = compiled
+        return compiled
+
+    def clear(self) -> None:
+        """Drops the current snapshot."""
+        with self._lock:
+            self._compiled = None
@@ -17,6 +17,7 @@ from ...config import get_config
 from ...utils.logging.logger import get_logger
 from .healing_config import get_healing_config
 from .risk_management import RiskLevel
+from .rule_compiler import CompiledStrategySet, CompiledStrategyCache, compile_rules, is_rule_group
 
 # Configure module logger
 logger = get_logger(__name__)
@@ -31,6 +32,9 @@ DEFAULT_STRATEGY_CONFIG_PATH = os.path.join(
 # Cache for loaded strategy configuration
 _strategy_config_cache = None
 
+# Compiled applicability rules of the cached strategy and healing configuration
+_compiled_strategy_cache = CompiledStrategyCache()
+
 
 class StrategyCategory(enum.Enum):
     """Enumeration of strategy categories for different healing approaches."""
@@ -68,6 +72,7 @@ class Strategy:
         self.applicability_rules = applicability_rules
         self.execution_settings = execution_settings
         self.success_rate = success_rate
+        self._compiled_rules = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert strategy to dictionary representation.
@@ -120,12 +125,12 @@ class Strategy:
         Returns:
             True if strategy is applicable, False otherwise
         """
-        # If no rules defined, assume always applicable
-        if not self.applicability_rules:
-            return True
+        # Compile the rules on first use and again if they are replaced
+        if self._compiled_rules is None or self._compiled_rules[0] is not self.applicability_rules:
+            self._compiled_rules = (self.applicability_rules, compile_rules(self.applicability_rules))
         
-        # Evaluate the rules against the context
-        return evaluate_rules(self.applicability_rules, context)
+        # Evaluate the compiled rules against the context; empty rules always apply
+        return self._compiled_rules[1](context)
     
     def get_confidence_threshold(self) -> float:
         """Get the confidence threshold for this strategy.
@@ -173,6 +178,7 @@ class StrategyConfig:
         self._strategy_config = None
         self._config_path = config_path or DEFAULT_STRATEGY_CONFIG_PATH
         self._initialized = False
+        self._compiled_strategies = CompiledStrategyCache()
         self._load_config()
     
     def _load_config(self):
@@ -188,9 +194,24 @@ class StrategyConfig:
             logger.warning(f"Invalid strategy configuration loaded from {self._config_path}. Using empty config.")
             self._strategy_config = {}
         
+        # Compile the applicability rules of the new configuration
+        self._compiled_strategies.get(self._strategy_config, get_healing_config())
+        
         self._initialized = True
         logger.info(f"Strategy configuration loaded from {self._config_path}")
     
+    def get_compiled_strategies(self) -> CompiledStrategySet:
+        """Gets the compiled applicability rules of the loaded strategies.
+        
+        Returns:
+            Compiled strategy snapshot, rebuilt if the healing configuration was reloaded
+        """
+        # Ensure configuration is loaded
+        if not self._initialized:
+            self._load_config()
+        
+        return self._compiled_strategies.get(self._strategy_config, get_healing_config())
+    
     def get_strategies_by_action_type(self, action_type: HealingActionType) -> List[Dict[str, Any]]:
         """Gets strategies applicable for a specific healing action type.
         
@@ -278,20 +299,21 @@ class StrategyConfig:
         Returns:
             True if strategy is applicable, False otherwise
         """
-        # Get strategy configuration
-        strategy = self.get_strategy_by_name(strategy_name)
-        if not strategy:
-            return False
-        
-        # Get applicability rules
-        applicability_rules = strategy.get('applicability_rules', {})
-        
-        # If no rules defined, assume always applicable
-        if not applicability_rules:
-            return True
+        return self.get_compiled_strategies().is_applicable(strategy_name, context)
+    
+    def get_applicable_strategies(self, context: Dict[str, Any],
+                                  action_type: Optional[HealingActionType] = None) -> List[str]:
+        """Gets the names of all strategies applicable for a given context.
         
-        # Evaluate the rules against the context
-        return evaluate_rules(applicability_rules, context)
+        Args:
+            context: Context information for evaluation
+            action_type: Only consider strategies of this action type
+            
+        Returns:
+            Names of applicable strategies whose action type is not disabled
+        """
+        action_type_value = action_type.value if action_type is not None else None
+        return self.get_compiled_strategies().get_applicable_strategies(context, action_type_value)
     
     def get_strategy_confidence_threshold(self, strategy_name: str) -> float:
         """Gets the confidence threshold for a specific strategy.
@@ -555,8 +577,8 @@ def evaluate_rules(rules: Dict[str, Any], context: Dict[str, Any]) -> bool:
     Returns:
         True if rules pass, False otherwise
     """
-    # Check if rules is a dict with operator
-    if isinstance(rules, dict) and 'operator' in rules:
+    # Check if rules is a logical group; a condition may carry a comparison operator too
+    if is_rule_group(rules):
         operator = rules.get('operator', 'AND')
         conditions = rules.get('conditions', [])
         
@@ -573,6 +595,9 @@ def evaluate_rules(rules: Dict[str, Any], context: Dict[str, Any]) -> bool:
                 logger.warning("NOT operator should have exactly one condition")
                 return False
             return not evaluate_rules(conditions[0], context)
+        
+        logger.warning(f"Unknown logical operator: {operator}")
+        return False
     
     # Check if rules is a simple condition
     if isinstance(rules, dict) and 'field' in rules:
@@ -684,20 +709,38 @@ def is_strategy_applicable(strategy_name: str, context: Dict[str, Any]) -> bool:
     Returns:
         True if strategy is applicable, False otherwise
     """
-    # Get strategy configuration
-    strategy = get_strategy_by_name(strategy_name)
-    if not strategy:
-        return False
+    return get_compiled_strategies().is_applicable(strategy_name, context)
+
+
+def get_applicable_strategies(context: Dict[str, Any], action_type: Optional[HealingActionType] = None) -> List[str]:
+    """Gets the names of all strategies applicable for a given context.
     
-    # Get applicability rules
-    applicability_rules = strategy.get('applicability_rules', {})
+    Evaluates every strategy against the context in one pass, sharing the result of
+    conditions that several strategies have in common.
     
-    # If no rules defined, assume always applicable
-    if not applicability_rules:
-        return True
+    Args:
+        context: Context information for evaluation
+        action_type: Only consider strategies of this action type
+        
+    Returns:
+        Names of applicable strategies in configuration order, leaving out strategies
+        whose action type is disabled in the healing configuration
+    """
+    action_type_value = action_type.value if action_type is not None else None
+    return get_compiled_strategies().get_applicable_strategies(context, action_type_value)
+
+
+def get_compiled_strategies() -> CompiledStrategySet:
+    """Gets the compiled applicability rules of the cached strategy configuration.
+    
+    The snapshot is rebuilt when the strategy or the healing configuration has been
+    reloaded since it was compiled; callers still holding the previous snapshot finish
+    their evaluation on it.
     
-    # Evaluate the rules against the context
-    return evaluate_rules(applicability_rules, context)
+    Returns:
+        Compiled strategy snapshot
+    """
+    return _compiled_strategy_cache.get(get_strategy_config(), get_healing_config())
 
 
 def get_strategy_confidence_threshold(strategy_name: str) -> float:
@@ -788,6 +831,9 @@ def reload_strategy_config(config_path: str = None) -> Dict[str, Any]:
     
     # Load and return the updated configuration
     config = get_strategy_config(config_path)
+    
+    # Compile the new rules now rather than on the next applicability check
+    get_compiled_strategies()
     logger.info("Strategy configuration reloaded")
     
     return config
\ No newline at end of file
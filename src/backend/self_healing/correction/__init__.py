@@ -3,6 +3,8 @@ Initialization module for the self-healing correction package that exposes the c
 """
 
 from .data_corrector import DataCorrector, CorrectionResult
+from .correction_engine import CorrectionPlan
+from .issue_coalescer import IssueCoalescer, issue_fingerprint
 from .pipeline_adjuster import PipelineAdjuster, AdjustmentResult, ResourceAdjuster, TimeoutAdjuster, ConfigurationAdjuster, DependencyAdjuster
 from .resource_optimizer import ResourceOptimizer, OptimizationResult, BigQueryOptimizer, ComposerOptimizer, MemoryOptimizer, StorageOptimizer
 from .recovery_orchestrator import RecoveryOrchestrator, RecoveryResult
@@ -10,6 +12,9 @@ from .recovery_orchestrator import RecoveryOrchestrator, RecoveryResult
 __all__ = [
     "DataCorrector",
     "CorrectionResult",
+    "CorrectionPlan",
+    "IssueCoalescer",
+    "issue_fingerprint",
     "PipelineAdjuster",
     "AdjustmentResult",
     "ResourceOptimizer",
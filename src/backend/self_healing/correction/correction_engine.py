@@ -0,0 +1,810 @@
+"""
+Vectorized correction engine for missing values and outliers.
+
+A CorrectionPlan describes one correction (an imputation strategy, an outlier capping
+method, or both) over a set of columns. The plan is executed in one of three modes:
+
+- In memory: the statistics the plan needs (moments, quantiles, modes) are computed once
+  for all columns, then imputation and capping run as one vectorized pass over a 2-D array.
+- Chunked: for data larger than memory, a first pass over the chunks accumulates moments
+  and a uniform row sample for the quantiles, and a second pass corrects chunk by chunk.
+- Pushdown: the statistics are computed by one aggregate query and the correction is
+  compiled into one set-based UPDATE statement, so the data never leaves the warehouse.
+  A second aggregate query evaluates the corrected values first, so the correction is
+  validated before the UPDATE runs.
+
+Outliers are capped to their bounds rather than removed, so the row count is preserved in
+every mode. Every pass records column statistics before and after the correction, and
+validation compares those instead of rescanning the data.
+"""
+
+import collections
+import re
+import typing
+
+import numpy as np  # version 1.24.x
+import pandas as pd  # version 2.0.x
+
+from src.backend.utils.logging.logger import get_logger  # Configure logging for the correction engine
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Supported imputation strategies and outlier capping methods
+IMPUTATION_STRATEGIES = ("mean", "median", "most_frequent", "constant")
+OUTLIER_METHODS = ("winsorization", "iqr_filtering", "z_score_filtering")
+
+# Correction strategy names mapped to (imputation strategy, outlier method)
+STRATEGY_PLANS = {
+    "mean_imputation": ("mean", None),
+    "median_imputation": ("median", None),
+    "mode_imputation": ("most_frequent", None),
+    "constant_imputation": ("constant", None),
+    "winsorization": (None, "winsorization"),
+    "iqr_filtering": (None, "iqr_filtering"),
+    "z_score_filtering": (None, "z_score_filtering")
+}
+
+# Default settings
+DEFAULT_WINSORIZATION_LIMITS = (0.05, 0.05)
+DEFAULT_IQR_FACTOR = 1.5
+DEFAULT_Z_THRESHOLD = 3.0
+DEFAULT_SAMPLE_SIZE = 100000
+DEFAULT_MAX_MEAN_SHIFT = 1.0
+
+# Resolution of APPROX_QUANTILES in pushdown statistics
+SQL_QUANTILE_BUCKETS = 1000
+
+# Casts of corrected pushdown values back to non-FLOAT64 column types, since the bounds are
+# FLOAT64 parameters and GREATEST/LEAST return FLOAT64
+SQL_TYPE_CASTS = {
+    "INTEGER": "CAST(ROUND({}) AS INT64)",
+    "INT64": "CAST(ROUND({}) AS INT64)",
+    "NUMERIC": "CAST({} AS NUMERIC)",
+    "BIGNUMERIC": "CAST({} AS BIGNUMERIC)"
+}
+
+
+class CorrectionPlan:
+    """Imputation and outlier capping to apply to a set of columns"""
+
+    def __init__(self, columns: list, impute_strategy: str = None, fill_value: typing.Any = 0,
+                 outlier_method: str = None, limits: typing.Sequence[float] = DEFAULT_WINSORIZATION_LIMITS,
+                 iqr_factor: float = DEFAULT_IQR_FACTOR, z_threshold: float = DEFAULT_Z_THRESHOLD):
+        """Initialize a correction plan
+
+        Args:
+            columns (list): Columns to correct
+            impute_strategy (str): One of IMPUTATION_STRATEGIES, or None to keep missing values
+            fill_value (Any): Value used by the constant strategy
+            outlier_method (str): One of OUTLIER_METHODS, or None to keep outliers
+            limits (Sequence[float]): Lower and upper tail fractions capped by winsorization
+            iqr_factor (float): Multiple of the interquartile range beyond which values are capped
+            z_threshold (float): Number of standard deviations beyond which values are capped
+        """
+        if impute_strategy is not None and impute_strategy not in IMPUTATION_STRATEGIES:
+            raise ValueError(f"Unsupported imputation strategy: {impute_strategy}")
+        if outlier_method is not None and outlier_method not in OUTLIER_METHODS:
+            raise ValueError(f"Unsupported outlier method: {outlier_method}")
+        self.columns = list(columns)
+        self.impute_strategy = impute_strategy
+        self.fill_value = fill_value
+        self.outlier_method = outlier_method
+        self.limits = (float(limits[0]), float(limits[1]))
+        self.iqr_factor = float(iqr_factor)
+        self.z_threshold = float(z_threshold)
+
+    @classmethod
+    def from_strategy(cls, strategy: str, parameters: dict, target_columns: list) -> 'CorrectionPlan':
+        """Build a plan from a correction strategy name and its parameters
+
+        Args:
+            strategy (str): Strategy name from STRATEGY_PLANS
+            parameters (dict): Strategy parameters (fill_value, limits, factor, threshold)
+            target_columns (list): Columns to correct
+
+        Returns:
+            CorrectionPlan: Plan for the strategy
+        """
+        if strategy not in STRATEGY_PLANS:
+            raise ValueError(f"Unsupported correction strategy: {strategy}")
+        impute_strategy, outlier_method = STRATEGY_PLANS[strategy]
+        parameters = parameters or {}
+        return cls(
+            target_columns,
+            impute_strategy=impute_strategy,
+            fill_value=parameters.get("fill_value", 0),
+            outlier_method=outlier_method,
+            limits=parameters.get("limits", DEFAULT_WINSORIZATION_LIMITS),
+            iqr_factor=parameters.get("factor", DEFAULT_IQR_FACTOR),
+            z_threshold=parameters.get("threshold", DEFAULT_Z_THRESHOLD)
+        )
+
+    @property
+    def method(self) -> str:
+        """Name of the correction recorded in correction details"""
+        return " + ".join(name for name in (self.impute_strategy, self.outlier_method) if name)
+
+    def quantile_levels(self) -> list:
+        """Quantile levels the plan needs
+
+        Returns:
+            list: Sorted quantile levels between 0 and 1
+        """
+        levels = set()
+        if self.impute_strategy == "median":
+            levels.add(0.5)
+        if self.outlier_method == "winsorization":
+            levels.update((self.limits[0], 1.0 - self.limits[1]))
+        elif self.outlier_method == "iqr_filtering":
+            levels.update((0.25, 0.75))
+        return sorted(levels)
+
+    def resolve(self, statistics: dict) -> dict:
+        """Resolve fill values and capping bounds from column statistics
+
+        Args:
+            statistics (dict): Column statistics from compute_statistics, profile_chunks or parse_profile_row
+
+        Returns:
+            dict: Column name to {"fill", "lower", "upper"}; None where the plan does not apply
+        """
+        resolved = {}
+        for column in self.columns:
+            stats = statistics.get(column, {})
+            quantiles = stats.get("quantiles", {})
+            lower = upper = None
+            if self.outlier_method == "winsorization":
+                lower, upper = quantiles.get(self.limits[0]), quantiles.get(1.0 - self.limits[1])
+            elif self.outlier_method == "iqr_filtering" and quantiles.get(0.25) is not None:
+                spread = quantiles[0.75] - quantiles[0.25]
+                lower, upper = quantiles[0.25] - self.iqr_factor * spread, quantiles[0.75] + self.iqr_factor * spread
+            elif self.outlier_method == "z_score_filtering" and stats.get("mean") is not None:
+                lower = stats["mean"] - self.z_threshold * stats["std"]
+                upper = stats["mean"] + self.z_threshold * stats["std"]
+
+            fill = None
+            if self.impute_strategy == "mean":
+                fill = stats.get("mean")
+            elif self.impute_strategy == "median":
+                fill = quantiles.get(0.5)
+            elif self.impute_strategy == "most_frequent":
+                fill = stats.get("mode")
+            elif self.impute_strategy == "constant":
+                fill = self.fill_value
+            # A fill value outside the bounds would be capped right away
+            if isinstance(fill, (int, float)) and lower is not None:
+                fill = min(max(fill, lower), upper)
+            resolved[column] = {"fill": fill, "lower": lower, "upper": upper}
+        return resolved
+
+
+class ColumnMoments:
+    """Mergeable per-column count, missing count, sum, sum of squares, minimum and maximum"""
+
+    def __init__(self, columns: list):
+        """Initialize empty moments
+
+        Args:
+            columns (list): Numeric columns tracked, in array column order
+        """
+        self.columns = list(columns)
+        width = len(self.columns)
+        self.rows = 0
+        self.count = np.zeros(width)
+        self.total = np.zeros(width)
+        self.squares = np.zeros(width)
+        self.minimum = np.full(width, np.inf)
+        self.maximum = np.full(width, -np.inf)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a block of rows
+
+        Args:
+            values (numpy.ndarray): 2-D float array with NaN for missing values
+        """
+        present = ~np.isnan(values)
+        self.rows += values.shape[0]
+        self.count += present.sum(axis=0)
+        self.total += np.nansum(values, axis=0)
+        self.squares += np.nansum(values * values, axis=0)
+        if values.shape[0]:
+            with np.errstate(all="ignore"):
+                self.minimum = np.fmin(self.minimum, np.nanmin(np.where(present, values, np.inf), axis=0))
+                self.maximum = np.fmax(self.maximum, np.nanmax(np.where(present, values, -np.inf), axis=0))
+
+    def to_dict(self) -> dict:
+        """Convert to per-column statistics
+
+        Returns:
+            dict: Column name to {"count", "missing", "mean", "std", "min", "max"}
+        """
+        statistics = {}
+        for index, column in enumerate(self.columns):
+            count = int(self.count[index])
+            if count:
+                mean = self.total[index] / count
+                variance = max(self.squares[index] / count - mean * mean, 0.0)
+                statistics[column] = {"count": count, "missing": self.rows - count, "mean": float(mean),
+                                      "std": float(np.sqrt(variance)), "min": float(self.minimum[index]),
+                                      "max": float(self.maximum[index])}
+            else:
+                statistics[column] = {"count": 0, "missing": self.rows, "mean": None, "std": None,
+                                      "min": None, "max": None}
+        return statistics
+
+
+class CorrectionReport:
+    """Before and after statistics and correction counts collected while correcting"""
+
+    def __init__(self, plan: CorrectionPlan, resolved: dict, numeric_columns: list, other_columns: list):
+        """Initialize an empty report
+
+        Args:
+            plan (CorrectionPlan): Executed plan
+            resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+            numeric_columns (list): Corrected numeric columns
+            other_columns (list): Imputed non-numeric columns
+        """
+        self.plan = plan
+        self.resolved = resolved
+        self.before = ColumnMoments(numeric_columns)
+        self.after = ColumnMoments(numeric_columns)
+        self.imputed = collections.Counter()
+        self.capped = collections.Counter()
+        self.missing_before = collections.Counter()
+        self.missing_after = collections.Counter()
+        self.other_columns = list(other_columns)
+        self.rows = 0
+
+    def get_column_details(self) -> dict:
+        """Summarize the correction per column
+
+        Returns:
+            dict: Column name to counts, method, fill value, bounds and before/after statistics
+        """
+        before, after = self.before.to_dict(), self.after.to_dict()
+        details = {}
+        for column in self.plan.columns:
+            resolved = self.resolved.get(column, {})
+            entry = {
+                "missing_count": int(self.missing_before[column]),
+                "imputed_count": int(self.imputed[column]),
+                "outlier_count": int(self.capped[column]),
+                "imputation_method": self.plan.impute_strategy,
+                "correction_method": self.plan.method,
+                "fill_value": _to_python(resolved.get("fill")),
+                "lower_bound": _to_python(resolved.get("lower")),
+                "upper_bound": _to_python(resolved.get("upper")),
+                "before": before.get(column, {"count": self.rows - self.missing_before[column],
+                                              "missing": int(self.missing_before[column])}),
+                "after": after.get(column, {"count": self.rows - self.missing_after[column],
+                                            "missing": int(self.missing_after[column])})
+            }
+            details[column] = entry
+        return details
+
+
+def _to_python(value: typing.Any) -> typing.Any:
+    """Convert NumPy scalars to Python values for JSON-friendly details"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _split_columns(data: pd.DataFrame, columns: list) -> typing.Tuple[list, list]:
+    """Split columns into numeric and other columns
+
+    Args:
+        data (pandas.DataFrame): Data holding the columns
+        columns (list): Columns to split
+
+    Returns:
+        tuple: (list, list) - Numeric columns and other columns
+    """
+    missing = [column for column in columns if column not in data.columns]
+    if missing:
+        raise ValueError(f"Columns not found in data: {missing}")
+    numeric = [column for column in columns
+               if pd.api.types.is_numeric_dtype(data[column]) and not pd.api.types.is_bool_dtype(data[column])]
+    return numeric, [column for column in columns if column not in numeric]
+
+
+def _numeric_array(data: pd.DataFrame, columns: list) -> np.ndarray:
+    """Copy numeric columns into one float array with NaN for missing values"""
+    if not columns:
+        return np.empty((len(data), 0))
+    return data[columns].to_numpy(dtype=float, na_value=np.nan, copy=True)
+
+
+def compute_statistics(data: pd.DataFrame, plan: CorrectionPlan) -> dict:
+    """Compute the statistics a plan needs for all its columns at once
+
+    Args:
+        data (pandas.DataFrame): Data to correct
+        plan (CorrectionPlan): Correction plan
+
+    Returns:
+        dict: Column name to moments, quantiles and (for most_frequent) mode
+    """
+    numeric, other = _split_columns(data, plan.columns)
+    values = _numeric_array(data, numeric)
+    moments = ColumnMoments(numeric)
+    moments.update(values)
+    statistics = moments.to_dict()
+
+    levels = plan.quantile_levels()
+    if levels and numeric and len(data):
+        with np.errstate(all="ignore"):
+            quantiles = np.nanquantile(values, levels, axis=0)
+        for index, column in enumerate(numeric):
+            statistics[column]["quantiles"] = {level: float(quantiles[position, index])
+                                               for position, level in enumerate(levels)
+                                               if not np.isnan(quantiles[position, index])}
+
+    for column in other:
+        statistics[column] = {"count": int(data[column].count()), "missing": int(data[column].isna().sum())}
+    if plan.impute_strategy == "most_frequent":
+        for column in plan.columns:
+            modes = data[column].mode(dropna=True)
+            statistics[column]["mode"] = _to_python(modes.iloc[0]) if len(modes) else None
+    return statistics
+
+
+def apply_plan(data: pd.DataFrame, plan: CorrectionPlan, resolved: dict,
+               report: CorrectionReport = None) -> typing.Tuple[pd.DataFrame, CorrectionReport]:
+    """Impute and cap all plan columns in one vectorized pass
+
+    Args:
+        data (pandas.DataFrame): Data to correct; it is not modified
+        plan (CorrectionPlan): Correction plan
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+        report (CorrectionReport): Report to accumulate into when correcting chunk by chunk
+
+    Returns:
+        tuple: (pandas.DataFrame, CorrectionReport) - Corrected data and report
+    """
+    numeric, other = _split_columns(data, plan.columns)
+    if report is None:
+        report = CorrectionReport(plan, resolved, numeric, other)
+    report.rows += len(data)
+    corrected = data.copy()
+
+    if numeric:
+        values = _numeric_array(data, numeric)
+        report.before.update(values)
+        nan_fill = np.array([np.nan if resolved[column]["fill"] is None else float(resolved[column]["fill"])
+                             for column in numeric])
+        lower = np.array([-np.inf if resolved[column]["lower"] is None else resolved[column]["lower"] for column in numeric])
+        upper = np.array([np.inf if resolved[column]["upper"] is None else resolved[column]["upper"] for column in numeric])
+
+        missing = np.isnan(values)
+        capped = (values < lower) | (values > upper)
+        np.clip(values, lower, upper, out=values)
+        values = np.where(missing, nan_fill, values)
+        still_missing = np.isnan(values)
+        report.after.update(values)
+
+        for index, column in enumerate(numeric):
+            report.missing_before[column] += int(missing[:, index].sum())
+            report.missing_after[column] += int(still_missing[:, index].sum())
+            report.imputed[column] += int((missing[:, index] & ~still_missing[:, index]).sum())
+            report.capped[column] += int(capped[:, index].sum())
+            dtype = data[column].dtype
+            if pd.api.types.is_integer_dtype(dtype):
+                # Integer columns keep their dtype; values left missing need the nullable dtype
+                column_values = pd.array(np.round(values[:, index]), dtype="Int64")
+                if not still_missing[:, index].any():
+                    column_values = column_values.astype(dtype)
+                corrected[column] = column_values
+            else:
+                corrected[column] = values[:, index]
+
+    if other and plan.impute_strategy is not None:
+        fills = {column: resolved[column]["fill"] for column in other if resolved[column]["fill"] is not None}
+        for column in other:
+            report.missing_before[column] += int(data[column].isna().sum())
+        corrected = corrected.fillna(value=fills)
+        for column in other:
+            report.missing_after[column] += int(corrected[column].isna().sum())
+            report.imputed[column] += report.missing_before[column] - report.missing_after[column]
+    return corrected, report
+
+
+def correct_dataframe(data: pd.DataFrame, plan: CorrectionPlan) -> typing.Tuple[pd.DataFrame, CorrectionReport]:
+    """Correct data held in memory: statistics once, then one vectorized pass
+
+    Args:
+        data (pandas.DataFrame): Data to correct
+        plan (CorrectionPlan): Correction plan
+
+    Returns:
+        tuple: (pandas.DataFrame, CorrectionReport) - Corrected data and report
+    """
+    return apply_plan(data, plan, plan.resolve(compute_statistics(data, plan)))
+
+
+def profile_chunks(chunks: typing.Iterable[pd.DataFrame], plan: CorrectionPlan,
+                   sample_size: int = DEFAULT_SAMPLE_SIZE, seed: int = None) -> dict:
+    """Compute plan statistics over chunks that do not fit in memory together
+
+    Moments are exact. Quantiles come from a uniform sample of at most sample_size rows,
+    kept by giving every row a random key and retaining the smallest keys, and are exact
+    when the data has no more rows than the sample.
+
+    Args:
+        chunks (Iterable[pandas.DataFrame]): Chunks of the data
+        plan (CorrectionPlan): Correction plan
+        sample_size (int): Maximum number of rows sampled for quantiles
+        seed (int): Random seed for the sample
+
+    Returns:
+        dict: Column statistics as returned by compute_statistics
+    """
+    rng = np.random.default_rng(seed)
+    levels = plan.quantile_levels()
+    moments, numeric, other = None, None, None
+    sample, sample_keys = None, np.empty(0)
+    missing_other = collections.Counter()
+    counts_other = collections.Counter()
+    modes = collections.defaultdict(collections.Counter)
+
+    for chunk in chunks:
+        if moments is None:
+            numeric, other = _split_columns(chunk, plan.columns)
+            moments = ColumnMoments(numeric)
+            sample = np.empty((0, len(numeric)))
+        values = _numeric_array(chunk, numeric)
+        moments.update(values)
+        if levels and len(chunk):
+            keys = rng.random(len(chunk))
+            sample, sample_keys = np.vstack([sample, values]), np.concatenate([sample_keys, keys])
+            if len(sample_keys) > sample_size:
+                keep = np.argpartition(sample_keys, sample_size)[:sample_size]
+                sample, sample_keys = sample[keep], sample_keys[keep]
+        for column in other:
+            missing_other[column] += int(chunk[column].isna().sum())
+            counts_other[column] += int(chunk[column].count())
+        if plan.impute_strategy == "most_frequent":
+            for column in plan.columns:
+                modes[column].update(chunk[column].value_counts(dropna=True).to_dict())
+
+    if moments is None:
+        return {column: {"count": 0, "missing": 0} for column in plan.columns}
+    statistics = moments.to_dict()
+    if levels and numeric and len(sample):
+        with np.errstate(all="ignore"):
+            quantiles = np.nanquantile(sample, levels, axis=0)
+        for index, column in enumerate(numeric):
+            statistics[column]["quantiles"] = {level: float(quantiles[position, index])
+                                               for position, level in enumerate(levels)
+                                               if not np.isnan(quantiles[position, index])}
+    for column in other:
+        statistics[column] = {"count": counts_other[column], "missing": missing_other[column]}
+    if plan.impute_strategy == "most_frequent":
+        for column in plan.columns:
+            most_common = modes[column].most_common(1)
+            statistics[column]["mode"] = _to_python(most_common[0][0]) if most_common else None
+    return statistics
+
+
+def correct_chunks(chunks: typing.Iterable[pd.DataFrame], plan: CorrectionPlan, resolved: dict,
+                   write_chunk: typing.Callable[[pd.DataFrame], None]) -> CorrectionReport:
+    """Correct chunks one at a time with fill values and bounds resolved beforehand
+
+    Args:
+        chunks (Iterable[pandas.DataFrame]): Chunks of the data
+        plan (CorrectionPlan): Correction plan
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+        write_chunk (Callable): Receives every corrected chunk
+
+    Returns:
+        CorrectionReport: Report accumulated over all chunks
+    """
+    report = None
+    for chunk in chunks:
+        corrected, report = apply_plan(chunk, plan, resolved, report)
+        write_chunk(corrected)
+    return report or CorrectionReport(plan, resolved, [], [])
+
+
+def correct_out_of_core(read_chunks: typing.Callable[[], typing.Iterable[pd.DataFrame]], plan: CorrectionPlan,
+                        write_chunk: typing.Callable[[pd.DataFrame], None],
+                        sample_size: int = DEFAULT_SAMPLE_SIZE) -> CorrectionReport:
+    """Correct data larger than memory in two streaming passes
+
+    Args:
+        read_chunks (Callable): Returns a fresh iterator over the data's chunks; called twice
+        plan (CorrectionPlan): Correction plan
+        write_chunk (Callable): Receives every corrected chunk
+        sample_size (int): Maximum number of rows sampled for quantiles
+
+    Returns:
+        CorrectionReport: Report accumulated over all chunks
+    """
+    resolved = plan.resolve(profile_chunks(read_chunks(), plan, sample_size=sample_size))
+    return correct_chunks(read_chunks(), plan, resolved, write_chunk)
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for BigQuery SQL"""
+    if "`" in name:
+        raise ValueError(f"Invalid column name: {name}")
+    return f"`{name}`"
+
+
+def compile_profile_sql(table: str, plan: CorrectionPlan) -> str:
+    """Compile one aggregate query computing every statistic the plan needs
+
+    Args:
+        table (str): Fully qualified table reference (project.dataset.table)
+        plan (CorrectionPlan): Correction plan
+
+    Returns:
+        str: BigQuery SQL query returning one row
+    """
+    levels = plan.quantile_levels()
+    selects = ["COUNT(*) AS row_count"]
+    for index, column in enumerate(plan.columns):
+        quoted = _quote_identifier(column)
+        selects.append(f"COUNTIF({quoted} IS NULL) AS c{index}_missing")
+        if plan.outlier_method or plan.impute_strategy in ("mean", "median"):
+            selects.extend([
+                f"AVG({quoted}) AS c{index}_mean",
+                f"STDDEV_POP({quoted}) AS c{index}_std",
+                f"MIN({quoted}) AS c{index}_min",
+                f"MAX({quoted}) AS c{index}_max"
+            ])
+        for position, level in enumerate(levels):
+            offset = int(round(level * SQL_QUANTILE_BUCKETS))
+            selects.append(f"APPROX_QUANTILES({quoted}, {SQL_QUANTILE_BUCKETS})[OFFSET({offset})] AS c{index}_q{position}")
+        if plan.impute_strategy == "most_frequent":
+            selects.append(f"APPROX_TOP_COUNT({quoted}, 1)[OFFSET(0)].value AS c{index}_mode")
+    return f"SELECT {', '.join(selects)} FROM `{table}`"
+
+
+def parse_profile_row(row: dict, plan: CorrectionPlan) -> dict:
+    """Convert the row returned by the profile query to column statistics
+
+    Args:
+        row (dict): Result row of compile_profile_sql
+        plan (CorrectionPlan): Correction plan
+
+    Returns:
+        dict: Column statistics as returned by compute_statistics
+    """
+    def number(value):
+        return None if value is None else float(value)
+
+    rows = int(row["row_count"])
+    levels = plan.quantile_levels()
+    statistics = {}
+    for index, column in enumerate(plan.columns):
+        missing = int(row[f"c{index}_missing"])
+        stats = {"count": rows - missing, "missing": missing}
+        if f"c{index}_mean" in row:
+            stats.update({key: number(row[f"c{index}_{key}"]) for key in ("mean", "std", "min", "max")})
+        if levels:
+            stats["quantiles"] = {level: number(row[f"c{index}_q{position}"])
+                                  for position, level in enumerate(levels) if row[f"c{index}_q{position}"] is not None}
+        if f"c{index}_mode" in row:
+            stats["mode"] = _to_python(row[f"c{index}_mode"])
+        statistics[column] = stats
+    return statistics
+
+
+def _compile_corrections(plan: CorrectionPlan, resolved: dict,
+                         column_types: typing.Mapping[str, str] = None) -> typing.Tuple[dict, list, dict]:
+    """Compile the corrected value of every column the plan changes
+
+    Args:
+        plan (CorrectionPlan): Correction plan
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+        column_types (Mapping[str, str]): BigQuery type of each column; corrected values of
+            integer and NUMERIC columns are cast back to the column type
+
+    Returns:
+        tuple: (dict, list, dict) - Column name to corrected SQL expression, conditions selecting
+            the rows that change, and query parameters
+    """
+    column_types = column_types or {}
+    expressions, conditions, parameters = {}, [], {}
+    for index, column in enumerate(plan.columns):
+        quoted = _quote_identifier(column)
+        bounds = resolved.get(column, {})
+        expression, changes = quoted, []
+        if bounds.get("fill") is not None:
+            parameters[f"fill_{index}"] = _to_python(bounds["fill"])
+            expression = f"COALESCE({expression}, @fill_{index})"
+            changes.append(f"{quoted} IS NULL")
+        if bounds.get("lower") is not None:
+            parameters[f"lower_{index}"] = float(bounds["lower"])
+            expression = f"GREATEST({expression}, @lower_{index})"
+            changes.append(f"{quoted} < @lower_{index}")
+        if bounds.get("upper") is not None:
+            parameters[f"upper_{index}"] = float(bounds["upper"])
+            expression = f"LEAST({expression}, @upper_{index})"
+            changes.append(f"{quoted} > @upper_{index}")
+        if not changes:
+            continue
+        cast = SQL_TYPE_CASTS.get(str(column_types.get(column, "")).upper())
+        if cast:
+            expression = cast.format(expression)
+        expressions[column] = expression
+        conditions.extend(changes)
+
+    if not expressions:
+        raise ValueError("Correction plan does not change any column")
+    return expressions, conditions, parameters
+
+
+def _used_parameters(statement: str, parameters: dict) -> dict:
+    """Keep only the query parameters a statement references"""
+    return {name: value for name, value in parameters.items() if re.search(rf"@{name}\b", statement)}
+
+
+def compile_correction_sql(table: str, plan: CorrectionPlan, resolved: dict,
+                           column_types: typing.Mapping[str, str] = None) -> typing.Tuple[str, dict]:
+    """Compile the correction into one set-based UPDATE statement
+
+    Args:
+        table (str): Fully qualified table reference (project.dataset.table)
+        plan (CorrectionPlan): Correction plan
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+        column_types (Mapping[str, str]): BigQuery type of each column, whose corrected values are cast back to it
+
+    Returns:
+        tuple: (str, dict) - BigQuery UPDATE statement and its query parameters
+    """
+    expressions, conditions, parameters = _compile_corrections(plan, resolved, column_types)
+    assignments = [f"{_quote_identifier(column)} = {expression}" for column, expression in expressions.items()]
+    statement = f"UPDATE `{table}` SET {', '.join(assignments)} WHERE {' OR '.join(conditions)}"
+    return statement, parameters
+
+
+def compile_preview_sql(table: str, plan: CorrectionPlan, resolved: dict, column_types: typing.Mapping[str, str] = None,
+                        numeric_columns: typing.Iterable[str] = None) -> typing.Tuple[str, dict]:
+    """Compile one aggregate query over the corrected values without changing the table
+
+    The query evaluates the same expressions as compile_correction_sql, so the statistics
+    the UPDATE would produce can be validated before any row is written.
+
+    Args:
+        table (str): Fully qualified table reference (project.dataset.table)
+        plan (CorrectionPlan): Correction plan
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+        column_types (Mapping[str, str]): BigQuery type of each column, whose corrected values are cast back to it
+        numeric_columns (Iterable[str]): Columns with numeric type; defaults to the columns the
+            profile query computed moments for
+
+    Returns:
+        tuple: (str, dict) - BigQuery SQL query returning one row, and its query parameters
+    """
+    expressions, _, parameters = _compile_corrections(plan, resolved, column_types)
+    numeric_columns = set(numeric_columns) if numeric_columns is not None else None
+    selects = ["COUNT(*) AS row_count"]
+    for index, column in enumerate(plan.columns):
+        quoted = _quote_identifier(column)
+        expression = expressions.get(column, quoted)
+        selects.append(f"COUNTIF({expression} IS NULL) AS c{index}_missing")
+        if (column in numeric_columns) if numeric_columns is not None else (
+                plan.outlier_method or plan.impute_strategy in ("mean", "median")):
+            selects.extend([
+                f"AVG({expression}) AS c{index}_mean",
+                f"STDDEV_POP({expression}) AS c{index}_std",
+                f"MIN({expression}) AS c{index}_min",
+                f"MAX({expression}) AS c{index}_max"
+            ])
+        # Count against the bounds that resolved, like _compile_corrections
+        outside = [f"{quoted} {operator} @{bound}_{index}" for bound, operator in (("lower", "<"), ("upper", ">"))
+                   if f"{bound}_{index}" in parameters]
+        if outside:
+            selects.append(f"COUNTIF({' OR '.join(outside)}) AS c{index}_outliers")
+    query = f"SELECT {', '.join(selects)} FROM `{table}`"
+    return query, _used_parameters(query, parameters)
+
+
+def parse_preview_row(row: dict, plan: CorrectionPlan) -> dict:
+    """Convert the row returned by the preview query to statistics of the corrected columns
+
+    Args:
+        row (dict): Result row of compile_preview_sql
+        plan (CorrectionPlan): Correction plan
+
+    Returns:
+        dict: Column name to {"count", "missing", "mean", "std", "min", "max", "outliers"}
+    """
+    rows = int(row["row_count"])
+    statistics = {}
+    for index, column in enumerate(plan.columns):
+        missing = int(row[f"c{index}_missing"])
+        stats = {"count": rows - missing, "missing": missing}
+        for key in ("mean", "std", "min", "max"):
+            if f"c{index}_{key}" in row:
+                stats[key] = None if row[f"c{index}_{key}"] is None else float(row[f"c{index}_{key}"])
+        if f"c{index}_outliers" in row:
+            stats["outliers"] = int(row[f"c{index}_outliers"] or 0)
+        statistics[column] = stats
+    return statistics
+
+
+def compile_backup_sql(table: str, backup_table: str, plan: CorrectionPlan, resolved: dict) -> typing.Tuple[str, dict]:
+    """Compile a statement copying the rows the correction will change into a backup table
+
+    Args:
+        table (str): Fully qualified table reference (project.dataset.table)
+        backup_table (str): Fully qualified reference of the backup table to create
+        plan (CorrectionPlan): Correction plan
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+
+    Returns:
+        tuple: (str, dict) - CREATE TABLE AS SELECT statement and its query parameters
+    """
+    _, conditions, parameters = _compile_corrections(plan, resolved)
+    statement = f"CREATE TABLE `{backup_table}` AS SELECT * FROM `{table}` WHERE {' OR '.join(conditions)}"
+    return statement, _used_parameters(statement, parameters)
+
+
+def validate_report(details: dict, validation_rules: dict = None) -> typing.Tuple[bool, dict]:
+    """Validate a correction from the statistics recorded while correcting
+
+    Args:
+        details (dict): Column details from CorrectionReport.get_column_details
+        validation_rules (dict): Optional "max_mean_shift" in standard deviations of the original data
+
+    Returns:
+        tuple: (bool, dict) - Validation result and per-column checks
+    """
+    rules = validation_rules or {}
+    max_mean_shift = rules.get("max_mean_shift", DEFAULT_MAX_MEAN_SHIFT)
+    results = {}
+    for column, entry in details.items():
+        before, after = entry.get("before") or {}, entry.get("after") or {}
+        checks = {}
+        if entry.get("imputation_method") and entry.get("fill_value") is not None:
+            checks["missing_resolved"] = after.get("missing") == 0
+        if entry.get("lower_bound") is not None and after.get("min") is not None:
+            checks["within_bounds"] = (after["min"] >= entry["lower_bound"] - 1e-9
+                                       and after["max"] <= entry["upper_bound"] + 1e-9)
+        if before.get("mean") is not None and after.get("mean") is not None:
+            scale = before.get("std") or 1.0
+            shift = abs(after["mean"] - before["mean"]) / scale
+            checks["mean_shift"] = shift
+            checks["mean_shift_ok"] = shift <= max_mean_shift
+        checks["missing_before"] = before.get("missing")
+        checks["missing_after"] = after.get("missing")
+        checks["outliers_capped"] = entry.get("outlier_count", 0)
+        checks["passed"] = all(value for key, value in checks.items() if key in ("missing_resolved", "within_bounds", "mean_shift_ok"))
+        results[column] = checks
+    return all(checks["passed"] for checks in results.values()), results
+
+
+def summarize_pushdown(plan: CorrectionPlan, statistics: dict, resolved: dict, corrected_statistics: dict) -> dict:
+    """Summarize a pushdown correction from its profile and preview statistics
+
+    Args:
+        plan (CorrectionPlan): Executed plan
+        statistics (dict): Profile statistics from parse_profile_row
+        resolved (dict): Fill values and bounds from CorrectionPlan.resolve
+        corrected_statistics (dict): Statistics of the corrected values from parse_preview_row
+
+    Returns:
+        dict: Column details shaped like CorrectionReport.get_column_details
+    """
+    details = {}
+    for column in plan.columns:
+        before = {key: value for key, value in statistics.get(column, {}).items() if key not in ("quantiles", "mode")}
+        after = dict(corrected_statistics.get(column, {}))
+        outlier_count = after.pop("outliers", 0)
+        bounds = resolved.get(column, {})
+        details[column] = {
+            "missing_count": before.get("missing", 0),
+            "imputed_count": before.get("missing", 0) - after.get("missing", 0),
+            "outlier_count": outlier_count,
+            "imputation_method": plan.impute_strategy,
+            "correction_method": plan.method,
+            "fill_value": _to_python(bounds.get("fill")),
+            "lower_bound": _to_python(bounds.get("lower")),
+            "upper_bound": _to_python(bounds.get("upper")),
+            "before": before,
+            "after": after
+        }
+    return details
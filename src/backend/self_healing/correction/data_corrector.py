@@ -10,7 +10,6 @@ import json
 # Import third-party libraries with version specification
 import pandas as pd  # version 2.0.x
 import numpy as np  # version 1.24.x
-from sklearn.impute import SimpleImputer  # scikit-learn 1.2.x
 
 # Import internal modules
 from src.backend import constants  # Import enumerations for healing action types and alert severity levels
@@ -23,7 +22,7 @@ from src.backend.self_healing.ai.root_cause_analyzer import RootCauseAnalysis  #
 from src.backend.self_healing.config import healing_config  # Access self-healing configuration settings
 from src.backend.db.repositories.healing_repository import HealingRepository  # Access healing-related data from the database
 from src.backend.db.models.healing_action import HealingAction  # Use healing action model for correction tracking
-from src.backend.db.models.healing_execution import HealingExecution, create_healing_execution  # Track healing execution attempts and results
+from src.backend.self_healing.correction.correction_engine import CorrectionPlan, ColumnMoments, correct_dataframe, correct_out_of_core, compile_profile_sql, parse_profile_row, compile_correction_sql, compile_preview_sql, parse_preview_row, compile_backup_sql, summarize_pushdown, validate_report, DEFAULT_SAMPLE_SIZE  # Vectorized, chunked and SQL pushdown corrections
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -31,6 +30,11 @@ logger = get_logger(__name__)
 # Define global constants
 CORRECTION_STRATEGIES = {"missing_values": ["mean_imputation", "median_imputation", "mode_imputation", "constant_imputation", "regression_imputation", "knn_imputation"], "outliers": ["winsorization", "trimming", "iqr_filtering", "z_score_filtering", "isolation_forest"], "format_errors": ["date_format_correction", "number_format_correction", "string_format_correction", "type_conversion"], "schema_drift": ["column_mapping", "type_casting", "default_values"], "data_corruption": ["checksum_validation", "reconstruction", "fallback_to_previous"]}
 DEFAULT_CORRECTION_PARAMS = {"mean_imputation": {"strategy": "mean"}, "median_imputation": {"strategy": "median"}, "mode_imputation": {"strategy": "most_frequent"}, "constant_imputation": {"fill_value": 0}, "winsorization": {"limits": [0.05, 0.05]}, "iqr_filtering": {"factor": 1.5}, "z_score_filtering": {"threshold": 3.0}}
+IMPUTATION_STRATEGY_NAMES = {"mean_imputation": "mean", "median_imputation": "median", "mode_imputation": "most_frequent", "constant_imputation": "constant"}
+OUTLIER_STRATEGY_NAMES = ["winsorization", "iqr_filtering", "z_score_filtering"]
+PUSHDOWN_LOCATION_TYPES = ["bigquery"]
+# BigQuery column types whose corrected values are profiled with moments and bounds
+NUMERIC_FIELD_TYPES = ("INTEGER", "INT64", "FLOAT", "FLOAT64", "NUMERIC", "BIGNUMERIC")
 
 
 def get_correction_strategy(issue_type: str, rule_id: str = None) -> typing.Tuple[str, dict]:
@@ -84,15 +88,11 @@ def apply_correction(data: pd.DataFrame, strategy: str, parameters: dict, target
     if not isinstance(target_columns, list):
         raise ValueError("Target columns must be a list")
     # Select appropriate correction function based on strategy
-    if strategy == "mean_imputation":
+    if strategy in IMPUTATION_STRATEGY_NAMES:
         # Apply correction to target columns in data
-        return correct_missing_values(data, "mean", parameters, target_columns)
-    elif strategy == "median_imputation":
-        return correct_missing_values(data, "median", parameters, target_columns)
-    elif strategy == "mode_imputation":
-        return correct_missing_values(data, "most_frequent", parameters, target_columns)
-    elif strategy == "constant_imputation":
-        return correct_missing_values(data, "constant", parameters, target_columns)
+        return correct_missing_values(data, IMPUTATION_STRATEGY_NAMES[strategy], parameters, target_columns)
+    elif strategy in OUTLIER_STRATEGY_NAMES:
+        return correct_outliers(data, strategy, parameters, target_columns)
     else:
         raise ValueError(f"Unsupported correction strategy: {strategy}")
 
@@ -109,20 +109,11 @@ def correct_missing_values(data: pd.DataFrame, strategy: str, parameters: dict,
     Returns:
         tuple: (pandas.DataFrame, dict) - Corrected data and correction details
     """
-    # Create a copy of the input dataframe
-    corrected_data = data.copy()
-    # Initialize correction details dictionary
-    correction_details = {}
-    # For each target column, count missing values
-    for column in target_columns:
-        missing_count = corrected_data[column].isnull().sum()
-        # Apply specified imputation strategy (mean, median, mode, constant, etc.)
-        imputer = SimpleImputer(strategy=strategy, **parameters)
-        corrected_data[column] = imputer.fit_transform(corrected_data[[column]])
-        # Track number of values imputed and method used
-        correction_details[column] = {"missing_count": missing_count, "imputation_method": strategy}
-    # Return corrected dataframe and correction details
-    return corrected_data, correction_details
+    # Impute all target columns together in one vectorized pass over a copy of the data
+    plan = CorrectionPlan(target_columns, impute_strategy=strategy, fill_value=parameters.get("fill_value", 0))
+    corrected_data, report = correct_dataframe(data, plan)
+    # Per-column details carry counts and the before/after statistics used by validate_correction
+    return corrected_data, report.get_column_details()
 
 
 def correct_outliers(data: pd.DataFrame, strategy: str, parameters: dict, target_columns: list) -> typing.Tuple[pd.DataFrame, dict]:
@@ -137,17 +128,92 @@ def correct_outliers(data: pd.DataFrame, strategy: str, parameters: dict, target
     Returns:
         tuple: (pandas.DataFrame, dict) - Corrected data and correction details
     """
-    # Create a copy of the input dataframe
-    corrected_data = data.copy()
-    # Initialize correction details dictionary
-    correction_details = {}
-    # For each target column, identify outliers using specified method
-    for column in target_columns:
-        # Apply correction strategy (winsorization, trimming, etc.)
-        # Track number of outliers corrected and method used
-        correction_details[column] = {"outlier_count": 0, "correction_method": strategy}
-    # Return corrected dataframe and correction details
-    return corrected_data, correction_details
+    # Outliers are capped to bounds computed once for all target columns, so no rows are dropped
+    if strategy not in OUTLIER_STRATEGY_NAMES:
+        raise ValueError(f"Unsupported outlier correction strategy: {strategy}")
+    plan = CorrectionPlan.from_strategy(strategy, parameters, target_columns)
+    corrected_data, report = correct_dataframe(data, plan)
+    # Per-column details carry counts and the before/after statistics used by validate_correction
+    return corrected_data, report.get_column_details()
+
+
+def correct_in_chunks(read_chunks: typing.Callable[[], typing.Iterable[pd.DataFrame]], strategy: str, parameters: dict,
+                      target_columns: list, write_chunk: typing.Callable[[pd.DataFrame], None],
+                      sample_size: int = DEFAULT_SAMPLE_SIZE) -> dict:
+    """Applies an imputation or outlier strategy to data larger than memory
+
+    Args:
+        read_chunks (Callable): Returns a fresh iterator over DataFrame chunks; called once per pass
+        strategy (str): strategy
+        parameters (dict): parameters
+        target_columns (list): target_columns
+        write_chunk (Callable): Receives every corrected chunk
+        sample_size (int): Maximum number of rows sampled for quantiles
+
+    Returns:
+        dict: Correction details
+    """
+    # First pass profiles the chunks, second pass corrects them one at a time
+    plan = CorrectionPlan.from_strategy(strategy, parameters, target_columns)
+    report = correct_out_of_core(read_chunks, plan, write_chunk, sample_size=sample_size)
+    return report.get_column_details()
+
+
+def correct_in_warehouse(bq_client: BigQueryClient, dataset: str, table: str, strategy: str, parameters: dict,
+                         target_columns: list, validation_rules: dict = None,
+                         create_backup: bool = True, project: str = None) -> typing.Tuple[bool, dict]:
+    """Applies an imputation or outlier strategy inside BigQuery with one UPDATE statement
+
+    The corrected values are profiled by a read-only query and validated first; the UPDATE
+    only runs when they pass, after the rows it changes are copied to a backup table.
+
+    Args:
+        bq_client (BigQueryClient): Client for the table's project (or a local query engine)
+        dataset (str): dataset
+        table (str): table
+        strategy (str): strategy
+        parameters (dict): parameters
+        target_columns (list): target_columns
+        validation_rules (dict): validation_rules
+        create_backup (bool): create_backup
+        project (str): Project of the table; defaults to the client's project
+
+    Returns:
+        tuple: (bool, dict) - Whether the correction was applied, and the correction details,
+            validation results and backup table
+    """
+    plan = CorrectionPlan.from_strategy(strategy, parameters, target_columns)
+    project = project or bq_client.project_id
+    table_ref = f"{project}.{dataset}.{table}"
+    # One aggregate query computes every statistic the correction needs
+    statistics = parse_profile_row(bq_client.query(compile_profile_sql(table_ref, plan))[0], plan)
+    resolved = plan.resolve(statistics)
+    schema = bq_client.get_table(project, dataset, table).schema
+    column_types = {field.name: field.field_type for field in schema}
+    numeric_columns = [field.name for field in schema if field.field_type in NUMERIC_FIELD_TYPES]
+
+    # A second aggregate query profiles the corrected values without changing any row
+    preview_sql, preview_parameters = compile_preview_sql(table_ref, plan, resolved, column_types, numeric_columns)
+    corrected_statistics = parse_preview_row(bq_client.query(preview_sql, preview_parameters)[0], plan)
+    correction_details = summarize_pushdown(plan, statistics, resolved, corrected_statistics)
+    success, validation_results = validate_report(correction_details, validation_rules)
+    result = {"correction_details": correction_details, "validation_results": validation_results, "backup_table": None}
+    if not success:
+        logger.warning(f"Skipped {strategy} on {dataset}.{table}: corrected values failed validation {validation_results}")
+        return False, result
+
+    if create_backup:
+        backup_table = f"{table}_backup_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+        backup_sql, backup_parameters = compile_backup_sql(table_ref, f"{project}.{dataset}.{backup_table}",
+                                                           plan, resolved)
+        bq_client.execute_query(backup_sql, parameters=backup_parameters)
+        result["backup_table"] = backup_table
+
+    # One set-based UPDATE rewrites only the rows that need a correction
+    statement, query_parameters = compile_correction_sql(table_ref, plan, resolved, column_types)
+    bq_client.execute_query(statement, parameters=query_parameters)
+    logger.info(f"Applied {strategy} to {dataset}.{table} in place for columns {target_columns}")
+    return True, result
 
 
 def correct_format_errors(data: pd.DataFrame, strategy: str, parameters: dict, target_columns: list) -> typing.Tuple[pd.DataFrame, dict]:
@@ -232,14 +298,39 @@ def validate_correction(original_data: pd.DataFrame, corrected_data: pd.DataFram
     Returns:
         tuple: (bool, dict) - Validation result and details
     """
-    # Initialize validation result dictionary
-    validation_results = {}
     # Check that corrected data has expected structure
-    # Verify that targeted issues were addressed
-    # Apply validation rules to corrected data
-    # Calculate improvement metrics
-    # Return validation success boolean and details
-    return True, validation_results
+    if original_data is not None and corrected_data is not None and len(corrected_data) != len(original_data):
+        return False, {"row_count": {"before": len(original_data), "after": len(corrected_data), "passed": False}}
+    # Use the before/after statistics recorded by the correction pass; compute them only when missing
+    details = {}
+    for column, entry in (correction_details or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        entry = dict(entry)
+        if "before" not in entry and original_data is not None and column in original_data.columns:
+            entry["before"] = _column_statistics(original_data, column)
+        if "after" not in entry and corrected_data is not None and column in corrected_data.columns:
+            entry["after"] = _column_statistics(corrected_data, column)
+        details[column] = entry
+    # Verify that targeted issues were addressed and statistics stayed within the validation rules
+    return validate_report(details, validation_rules)
+
+
+def _column_statistics(data: pd.DataFrame, column: str) -> dict:
+    """Computes the statistics of one column recorded by correction passes
+
+    Args:
+        data (pandas.DataFrame): data
+        column (str): column
+
+    Returns:
+        dict: Column statistics
+    """
+    if not pd.api.types.is_numeric_dtype(data[column]) or pd.api.types.is_bool_dtype(data[column]):
+        return {"count": int(data[column].count()), "missing": int(data[column].isna().sum())}
+    moments = ColumnMoments([column])
+    moments.update(data[[column]].to_numpy(dtype=float, na_value=np.nan))
+    return moments.to_dict()[column]
 
 
 def load_data_for_correction(source_info: dict) -> pd.DataFrame:
@@ -345,14 +436,7 @@ class DataCorrector:
         Returns:
             tuple: (bool, dict) - Success status and correction details
         """
-        # Extract affected columns and data location from issue_data
-        # Determine imputation strategy based on data characteristics
-        # Load data from source
-        # Apply missing value correction
-        # Validate correction was successful
-        # Save corrected data back to source
-        # Return success status and correction details
-        pass
+        return self._correct_with_engine(issue_data, classification, "missing_values")
 
     def correct_outliers_issue(self, issue_data: dict, classification: IssueClassification) -> typing.Tuple[bool, dict]:
         """Correct outliers in data
@@ -361,17 +445,60 @@ class DataCorrector:
             issue_data (dict): issue_data
             classification (IssueClassification): classification
 
+        Returns:
+            tuple: (bool, dict) - Success status and correction details
+        """
+        return self._correct_with_engine(issue_data, classification, "outliers")
+
+    def _correct_with_engine(self, issue_data: dict, classification: IssueClassification, issue_type: str) -> typing.Tuple[bool, dict]:
+        """Correct missing values or outliers where the data lives when possible
+
+        BigQuery tables are corrected in place by one UPDATE statement unless pushdown is
+        disabled in the config; other sources are loaded and corrected in one vectorized pass.
+
+        Args:
+            issue_data (dict): issue_data
+            classification (IssueClassification): classification
+            issue_type (str): missing_values or outliers
+
         Returns:
             tuple: (bool, dict) - Success status and correction details
         """
         # Extract affected columns and data location from issue_data
-        # Determine outlier correction strategy based on data characteristics
-        # Load data from source
-        # Apply outlier correction
-        # Validate correction was successful
-        # Save corrected data back to source
-        # Return success status and correction details
-        pass
+        target_columns = self._get_affected_columns(issue_data, classification)
+        source_info = self._get_data_source_info(issue_data)
+        if not target_columns or not source_info:
+            logger.error(f"Issue {issue_data.get('issue_id')} has no affected columns or data location")
+            return False, {"error": "Missing affected columns or data location"}
+        strategy, parameters = get_correction_strategy(issue_type, issue_data.get("rule_id"))
+        parameters = {**(parameters or {}), **issue_data.get("correction_parameters", {})}
+        validation_rules = issue_data.get("validation_rules", {})
+        backup_table = None
+
+        try:
+            if source_info.get("type") in PUSHDOWN_LOCATION_TYPES and self._bq_client and self._config.get("pushdown_enabled", True):
+                # Validated before the UPDATE runs, so a failed validation leaves the table unchanged
+                success, pushdown = correct_in_warehouse(self._bq_client, source_info["dataset"], source_info["table"],
+                                                         strategy, parameters, target_columns, validation_rules,
+                                                         project=source_info.get("project"))
+                correction_details, validation_results = pushdown["correction_details"], pushdown["validation_results"]
+                backup_table = pushdown["backup_table"]
+                save_successful = True
+            else:
+                data = load_data_for_correction(source_info)
+                corrected_data, correction_details = apply_correction(data, strategy, parameters, target_columns)
+                success, validation_results = validate_correction(data, corrected_data, correction_details, validation_rules)
+                # Only a validated correction is written back
+                save_successful = success and save_corrected_data(corrected_data, source_info, create_backup=True)
+        except Exception as e:
+            logger.error(f"Failed to correct {issue_type} for issue {issue_data.get('issue_id')}: {e}")
+            return False, {"strategy": strategy, "parameters": parameters, "error": str(e)}
+
+        result = {"issue_id": issue_data.get("issue_id"), "strategy": strategy, "parameters": parameters,
+                  "correction_details": correction_details, "validation_results": validation_results}
+        if backup_table:
+            result["backup_table"] = backup_table
+        return bool(success and save_successful), result
 
     def correct_format_errors_issue(self, issue_data: dict, classification: IssueClassification) -> typing.Tuple[bool, dict]:
         """Correct format errors in data
@@ -470,16 +597,14 @@ class DataCorrector:
         Returns:
             str: Healing execution ID
         """
-        # Create healing execution record
-        healing_execution = create_healing_execution(execution_id, pattern_id, action_id, issue_details={}, validation_id=validation_id)
-        # Update execution with result and details
-        healing_execution.confidence_score = confidence_score
-        healing_execution.execution_details = execution_details
-        healing_execution.successful = successful
-        # Update related healing action success rate
-        # Update related issue pattern stats
-        # Return healing execution ID
-        pass
+        if self._healing_repository is None:
+            logger.warning(f"No healing repository, correction execution for {execution_id} not recorded")
+            return None
+        # Completing the execution updates the action, pattern and success rate statistics
+        return self._healing_repository.record_completed_execution(
+            execution_id, pattern_id, action_id, confidence_score, successful, execution_details,
+            validation_id=validation_id
+        )
 
     def _update_correction_history(self, correction_result: dict) -> None:
         """Update the correction history with a new result
@@ -501,11 +626,24 @@ class DataCorrector:
         Returns:
             dict: Source information dictionary
         """
-        # Extract source type (GCS, BigQuery, etc.)
-        # Extract location details (bucket, path, dataset, table, etc.)
-        # Extract authentication information if needed
-        # Return structured source information dictionary
-        pass
+        # Extract source type (GCS, BigQuery, etc.) and location details (bucket, path, dataset, table, etc.)
+        location = issue_data.get("data_location")
+        if isinstance(location, dict):
+            source_info = dict(location)
+            if "type" not in source_info:
+                source_info["type"] = "bigquery" if "table" in source_info else "gcs"
+            return source_info
+        if isinstance(location, str) and location.startswith("gs://"):
+            bucket, _, path = location[len("gs://"):].partition("/")
+            return {"type": "gcs", "bucket": bucket, "path": path}
+        if isinstance(location, str) and location.count(".") in (1, 2):
+            # dataset.table or project.dataset.table
+            parts = location.split(".")
+            source_info = {"type": "bigquery", "dataset": parts[-2], "table": parts[-1]}
+            if len(parts) == 3:
+                source_info["project"] = parts[0]
+            return source_info
+        return {}
 
     def _get_affected_columns(self, issue_data: dict, classification: IssueClassification) -> list:
         """Extract affected columns from issue data
@@ -518,6 +656,11 @@ class DataCorrector:
             list: List of affected column names
         """
         # Extract column information from issue_data
+        columns = issue_data.get("affected_columns")
         # If not available, infer from classification
+        if not columns and classification is not None:
+            columns = (classification.features or {}).get("affected_columns")
         # Return list of affected column names
-        pass
\ No newline at end of file
+        if isinstance(columns, str):
+            return [columns]
+        return list(columns or [])
\ No newline at end of file
@@ -0,0 +1,299 @@
+"""
+Coalescing of issue storms in the healing pipeline.
+
+When an upstream table breaks, every downstream check and task reports its own copy of the
+same failure, and each copy used to run classification, root cause analysis, resolution
+selection and possibly a recovery of its own. IssueCoalescer collapses such a storm:
+
+- Issues are keyed by a fingerprint of their category, type, target and normalized error
+  signature, so copies that differ only in IDs, timestamps or counts share a key.
+- The first issue of a fingerprint runs the work in the caller's thread. Duplicates that
+  arrive while it runs, or within the window after it started, block in their own callers'
+  threads until it finishes and receive its result (or its exception) instead of
+  recomputing it.
+- The work holds a per-target lock shared by every coalescer in the process, so two
+  recoveries never run against the same dataset or pipeline at the same time, even when
+  their fingerprints differ. The locks are reentrant, so a recovery started from within an
+  analysis on the same thread does not deadlock.
+"""
+
+import concurrent.futures
+import contextlib
+import hashlib
+import threading
+import time
+import typing
+
+from src.backend.utils.logging.logger import get_logger  # Configure logging for issue coalescing
+from src.backend.self_healing.ai.feature_vectorizer import normalize_error_signature  # Normalize error messages shared by repeats
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_COALESCING_WINDOW_SECONDS = 60.0
+COALESCING_METRIC_TYPE = "self_healing/coalesced_issues"
+
+# Issue fields holding the error text, in order of preference
+ERROR_MESSAGE_FIELDS = ["error_message", "error", "message", "description"]
+
+
+class CoalescedResult(typing.NamedTuple):
+    """Result of a coalesced call and whether it was shared from another issue"""
+    result: typing.Any
+    coalesced: bool
+    leader_id: typing.Optional[str]
+    fingerprint: str
+
+
+def _issue_value(issue_data: dict, *keys: str) -> typing.Any:
+    """Get the first present value of the keys from an issue or its data location"""
+    location = issue_data.get("data_location")
+    for key in keys:
+        if issue_data.get(key):
+            return issue_data[key]
+        if isinstance(location, dict) and location.get(key):
+            return location[key]
+    return None
+
+
+def recovery_target(issue_data: dict) -> typing.Optional[str]:
+    """Get the dataset or pipeline a recovery for an issue would act on
+
+    Args:
+        issue_data (dict): Issue data or recovery context
+
+    Returns:
+        str: "dataset:<dataset>" or "pipeline:<pipeline>", or None if the issue names neither
+    """
+    if not isinstance(issue_data, dict):
+        return None
+    dataset = _issue_value(issue_data, "dataset", "dataset_id")
+    if not dataset and isinstance(issue_data.get("data_location"), str) and "." in issue_data["data_location"]:
+        dataset = issue_data["data_location"].split(".")[-2]
+    if dataset:
+        return f"dataset:{dataset}"
+    pipeline = _issue_value(issue_data, "pipeline_id", "dag_id", "pipeline_name")
+    if pipeline:
+        return f"pipeline:{pipeline}"
+    return None
+
+
+def issue_fingerprint(issue_data: dict, classification: typing.Any = None) -> str:
+    """Compute the fingerprint shared by near-identical issues
+
+    Args:
+        issue_data (dict): Issue data or recovery context
+        classification (IssueClassification): Optional classification supplying category, type and description
+
+    Returns:
+        str: Hex digest of the category, type, target, table and normalized error signature
+    """
+    issue_data = issue_data if isinstance(issue_data, dict) else {}
+    category = getattr(classification, "issue_category", None) or issue_data.get("issue_category") or issue_data.get("category")
+    issue_type = getattr(classification, "issue_type", None) or issue_data.get("issue_type") or issue_data.get("type")
+    message = next((issue_data[field] for field in ERROR_MESSAGE_FIELDS if issue_data.get(field)), None)
+    if message is None and classification is not None:
+        message = getattr(classification, "description", None)
+    parts = [
+        str(category or ""),
+        str(issue_type or ""),
+        recovery_target(issue_data) or "",
+        str(_issue_value(issue_data, "table", "table_id", "task_id") or ""),
+        normalize_error_signature(message) if message else ""
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class TargetLocks:
+    """Reentrant locks per recovery target, created on first use and dropped when unused"""
+
+    def __init__(self):
+        """Initialize an empty lock registry"""
+        self._locks: typing.Dict[str, typing.List[typing.Any]] = {}
+        self._lock = threading.Lock()
+        self._acquisitions = 0
+        self._waits = 0
+
+    @contextlib.contextmanager
+    def hold(self, target: typing.Optional[str]) -> typing.Iterator[None]:
+        """Hold the lock of a target for the duration of the block
+
+        Args:
+            target (str): Recovery target; None holds no lock
+        """
+        if target is None:
+            yield
+            return
+        with self._lock:
+            entry = self._locks.setdefault(target, [threading.RLock(), 0])
+            entry[1] += 1
+            self._acquisitions += 1
+        lock = entry[0]
+        if not lock.acquire(blocking=False):
+            with self._lock:
+                self._waits += 1
+            logger.info(f"Waiting for the running recovery of {target}")
+            lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0 and self._locks.get(target) is entry:
+                    del self._locks[target]
+
+    def is_locked(self, target: str) -> bool:
+        """Check whether any thread holds or waits for the lock of a target"""
+        with self._lock:
+            return target in self._locks
+
+    def get_stats(self) -> dict:
+        """Get lock acquisition counters
+
+        Returns:
+            dict: Acquisitions, acquisitions that had to wait and targets currently held
+        """
+        with self._lock:
+            return {"acquisitions": self._acquisitions, "waits": self._waits, "held_targets": len(self._locks)}
+
+
+# Process-wide target locks shared by every coalescer
+_target_locks = None
+_target_locks_lock = threading.Lock()
+
+
+def get_target_locks() -> TargetLocks:
+    """Get the process-wide target lock registry
+
+    Returns:
+        TargetLocks: Shared registry
+    """
+    global _target_locks
+    with _target_locks_lock:
+        if _target_locks is None:
+            _target_locks = TargetLocks()
+        return _target_locks
+
+
+class _Flight:
+    """One execution shared by the issues of a fingerprint"""
+    __slots__ = ("future", "started_at", "leader_id", "attached")
+
+    def __init__(self, started_at: float, leader_id: typing.Optional[str]):
+        self.future = concurrent.futures.Future()
+        self.started_at = started_at
+        self.leader_id = leader_id
+        self.attached = 0
+
+
+class IssueCoalescer:
+    """Runs work once per issue fingerprint and window, sharing the result with duplicates"""
+
+    def __init__(self, name: str = "issues", window_seconds: float = DEFAULT_COALESCING_WINDOW_SECONDS,
+                 target_locks: TargetLocks = None, metric_client: typing.Any = None,
+                 clock: typing.Callable[[], float] = time.monotonic):
+        """Initialize the coalescer
+
+        Args:
+            name (str): Name used in log messages and metric labels
+            window_seconds (float): Time after a flight started during which duplicates share its result
+            target_locks (TargetLocks): Lock registry (the process-wide registry when omitted)
+            metric_client (MetricClient): Optional buffered metric client for coalescing counters
+            clock (Callable): Monotonic time source
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self._target_locks = target_locks or get_target_locks()
+        self._metric_client = metric_client
+        self._clock = clock
+        self._flights: typing.Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {"issues": 0, "executions": 0, "coalesced": 0, "failures": 0, "largest_storm": 0}
+
+    def run(self, fingerprint: str, fn: typing.Callable[..., typing.Any], *args, issue_id: str = None,
+            target: str = None, timeout: float = None, **kwargs) -> CoalescedResult:
+        """Run work for an issue, or attach to the run already started for its fingerprint
+
+        Args:
+            fingerprint (str): Fingerprint of the issue, usually from issue_fingerprint
+            fn (Callable): Work to run for the first issue of the fingerprint
+            *args: Positional arguments for fn
+            issue_id (str): ID of the issue, reported to duplicates as the leader ID
+            target (str): Recovery target whose lock is held while fn runs
+            timeout (float): Maximum seconds a duplicate waits for the shared result
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            CoalescedResult: Result of fn, and whether it was shared from another issue
+        """
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            self._stats["issues"] += 1
+            flight = self._flights.get(fingerprint)
+            leader = flight is None
+            if leader:
+                flight = self._flights[fingerprint] = _Flight(now, issue_id)
+                self._stats["executions"] += 1
+                self._stats["largest_storm"] = max(self._stats["largest_storm"], 1)
+            else:
+                flight.attached += 1
+                self._stats["coalesced"] += 1
+                self._stats["largest_storm"] = max(self._stats["largest_storm"], flight.attached + 1)
+        if not leader:
+            self._record_metric("coalesced")
+            return CoalescedResult(flight.future.result(timeout=timeout), True, flight.leader_id, fingerprint)
+
+        self._record_metric("executed")
+        try:
+            with self._target_locks.hold(target):
+                result = fn(*args, **kwargs)
+        except BaseException as e:
+            flight.future.set_exception(e)
+            with self._lock:
+                self._stats["failures"] += 1
+                # A failed run is not shared with issues arriving after it finished
+                if self._flights.get(fingerprint) is flight:
+                    del self._flights[fingerprint]
+            raise
+        flight.future.set_result(result)
+        if flight.attached:
+            logger.info(f"{self.name}: {flight.attached} duplicate issues shared the result of issue {issue_id}")
+        return CoalescedResult(result, False, issue_id, fingerprint)
+
+    def get_stats(self) -> dict:
+        """Get coalescing counters and ratio
+
+        Returns:
+            dict: Issues seen, executions, coalesced issues, failures, largest storm, flights
+                in the window, coalescing ratio and target lock counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["flights"] = len(self._flights)
+        stats["coalescing_ratio"] = stats["coalesced"] / stats["issues"] if stats["issues"] else 0.0
+        stats["target_locks"] = self._target_locks.get_stats()
+        return stats
+
+    def clear(self) -> None:
+        """Forget finished flights so the next issue of every fingerprint runs again"""
+        with self._lock:
+            self._flights = {key: flight for key, flight in self._flights.items() if not flight.future.done()}
+
+    def _prune(self, now: float) -> None:
+        """Drop finished flights whose window has passed; caller holds the lock"""
+        expired = [key for key, flight in self._flights.items()
+                   if flight.future.done() and now - flight.started_at > self.window_seconds]
+        for key in expired:
+            del self._flights[key]
+
+    def _record_metric(self, outcome: str) -> None:
+        """Count an issue in the metric client, if one is configured and buffered"""
+        if self._metric_client is None or not getattr(self._metric_client, "is_buffered", False):
+            return
+        try:
+            self._metric_client.record_counter(COALESCING_METRIC_TYPE, 1, {"coalescer": self.name, "outcome": outcome})
+        except Exception as e:
+            logger.debug(f"Failed to record coalescing metric: {e}")
@@ -576,13 +576,14 @@ class PipelineAdjuster:
         Returns:
             str: Healing execution ID
         """
-        # Create healing execution record
-        # Update execution with result and details
-        # Update related healing action success rate
-        # Update related issue pattern stats
-
-        # Return healing execution ID
-        return "healing_execution_id"
+        if self._healing_repository is None:
+            logger.warning(f"No healing repository, adjustment execution for {execution_id} not recorded")
+            return None
+        # Completing the execution updates the action, pattern and success rate statistics
+        return self._healing_repository.record_completed_execution(
+            execution_id, pattern_id, action_id, confidence_score, successful, execution_details,
+            validation_id=validation_id
+        )
 
     def _update_adjustment_history(self, adjustment_result: AdjustmentResult) -> None:
         """Update the adjustment history with a new result
@@ -25,6 +25,7 @@ from src.backend.self_healing.correction.resource_optimizer import ResourceOptim
 from src.backend.self_healing.decision.resolution_selector import ResolutionSelector  # Select appropriate resolution strategies
 from src.backend.db.repositories.healing_repository import HealingRepository  # Access healing-related data from the database
 from src.backend.db.models.healing_execution import HealingExecution, create_healing_execution  # Track healing execution attempts and results
+from src.backend.self_healing.correction.issue_coalescer import IssueCoalescer, issue_fingerprint, recovery_target, DEFAULT_COALESCING_WINDOW_SECONDS  # Share one recovery across duplicate issues
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -165,6 +166,11 @@ class RecoveryOrchestrator:
         self._confidence_threshold = healing_config.get_confidence_threshold()
         self._max_recovery_attempts = healing_config.get_max_retry_attempts()
         self._recovery_history = {}
+        # Duplicate issues within the window share one recovery; recoveries of a target never overlap
+        self._coalescer = IssueCoalescer(
+            name="recovery",
+            window_seconds=(config or {}).get("coalescing_window_seconds", DEFAULT_COALESCING_WINDOW_SECONDS)
+        )
 
     def orchestrate_recovery(
         self,
@@ -193,6 +199,46 @@ class RecoveryOrchestrator:
             logger.warning(f"Issue {issue_id} is already being addressed")
             return self.get_recovery_by_id(issue_id)
 
+        # Run the recovery once per issue fingerprint, holding the lock of the dataset or pipeline it acts on
+        coalesced = self._coalescer.run(
+            issue_fingerprint(context, classification), self._run_recovery, issue_id, classification,
+            root_cause_analysis, context, issue_id=issue_id, target=recovery_target(context)
+        )
+        if not coalesced.coalesced:
+            return coalesced.result
+
+        # Duplicates receive the shared recovery under their own issue ID
+        shared = coalesced.result
+        recovery_result = RecoveryResult(
+            issue_id=issue_id,
+            strategy=shared.strategy,
+            original_state=shared.original_state,
+            recovered_state=shared.recovered_state,
+            confidence=shared.confidence,
+            successful=shared.successful,
+            metadata={**(shared.metadata or {}), "coalesced_with": coalesced.leader_id, "shared_recovery_id": shared.recovery_id},
+        )
+        self._update_recovery_history(recovery_result)
+        return recovery_result
+
+    def _run_recovery(
+        self,
+        issue_id: str,
+        classification: IssueClassification,
+        root_cause_analysis: RootCauseAnalysis,
+        context: dict,
+    ) -> RecoveryResult:
+        """Select, apply and validate the recovery for an issue
+
+        Args:
+            issue_id (str): The ID of the issue to recover from
+            classification (IssueClassification): The classification of the issue
+            root_cause_analysis (RootCauseAnalysis): The root cause analysis of the issue
+            context (dict): Contextual information about the issue
+
+        Returns:
+            RecoveryResult: Result of the recovery operation
+        """
         # Determine appropriate recovery approach based on classification and root cause
         recovery_approach = self._determine_recovery_approach(classification, root_cause_analysis)
 
@@ -346,6 +392,14 @@ class RecoveryOrchestrator:
         # Return filtered or all recovery history
         return list(self._recovery_history.values())
 
+    def get_coalescing_stats(self) -> dict:
+        """Get statistics about recoveries shared between duplicate issues
+
+        Returns:
+            dict: Issues seen, recoveries run, coalesced issues and coalescing ratio
+        """
+        return self._coalescer.get_stats()
+
     def get_recovery_by_id(self, recovery_id: str) -> RecoveryResult:
         """Get a specific recovery by its ID
 
@@ -398,13 +452,14 @@ class RecoveryOrchestrator:
         Returns:
             str: Healing execution ID
         """
-        # Create healing execution record
-        # Update execution with result and details
-        # Update related healing action success rate
-        # Update related issue pattern stats
-
-        # Return healing execution ID
-        return "healing_execution_id"
+        if self._healing_repository is None:
+            logger.warning(f"No healing repository, recovery execution for {execution_id} not recorded")
+            return None
+        # Completing the execution updates the action, pattern and success rate statistics
+        return self._healing_repository.record_completed_execution(
+            execution_id, pattern_id, action_id, confidence_score, successful, execution_details,
+            validation_id=validation_id
+        )
 
     def _update_recovery_history(self, recovery_result: RecoveryResult) -> None:
         """Update the recovery history with a new result
@@ -14,7 +14,8 @@ from ...constants import HealingActionType, DEFAULT_CONFIDENCE_THRESHOLD
 from ...config import get_config
 from ...utils.logging.logger import get_logger
 from ..config.healing_config import get_confidence_threshold as get_healing_config_confidence_threshold
-from ..db.repositories.healing_repository import HealingRepository
+from ...db.repositories.healing_repository import HealingRepository
+from ...db.repositories.success_rate_store import DEFAULT_PRIOR_SUCCESS_RATE
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -284,12 +285,21 @@ class ConfidenceScorer:
         Returns:
             Historical success factor
         """
-        # Query repository for historical healing actions
-        # Filter for relevant actions based on type and parameters
-        # Calculate success rate from historical data
-        # Apply weighting based on recency and sample size
+        # Look up the time-decayed success rate maintained by the repository; keys with fewer
+        # than the minimum number of samples are shrunk towards their pattern and action type
+        try:
+            success_rate = self._repository.get_success_rate(
+                action_type,
+                pattern_id=action_details.get("pattern_id"),
+                issue_category=action_details.get("issue_category"),
+                prior_strength=self._min_history_samples,
+            )
+        except Exception as e:
+            self.logger.warning(f"Historical success rate unavailable for {action_type.value}, using prior: {e}")
+            return DEFAULT_PRIOR_SUCCESS_RATE
+
         # Return normalized factor
-        return 0.75  # Placeholder implementation
+        return max(0.0, min(1.0, success_rate))
 
     def calculate_pattern_match_factor(
         self,
@@ -6,6 +6,8 @@ from .feedback_collector import Feedback, FeedbackCollector, serialize_feedback,
 from .effectiveness_analyzer import AnalysisStorageProvider, InMemoryAnalysisStorage, FeedbackData, EffectivenessMetric, ImprovementRecommendation, EffectivenessAnalysis, EffectivenessAnalyzer, calculate_effectiveness_metrics, analyze_failure_patterns, generate_improvement_recommendations, serialize_analysis, deserialize_analysis
 from .knowledge_base import KnowledgeEntry, IssueKnowledge, PatternKnowledge, CorrectionKnowledge, EffectivenessKnowledge, KnowledgeBase, KnowledgeStorageProvider, FirestoreKnowledgeStorage, serialize_knowledge_entry, deserialize_knowledge_entry, calculate_knowledge_relevance
 from .model_trainer import TrainingConfig, TrainingRun, ModelTrainer, prepare_training_data, evaluate_model_performance, compare_model_versions, generate_model_metadata
+from .feedback_store import ColumnarFeedbackStore, records_to_columns
+from .hyperparameter_search import HyperparameterSearch, generate_candidates
 
 __all__ = [
     "Feedback",
@@ -42,5 +44,9 @@ __all__ = [
     "prepare_training_data",
     "evaluate_model_performance",
     "compare_model_versions",
-    "generate_model_metadata"
+    "generate_model_metadata",
+    "ColumnarFeedbackStore",
+    "records_to_columns",
+    "HyperparameterSearch",
+    "generate_candidates"
 ]
\ No newline at end of file
@@ -18,6 +18,7 @@ from src.backend.constants import HealingActionType, QualityDimension  # Import
 from src.backend.config import get_config  # Access application configuration settings
 from src.backend.utils.logging.logger import get_logger  # Configure logging for feedback collector
 from src.backend.db.repositories.healing_repository import HealingRepository  # Access healing execution data for feedback collection
+from src.backend.self_healing.learning.feedback_store import ColumnarFeedbackStore  # Persist feedback as columnar training data
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -221,6 +222,10 @@ class FeedbackCollector:
         self._config.update(config)
         self._healing_repository = healing_repository
         self._feedback_store = {}
+        self._pending_feedback = []
+        self._columnar_store = None
+        if self._config.get("feedback_store_path"):
+            self._columnar_store = ColumnarFeedbackStore(self._config["feedback_store_path"])
         self._retention_days = self._config.get("retention_days", DEFAULT_RETENTION_DAYS)
         self._batch_size = self._config.get("batch_size", DEFAULT_BATCH_SIZE)
         self.logger = get_logger(__name__)
@@ -564,6 +569,26 @@ class FeedbackCollector:
             raise ValueError("Batch size must be a positive integer")
         self._batch_size = size
 
+    def flush_feedback(self) -> int:
+        """Persist feedback collected since the last persisted batch
+
+        Returns:
+            int: Number of records persisted
+        """
+        feedback_batch, self._pending_feedback = self._pending_feedback, []
+        if feedback_batch and not self._persist_feedback_batch(feedback_batch):
+            self._pending_feedback = feedback_batch + self._pending_feedback
+            return 0
+        return len(feedback_batch)
+
+    def get_columnar_store(self) -> Optional[ColumnarFeedbackStore]:
+        """Get the columnar store persisted feedback is appended to
+
+        Returns:
+            ColumnarFeedbackStore: Store, or None if no feedback_store_path is configured
+        """
+        return self._columnar_store
+
     def _store_feedback(self, feedback: Feedback) -> bool:
         """Store a feedback record in the internal store
 
@@ -574,8 +599,9 @@ class FeedbackCollector:
             bool: True if stored successfully
         """
         self._feedback_store[feedback.feedback_id] = feedback
-        if len(self._feedback_store) > self._batch_size:
-            self._persist_feedback_batch(list(self._feedback_store.values())[:self._batch_size])
+        self._pending_feedback.append(feedback)
+        if len(self._pending_feedback) >= self._batch_size:
+            self.flush_feedback()
         return True
 
     def _persist_feedback_batch(self, feedback_batch: list) -> bool:
@@ -587,6 +613,11 @@ class FeedbackCollector:
         Returns:
             bool: True if persisted successfully
         """
-        # In a real implementation, this would persist the feedback to a database or other storage
         self.logger.info(f"Persisting {len(feedback_batch)} feedback records to storage")
+        if self._columnar_store is not None:
+            try:
+                self._columnar_store.append(feedback_batch)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to append feedback batch to the columnar store: {e}")
+                return False
         return True
\ No newline at end of file
@@ -0,0 +1,451 @@
+"""
+Columnar, append-only local store for healing feedback used as model training data.
+
+Feedback records are encoded once, when they are appended: label fields become string and
+boolean columns and the model inputs become a dense float32 feature matrix built by the
+hashed feature vectorizer. Every append writes an immutable segment directory holding one
+.npy file per column, and a manifest lists the segments with the sequence number of their
+first row. Readers memory-map the segments, so loading training data (or only the rows
+appended since a model version was trained) slices arrays instead of rebuilding feedback
+dictionaries. A single process may write to a store; any number of processes may read it.
+"""
+
+import datetime
+import json
+import os
+import shutil
+import threading
+import typing
+import uuid
+
+import numpy as np  # version 1.24.x
+
+from src.backend.utils.logging.logger import get_logger  # Configure logging for the feedback store
+from src.backend.self_healing.ai.feature_vectorizer import HashedFeatureVectorizer, FEATURE_TYPE_TEXT, FEATURE_TYPE_CATEGORICAL, FEATURE_TYPE_NUMERIC  # Encode feedback into feature rows
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_COMPACT_SEGMENT_ROWS = 50000
+MANIFEST_FILE = "manifest.json"
+SEGMENTS_DIRECTORY = "segments"
+STORE_FORMAT_VERSION = 1
+
+# Feedback fields stored as string columns; nested names are read from the feedback context
+STRING_COLUMNS = {
+    "feedback_id": "feedback_id",
+    "action_id": "action_id",
+    "action_type": "action_type",
+    "issue_type": "issue_type",
+    "feedback_type": "feedback_type",
+    "feedback_source": "feedback_source",
+    "root_cause": "context.root_cause",
+    "pattern_id": "context.pattern_id"
+}
+FLOAT_COLUMNS = ["confidence_score", "timestamp"]
+BOOL_COLUMNS = ["successful"]
+FEATURES_COLUMN = "features"
+COLUMNS = list(STRING_COLUMNS) + FLOAT_COLUMNS + BOOL_COLUMNS + [FEATURES_COLUMN]
+
+# Model inputs of the feedback feature matrix; label fields are left out so they cannot leak
+FEEDBACK_FEATURE_SPEC = [
+    {"name": "context.error_message", "type": FEATURE_TYPE_TEXT, "buckets": 256},
+    {"name": "action_type", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 32},
+    {"name": "feedback_source", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 16},
+    {"name": "context.pipeline", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 64},
+    {"name": "context.dataset", "type": FEATURE_TYPE_CATEGORICAL, "buckets": 64},
+    {"name": "confidence_score", "type": FEATURE_TYPE_NUMERIC}
+]
+
+
+def _field(record: dict, path: str) -> typing.Any:
+    """Gets a possibly nested field of a feedback dictionary
+
+    Args:
+        record (dict): record
+        path (str): path
+
+    Returns:
+        object: Field value or None if missing
+    """
+    value = record
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _epoch_seconds(value: typing.Any) -> float:
+    """Converts a feedback timestamp to epoch seconds
+
+    Args:
+        value (object): value
+
+    Returns:
+        float: Epoch seconds, NaN if missing
+    """
+    if value is None:
+        return float("nan")
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def records_to_columns(feedback_records: typing.Sequence[typing.Any], vectorizer: HashedFeatureVectorizer) -> typing.Dict[str, np.ndarray]:
+    """Encodes feedback records into store columns
+
+    Args:
+        feedback_records (list): Feedback objects or feedback dictionaries
+        vectorizer (HashedFeatureVectorizer): vectorizer
+
+    Returns:
+        dict: Dictionary mapping column name to array, one entry per record
+    """
+    records = [record if isinstance(record, dict) else record.to_dict() for record in feedback_records]
+    columns = {}
+    for column, path in STRING_COLUMNS.items():
+        values = [_field(record, path) for record in records]
+        columns[column] = np.array(["" if value is None else str(value) for value in values], dtype=str)
+    columns["confidence_score"] = np.array([_field(record, "confidence_score") for record in records], dtype=np.float64)
+    columns["timestamp"] = np.array([_epoch_seconds(record.get("timestamp")) for record in records], dtype=np.float64)
+    columns["successful"] = np.array([bool(record.get("successful")) for record in records], dtype=bool)
+    columns[FEATURES_COLUMN] = vectorizer.transform(records)
+    return columns
+
+
+class ColumnarFeedbackStore:
+    """Append-only store of encoded feedback in memory-mapped column segments"""
+
+    def __init__(self, root_path: str, feature_spec: typing.List[dict] = None):
+        """Open or create a feedback store
+
+        Args:
+            root_path (str): Directory of the store
+            feature_spec (list): Feature spec of the feature matrix; must match the spec of an existing store
+        """
+        self._root_path = root_path
+        self._segments_path = os.path.join(root_path, SEGMENTS_DIRECTORY)
+        self._lock = threading.Lock()
+        os.makedirs(self._segments_path, exist_ok=True)
+
+        manifest = self._read_manifest()
+        if manifest is None:
+            manifest = {
+                "version": STORE_FORMAT_VERSION,
+                "feature_spec": feature_spec or FEEDBACK_FEATURE_SPEC,
+                "segments": [],
+                "next_sequence": 0
+            }
+            self._write_manifest(manifest)
+        elif feature_spec is not None and feature_spec != manifest["feature_spec"]:
+            raise ValueError(f"Feature spec does not match the spec of the feedback store at {root_path}")
+        self._manifest = manifest
+        self._vectorizer = HashedFeatureVectorizer(manifest["feature_spec"])
+        self._segment_cache = {}
+
+    @property
+    def root_path(self) -> str:
+        """Directory of the store"""
+        return self._root_path
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number the next appended record gets, i.e. the number of records appended so far"""
+        self._refresh()
+        return self._manifest["next_sequence"]
+
+    @property
+    def feature_dimension(self) -> int:
+        """Number of columns of the feature matrix"""
+        return self._vectorizer.dimension
+
+    @property
+    def feature_spec(self) -> typing.List[dict]:
+        """Feature spec of the feature matrix"""
+        return self._manifest["feature_spec"]
+
+    def __len__(self) -> int:
+        return self.sequence
+
+    def append(self, feedback_records: typing.Sequence[typing.Any]) -> typing.Tuple[int, int]:
+        """Encode feedback records and append them as a new segment
+
+        Args:
+            feedback_records (list): Feedback objects or feedback dictionaries
+
+        Returns:
+            tuple: (first, end) sequence numbers of the appended records
+        """
+        if not feedback_records:
+            return self._manifest["next_sequence"], self._manifest["next_sequence"]
+        columns = records_to_columns(feedback_records, self._vectorizer)
+        return self.append_columns(columns)
+
+    def append_columns(self, columns: typing.Dict[str, np.ndarray]) -> typing.Tuple[int, int]:
+        """Append already encoded columns as a new segment
+
+        Args:
+            columns (dict): Array of every store column, all with the same number of rows
+
+        Returns:
+            tuple: (first, end) sequence numbers of the appended records
+        """
+        missing = set(COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Missing feedback store columns: {sorted(missing)}")
+        rows = len(columns[FEATURES_COLUMN])
+        if any(len(columns[column]) != rows for column in COLUMNS):
+            raise ValueError("Feedback store columns must all have the same number of rows")
+        if columns[FEATURES_COLUMN].shape[1:] != (self.feature_dimension,):
+            raise ValueError(f"Feature matrix must have {self.feature_dimension} columns")
+        if not rows:
+            return self._manifest["next_sequence"], self._manifest["next_sequence"]
+
+        with self._lock:
+            start = self._manifest["next_sequence"]
+            name = self._write_segment(start, {column: columns[column] for column in COLUMNS})
+            manifest = dict(self._manifest)
+            manifest["segments"] = self._manifest["segments"] + [{"name": name, "start": start, "rows": rows}]
+            manifest["next_sequence"] = start + rows
+            self._write_manifest(manifest)
+            self._manifest = manifest
+        logger.debug(f"Appended {rows} feedback records to {self._root_path} as segment {name}")
+        return start, start + rows
+
+    def load(self, start: int = 0, stop: int = None, columns: typing.List[str] = None) -> typing.Dict[str, np.ndarray]:
+        """Load a range of records
+
+        Args:
+            start (int): First sequence number
+            stop (int): Sequence number after the last record; defaults to the end of the store
+            columns (list): Columns to load; defaults to all columns
+
+        Returns:
+            dict: Dictionary mapping column name to array of the records in [start, stop)
+        """
+        columns = self._check_columns(columns)
+        segments = self._refresh()
+        end = self._manifest["next_sequence"]
+        stop = end if stop is None else min(stop, end)
+        start = max(0, start)
+        parts = {column: [] for column in columns}
+        for segment in segments:
+            first, end = segment["start"], segment["start"] + segment["rows"]
+            if end <= start or first >= stop:
+                continue
+            arrays = self._open_segment(segment["name"])
+            lower, upper = max(start, first) - first, min(stop, end) - first
+            for column in columns:
+                parts[column].append(arrays[column][lower:upper])
+        return {column: self._concatenate(column, parts[column]) for column in columns}
+
+    def take(self, sequences: typing.Sequence[int], columns: typing.List[str] = None) -> typing.Dict[str, np.ndarray]:
+        """Load records by sequence number, e.g. a replay sample of older feedback
+
+        Args:
+            sequences (list): Sequence numbers
+            columns (list): Columns to load; defaults to all columns
+
+        Returns:
+            dict: Dictionary mapping column name to array, in the order of the sequence numbers
+        """
+        columns = self._check_columns(columns)
+        segments = self._refresh()
+        sequences = np.asarray(sequences, dtype=np.int64)
+        if len(sequences) and (sequences.min() < 0 or sequences.max() >= self._manifest["next_sequence"]):
+            raise IndexError("Sequence number out of range of the feedback store")
+        if not len(sequences):
+            return {column: self._concatenate(column, []) for column in columns}
+
+        starts = np.array([segment["start"] for segment in segments], dtype=np.int64)
+        owners = np.searchsorted(starts, sequences, side="right") - 1
+        order = np.argsort(owners, kind="stable")
+        parts = {column: [] for column in columns}
+        for owner in np.unique(owners):
+            selected = order[owners[order] == owner]
+            arrays = self._open_segment(segments[owner]["name"])
+            offsets = sequences[selected] - starts[owner]
+            for column in columns:
+                parts[column].append(arrays[column][offsets])
+        positions = np.empty(len(sequences), dtype=np.int64)
+        positions[order] = np.arange(len(sequences))
+        return {column: self._concatenate(column, parts[column])[positions] for column in columns}
+
+    def compact(self, target_rows: int = DEFAULT_COMPACT_SEGMENT_ROWS) -> int:
+        """Merge runs of small segments into segments of up to target_rows records
+
+        Args:
+            target_rows (int): Preferred number of records per merged segment
+
+        Returns:
+            int: Number of segments removed
+        """
+        with self._lock:
+            segments = self._manifest["segments"]
+            groups, current = [], []
+            for segment in segments:
+                if current and sum(item["rows"] for item in current) + segment["rows"] > target_rows:
+                    groups.append(current)
+                    current = []
+                current.append(segment)
+            if current:
+                groups.append(current)
+            if all(len(group) == 1 for group in groups):
+                return 0
+
+            merged, obsolete = [], []
+            for group in groups:
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                arrays = [self._open_segment(segment["name"]) for segment in group]
+                data = {column: np.concatenate([array[column] for array in arrays]) for column in COLUMNS}
+                start = group[0]["start"]
+                name = self._write_segment(start, data)
+                merged.append({"name": name, "start": start, "rows": len(data[FEATURES_COLUMN])})
+                obsolete.extend(segment["name"] for segment in group)
+
+            manifest = dict(self._manifest)
+            manifest["segments"] = merged
+            self._write_manifest(manifest)
+            self._manifest = manifest
+            for name in obsolete:
+                self._segment_cache.pop(name, None)
+                shutil.rmtree(os.path.join(self._segments_path, name), ignore_errors=True)
+        logger.info(f"Compacted {len(segments)} feedback segments into {len(merged)}")
+        return len(segments) - len(merged)
+
+    def get_stats(self) -> dict:
+        """Get store statistics
+
+        Returns:
+            dict: Record count, segment count, feature dimension and size on disk in bytes
+        """
+        segments = self._refresh()
+        size = 0
+        for segment in segments:
+            segment_path = os.path.join(self._segments_path, segment["name"])
+            for file_name in os.listdir(segment_path):
+                size += os.path.getsize(os.path.join(segment_path, file_name))
+        return {
+            "records": self._manifest["next_sequence"],
+            "segments": len(segments),
+            "feature_dimension": self.feature_dimension,
+            "size_bytes": size
+        }
+
+    def _refresh(self) -> typing.List[dict]:
+        """Pick up segments appended or compacted by the writing process
+
+        Returns:
+            list: Current segment entries
+        """
+        manifest = self._read_manifest()
+        with self._lock:
+            if manifest is not None and manifest["segments"] != self._manifest["segments"]:
+                self._manifest = manifest
+                names = {segment["name"] for segment in manifest["segments"]}
+                for name in set(self._segment_cache) - names:
+                    del self._segment_cache[name]
+            return self._manifest["segments"]
+
+    def _check_columns(self, columns: typing.Optional[typing.List[str]]) -> typing.List[str]:
+        """Validate requested column names
+
+        Args:
+            columns (list): columns
+
+        Returns:
+            list: Column names to load
+        """
+        columns = list(columns) if columns is not None else list(COLUMNS)
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown feedback store columns: {sorted(unknown)}")
+        return columns
+
+    def _concatenate(self, column: str, parts: list) -> np.ndarray:
+        """Concatenate column slices, returning an empty typed array if there are none
+
+        Args:
+            column (str): column
+            parts (list): parts
+
+        Returns:
+            numpy.ndarray: Concatenated column
+        """
+        if len(parts) == 1:
+            return np.array(parts[0])
+        if parts:
+            return np.concatenate(parts)
+        if column == FEATURES_COLUMN:
+            return np.zeros((0, self.feature_dimension), dtype=np.float32)
+        if column in STRING_COLUMNS:
+            return np.array([], dtype=str)
+        return np.array([], dtype=bool if column in BOOL_COLUMNS else np.float64)
+
+    def _open_segment(self, name: str) -> typing.Dict[str, np.ndarray]:
+        """Memory-map the columns of a segment
+
+        Args:
+            name (str): name
+
+        Returns:
+            dict: Dictionary mapping column name to memory-mapped array
+        """
+        arrays = self._segment_cache.get(name)
+        if arrays is None:
+            segment_path = os.path.join(self._segments_path, name)
+            arrays = {column: np.load(os.path.join(segment_path, f"{column}.npy"), mmap_mode="r")
+                      for column in COLUMNS}
+            self._segment_cache[name] = arrays
+        return arrays
+
+    def _write_segment(self, start: int, columns: typing.Dict[str, np.ndarray]) -> str:
+        """Write columns to a new segment directory; the segment is invisible until the manifest lists it
+
+        Args:
+            start (int): Sequence number of the first record
+            columns (dict): columns
+
+        Returns:
+            str: Segment name
+        """
+        name = f"{start:012d}-{uuid.uuid4().hex[:8]}"
+        staging_path = os.path.join(self._segments_path, f".{name}.tmp")
+        os.makedirs(staging_path)
+        for column, values in columns.items():
+            np.save(os.path.join(staging_path, f"{column}.npy"), np.asarray(values), allow_pickle=False)
+        os.replace(staging_path, os.path.join(self._segments_path, name))
+        return name
+
+    def _read_manifest(self) -> typing.Optional[dict]:
+        """Read the manifest
+
+        Returns:
+            dict: Manifest or None if the store is new
+        """
+        manifest_path = os.path.join(self._root_path, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("version") != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported feedback store version {manifest.get('version')} at {self._root_path}")
+        return manifest
+
+    def _write_manifest(self, manifest: dict) -> None:
+        """Atomically replace the manifest
+
+        Args:
+            manifest (dict): manifest
+        """
+        manifest_path = os.path.join(self._root_path, MANIFEST_FILE)
+        staging_path = f"{manifest_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(staging_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(staging_path, manifest_path)
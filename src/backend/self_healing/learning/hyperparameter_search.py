@@ -0,0 +1,233 @@
+"""
+Parallel hyperparameter search with early stopping of weak trials for the model trainer.
+
+Candidates are evaluated by successive halving: every surviving candidate is trained with
+the budget of the current rung (for example a number of epochs) in a pool of CPU-only
+worker processes, the best 1/reduction_factor of them move on to the next rung with a
+reduction_factor times larger budget, and the rest are stopped. Each trial gets its own
+checkpoint path so that a trial function can resume training where its previous rung ended
+instead of starting over.
+"""
+
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+import typing
+
+from src.backend.utils.logging.logger import get_logger  # Configure logging for the hyperparameter search
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_REDUCTION_FACTOR = 3
+DEFAULT_MIN_BUDGET = 1
+DEFAULT_MAX_BUDGET = 27
+DEFAULT_START_METHOD = "spawn"
+DEFAULT_WORKER_THREADS = 1
+
+
+def _init_worker(worker_threads: int) -> None:
+    """Restricts a search worker to the CPU and to a fixed number of threads
+
+    Args:
+        worker_threads (int): worker_threads
+    """
+    os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
+    for variable in ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS",
+                     "TF_NUM_INTRAOP_THREADS", "TF_NUM_INTEROP_THREADS"]:
+        os.environ[variable] = str(worker_threads)
+
+
+def generate_candidates(search_space: dict, count: int, seed: int = None) -> typing.List[dict]:
+    """Samples hyperparameter candidates from a search space
+
+    Args:
+        search_space (dict): Maps each parameter to a list of choices or a (low, high) range;
+            ranges of two ints sample ints, other ranges sample floats, log-uniformly if both
+            bounds are positive and at least a factor 100 apart
+        count (int): Number of candidates
+        seed (int): Random seed
+
+    Returns:
+        list: Unique candidate parameter dictionaries
+    """
+    rng = random.Random(seed)
+    candidates, seen = [], set()
+    attempts = 0
+    while len(candidates) < count and attempts < count * 20:
+        attempts += 1
+        candidate = {}
+        for name, space in search_space.items():
+            if isinstance(space, tuple) and len(space) == 2:
+                low, high = space
+                if isinstance(low, int) and isinstance(high, int):
+                    candidate[name] = rng.randint(low, high)
+                elif low > 0 and high >= low * 100:
+                    candidate[name] = math.exp(rng.uniform(math.log(low), math.log(high)))
+                else:
+                    candidate[name] = rng.uniform(low, high)
+            elif isinstance(space, (list, tuple)):
+                candidate[name] = rng.choice(list(space))
+            else:
+                candidate[name] = space
+        key = tuple(sorted((name, repr(value)) for name, value in candidate.items()))
+        if key not in seen:
+            seen.add(key)
+            candidates.append(candidate)
+    return candidates
+
+
+class HyperparameterSearch:
+    """Successive halving search running trials in parallel worker processes"""
+
+    def __init__(
+        self,
+        trial_function: typing.Callable[[dict, int, str], float],
+        max_workers: int = None,
+        reduction_factor: int = DEFAULT_REDUCTION_FACTOR,
+        min_budget: int = DEFAULT_MIN_BUDGET,
+        max_budget: int = DEFAULT_MAX_BUDGET,
+        maximize: bool = True,
+        start_method: str = DEFAULT_START_METHOD,
+        worker_threads: int = DEFAULT_WORKER_THREADS
+    ):
+        """Initialize the search
+
+        Args:
+            trial_function (callable): Picklable function (params, budget, checkpoint_path) -> score;
+                checkpoint_path is stable across the rungs of a trial and may not exist yet
+            max_workers (int): Number of worker processes; defaults to the CPU count
+            reduction_factor (int): Factor by which candidates are cut and budgets grow per rung
+            min_budget (int): Budget of the first rung
+            max_budget (int): Budget of the last rung
+            maximize (bool): Whether higher scores are better
+            start_method (str): Multiprocessing start method of the workers
+            worker_threads (int): Number of math library threads per worker
+        """
+        if reduction_factor < 2:
+            raise ValueError("Reduction factor must be at least 2")
+        if min_budget < 1 or max_budget < min_budget:
+            raise ValueError("Budgets must satisfy 1 <= min_budget <= max_budget")
+        self._trial_function = trial_function
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._reduction_factor = reduction_factor
+        self._min_budget = min_budget
+        self._max_budget = max_budget
+        self._maximize = maximize
+        self._start_method = start_method
+        self._worker_threads = worker_threads
+
+    def get_budgets(self) -> typing.List[int]:
+        """Get the budget of every rung
+
+        Returns:
+            list: Increasing budgets, ending with max_budget
+        """
+        budgets = []
+        budget = self._min_budget
+        while budget < self._max_budget:
+            budgets.append(budget)
+            budget *= self._reduction_factor
+        budgets.append(self._max_budget)
+        return budgets
+
+    def run(self, candidates: typing.List[dict]) -> dict:
+        """Evaluate candidates, stopping weak ones early
+
+        Args:
+            candidates (list): Candidate parameter dictionaries
+
+        Returns:
+            dict: best_params, best_score, trials (params, scores per budget, stopped_at_budget,
+                error), budgets, workers and elapsed_seconds
+        """
+        if not candidates:
+            raise ValueError("At least one candidate is required")
+        started = time.perf_counter()
+        budgets = self.get_budgets()
+        trials = [{"trial_id": index, "params": dict(params), "scores": {}, "stopped_at_budget": None, "error": None}
+                  for index, params in enumerate(candidates)]
+        checkpoint_root = tempfile.mkdtemp(prefix="hyperparameter-search-")
+        workers = min(self._max_workers, len(trials))
+        context = multiprocessing.get_context(self._start_method)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                        initializer=_init_worker,
+                                                        initargs=(self._worker_threads,)) as executor:
+                alive = list(trials)
+                for rung, budget in enumerate(budgets):
+                    self._run_rung(executor, alive, budget, checkpoint_root)
+                    alive = [trial for trial in alive if trial["error"] is None]
+                    if not alive:
+                        break
+                    ranked = sorted(alive, key=lambda trial: trial["scores"][budget], reverse=self._maximize)
+                    if rung == len(budgets) - 1:
+                        alive = ranked
+                        break
+                    keep = max(1, len(ranked) // self._reduction_factor)
+                    for trial in ranked[keep:]:
+                        trial["stopped_at_budget"] = budget
+                    alive = ranked[:keep]
+                    logger.info(f"Hyperparameter search rung {rung} (budget {budget}): kept {keep} of {len(ranked)} trials")
+        finally:
+            shutil.rmtree(checkpoint_root, ignore_errors=True)
+
+        finished = [trial for trial in trials if trial["error"] is None and trial["scores"]]
+        if not finished:
+            raise RuntimeError(f"All {len(trials)} hyperparameter trials failed")
+        best = max(finished, key=lambda trial: (max(trial["scores"]), self._sign(trial["scores"][max(trial["scores"])])))
+        best_budget = max(best["scores"])
+        elapsed = time.perf_counter() - started
+        logger.info(f"Hyperparameter search finished in {elapsed:.1f}s with {workers} workers; "
+                    f"best score {best['scores'][best_budget]:.4f} with {best['params']}")
+        return {
+            "best_params": best["params"],
+            "best_score": best["scores"][best_budget],
+            "trials": trials,
+            "budgets": budgets,
+            "workers": workers,
+            "elapsed_seconds": elapsed
+        }
+
+    def _run_rung(self, executor: concurrent.futures.Executor, trials: list, budget: int, checkpoint_root: str) -> None:
+        """Train every trial of a rung with the rung budget, recording scores and failures
+
+        Args:
+            executor (Executor): executor
+            trials (list): trials
+            budget (int): budget
+            checkpoint_root (str): checkpoint_root
+        """
+        futures = {
+            executor.submit(self._trial_function, trial["params"], budget,
+                            os.path.join(checkpoint_root, f"trial-{trial['trial_id']}")): trial
+            for trial in trials
+        }
+        for future in concurrent.futures.as_completed(futures):
+            trial = futures[future]
+            try:
+                score = float(future.result())
+                if math.isnan(score):
+                    raise ValueError("Trial returned a NaN score")
+                trial["scores"][budget] = score
+            except Exception as error:
+                logger.warning(f"Hyperparameter trial {trial['trial_id']} failed at budget {budget}: {error}")
+                trial["error"] = str(error)
+                trial["stopped_at_budget"] = budget
+
+    def _sign(self, score: float) -> float:
+        """Orient a score so that larger is better
+
+        Args:
+            score (float): score
+
+        Returns:
+            float: Oriented score
+        """
+        return score if self._maximize else -score
@@ -10,6 +10,8 @@ import os  # standard library # IE2: os library for file and path operations
 import json  # standard library # IE2: json library for serializing and deserializing model configurations
 from datetime import datetime  # standard library # IE2: datetime library for timestamping training events and model versions
 import uuid  # standard library # IE2: uuid library for generating unique identifiers for training runs
+import time  # standard library # IE2: time library for measuring training durations
+import functools  # standard library # IE2: functools library for binding hyperparameter trial arguments
 
 import pandas as pd  # version 2.0.x # IE2: pandas library for data manipulation and preparation
 import numpy as np  # version 1.24.x # IE2: numpy library for numerical operations
@@ -23,13 +25,22 @@ from src.backend.utils.ml import model_utils  # Internal import # IE1: model_uti
 from src.backend.self_healing.learning import feedback_collector  # Internal import # IE1: feedback_collector module for accessing feedback data
 from src.backend.self_healing.learning import effectiveness_analyzer  # Internal import # IE1: effectiveness_analyzer module for accessing effectiveness analysis
 from src.backend.self_healing.learning import knowledge_base  # Internal import # IE1: knowledge_base module for accessing knowledge base
+from src.backend.self_healing.learning import feedback_store  # Internal import # IE1: feedback_store module for the columnar training data store
+from src.backend.self_healing.learning import hyperparameter_search  # Internal import # IE1: hyperparameter_search module for parallel successive halving
 from src.backend.self_healing.models import model_manager  # Internal import # IE1: model_manager module for managing trained models
 
 # Initialize logger
 logger = logger.get_logger(__name__)
 
 # Define default training configuration
-DEFAULT_TRAINING_CONFIG = {"batch_size": 32, "epochs": 50, "validation_split": 0.2, "early_stopping": True, "patience": 5}
+DEFAULT_TRAINING_CONFIG = {"batch_size": 32, "epochs": 50, "validation_split": 0.2, "early_stopping": True, "patience": 5, "learning_rate": 0.001,
+                           "warm_start_epochs": 10, "replay_fraction": 1.0, "min_new_records": 50, "full_retrain_ratio": 0.5, "cpu_only": True}
+
+# Define default network hyperparameters, overridable through model_specific_params
+DEFAULT_MODEL_PARAMS = {"hidden_units": 64, "dropout": 0.2}
+
+# Define default hyperparameter search space
+DEFAULT_SEARCH_SPACE = {"learning_rate": (0.0001, 0.01), "batch_size": [32, 64, 128], "hidden_units": [32, 64, 128, 256], "dropout": (0.0, 0.5)}
 
 # Define default model formats
 DEFAULT_MODEL_FORMATS = {"classification": "tensorflow", "root_cause": "tensorflow", "pattern": "tensorflow", "correction": "tensorflow"}
@@ -37,26 +48,186 @@ DEFAULT_MODEL_FORMATS = {"classification": "tensorflow", "root_cause": "tensorfl
 # Define model types
 MODEL_TYPES = {"classification": "Issue Classification Model", "root_cause": "Root Cause Analysis Model", "pattern": "Pattern Recognition Model", "correction": "Data Correction Model"}
 
+# Define the feedback store column each model type learns to predict
+TRAINING_LABELS = {"classification": "issue_type", "root_cause": "root_cause", "pattern": "pattern_id", "correction": "successful"}
+
+# Define training modes
+TRAINING_MODE_FULL = "full"
+TRAINING_MODE_WARM_START = "warm_start"
+TRAINING_MODE_ONLINE = "online"
+
+# Define default directory of model artifacts and training history
+DEFAULT_MODELS_PATH = model_manager.DEFAULT_MODEL_BASE_PATH
 
-def prepare_training_data(feedback_records: list, model_type: str, knowledge_base: knowledge_base.KnowledgeBase) -> typing.Tuple[object, object, object, object]:
+# Define training history file name
+TRAINING_HISTORY_FILE = "training_history.json"
+
+# Shared vectorizer for feedback records that are not read from a feedback store
+_feedback_vectorizer = None
+
+
+def prepare_training_data(feedback_records: list, model_type: str, knowledge_base: knowledge_base.KnowledgeBase, validation_split: float = None, seed: int = 0) -> typing.Tuple[object, object, object, object]:
     """Prepares training data from feedback and knowledge base
 
     Args:
-        feedback_records (list): feedback_records
+        feedback_records (list): Feedback objects or dictionaries, or columns loaded from a ColumnarFeedbackStore
         model_type (str): model_type
         knowledge_base (KnowledgeBase): knowledge_base
+        validation_split (float): Fraction of records held out for validation; defaults to the training default
+        seed (int): Seed of the validation split
 
     Returns:
-        tuple: Tuple of (X_train, y_train, X_val, y_val)
+        tuple: Tuple of (X_train, y_train, X_val, y_val), with string labels
     """
-    # Convert feedback records to pandas DataFrame
-    # Filter records relevant to the specified model_type
-    # Extract features and labels based on model_type
-    # Augment training data with knowledge base information
-    # Normalize and preprocess features
+    if model_type not in TRAINING_LABELS:
+        raise ValueError(f"Unsupported model type: {model_type}")
+    if validation_split is None:
+        validation_split = DEFAULT_TRAINING_CONFIG["validation_split"]
+
+    # Columns from the feedback store are used as they are; records are encoded once here
+    if isinstance(feedback_records, dict):
+        columns = feedback_records
+    else:
+        columns = feedback_store.records_to_columns(feedback_records, _get_feedback_vectorizer())
+
+    # Keep the records that carry a label for this model type
+    labels = np.asarray(columns[TRAINING_LABELS[model_type]]).astype(str)
+    labelled = labels != ""
+    features = np.asarray(columns[feedback_store.FEATURES_COLUMN])[labelled]
+    labels = labels[labelled]
+
     # Split into training and validation sets
-    # Return prepared datasets
-    return None, None, None, None
+    order = np.random.default_rng(seed).permutation(len(labels))
+    validation_count = int(round(len(labels) * validation_split)) if len(labels) > 1 else 0
+    validation, training = order[:validation_count], order[validation_count:]
+    return features[training], labels[training], features[validation], labels[validation]
+
+
+def encode_labels(labels: object, classes: list) -> object:
+    """Encodes string labels as class indexes
+
+    Args:
+        labels (object): labels
+        classes (list): Sorted class names
+
+    Returns:
+        numpy.ndarray: Class index of every label
+    """
+    classes = np.asarray(classes, dtype=str)
+    labels = np.asarray(labels, dtype=str)
+    indexes = np.searchsorted(classes, labels)
+    if len(labels) and (indexes.max() >= len(classes) or not np.array_equal(classes[indexes], labels)):
+        unknown = sorted(set(labels.tolist()) - set(classes.tolist()))
+        raise ValueError(f"Labels not among the model classes: {unknown}")
+    return indexes.astype(np.int32)
+
+
+def build_network(input_dim: int, class_count: int, training_config: 'TrainingConfig') -> object:
+    """Builds and compiles a feed-forward classification network
+
+    Args:
+        input_dim (int): Number of feature columns
+        class_count (int): Number of output classes
+        training_config (TrainingConfig): training_config
+
+    Returns:
+        object: Compiled Keras model
+    """
+    params = dict(DEFAULT_MODEL_PARAMS, **training_config.model_specific_params)
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(input_dim,)),
+        tf.keras.layers.Dense(int(params["hidden_units"]), activation="relu"),
+        tf.keras.layers.Dropout(float(params["dropout"])),
+        tf.keras.layers.Dense(max(class_count, 2), activation="softmax")
+    ])
+    compile_network(model, training_config)
+    return model
+
+
+def compile_network(model: object, training_config: 'TrainingConfig') -> None:
+    """Compiles a network with the configured learning rate
+
+    Args:
+        model (object): model
+        training_config (TrainingConfig): training_config
+    """
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=training_config.learning_rate),
+                  loss="sparse_categorical_crossentropy", metrics=["accuracy"])
+
+
+def fit_network(model: object, X_train: object, y_train: object, training_config: 'TrainingConfig', validation_data: tuple = None, epochs: int = None) -> object:
+    """Trains a compiled network, stopping early when validation loss stops improving
+
+    Args:
+        model (object): model
+        X_train (object): X_train
+        y_train (object): y_train
+        training_config (TrainingConfig): training_config
+        validation_data (tuple): Optional (X_val, y_val)
+        epochs (int): Number of epochs; defaults to training_config.epochs
+
+    Returns:
+        object: Trained model
+    """
+    has_validation = validation_data is not None and len(validation_data[0]) > 0
+    callbacks = []
+    if training_config.early_stopping and has_validation:
+        callbacks.append(tf.keras.callbacks.EarlyStopping(monitor="val_loss", patience=training_config.patience, restore_best_weights=True))
+    model.fit(X_train, y_train, batch_size=training_config.batch_size, epochs=epochs or training_config.epochs,
+              validation_data=validation_data if has_validation else None, callbacks=callbacks, verbose=0)
+    return model
+
+
+def hide_gpus() -> None:
+    """Restricts TensorFlow in this process to the CPU"""
+    try:
+        tf.config.set_visible_devices([], "GPU")
+    except (RuntimeError, ValueError) as e:
+        # Devices cannot be changed once TensorFlow has initialized them
+        logger.debug(f"Could not hide GPUs from TensorFlow: {e}")
+
+
+def run_search_trial(model_type: str, store_path: str, stop_sequence: int, config_dict: dict, params: dict, budget: int, checkpoint_path: str) -> float:
+    """Trains one hyperparameter candidate up to a budget of epochs in a search worker
+
+    Args:
+        model_type (str): model_type
+        store_path (str): Directory of the ColumnarFeedbackStore holding the training data
+        stop_sequence (int): Sequence number after the last record to train on
+        config_dict (dict): Base training configuration
+        params (dict): Candidate hyperparameters
+        budget (int): Total number of epochs the candidate has trained after this call
+        checkpoint_path (str): Path prefix of the candidate checkpoint
+
+    Returns:
+        float: Validation accuracy
+    """
+    hide_gpus()
+    training_config = TrainingConfig.from_dict(config_dict)
+    training_config.update(params)
+    store = feedback_store.ColumnarFeedbackStore(store_path)
+    X_train, y_train, X_val, y_val = prepare_training_data(store.load(stop=stop_sequence), model_type, None, training_config.validation_split)
+    if not len(X_val):
+        raise ValueError("Hyperparameter search needs validation records")
+    classes = sorted(set(y_train.tolist()) | set(y_val.tolist()))
+    y_train, y_val = encode_labels(y_train, classes), encode_labels(y_val, classes)
+
+    # Resume the candidate from the checkpoint of its previous rung
+    model_file, state_file = f"{checkpoint_path}.keras", f"{checkpoint_path}.json"
+    trained_epochs = 0
+    if os.path.exists(model_file):
+        model = tf.keras.models.load_model(model_file)
+        with open(state_file, "r") as f:
+            trained_epochs = json.load(f)["epochs"]
+    else:
+        model = build_network(X_train.shape[1], len(classes), training_config)
+
+    if budget > trained_epochs:
+        fit_network(model, X_train, y_train, training_config, (X_val, y_val), epochs=budget - trained_epochs)
+        model.save(model_file)
+        with open(state_file, "w") as f:
+            json.dump({"epochs": budget}, f)
+    return evaluate_model_performance(model, X_val, y_val, model_type)["accuracy"]
 
 
 def evaluate_model_performance(model: object, X_val: object, y_val: object, model_type: str) -> dict:
@@ -65,19 +236,33 @@ def evaluate_model_performance(model: object, X_val: object, y_val: object, mode
     Args:
         model (object): model
         X_val (object): X_val
-        y_val (object): y_val
+        y_val (object): Class indexes of the validation records
         model_type (str): model_type
 
     Returns:
         dict: Dictionary of performance metrics
     """
-    # Make predictions using the model on validation data
-    # Calculate appropriate metrics based on model_type
-    # For classification models: accuracy, precision, recall, F1-score
-    # For regression models: RMSE, MAE, R²
-    # For specialized models: custom metrics
-    # Return dictionary of performance metrics
-    return {}
+    if model is None or X_val is None or not len(X_val):
+        return {}
+    predicted = np.asarray(model.predict(X_val, verbose=0)).argmax(axis=1)
+    actual = np.asarray(y_val)
+
+    # Macro-averaged precision, recall and F1-score over the classes present
+    precisions, recalls, f1_scores = [], [], []
+    for label in np.union1d(actual, predicted):
+        true_positives = np.sum((predicted == label) & (actual == label))
+        precision = true_positives / max(np.sum(predicted == label), 1)
+        recall = true_positives / max(np.sum(actual == label), 1)
+        precisions.append(precision)
+        recalls.append(recall)
+        f1_scores.append(2 * precision * recall / (precision + recall) if precision + recall else 0.0)
+    return {
+        "accuracy": float(np.mean(predicted == actual)),
+        "precision": float(np.mean(precisions)),
+        "recall": float(np.mean(recalls)),
+        "f1_score": float(np.mean(f1_scores)),
+        "validation_records": int(len(actual))
+    }
 
 
 def compare_model_versions(current_metrics: dict, previous_metrics: dict) -> dict:
@@ -90,12 +275,18 @@ def compare_model_versions(current_metrics: dict, previous_metrics: dict) -> dic
     Returns:
         dict: Comparison results with improvement percentages
     """
-    # Validate both metrics dictionaries have the same keys
-    # Calculate percentage improvement for each metric
-    # Determine overall improvement score
-    # Create summary of improvements and regressions
-    # Return comparison dictionary with detailed results
-    return {}
+    improvements = {}
+    for name in sorted(set(current_metrics) & set(previous_metrics)):
+        current, previous = current_metrics[name], previous_metrics[name]
+        if isinstance(current, bool) or not isinstance(current, (int, float)) or not isinstance(previous, (int, float)) or not previous:
+            continue
+        improvements[name] = (current - previous) / abs(previous) * 100
+    return {
+        "improvements": improvements,
+        "overall_improvement": float(np.mean(list(improvements.values()))) if improvements else 0.0,
+        "improved": sorted(name for name, change in improvements.items() if change > 0),
+        "regressed": sorted(name for name, change in improvements.items() if change < 0)
+    }
 
 
 def generate_model_metadata(model_type: str, training_config: dict, performance_metrics: dict, model_parameters: dict) -> dict:
@@ -110,13 +301,27 @@ def generate_model_metadata(model_type: str, training_config: dict, performance_
     Returns:
         dict: Model metadata dictionary
     """
-    # Create metadata dictionary with model type and description
-    # Add training configuration details
-    # Add performance metrics
-    # Add model parameters
-    # Add timestamp and version information
-    # Return complete metadata dictionary
-    return {}
+    return {
+        "model_type": model_type,
+        "description": MODEL_TYPES.get(model_type, model_type),
+        "training_config": training_config,
+        "performance_metrics": performance_metrics,
+        "model_parameters": model_parameters,
+        "created_at": datetime.now().isoformat(),
+        "version": datetime.now().strftime("%Y%m%d%H%M%S")
+    }
+
+
+def _get_feedback_vectorizer() -> object:
+    """Gets the shared vectorizer encoding feedback records that are not in a feedback store
+
+    Returns:
+        HashedFeatureVectorizer: Vectorizer of the default feedback feature spec
+    """
+    global _feedback_vectorizer
+    if _feedback_vectorizer is None:
+        _feedback_vectorizer = feedback_store.HashedFeatureVectorizer(feedback_store.FEEDBACK_FEATURE_SPEC)
+    return _feedback_vectorizer
 
 
 class TrainingConfig:
@@ -128,11 +333,10 @@ class TrainingConfig:
         Args:
             config (dict): config
         """
-        # Initialize with default values from DEFAULT_TRAINING_CONFIG
-        # Override defaults with provided config values
-        # Validate configuration parameters
-        # Set model_specific_params to empty dict if not provided
-        pass
+        for key, value in DEFAULT_TRAINING_CONFIG.items():
+            setattr(self, key, value)
+        self.model_specific_params = {}
+        self.update(config or {})
 
     def to_dict(self) -> dict:
         """Convert configuration to dictionary
@@ -140,9 +344,9 @@ class TrainingConfig:
         Returns:
             dict: Dictionary representation of configuration
         """
-        # Create dictionary with all configuration properties
-        # Return the dictionary
-        return {}
+        config_dict = {key: getattr(self, key) for key in DEFAULT_TRAINING_CONFIG}
+        config_dict["model_specific_params"] = dict(self.model_specific_params)
+        return config_dict
 
     @classmethod
     def from_dict(cls, config_dict: dict) -> 'TrainingConfig':
@@ -154,9 +358,7 @@ class TrainingConfig:
         Returns:
             TrainingConfig: TrainingConfig instance
         """
-        # Create new TrainingConfig instance with config_dict
-        # Return the instance
-        return TrainingConfig({})
+        return cls(config_dict)
 
     def validate(self) -> bool:
         """Validate configuration parameters
@@ -164,23 +366,32 @@ class TrainingConfig:
         Returns:
             bool: True if configuration is valid
         """
-        # Check batch_size is positive integer
-        # Check epochs is positive integer
-        # Check validation_split is between 0 and 1
-        # Check patience is positive integer if early_stopping is True
-        # Check learning_rate is positive float
-        # Return validation result
-        return True
+        positive_integers = [self.batch_size, self.epochs, self.warm_start_epochs]
+        if self.early_stopping:
+            positive_integers.append(self.patience)
+        if any(not isinstance(value, int) or isinstance(value, bool) or value <= 0 for value in positive_integers):
+            return False
+        if not 0 <= self.validation_split < 1:
+            return False
+        if not isinstance(self.learning_rate, (int, float)) or self.learning_rate <= 0:
+            return False
+        return self.replay_fraction >= 0 and self.min_new_records >= 0 and 0 < self.full_retrain_ratio <= 1
 
     def update(self, new_params: dict) -> None:
         """Update configuration with new parameters
 
         Args:
-            new_params (dict): new_params
+            new_params (dict): Training parameters; other keys (e.g. network hyperparameters) go to model_specific_params
         """
-        # Update configuration properties with new_params
-        # Validate updated configuration
-        pass
+        for key, value in new_params.items():
+            if key == "model_specific_params":
+                self.model_specific_params.update(value or {})
+            elif key in DEFAULT_TRAINING_CONFIG:
+                setattr(self, key, value)
+            else:
+                self.model_specific_params[key] = value
+        if not self.validate():
+            raise ValueError(f"Invalid training configuration: {self.to_dict()}")
 
 
 class TrainingRun:
@@ -195,25 +406,23 @@ class TrainingRun:
             config (TrainingConfig): config
             dataset_info (dict): dataset_info
         """
-        # Generate unique run_id using uuid
-        # Set model_type
-        # Set model_id
-        # Generate version string based on timestamp
-        # Set config
-        # Set dataset_info
-        # Initialize empty metrics dictionary
-        # Set start_time to current time
-        # Set end_time to None
-        # Set status to 'initialized'
-        # Set artifact_path to None
-        pass
+        self.run_id = str(uuid.uuid4())
+        self.model_type = model_type
+        self.model_id = model_id
+        self.version = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self.config = config
+        self.dataset_info = dataset_info or {}
+        self.metrics = {}
+        self.start_time = datetime.now()
+        self.end_time = None
+        self.status = "initialized"
+        self.artifact_path = None
 
     def start(self) -> None:
         """Mark training run as started"""
-        # Set status to 'running'
-        # Set start_time to current time
-        # Log training run start
-        pass
+        self.status = "running"
+        self.start_time = datetime.now()
+        logger.info(f"Started training run {self.run_id} for {self.model_type} model {self.model_id}")
 
     def complete(self, final_metrics: dict, artifact_path: str) -> None:
         """Mark training run as completed
@@ -222,12 +431,11 @@ class TrainingRun:
             final_metrics (dict): final_metrics
             artifact_path (str): artifact_path
         """
-        # Set status to 'completed'
-        # Set end_time to current time
-        # Update metrics with final_metrics
-        # Set artifact_path
-        # Log training run completion with metrics
-        pass
+        self.status = "completed"
+        self.end_time = datetime.now()
+        self.metrics.update(final_metrics)
+        self.artifact_path = artifact_path
+        logger.info(f"Completed training run {self.run_id} for {self.model_type} model: {final_metrics}")
 
     def fail(self, error_message: str) -> None:
         """Mark training run as failed
@@ -235,11 +443,10 @@ class TrainingRun:
         Args:
             error_message (str): error_message
         """
-        # Set status to 'failed'
-        # Set end_time to current time
-        # Add error_message to metrics
-        # Log training run failure with error message
-        pass
+        self.status = "failed"
+        self.end_time = datetime.now()
+        self.metrics["error_message"] = error_message
+        logger.error(f"Training run {self.run_id} for {self.model_type} model failed: {error_message}")
 
     def to_dict(self) -> dict:
         """Convert training run to dictionary representation
@@ -247,11 +454,19 @@ class TrainingRun:
         Returns:
             dict: Dictionary representation of training run
         """
-        # Create dictionary with all training run properties
-        # Convert config to dictionary
-        # Format datetime objects as ISO strings
-        # Return the dictionary
-        return {}
+        return {
+            "run_id": self.run_id,
+            "model_type": self.model_type,
+            "model_id": self.model_id,
+            "version": self.version,
+            "config": self.config.to_dict(),
+            "dataset_info": self.dataset_info,
+            "metrics": self.metrics,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "status": self.status,
+            "artifact_path": self.artifact_path
+        }
 
     @classmethod
     def from_dict(cls, run_dict: dict) -> 'TrainingRun':
@@ -263,13 +478,16 @@ class TrainingRun:
         Returns:
             TrainingRun: TrainingRun instance
         """
-        # Extract model_type, model_id from dictionary
-        # Create TrainingConfig from config dictionary
-        # Create TrainingRun instance
-        # Set remaining properties from dictionary
-        # Parse timestamp strings to datetime objects
-        # Return the instance
-        return TrainingRun(model_type="", model_id="", config=TrainingConfig({}), dataset_info={})
+        run = cls(model_type=run_dict["model_type"], model_id=run_dict["model_id"],
+                  config=TrainingConfig.from_dict(run_dict.get("config", {})), dataset_info=run_dict.get("dataset_info", {}))
+        run.run_id = run_dict.get("run_id", run.run_id)
+        run.version = run_dict.get("version", run.version)
+        run.metrics = run_dict.get("metrics", {})
+        run.status = run_dict.get("status", run.status)
+        run.artifact_path = run_dict.get("artifact_path")
+        run.start_time = datetime.fromisoformat(run_dict["start_time"]) if run_dict.get("start_time") else None
+        run.end_time = datetime.fromisoformat(run_dict["end_time"]) if run_dict.get("end_time") else None
+        return run
 
     def get_duration(self) -> float:
         """Get the duration of the training run
@@ -277,10 +495,9 @@ class TrainingRun:
         Returns:
             float: Duration in seconds or None if not completed
         """
-        # Check if both start_time and end_time are set
-        # Calculate duration as difference between end_time and start_time
-        # Return duration in seconds or None if not completed
-        return 0.0
+        if self.start_time is None or self.end_time is None:
+            return None
+        return (self.end_time - self.start_time).total_seconds()
 
 
 class ModelTrainer:
@@ -290,67 +507,183 @@ class ModelTrainer:
         """Initialize the model trainer with configuration
 
         Args:
-            config (dict): config
+            config (dict): Trainer settings: models_path, feedback_store_path, training (TrainingConfig overrides)
             model_manager (ModelManager): model_manager
             knowledge_base (KnowledgeBase): knowledge_base
         """
-        # Initialize configuration with defaults and override with provided config
-        # Set model_manager reference
-        # Set knowledge_base reference
-        # Initialize empty dictionary for training_history
-        # Initialize empty dictionary for model_builders
-        # Set models_path from config or default
-        # Register default model builders
-        # Set up logging
-        pass
-
-    def train_model(self, model_type: str, training_data: list, training_config: TrainingConfig) -> typing.Tuple[object, dict, TrainingRun]:
+        self._config = config or {}
+        self._model_manager = model_manager
+        self._knowledge_base = knowledge_base
+        self._training_history = {}
+        self._model_builders = {}
+        self._models_path = self._config.get("models_path", DEFAULT_MODELS_PATH)
+        self._feedback_store = None
+        self._default_training_config = self._config.get("training", {})
+        self._register_default_builders()
+        if TrainingConfig(self._default_training_config).cpu_only:
+            hide_gpus()
+        logger.info(f"Initialized model trainer with models path {self._models_path}")
+
+    def train_model(self, model_type: str, training_data: list, training_config: TrainingConfig, feedback_sequence: int = None) -> typing.Tuple[object, dict, TrainingRun]:
         """Train a model of specified type with provided data
 
         Args:
             model_type (str): model_type
-            training_data (list): training_data
+            training_data (list): Feedback records, or columns loaded from a ColumnarFeedbackStore
             training_config (TrainingConfig): training_config
+            feedback_sequence (int): Feedback store sequence number the data reaches, recorded on the
+                model version so that later incremental runs only load newer feedback
 
         Returns:
             tuple: (model, metrics, TrainingRun)
         """
-        # Validate model_type is supported
-        # Create or get model_id for the model type
-        # Prepare training and validation datasets
-        # Create TrainingRun instance
-        # Start training run
-        # Get appropriate model builder for model_type
-        # Build and train model with training_config
-        # Evaluate model on validation data
-        # Save trained model to disk
-        # Register model with model_manager
-        # Complete training run with metrics and artifact path
-        # Add training run to history
-        # Return tuple of (model, metrics, training_run)
-        return None, {}, TrainingRun(model_type="", model_id="", config=TrainingConfig({}), dataset_info={})
+        return self._train(model_type, training_data, training_config or self._get_training_config(),
+                           TRAINING_MODE_FULL, feedback_sequence=feedback_sequence)
+
+    def train_incremental(self, model_type: str, store: feedback_store.ColumnarFeedbackStore = None, training_config: TrainingConfig = None) -> typing.Tuple[object, dict, TrainingRun]:
+        """Update a model from the feedback collected since its last version
+
+        The last version is copied and trained for warm_start_epochs on the new records plus a
+        replay sample of older ones (replay_fraction times as many; with no replay this is a
+        pure online update). A full retrain is done instead when there is no version trained
+        from the store yet, the new records carry unseen labels, or they make up more than
+        full_retrain_ratio of the store.
+
+        Args:
+            model_type (str): model_type
+            store (ColumnarFeedbackStore): Feedback store; defaults to the configured feedback_store_path
+            training_config (TrainingConfig): training_config
+
+        Returns:
+            tuple: (model, metrics, TrainingRun); (None, metrics, None) if there are too few new records
+        """
+        self._validate_model_type(model_type)
+        store = store or self.get_feedback_store()
+        training_config = training_config or self._get_training_config()
+        end = store.sequence
+
+        model_id = self._get_or_create_model_id(model_type)
+        previous = self._model_manager.get_model(model_id).get_latest_version()
+        parameters = previous.metadata.parameters if previous else {}
+        start = parameters.get("feedback_sequence")
+        classes = parameters.get("classes")
+
+        full_retrain_reason = None
+        if start is None or classes is None:
+            full_retrain_reason = "no model version trained from the feedback store"
+        elif parameters.get("feature_dimension") != store.feature_dimension or start > end:
+            full_retrain_reason = "the feedback store does not match the last model version"
+        elif end - start > training_config.full_retrain_ratio * end:
+            full_retrain_reason = f"{end - start} of {end} feedback records are new"
+        if full_retrain_reason is None:
+            new_records = end - start
+            if new_records < training_config.min_new_records:
+                logger.info(f"Skipping {model_type} update: {new_records} new feedback records, {training_config.min_new_records} required")
+                return None, {"new_records": new_records}, None
+            new_columns = store.load(start, end)
+            new_labels = set(np.asarray(new_columns[TRAINING_LABELS[model_type]]).astype(str).tolist()) - {""}
+            if not new_labels <= set(classes):
+                full_retrain_reason = f"new labels {sorted(new_labels - set(classes))}"
+
+        if full_retrain_reason is not None:
+            logger.info(f"Retraining {model_type} model from scratch: {full_retrain_reason}")
+            return self.train_model(model_type, store.load(stop=end), training_config, feedback_sequence=end)
+
+        # Mix a replay sample of older feedback in so the update does not forget it
+        replay_count = min(start, int(training_config.replay_fraction * new_records))
+        data = new_columns
+        if replay_count:
+            sample = np.sort(np.random.default_rng(end).choice(start, size=replay_count, replace=False))
+            replay_columns = store.take(sample)
+            data = {column: np.concatenate([replay_columns[column], new_columns[column]]) for column in new_columns}
+
+        initial_model = self._copy_model(self._model_manager.load_model(model_id, previous.version_id))
+        warm_config = TrainingConfig.from_dict(training_config.to_dict())
+        warm_config.update({"epochs": training_config.warm_start_epochs})
+        mode = TRAINING_MODE_WARM_START if replay_count else TRAINING_MODE_ONLINE
+        return self._train(model_type, data, warm_config, mode, feedback_sequence=end, initial_model=initial_model,
+                           classes=classes, total_records=end)
+
+    def search_hyperparameters(self, model_type: str, store: feedback_store.ColumnarFeedbackStore = None, search_space: dict = None, candidate_count: int = 9,
+                               training_config: TrainingConfig = None, max_workers: int = None, seed: int = None) -> dict:
+        """Search network hyperparameters in parallel CPU-only worker processes
+
+        Candidates are trained on the store contents by successive halving over epochs, so weak
+        candidates are stopped after a few epochs and only the best reach training_config.epochs.
+
+        Args:
+            model_type (str): model_type
+            store (ColumnarFeedbackStore): Feedback store; defaults to the configured feedback_store_path
+            search_space (dict): Parameter choices or ranges; defaults to DEFAULT_SEARCH_SPACE
+            candidate_count (int): Number of sampled candidates
+            training_config (TrainingConfig): Base configuration the candidates override
+            max_workers (int): Number of worker processes; defaults to the CPU count
+            seed (int): Seed of the candidate sampling
+
+        Returns:
+            dict: Search result (see HyperparameterSearch.run) plus training_config, the base
+                configuration updated with the best parameters
+        """
+        self._validate_model_type(model_type)
+        store = store or self.get_feedback_store()
+        training_config = training_config or self._get_training_config()
+        reduction_factor = hyperparameter_search.DEFAULT_REDUCTION_FACTOR
+        trial_function = functools.partial(run_search_trial, model_type, store.root_path, store.sequence, training_config.to_dict())
+        search = hyperparameter_search.HyperparameterSearch(
+            trial_function,
+            max_workers=max_workers,
+            reduction_factor=reduction_factor,
+            min_budget=max(1, training_config.epochs // reduction_factor ** 2),
+            max_budget=training_config.epochs
+        )
+        candidates = hyperparameter_search.generate_candidates(search_space or DEFAULT_SEARCH_SPACE, candidate_count, seed)
+        result = search.run(candidates)
+        best_config = TrainingConfig.from_dict(training_config.to_dict())
+        best_config.update(result["best_params"])
+        result["training_config"] = best_config
+        return result
+
+    def get_feedback_store(self) -> feedback_store.ColumnarFeedbackStore:
+        """Get the feedback store at the configured feedback_store_path
+
+        Returns:
+            ColumnarFeedbackStore: Feedback store
+        """
+        if self._feedback_store is None:
+            store_path = self._config.get("feedback_store_path")
+            if not store_path:
+                raise ValueError("No feedback store given and no feedback_store_path configured")
+            self._feedback_store = feedback_store.ColumnarFeedbackStore(store_path)
+        return self._feedback_store
 
     def train_from_feedback(self, feedback_records: list, model_types: list, training_config: TrainingConfig) -> dict:
         """Train or update models based on feedback data
 
         Args:
-            feedback_records (list): feedback_records
+            feedback_records (list): Feedback records, or columns loaded from a ColumnarFeedbackStore
             model_types (list): model_types
             training_config (TrainingConfig): training_config
 
         Returns:
             dict: Dictionary of training results by model type
         """
-        # Validate feedback_records has sufficient data
-        # Use all model types if model_types is None
-        # Use default training config if not provided
-        # Initialize results dictionary
-        # For each model type:
-        #   Prepare training data from feedback
-        #   Train model if sufficient data available
-        #   Add training result to results dictionary
-        # Return dictionary of training results
-        return {}
+        if feedback_records is None or not len(feedback_records):
+            logger.warning("No feedback records to train from")
+            return {}
+        training_config = training_config or self._get_training_config()
+        if not isinstance(feedback_records, dict):
+            # Encode the records once for all model types
+            feedback_records = feedback_store.records_to_columns(feedback_records, _get_feedback_vectorizer())
+
+        results = {}
+        for model_type in model_types or list(MODEL_TYPES):
+            try:
+                model, metrics, training_run = self.train_model(model_type, feedback_records, training_config)
+                results[model_type] = {"metrics": metrics, "run_id": training_run.run_id, "status": training_run.status}
+            except ValueError as e:
+                logger.warning(f"Could not train {model_type} model from feedback: {e}")
+                results[model_type] = {"metrics": {}, "run_id": None, "status": "skipped", "error": str(e)}
+        return results
 
     def train_from_effectiveness(self, analysis: effectiveness_analyzer.EffectivenessAnalysis, feedback_records: list, training_config: TrainingConfig) -> dict:
         """Train or update models based on effectiveness analysis
@@ -377,27 +710,24 @@ class ModelTrainer:
 
         Args:
             model_type (str): model_type
-            builder_function (callable): builder_function
+            builder_function (callable): Function (X_train, y_train, config, initial_model=None, class_count=None,
+                validation_data=None) returning a trained model; initial_model is a copy of the last version to warm start from
         """
-        # Validate builder_function is callable
-        # Add builder_function to model_builders dictionary with model_type as key
-        pass
+        if not callable(builder_function):
+            raise ValueError(f"Model builder for {model_type} must be callable")
+        self._model_builders[model_type] = builder_function
 
     def get_training_history(self, filters: dict) -> list:
         """Get training history with optional filtering
 
         Args:
-            filters (dict): filters
+            filters (dict): Attribute values of TrainingRun to match, e.g. {"model_type": "classification"}
 
         Returns:
             list: Filtered training history
         """
-        # Initialize empty result list
-        # Iterate through training_history
-        # Apply filters to each training run
-        # Add matching runs to result list
-        # Return filtered list
-        return []
+        return [training_run for training_run in self._training_history.values()
+                if not filters or all(getattr(training_run, key, None) == value for key, value in filters.items())]
 
     def get_training_run(self, run_id: str) -> TrainingRun:
         """Get a specific training run by ID
@@ -408,24 +738,23 @@ class ModelTrainer:
         Returns:
             TrainingRun: Training run or None if not found
         """
-        # Look up run_id in training_history
-        # Return training run if found, None otherwise
-        return TrainingRun(model_type="", model_id="", config=TrainingConfig({}), dataset_info={})
+        return self._training_history.get(run_id)
 
-    def get_latest_training_run(self, model_type: str) -> TrainingRun:
+    def get_latest_training_run(self, model_type: str, training_mode: str = None) -> TrainingRun:
         """Get the latest training run for a model type
 
         Args:
             model_type (str): model_type
+            training_mode (str): Only consider completed runs of this training mode
 
         Returns:
             TrainingRun: Latest training run or None if not found
         """
-        # Filter training history for specified model_type
-        # Sort by start_time in descending order
-        # Return the most recent training run
-        # Return None if no training runs found
-        return TrainingRun(model_type="", model_id="", config=TrainingConfig({}), dataset_info={})
+        runs = [training_run for training_run in self._training_history.values() if training_run.model_type == model_type
+                and (training_mode is None or (training_run.status == "completed" and training_run.metrics.get("training_mode") == training_mode))]
+        if not runs:
+            return None
+        return max(runs, key=lambda training_run: training_run.start_time)
 
     def evaluate_model_improvement(self, model_id: str, current_version: str, previous_version: str) -> dict:
         """Evaluate improvement between model versions
@@ -438,12 +767,13 @@ class ModelTrainer:
         Returns:
             dict: Improvement metrics
         """
-        # Get model versions from model_manager
-        # Extract metrics for both versions
-        # Compare metrics using compare_model_versions
-        # Generate improvement summary
-        # Return improvement metrics dictionary
-        return {}
+        model = self._model_manager.get_model(model_id)
+        if not model:
+            raise ValueError(f"Model with ID {model_id} not found")
+        current, previous = model.get_version(current_version), model.get_version(previous_version)
+        if not current or not previous:
+            raise ValueError(f"Versions {current_version} and {previous_version} must both exist for model {model_id}")
+        return compare_model_versions(current.metadata.metrics, previous.metadata.metrics)
 
     def save_training_history(self) -> bool:
         """Save training history to disk
@@ -451,10 +781,14 @@ class ModelTrainer:
         Returns:
             bool: True if save successful
         """
-        # Convert training history to serializable format
-        # Write to JSON file in models directory
-        # Return success status
-        return True
+        try:
+            os.makedirs(self._models_path, exist_ok=True)
+            with open(os.path.join(self._models_path, TRAINING_HISTORY_FILE), "w") as f:
+                json.dump([training_run.to_dict() for training_run in self._training_history.values()], f, default=str)
+            return True
+        except (OSError, TypeError) as e:
+            logger.error(f"Failed to save training history: {e}")
+            return False
 
     def load_training_history(self) -> bool:
         """Load training history from disk
@@ -462,87 +796,109 @@ class ModelTrainer:
         Returns:
             bool: True if load successful
         """
-        # Check if history file exists
-        # Read and parse JSON if exists
-        # Convert to training_history dictionary with TrainingRun objects
-        # Return success status
+        history_path = os.path.join(self._models_path, TRAINING_HISTORY_FILE)
+        if not os.path.exists(history_path):
+            return False
+        try:
+            with open(history_path, "r") as f:
+                runs = [TrainingRun.from_dict(run_dict) for run_dict in json.load(f)]
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load training history: {e}")
+            return False
+        self._training_history = {training_run.run_id: training_run for training_run in runs}
         return True
 
-    def _build_classification_model(self, X_train: object, y_train: object, config: TrainingConfig) -> object:
+    def _build_classification_model(self, X_train: object, y_train: object, training_config: TrainingConfig, initial_model: object = None, class_count: int = None, validation_data: tuple = None) -> object:
         """Build an issue classification model
 
         Args:
             X_train (object): X_train
             y_train (object): y_train
-            config (TrainingConfig): config
+            training_config (TrainingConfig): training_config
+            initial_model (object): Model to continue training instead of building a new one
+            class_count (int): Number of issue types
+            validation_data (tuple): Optional (X_val, y_val) for early stopping
 
         Returns:
             object: Trained classification model
         """
-        # Create TensorFlow model architecture for classification
-        # Configure model with training parameters
-        # Train model on training data
-        # Return trained model
-        return None
+        return self._build_network_model(X_train, y_train, training_config, initial_model, class_count, validation_data)
 
-    def _build_root_cause_model(self, X_train: object, y_train: object, config: TrainingConfig) -> object:
+    def _build_root_cause_model(self, X_train: object, y_train: object, training_config: TrainingConfig, initial_model: object = None, class_count: int = None, validation_data: tuple = None) -> object:
         """Build a root cause analysis model
 
         Args:
             X_train (object): X_train
             y_train (object): y_train
-            config (TrainingConfig): config
+            training_config (TrainingConfig): training_config
+            initial_model (object): Model to continue training instead of building a new one
+            class_count (int): Number of root causes
+            validation_data (tuple): Optional (X_val, y_val) for early stopping
 
         Returns:
             object: Trained root cause model
         """
-        # Create TensorFlow model architecture for root cause analysis
-        # Configure model with training parameters
-        # Train model on training data
-        # Return trained model
-        return None
+        return self._build_network_model(X_train, y_train, training_config, initial_model, class_count, validation_data)
 
-    def _build_pattern_model(self, X_train: object, y_train: object, config: TrainingConfig) -> object:
+    def _build_pattern_model(self, X_train: object, y_train: object, training_config: TrainingConfig, initial_model: object = None, class_count: int = None, validation_data: tuple = None) -> object:
         """Build a pattern recognition model
 
         Args:
             X_train (object): X_train
             y_train (object): y_train
-            config (TrainingConfig): config
+            training_config (TrainingConfig): training_config
+            initial_model (object): Model to continue training instead of building a new one
+            class_count (int): Number of patterns
+            validation_data (tuple): Optional (X_val, y_val) for early stopping
 
         Returns:
             object: Trained pattern recognition model
         """
-        # Create TensorFlow model architecture for pattern recognition
-        # Configure model with training parameters
-        # Train model on training data
-        # Return trained model
-        return None
+        return self._build_network_model(X_train, y_train, training_config, initial_model, class_count, validation_data)
 
-    def _build_correction_model(self, X_train: object, y_train: object, config: TrainingConfig) -> object:
+    def _build_correction_model(self, X_train: object, y_train: object, training_config: TrainingConfig, initial_model: object = None, class_count: int = None, validation_data: tuple = None) -> object:
         """Build a data correction model
 
         Args:
             X_train (object): X_train
             y_train (object): y_train
-            config (TrainingConfig): config
+            training_config (TrainingConfig): training_config
+            initial_model (object): Model to continue training instead of building a new one
+            class_count (int): Number of outcomes
+            validation_data (tuple): Optional (X_val, y_val) for early stopping
 
         Returns:
             object: Trained data correction model
         """
-        # Create TensorFlow model architecture for data correction
-        # Configure model with training parameters
-        # Train model on training data
-        # Return trained model
-        return None
+        return self._build_network_model(X_train, y_train, training_config, initial_model, class_count, validation_data)
+
+    def _build_network_model(self, X_train: object, y_train: object, training_config: TrainingConfig, initial_model: object, class_count: int, validation_data: tuple) -> object:
+        """Build a feed-forward network, or recompile the initial model, and train it
+
+        Args:
+            X_train (object): X_train
+            y_train (object): y_train
+            training_config (TrainingConfig): training_config
+            initial_model (object): initial_model
+            class_count (int): class_count
+            validation_data (tuple): validation_data
+
+        Returns:
+            object: Trained model
+        """
+        if initial_model is not None:
+            model = initial_model
+            compile_network(model, training_config)
+        else:
+            model = build_network(X_train.shape[1], class_count or int(np.max(y_train)) + 1, training_config)
+        return fit_network(model, X_train, y_train, training_config, validation_data)
 
     def _register_default_builders(self) -> None:
         """Register default model builders for standard model types"""
-        # Register _build_classification_model for 'classification' type
-        # Register _build_root_cause_model for 'root_cause' type
-        # Register _build_pattern_model for 'pattern' type
-        # Register _build_correction_model for 'correction' type
-        pass
+        self.register_model_builder("classification", self._build_classification_model)
+        self.register_model_builder("root_cause", self._build_root_cause_model)
+        self.register_model_builder("pattern", self._build_pattern_model)
+        self.register_model_builder("correction", self._build_correction_model)
 
     def _get_or_create_model_id(self, model_type: str) -> str:
         """Get existing model ID or create new one for model type
@@ -553,8 +909,131 @@ class ModelTrainer:
         Returns:
             str: Model ID
         """
-        # Query model_manager for models of specified type
-        # If model exists, return its ID
-        # If no model exists, register new model with model_manager
-        # Return new model ID
-        return ""
\ No newline at end of file
+        models = self._model_manager.get_model_by_type(model_type)
+        if models:
+            return models[0].model_id
+        return self._model_manager.register_model(MODEL_TYPES[model_type], MODEL_TYPES[model_type], model_type, {})
+
+    def _train(self, model_type: str, training_data: object, training_config: TrainingConfig, mode: str, feedback_sequence: int = None,
+               initial_model: object = None, classes: list = None, total_records: int = None) -> typing.Tuple[object, dict, TrainingRun]:
+        """Train, evaluate, save and register a model version
+
+        Args:
+            model_type (str): model_type
+            training_data (object): Feedback records or feedback store columns
+            training_config (TrainingConfig): training_config
+            mode (str): One of the training modes
+            feedback_sequence (int): Feedback store sequence number the data reaches
+            initial_model (object): Model to warm start from
+            classes (list): Classes of the initial model; derived from the data if None
+            total_records (int): Number of records a full retrain would use, for the timing comparison
+
+        Returns:
+            tuple: (model, metrics, TrainingRun)
+        """
+        self._validate_model_type(model_type)
+        model_id = self._get_or_create_model_id(model_type)
+        X_train, y_train, X_val, y_val = prepare_training_data(training_data, model_type, self._knowledge_base, training_config.validation_split)
+        if not len(X_train):
+            raise ValueError(f"No feedback records labelled for the {model_type} model")
+        if classes is None:
+            classes = sorted(set(y_train.tolist()) | set(y_val.tolist()))
+        y_train, y_val = encode_labels(y_train, classes), encode_labels(y_val, classes)
+
+        records = len(X_train) + len(X_val)
+        dataset_info = {
+            "records": records,
+            "training_records": len(X_train),
+            "validation_records": len(X_val),
+            "feature_dimension": int(X_train.shape[1]),
+            "classes": list(classes),
+            "feedback_sequence": feedback_sequence,
+            "training_mode": mode
+        }
+        training_run = TrainingRun(model_type, model_id, training_config, dataset_info)
+        training_run.start()
+        self._training_history[training_run.run_id] = training_run
+        try:
+            started = time.perf_counter()
+            model = self._model_builders[model_type](X_train, y_train, training_config, initial_model=initial_model, class_count=len(classes),
+                                                     validation_data=(X_val, y_val))
+            training_seconds = time.perf_counter() - started
+
+            metrics = evaluate_model_performance(model, X_val, y_val, model_type)
+            metrics.update(self._get_timing_metrics(model_type, mode, training_seconds, records, total_records or records))
+
+            model_format = DEFAULT_MODEL_FORMATS[model_type]
+            parameters = dict(training_config.to_dict(), classes=list(classes), feedback_sequence=feedback_sequence,
+                              feature_dimension=int(X_train.shape[1]), training_mode=mode)
+            artifact_path = model_utils.save_model(
+                model, model_utils.create_model_path(model_id, training_run.version, base_dir=self._models_path), model_format,
+                metadata=generate_model_metadata(model_type, training_config.to_dict(), metrics, parameters))
+            self._model_manager.register_model_version(model_id, artifact_path, model_format, parameters, metrics,
+                                                       f"{MODEL_TYPES[model_type]} ({mode} training on {records} feedback records)")
+        except Exception as e:
+            training_run.fail(str(e))
+            raise
+        training_run.complete(metrics, artifact_path)
+        return model, metrics, training_run
+
+    def _get_timing_metrics(self, model_type: str, mode: str, training_seconds: float, records: int, total_records: int) -> dict:
+        """Time a training run against a from-scratch run
+
+        A full run is its own baseline. Incremental runs are compared with the last full run of
+        the model type, scaled linearly to the number of records a full retrain would use now.
+
+        Args:
+            model_type (str): model_type
+            mode (str): mode
+            training_seconds (float): training_seconds
+            records (int): Records trained on
+            total_records (int): Records a full retrain would train on
+
+        Returns:
+            dict: training_mode, training_seconds, records_trained, full_training_seconds_estimate and speedup
+        """
+        timing = {"training_mode": mode, "training_seconds": training_seconds, "records_trained": records,
+                  "full_training_seconds_estimate": None, "speedup": None}
+        if mode == TRAINING_MODE_FULL:
+            timing["full_training_seconds_estimate"] = training_seconds
+            timing["speedup"] = 1.0
+            return timing
+        last_full_run = self.get_latest_training_run(model_type, TRAINING_MODE_FULL)
+        if last_full_run is not None and last_full_run.metrics.get("records_trained"):
+            estimate = last_full_run.metrics["training_seconds"] * total_records / last_full_run.metrics["records_trained"]
+            timing["full_training_seconds_estimate"] = estimate
+            timing["speedup"] = estimate / training_seconds if training_seconds else None
+            logger.info(f"{mode} training of {model_type} model took {training_seconds:.1f}s, "
+                        f"estimated full retrain {estimate:.1f}s")
+        return timing
+
+    def _get_training_config(self) -> TrainingConfig:
+        """Get the configured default training configuration
+
+        Returns:
+            TrainingConfig: New TrainingConfig instance
+        """
+        return TrainingConfig(self._default_training_config)
+
+    def _copy_model(self, model: object) -> object:
+        """Copy a loaded model so that warm starting does not modify the instance being served
+
+        Args:
+            model (object): model
+
+        Returns:
+            object: Uncompiled copy with the same weights
+        """
+        model_copy = tf.keras.models.clone_model(model)
+        model_copy.set_weights(model.get_weights())
+        return model_copy
+
+    @staticmethod
+    def _validate_model_type(model_type: str) -> None:
+        """Validate that a model type is supported
+
+        Args:
+            model_type (str): model_type
+        """
+        if model_type not in MODEL_TYPES:
+            raise ValueError(f"Unsupported model type: {model_type}. Supported types are: {', '.join(MODEL_TYPES)}")
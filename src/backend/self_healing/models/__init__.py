@@ -15,6 +15,12 @@ from .model_evaluation import ModelEvaluator, ModelEvaluationResult, serialize_e
 # Import model serving functionality
 from .model_serving import ModelServer, ModelPrediction, ModelServingCache, serialize_prediction, deserialize_prediction  # src/backend/self_healing/models/model_serving.py
 
+# Import dynamic inference batching
+from .inference_batcher import DynamicBatcher  # src/backend/self_healing/models/inference_batcher.py
+
+# Import shared model pool
+from .model_pool import ModelPool, get_model_pool  # src/backend/self_healing/models/model_pool.py
+
 __all__ = [
     "ModelManager",  # Main class for managing ML models used in the self-healing pipeline
     "Model",  # Represents a model with multiple versions
@@ -26,6 +32,9 @@ __all__ = [
     "ModelServer",  # Main class for serving machine learning models and making predictions
     "ModelPrediction",  # Represents a prediction result from a model
     "ModelServingCache",  # Cache for model serving to improve prediction performance
+    "DynamicBatcher",  # Gathers concurrent inference requests into batched forward passes
+    "ModelPool",  # Memory-budgeted LRU pool of loaded models shared across the process
+    "get_model_pool",  # Returns the process-wide model pool
     "serialize_model_metadata",  # Serializes model metadata to JSON format
     "deserialize_model_metadata",  # Deserializes model metadata from JSON format
     "get_model_path",  # Constructs the path to a model artifact
@@ -0,0 +1,317 @@
+"""
+Dynamic micro-batching for model inference in the self-healing AI engine.
+
+During incident storms many threads call ModelServer.predict concurrently, and each call
+used to run its own single-row forward pass. A DynamicBatcher sits in front of one loaded
+model and turns those concurrent calls into batched forward passes:
+
+- Callers enqueue an input and wait on a future.
+- A worker thread takes the first queued input, then keeps gathering inputs until the
+  batch is full or the latency window that started with the first input has elapsed.
+- The batch is passed to the predict function in one call, and its outputs are scattered
+  back to the callers' futures in order. A failing batch is split in halves and retried,
+  recursively, so only the callers whose inputs fail on their own receive the exception.
+
+Batch sizes, batch latencies and queue wait times are recorded in histograms.
+"""
+
+import bisect
+import concurrent.futures
+import queue
+import threading
+import typing
+from time import perf_counter
+
+from src.backend.utils.logging.logger import get_logger  # Internal import
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default batching settings
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_LATENCY_MS = 5.0
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+# Histogram bucket upper bounds
+BATCH_SIZE_BOUNDS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+LATENCY_MS_BOUNDS = [0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+# Sentinel telling the worker thread to stop
+_STOP = object()
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of observed values
+    """
+
+    def __init__(self, bounds: typing.List[float]):
+        """
+        Initialize an empty histogram
+
+        Args:
+            bounds: Sorted bucket upper bounds; larger values fall in an overflow bucket
+        """
+        self._bounds = list(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float):
+        """
+        Record a value
+
+        Args:
+            value: Observed value
+        """
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def to_dict(self) -> dict:
+        """
+        Convert the histogram to a dictionary
+
+        Returns:
+            Dictionary with bucket counts keyed by upper bound ("+Inf" for overflow), total count, sum and mean
+        """
+        buckets = {str(bound): count for bound, count in zip(self._bounds, self._counts)}
+        buckets["+Inf"] = self._counts[-1]
+        return {
+            "buckets": buckets,
+            "count": self._count,
+            "sum": self._sum,
+            "mean": self._sum / self._count if self._count else 0.0
+        }
+
+
+class _Request:
+    """
+    Queued inference request
+    """
+    __slots__ = ("item", "future", "enqueued_at")
+
+    def __init__(self, item: typing.Any):
+        self.item = item
+        self.future = concurrent.futures.Future()
+        self.enqueued_at = perf_counter()
+
+
+class DynamicBatcher:
+    """
+    Gathers concurrent inference requests into batched calls of a predict function
+    """
+
+    def __init__(self, predict_fn: typing.Callable[[list], typing.Sequence], max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_latency_ms: float = DEFAULT_MAX_LATENCY_MS, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+                 name: str = "model"):
+        """
+        Initialize the batcher
+
+        Args:
+            predict_fn: Function mapping a list of inputs to a sequence with one output per input
+            max_batch_size: Maximum number of inputs per batch
+            max_latency_ms: Time to wait for more inputs after the first input of a batch arrives
+            max_queue_size: Maximum number of queued inputs; submit blocks when the queue is full
+            name: Name used for the worker thread and log messages
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_latency = max(0.0, max_latency_ms) / 1000.0
+        self._name = name
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._worker = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._batch_sizes = Histogram(BATCH_SIZE_BOUNDS)
+        self._batch_latencies = Histogram(LATENCY_MS_BOUNDS)
+        self._queue_waits = Histogram(LATENCY_MS_BOUNDS)
+        self._requests = 0
+        self._failed_batches = 0
+        self._failed_requests = 0
+
+    def submit(self, item: typing.Any) -> concurrent.futures.Future:
+        """
+        Queue an input for the next batch
+
+        Args:
+            item: Model input
+
+        Returns:
+            Future resolving to the model output for this input
+        """
+        request = _Request(item)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Batcher for {self._name} is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=f"batcher-{self._name}", daemon=True)
+                self._worker.start()
+            self._requests += 1
+        self._queue.put(request)
+        return request.future
+
+    def predict(self, item: typing.Any, timeout: float = None) -> typing.Any:
+        """
+        Run an input through the model as part of a batch
+
+        Args:
+            item: Model input
+            timeout: Maximum time to wait for the result in seconds
+
+        Returns:
+            Model output for the input
+        """
+        return self.submit(item).result(timeout)
+
+    def predict_many(self, items: list, timeout: float = None) -> list:
+        """
+        Run several inputs through the model, batched with any concurrent requests
+
+        Args:
+            items: Model inputs
+            timeout: Maximum time to wait for all results in seconds
+
+        Returns:
+            Model outputs in input order
+        """
+        futures = [self.submit(item) for item in items]
+        return [future.result(timeout) for future in futures]
+
+    def get_stats(self) -> dict:
+        """
+        Get batching statistics
+
+        Returns:
+            Dictionary with request, batch and failure counters, queue depth and histograms
+            of batch size, batch latency (ms) and queue wait (ms)
+        """
+        with self._lock:
+            batch_sizes = self._batch_sizes.to_dict()
+            return {
+                "requests": self._requests,
+                "batches": batch_sizes["count"],
+                "failed_batches": self._failed_batches,
+                "failed_requests": self._failed_requests,
+                "queue_depth": self._queue.qsize(),
+                "batch_size": batch_sizes,
+                "batch_latency_ms": self._batch_latencies.to_dict(),
+                "queue_wait_ms": self._queue_waits.to_dict()
+            }
+
+    def close(self, timeout: float = None):
+        """
+        Stop the worker thread after the queued requests have been served
+
+        Args:
+            timeout: Maximum time to wait for the worker thread in seconds
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is not None:
+            self._queue.put(_STOP)
+            worker.join(timeout)
+
+    def _run(self):
+        """
+        Worker loop gathering queued requests into batches
+        """
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = perf_counter() + self._max_latency
+            while len(batch) < self._max_batch_size:
+                try:
+                    remaining = deadline - perf_counter()
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                batch.append(request)
+            self._run_batch(batch)
+
+        # Fail requests that raced with close()
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not _STOP:
+                request.future.set_exception(RuntimeError(f"Batcher for {self._name} is closed"))
+
+    def _run_batch(self, batch: typing.List[_Request]):
+        """
+        Run one batch through the predict function and scatter the outputs
+
+        Args:
+            batch: Requests in the batch
+        """
+        started = perf_counter()
+        try:
+            outputs = self._predict(batch)
+        except Exception as e:
+            logger.error(f"Batched prediction with {self._name} failed for {len(batch)} requests: {e}")
+            with self._lock:
+                self._failed_batches += 1
+            self._isolate_failures(batch, e)
+            return
+        finished = perf_counter()
+
+        with self._lock:
+            self._batch_sizes.observe(len(batch))
+            self._batch_latencies.observe((finished - started) * 1000.0)
+            for request in batch:
+                self._queue_waits.observe((started - request.enqueued_at) * 1000.0)
+
+        for request, output in zip(batch, outputs):
+            request.future.set_result(output)
+
+    def _predict(self, batch: typing.List[_Request]) -> typing.Sequence:
+        """
+        Run requests through the predict function
+
+        Args:
+            batch: Requests to run
+
+        Returns:
+            One output per request
+        """
+        outputs = self._predict_fn([request.item for request in batch])
+        if len(outputs) != len(batch):
+            raise ValueError(f"Model {self._name} returned {len(outputs)} outputs for a batch of {len(batch)}")
+        return outputs
+
+    def _isolate_failures(self, batch: typing.List[_Request], error: Exception):
+        """
+        Bisect a failed batch so only requests that fail on their own receive an exception
+
+        Args:
+            batch: Requests of the failed batch
+            error: Exception the batch failed with
+        """
+        if len(batch) == 1:
+            with self._lock:
+                self._failed_requests += 1
+            batch[0].future.set_exception(error)
+            return
+
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            try:
+                outputs = self._predict(half)
+            except Exception as e:
+                self._isolate_failures(half, e)
+                continue
+            for request, output in zip(half, outputs):
+                request.future.set_result(output)
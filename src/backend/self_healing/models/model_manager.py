@@ -11,12 +11,12 @@ import uuid  # standard library # IE2: uuid library for generating unique identi
 from google.cloud import aiplatform  # version: 1.25.0 # IE2: google-cloud-aiplatform library for Vertex AI integration
 
 from src.backend.utils.logging.logger import get_logger  # Internal import # IE1: get_logger function from the utils.logging.logger module for configuring logging
-from src.backend.utils.ml import model_utils  # Internal import # IE1: model_utils module for utility functions for model operations
 from src.backend.utils.ml.vertex_client import VertexAIClient, upload_model_to_vertex, deploy_model_to_endpoint  # Internal import # IE1: VertexAIClient class and upload_model_to_vertex, deploy_model_to_endpoint functions from the utils.ml.vertex_client module for Vertex AI integration
 from src.backend.self_healing.models import model_registry  # Internal import # IE1: model_registry module for model registry functionality
 from src.backend.self_healing.models.model_registry import ModelRegistry, serialize_model_metadata, deserialize_model_metadata, get_model_path  # Internal import # IE1: ModelRegistry class and serialize_model_metadata, deserialize_model_metadata, get_model_path functions from the self_healing.models.model_registry module for model registry functionality
 from src.backend.self_healing.models.model_evaluation import ModelEvaluator, ModelEvaluationResult  # Internal import # IE1: ModelEvaluator class and ModelEvaluationResult class from the self_healing.models.model_evaluation module for model evaluation capabilities
 from src.backend.self_healing.models.model_serving import ModelServingFactory, ModelServer  # Internal import # IE1: ModelServingFactory class and ModelServer class from the self_healing.models.model_serving module for model serving capabilities
+from src.backend.self_healing.models.model_pool import ModelPool, get_model_pool, MODEL_POOL_PRELOAD_CONFIG_KEY  # Internal import # IE1: process-wide pool sharing loaded models across components
 from src.backend import config  # Internal import # IE1: config module for accessing application configuration settings
 
 # Initialize logger
@@ -29,64 +29,6 @@ DEFAULT_MODEL_BASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.a
 MODEL_TYPES = {"classification": "Issue Classification", "root_cause": "Root Cause Analysis", "pattern": "Pattern Recognition", "correction": "Data Correction"}
 
 
-def serialize_model_metadata(dict: typing.Dict) -> str:
-    """Serializes model metadata to JSON format
-
-    Args:
-        dict: metadata
-
-    Returns:
-        str: JSON string representation of the metadata
-    """
-    def json_converter(o):
-        if isinstance(o, datetime):
-            return o.__str__()
-        if isinstance(o, enum.Enum):
-            return o.value
-    return json.dumps(dict, default=json_converter)
-
-
-def deserialize_model_metadata(metadata_json: str) -> typing.Dict:
-    """Deserializes model metadata from JSON format
-
-    Args:
-        str: metadata_json
-
-    Returns:
-        dict: Deserialized metadata dictionary
-    """
-    def object_hook(d):
-        for k, v in d.items():
-            if isinstance(v, str):
-                try:
-                    d[k] = datetime.fromisoformat(v)
-                except:
-                    pass
-        return d
-    return json.loads(metadata_json, object_hook=object_hook)
-
-
-def get_model_path(model_id: str, version_id: str = None, base_path: str = None) -> str:
-    """Constructs the path to a model artifact
-
-    Args:
-        model_id: Unique identifier for the model
-        version_id: Version identifier
-        base_path: Base path for models
-
-    Returns:
-        Full path to the model artifact
-    """
-    if not model_id:
-        raise ValueError("Model ID cannot be empty")
-
-    version_id = version_id or "latest"
-    base_path = base_path or DEFAULT_MODEL_BASE_PATH
-
-    model_path = os.path.join(base_path, model_id, version_id)
-    return model_path
-
-
 class ModelMetadata:
     """Represents metadata for a model version"""
     def __init__(self, model_id: str, version_id: str, name: str, description: str, model_type: str, framework: str, parameters: typing.Dict, metrics: typing.Dict, artifact_path: str):
@@ -184,38 +126,34 @@ class ModelVersion:
         self.version_id = version_id
         self.model_id = model_id
         self.metadata = metadata
-        self.model_instance = None
         self.is_active = False
-        self.is_loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model is loaded in the shared model pool"""
+        return get_model_pool().is_loaded(self.model_id, self.version_id)
+
+    @property
+    def model_instance(self) -> object:
+        """Loaded model instance from the shared model pool, or None if not loaded"""
+        return self.load() if self.is_loaded else None
 
     def load(self) -> object:
-        """Load the model from its artifact path
+        """Load the model from its artifact path into the shared model pool
         Returns:
             Loaded model instance
         """
-        if self.is_loaded:
-            logger.info(f"Model {self.model_id} version {self.version_id} already loaded")
-            return self.model_instance
-
-        artifact_path = self.metadata.artifact_path
-        model_format = self.metadata.framework
-
-        self.model_instance = model_utils.load_model(artifact_path, model_format)
-        self.is_loaded = True
-        logger.info(f"Model {self.model_id} version {self.version_id} loaded successfully")
-        return self.model_instance
+        return get_model_pool().get(self.model_id, self.version_id, self.metadata.artifact_path, self.metadata.framework)
 
     def unload(self) -> bool:
         """Unload the model from memory
         Returns:
             True if unloaded successfully
         """
-        if not self.is_loaded:
+        if not get_model_pool().evict(self.model_id, self.version_id):
             logger.info(f"Model {self.model_id} version {self.version_id} not loaded, cannot unload")
             return True
 
-        self.model_instance = None
-        self.is_loaded = False
         logger.info(f"Model {self.model_id} version {self.version_id} unloaded successfully")
         return True
 
@@ -363,9 +301,14 @@ class ModelManager:
         self._model_servers = {}
         self._vertex_client = VertexAIClient(config)
         self._use_vertex_ai = config.get("model_manager.use_vertex_ai", False)
+        self._model_pool = get_model_pool(config)
 
         self._load_models_from_registry()
 
+        # Warm the active versions so the first healing request does not pay for a cold load
+        if not self._use_vertex_ai and config.get(MODEL_POOL_PRELOAD_CONFIG_KEY, True):
+            self.preload_active_models()
+
     def register_model(self, name: str, description: str, model_type: str, metadata: typing.Dict) -> str:
         """Register a new model in the system
         Args:
@@ -382,6 +325,8 @@ class ModelManager:
         model_id = str(uuid.uuid4())
         model = Model(model_id, name, description, model_type)
         self._models[model_id] = model
+        # Analyzers ask the pool for the model by name
+        self._model_pool.register_name(name, model_id)
         logger.info(f"Registered new model: {model_id} with type {model_type}")
         return model_id
 
@@ -445,7 +390,31 @@ class ModelManager:
         if not model:
             raise ValueError(f"Model with ID {model_id} not found")
 
-        return model.set_active_version(version_id)
+        activated = model.set_active_version(version_id)
+        if activated and not self._use_vertex_ai:
+            # Load the new version in the background; the previous one keeps serving until it is ready
+            version = model.get_version(version_id)
+            self._model_pool.swap(model_id, version_id, version.metadata.artifact_path, version.metadata.framework)
+        return activated
+
+    def preload_active_models(self) -> int:
+        """Load the active version of every model into the shared model pool
+        Returns:
+            Number of models loaded
+        """
+        active_versions = []
+        for model in self._models.values():
+            version = model.get_active_version()
+            if version:
+                active_versions.append((model.model_id, version.version_id, version.metadata.artifact_path, version.metadata.framework))
+        return self._model_pool.preload(active_versions)
+
+    def get_model_pool(self) -> ModelPool:
+        """Get the pool holding the loaded models
+        Returns:
+            Shared model pool with hit, miss and load time metrics
+        """
+        return self._model_pool
 
     def get_active_model(self, model_type: str) -> typing.Tuple[Model, ModelVersion]:
         """Get the active version of a model by type
@@ -581,8 +550,22 @@ class ModelManager:
         Returns:
             True if loading successful
         """
-        # Load models from registry
-        # For each model, create Model instance
-        # For each version, create ModelVersion instance
-        # Add models and versions to models dictionary
+        for entry in self._registry.get_all_models():
+            model = Model(entry["id"], entry["name"], entry.get("description"), entry["type"])
+            for version_id in entry.get("versions", []):
+                version_entry = self._registry.get_model_version(model.model_id, version_id)
+                if not version_entry:
+                    continue
+                metadata = ModelMetadata(model.model_id, version_id, model.name, version_entry.get("description"),
+                                         model.model_type, version_entry.get("framework"),
+                                         version_entry.get("parameters", {}), version_entry.get("metrics", {}),
+                                         version_entry.get("artifact_path"))
+                model.add_version(ModelVersion(version_id, model.model_id, metadata))
+            active = self._registry.get_active_version(model.model_id)
+            if active and active["id"] in model.versions:
+                model.set_active_version(active["id"])
+            self._models[model.model_id] = model
+            # Analyzers ask the pool for the model by name; it resolves to the registry ID preloaded here
+            self._model_pool.register_name(model.name, model.model_id)
+        logger.info(f"Loaded {len(self._models)} models from the registry")
         return True
\ No newline at end of file
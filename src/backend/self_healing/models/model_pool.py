@@ -0,0 +1,528 @@
+"""
+Process-wide pool of loaded models for the self-healing AI engine.
+
+Models used to be loaded on first use by every component that needed them: ModelServer,
+ModelManager and each analyzer kept private copies, and a cold load on the healing hot
+path added seconds to time-to-heal. The ModelPool keeps one loaded instance per
+(model, version) for the whole process:
+
+- Models are kept in least-recently-used order within a memory budget. The footprint of
+  each model is estimated when it is loaded, and the least recently used models are
+  evicted when the budget is exceeded.
+- Concurrent requests for a model that is not loaded wait for a single load.
+- Each model name has an active version. preload() loads the active versions at startup,
+  and swap() loads a new version in the background and then switches the active version
+  atomically, so callers never see a partially loaded model. Every swap() or activate()
+  takes a new generation of the model, and a load that completes after a later activation
+  was requested does not change the active version.
+- Models are keyed by their registry model ID. Components that know a model by name
+  resolve it through register_name(), so ModelManager and the analyzers share one entry.
+- Hits, misses, evictions and load times are counted for monitoring.
+"""
+
+import collections
+import concurrent.futures
+import os
+import sys
+import threading
+import typing
+from time import perf_counter
+
+from src.backend.utils.logging.logger import get_logger  # Internal import
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Configuration keys
+MODEL_POOL_MAX_MEMORY_CONFIG_KEY = "model_pool.max_memory_bytes"
+MODEL_POOL_PRELOAD_CONFIG_KEY = "model_pool.preload_on_startup"
+
+# Default memory budget for loaded models (2 GiB)
+DEFAULT_MAX_MEMORY_BYTES = 2 * 1024 ** 3
+
+# Bytes per parameter assumed for framework models (float32 weights)
+BYTES_PER_PARAMETER = 4
+
+# Process-wide pool
+_model_pool = None
+_model_pool_lock = threading.Lock()
+
+ModelKey = typing.Tuple[str, str]
+
+
+def load_artifact(model_path: str, model_format: str = None) -> object:
+    """
+    Loads a model artifact from disk
+
+    Args:
+        model_path: Path to the model artifact
+        model_format: Format of the model, detected from the path if not given
+
+    Returns:
+        Loaded model object
+    """
+    # Imported here because model_utils pulls in the ML frameworks
+    from src.backend.utils.ml import model_utils  # Internal import
+    return model_utils.load_model(model_path, model_format)
+
+
+def _artifact_size(model_path: str) -> int:
+    """
+    Returns the on-disk size of a model file or directory
+
+    Args:
+        model_path: Path to the model artifact
+
+    Returns:
+        Size in bytes, 0 if the path does not exist
+    """
+    if not model_path or not os.path.exists(model_path):
+        return 0
+    if os.path.isfile(model_path):
+        return os.path.getsize(model_path)
+    total = 0
+    for root, _, files in os.walk(model_path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def estimate_model_size(model: object, model_path: str = None) -> int:
+    """
+    Estimates the memory footprint of a loaded model
+
+    Framework models are sized by their parameter count; otherwise the numpy arrays held by
+    the model, then the size of its artifact on disk, are used.
+
+    Args:
+        model: Loaded model object
+        model_path: Path the model was loaded from
+
+    Returns:
+        Estimated size in bytes
+    """
+    count_params = getattr(model, "count_params", None)
+    if callable(count_params):
+        try:
+            return int(count_params()) * BYTES_PER_PARAMETER
+        except Exception:
+            pass
+
+    array_bytes = getattr(model, "nbytes", None)
+    if isinstance(array_bytes, int):
+        return array_bytes
+    attributes = getattr(model, "__dict__", {})
+    array_bytes = sum(value.nbytes for value in attributes.values() if isinstance(getattr(value, "nbytes", None), int))
+    if array_bytes:
+        return array_bytes
+
+    return _artifact_size(model_path) or sys.getsizeof(model)
+
+
+class _PoolEntry:
+    """
+    Loaded model with its estimated size
+    """
+    __slots__ = ("model", "size_bytes", "model_path")
+
+    def __init__(self, model: object, size_bytes: int, model_path: str):
+        self.model = model
+        self.size_bytes = size_bytes
+        self.model_path = model_path
+
+
+class ModelPool:
+    """
+    Memory-budgeted LRU pool of loaded models shared across the process
+    """
+
+    def __init__(self, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+                 loader: typing.Callable[[str, str], object] = None,
+                 size_estimator: typing.Callable[[object, str], int] = None):
+        """
+        Initialize an empty pool
+
+        Args:
+            max_memory_bytes: Memory budget for loaded models
+            loader: Function loading a model from (path, format); defaults to model_utils.load_model
+            size_estimator: Function estimating the footprint of a loaded model from (model, path)
+        """
+        self._max_memory_bytes = max_memory_bytes
+        self._loader = loader or load_artifact
+        self._size_estimator = size_estimator or estimate_model_size
+        self._entries: "collections.OrderedDict[ModelKey, _PoolEntry]" = collections.OrderedDict()
+        self._loading: typing.Dict[ModelKey, concurrent.futures.Future] = {}
+        self._active: typing.Dict[str, typing.Tuple[str, str, str]] = {}
+        self._generations: typing.Dict[str, int] = {}
+        self._model_ids: typing.Dict[str, str] = {}
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+        self._executor = None
+        self._stats = {"hits": 0, "misses": 0, "loads": 0, "load_failures": 0, "evictions": 0,
+                       "swaps": 0, "stale_activations": 0, "load_time_seconds": 0.0, "max_load_time_seconds": 0.0}
+
+    def register_name(self, model_name: str, model_id: str) -> None:
+        """
+        Register the registry model ID a model name refers to
+
+        Args:
+            model_name: Name components use for the model
+            model_id: Registry ID the model is loaded and activated under
+        """
+        if model_name and model_name != model_id:
+            with self._lock:
+                self._model_ids[model_name] = model_id
+
+    def resolve(self, model_name: str) -> str:
+        """
+        Get the registry model ID for a model name or ID
+
+        Args:
+            model_name: Name or ID of the model
+
+        Returns:
+            Registry model ID, or the argument if no name was registered for it
+        """
+        with self._lock:
+            return self._model_ids.get(model_name, model_name)
+
+    def get(self, model_name: str, version: str, model_path: str, model_format: str = None) -> object:
+        """
+        Get a loaded model, loading it on a miss
+
+        Args:
+            model_name: Name or ID of the model
+            version: Version of the model
+            model_path: Path to the model artifact, used on a miss
+            model_format: Format of the model artifact
+
+        Returns:
+            Loaded model object
+        """
+        key = (self.resolve(model_name), version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry.model
+            self._stats["misses"] += 1
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._loading[key] = future
+
+        if owner:
+            self._load(key, model_path, model_format, future)
+        return future.result()
+
+    def get_active(self, model_name: str) -> typing.Optional[object]:
+        """
+        Get the active version of a model
+
+        Args:
+            model_name: Name or ID of the model
+
+        Returns:
+            Loaded model object, or None if no version is active
+        """
+        model_name = self.resolve(model_name)
+        with self._lock:
+            active = self._active.get(model_name)
+        if active is None:
+            return None
+        version, model_path, model_format = active
+        return self.get(model_name, version, model_path, model_format)
+
+    def get_active_version(self, model_name: str) -> typing.Optional[str]:
+        """
+        Get the active version of a model
+
+        Args:
+            model_name: Name or ID of the model
+
+        Returns:
+            Active version, or None if no version is active
+        """
+        model_name = self.resolve(model_name)
+        with self._lock:
+            active = self._active.get(model_name)
+        return active[0] if active else None
+
+    def activate(self, model_name: str, version: str, model_path: str, model_format: str = None) -> object:
+        """
+        Load a version and make it the active version of a model
+
+        Args:
+            model_name: Name or ID of the model
+            version: Version to activate
+            model_path: Path to the model artifact
+            model_format: Format of the model artifact
+
+        Returns:
+            Loaded model object; it is not made active if a later swap() or activate()
+            of the model was requested while it loaded
+        """
+        model_name = self.resolve(model_name)
+        return self._activate(model_name, self._next_generation(model_name), version, model_path, model_format)
+
+    def swap(self, model_name: str, version: str, model_path: str, model_format: str = None) -> concurrent.futures.Future:
+        """
+        Load a version in the background and then make it active
+
+        The previous version stays active until the new version has loaded, and stays
+        active if loading fails.
+
+        Args:
+            model_name: Name or ID of the model
+            version: Version to activate
+            model_path: Path to the model artifact
+            model_format: Format of the model artifact
+
+        Returns:
+            Future resolving to the loaded model once it is active, or once it is loaded if a
+            later swap() or activate() superseded it
+        """
+        model_name = self.resolve(model_name)
+        generation = self._next_generation(model_name)
+        return self._get_executor().submit(self._activate, model_name, generation, version, model_path, model_format)
+
+    def preload(self, models: typing.Iterable[typing.Tuple[str, str, str, typing.Optional[str]]]) -> int:
+        """
+        Load and activate models, e.g. the active versions at startup
+
+        Args:
+            models: (model_name, version, model_path, model_format) tuples
+
+        Returns:
+            Number of models loaded successfully
+        """
+        futures = [self.swap(*model) for model in models]
+        loaded = 0
+        for future in futures:
+            try:
+                future.result()
+                loaded += 1
+            except Exception as e:
+                logger.error(f"Failed to preload model: {e}")
+        logger.info(f"Preloaded {loaded} of {len(futures)} models")
+        return loaded
+
+    def evict(self, model_name: str, version: str) -> bool:
+        """
+        Remove a model from the pool
+
+        Args:
+            model_name: Name or ID of the model
+            version: Version of the model
+
+        Returns:
+            True if the model was loaded
+        """
+        model_name = self.resolve(model_name)
+        with self._lock:
+            entry = self._entries.pop((model_name, version), None)
+            if entry is None:
+                return False
+            self._memory_bytes -= entry.size_bytes
+        logger.info(f"Evicted model {model_name} version {version}")
+        return True
+
+    def is_loaded(self, model_name: str, version: str) -> bool:
+        """
+        Check whether a model is in the pool
+
+        Args:
+            model_name: Name or ID of the model
+            version: Version of the model
+
+        Returns:
+            True if the model is loaded
+        """
+        model_name = self.resolve(model_name)
+        with self._lock:
+            return (model_name, version) in self._entries
+
+    def get_loaded_models(self) -> list:
+        """
+        Get the loaded models from least to most recently used
+
+        Returns:
+            List of dictionaries with model name, version, estimated size and active flag
+        """
+        with self._lock:
+            return [
+                {
+                    "model_id": model_name,
+                    "version_id": version,
+                    "memory_usage": entry.size_bytes,
+                    "active": self._active.get(model_name, (None,))[0] == version
+                }
+                for (model_name, version), entry in self._entries.items()
+            ]
+
+    def get_stats(self) -> dict:
+        """
+        Get pool metrics
+
+        Returns:
+            Dictionary with hit, miss, load, eviction and swap counters, load times, hit rate
+            and memory usage
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            requests = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / requests if requests else 0.0
+            stats["avg_load_time_seconds"] = stats["load_time_seconds"] / stats["loads"] if stats["loads"] else 0.0
+            stats["loaded_models"] = len(self._entries)
+            stats["memory_bytes"] = self._memory_bytes
+            stats["max_memory_bytes"] = self._max_memory_bytes
+            return stats
+
+    def clear(self):
+        """
+        Unload every model and forget the active versions
+        """
+        with self._lock:
+            self._entries.clear()
+            self._active.clear()
+            self._memory_bytes = 0
+
+    def close(self):
+        """
+        Stop the background loading thread
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _next_generation(self, model_name: str) -> int:
+        """
+        Start a new activation of a model, superseding the ones in flight
+
+        Args:
+            model_name: Registry ID of the model
+
+        Returns:
+            Generation of the new activation
+        """
+        with self._lock:
+            generation = self._generations[model_name] = self._generations.get(model_name, 0) + 1
+            return generation
+
+    def _activate(self, model_name: str, generation: int, version: str, model_path: str,
+                  model_format: typing.Optional[str]) -> object:
+        """
+        Load a version and make it active unless a later activation was requested meanwhile
+
+        Args:
+            model_name: Registry ID of the model
+            generation: Generation taken when the activation was requested
+            version: Version to activate
+            model_path: Path to the model artifact
+            model_format: Format of the model artifact
+
+        Returns:
+            Loaded model object
+        """
+        model = self.get(model_name, version, model_path, model_format)
+        with self._lock:
+            if self._generations.get(model_name) != generation:
+                self._stats["stale_activations"] += 1
+                logger.info(f"Not activating {model_name} version {version}: a later activation superseded it")
+                return model
+            previous = self._active.get(model_name)
+            self._active[model_name] = (version, model_path, model_format)
+            if previous is not None and previous[0] != version:
+                self._stats["swaps"] += 1
+        if previous is not None and previous[0] != version:
+            logger.info(f"Swapped active version of {model_name} from {previous[0]} to {version}")
+        return model
+
+    def _load(self, key: ModelKey, model_path: str, model_format: typing.Optional[str],
+              future: concurrent.futures.Future):
+        """
+        Load a model, add it to the pool and resolve the callers waiting for it
+
+        Args:
+            key: (model_name, version) of the model
+            model_path: Path to the model artifact
+            model_format: Format of the model artifact
+            future: Future shared by the callers waiting for this load
+        """
+        started = perf_counter()
+        try:
+            model = self._loader(model_path, model_format)
+            size_bytes = int(self._size_estimator(model, model_path))
+        except Exception as e:
+            with self._lock:
+                self._stats["load_failures"] += 1
+                self._loading.pop(key, None)
+            logger.error(f"Failed to load model {key[0]} version {key[1]} from {model_path}: {e}")
+            future.set_exception(e)
+            return
+        elapsed = perf_counter() - started
+
+        with self._lock:
+            self._entries[key] = _PoolEntry(model, size_bytes, model_path)
+            self._memory_bytes += size_bytes
+            self._stats["loads"] += 1
+            self._stats["load_time_seconds"] += elapsed
+            self._stats["max_load_time_seconds"] = max(self._stats["max_load_time_seconds"], elapsed)
+            evicted = self._evict_over_budget(keep=key)
+            self._loading.pop(key, None)
+
+        logger.info(f"Loaded model {key[0]} version {key[1]} ({size_bytes} bytes) in {elapsed:.2f}s")
+        for model_name, version in evicted:
+            logger.info(f"Evicted model {model_name} version {version} to stay within the memory budget")
+        future.set_result(model)
+
+    def _evict_over_budget(self, keep: ModelKey) -> typing.List[ModelKey]:
+        """
+        Evict least recently used models until the pool fits its budget; caller holds the lock
+
+        Args:
+            keep: Key of the model just loaded, which is never evicted
+
+        Returns:
+            Keys of the evicted models
+        """
+        evicted = []
+        for key in list(self._entries):
+            if self._memory_bytes <= self._max_memory_bytes:
+                break
+            if key == keep:
+                continue
+            self._memory_bytes -= self._entries.pop(key).size_bytes
+            self._stats["evictions"] += 1
+            evicted.append(key)
+        return evicted
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Get the executor running background loads, creating it on first use
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-pool")
+            return self._executor
+
+
+def get_model_pool(config: dict = None) -> ModelPool:
+    """
+    Get the process-wide model pool, creating it on first use
+
+    Args:
+        config: Configuration dictionary read when the pool is created
+
+    Returns:
+        Shared ModelPool instance
+    """
+    global _model_pool
+    with _model_pool_lock:
+        if _model_pool is None:
+            max_memory_bytes = (config or {}).get(MODEL_POOL_MAX_MEMORY_CONFIG_KEY, DEFAULT_MAX_MEMORY_BYTES)
+            _model_pool = ModelPool(max_memory_bytes=int(max_memory_bytes))
+        return _model_pool
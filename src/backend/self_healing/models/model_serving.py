@@ -5,16 +5,18 @@ Implements model serving capabilities for the self-healing AI engine. This modul
 import typing  # standard library
 import os  # standard library
 import json  # standard library
+import threading  # standard library
 from time import time  # standard library
 
 import numpy as np  # version: 1.24.x
 import tensorflow as tf  # version: 2.12.x
 
 from src.backend.utils.logging.logger import get_logger  # Internal import
-from src.backend.utils.ml import model_utils  # Internal import
 from src.backend.utils.ml.vertex_client import VertexAIClient, predict_with_vertex, format_vertex_request, parse_vertex_response  # Internal import
 from src.backend.self_healing.models import model_registry  # Internal import
 from src.backend.self_healing.models.model_registry import ModelRegistry  # Internal import
+from src.backend.self_healing.models.inference_batcher import DynamicBatcher, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LATENCY_MS  # Internal import
+from src.backend.self_healing.models.model_pool import get_model_pool  # Internal import
 from src.backend.config import get_config  # Internal import
 
 # Initialize logger
@@ -23,6 +25,11 @@ logger = get_logger(__name__)
 # Default prediction timeout
 DEFAULT_PREDICTION_TIMEOUT = 30
 
+# Dynamic batching configuration keys
+BATCHING_ENABLED_CONFIG_KEY = "model_serving.batching.enabled"
+BATCHING_MAX_BATCH_SIZE_CONFIG_KEY = "model_serving.batching.max_batch_size"
+BATCHING_MAX_LATENCY_MS_CONFIG_KEY = "model_serving.batching.max_latency_ms"
+
 # Model type mapping
 MODEL_TYPE_MAPPING = {"issue_classifier": "classification", "root_cause_analyzer": "classification", "pattern_recognizer": "classification", "data_corrector": "regression", "anomaly_detector": "anomaly"}
 
@@ -131,10 +138,18 @@ class ModelServer:
         """
         self._config = config
         self._model_registry = ModelRegistry(config)
+        # Loaded models live in the process-wide pool; this maps (model_id, version_id) to artifact paths
+        self._model_pool = get_model_pool(config)
         self._loaded_models = {}
         self._use_vertex_ai = config.get("model_serving.use_vertex_ai", False)
         self._vertex_client = VertexAIClient(config) if self._use_vertex_ai else None
         self._prediction_history = {}
+        # Concurrent local predictions are gathered into batched forward passes per loaded model
+        self._batching_enabled = config.get(BATCHING_ENABLED_CONFIG_KEY, True)
+        self._max_batch_size = int(config.get(BATCHING_MAX_BATCH_SIZE_CONFIG_KEY, DEFAULT_MAX_BATCH_SIZE))
+        self._max_latency_ms = float(config.get(BATCHING_MAX_LATENCY_MS_CONFIG_KEY, DEFAULT_MAX_LATENCY_MS))
+        self._batchers = {}
+        self._batchers_lock = threading.Lock()
 
     def predict(self, model_id: str, input_data: dict, version_id: str = "latest") -> ModelPrediction:
         """
@@ -165,23 +180,7 @@ class ModelServer:
 
         latency = end_time - start_time
 
-        prediction = format_prediction_output(raw_prediction, model_type)
-        confidence = self.calculate_confidence(prediction, model_type)
-
-        model_prediction = ModelPrediction(
-            model_id=model_id,
-            model_version=version_id,
-            model_type=model_type,
-            input_data=input_data,
-            prediction=prediction,
-            confidence=confidence,
-            latency=latency,
-            metadata={}
-        )
-
-        self._update_prediction_history(model_prediction)
-
-        return model_prediction
+        return self._build_prediction(model_id, version_id, model_type, input_data, raw_prediction, latency)
 
     def predict_with_local_model(self, model_id: str, formatted_input: dict, version_id: str) -> object:
         """
@@ -196,11 +195,10 @@ class ModelServer:
             Raw model output
         """
         model = self._ensure_model_loaded(model_id, version_id)
-        # Prepare input in the format expected by the model
-        input_tensor = tf.convert_to_tensor([formatted_input])
-        # Execute prediction with model
-        raw_prediction = model(input_tensor).numpy()
-        return raw_prediction
+        if self._batching_enabled:
+            # Joins a batched forward pass with concurrent requests for the same model
+            return self._get_batcher(model_id, version_id).predict(formatted_input, DEFAULT_PREDICTION_TIMEOUT)
+        return run_model_batch(model, [formatted_input])[0]
 
     def predict_with_vertex_ai(self, model_id: str, formatted_input: dict, version_id: str) -> object:
         """
@@ -247,12 +245,31 @@ class ModelServer:
         if not isinstance(input_data_list, list):
             raise ValueError("input_data_list must be a list")
 
-        predictions = []
-        for input_data in input_data_list:
-            prediction = self.predict(model_id, input_data, version_id)
-            predictions.append(prediction)
+        if self._use_vertex_ai:
+            return [self.predict(model_id, input_data, version_id) for input_data in input_data_list]
+
+        model_info = self._model_registry.get_model(model_id)
+        if not model_info:
+            raise ValueError(f"Model with ID {model_id} not found")
+
+        model_type = model_info["type"]
+        formatted_inputs = [format_prediction_input(input_data, model_type) for input_data in input_data_list]
 
-        return predictions
+        # All inputs are queued at once so they share forward passes of up to max_batch_size rows
+        model = self._ensure_model_loaded(model_id, version_id)
+        start_time = time()
+        if self._batching_enabled:
+            raw_predictions = self._get_batcher(model_id, version_id).predict_many(
+                formatted_inputs, DEFAULT_PREDICTION_TIMEOUT
+            )
+        else:
+            raw_predictions = run_model_batch(model, formatted_inputs)
+        latency = time() - start_time
+
+        return [
+            self._build_prediction(model_id, version_id, model_type, input_data, raw_prediction, latency)
+            for input_data, raw_prediction in zip(input_data_list, raw_predictions)
+        ]
 
     def load_model(self, model_id: str, version_id: str) -> bool:
         """
@@ -279,8 +296,8 @@ class ModelServer:
 
         model_path = version_info["artifact_path"]
 
-        model = model_utils.load_model(model_path)
-        self._loaded_models[(model_id, version_id)] = model
+        self._model_pool.get(model_id, version_id, model_path)
+        self._loaded_models[(model_id, version_id)] = model_path
 
         logger.info(f"Model {model_id} version {version_id} loaded successfully")
         return True
@@ -298,6 +315,11 @@ class ModelServer:
         """
         if (model_id, version_id) in self._loaded_models:
             del self._loaded_models[(model_id, version_id)]
+            self._model_pool.evict(model_id, version_id)
+            with self._batchers_lock:
+                batcher = self._batchers.pop((model_id, version_id), None)
+            if batcher:
+                batcher.close()
             logger.info(f"Model {model_id} version {version_id} unloaded successfully")
             return True
         else:
@@ -311,15 +333,10 @@ class ModelServer:
         Returns:
             List of loaded model information
         """
-        loaded_models_info = []
-        for (model_id, version_id), model in self._loaded_models.items():
-            model_info = {
-                "model_id": model_id,
-                "version_id": version_id,
-                "memory_usage": sys.getsizeof(model)  # Approximate memory usage
-            }
-            loaded_models_info.append(model_info)
-        return loaded_models_info
+        return [
+            model_info for model_info in self._model_pool.get_loaded_models()
+            if (model_info["model_id"], model_info["version_id"]) in self._loaded_models
+        ]
 
     def get_prediction_history(self, filters: dict = None) -> list:
         """
@@ -344,6 +361,17 @@ class ModelServer:
         else:
             return list(self._prediction_history.values())
 
+    def get_batching_stats(self) -> dict:
+        """
+        Get dynamic batching statistics for the loaded models
+
+        Returns:
+            Dictionary mapping "model_id:version_id" to batch size and latency histograms
+        """
+        with self._batchers_lock:
+            batchers = dict(self._batchers)
+        return {f"{model_id}:{version_id}": batcher.get_stats() for (model_id, version_id), batcher in batchers.items()}
+
     def calculate_confidence(self, model_output: object, model_type: str) -> float:
         """
         Calculate confidence score for a prediction
@@ -396,7 +424,65 @@ class ModelServer:
         """
         if (model_id, version_id) not in self._loaded_models:
             self.load_model(model_id, version_id)
-        return self._loaded_models[(model_id, version_id)]
+        # Reloads from the artifact if the pool evicted the model
+        return self._model_pool.get(model_id, version_id, self._loaded_models[(model_id, version_id)])
+
+    def _get_batcher(self, model_id: str, version_id: str) -> DynamicBatcher:
+        """
+        Get the request queue batching predictions for a loaded model, creating it on first use
+
+        Args:
+            model_id: ID of the model
+            version_id: ID of the version
+
+        Returns:
+            DynamicBatcher running forward passes of the model
+        """
+        with self._batchers_lock:
+            batcher = self._batchers.get((model_id, version_id))
+            if batcher is None:
+                batcher = DynamicBatcher(
+                    lambda inputs: run_model_batch(self._ensure_model_loaded(model_id, version_id), inputs),
+                    max_batch_size=self._max_batch_size,
+                    max_latency_ms=self._max_latency_ms,
+                    name=f"{model_id}-{version_id}"
+                )
+                self._batchers[(model_id, version_id)] = batcher
+            return batcher
+
+    def _build_prediction(self, model_id: str, version_id: str, model_type: str, input_data: dict,
+                          raw_prediction: object, latency: float) -> ModelPrediction:
+        """
+        Format a raw model output into a prediction and record it in the history
+
+        Args:
+            model_id: ID of the model
+            version_id: ID of the version
+            model_type: Type of the model
+            input_data: Input data for prediction
+            raw_prediction: Raw model output for the input
+            latency: Prediction latency in seconds
+
+        Returns:
+            Prediction result
+        """
+        prediction = format_prediction_output(raw_prediction, model_type)
+        confidence = self.calculate_confidence(prediction, model_type)
+
+        model_prediction = ModelPrediction(
+            model_id=model_id,
+            model_version=version_id,
+            model_type=model_type,
+            input_data=input_data,
+            prediction=prediction,
+            confidence=confidence,
+            latency=latency,
+            metadata={}
+        )
+
+        self._update_prediction_history(model_prediction)
+
+        return model_prediction
 
 
 class ModelServingCache:
@@ -528,6 +614,24 @@ class ModelServingCache:
         return time() - cache_entry["timestamp"] > self._cache_ttl
 
 
+def run_model_batch(model: object, formatted_inputs: list) -> list:
+    """
+    Runs one vectorized forward pass over a batch of formatted inputs
+
+    Args:
+        model: Loaded model object
+        formatted_inputs: Formatted input data, one entry per prediction
+
+    Returns:
+        List with the raw output of each input, shaped like a single-row prediction
+    """
+    # Prepare input in the format expected by the model
+    input_tensor = tf.convert_to_tensor(formatted_inputs)
+    # Execute prediction with model
+    outputs = model(input_tensor).numpy()
+    return [outputs[index:index + 1] for index in range(len(formatted_inputs))]
+
+
 def format_prediction_input(input_data: dict, model_type: str) -> dict:
     """
     Formats input data for model prediction based on model type
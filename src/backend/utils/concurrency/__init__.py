@@ -61,6 +61,12 @@ from .throttler import (
     reset_all_throttlers
 )
 
+# Import request coalescing functionality
+from .request_coalescer import (
+    SingleFlight,
+    StaleWhileRevalidateCache
+)
+
 # Export all the imported classes and functions
 __all__ = [
     # Rate limiting
@@ -103,5 +109,9 @@ __all__ = [
     'get_throttler',
     'throttle',
     'reset_throttler',
-    'reset_all_throttlers'
+    'reset_all_throttlers',
+    
+    # Request coalescing
+    'SingleFlight',
+    'StaleWhileRevalidateCache'
 ]
\ No newline at end of file
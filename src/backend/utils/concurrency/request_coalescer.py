@@ -0,0 +1,279 @@
+"""
+Request coalescing for expensive read paths in the self-healing data pipeline.
+
+Dashboards and status endpoints are polled by many viewers at once, and each poll used to
+issue its own identical set of BigQuery queries. This module provides two building blocks
+that make backend load independent of the number of concurrent viewers:
+
+- SingleFlight runs at most one call per key at a time. Callers that arrive while a
+  call for the same key is in flight wait for and share its result instead of issuing
+  their own.
+- StaleWhileRevalidateCache keeps the last result per key. Results younger than the
+  max age are served as is. Older results, within the stale window, are still served
+  immediately while a single background refresh runs. Only missing or expired entries
+  make the caller wait.
+
+Both are thread-safe and built on concurrent.futures, so blocking callers and asyncio
+callers (through the *_async methods) share the same in-flight calls.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import typing
+
+from ...utils.logging.logger import get_logger
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_AGE_SECONDS = 15.0
+DEFAULT_STALE_WHILE_REVALIDATE_SECONDS = 60.0
+
+T = typing.TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution"""
+
+    def __init__(self, name: str = "singleflight", max_workers: int = DEFAULT_MAX_WORKERS,
+                 executor: concurrent.futures.Executor = None):
+        """Initializes the coalescer
+
+        Args:
+            name: Name used for worker threads and log messages
+            max_workers: Number of worker threads when no executor is given
+            executor: Executor that runs the calls (one is created when omitted)
+        """
+        self.name = name
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._owns_executor = executor is None
+        self._inflight: typing.Dict[typing.Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._coalesced = 0
+
+    def submit(self, key: typing.Hashable, fn: typing.Callable[..., T], *args, **kwargs) -> "concurrent.futures.Future[T]":
+        """Starts a call for the key, or joins the call already in flight
+
+        Args:
+            key: Identity of the call; calls with equal keys are coalesced
+            fn: Function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future shared by every caller of this flight
+        """
+        return self._start(key, fn, args, kwargs)[0]
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[..., T], *args, **kwargs) -> T:
+        """Runs or joins a call and waits for its result
+
+        Args:
+            key: Identity of the call
+            fn: Function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of the shared call
+        """
+        return self.submit(key, fn, *args, **kwargs).result()
+
+    async def do_async(self, key: typing.Hashable, fn: typing.Callable[..., T], *args, **kwargs) -> T:
+        """Runs or joins a call without blocking the event loop
+
+        Args:
+            key: Identity of the call
+            fn: Blocking function to run on the worker threads
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of the shared call
+        """
+        return await asyncio.wrap_future(self.submit(key, fn, *args, **kwargs))
+
+    def in_flight(self, key: typing.Hashable) -> bool:
+        """Checks whether a call for the key is running"""
+        with self._lock:
+            return key in self._inflight
+
+    def get_stats(self) -> dict:
+        """Returns call and coalescing counters
+
+        Returns:
+            Dictionary with executed calls, coalesced callers and calls in flight
+        """
+        with self._lock:
+            return {"calls": self._calls, "coalesced": self._coalesced, "in_flight": len(self._inflight)}
+
+    def close(self) -> None:
+        """Shuts down the worker threads if this coalescer created them"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def _start(self, key: typing.Hashable, fn: typing.Callable[..., T], args: tuple = (), kwargs: dict = None,
+               on_done: typing.Callable[[concurrent.futures.Future], None] = None
+               ) -> typing.Tuple[concurrent.futures.Future, bool]:
+        """Starts or joins a flight, reporting whether this caller started it
+
+        on_done only applies when a new flight starts. It runs before the flight is
+        forgotten, so callers arriving afterwards observe its effects.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._coalesced += 1
+                return future, False
+            future = self._executor.submit(fn, *args, **(kwargs or {}))
+            self._inflight[key] = future
+            self._calls += 1
+
+        if on_done is not None:
+            future.add_done_callback(on_done)
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future, True
+
+    def _forget(self, key: typing.Hashable, future: concurrent.futures.Future) -> None:
+        """Removes a finished flight so the next caller starts a fresh call"""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+class StaleWhileRevalidateCache:
+    """Result cache that serves slightly stale values while refreshing them in the background"""
+
+    def __init__(self, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+                 stale_while_revalidate_seconds: float = DEFAULT_STALE_WHILE_REVALIDATE_SECONDS,
+                 singleflight: SingleFlight = None, clock: typing.Callable[[], float] = time.monotonic):
+        """Initializes the cache
+
+        Args:
+            max_age_seconds: Age up to which a cached value is served without refreshing
+            stale_while_revalidate_seconds: Additional age during which the cached value is
+                still served while a background refresh runs
+            singleflight: Coalescer running the loads (one is created when omitted)
+            clock: Monotonic time source
+        """
+        self.max_age_seconds = max_age_seconds
+        self.stale_while_revalidate_seconds = stale_while_revalidate_seconds
+        self._singleflight = singleflight or SingleFlight(name="swr-cache")
+        self._clock = clock
+        self._entries: typing.Dict[typing.Hashable, typing.Tuple[typing.Any, float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refresh_errors": 0}
+
+    def get_future(self, key: typing.Hashable, loader: typing.Callable[[], T],
+                   max_age_seconds: float = None) -> "concurrent.futures.Future[T]":
+        """Returns a future for the value of a key, loading or refreshing it as needed
+
+        Args:
+            key: Cache key
+            loader: Blocking function producing the value
+            max_age_seconds: Overrides the cache's max age for this lookup
+
+        Returns:
+            Completed future for fresh or stale values, otherwise the in-flight load
+        """
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            value, loaded_at = entry
+            age = self._clock() - loaded_at
+            if age <= max_age:
+                self._count("hits")
+                return self._completed(value)
+            if age <= max_age + self.stale_while_revalidate_seconds:
+                self._count("stale_hits")
+                self._load(key, loader)
+                return self._completed(value)
+
+        self._count("misses")
+        return self._load(key, loader)
+
+    def get(self, key: typing.Hashable, loader: typing.Callable[[], T], max_age_seconds: float = None) -> T:
+        """Gets the value of a key, waiting only when no usable value is cached
+
+        Args:
+            key: Cache key
+            loader: Blocking function producing the value
+            max_age_seconds: Overrides the cache's max age for this lookup
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        return self.get_future(key, loader, max_age_seconds).result()
+
+    async def get_async(self, key: typing.Hashable, loader: typing.Callable[[], T], max_age_seconds: float = None) -> T:
+        """Gets the value of a key without blocking the event loop
+
+        Args:
+            key: Cache key
+            loader: Blocking function producing the value, run on the worker threads
+            max_age_seconds: Overrides the cache's max age for this lookup
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        return await asyncio.wrap_future(self.get_future(key, loader, max_age_seconds))
+
+    def invalidate(self, key: typing.Hashable = None) -> None:
+        """Drops one cached value, or all of them
+
+        Args:
+            key: Key to drop; all keys when omitted
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Returns hit, stale hit, miss and refresh error counters
+
+        Returns:
+            Dictionary of counters, including the coalescer's counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(self._singleflight.get_stats())
+        return stats
+
+    def _load(self, key: typing.Hashable, loader: typing.Callable[[], T]) -> concurrent.futures.Future:
+        """Starts or joins the load for a key and stores its result when it succeeds"""
+        return self._singleflight._start(key, loader, on_done=lambda done: self._store(key, done))[0]
+
+    def _store(self, key: typing.Hashable, future: concurrent.futures.Future) -> None:
+        """Caches a finished load, keeping the previous value if it failed"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._count("refresh_errors")
+            logger.warning(f"Refreshing cached value for {key} failed: {error}")
+            return
+        with self._lock:
+            self._entries[key] = (future.result(), self._clock())
+
+    def _count(self, counter: str) -> None:
+        """Increments a statistics counter"""
+        with self._lock:
+            self._stats[counter] += 1
+
+    @staticmethod
+    def _completed(value: typing.Any) -> concurrent.futures.Future:
+        """Wraps a value in an already completed future"""
+        future = concurrent.futures.Future()
+        future.set_result(value)
+        return future
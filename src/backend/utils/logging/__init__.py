@@ -21,6 +21,7 @@ from .logger import (
     set_context,
     get_context,
     clear_context,
+    get_thread_context,
     log_with_context,
     configure_root_logger,
     reset_logging,
@@ -57,6 +58,7 @@ __all__ = [
     'set_context',
     'get_context',
     'clear_context',
+    'get_thread_context',
     'log_with_context',
     'configure_root_logger',
     'reset_logging',
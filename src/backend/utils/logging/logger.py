@@ -19,7 +19,9 @@ import typing
 import uuid
 import threading
 import functools
+import itertools
 import contextlib
+import weakref
 
 from ...constants import (
     ENV_DEVELOPMENT,
@@ -49,6 +51,13 @@ DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Thread-local storage for contextual logging
 _thread_local = threading.local()
 
+# Per-thread context and correlation ID published for readers on other threads (e.g. profilers),
+# as thread ID -> (context, correlation ID, owner token)
+_thread_states = {}
+
+# Source of owner tokens tying a published state to the thread that published it
+_thread_state_tokens = itertools.count()
+
 # Logger cache for reusing configured loggers
 _loggers = {}
 
@@ -120,6 +129,7 @@ def set_correlation_id(correlation_id: str = None) -> str:
         correlation_id = str(uuid.uuid4())
     
     setattr(_thread_local, 'correlation_id', correlation_id)
+    _publish_thread_state()
     return correlation_id
 
 
@@ -139,6 +149,7 @@ def clear_correlation_id() -> None:
     """
     if hasattr(_thread_local, 'correlation_id'):
         delattr(_thread_local, 'correlation_id')
+    _publish_thread_state()
 
 
 def set_context(context: dict) -> dict:
@@ -157,6 +168,7 @@ def set_context(context: dict) -> dict:
     
     # Update thread-local context with provided context dictionary
     _thread_local.context.update(context)
+    _publish_thread_state()
     
     return _thread_local.context
 
@@ -177,6 +189,94 @@ def clear_context() -> None:
     """
     if hasattr(_thread_local, 'context'):
         delattr(_thread_local, 'context')
+    _publish_thread_state()
+
+
+def get_thread_context(thread_id: int) -> dict:
+    """
+    Gets the logging context of another thread, including its correlation ID.
+    
+    Args:
+        thread_id: Identifier of the thread as returned by threading.get_ident()
+        
+    Returns:
+        Copy of the thread's context dictionary or empty dict if not set
+    """
+    state = _thread_states.get(thread_id)
+    if state is None:
+        return {}
+    
+    context, correlation_id, _ = state
+    result = dict(context) if context else {}
+    if correlation_id and 'correlation_id' not in result:
+        result['correlation_id'] = correlation_id
+    return result
+
+
+def _restore_context(context: dict) -> None:
+    """
+    Replaces the current thread's context with a previously saved one.
+    
+    Args:
+        context: Context dictionary to restore
+    """
+    setattr(_thread_local, 'context', context)
+    _publish_thread_state()
+
+
+def _publish_thread_state() -> None:
+    """
+    Publishes the current thread's context and correlation ID for cross-thread readers.
+    """
+    thread_id = threading.get_ident()
+    context = getattr(_thread_local, 'context', None)
+    correlation_id = getattr(_thread_local, 'correlation_id', None)
+    
+    # Single dict operations are atomic, so readers never need a lock
+    if context or correlation_id:
+        _thread_states[thread_id] = (context, correlation_id, _get_thread_state_owner().token)
+    else:
+        _thread_states.pop(thread_id, None)
+
+
+class _ThreadStateOwner:
+    """
+    Thread-local marker whose release at thread exit unpublishes the thread's state, so
+    states of finished threads do not accumulate or leak into a thread reusing the ident.
+    """
+    
+    __slots__ = ('token', '__weakref__')
+    
+    def __init__(self, token: int):
+        self.token = token
+
+
+def _get_thread_state_owner() -> _ThreadStateOwner:
+    """
+    Gets the current thread's state owner, registering its cleanup on first use.
+    
+    Returns:
+        Owner marker stored in thread-local storage
+    """
+    owner = getattr(_thread_local, 'state_owner', None)
+    if owner is None:
+        owner = _ThreadStateOwner(next(_thread_state_tokens))
+        _thread_local.state_owner = owner
+        weakref.finalize(owner, _discard_thread_state, threading.get_ident(), owner.token)
+    return owner
+
+
+def _discard_thread_state(thread_id: int, token: int) -> None:
+    """
+    Removes the published state of a finished thread unless a newer thread owns the entry.
+    
+    Args:
+        thread_id: Identifier of the finished thread
+        token: Owner token of the finished thread
+    """
+    state = _thread_states.get(thread_id)
+    if state is not None and state[2] == token:
+        _thread_states.pop(thread_id, None)
 
 
 def log_with_context(context: dict):
@@ -204,7 +304,7 @@ def log_with_context(context: dict):
             finally:
                 # Restore original context after function execution
                 if original_context:
-                    setattr(_thread_local, 'context', original_context)
+                    _restore_context(original_context)
                 else:
                     clear_context()
         
@@ -249,7 +349,7 @@ class LoggingContext:
             exc_tb: Exception traceback if an exception was raised
         """
         if self._previous_context:
-            setattr(_thread_local, 'context', self._previous_context)
+            _restore_context(self._previous_context)
         else:
             clear_context()
         
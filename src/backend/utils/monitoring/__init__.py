@@ -14,15 +14,30 @@ from .metric_client import (  # Google Cloud Monitoring API client and related u
     VALUE_TYPE_INT64,
     VALUE_TYPE_DOUBLE,
     VALUE_TYPE_BOOL,
-    VALUE_TYPE_STRING
+    VALUE_TYPE_STRING,
+    VALUE_TYPE_DISTRIBUTION
+)
+
+# Import buffered metric aggregation functionality
+from .metric_buffer import (  # In-process aggregation with background batch flushing
+    MetricBuffer,
+    InMemoryMetricBackend,
+    AGGREGATION_GAUGE,
+    AGGREGATION_COUNTER,
+    AGGREGATION_DISTRIBUTION
 )
 
 # Import performance profiling functionality
 from .profiler import (  # Performance profiling tools for measuring code execution
     Profiler,
     ProfilerContext,
+    SamplingProfiler,
     profile,
     get_profiling_config,
+    get_sampling_config,
+    start_sampling_profiler,
+    stop_sampling_profiler,
+    get_sampling_profiler,
     is_profiling_enabled,
     format_duration,
     report_metric
@@ -44,15 +59,25 @@ from .tracer import (  # Distributed tracing tools for tracking request flows
     is_tracing_enabled
 )
 
+# Import span export functionality
+from .span_processor import (  # Batched span export with head and tail sampling
+    BatchSpanProcessor,
+    should_sample_trace
+)
+
 __all__ = [
     "MetricClient",
     "TimeSeries",
+    "MetricBuffer",
+    "InMemoryMetricBackend",
     "Profiler",
     "ProfilerContext",
+    "SamplingProfiler",
     "TraceClient",
     "Span",
     "TraceContext",
     "OpenTelemetryTracer",
+    "BatchSpanProcessor",
     "profile",
     "trace",
     "format_metric_type",
@@ -66,11 +91,20 @@ __all__ = [
     "inject_trace_context",
     "extract_current_trace_data",
     "is_profiling_enabled",
+    "start_sampling_profiler",
+    "stop_sampling_profiler",
+    "get_sampling_profiler",
+    "get_sampling_config",
     "is_tracing_enabled",
+    "should_sample_trace",
     "METRIC_KIND_GAUGE",
     "METRIC_KIND_CUMULATIVE",
     "VALUE_TYPE_INT64",
     "VALUE_TYPE_DOUBLE",
     "VALUE_TYPE_BOOL",
-    "VALUE_TYPE_STRING"
+    "VALUE_TYPE_STRING",
+    "VALUE_TYPE_DISTRIBUTION",
+    "AGGREGATION_GAUGE",
+    "AGGREGATION_COUNTER",
+    "AGGREGATION_DISTRIBUTION"
 ]
\ No newline at end of file
@@ -0,0 +1,436 @@
+"""
+Client-side aggregation and background flushing for Cloud Monitoring metric writes.
+
+Hot code paths record metric points into an in-process buffer instead of calling the
+Cloud Monitoring API once per point. Points are aggregated per (metric type, labels):
+
+- Gauges keep the last recorded value
+- Counters are summed into a cumulative total
+- Distributions are bucketed into a cumulative histogram
+
+A background thread flushes changed series through ``create_time_series_batch`` every
+flush interval, or as soon as a full batch of series is pending. Cumulative series that
+have not been recorded for a while are evicted after a flush (a later point starts a new
+cumulative series). When the buffer still holds too many distinct series, points for
+existing series merge while points for new series are dropped and counted, and the next
+flush evicts the least recently recorded written series to make room.
+"""
+
+import bisect
+import datetime
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..logging.logger import get_logger
+from .metric_client import (
+    TimeSeries,
+    METRIC_KIND_GAUGE,
+    METRIC_KIND_CUMULATIVE,
+    VALUE_TYPE_INT64,
+    VALUE_TYPE_DOUBLE,
+    VALUE_TYPE_DISTRIBUTION,
+    DEFAULT_RESOURCE_TYPE,
+    determine_value_type
+)
+
+# Set up logger
+logger = get_logger(__name__)
+
+# Aggregation types
+AGGREGATION_GAUGE = "gauge"
+AGGREGATION_COUNTER = "counter"
+AGGREGATION_DISTRIBUTION = "distribution"
+
+# Buffer defaults
+DEFAULT_FLUSH_INTERVAL_SECONDS = 10.0
+DEFAULT_MAX_BATCH_SERIES = 200
+DEFAULT_MAX_PENDING_SERIES = 10000
+DEFAULT_IDLE_SERIES_SECONDS = 600.0
+# Fraction of max_pending_series kept after evicting series to make room for new ones
+EVICTION_TARGET_RATIO = 0.9
+DEFAULT_DISTRIBUTION_BOUNDS = [
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0
+]
+
+SeriesKey = Tuple[str, str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]
+
+
+def make_series_key(
+    metric_type: str,
+    aggregation: str,
+    labels: Optional[Dict[str, Any]] = None,
+    resource_labels: Optional[Dict[str, Any]] = None
+) -> SeriesKey:
+    """Builds a hashable key identifying one aggregated time series.
+
+    Args:
+        metric_type: Fully qualified metric type
+        aggregation: Aggregation type (gauge, counter, distribution)
+        labels: Metric labels
+        resource_labels: Resource labels
+
+    Returns:
+        Tuple usable as a dictionary key
+    """
+    return (
+        metric_type,
+        aggregation,
+        tuple(sorted((str(k), str(v)) for k, v in (labels or {}).items())),
+        tuple(sorted((str(k), str(v)) for k, v in (resource_labels or {}).items()))
+    )
+
+
+class _SeriesState:
+    """Aggregated state of one buffered time series."""
+
+    __slots__ = (
+        "aggregation", "value", "value_type", "timestamp", "start_time",
+        "count", "total", "mean", "sum_of_squared_deviation", "bucket_counts", "dirty", "last_recorded"
+    )
+
+    def __init__(self, aggregation: str, start_time: datetime.datetime, bucket_count: int = 0):
+        self.aggregation = aggregation
+        self.value: Any = None
+        self.value_type: Optional[str] = None
+        self.timestamp = start_time
+        self.start_time = start_time
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.sum_of_squared_deviation = 0.0
+        self.bucket_counts = [0] * bucket_count
+        self.dirty = False
+        self.last_recorded = time.monotonic()
+
+
+class MetricBuffer:
+    """Aggregates metric points in-process and flushes them in batches.
+
+    The backend can be any object exposing ``create_time_series_batch(list)``,
+    normally an unbuffered MetricClient or an InMemoryMetricBackend in tests.
+    """
+
+    def __init__(self, backend: Any, config: Optional[Dict[str, Any]] = None, start_thread: bool = True):
+        """Initializes the buffer.
+
+        Args:
+            backend: Object exposing create_time_series_batch
+            config: Optional settings: flush_interval_seconds, max_batch_series,
+                max_pending_series, idle_series_seconds, distribution_bounds
+            start_thread: Whether to start the background flush thread
+        """
+        config = config or {}
+        self._backend = backend
+        self._flush_interval = float(config.get("flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS))
+        self._max_batch_series = int(config.get("max_batch_series", DEFAULT_MAX_BATCH_SERIES))
+        self._max_pending_series = int(config.get("max_pending_series", DEFAULT_MAX_PENDING_SERIES))
+        self._idle_series_seconds = float(config.get("idle_series_seconds", DEFAULT_IDLE_SERIES_SECONDS))
+        self._distribution_bounds = sorted(config.get("distribution_bounds", DEFAULT_DISTRIBUTION_BOUNDS))
+
+        self._series: Dict[SeriesKey, _SeriesState] = {}
+        self._dirty_count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+        # Statistics about buffer behaviour
+        self._stats = {"points_recorded": 0, "points_dropped": 0, "series_flushed": 0, "series_evicted": 0,
+                       "flushes": 0, "flush_errors": 0}
+
+        self._thread: Optional[threading.Thread] = None
+        if start_thread:
+            self._thread = threading.Thread(target=self._flush_loop, name="metric-buffer-flush", daemon=True)
+            self._thread.start()
+
+    def record(
+        self,
+        metric_type: str,
+        value: Any,
+        aggregation: str = AGGREGATION_GAUGE,
+        labels: Optional[Dict[str, Any]] = None,
+        resource_labels: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime.datetime] = None,
+        value_type: Optional[str] = None
+    ) -> bool:
+        """Records a metric point into the buffer.
+
+        Args:
+            metric_type: Fully qualified metric type
+            value: Point value
+            aggregation: gauge, counter or distribution
+            labels: Metric labels
+            resource_labels: Resource labels
+            timestamp: Point timestamp (defaults to now)
+            value_type: Value type for gauges (determined automatically if None)
+
+        Returns:
+            True if the point was buffered, False if it was dropped
+        """
+        if aggregation not in (AGGREGATION_GAUGE, AGGREGATION_COUNTER, AGGREGATION_DISTRIBUTION):
+            raise ValueError(f"Unsupported aggregation type: {aggregation}")
+
+        timestamp = timestamp or datetime.datetime.now(datetime.timezone.utc)
+        key = make_series_key(metric_type, aggregation, labels, resource_labels)
+
+        with self._lock:
+            state = self._series.get(key)
+            if state is None:
+                # Under backpressure only existing series keep merging until a flush evicts some
+                if len(self._series) >= self._max_pending_series:
+                    self._stats["points_dropped"] += 1
+                    self._wakeup.set()
+                    return False
+                state = _SeriesState(aggregation, timestamp, len(self._distribution_bounds) + 1)
+                self._series[key] = state
+
+            if aggregation == AGGREGATION_GAUGE:
+                state.value = value
+                state.value_type = value_type or determine_value_type(value)
+            elif aggregation == AGGREGATION_COUNTER:
+                state.total += value
+            else:
+                # Welford update keeps mean and squared deviation exact without storing samples
+                state.count += 1
+                delta = value - state.mean
+                state.mean += delta / state.count
+                state.sum_of_squared_deviation += delta * (value - state.mean)
+                state.bucket_counts[bisect.bisect_right(self._distribution_bounds, value)] += 1
+
+            if timestamp > state.timestamp:
+                state.timestamp = timestamp
+            state.last_recorded = time.monotonic()
+            if not state.dirty:
+                state.dirty = True
+                self._dirty_count += 1
+            self._stats["points_recorded"] += 1
+            batch_ready = self._dirty_count >= self._max_batch_series
+
+        # Wake the flush thread early once a full batch is pending
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """Writes all changed series to the backend.
+
+        Returns:
+            Number of series written
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = [(key, state) for key, state in self._series.items() if state.dirty]
+                series = [self._to_time_series(key, state) for key, state in pending]
+                # Gauges are forgotten after they are written; cumulative series keep their totals
+                for key, state in pending:
+                    state.dirty = False
+                    if state.aggregation == AGGREGATION_GAUGE:
+                        del self._series[key]
+                self._dirty_count = 0
+
+            if not series:
+                return 0
+
+            written = 0
+            try:
+                for i in range(0, len(series), self._max_batch_series):
+                    batch = series[i:i + self._max_batch_series]
+                    self._backend.create_time_series_batch(batch)
+                    written += len(batch)
+            except Exception as e:
+                logger.error(f"Error flushing buffered metrics: {str(e)}")
+                self._stats["flush_errors"] += 1
+                self._requeue(pending[written:])
+
+            self._evict_series()
+            self._stats["flushes"] += 1
+            self._stats["series_flushed"] += written
+            logger.debug(f"Flushed {written} buffered metric series")
+            return written
+
+    def close(self, flush: bool = True) -> None:
+        """Stops the background thread and optionally flushes remaining series.
+
+        Args:
+            flush: Whether to flush pending series before returning
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self._flush_interval + 5)
+        if flush:
+            self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns buffer statistics.
+
+        Returns:
+            Dictionary with recorded, dropped and flushed counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending_series"] = self._dirty_count
+            stats["tracked_series"] = len(self._series)
+        return stats
+
+    def _evict_series(self) -> int:
+        """Forgets written series that went idle, then the least recently recorded ones if full.
+
+        Returns:
+            Number of series evicted
+        """
+        now = time.monotonic()
+        with self._lock:
+            clean = [(state.last_recorded, key) for key, state in self._series.items() if not state.dirty]
+            evicted = [key for last_recorded, key in clean if now - last_recorded >= self._idle_series_seconds]
+            excess = len(self._series) - len(evicted) - int(self._max_pending_series * EVICTION_TARGET_RATIO)
+            if len(self._series) >= self._max_pending_series and excess > 0:
+                idle = set(evicted)
+                remaining = sorted(item for item in clean if item[1] not in idle)
+                evicted.extend(key for last_recorded, key in remaining[:excess])
+            for key in evicted:
+                del self._series[key]
+            self._stats["series_evicted"] += len(evicted)
+        if evicted:
+            logger.debug(f"Evicted {len(evicted)} buffered metric series")
+        return len(evicted)
+
+    def _requeue(self, failed: List[Tuple[SeriesKey, _SeriesState]]) -> None:
+        """Marks series from a failed flush as pending again.
+
+        Args:
+            failed: Series that were not written
+        """
+        with self._lock:
+            for key, state in failed:
+                current = self._series.get(key)
+                if current is None:
+                    # Restore a flushed gauge unless a newer value arrived meanwhile
+                    if len(self._series) >= self._max_pending_series:
+                        self._stats["points_dropped"] += 1
+                        continue
+                    self._series[key] = current = state
+                if not current.dirty:
+                    current.dirty = True
+                    self._dirty_count += 1
+
+    def _to_time_series(self, key: SeriesKey, state: _SeriesState) -> TimeSeries:
+        """Converts aggregated state into a TimeSeries.
+
+        Args:
+            key: Series key
+            state: Aggregated series state
+
+        Returns:
+            TimeSeries ready for create_time_series_batch
+        """
+        metric_type, aggregation, labels, resource_labels = key
+
+        if aggregation == AGGREGATION_GAUGE:
+            value, value_type, metric_kind, start_time = state.value, state.value_type, METRIC_KIND_GAUGE, None
+        elif aggregation == AGGREGATION_COUNTER:
+            value_type = VALUE_TYPE_INT64 if isinstance(state.total, int) else VALUE_TYPE_DOUBLE
+            value, metric_kind, start_time = state.total, METRIC_KIND_CUMULATIVE, state.start_time
+        else:
+            value = {
+                "count": state.count,
+                "mean": state.mean,
+                "sum_of_squared_deviation": state.sum_of_squared_deviation,
+                "bounds": list(self._distribution_bounds),
+                "bucket_counts": list(state.bucket_counts)
+            }
+            value_type, metric_kind, start_time = VALUE_TYPE_DISTRIBUTION, METRIC_KIND_CUMULATIVE, state.start_time
+
+        # Cumulative points must end strictly after their start time
+        timestamp = state.timestamp
+        if start_time is not None and timestamp <= start_time:
+            timestamp = start_time + datetime.timedelta(milliseconds=1)
+
+        return TimeSeries(
+            metric_type=metric_type,
+            value=value,
+            metric_labels=dict(labels),
+            resource_labels=dict(resource_labels),
+            timestamp=timestamp,
+            metric_kind=metric_kind,
+            value_type=value_type,
+            resource_type=DEFAULT_RESOURCE_TYPE,
+            start_time=start_time
+        )
+
+    def _flush_loop(self) -> None:
+        """Background thread flushing on interval or when a batch is full."""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Unexpected error in metric flush thread: {str(e)}")
+
+
+class InMemoryMetricBackend:
+    """Metric backend that keeps written time series in memory for tests and benchmarks."""
+
+    def __init__(self, fail_writes: bool = False):
+        """Initializes the backend.
+
+        Args:
+            fail_writes: Whether writes should raise to simulate API errors
+        """
+        self.fail_writes = fail_writes
+        self.batches: List[List[TimeSeries]] = []
+        self._lock = threading.Lock()
+
+    def create_time_series_batch(self, time_series: List[TimeSeries]) -> bool:
+        """Stores a batch of time series.
+
+        Args:
+            time_series: Time series to store
+
+        Returns:
+            True if stored
+        """
+        if self.fail_writes:
+            raise RuntimeError("Simulated metric write failure")
+        with self._lock:
+            self.batches.append(list(time_series))
+        return True
+
+    def create_time_series(self, metric_type: str, value: Any, labels: Optional[Dict[str, str]] = None,
+                           resource_labels: Optional[Dict[str, str]] = None,
+                           timestamp: Optional[datetime.datetime] = None, **kwargs) -> bool:
+        """Stores a single time series point, mirroring MetricClient.create_time_series.
+
+        Returns:
+            True if stored
+        """
+        return self.create_time_series_batch([
+            TimeSeries(metric_type=metric_type, value=value, metric_labels=labels,
+                       resource_labels=resource_labels, timestamp=timestamp, **kwargs)
+        ])
+
+    @property
+    def written_series(self) -> List[TimeSeries]:
+        """Returns all written time series in write order."""
+        with self._lock:
+            return [ts for batch in self.batches for ts in batch]
+
+    def get_latest(self, metric_type: str, labels: Optional[Dict[str, str]] = None) -> Optional[TimeSeries]:
+        """Returns the most recently written series for a metric type and labels.
+
+        Args:
+            metric_type: Metric type to look up
+            labels: Metric labels to match exactly, or None to match any
+
+        Returns:
+            Latest matching TimeSeries or None
+        """
+        for ts in reversed(self.written_series):
+            if ts.metric_type == metric_type and (labels is None or ts.metric_labels == labels):
+                return ts
+        return None
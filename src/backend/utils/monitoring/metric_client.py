@@ -10,6 +10,7 @@ It offers:
 - Retrieval and analysis of metrics
 - Support for different metric types (gauge, cumulative)
 - Automatic retry handling for API resilience
+- Optional buffered mode that aggregates points in-process and flushes them in batches
 """
 
 import datetime
@@ -26,6 +27,7 @@ from google.cloud.monitoring_v3.types import (
     TypedValue,
     MonitoredResource
 )
+from google.api import distribution_pb2
 from google.protobuf.timestamp_pb2 import Timestamp
 import google.api_core.exceptions
 
@@ -33,7 +35,7 @@ from ..retry.retry_decorator import retry
 from ..auth.gcp_auth import get_default_credentials, get_project_id
 from ...constants import DEFAULT_MAX_RETRY_ATTEMPTS
 from ...config import get_config
-from ...logging_config import get_logger
+from ..logging.logger import get_logger
 
 # Set up logger
 logger = get_logger(__name__)
@@ -50,6 +52,7 @@ VALUE_TYPE_INT64 = "INT64"
 VALUE_TYPE_DOUBLE = "DOUBLE"
 VALUE_TYPE_BOOL = "BOOL"
 VALUE_TYPE_STRING = "STRING"
+VALUE_TYPE_DISTRIBUTION = "DISTRIBUTION"
 
 # Default monitored resource type
 DEFAULT_RESOURCE_TYPE = "global"
@@ -169,8 +172,21 @@ class MetricClient:
         credentials = get_default_credentials()
         self._client = MetricServiceClient(credentials=credentials)
         
+        # Set up buffered mode if enabled; points are aggregated and flushed in batches
+        self._buffer = None
+        buffering_config = self._config.get("buffering", {})
+        if buffering_config.get("enabled", False):
+            # Imported here because metric_buffer depends on this module
+            from .metric_buffer import MetricBuffer
+            self._buffer = MetricBuffer(self, buffering_config)
+        
         logger.info(f"Initialized MetricClient for project {self._project_id}")
     
+    @property
+    def is_buffered(self) -> bool:
+        """Returns True if writes are aggregated and flushed in the background."""
+        return self._buffer is not None
+    
     @retry(max_attempts=DEFAULT_MAX_RETRY_ATTEMPTS)
     def create_metric_descriptor(
         self,
@@ -355,6 +371,12 @@ class MetricClient:
         if timestamp is None:
             timestamp = datetime.datetime.now(datetime.timezone.utc)
         
+        # In buffered mode gauge points only update the in-process aggregate
+        if self._buffer is not None and metric_kind == METRIC_KIND_GAUGE:
+            return self._buffer.record(
+                metric_type, value, "gauge", labels, resource_labels, timestamp, value_type
+            )
+        
         # Create TimeSeries object
         time_series = TimeSeries(
             metric_type=metric_type,
@@ -696,6 +718,75 @@ class MetricClient:
             logger.error(f"Error creating cumulative time series for {metric_type}: {str(e)}")
             raise
     
+    def record_counter(
+        self,
+        metric_type: str,
+        increment: Union[int, float] = 1,
+        labels: Optional[Dict[str, str]] = None,
+        resource_labels: Optional[Dict[str, str]] = None,
+        timestamp: Optional[datetime.datetime] = None
+    ) -> bool:
+        """Adds to a counter metric, summed in-process and written as a cumulative series.
+        
+        Args:
+            metric_type: Type of metric (will be prefixed with domain if needed)
+            increment: Amount to add to the counter
+            labels: Metric labels
+            resource_labels: Resource labels
+            timestamp: Timestamp for the increment (defaults to now)
+            
+        Returns:
+            True if the increment was recorded, False otherwise
+        """
+        if self._buffer is None:
+            raise RuntimeError("record_counter requires buffered mode (monitoring.buffering.enabled)")
+        metric_type = format_metric_type(metric_type, self._metric_domain)
+        return self._buffer.record(metric_type, increment, "counter", labels, resource_labels, timestamp)
+    
+    def record_distribution(
+        self,
+        metric_type: str,
+        value: float,
+        labels: Optional[Dict[str, str]] = None,
+        resource_labels: Optional[Dict[str, str]] = None,
+        timestamp: Optional[datetime.datetime] = None
+    ) -> bool:
+        """Adds a sample to a distribution metric, bucketed in-process.
+        
+        Args:
+            metric_type: Type of metric (will be prefixed with domain if needed)
+            value: Sample value
+            labels: Metric labels
+            resource_labels: Resource labels
+            timestamp: Timestamp for the sample (defaults to now)
+            
+        Returns:
+            True if the sample was recorded, False otherwise
+        """
+        if self._buffer is None:
+            raise RuntimeError("record_distribution requires buffered mode (monitoring.buffering.enabled)")
+        metric_type = format_metric_type(metric_type, self._metric_domain)
+        return self._buffer.record(metric_type, value, "distribution", labels, resource_labels, timestamp)
+    
+    def flush(self) -> int:
+        """Writes buffered metric series immediately.
+        
+        Returns:
+            Number of series written (0 when not buffered)
+        """
+        if self._buffer is None:
+            return 0
+        return self._buffer.flush()
+    
+    def close(self) -> None:
+        """Flushes buffered metrics and stops the background flush thread."""
+        if self._buffer is not None:
+            self._buffer.close(flush=True)
+    
+    def get_buffer_stats(self) -> Dict[str, int]:
+        """Returns buffered mode statistics (empty when not buffered)."""
+        return self._buffer.get_stats() if self._buffer is not None else {}
+    
     def _descriptor_to_dict(self, descriptor) -> Dict[str, Any]:
         """Converts a metric descriptor to a dictionary.
         
@@ -863,6 +954,18 @@ class TimeSeries:
             point_value.double_value = float(self.value)
         elif self.value_type == VALUE_TYPE_BOOL:
             point_value.bool_value = bool(self.value)
+        elif self.value_type == VALUE_TYPE_DISTRIBUTION:
+            point_value.distribution_value = distribution_pb2.Distribution(
+                count=self.value["count"],
+                mean=self.value["mean"],
+                sum_of_squared_deviation=self.value["sum_of_squared_deviation"],
+                bucket_options=distribution_pb2.Distribution.BucketOptions(
+                    explicit_buckets=distribution_pb2.Distribution.BucketOptions.Explicit(
+                        bounds=self.value["bounds"]
+                    )
+                ),
+                bucket_counts=self.value["bucket_counts"]
+            )
         else:  # VALUE_TYPE_STRING
             point_value.string_value = str(self.value)
         
@@ -2,10 +2,17 @@
 Performance profiling utility for the self-healing data pipeline. Provides tools to measure,
 record, and analyze execution time and resource usage of code blocks and functions.
 Supports both decorator-based and context manager-based profiling with configurable
-detail levels and metric reporting.
+detail levels and metric reporting, plus a continuous statistical sampling profiler that
+aggregates stacks per logging context without annotating code.
 """
 
+import os
+import sys
+import json
 import time
+import signal
+import threading
+import collections
 import functools
 import contextlib
 import typing
@@ -15,7 +22,7 @@ import pstats
 
 from src.backend.config import get_config  # Access application configuration settings for profiling
 from src.backend.constants import DEFAULT_MAX_RETRY_ATTEMPTS  # Import constant values for configuration
-from src.backend.utils.logging.logger import get_logger  # Configure logging for the module
+from src.backend.utils.logging.logger import get_logger, get_thread_context  # Configure logging for the module
 from src.backend.utils.monitoring.metric_client import MetricClient, METRIC_KIND_GAUGE, VALUE_TYPE_DOUBLE, VALUE_TYPE_INT64  # Send profiling metrics to Cloud Monitoring
 
 # Initialize logger for this module
@@ -31,6 +38,34 @@ DEFAULT_PROFILING_ENABLED = True
 DEFAULT_PROFILING_LEVEL = "BASIC"
 DEFAULT_METRIC_REPORTING = True
 
+# Configuration keys for the sampling profiler
+SAMPLING_ENABLED_CONFIG_KEY = "monitoring.profiling.sampling.enabled"
+SAMPLING_MODE_CONFIG_KEY = "monitoring.profiling.sampling.mode"
+SAMPLING_HZ_CONFIG_KEY = "monitoring.profiling.sampling.hz"
+SAMPLING_MAX_OVERHEAD_CONFIG_KEY = "monitoring.profiling.sampling.max_overhead"
+SAMPLING_CONTEXT_KEYS_CONFIG_KEY = "monitoring.profiling.sampling.context_keys"
+SAMPLING_REPORT_INTERVAL_CONFIG_KEY = "monitoring.profiling.sampling.report_interval_seconds"
+SAMPLING_OUTPUT_DIR_CONFIG_KEY = "monitoring.profiling.sampling.output_dir"
+
+# Default values for the sampling profiler; an odd rate avoids lockstep with periodic work
+DEFAULT_SAMPLING_ENABLED = False
+DEFAULT_SAMPLING_HZ = 49.0
+DEFAULT_MIN_SAMPLING_HZ = 1.0
+DEFAULT_MAX_SAMPLING_OVERHEAD = 0.02
+DEFAULT_SAMPLING_CONTEXT_KEYS = ("pipeline_id", "task_id", "correlation_id")
+DEFAULT_SAMPLING_REPORT_INTERVAL = 60.0
+DEFAULT_SAMPLING_TOP_N = 10
+DEFAULT_MAX_STACK_DEPTH = 64
+DEFAULT_MAX_SAMPLING_CONTEXTS = 1000
+DEFAULT_SIGNAL_MAINTENANCE_INTERVAL = 1.0
+
+# Sampling modes
+SAMPLING_MODE_THREAD = "thread"
+SAMPLING_MODE_SIGNAL = "signal"
+
+# Context bucket used once the number of distinct contexts reaches its limit
+OVERFLOW_CONTEXT = (("context", "other"),)
+
 # Profiling levels
 PROFILING_LEVEL_BASIC = "BASIC"
 PROFILING_LEVEL_DETAILED = "DETAILED"
@@ -39,6 +74,10 @@ PROFILING_LEVEL_ADVANCED = "ADVANCED"
 # Global variable to store the MetricClient instance
 _metric_client = None
 
+# Global process-wide sampling profiler
+_sampling_profiler = None
+_sampling_profiler_lock = threading.Lock()
+
 
 def get_profiling_config() -> dict:
     """Retrieves profiling configuration settings from application config
@@ -66,6 +105,25 @@ def get_profiling_config() -> dict:
     }
 
 
+def get_sampling_config() -> dict:
+    """Retrieves sampling profiler configuration settings from application config
+
+    Returns:
+        dict: Dictionary of sampling profiler settings
+    """
+    config = get_config()
+
+    return {
+        "enabled": config.get(SAMPLING_ENABLED_CONFIG_KEY, DEFAULT_SAMPLING_ENABLED),
+        "mode": config.get(SAMPLING_MODE_CONFIG_KEY, SAMPLING_MODE_THREAD),
+        "hz": config.get(SAMPLING_HZ_CONFIG_KEY, DEFAULT_SAMPLING_HZ),
+        "max_overhead": config.get(SAMPLING_MAX_OVERHEAD_CONFIG_KEY, DEFAULT_MAX_SAMPLING_OVERHEAD),
+        "context_keys": config.get(SAMPLING_CONTEXT_KEYS_CONFIG_KEY, list(DEFAULT_SAMPLING_CONTEXT_KEYS)),
+        "report_interval_seconds": config.get(SAMPLING_REPORT_INTERVAL_CONFIG_KEY, DEFAULT_SAMPLING_REPORT_INTERVAL),
+        "output_dir": config.get(SAMPLING_OUTPUT_DIR_CONFIG_KEY, None)
+    }
+
+
 def is_profiling_enabled() -> bool:
     """Checks if profiling is enabled in the configuration
 
@@ -557,4 +615,517 @@ class ProfilerContext:
             return self._profiler.metrics
 
         # Return empty dict if profiler is not active or metrics not available
-        return {}
\ No newline at end of file
+        return {}
+
+
+def format_context_key(context_key: tuple) -> str:
+    """Formats a sampling context key as a readable string
+
+    Args:
+        context_key (tuple): Tuple of (name, value) pairs
+
+    Returns:
+        str: Context formatted as name=value pairs, or 'all' for the empty context
+    """
+    if not context_key:
+        return "all"
+    return ",".join(f"{name}={value}" for name, value in context_key)
+
+
+class SamplingProfiler:
+    """Statistical stack-sampling profiler aggregating collapsed stacks per logging context
+
+    Samples are taken either by a background thread reading the stacks of all threads
+    (thread mode) or by a CPU-time interval timer interrupting the main thread (signal
+    mode). Each sample is attributed to the sampled thread's logging context, so Airflow
+    tasks and API requests can be told apart without annotating code. The sampling rate
+    is lowered automatically whenever the measured overhead exceeds max_overhead; in
+    signal mode a background thread checks the overhead and reports, since the signal
+    handler must not take locks.
+    """
+
+    def __init__(self, config: dict = None):
+        """Initializes the sampling profiler
+
+        Args:
+            config (dict): Optional settings: mode, hz, max_overhead, context_keys,
+                max_stack_depth, max_contexts, report_interval_seconds, top_n, output_dir
+        """
+        config = config or {}
+        self.mode = config.get("mode", SAMPLING_MODE_THREAD)
+        if self.mode not in (SAMPLING_MODE_THREAD, SAMPLING_MODE_SIGNAL):
+            raise ValueError(f"Unsupported sampling mode: {self.mode}")
+
+        self._target_hz = float(config.get("hz", DEFAULT_SAMPLING_HZ))
+        if self._target_hz <= 0:
+            raise ValueError("Sampling rate must be positive")
+        self._interval = 1.0 / self._target_hz
+        self._max_overhead = float(config.get("max_overhead", DEFAULT_MAX_SAMPLING_OVERHEAD))
+        self._context_keys = tuple(config.get("context_keys", DEFAULT_SAMPLING_CONTEXT_KEYS))
+        self._max_stack_depth = int(config.get("max_stack_depth", DEFAULT_MAX_STACK_DEPTH))
+        self._max_contexts = int(config.get("max_contexts", DEFAULT_MAX_SAMPLING_CONTEXTS))
+        self._report_interval = float(config.get("report_interval_seconds", DEFAULT_SAMPLING_REPORT_INTERVAL))
+        self._top_n = int(config.get("top_n", DEFAULT_SAMPLING_TOP_N))
+        self._output_dir = config.get("output_dir")
+
+        # Collapsed stacks (tuples of frame labels, root first) counted per context
+        self._stacks: typing.Dict[tuple, collections.Counter] = {}
+        # Signal handlers never take the lock; they append here and readers fold the samples
+        self._signal_samples: collections.deque = collections.deque(maxlen=100000)
+        self._frame_labels: typing.Dict[typing.Any, str] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._previous_handler = None
+
+        self._running = False
+        self._started_at = None
+        self._sampling_time = 0.0
+        self._sample_count = 0
+        self._last_report = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the profiler is currently sampling"""
+        return self._running
+
+    @property
+    def current_hz(self) -> float:
+        """Current sampling rate after overhead adjustments"""
+        return 1.0 / self._interval
+
+    def start(self) -> bool:
+        """Starts sampling
+
+        Returns:
+            bool: True if sampling was started
+        """
+        if self._running:
+            return False
+
+        if self.mode == SAMPLING_MODE_SIGNAL:
+            # Interval timers and signal handlers are only available on the main thread
+            if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+                logger.warning("Signal sampling is unavailable here, falling back to thread sampling")
+                self.mode = SAMPLING_MODE_THREAD
+
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._last_report = time.monotonic()
+        self._running = True
+
+        if self.mode == SAMPLING_MODE_SIGNAL:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._handle_signal)
+            signal.setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+            self._thread = threading.Thread(target=self._maintenance_loop, name="sampling-profiler", daemon=True)
+        else:
+            self._thread = threading.Thread(target=self._sampling_loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+        logger.info(f"Started sampling profiler: mode={self.mode}, hz={self.current_hz:.1f}")
+        return True
+
+    def stop(self) -> None:
+        """Stops sampling; collected stacks are kept until reset"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self.mode == SAMPLING_MODE_SIGNAL:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+        self._thread = None
+
+        logger.info(f"Stopped sampling profiler after {self._sample_count} samples, overhead={self.get_overhead():.4f}")
+
+    def reset(self) -> None:
+        """Discards all collected stacks"""
+        with self._lock:
+            self._signal_samples.clear()
+            self._stacks.clear()
+
+    def sample_once(self) -> int:
+        """Samples the stacks of all threads except the profiler's own
+
+        Returns:
+            int: Number of thread stacks recorded
+        """
+        own_thread_id = threading.get_ident()
+        recorded = 0
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, frame in frames.items():
+                if thread_id == own_thread_id:
+                    continue
+                self._record(self._get_context_key(thread_id), self._collapse_stack(frame))
+                recorded += 1
+        return recorded
+
+    def get_folded_stacks(self, include_context: bool = True) -> typing.Dict[str, int]:
+        """Gets collapsed stacks in folded format
+
+        Args:
+            include_context (bool): Whether to prefix stacks with their context as root frames
+
+        Returns:
+            dict: Mapping of semicolon-separated stacks (root first) to sample counts
+        """
+        folded = collections.Counter()
+        for context_key, stacks in self._snapshot().items():
+            prefix = [f"{name}={value}" for name, value in context_key] if include_context else []
+            for stack, count in stacks.items():
+                folded[";".join(prefix + list(stack))] += count
+        return dict(folded)
+
+    def get_top_functions(self, n: int = None, context_key: tuple = None) -> list:
+        """Gets the functions where most samples were taken
+
+        Args:
+            n (int): Number of functions to return (defaults to top_n)
+            context_key (tuple): Restrict to one context, as returned by get_contexts
+
+        Returns:
+            list: Dictionaries with function, self_samples, total_samples and self_percent
+        """
+        snapshot = self._snapshot()
+        if context_key is not None:
+            snapshot = {context_key: snapshot.get(context_key, {})}
+
+        self_counts = collections.Counter()
+        total_counts = collections.Counter()
+        total_samples = 0
+        for stacks in snapshot.values():
+            for stack, count in stacks.items():
+                total_samples += count
+                if stack:
+                    self_counts[stack[-1]] += count
+                # Recursive frames count once per sample
+                for label in set(stack):
+                    total_counts[label] += count
+
+        top = []
+        for label, self_samples in self_counts.most_common(n or self._top_n):
+            top.append({
+                "function": label,
+                "self_samples": self_samples,
+                "total_samples": total_counts[label],
+                "self_percent": 100.0 * self_samples / total_samples if total_samples else 0.0
+            })
+        return top
+
+    def get_contexts(self) -> typing.Dict[tuple, int]:
+        """Gets the contexts seen so far with their sample counts
+
+        Returns:
+            dict: Mapping of context keys to sample counts
+        """
+        return {context_key: sum(stacks.values()) for context_key, stacks in self._snapshot().items()}
+
+    def export_folded(self, file_path: str, include_context: bool = True) -> bool:
+        """Writes collapsed stacks in the folded format used by flame graph tools
+
+        Args:
+            file_path (str): Destination file path
+            include_context (bool): Whether to prefix stacks with their context
+
+        Returns:
+            bool: True if the file was written
+        """
+        folded = self.get_folded_stacks(include_context)
+        lines = [f"{stack} {count}\n" for stack, count in sorted(folded.items())]
+        return self._write_atomic(file_path, "".join(lines))
+
+    def export_speedscope(self, file_path: str, name: str = "self-healing-pipeline") -> bool:
+        """Writes a speedscope profile with one sampled profile per context
+
+        Args:
+            file_path (str): Destination file path
+            name (str): Name of the profile
+
+        Returns:
+            bool: True if the file was written
+        """
+        frames = []
+        frame_index = {}
+        profiles = []
+        for context_key, stacks in sorted(self._snapshot().items()):
+            samples = []
+            weights = []
+            for stack, count in stacks.items():
+                indices = []
+                for label in stack:
+                    if label not in frame_index:
+                        frame_index[label] = len(frames)
+                        frames.append({"name": label})
+                    indices.append(frame_index[label])
+                samples.append(indices)
+                weights.append(count)
+            profiles.append({
+                "type": "sampled",
+                "name": format_context_key(context_key),
+                "unit": "none",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights
+            })
+
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "self-healing-pipeline-sampling-profiler",
+            "shared": {"frames": frames},
+            "profiles": profiles
+        }
+        return self._write_atomic(file_path, json.dumps(document))
+
+    def report_hot_functions(self, n: int = None) -> int:
+        """Reports the top-N hot functions and the profiler overhead to Cloud Monitoring
+
+        Args:
+            n (int): Number of functions to report (defaults to top_n)
+
+        Returns:
+            int: Number of metrics reported successfully
+        """
+        reported = 0
+        for rank, entry in enumerate(self.get_top_functions(n), start=1):
+            labels = {"function": entry["function"][:1024], "rank": str(rank)}
+            if report_metric("profiling.sampling.self_percent", entry["self_percent"], labels):
+                reported += 1
+
+        if report_metric("profiling.sampling.overhead", self.get_overhead(), {"mode": self.mode}):
+            reported += 1
+        return reported
+
+    def get_overhead(self) -> float:
+        """Gets the fraction of wall time spent taking samples
+
+        Returns:
+            float: Sampling time divided by elapsed time since start
+        """
+        if self._started_at is None:
+            return 0.0
+        elapsed = time.perf_counter() - self._started_at
+        return self._sampling_time / elapsed if elapsed > 0 else 0.0
+
+    def get_stats(self) -> dict:
+        """Gets profiler statistics
+
+        Returns:
+            dict: Dictionary of sampling statistics
+        """
+        contexts = self.get_contexts()
+        return {
+            "running": self._running,
+            "mode": self.mode,
+            "hz": self.current_hz,
+            "samples": self._sample_count,
+            "recorded_stacks": sum(contexts.values()),
+            "contexts": len(contexts),
+            "overhead": self.get_overhead()
+        }
+
+    def _sampling_loop(self) -> None:
+        """Background thread sampling all thread stacks at the configured rate"""
+        next_sample = time.monotonic()
+        while not self._stop_event.is_set():
+            next_sample += self._interval
+            delay = next_sample - time.monotonic()
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+            if delay < 0:
+                # Skip missed samples instead of bursting to catch up
+                next_sample = time.monotonic()
+
+            sample_start = time.perf_counter()
+            try:
+                self.sample_once()
+            except Exception as e:
+                logger.error(f"Error taking profiling sample: {e}")
+            self._sampling_time += time.perf_counter() - sample_start
+            self._sample_count += 1
+
+            self._adjust_rate()
+            self._maybe_report()
+
+    def _maintenance_loop(self) -> None:
+        """Background thread applying the overhead budget and reporting in signal mode"""
+        while not self._stop_event.wait(DEFAULT_SIGNAL_MAINTENANCE_INTERVAL):
+            self._adjust_rate()
+            self._maybe_report()
+
+    def _handle_signal(self, signum, frame) -> None:
+        """Records the interrupted main thread stack from the SIGPROF handler
+
+        Args:
+            signum: Signal number
+            frame: Frame interrupted by the signal
+        """
+        sample_start = time.perf_counter()
+        if frame is not None:
+            self._signal_samples.append((self._get_context_key(threading.get_ident()), self._collapse_stack(frame)))
+        self._sampling_time += time.perf_counter() - sample_start
+        self._sample_count += 1
+
+    def _adjust_rate(self) -> None:
+        """Halves the sampling rate while the measured overhead exceeds its budget"""
+        # Require a few samples before trusting the overhead estimate
+        if self._sample_count < 10:
+            return
+        if self.get_overhead() > self._max_overhead and self.current_hz > DEFAULT_MIN_SAMPLING_HZ:
+            self._interval = min(self._interval * 2, 1.0 / DEFAULT_MIN_SAMPLING_HZ)
+            if self.mode == SAMPLING_MODE_SIGNAL and self._running:
+                signal.setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+            logger.warning(f"Sampling overhead above {self._max_overhead:.2%}, lowering rate to {self.current_hz:.1f} Hz")
+
+    def _maybe_report(self) -> None:
+        """Reports hot functions and writes profile files once per report interval"""
+        if self._report_interval <= 0 or time.monotonic() - self._last_report < self._report_interval:
+            return
+        self._last_report = time.monotonic()
+
+        try:
+            if get_profiling_config().get("report_metrics", False):
+                self.report_hot_functions()
+            if self._output_dir:
+                self.export_folded(os.path.join(self._output_dir, f"profile-{os.getpid()}.folded"))
+        except Exception as e:
+            logger.error(f"Error reporting sampling profile: {e}")
+
+    def _get_context_key(self, thread_id: int) -> tuple:
+        """Builds the context key of a thread from its logging context
+
+        Args:
+            thread_id (int): Thread identifier
+
+        Returns:
+            tuple: Tuple of (name, value) pairs for the configured context keys that are set
+        """
+        context = get_thread_context(thread_id)
+        if not context:
+            return ()
+        return tuple((key, str(context[key])) for key in self._context_keys if context.get(key) is not None)
+
+    def _collapse_stack(self, frame) -> tuple:
+        """Converts a frame and its callers into a tuple of labels, root first
+
+        Args:
+            frame: Innermost frame of the stack
+
+        Returns:
+            tuple: Frame labels ordered from the outermost caller
+        """
+        labels = []
+        depth = 0
+        while frame is not None and depth < self._max_stack_depth:
+            code = frame.f_code
+            label = self._frame_labels.get(code)
+            if label is None:
+                # First line of the function keeps labels stable across samples
+                label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                self._frame_labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+            depth += 1
+        labels.reverse()
+        return tuple(labels)
+
+    def _record(self, context_key: tuple, stack: tuple) -> None:
+        """Counts a collapsed stack for a context; caller holds the lock
+
+        Args:
+            context_key (tuple): Context of the sampled thread
+            stack (tuple): Collapsed stack
+        """
+        stacks = self._stacks.get(context_key)
+        if stacks is None:
+            # Bound memory when contexts are high-cardinality, e.g. per-request correlation IDs
+            if len(self._stacks) >= self._max_contexts:
+                context_key = OVERFLOW_CONTEXT
+            stacks = self._stacks.setdefault(context_key, collections.Counter())
+        stacks[stack] += 1
+
+    def _snapshot(self) -> typing.Dict[tuple, dict]:
+        """Folds pending signal samples and copies the collected stacks
+
+        Returns:
+            dict: Mapping of context keys to stack counts
+        """
+        with self._lock:
+            while self._signal_samples:
+                context_key, stack = self._signal_samples.popleft()
+                self._record(context_key, stack)
+            return {context_key: dict(stacks) for context_key, stacks in self._stacks.items()}
+
+    def _write_atomic(self, file_path: str, content: str) -> bool:
+        """Writes a file through a temporary file so readers never see partial output
+
+        Args:
+            file_path (str): Destination file path
+            content (str): File content
+
+        Returns:
+            bool: True if the file was written
+        """
+        try:
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{file_path}.tmp"
+            with open(temp_path, "w") as f:
+                f.write(content)
+            os.replace(temp_path, file_path)
+            return True
+        except OSError as e:
+            logger.error(f"Failed to write profile to {file_path}: {e}")
+            return False
+
+
+def start_sampling_profiler(config: dict = None) -> typing.Optional[SamplingProfiler]:
+    """Starts the process-wide sampling profiler if enabled
+
+    Args:
+        config (dict): Optional sampler settings; defaults to the application configuration,
+            in which case the profiler only starts when sampling is enabled
+
+    Returns:
+        SamplingProfiler: The running profiler, or None if sampling is disabled
+    """
+    global _sampling_profiler
+
+    if config is None:
+        config = get_sampling_config()
+        if not config.get("enabled", False):
+            return None
+
+    with _sampling_profiler_lock:
+        if _sampling_profiler is None or not _sampling_profiler.is_running:
+            _sampling_profiler = SamplingProfiler(config)
+            _sampling_profiler.start()
+        return _sampling_profiler
+
+
+def stop_sampling_profiler() -> typing.Optional[SamplingProfiler]:
+    """Stops the process-wide sampling profiler
+
+    Returns:
+        SamplingProfiler: The stopped profiler with its collected stacks, or None if none was running
+    """
+    with _sampling_profiler_lock:
+        profiler = _sampling_profiler
+        if profiler is not None:
+            profiler.stop()
+        return profiler
+
+
+def get_sampling_profiler() -> typing.Optional[SamplingProfiler]:
+    """Gets the process-wide sampling profiler
+
+    Returns:
+        SamplingProfiler: The sampling profiler, or None if it was never started
+    """
+    return _sampling_profiler
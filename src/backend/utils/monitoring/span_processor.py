@@ -0,0 +1,290 @@
+"""
+Batching span processor with head and tail sampling for the tracing framework.
+
+Ended spans are handed to a BatchSpanProcessor instead of being written to Cloud Trace
+one at a time. The processor keeps a bounded export queue that a background thread
+drains in batches, either periodically or as soon as a full batch is waiting.
+
+Sampling happens in two stages:
+- Head sampling keeps a deterministic fraction of traces based on the trace ID, so every
+  span of a sampled trace is kept without coordination between services.
+- Tail sampling holds the spans of traces that were not head-sampled until the trace
+  completes, and keeps the whole trace if any span recorded an error or ran slowly.
+"""
+
+import threading
+import time
+import collections
+from typing import Any, Callable, Dict, List, Optional
+
+from ..logging.logger import get_logger
+
+# Initialize logger
+logger = get_logger(__name__)
+
+# Default processor settings
+DEFAULT_MAX_QUEUE_SIZE = 2048
+DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
+DEFAULT_SCHEDULE_DELAY_SECONDS = 5.0
+DEFAULT_SLOW_SPAN_THRESHOLD_MS = 1000.0
+DEFAULT_TAIL_DECISION_WAIT_SECONDS = 30.0
+DEFAULT_MAX_PENDING_TRACES = 1000
+DEFAULT_MAX_SPANS_PER_TRACE = 256
+
+# Trace ID ratio sampling uses the low 60 bits, which exclude the UUID version and variant bits
+_TRACE_ID_SAMPLING_HEX_DIGITS = 15
+_TRACE_ID_BOUND = 1 << (4 * _TRACE_ID_SAMPLING_HEX_DIGITS)
+
+
+def should_sample_trace(trace_id: str, ratio: float) -> bool:
+    """Makes a deterministic head sampling decision from a trace ID.
+
+    Every service that sees the same trace ID makes the same decision, so sampled
+    traces are complete across process boundaries.
+
+    Args:
+        trace_id: Hexadecimal trace ID
+        ratio: Fraction of traces to keep, between 0 and 1
+
+    Returns:
+        True if the trace should be sampled
+    """
+    if ratio >= 1.0:
+        return True
+    if ratio <= 0.0 or not trace_id:
+        return False
+    try:
+        # The low bits of random trace IDs are uniformly distributed
+        return int(trace_id[-_TRACE_ID_SAMPLING_HEX_DIGITS:], 16) < ratio * _TRACE_ID_BOUND
+    except ValueError:
+        return False
+
+
+def is_error_span(span: Any) -> bool:
+    """Checks whether a span recorded an error.
+
+    Args:
+        span: Span with an attributes dictionary
+
+    Returns:
+        True if the span is marked as an error
+    """
+    return bool(span.attributes.get("error"))
+
+
+class _PendingTrace:
+    """Spans of a trace awaiting a tail sampling decision."""
+
+    __slots__ = ("spans", "keep", "created_at")
+
+    def __init__(self):
+        self.spans: List[Any] = []
+        self.keep = False
+        self.created_at = time.monotonic()
+
+
+class BatchSpanProcessor:
+    """Samples ended spans and exports them in batches on a background thread."""
+
+    def __init__(self, export_func: Callable[[List[Any]], bool], config: Optional[Dict[str, Any]] = None,
+                 start_thread: bool = True):
+        """Initializes the processor.
+
+        Args:
+            export_func: Callable that writes a list of spans and returns True on success
+            config: Optional settings: sampling_rate, tail_sampling_enabled, slow_span_threshold_ms,
+                max_queue_size, max_export_batch_size, schedule_delay_seconds,
+                tail_decision_wait_seconds, max_pending_traces
+            start_thread: Whether to start the background export thread
+        """
+        config = config or {}
+        self._export_func = export_func
+        self._sampling_rate = float(config.get("sampling_rate", 1.0))
+        self._tail_sampling_enabled = bool(config.get("tail_sampling_enabled", True))
+        self._slow_span_threshold = float(config.get("slow_span_threshold_ms", DEFAULT_SLOW_SPAN_THRESHOLD_MS)) / 1000.0
+        self._max_queue_size = int(config.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE))
+        self._max_export_batch_size = int(config.get("max_export_batch_size", DEFAULT_MAX_EXPORT_BATCH_SIZE))
+        self._schedule_delay = float(config.get("schedule_delay_seconds", DEFAULT_SCHEDULE_DELAY_SECONDS))
+        self._tail_decision_wait = float(config.get("tail_decision_wait_seconds", DEFAULT_TAIL_DECISION_WAIT_SECONDS))
+        self._max_pending_traces = int(config.get("max_pending_traces", DEFAULT_MAX_PENDING_TRACES))
+
+        self._queue: collections.deque = collections.deque()
+        self._pending_traces: Dict[str, _PendingTrace] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._stats = {
+            "spans_received": 0, "spans_sampled_head": 0, "spans_sampled_tail": 0,
+            "spans_discarded": 0, "spans_dropped": 0, "spans_exported": 0, "export_errors": 0
+        }
+
+        self._thread: Optional[threading.Thread] = None
+        if start_thread:
+            self._thread = threading.Thread(target=self._export_loop, name="span-exporter", daemon=True)
+            self._thread.start()
+
+    def is_sampled(self, trace_id: str) -> bool:
+        """Returns the head sampling decision for a trace.
+
+        Args:
+            trace_id: Hexadecimal trace ID
+
+        Returns:
+            True if the trace is head-sampled
+        """
+        return should_sample_trace(trace_id, self._sampling_rate)
+
+    def on_end(self, span: Any) -> None:
+        """Handles an ended span; never blocks on network I/O.
+
+        Args:
+            span: Ended span
+        """
+        with self._lock:
+            self._stats["spans_received"] += 1
+
+            # Head-sampled traces are exported span by span
+            if self.is_sampled(span.trace_id):
+                self._stats["spans_sampled_head"] += 1
+                self._enqueue([span])
+                return
+
+            if not self._tail_sampling_enabled:
+                self._stats["spans_discarded"] += 1
+                return
+
+            pending = self._pending_traces.get(span.trace_id)
+            if pending is None:
+                # Bound memory by evaluating the oldest pending trace early
+                if len(self._pending_traces) >= self._max_pending_traces:
+                    oldest_trace_id = next(iter(self._pending_traces))
+                    self._decide(oldest_trace_id)
+                pending = self._pending_traces[span.trace_id] = _PendingTrace()
+
+            if len(pending.spans) < DEFAULT_MAX_SPANS_PER_TRACE:
+                pending.spans.append(span)
+            else:
+                self._stats["spans_discarded"] += 1
+
+            # An error or slow span marks the whole trace as interesting
+            duration = span.get_duration()
+            if is_error_span(span) or (duration is not None and duration >= self._slow_span_threshold):
+                pending.keep = True
+
+            # The local root span completes the trace; a span continuing a trace from
+            # another process is the local root even though it has a parent
+            if span.parent_span_id is None or span.remote_parent:
+                self._decide(span.trace_id)
+
+    def force_flush(self) -> bool:
+        """Exports all queued spans immediately.
+
+        Returns:
+            True if every export succeeded
+        """
+        success = True
+        while True:
+            exported, batch_success = self._export_batch()
+            success = success and batch_success
+            if exported == 0 or not batch_success:
+                return success
+
+    def shutdown(self) -> None:
+        """Decides pending traces, flushes queued spans and stops the export thread."""
+        with self._lock:
+            for trace_id in list(self._pending_traces):
+                self._decide(trace_id)
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self._schedule_delay + 5)
+        self.force_flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns processor statistics.
+
+        Returns:
+            Dictionary of sampling and export counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["queue_size"] = len(self._queue)
+            stats["pending_traces"] = len(self._pending_traces)
+        return stats
+
+    def _decide(self, trace_id: str) -> None:
+        """Applies the tail sampling decision to a pending trace; caller holds the lock.
+
+        Args:
+            trace_id: Trace to decide
+        """
+        pending = self._pending_traces.pop(trace_id, None)
+        if pending is None:
+            return
+        if pending.keep:
+            self._stats["spans_sampled_tail"] += len(pending.spans)
+            self._enqueue(pending.spans)
+        else:
+            self._stats["spans_discarded"] += len(pending.spans)
+
+    def _enqueue(self, spans: List[Any]) -> None:
+        """Adds spans to the export queue, dropping them when it is full; caller holds the lock.
+
+        Args:
+            spans: Spans to export
+        """
+        for span in spans:
+            if len(self._queue) >= self._max_queue_size:
+                self._stats["spans_dropped"] += 1
+                continue
+            self._queue.append(span)
+        if len(self._queue) >= self._max_export_batch_size:
+            self._wakeup.set()
+
+    def _expire_pending_traces(self) -> None:
+        """Decides traces whose root span never ended within the decision wait."""
+        cutoff = time.monotonic() - self._tail_decision_wait
+        with self._lock:
+            expired = [trace_id for trace_id, pending in self._pending_traces.items() if pending.created_at <= cutoff]
+            for trace_id in expired:
+                self._decide(trace_id)
+
+    def _export_batch(self) -> tuple:
+        """Exports up to one batch of queued spans.
+
+        Returns:
+            Tuple of (number of spans exported, success flag)
+        """
+        with self._export_lock:
+            with self._lock:
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self._max_export_batch_size))]
+            if not batch:
+                return 0, True
+            try:
+                success = bool(self._export_func(batch))
+            except Exception as e:
+                logger.error(f"Failed to export {len(batch)} spans: {str(e)}")
+                success = False
+            with self._lock:
+                if success:
+                    self._stats["spans_exported"] += len(batch)
+                else:
+                    self._stats["export_errors"] += 1
+                    self._stats["spans_dropped"] += len(batch)
+            return len(batch), success
+
+    def _export_loop(self) -> None:
+        """Background thread exporting batches periodically or when a batch is full."""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._schedule_delay)
+            self._wakeup.clear()
+            try:
+                self._expire_pending_traces()
+                # Drain full batches first, then whatever remains
+                while True:
+                    exported, success = self._export_batch()
+                    if exported < self._max_export_batch_size or not success:
+                        break
+            except Exception as e:
+                logger.error(f"Unexpected error in span export thread: {str(e)}")
@@ -12,6 +12,7 @@ Key features:
 - OpenTelemetry support for standardized instrumentation
 - Decorators and context managers for easy code instrumentation
 - Correlation with logging system via correlation IDs
+- Batched background export with head (trace ID ratio) and tail (error/slow) sampling
 
 The module can be configured via application settings to control tracing behavior,
 sampling rates, and export destinations.
@@ -28,20 +29,26 @@ from typing import Dict, List, Optional, Any, Tuple, Callable, Union
 
 from google.cloud.trace_v2 import TraceServiceClient
 from google.cloud.trace_v2.types import Span as TraceSpanProto
-from google.cloud.trace_v2.types import Trace, TruncatableString, AttributeValue
+from google.cloud.trace_v2.types import TruncatableString, AttributeValue
 from google.cloud.trace_v2.types import Attributes, Links, Status, TimeEvents
 
 from opentelemetry.trace import SpanContext, TracerProvider, Tracer as OTelTracer
 from opentelemetry.trace import SpanKind, get_current_span, set_span_in_context
 from opentelemetry.sdk.trace import Tracer as SDKTracer, TracerProvider as SDKTracerProvider
 from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.propagate import extract, inject, set_global_textmap
 from opentelemetry.propagators.cloud_trace_propagator import CloudTraceFormatPropagator
 
 from ..logging.logger import get_logger, get_correlation_id, set_correlation_id
 from ..auth.gcp_auth import get_default_credentials, get_project_id
 from ..retry.retry_decorator import retry
+from .span_processor import (
+    BatchSpanProcessor,
+    DEFAULT_MAX_QUEUE_SIZE,
+    DEFAULT_MAX_EXPORT_BATCH_SIZE,
+    DEFAULT_SCHEDULE_DELAY_SECONDS,
+    DEFAULT_SLOW_SPAN_THRESHOLD_MS
+)
 from ...config import get_config
 from ...constants import DEFAULT_MAX_RETRY_ATTEMPTS
 
@@ -52,11 +59,19 @@ logger = get_logger(__name__)
 TRACING_ENABLED_CONFIG_KEY = "monitoring.tracing.enabled"
 TRACING_EXPORTER_CONFIG_KEY = "monitoring.tracing.exporter"
 TRACING_SAMPLING_RATE_CONFIG_KEY = "monitoring.tracing.sampling_rate"
+TRACING_BATCH_EXPORT_CONFIG_KEY = "monitoring.tracing.batch_export"
+TRACING_TAIL_SAMPLING_CONFIG_KEY = "monitoring.tracing.tail_sampling_enabled"
+TRACING_SLOW_SPAN_THRESHOLD_CONFIG_KEY = "monitoring.tracing.slow_span_threshold_ms"
+TRACING_MAX_QUEUE_SIZE_CONFIG_KEY = "monitoring.tracing.max_queue_size"
+TRACING_MAX_EXPORT_BATCH_SIZE_CONFIG_KEY = "monitoring.tracing.max_export_batch_size"
+TRACING_SCHEDULE_DELAY_CONFIG_KEY = "monitoring.tracing.schedule_delay_seconds"
 
 # Default values
 DEFAULT_TRACING_ENABLED = True
 DEFAULT_TRACING_EXPORTER = "cloud_trace"
 DEFAULT_SAMPLING_RATE = 0.1
+DEFAULT_BATCH_EXPORT = True
+DEFAULT_TAIL_SAMPLING_ENABLED = True
 
 # Standard trace header name for GCP
 TRACE_HEADER_NAME = "X-Cloud-Trace-Context"
@@ -85,7 +100,13 @@ def get_tracing_config() -> Dict[str, Any]:
     return {
         "enabled": enabled,
         "exporter": exporter,
-        "sampling_rate": sampling_rate
+        "sampling_rate": sampling_rate,
+        "batch_export": config.get(TRACING_BATCH_EXPORT_CONFIG_KEY, DEFAULT_BATCH_EXPORT),
+        "tail_sampling_enabled": config.get(TRACING_TAIL_SAMPLING_CONFIG_KEY, DEFAULT_TAIL_SAMPLING_ENABLED),
+        "slow_span_threshold_ms": float(config.get(TRACING_SLOW_SPAN_THRESHOLD_CONFIG_KEY, DEFAULT_SLOW_SPAN_THRESHOLD_MS)),
+        "max_queue_size": int(config.get(TRACING_MAX_QUEUE_SIZE_CONFIG_KEY, DEFAULT_MAX_QUEUE_SIZE)),
+        "max_export_batch_size": int(config.get(TRACING_MAX_EXPORT_BATCH_SIZE_CONFIG_KEY, DEFAULT_MAX_EXPORT_BATCH_SIZE)),
+        "schedule_delay_seconds": float(config.get(TRACING_SCHEDULE_DELAY_CONFIG_KEY, DEFAULT_SCHEDULE_DELAY_SECONDS))
     }
 
 
@@ -253,13 +274,19 @@ class TraceClient:
         credentials = get_default_credentials()
         self._client = TraceServiceClient(credentials=credentials)
         
+        # Export ended spans in batches on a background thread unless disabled
+        self._span_processor = None
+        if self._config.get("batch_export", DEFAULT_BATCH_EXPORT):
+            self._span_processor = BatchSpanProcessor(self.export_spans, self._config)
+        
         logger.info(f"Initialized TraceClient for project {self._project_id}")
     
     @retry(max_attempts=DEFAULT_MAX_RETRY_ATTEMPTS)
     def create_span(self, name: str, trace_id: Optional[str] = None, 
                     parent_span_id: Optional[str] = None, 
                     attributes: Optional[Dict[str, Any]] = None,
-                    start_time: Optional[datetime.datetime] = None) -> 'Span':
+                    start_time: Optional[datetime.datetime] = None,
+                    remote_parent: bool = False) -> 'Span':
         """Creates a new span in a trace.
         
         Args:
@@ -268,6 +295,7 @@ class TraceClient:
             parent_span_id: Parent span ID (optional)
             attributes: Span attributes (optional)
             start_time: Span start time (optional, defaults to current time)
+            remote_parent: Whether the parent span belongs to another process
             
         Returns:
             New Span instance
@@ -287,19 +315,22 @@ class TraceClient:
             parent_span_id=parent_span_id,
             attributes=attributes,
             start_time=start_time,
-            trace_client=self
+            trace_client=self,
+            remote_parent=remote_parent
         )
     
-    @retry(max_attempts=DEFAULT_MAX_RETRY_ATTEMPTS)
     def end_span(self, span: 'Span', end_time: Optional[datetime.datetime] = None) -> bool:
-        """Ends a span and sends it to Cloud Trace.
+        """Ends a span and hands it to the exporter.
+        
+        With batch export enabled the span is sampled and queued for the background
+        exporter; otherwise it is written to Cloud Trace synchronously.
         
         Args:
             span: The span to end
             end_time: End time for the span (optional, defaults to current time)
             
         Returns:
-            True if the span was successfully sent to Cloud Trace, False otherwise
+            True if the span was queued or successfully sent to Cloud Trace, False otherwise
         """
         # Set end time on the span if provided
         if end_time:
@@ -307,22 +338,72 @@ class TraceClient:
         elif not span.end_time:
             span.end_time = datetime.datetime.utcnow()
         
-        # Create a Trace protobuf with the span
-        span_proto = span.to_proto()
-        trace_proto = Trace(spans=[span_proto])
+        # Queue the span for sampling and batched export
+        if self._span_processor is not None:
+            self._span_processor.on_end(span)
+            return True
         
         try:
-            # Call Trace API to batch write the span
-            self._client.batch_write_spans(
-                name=self._project_name,
-                spans=[span_proto]
-            )
-            logger.debug(f"Successfully sent span '{span.name}' to Cloud Trace")
-            return True
+            return self.export_spans([span])
         except Exception as e:
             logger.error(f"Failed to send span to Cloud Trace: {str(e)}")
             return False
     
+    @retry(max_attempts=DEFAULT_MAX_RETRY_ATTEMPTS)
+    def export_spans(self, spans: List['Span']) -> bool:
+        """Writes a batch of spans to Cloud Trace in a single API call.
+        
+        Args:
+            spans: Ended spans to write
+            
+        Returns:
+            True if the spans were written
+        """
+        if not spans:
+            return True
+        
+        # Call Trace API to batch write the spans
+        self._client.batch_write_spans(
+            name=self._project_name,
+            spans=[span.to_proto() for span in spans]
+        )
+        logger.debug(f"Successfully sent {len(spans)} spans to Cloud Trace")
+        return True
+    
+    def is_sampled(self, trace_id: str) -> bool:
+        """Returns the head sampling decision for a trace.
+        
+        Args:
+            trace_id: Trace ID
+            
+        Returns:
+            True if every span of the trace is exported regardless of outcome
+        """
+        if self._span_processor is None:
+            return True
+        return self._span_processor.is_sampled(trace_id)
+    
+    def flush(self) -> bool:
+        """Exports all queued spans immediately.
+        
+        Returns:
+            True if all queued spans were exported
+        """
+        if self._span_processor is None:
+            return True
+        return self._span_processor.force_flush()
+    
+    def shutdown(self) -> None:
+        """Flushes queued spans and stops the background exporter."""
+        if self._span_processor is not None:
+            self._span_processor.shutdown()
+    
+    def get_export_stats(self) -> Dict[str, int]:
+        """Returns sampling and export statistics (empty without batch export)."""
+        if self._span_processor is None:
+            return {}
+        return self._span_processor.get_stats()
+    
     def create_trace(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> 'Span':
         """Creates a new trace with an initial root span.
         
@@ -347,7 +428,7 @@ class TraceClient:
         setattr(_thread_local, 'trace_context', {
             'trace_id': trace_id,
             'span_id': root_span.span_id,
-            'trace_options': '1'  # Set sampling bit to 1
+            'trace_options': '1' if self.is_sampled(trace_id) else '0'  # Propagate the head sampling decision
         })
         
         return root_span
@@ -485,7 +566,8 @@ class Span:
                 parent_span_id: Optional[str] = None,
                 attributes: Optional[Dict[str, Any]] = None,
                 start_time: Optional[datetime.datetime] = None,
-                trace_client: Optional[TraceClient] = None):
+                trace_client: Optional[TraceClient] = None,
+                remote_parent: bool = False):
         """Initializes a new Span instance.
         
         Args:
@@ -496,11 +578,14 @@ class Span:
             attributes: Dictionary of span attributes (optional)
             start_time: Start time of the span (optional, defaults to current time)
             trace_client: TraceClient for sending the span (optional)
+            remote_parent: Whether the parent span belongs to another process, making
+                this span the local root of the trace
         """
         self.name = name
         self.trace_id = trace_id
         self.span_id = span_id
         self.parent_span_id = parent_span_id
+        self.remote_parent = remote_parent
         self.attributes = attributes or {}
         self.start_time = start_time or datetime.datetime.utcnow()
         self.end_time = None
@@ -667,6 +752,10 @@ class TraceContext:
                 attributes: Optional[Dict[str, Any]] = None):
         """Initializes the trace context manager.
         
+        A trace ID and parent span ID passed explicitly continue a trace from another
+        process, such as one extracted with parse_trace_context, so the new span is
+        the local root of that trace.
+        
         Args:
             name: Name for the span (typically the operation name)
             trace_id: Trace ID (optional, will use current trace context or create new)
@@ -683,6 +772,7 @@ class TraceContext:
         self._previous_context = extract_current_trace_data()
         
         # Determine trace ID and parent span ID
+        remote_parent = bool(trace_id and parent_span_id)
         if not trace_id:
             # Try to get trace ID from current context
             current_context = self._previous_context
@@ -701,7 +791,8 @@ class TraceContext:
                 name=name,
                 trace_id=trace_id,
                 parent_span_id=parent_span_id,
-                attributes=attributes
+                attributes=attributes,
+                remote_parent=remote_parent
             )
     
     def __enter__(self) -> Span:
@@ -717,7 +808,7 @@ class TraceContext:
         setattr(_thread_local, 'trace_context', {
             'trace_id': self._span.trace_id,
             'span_id': self._span.span_id,
-            'trace_options': '1'  # Set sampling bit to 1
+            'trace_options': '1' if _trace_client.is_sampled(self._span.trace_id) else '0'  # Propagate the head sampling decision
         })
         
         # Set correlation ID from trace ID for logging integration
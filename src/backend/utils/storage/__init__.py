@@ -13,6 +13,29 @@ from .bigquery_client import (
     format_query_parameters,
     get_table_schema,
     format_table_reference,
+    create_bigquery_client,
+    get_bigquery_client,
+)
+
+# Embedded DuckDB stand-in for BigQuery used in local development and tests
+from .local_query_engine import LocalBigQueryClient
+
+# Read-through result cache for repository aggregation queries
+from .query_cache import QueryResultCache, get_query_cache
+
+# Micro-batching buffer for repository streaming inserts
+from .write_buffer import WriteBuffer, get_write_buffer, flush_write_buffers
+
+# Atomic JSON writes for in-process state checkpoints
+from .atomic_file import write_json_atomic
+
+# Cursor (keyset) pagination helpers for repository list queries
+from .keyset_pagination import (
+    encode_cursor,
+    decode_cursor,
+    build_keyset_condition,
+    build_keyset_order_by,
+    get_next_cursor,
 )
 
 # Google Cloud Storage client and utilities
@@ -20,14 +43,26 @@ from .gcs_client import (
     GCSClient,
     map_gcs_exception_to_pipeline_error,
     get_content_type,
+    GCSRangeReader,
+    create_gcs_client,
+    get_gcs_client,
 )
 
+# Local-filesystem stand-in for Cloud Storage used in local development and tests
+from .local_gcs import LocalStorageClient
+
 # Firestore client and utilities
 from .firestore_client import (
     FirestoreClient,
+    FirestoreBulkWriter,
     map_firestore_exception_to_pipeline_error,
+    create_firestore_client,
+    get_firestore_client,
 )
 
+# In-process Firestore stand-in used in local development and tests
+from .local_firestore import LocalFirestoreClient
+
 # Define exports for wildcard imports
 __all__ = [
     "BigQueryClient",
@@ -35,9 +70,31 @@ __all__ = [
     "format_query_parameters",
     "get_table_schema", 
     "format_table_reference",
+    "create_bigquery_client",
+    "get_bigquery_client",
+    "LocalBigQueryClient",
+    "QueryResultCache",
+    "get_query_cache",
+    "WriteBuffer",
+    "get_write_buffer",
+    "flush_write_buffers",
+    "write_json_atomic",
+    "encode_cursor",
+    "decode_cursor",
+    "build_keyset_condition",
+    "build_keyset_order_by",
+    "get_next_cursor",
     "GCSClient",
     "map_gcs_exception_to_pipeline_error",
     "get_content_type",
+    "GCSRangeReader",
+    "create_gcs_client",
+    "get_gcs_client",
+    "LocalStorageClient",
     "FirestoreClient",
+    "FirestoreBulkWriter",
     "map_firestore_exception_to_pipeline_error",
+    "create_firestore_client",
+    "get_firestore_client",
+    "LocalFirestoreClient",
 ]
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Atomic local file writes for in-process state checkpoints.
+
+Checkpoints are written to a temporary file in the destination directory and moved
+into place with os.replace, so readers and restarts see either the previous file or
+the complete new one, never a partially written file.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def write_json_atomic(path: str, data: Any, prefix: str = '.tmp.') -> None:
+    """
+    Atomically writes compact JSON to a file, creating its directory if needed.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+        prefix: Prefix of the temporary file created next to the destination
+
+    Raises:
+        OSError: If the file cannot be written; the temporary file is removed
+        TypeError: If the data is not JSON-serializable; the temporary file is removed
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=prefix)
+    try:
+        with os.fdopen(descriptor, 'w') as handle:
+            json.dump(data, handle, separators=(',', ':'))
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
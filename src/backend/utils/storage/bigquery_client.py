@@ -0,0 +1,1012 @@
+"""
+BigQuery client for the self-healing data pipeline.
+
+Wraps the Google Cloud BigQuery client with retry handling, error mapping and typed
+query parameters. Result sets are streamed as Arrow record batches so callers never
+have to materialize large row lists:
+- Query results are downloaded over the BigQuery Storage Read API using parallel
+  streams when the storage client library is installed, and over paginated REST otherwise.
+- Whole-table reads open a Storage Read session with column projection and row filters
+  pushed down, and read its streams in parallel worker threads.
+
+One underlying client (and HTTP connection pool) is shared per project and location
+through create_bigquery_client. Setting bigquery.backend to "local" in the configuration
+swaps in an embedded DuckDB engine with the same interface, so repositories and
+benchmarks can run without network access.
+"""
+
+import datetime
+import decimal
+import queue
+import threading
+import typing
+
+from google.cloud import bigquery  # version 3.11.0+
+from google.api_core.exceptions import (  # version 2.10.0+
+    GoogleAPICallError,
+    NotFound,
+    Forbidden,
+    BadRequest,
+    ServiceUnavailable,
+    DeadlineExceeded,
+    TooManyRequests,
+    InternalServerError
+)
+
+from ...constants import FileFormat
+from ...config import get_config
+from ..auth.gcp_auth import get_project_id
+from ..logging.logger import get_logger
+from ..retry.retry_decorator import retry
+from ..errors.error_types import (
+    PipelineError,
+    ResourceError,
+    ConnectionError,
+    ErrorCategory,
+    ErrorRecoverability
+)
+
+try:
+    from google.cloud import bigquery_storage  # version 2.22.0+
+except ImportError:  # pragma: no cover - optional dependency
+    bigquery_storage = None
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Configuration keys
+BIGQUERY_LOCATION_CONFIG_KEY = "bigquery.location"
+BIGQUERY_TIMEOUT_CONFIG_KEY = "bigquery.query_timeout_seconds"
+BIGQUERY_BACKEND_CONFIG_KEY = "bigquery.backend"
+BIGQUERY_MAX_READ_STREAMS_CONFIG_KEY = "bigquery.max_read_streams"
+BIGQUERY_HTTP_POOL_SIZE_CONFIG_KEY = "bigquery.http_pool_size"
+
+# Default settings
+DEFAULT_LOCATION = "US"
+DEFAULT_QUERY_TIMEOUT_SECONDS = 300
+DEFAULT_MAX_READ_STREAMS = 4
+DEFAULT_HTTP_POOL_SIZE = 32
+DEFAULT_READ_QUEUE_SIZE = 8
+
+# Query backends
+BACKEND_BIGQUERY = "bigquery"
+BACKEND_LOCAL = "local"
+
+# BigQuery errors that are worth retrying
+RETRYABLE_EXCEPTIONS = (ServiceUnavailable, DeadlineExceeded, TooManyRequests, InternalServerError)
+
+# Shared clients keyed by (backend, project, location)
+_shared_clients: typing.Dict[tuple, typing.Any] = {}
+_shared_clients_lock = threading.Lock()
+
+# Sentinel marking the end of one Storage Read stream
+_STREAM_DONE = object()
+
+
+class QueryParameter:
+    """A typed query parameter that converts to the BigQuery client representation"""
+
+    def __init__(self, name: str, parameter_type: str, value: typing.Any, array_type: str = None):
+        """Initializes a typed query parameter
+
+        Args:
+            name: Parameter name, referenced as @name in SQL
+            parameter_type: BigQuery type (STRING, INT64, FLOAT64, NUMERIC, BOOL, DATE, DATETIME, TIMESTAMP, BYTES, ARRAY)
+            value: Parameter value, a list for ARRAY parameters
+            array_type: Element type for ARRAY parameters
+        """
+        self.name = name
+        self.parameter_type = parameter_type
+        self.value = value
+        self.array_type = array_type
+
+    @property
+    def string_value(self) -> typing.Optional[str]:
+        """Value in the string form BigQuery uses for the parameter"""
+        if self.value is None or self.parameter_type == "ARRAY":
+            return None
+        if isinstance(self.value, (datetime.datetime, datetime.date)):
+            return self.value.isoformat()
+        if isinstance(self.value, bool):
+            return "true" if self.value else "false"
+        return str(self.value)
+
+    @property
+    def numeric_value(self) -> typing.Optional[typing.Union[int, float, decimal.Decimal]]:
+        """Value for numeric parameters"""
+        if self.parameter_type in ("INT64", "FLOAT64", "NUMERIC"):
+            return self.value
+        return None
+
+    @property
+    def bool_value(self) -> typing.Optional[bool]:
+        """Value for boolean parameters"""
+        return self.value if self.parameter_type == "BOOL" else None
+
+    @property
+    def array_value(self) -> typing.Optional[typing.List["QueryParameter"]]:
+        """Element parameters for array parameters"""
+        if self.parameter_type != "ARRAY":
+            return None
+        return [QueryParameter(self.name, self.array_type, item) for item in self.value or []]
+
+    def to_bigquery(self) -> typing.Union[bigquery.ScalarQueryParameter, bigquery.ArrayQueryParameter]:
+        """Converts to a BigQuery client query parameter
+
+        Returns:
+            Scalar or array query parameter
+        """
+        if self.parameter_type == "ARRAY":
+            return bigquery.ArrayQueryParameter(self.name, self.array_type, list(self.value or []))
+        return bigquery.ScalarQueryParameter(self.name, self.parameter_type, self.value)
+
+    @classmethod
+    def from_value(cls, name: str, value: typing.Any) -> "QueryParameter":
+        """Creates a parameter with its type inferred from the Python value
+
+        Args:
+            name: Parameter name
+            value: Parameter value
+
+        Returns:
+            Typed query parameter
+        """
+        if isinstance(value, QueryParameter):
+            return value
+        if isinstance(value, (list, tuple, set)):
+            items = list(value)
+            array_type = infer_parameter_type(items[0]) if items else "STRING"
+            return cls(name, "ARRAY", items, array_type)
+        return cls(name, infer_parameter_type(value), value)
+
+    @classmethod
+    def from_api_repr(cls, resource: dict) -> "QueryParameter":
+        """Creates a parameter from the REST representation used by the repositories
+
+        Args:
+            resource: Dictionary with name, parameterType and parameterValue
+
+        Returns:
+            Typed query parameter
+        """
+        parameter_type = resource.get("parameterType", {})
+        parameter_value = resource.get("parameterValue", {})
+        type_name = parameter_type.get("type", "STRING")
+        if type_name == "ARRAY":
+            element_type = parameter_type.get("arrayType", {}).get("type", "STRING")
+            values = [_api_repr_value(item) for item in parameter_value.get("arrayValues", [])]
+            return cls(resource.get("name"), "ARRAY", values, element_type)
+        return cls(resource.get("name"), type_name, _api_repr_value(parameter_value))
+
+    def __eq__(self, other):
+        return (isinstance(other, QueryParameter) and self.name == other.name and
+                self.parameter_type == other.parameter_type and self.value == other.value and
+                self.array_type == other.array_type)
+
+    def __repr__(self):
+        return f"QueryParameter({self.name!r}, {self.parameter_type!r}, {self.value!r})"
+
+
+def _api_repr_value(parameter_value: dict) -> typing.Any:
+    """Reads a scalar from a REST parameter value, which carries it as value or stringValue"""
+    if "value" in parameter_value:
+        return parameter_value["value"]
+    return parameter_value.get("stringValue")
+
+
+def infer_parameter_type(value: typing.Any) -> str:
+    """Infers the BigQuery type of a Python value
+
+    Args:
+        value: Python value
+
+    Returns:
+        BigQuery type name
+    """
+    # bool must be checked before int because bool is a subclass of int
+    if isinstance(value, bool):
+        return "BOOL"
+    if isinstance(value, int):
+        return "INT64"
+    if isinstance(value, float):
+        return "FLOAT64"
+    if isinstance(value, decimal.Decimal):
+        return "NUMERIC"
+    if isinstance(value, datetime.datetime):
+        return "TIMESTAMP" if value.tzinfo is not None else "DATETIME"
+    if isinstance(value, datetime.date):
+        return "DATE"
+    if isinstance(value, bytes):
+        return "BYTES"
+    return "STRING"
+
+
+def format_query_parameters(parameters: dict) -> typing.Dict[str, QueryParameter]:
+    """Converts a dictionary of Python values into typed query parameters
+
+    Args:
+        parameters: Mapping of parameter names to values
+
+    Returns:
+        Mapping of parameter names to typed query parameters
+    """
+    return {name: QueryParameter.from_value(name, value) for name, value in (parameters or {}).items()}
+
+
+def normalize_query_parameters(parameters: typing.Any) -> typing.Dict[str, QueryParameter]:
+    """Normalizes every supported parameter format into typed query parameters
+
+    Supports a mapping of names to values, and lists of REST-style parameter dictionaries
+    or BigQuery client parameter objects.
+
+    Args:
+        parameters: Query parameters in any supported format
+
+    Returns:
+        Mapping of parameter names to typed query parameters
+    """
+    if not parameters:
+        return {}
+    if isinstance(parameters, dict):
+        return format_query_parameters(parameters)
+
+    normalized = {}
+    for parameter in parameters:
+        if isinstance(parameter, QueryParameter):
+            typed = parameter
+        elif isinstance(parameter, dict):
+            typed = QueryParameter.from_api_repr(parameter)
+        else:
+            typed = QueryParameter.from_api_repr(parameter.to_api_repr())
+        normalized[typed.name] = typed
+    return normalized
+
+
+def get_table_schema(schema: typing.List[typing.Any]) -> typing.List[bigquery.SchemaField]:
+    """Converts schema definitions into BigQuery SchemaField objects
+
+    Args:
+        schema: List of field dictionaries (name, type, mode, description, fields) or SchemaFields
+
+    Returns:
+        List of SchemaField objects
+    """
+    fields = []
+    for field in schema or []:
+        if isinstance(field, bigquery.SchemaField):
+            fields.append(field)
+            continue
+        fields.append(bigquery.SchemaField(
+            field["name"],
+            field.get("type", "STRING"),
+            mode=field.get("mode", "NULLABLE"),
+            description=field.get("description"),
+            fields=get_table_schema(field.get("fields", []))
+        ))
+    return fields
+
+
+def format_table_reference(project: str, dataset: str, table: str) -> str:
+    """Formats a fully qualified table reference
+
+    Args:
+        project: Project ID
+        dataset: Dataset ID
+        table: Table ID
+
+    Returns:
+        Table reference in project.dataset.table form
+    """
+    return f"{project}.{dataset}.{table}"
+
+
+def resolve_table_reference(default_project: str, *parts: str) -> str:
+    """Resolves table reference parts into a fully qualified reference
+
+    Accepts (table_ref), (dataset, table) or (project, dataset, table), where a single
+    table_ref may itself be dataset.table or project.dataset.table.
+
+    Args:
+        default_project: Project used when the parts do not name one
+        parts: Table reference parts
+
+    Returns:
+        Table reference in project.dataset.table form
+    """
+    segments = []
+    for part in parts:
+        segments.extend(str(part).strip("`").split("."))
+    if len(segments) == 2:
+        segments.insert(0, default_project)
+    if len(segments) != 3:
+        raise ValueError(f"Invalid table reference: {'.'.join(segments)}")
+    return format_table_reference(*segments)
+
+
+def map_bigquery_exception_to_pipeline_error(exception: Exception, resource_name: str = None) -> PipelineError:
+    """Maps a BigQuery API exception to the pipeline error hierarchy
+
+    Args:
+        exception: Exception raised by the BigQuery client
+        resource_name: Table, dataset or job the operation targeted
+
+    Returns:
+        PipelineError subclass describing the failure
+    """
+    message = f"BigQuery operation failed: {str(exception)}"
+    context = {"resource_name": resource_name, "original_error": exception.__class__.__name__}
+
+    if isinstance(exception, NotFound):
+        error = ResourceError(message, resource_type="bigquery", resource_name=resource_name,
+                              resource_details={"error": str(exception)}, retryable=False)
+    elif isinstance(exception, RETRYABLE_EXCEPTIONS):
+        error = ConnectionError(message, service_name="bigquery",
+                                connection_details={"error": str(exception)}, retryable=True)
+    elif isinstance(exception, Forbidden):
+        error = PipelineError(message, category=ErrorCategory.AUTHORIZATION_ERROR,
+                              recoverability=ErrorRecoverability.MANUAL_RECOVERABLE, retryable=False)
+    elif isinstance(exception, BadRequest):
+        error = PipelineError(message, category=ErrorCategory.VALIDATION_ERROR,
+                              recoverability=ErrorRecoverability.MANUAL_RECOVERABLE, retryable=False)
+    else:
+        error = PipelineError(message, category=ErrorCategory.UNKNOWN, retryable=False)
+
+    error.add_context(context)
+    return error
+
+
+class BigQueryJobConfig(bigquery.QueryJobConfig):
+    """Query job configuration that accepts typed or plain-value query parameters"""
+
+    @property
+    def query_parameters(self):
+        """Query parameters as they were set, or as BigQuery client parameters"""
+        typed = getattr(self, "_typed_query_parameters", None)
+        if typed is not None:
+            return typed
+        return bigquery.QueryJobConfig.query_parameters.fget(self)
+
+    @query_parameters.setter
+    def query_parameters(self, values):
+        self._typed_query_parameters = values
+        if isinstance(values, dict):
+            converted = [QueryParameter.from_value(name, value).to_bigquery() for name, value in values.items()]
+        else:
+            converted = [value.to_bigquery() if isinstance(value, QueryParameter) else value for value in values or []]
+        bigquery.QueryJobConfig.query_parameters.fset(self, converted)
+
+
+class BigQueryClient:
+    """Client for BigQuery queries, streaming reads and data loading"""
+
+    def __init__(self, project_id: str = None, location: str = None, client: bigquery.Client = None):
+        """Initializes the BigQuery client
+
+        Args:
+            project_id: GCP project ID (defaults to the detected project)
+            location: BigQuery location (defaults to the configured location)
+            client: Existing BigQuery client to share instead of creating one
+        """
+        config = get_config()
+        self._project_id = project_id or get_project_id()
+        self._location = location or config.get(BIGQUERY_LOCATION_CONFIG_KEY) or config.get("location") or DEFAULT_LOCATION
+        self._query_timeout = config.get(BIGQUERY_TIMEOUT_CONFIG_KEY) or DEFAULT_QUERY_TIMEOUT_SECONDS
+        self._max_read_streams = int(config.get(BIGQUERY_MAX_READ_STREAMS_CONFIG_KEY) or DEFAULT_MAX_READ_STREAMS)
+
+        self._client = client or bigquery.Client(project=self._project_id, location=self._location)
+        self._configure_http_pool(int(config.get(BIGQUERY_HTTP_POOL_SIZE_CONFIG_KEY) or DEFAULT_HTTP_POOL_SIZE))
+
+        self._bqstorage_client = None
+        self._bqstorage_unavailable = False
+        self._bqstorage_lock = threading.Lock()
+
+        logger.info(f"Initialized BigQuery client for project {self._project_id} in {self._location}")
+
+    @property
+    def project_id(self) -> str:
+        """GCP project ID used for queries and table references"""
+        return self._project_id
+
+    @property
+    def project(self) -> str:
+        """Alias of project_id matching the BigQuery client"""
+        return self._project_id
+
+    @property
+    def location(self) -> str:
+        """BigQuery location"""
+        return self._location
+
+    @property
+    def client(self) -> bigquery.Client:
+        """Underlying BigQuery client"""
+        return self._client
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def execute_query(self, query: str, parameters: typing.Any = None, timeout: int = None,
+                      job_config: bigquery.QueryJobConfig = None) -> bigquery.table.RowIterator:
+        """Executes a query and waits for its results
+
+        Args:
+            query: SQL query using @name placeholders for parameters
+            parameters: Query parameters as a name-to-value mapping or list of parameter definitions
+            timeout: Seconds to wait for the query to finish
+            job_config: Optional job configuration
+
+        Returns:
+            Row iterator over the query results
+        """
+        if parameters:
+            job_config = job_config or BigQueryJobConfig()
+            typed = normalize_query_parameters(parameters)
+            if not isinstance(job_config, BigQueryJobConfig):
+                job_config.query_parameters = [parameter.to_bigquery() for parameter in typed.values()]
+            elif isinstance(parameters, dict):
+                job_config.query_parameters = typed
+            else:
+                job_config.query_parameters = list(typed.values())
+
+        try:
+            if job_config is not None:
+                query_job = self._client.query(query, job_config)
+            else:
+                query_job = self._client.query(query)
+            return query_job.result(timeout=timeout or self._query_timeout)
+        except GoogleAPICallError as e:
+            logger.error(f"BigQuery query failed: {str(e)}")
+            raise map_bigquery_exception_to_pipeline_error(e, "query") from e
+
+    def query(self, query: str, parameters: typing.Any = None, timeout: int = None) -> typing.List[dict]:
+        """Executes a query and returns its rows as dictionaries
+
+        Intended for small results; use iter_query or iter_query_batches for large ones.
+
+        Args:
+            query: SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Seconds to wait for the query to finish
+
+        Returns:
+            List of rows as dictionaries
+        """
+        rows = self.execute_query(query, timeout=timeout, parameters=parameters)
+        return [dict(row.items()) for row in rows]
+
+    def iter_query_batches(self, query: str, parameters: typing.Any = None, timeout: int = None,
+                           max_streams: int = None) -> typing.Iterator[typing.Any]:
+        """Executes a query and streams its results as Arrow record batches
+
+        Args:
+            query: SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Seconds to wait for the query to finish
+            max_streams: Maximum number of parallel Storage Read streams
+
+        Returns:
+            Iterator of pyarrow.RecordBatch objects
+        """
+        rows = self.execute_query(query, timeout=timeout, parameters=parameters)
+        streams = max_streams or self._max_read_streams
+        return rows.to_arrow_iterable(
+            bqstorage_client=self._get_bqstorage_client(),
+            max_queue_size=streams * 2,
+            max_stream_count=streams
+        )
+
+    def iter_query(self, query: str, parameters: typing.Any = None, timeout: int = None) -> typing.Iterator[dict]:
+        """Executes a query and streams its rows as dictionaries, one batch in memory at a time
+
+        Args:
+            query: SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Seconds to wait for the query to finish
+
+        Returns:
+            Iterator of rows as dictionaries
+        """
+        for batch in self.iter_query_batches(query, parameters=parameters, timeout=timeout):
+            yield from batch.to_pylist()
+
+    def query_to_arrow(self, query: str, parameters: typing.Any = None, timeout: int = None) -> typing.Any:
+        """Executes a query and returns its results as an Arrow table
+
+        Args:
+            query: SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Seconds to wait for the query to finish
+
+        Returns:
+            pyarrow.Table with the query results
+        """
+        rows = self.execute_query(query, timeout=timeout, parameters=parameters)
+        return rows.to_arrow(bqstorage_client=self._get_bqstorage_client())
+
+    def execute_query_to_dataframe(self, query: str, parameters: typing.Any = None, timeout: int = None,
+                                   job_config: bigquery.QueryJobConfig = None) -> typing.Any:
+        """Executes a query and returns its results as a pandas DataFrame
+
+        Args:
+            query: SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Seconds to wait for the query to finish
+            job_config: Optional job configuration
+
+        Returns:
+            pandas.DataFrame with the query results
+        """
+        results = self.execute_query(query=query, timeout=timeout, job_config=job_config, parameters=parameters)
+        return results.to_dataframe(bqstorage_client=self._get_bqstorage_client())
+
+    def read_table_batches(self, dataset: str, table: str, columns: typing.List[str] = None, row_filter: str = None,
+                           max_streams: int = None) -> typing.Iterator[typing.Any]:
+        """Reads a table over the Storage Read API with projection and filter pushdown
+
+        Streams of the read session are consumed in parallel worker threads feeding a
+        bounded queue, so memory stays flat regardless of table size.
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            columns: Columns to read (all columns when omitted)
+            row_filter: SQL boolean expression applied server-side, e.g. "status = 'FAILED'"
+            max_streams: Maximum number of parallel streams
+
+        Returns:
+            Iterator of pyarrow.RecordBatch objects
+        """
+        bqstorage_client = self._get_bqstorage_client()
+        if bqstorage_client is None:
+            # Fall back to a query when the Storage Read API client is not installed
+            column_list = ", ".join(f"`{column}`" for column in columns) if columns else "*"
+            where_clause = f" WHERE {row_filter}" if row_filter else ""
+            query = f"SELECT {column_list} FROM `{resolve_table_reference(self._project_id, dataset, table)}`{where_clause}"
+            yield from self.iter_query_batches(query)
+            return
+
+        project, dataset_id, table_id = resolve_table_reference(self._project_id, dataset, table).split(".")
+        read_options = bigquery_storage.types.ReadSession.TableReadOptions(
+            selected_fields=columns or [],
+            row_restriction=row_filter or ""
+        )
+        requested_session = bigquery_storage.types.ReadSession(
+            table=f"projects/{project}/datasets/{dataset_id}/tables/{table_id}",
+            data_format=bigquery_storage.types.DataFormat.ARROW,
+            read_options=read_options
+        )
+
+        try:
+            session = bqstorage_client.create_read_session(
+                parent=f"projects/{self._project_id}",
+                read_session=requested_session,
+                max_stream_count=max_streams or self._max_read_streams
+            )
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, f"{dataset_id}.{table_id}") from e
+
+        if not session.streams:
+            return
+        yield from self._read_streams_in_parallel(bqstorage_client, session)
+
+    def insert_rows(self, *args, row_ids: typing.List[str] = None,
+                    return_errors: bool = False) -> typing.Union[bool, typing.List[dict]]:
+        """Streams rows into a table
+
+        Accepts (table_ref, rows), (dataset, table, rows) or (project, dataset, table, rows).
+
+        Args:
+            args: Table reference parts followed by the list of row dictionaries
+            row_ids: Optional insert IDs, one per row, used by BigQuery to deduplicate retries
+            return_errors: Return the per-row errors instead of a success flag
+
+        Returns:
+            True if every row was inserted, or with return_errors the list of
+            {"index": ..., "errors": [...]} entries for rows that were not inserted
+        """
+        if len(args) < 2:
+            raise ValueError("insert_rows requires a table reference and a list of rows")
+        rows = args[-1]
+        table_ref = resolve_table_reference(self._project_id, *args[:-1])
+        if not rows:
+            return [] if return_errors else True
+
+        try:
+            errors = self._client.insert_rows_json(
+                table_ref,
+                [_to_json_row(row) for row in rows],
+                row_ids=row_ids
+            )
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, table_ref) from e
+
+        if errors:
+            logger.error(f"Failed to insert {len(errors)} of {len(rows)} rows into {table_ref}: {errors[:5]}")
+            return list(errors) if return_errors else False
+        logger.debug(f"Inserted {len(rows)} rows into {table_ref}")
+        return [] if return_errors else True
+
+    def update_rows(self, dataset: str, table: str, rows: typing.List[dict], key_column: str) -> bool:
+        """Updates existing rows by key with a single MERGE from a staging table
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            rows: Rows with updated values, including the key column
+            key_column: Column identifying the rows to update
+
+        Returns:
+            True if the update succeeded
+        """
+        if not rows:
+            return True
+
+        table_ref = resolve_table_reference(self._project_id, dataset, table)
+        staging_ref = f"{table_ref}_staging_{threading.get_ident()}_{int(datetime.datetime.now().timestamp() * 1000)}"
+        try:
+            target = self._client.get_table(table_ref)
+            load_config = bigquery.LoadJobConfig(schema=target.schema,
+                                                 write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE)
+            self._client.load_table_from_json([_to_json_row(row) for row in rows], staging_ref,
+                                              job_config=load_config).result()
+
+            columns = [field.name for field in target.schema if field.name in rows[0] and field.name != key_column]
+            assignments = ", ".join(f"T.`{column}` = S.`{column}`" for column in columns)
+            merge_query = (
+                f"MERGE `{table_ref}` T USING `{staging_ref}` S ON T.`{key_column}` = S.`{key_column}` "
+                f"WHEN MATCHED THEN UPDATE SET {assignments}"
+            )
+            self.execute_query(merge_query)
+            return True
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, table_ref) from e
+        finally:
+            self._client.delete_table(staging_ref, not_found_ok=True)
+
+    def load_table_from_dataframe(self, dataset: str, table: str, dataframe: typing.Any, schema: typing.List = None,
+                                  job_config_args: dict = None, wait_for_completion: bool = True,
+                                  timeout: int = None) -> typing.Any:
+        """Loads a DataFrame (or list of row dictionaries) into a table
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            dataframe: pandas.DataFrame or list of row dictionaries
+            schema: Optional schema definition
+            job_config_args: Additional LoadJobConfig properties
+            wait_for_completion: Whether to wait for the load job to finish
+            timeout: Seconds to wait for the load job
+
+        Returns:
+            Load job result when waiting, otherwise the load job
+        """
+        table_ref = resolve_table_reference(self._project_id, dataset, table)
+        job_config = bigquery.LoadJobConfig(**(job_config_args or {}))
+        if schema:
+            job_config.schema = get_table_schema(schema)
+
+        try:
+            if isinstance(dataframe, list):
+                load_job = self._client.load_table_from_json([_to_json_row(row) for row in dataframe], table_ref,
+                                                             job_config=job_config)
+            else:
+                load_job = self._client.load_table_from_dataframe(dataframe, table_ref, job_config=job_config)
+            if not wait_for_completion:
+                return load_job
+            return load_job.result(timeout=timeout or self._query_timeout)
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, table_ref) from e
+
+    def load_table_from_gcs(self, uri: str, dataset: str, table: str, schema: typing.List = None,
+                            source_format: FileFormat = FileFormat.CSV, write_disposition: str = "WRITE_APPEND",
+                            skip_leading_rows: int = None, timeout: int = None) -> typing.Any:
+        """Loads files from Cloud Storage into a table
+
+        Args:
+            uri: gs:// URI, optionally with wildcards
+            dataset: Dataset ID
+            table: Table ID
+            schema: Optional schema definition (autodetected when omitted)
+            source_format: Format of the source files
+            write_disposition: BigQuery write disposition
+            skip_leading_rows: Header rows to skip for CSV files
+            timeout: Seconds to wait for the load job
+
+        Returns:
+            Load job result
+        """
+        table_ref = resolve_table_reference(self._project_id, dataset, table)
+        format_name = source_format.value if isinstance(source_format, FileFormat) else str(source_format)
+        if format_name == FileFormat.JSON.value:
+            format_name = "NEWLINE_DELIMITED_JSON"
+
+        job_config = bigquery.LoadJobConfig(source_format=format_name, write_disposition=write_disposition)
+        if schema:
+            job_config.schema = get_table_schema(schema)
+        else:
+            job_config.autodetect = True
+        if skip_leading_rows is not None:
+            job_config.skip_leading_rows = skip_leading_rows
+
+        try:
+            load_job = self._client.load_table_from_uri(uri, table_ref, job_config=job_config)
+            return load_job.result(timeout=timeout or self._query_timeout)
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, table_ref) from e
+
+    def create_dataset(self, dataset: str, location: str = None, exists_ok: bool = True) -> typing.Any:
+        """Creates a dataset
+
+        Args:
+            dataset: Dataset ID
+            location: Dataset location (defaults to the client location)
+            exists_ok: Whether an existing dataset is acceptable
+
+        Returns:
+            The created dataset
+        """
+        dataset_obj = bigquery.Dataset(f"{self._project_id}.{dataset}")
+        dataset_obj.location = location or self._location
+        try:
+            return self._client.create_dataset(dataset_obj, exists_ok=exists_ok)
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, dataset) from e
+
+    def dataset_exists(self, dataset: str) -> bool:
+        """Checks whether a dataset exists
+
+        Args:
+            dataset: Dataset ID
+
+        Returns:
+            True if the dataset exists
+        """
+        try:
+            self._client.get_dataset(f"{self._project_id}.{dataset}")
+            return True
+        except NotFound:
+            return False
+
+    def create_table(self, *args, dataset: str = None, table: str = None, schema: typing.List = None,
+                     time_partitioning_field: str = None, clustering_fields: typing.List[str] = None,
+                     description: str = None, exists_ok: bool = False) -> typing.Any:
+        """Creates a table
+
+        Table reference parts may be given positionally, followed by the schema.
+
+        Args:
+            args: Table reference parts, optionally followed by the schema
+            dataset: Dataset ID
+            table: Table ID
+            schema: Schema definition
+            time_partitioning_field: Column to partition the table by day
+            clustering_fields: Columns to cluster the table by
+            description: Table description
+            exists_ok: Whether an existing table is acceptable
+
+        Returns:
+            The created table
+        """
+        parts = list(args)
+        if schema is None and parts and isinstance(parts[-1], list):
+            schema = parts.pop()
+        parts.extend(part for part in (dataset, table) if part)
+        table_ref = resolve_table_reference(self._project_id, *parts)
+
+        table_obj = bigquery.Table(table_ref, schema=get_table_schema(schema) if schema else schema)
+        if time_partitioning_field:
+            table_obj.time_partitioning = bigquery.TimePartitioning(field=time_partitioning_field)
+        if clustering_fields:
+            table_obj.clustering_fields = clustering_fields
+        if description:
+            table_obj.description = description
+
+        try:
+            if exists_ok:
+                return self._client.create_table(table_obj, exists_ok=True)
+            return self._client.create_table(table_obj)
+        except GoogleAPICallError as e:
+            raise map_bigquery_exception_to_pipeline_error(e, table_ref) from e
+
+    def table_exists(self, *args, dataset: str = None, table: str = None) -> bool:
+        """Checks whether a table exists
+
+        Args:
+            args: Table reference parts
+            dataset: Dataset ID
+            table: Table ID
+
+        Returns:
+            True if the table exists
+        """
+        parts = list(args) + [part for part in (dataset, table) if part]
+        try:
+            self._client.get_table(resolve_table_reference(self._project_id, *parts))
+            return True
+        except NotFound:
+            return False
+
+    def get_table(self, *args) -> bigquery.Table:
+        """Gets table metadata
+
+        Args:
+            args: Table reference parts
+
+        Returns:
+            The table; raises NotFound if it does not exist
+        """
+        return self._client.get_table(resolve_table_reference(self._project_id, *args))
+
+    def get_table_rows_count(self, dataset: str, table: str) -> int:
+        """Counts the rows of a table
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+
+        Returns:
+            Number of rows
+        """
+        table_ref = format_table_reference(self._project_id, dataset, table)
+        rows = self.execute_query(f"SELECT COUNT(*) as row_count FROM `{table_ref}`")
+        for row in rows:
+            return row["row_count"]
+        return 0
+
+    def close(self) -> None:
+        """Closes the underlying clients and their connections"""
+        with self._bqstorage_lock:
+            if self._bqstorage_client is not None:
+                transport = getattr(self._bqstorage_client, "_transport", None)
+                if transport is not None and hasattr(transport, "close"):
+                    transport.close()
+                self._bqstorage_client = None
+        self._client.close()
+
+    def _get_bqstorage_client(self) -> typing.Any:
+        """Gets the shared Storage Read API client, creating it on first use
+
+        Returns:
+            BigQueryReadClient, or None if the storage library is not installed
+        """
+        if bigquery_storage is None or self._bqstorage_unavailable:
+            return None
+        if self._bqstorage_client is None:
+            with self._bqstorage_lock:
+                if self._bqstorage_client is None and not self._bqstorage_unavailable:
+                    try:
+                        credentials = getattr(self._client, "_credentials", None)
+                        self._bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+                    except Exception as e:
+                        # Downloads still work over REST, just without parallel streams
+                        logger.warning(f"BigQuery Storage Read API unavailable, using REST downloads: {str(e)}")
+                        self._bqstorage_unavailable = True
+        return self._bqstorage_client
+
+    def _configure_http_pool(self, pool_size: int) -> None:
+        """Sizes the shared HTTP connection pool for concurrent requests
+
+        Args:
+            pool_size: Maximum number of pooled connections per host
+        """
+        http = getattr(self._client, "_http", None)
+        if http is None or not hasattr(http, "mount"):
+            return
+        try:
+            import requests.adapters  # version 2.31.0+
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            http.mount("https://", adapter)
+        except Exception as e:
+            logger.debug(f"Could not resize BigQuery HTTP connection pool: {str(e)}")
+
+    def _read_streams_in_parallel(self, bqstorage_client: typing.Any, session: typing.Any) -> typing.Iterator[typing.Any]:
+        """Reads the streams of a read session in worker threads
+
+        Args:
+            bqstorage_client: Storage Read API client
+            session: Read session with one or more streams
+
+        Returns:
+            Iterator of pyarrow.RecordBatch objects in arrival order
+        """
+        batches = queue.Queue(maxsize=DEFAULT_READ_QUEUE_SIZE * len(session.streams))
+        stop_event = threading.Event()
+
+        def read_stream(stream_name):
+            try:
+                reader = bqstorage_client.read_rows(stream_name)
+                for page in reader.rows(session).pages:
+                    if stop_event.is_set():
+                        return
+                    batches.put(page.to_arrow())
+            except Exception as e:
+                batches.put(e)
+            finally:
+                batches.put(_STREAM_DONE)
+
+        workers = [
+            threading.Thread(target=read_stream, args=(stream.name,), name=f"bq-read-{index}", daemon=True)
+            for index, stream in enumerate(session.streams)
+        ]
+        for worker in workers:
+            worker.start()
+
+        remaining = len(workers)
+        try:
+            while remaining:
+                item = batches.get()
+                if item is _STREAM_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    if isinstance(item, GoogleAPICallError):
+                        raise map_bigquery_exception_to_pipeline_error(item, session.table) from item
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Unblock workers waiting on a full queue when the consumer stops early
+            stop_event.set()
+            while remaining:
+                try:
+                    if batches.get_nowait() is _STREAM_DONE:
+                        remaining -= 1
+                except queue.Empty:
+                    stop_event.wait(0.01)
+
+
+def _to_json_row(row: dict) -> dict:
+    """Converts a row to JSON-compatible values for streaming inserts and JSON loads
+
+    Args:
+        row: Row dictionary
+
+    Returns:
+        Row dictionary with dates, times and decimals as strings
+    """
+    converted = {}
+    for key, value in row.items():
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            converted[key] = value.isoformat()
+        elif isinstance(value, decimal.Decimal):
+            converted[key] = str(value)
+        elif isinstance(value, bytes):
+            converted[key] = value.decode("latin-1")
+        else:
+            converted[key] = value
+    return converted
+
+
+def create_bigquery_client(project_id: str = None, location: str = None, backend: str = None) -> typing.Any:
+    """Gets the shared query client for a project and location
+
+    Clients are cached so every caller reuses the same connection pool and Storage
+    Read API channel.
+
+    Args:
+        project_id: GCP project ID (defaults to the detected project)
+        location: BigQuery location (defaults to the configured location)
+        backend: "bigquery" or "local" (defaults to the bigquery.backend setting)
+
+    Returns:
+        BigQueryClient, or LocalBigQueryClient for the local backend
+    """
+    backend = backend or get_config().get(BIGQUERY_BACKEND_CONFIG_KEY) or BACKEND_BIGQUERY
+    key = (backend, project_id, location)
+
+    with _shared_clients_lock:
+        shared = _shared_clients.get(key)
+        if shared is None:
+            if backend == BACKEND_LOCAL:
+                from .local_query_engine import LocalBigQueryClient
+                shared = LocalBigQueryClient(project_id=project_id)
+            else:
+                shared = BigQueryClient(project_id=project_id, location=location)
+            _shared_clients[key] = shared
+        return shared
+
+
+def get_bigquery_client() -> bigquery.Client:
+    """Gets the shared underlying BigQuery client for the default project
+
+    Returns:
+        Shared google.cloud.bigquery.Client
+    """
+    return create_bigquery_client(backend=BACKEND_BIGQUERY).client
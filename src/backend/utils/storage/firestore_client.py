@@ -0,0 +1,1001 @@
+"""
+Firestore client for the self-healing data pipeline.
+
+Wraps the Google Cloud Firestore client with retry handling, error mapping and the
+access patterns the trackers and repositories rely on:
+- get_documents fetches many documents with batched get_all calls instead of one
+  round trip per document.
+- iter_snapshots and stream_documents page through large queries with cursors, so a
+  page that fails transiently is re-read from the last delivered document instead of
+  restarting the whole query, and callers can resume from a document of their choice.
+- Queries and reads accept field projections to avoid transferring unused fields.
+- FirestoreBulkWriter commits writes in small parallel batches and follows Firestore's
+  500/50/5 traffic ramp-up rule: start at 500 writes per second and grow by 50% every
+  5 minutes.
+
+Setting firestore.backend to "local" in the configuration swaps in an in-process store
+with the same interface, so trackers can be tested and benchmarked without network
+access. Every FirestoreClient created for the local backend shares one store per project.
+"""
+
+import concurrent.futures
+import threading
+import time
+import typing
+
+from google.api_core.exceptions import (  # version 2.10.0+
+    GoogleAPICallError,
+    NotFound,
+    Forbidden,
+    BadRequest,
+    Aborted,
+    Conflict,
+    ServiceUnavailable,
+    DeadlineExceeded,
+    TooManyRequests,
+    InternalServerError
+)
+
+from ...config import get_config
+from ..auth.gcp_auth import get_project_id
+from ..logging.logger import get_logger
+from ..retry.retry_decorator import retry
+from ..retry.backoff_strategy import get_backoff_strategy
+from ..errors.error_types import (
+    PipelineError,
+    ResourceError,
+    ConnectionError,
+    ErrorCategory,
+    ErrorRecoverability
+)
+from .local_firestore import LocalFirestoreClient, ASCENDING, DESCENDING
+
+try:
+    from google.cloud import firestore  # version 2.11.0+
+except ImportError:  # pragma: no cover - only needed for the firestore backend
+    firestore = None
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Configuration keys
+FIRESTORE_CONFIG_KEY = "firestore"
+FIRESTORE_BACKEND_CONFIG_KEY = "firestore.backend"
+
+# Default settings
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_GET_ALL_CHUNK_SIZE = 300
+DEFAULT_MAX_PAGE_ATTEMPTS = 5
+MAX_BATCH_WRITES = 500
+
+# Bulk writer defaults, following the 500/50/5 ramp-up rule
+DEFAULT_BULK_BATCH_SIZE = 20
+DEFAULT_BULK_MAX_CONCURRENCY = 8
+DEFAULT_BULK_INITIAL_OPS_PER_SECOND = 500
+DEFAULT_BULK_MAX_OPS_PER_SECOND = 10000
+DEFAULT_BULK_RAMP_UP_INTERVAL_SECONDS = 300
+DEFAULT_BULK_RAMP_UP_FACTOR = 1.5
+
+# Firestore backends
+BACKEND_FIRESTORE = "firestore"
+BACKEND_LOCAL = "local"
+
+# Firestore errors that are worth retrying; Aborted signals transaction contention
+RETRYABLE_EXCEPTIONS = (ServiceUnavailable, DeadlineExceeded, TooManyRequests, InternalServerError, Aborted)
+
+# Mongo-style comparison operators accepted in dictionary filters
+FILTER_OPERATORS = {
+    "$eq": "==",
+    "$ne": "!=",
+    "$lt": "<",
+    "$lte": "<=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$in": "in",
+    "$nin": "not-in",
+    "$contains": "array_contains",
+    "$contains_any": "array_contains_any"
+}
+
+# Filter operators that do not imply an ordering on their field
+EQUALITY_OPERATORS = {"==", "in", "array_contains", "array_contains_any"}
+
+# Sort direction aliases accepted in order_by tuples
+DESCENDING_ALIASES = {"desc", "descending"}
+
+Filters = typing.Union[typing.Dict[str, typing.Any], typing.Sequence[typing.Tuple[str, str, typing.Any]]]
+OrderBy = typing.Union[str, typing.Sequence[typing.Union[str, typing.Tuple[str, str]]]]
+
+# Shared clients keyed by (backend, project)
+_shared_clients: typing.Dict[tuple, "FirestoreClient"] = {}
+_local_backends: typing.Dict[tuple, LocalFirestoreClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def map_firestore_exception_to_pipeline_error(exception: Exception, collection_name: str = None,
+                                              document_id: str = None) -> PipelineError:
+    """Maps a Firestore API exception to the pipeline error hierarchy
+
+    Args:
+        exception: Exception raised by the Firestore client
+        collection_name: Collection the operation targeted
+        document_id: Document the operation targeted, if any
+
+    Returns:
+        PipelineError subclass describing the failure
+    """
+    message = f"Firestore operation failed: {str(exception)}"
+    resource_name = f"{collection_name}/{document_id}" if document_id else collection_name
+    context = {
+        "collection_name": collection_name,
+        "document_id": document_id,
+        "original_error": exception.__class__.__name__
+    }
+
+    if isinstance(exception, NotFound):
+        error = ResourceError(message, resource_type="firestore", resource_name=resource_name,
+                              resource_details={"error": str(exception)}, retryable=False)
+    elif isinstance(exception, RETRYABLE_EXCEPTIONS):
+        error = ConnectionError(message, service_name="firestore",
+                                connection_details={"error": str(exception)}, retryable=True)
+    elif isinstance(exception, Forbidden):
+        error = PipelineError(message, category=ErrorCategory.AUTHORIZATION_ERROR,
+                              recoverability=ErrorRecoverability.MANUAL_RECOVERABLE, retryable=False)
+    elif isinstance(exception, (BadRequest, Conflict)):
+        error = PipelineError(message, category=ErrorCategory.VALIDATION_ERROR,
+                              recoverability=ErrorRecoverability.MANUAL_RECOVERABLE, retryable=False)
+    else:
+        error = PipelineError(message, category=ErrorCategory.UNKNOWN, retryable=False)
+
+    error.add_context(context)
+    return error
+
+
+def _split_document_args(collection_name: str, document_id: typing.Any,
+                         data: typing.Any = None) -> typing.Tuple[str, str, typing.Any]:
+    """Resolves (collection, id, data) from either separate arguments or a document path
+
+    Callers pass a collection and document ID, or a single "collection/document" path
+    followed by the data.
+    """
+    if isinstance(document_id, dict) and data is None:
+        document_id, data = None, document_id
+    if document_id is None and collection_name and "/" in collection_name:
+        collection_name, document_id = collection_name.rsplit("/", 1)
+    return collection_name, document_id, data
+
+
+def normalize_filters(filters: Filters) -> typing.List[typing.Tuple[str, str, typing.Any]]:
+    """Converts filters to (field, operator, value) tuples
+
+    Args:
+        filters: List of (field, operator, value) tuples, or a mapping of field to value
+            where a value may be a dictionary of Mongo-style operators such as {"$gte": x}
+
+    Returns:
+        List of (field, operator, value) tuples
+    """
+    if not filters:
+        return []
+    if not isinstance(filters, dict):
+        return [tuple(condition) for condition in filters]
+
+    normalized = []
+    for field, value in filters.items():
+        if isinstance(value, dict) and value and all(key in FILTER_OPERATORS for key in value):
+            normalized.extend((field, FILTER_OPERATORS[key], operand) for key, operand in value.items())
+        else:
+            normalized.append((field, "==", value))
+    return normalized
+
+
+def normalize_order_by(order_by: OrderBy) -> typing.List[typing.Tuple[str, typing.Optional[str]]]:
+    """Converts order_by to (field, direction) pairs, with None for the default direction
+
+    Args:
+        order_by: Field name, or a list of field names and (field, direction) tuples
+
+    Returns:
+        List of (field, direction) pairs
+    """
+    if not order_by:
+        return []
+    if isinstance(order_by, str):
+        return [(order_by, None)]
+
+    normalized = []
+    for order in order_by:
+        if isinstance(order, str):
+            normalized.append((order, None))
+        else:
+            field, direction = order
+            normalized.append((field, DESCENDING if str(direction).lower() in DESCENDING_ALIASES else ASCENDING))
+    return normalized
+
+
+class FirestoreClient:
+    """Client for Firestore document reads, queries and batched writes"""
+
+    def __init__(self, project_id: str = None, config: typing.Dict[str, typing.Any] = None,
+                 client: typing.Any = None, backend: str = None):
+        """Initializes the Firestore client
+
+        Args:
+            project_id: GCP project ID (defaults to the detected project)
+            config: Settings overriding the firestore configuration section: backend,
+                local_database, page_size, get_all_chunk_size and bulk_writer
+            client: Existing Firestore client to share instead of creating one
+            backend: "firestore" or "local" (defaults to the firestore.backend setting)
+        """
+        settings = dict(get_config().get(FIRESTORE_CONFIG_KEY, None) or {})
+        settings.update(config or {})
+        self._settings = settings
+        self._backend = backend or settings.get("backend") or BACKEND_FIRESTORE
+        self._page_size = int(settings.get("page_size") or DEFAULT_PAGE_SIZE)
+        self._get_all_chunk_size = int(settings.get("get_all_chunk_size") or DEFAULT_GET_ALL_CHUNK_SIZE)
+
+        if client is not None:
+            self._project_id = project_id or getattr(client, "project", None)
+            self._client = client
+        elif self._backend == BACKEND_LOCAL:
+            self._client = _get_local_backend(project_id, settings.get("local_database"))
+            self._project_id = self._client.project
+        else:
+            self._project_id = project_id or get_project_id()
+            self._client = firestore.Client(project=self._project_id)
+
+        logger.info(f"Initialized Firestore client for project {self._project_id} ({self._backend} backend)")
+
+    @property
+    def project_id(self) -> str:
+        """GCP project ID of the Firestore database"""
+        return self._project_id
+
+    @property
+    def backend(self) -> str:
+        """Backend in use, "firestore" or "local\""""
+        return self._backend
+
+    @property
+    def client(self) -> typing.Any:
+        """Underlying Firestore client"""
+        return self._client
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def collection(self, collection_name: str = None, collection: str = None) -> typing.Any:
+        """Gets a reference to a collection
+
+        Args:
+            collection_name: Collection name or path
+            collection: Alias of collection_name
+
+        Returns:
+            Collection reference
+        """
+        collection_name = collection_name or collection
+        try:
+            return self._client.collection(collection_name)
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+
+    def document(self, collection_name: str = None, document_id: str = None, collection: str = None) -> typing.Any:
+        """Gets a reference to a document
+
+        Args:
+            collection_name: Collection name, or a "collection/document" path
+            document_id: Document ID, omitted when collection_name is a path
+            collection: Alias of collection_name
+
+        Returns:
+            Document reference
+        """
+        collection_name, document_id, _ = _split_document_args(collection_name or collection, document_id)
+        try:
+            return self.collection(collection_name).document(document_id)
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    def get_collection_ref(self, collection_name: str) -> typing.Any:
+        """Alias of collection() for callers building native queries"""
+        return self.collection(collection_name)
+
+    def get_document_ref(self, collection_name: str, document_id: str = None) -> typing.Any:
+        """Alias of document() for callers building native batches"""
+        return self.document(collection_name, document_id)
+
+    def create_batch(self) -> typing.Any:
+        """Creates a native write batch of at most 500 writes"""
+        return self._client.batch()
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def get_document(self, collection_name: str = None, document_id: str = None, collection: str = None,
+                     field_paths: typing.List[str] = None) -> typing.Optional[dict]:
+        """Reads a document
+
+        Args:
+            collection_name: Collection name, or a "collection/document" path
+            document_id: Document ID, omitted when collection_name is a path
+            collection: Alias of collection_name
+            field_paths: Optional fields to read instead of the whole document
+
+        Returns:
+            Document data, or None if the document does not exist
+        """
+        collection_name, document_id, _ = _split_document_args(collection_name or collection, document_id)
+        try:
+            reference = self.document(collection_name, document_id)
+            snapshot = reference.get(field_paths=field_paths) if field_paths else reference.get()
+            return snapshot.to_dict() if snapshot.exists else None
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    def get_documents(self, collection_name: str, document_ids: typing.Iterable[str],
+                      field_paths: typing.List[str] = None) -> typing.Dict[str, dict]:
+        """Reads many documents of a collection with batched get_all calls
+
+        Args:
+            collection_name: Collection name
+            document_ids: IDs of the documents to read; duplicates are read once
+            field_paths: Optional fields to read instead of whole documents
+
+        Returns:
+            Mapping of document ID to data for the documents that exist
+        """
+        document_ids = list(dict.fromkeys(document_ids))
+        documents = {}
+        for start in range(0, len(document_ids), self._get_all_chunk_size):
+            chunk = document_ids[start:start + self._get_all_chunk_size]
+            documents.update(self._get_all(collection_name, chunk, field_paths))
+        return documents
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def _get_all(self, collection_name: str, document_ids: typing.List[str],
+                 field_paths: typing.List[str] = None) -> typing.Dict[str, dict]:
+        """Reads one chunk of documents in a single get_all call"""
+        try:
+            references = [self.document(collection_name, document_id) for document_id in document_ids]
+            return {
+                snapshot.id: snapshot.to_dict()
+                for snapshot in self._client.get_all(references, field_paths=field_paths)
+                if snapshot.exists
+            }
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+
+    def document_exists(self, collection_name: str = None, document_id: str = None, collection: str = None) -> bool:
+        """Checks whether a document exists
+
+        Args:
+            collection_name: Collection name, or a "collection/document" path
+            document_id: Document ID, omitted when collection_name is a path
+            collection: Alias of collection_name
+
+        Returns:
+            True if the document exists
+        """
+        collection_name, document_id, _ = _split_document_args(collection_name or collection, document_id)
+        try:
+            return bool(self.document(collection_name, document_id).get().exists)
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def set_document(self, collection_name: str = None, document_id: typing.Any = None, data: dict = None,
+                     merge: bool = False, collection: str = None) -> bool:
+        """Creates or overwrites a document
+
+        Args:
+            collection_name: Collection name, or a "collection/document" path
+            document_id: Document ID; when collection_name is a path, the data may be passed here
+            data: Document data
+            merge: Merge into an existing document instead of overwriting it
+            collection: Alias of collection_name
+
+        Returns:
+            True once the write is committed
+        """
+        collection_name, document_id, data = _split_document_args(collection_name or collection, document_id, data)
+        try:
+            self.document(collection_name, document_id).set(data, merge=merge)
+            return True
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    def create_document(self, collection_name: str = None, document_id: str = None, data: dict = None,
+                        collection: str = None) -> typing.Any:
+        """Writes a document and returns its reference
+
+        Args:
+            collection_name: Collection name
+            document_id: Document ID
+            data: Document data
+            collection: Alias of collection_name
+
+        Returns:
+            Document reference
+        """
+        collection_name = collection_name or collection
+        try:
+            reference = self.collection(collection_name).document(document_id)
+            reference.set(data)
+            return reference
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    def add_document(self, collection_name: str = None, document_id: typing.Any = None, data: dict = None,
+                     collection: str = None) -> str:
+        """Writes a document, generating its ID when none is given
+
+        Args:
+            collection_name: Collection name
+            document_id: Optional document ID; the data may be passed here instead
+            data: Document data
+            collection: Alias of collection_name
+
+        Returns:
+            ID of the written document
+        """
+        collection_name = collection_name or collection
+        if isinstance(document_id, dict) and data is None:
+            document_id, data = None, document_id
+        return self.create_document(collection_name, document_id, data).id
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def update_document(self, collection_name: str = None, document_id: typing.Any = None, data: dict = None,
+                        collection: str = None) -> bool:
+        """Updates fields of an existing document
+
+        Args:
+            collection_name: Collection name, or a "collection/document" path
+            document_id: Document ID; when collection_name is a path, the data may be passed here
+            data: Fields to update, keyed by dotted field path
+            collection: Alias of collection_name
+
+        Returns:
+            True once the update is committed
+        """
+        collection_name, document_id, data = _split_document_args(collection_name or collection, document_id, data)
+        try:
+            self.document(collection_name, document_id).update(data)
+            return True
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def delete_document(self, collection_name: str = None, document_id: str = None, collection: str = None) -> bool:
+        """Deletes a document
+
+        Args:
+            collection_name: Collection name, or a "collection/document" path
+            document_id: Document ID, omitted when collection_name is a path
+            collection: Alias of collection_name
+
+        Returns:
+            True once the delete is committed
+        """
+        collection_name, document_id, _ = _split_document_args(collection_name or collection, document_id)
+        try:
+            self.document(collection_name, document_id).delete()
+            return True
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name, document_id) from e
+
+    def query(self, collection_name: str = None, filters: Filters = None, order_by: OrderBy = None,
+              limit: int = None, offset: int = None, field_paths: typing.List[str] = None,
+              collection: str = None) -> typing.Any:
+        """Builds a native query
+
+        Args:
+            collection_name: Collection name
+            filters: (field, operator, value) tuples or a field-to-value mapping
+            order_by: Field name, or a list of field names and (field, direction) tuples
+            limit: Maximum number of documents
+            offset: Number of documents to skip
+            field_paths: Optional fields to return instead of whole documents
+            collection: Alias of collection_name
+
+        Returns:
+            Query supporting further where/order_by/limit calls and stream()
+        """
+        query = self.collection(collection_name or collection)
+        for field, op, value in normalize_filters(filters):
+            query = query.where(field, op, value)
+        for field, direction in normalize_order_by(order_by):
+            query = query.order_by(field) if direction is None else query.order_by(field, direction=direction)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        if field_paths:
+            query = query.select(field_paths)
+        return query
+
+    def query_documents(self, collection_name: str = None, filters: Filters = None, order_by: OrderBy = None,
+                        limit: int = None, offset: int = None, field_paths: typing.List[str] = None,
+                        collection: str = None, query_params: Filters = None) -> typing.List[dict]:
+        """Runs a query and returns the matching documents
+
+        Queries with a limit up to the page size run as one request; larger or unbounded
+        queries are read page by page with cursors.
+
+        Args:
+            collection_name: Collection name
+            filters: (field, operator, value) tuples or a field-to-value mapping
+            order_by: Field name, or a list of field names and (field, direction) tuples
+            limit: Maximum number of documents
+            offset: Number of documents to skip
+            field_paths: Optional fields to return instead of whole documents
+            collection: Alias of collection_name
+            query_params: Alias of filters
+
+        Returns:
+            List of document data
+        """
+        collection_name = collection_name or collection
+        filters = filters if filters is not None else query_params
+
+        if limit is not None and limit <= self._page_size:
+            try:
+                query = self.query(collection_name, filters, order_by, limit, offset, field_paths)
+                return [snapshot.to_dict() for snapshot in query.stream()]
+            except GoogleAPICallError as e:
+                raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+
+        return list(self.stream_documents(collection_name, filters, order_by, limit=limit, offset=offset,
+                                          field_paths=field_paths))
+
+    def query_collection(self, collection_name: str, query: Filters = None, limit: int = None,
+                         order_by: OrderBy = None) -> typing.List[dict]:
+        """Runs a query given as a field-to-value mapping
+
+        Args:
+            collection_name: Collection name
+            query: Field-to-value mapping; dotted fields address nested maps
+            limit: Maximum number of documents
+            order_by: Field name, or a list of field names and (field, direction) tuples
+
+        Returns:
+            List of document data
+        """
+        return self.query_documents(collection_name, filters=query, order_by=order_by, limit=limit)
+
+    def iter_snapshots(self, collection_name: str, filters: Filters = None, order_by: OrderBy = None,
+                       page_size: int = None, start_after: typing.Any = None, limit: int = None,
+                       offset: int = None, field_paths: typing.List[str] = None) -> typing.Iterator[typing.Any]:
+        """Streams query results page by page using cursors
+
+        Each page is a separate request that starts after the last snapshot of the
+        previous page. A page that fails with a transient error is requested again from
+        the same cursor, so long scans never restart from the beginning.
+
+        Args:
+            collection_name: Collection name
+            filters: (field, operator, value) tuples or a field-to-value mapping
+            order_by: Field name, or a list of field names and (field, direction) tuples
+            page_size: Documents per request (defaults to the configured page size)
+            start_after: Resume after this snapshot, document ID or mapping of order-by values
+            limit: Maximum number of documents in total
+            offset: Number of documents to skip before the first page
+            field_paths: Optional fields to return; order-by and inequality filter fields are
+                added so cursors can be built from the returned snapshots
+
+        Returns:
+            Iterator of document snapshots
+        """
+        page_size = page_size or self._page_size
+        if field_paths:
+            cursor_fields = [field for field, _ in normalize_order_by(order_by)] + [
+                field for field, op, _ in normalize_filters(filters) if op not in EQUALITY_OPERATORS
+            ]
+            field_paths = list(dict.fromkeys(list(field_paths) + cursor_fields))
+        if isinstance(start_after, str):
+            start_after = self.document(collection_name, start_after).get()
+            if not start_after.exists:
+                raise ResourceError(f"Cursor document {start_after.id} not found", resource_type="firestore",
+                                    resource_name=f"{collection_name}/{start_after.id}",
+                                    resource_details={}, retryable=False)
+
+        base_query = self.query(collection_name, filters, order_by, field_paths=field_paths)
+        backoff = get_backoff_strategy("exponential", base_delay=0.5, max_delay=10.0)
+        cursor = start_after
+        remaining = limit
+        skip = offset
+
+        while remaining is None or remaining > 0:
+            request_size = page_size if remaining is None else min(page_size, remaining)
+            query = base_query.start_after(cursor) if cursor is not None else base_query
+            if skip:
+                query = query.offset(skip)
+
+            for attempt in range(1, DEFAULT_MAX_PAGE_ATTEMPTS + 1):
+                try:
+                    page = list(query.limit(request_size).stream())
+                    break
+                except RETRYABLE_EXCEPTIONS as e:
+                    if attempt == DEFAULT_MAX_PAGE_ATTEMPTS:
+                        raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+                    logger.warning(f"Reading a page of {collection_name} failed ({e}), retrying from the last cursor")
+                    backoff.wait(attempt)
+                except GoogleAPICallError as e:
+                    raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+
+            yield from page
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < request_size:
+                break
+            cursor = page[-1]
+            skip = None
+
+    def stream_documents(self, collection_name: str, filters: Filters = None, order_by: OrderBy = None,
+                         page_size: int = None, start_after: typing.Any = None, limit: int = None,
+                         offset: int = None, field_paths: typing.List[str] = None) -> typing.Iterator[dict]:
+        """Streams document data page by page using cursors
+
+        Takes the same arguments as iter_snapshots.
+
+        Returns:
+            Iterator of document data
+        """
+        for snapshot in self.iter_snapshots(collection_name, filters, order_by, page_size, start_after,
+                                            limit, offset, field_paths):
+            yield snapshot.to_dict()
+
+    def batch_create(self, collection_name: str = None, documents: typing.Dict[str, dict] = None,
+                     collection: str = None) -> int:
+        """Writes several documents in atomic batches of at most 500 writes
+
+        Args:
+            collection_name: Collection name
+            documents: Mapping of document ID to data
+            collection: Alias of collection_name
+
+        Returns:
+            Number of documents written
+        """
+        return self._commit_batches("set", collection_name or collection, list((documents or {}).items()))
+
+    def batch_update(self, collection_name: str = None, documents: typing.Dict[str, dict] = None,
+                     collection: str = None, updates: typing.Dict[str, dict] = None) -> int:
+        """Updates several documents in atomic batches of at most 500 writes
+
+        Args:
+            collection_name: Collection name
+            documents: Mapping of document ID to fields to update
+            collection: Alias of collection_name
+            updates: Alias of documents
+
+        Returns:
+            Number of documents updated
+        """
+        documents = documents if documents is not None else updates
+        return self._commit_batches("update", collection_name or collection, list((documents or {}).items()))
+
+    def batch_delete(self, collection_name: str = None, document_ids: typing.Iterable[str] = None,
+                     collection: str = None) -> int:
+        """Deletes several documents in atomic batches of at most 500 writes
+
+        Args:
+            collection_name: Collection name
+            document_ids: IDs of the documents to delete
+            collection: Alias of collection_name
+
+        Returns:
+            Number of documents deleted
+        """
+        return self._commit_batches("delete", collection_name or collection,
+                                    [(document_id, None) for document_id in document_ids or []])
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def _commit_batch(self, operation: str, collection_name: str, items: typing.List[tuple]) -> None:
+        """Commits one batch of writes"""
+        try:
+            batch = self._client.batch()
+            for document_id, data in items:
+                reference = self.document(collection_name, document_id)
+                if operation == "delete":
+                    batch.delete(reference)
+                else:
+                    getattr(batch, operation)(reference, data)
+            batch.commit()
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+
+    def _commit_batches(self, operation: str, collection_name: str, items: typing.List[tuple]) -> int:
+        """Commits writes in as many batches as the Firestore batch limit requires"""
+        for start in range(0, len(items), MAX_BATCH_WRITES):
+            self._commit_batch(operation, collection_name, items[start:start + MAX_BATCH_WRITES])
+        return len(items)
+
+    def bulk_writer(self, config: typing.Dict[str, typing.Any] = None) -> "FirestoreBulkWriter":
+        """Creates a bulk writer for high-volume, non-atomic writes
+
+        Args:
+            config: Settings overriding the firestore.bulk_writer configuration
+
+        Returns:
+            FirestoreBulkWriter, to be closed or used as a context manager
+        """
+        settings = dict(self._settings.get("bulk_writer") or {})
+        settings.update(config or {})
+        return FirestoreBulkWriter(self, settings)
+
+    def bulk_set(self, collection_name: str, documents: typing.Dict[str, dict], merge: bool = False) -> int:
+        """Writes many documents with a bulk writer
+
+        Unlike batch_create the writes are not atomic; each one is retried on its own.
+
+        Args:
+            collection_name: Collection name
+            documents: Mapping of document ID to data
+            merge: Merge into existing documents instead of overwriting them
+
+        Returns:
+            Number of documents written
+        """
+        with self.bulk_writer() as writer:
+            for document_id, data in documents.items():
+                writer.set(self.document(collection_name, document_id), data, merge=merge)
+        return writer.get_stats()["writes_succeeded"]
+
+    def collection_exists(self, collection_name: str) -> bool:
+        """Checks whether a collection contains at least one document
+
+        Args:
+            collection_name: Collection name
+
+        Returns:
+            True if the collection has documents
+        """
+        try:
+            return any(True for _ in self.collection(collection_name).limit(1).stream())
+        except GoogleAPICallError as e:
+            raise map_firestore_exception_to_pipeline_error(e, collection_name) from e
+
+    def create_collection(self, collection_name: str) -> bool:
+        """Prepares a collection; Firestore creates collections on their first write
+
+        Args:
+            collection_name: Collection name
+
+        Returns:
+            True
+        """
+        logger.debug(f"Firestore collection {collection_name} is created on its first write")
+        return True
+
+    def ensure_collection(self, collection_name: str) -> bool:
+        """Alias of create_collection()"""
+        return self.create_collection(collection_name)
+
+
+class FirestoreBulkWriter:
+    """Commits writes in parallel batches with a ramped-up rate limit
+
+    Writes are grouped into small batches that are committed concurrently. The allowed
+    rate starts at the initial operations per second and grows by the ramp-up factor
+    every ramp-up interval, up to the maximum. Failed batches are retried with backoff;
+    if a batch still fails, its writes are retried one by one so a single bad write does
+    not fail the others. Writes that fail on their own are reported by get_failures().
+    """
+
+    def __init__(self, client: FirestoreClient, config: typing.Dict[str, typing.Any] = None):
+        """Initializes the bulk writer
+
+        Args:
+            client: FirestoreClient whose underlying client commits the batches
+            config: Optional settings: batch_size, max_concurrency, initial_ops_per_second,
+                max_ops_per_second, ramp_up_interval_seconds, ramp_up_factor, max_attempts,
+                base_delay, max_delay
+        """
+        config = config or {}
+        self._client = client.client
+        self._batch_size = min(int(config.get("batch_size", DEFAULT_BULK_BATCH_SIZE)), MAX_BATCH_WRITES)
+        self._max_concurrency = int(config.get("max_concurrency", DEFAULT_BULK_MAX_CONCURRENCY))
+        self._initial_rate = float(config.get("initial_ops_per_second", DEFAULT_BULK_INITIAL_OPS_PER_SECOND))
+        self._max_rate = float(config.get("max_ops_per_second", DEFAULT_BULK_MAX_OPS_PER_SECOND))
+        self._ramp_up_interval = float(config.get("ramp_up_interval_seconds", DEFAULT_BULK_RAMP_UP_INTERVAL_SECONDS))
+        self._ramp_up_factor = float(config.get("ramp_up_factor", DEFAULT_BULK_RAMP_UP_FACTOR))
+        self._max_attempts = int(config.get("max_attempts", DEFAULT_MAX_PAGE_ATTEMPTS))
+        self._backoff = get_backoff_strategy(
+            "exponential",
+            base_delay=config.get("base_delay", 0.5),
+            max_delay=config.get("max_delay", 10.0)
+        )
+
+        self._next_send_at = time.monotonic()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="firestore-bulk-writer"
+        )
+        # Bounds in-flight batches so producers block instead of queueing without limit
+        self._slots = threading.BoundedSemaphore(self._max_concurrency * 2)
+        self._lock = threading.Lock()
+        self._pending: typing.List[tuple] = []
+        self._futures: typing.Set[concurrent.futures.Future] = set()
+        self._failures: typing.List[typing.Tuple[tuple, Exception]] = []
+        self._stats = {"writes_succeeded": 0, "writes_failed": 0, "batches_committed": 0, "batch_retries": 0}
+        self._started_at = time.monotonic()
+        self._closed = False
+
+    def set(self, reference: typing.Any, document_data: dict, merge: bool = False) -> None:
+        """Queues a set of a document"""
+        self._enqueue(("set", reference, document_data, merge))
+
+    def create(self, reference: typing.Any, document_data: dict) -> None:
+        """Queues a create of a document that must not exist"""
+        self._enqueue(("create", reference, document_data, False))
+
+    def update(self, reference: typing.Any, field_updates: dict) -> None:
+        """Queues an update of an existing document"""
+        self._enqueue(("update", reference, field_updates, False))
+
+    def delete(self, reference: typing.Any) -> None:
+        """Queues a delete of a document"""
+        self._enqueue(("delete", reference, None, False))
+
+    def flush(self) -> None:
+        """Sends queued writes and waits for every in-flight batch"""
+        with self._lock:
+            writes, self._pending = self._pending, []
+        if writes:
+            self._send(writes)
+        with self._lock:
+            futures = list(self._futures)
+        concurrent.futures.wait(futures)
+
+    def close(self) -> None:
+        """Flushes remaining writes and stops the worker threads"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def get_failures(self) -> typing.List[typing.Tuple[tuple, Exception]]:
+        """Returns writes that failed after retries, as ((operation, reference, data, merge), error)"""
+        with self._lock:
+            return list(self._failures)
+
+    def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """Returns bulk writer statistics
+
+        Returns:
+            Dictionary with write and batch counts and the current rate limit
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending_writes"] = len(self._pending)
+            stats["in_flight_batches"] = len(self._futures)
+        stats["ops_per_second"] = self._current_rate()
+        return stats
+
+    def __enter__(self) -> "FirestoreBulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _enqueue(self, write: tuple) -> None:
+        """Queues a write and sends a batch once enough writes are queued"""
+        if self._closed:
+            raise RuntimeError("The bulk writer is closed")
+        with self._lock:
+            self._pending.append(write)
+            if len(self._pending) < self._batch_size:
+                return
+            writes, self._pending = self._pending, []
+        self._send(writes)
+
+    def _current_rate(self) -> float:
+        """Allowed operations per second after ramp-up"""
+        if self._ramp_up_interval <= 0:
+            return self._max_rate
+        steps = int((time.monotonic() - self._started_at) // self._ramp_up_interval)
+        return min(self._initial_rate * self._ramp_up_factor ** steps, self._max_rate)
+
+    def _send(self, writes: typing.List[tuple]) -> None:
+        """Waits for rate and concurrency budget, then commits a batch in the pool"""
+        # Pace batches so writes are spread evenly at the current rate
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(self._next_send_at, now)
+            self._next_send_at = send_at + len(writes) / self._current_rate()
+        if send_at > now:
+            time.sleep(send_at - now)
+
+        self._slots.acquire()
+        future = self._executor.submit(self._commit_writes, writes)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: concurrent.futures.Future) -> None:
+        """Releases the concurrency slot of a finished batch"""
+        with self._lock:
+            self._futures.discard(future)
+        self._slots.release()
+
+    def _commit_writes(self, writes: typing.List[tuple]) -> None:
+        """Commits a batch with retries, falling back to single writes on failure"""
+        error = None
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                self._commit(writes)
+                with self._lock:
+                    self._stats["writes_succeeded"] += len(writes)
+                    self._stats["batches_committed"] += 1
+                return
+            except RETRYABLE_EXCEPTIONS as e:
+                error = e
+                with self._lock:
+                    self._stats["batch_retries"] += 1
+                if attempt < self._max_attempts:
+                    self._backoff.wait(attempt)
+            except Exception as e:
+                error = e
+                break
+
+        if len(writes) > 1:
+            # Batches are atomic, so isolate the writes that cannot be applied
+            for write in writes:
+                self._commit_writes([write])
+            return
+
+        logger.error(f"Bulk write to {getattr(writes[0][1], 'path', writes[0][1])} failed: {error}")
+        with self._lock:
+            self._stats["writes_failed"] += 1
+            self._failures.append((writes[0], error))
+
+    def _commit(self, writes: typing.List[tuple]) -> None:
+        """Applies writes in one native batch"""
+        batch = self._client.batch()
+        for operation, reference, data, merge in writes:
+            if operation == "set":
+                batch.set(reference, data, merge=merge)
+            elif operation == "delete":
+                batch.delete(reference)
+            else:
+                getattr(batch, operation)(reference, data)
+        batch.commit()
+
+
+def _get_local_backend(project_id: str = None, database_path: str = None) -> LocalFirestoreClient:
+    """Gets the in-process store shared by every local-backend client of a project"""
+    key = (project_id, database_path)
+    with _shared_clients_lock:
+        backend = _local_backends.get(key)
+        if backend is None:
+            backend = LocalFirestoreClient(project=project_id, database_path=database_path)
+            _local_backends[key] = backend
+        return backend
+
+
+def create_firestore_client(project_id: str = None, backend: str = None) -> FirestoreClient:
+    """Gets the shared Firestore client for a project
+
+    Args:
+        project_id: GCP project ID (defaults to the detected project)
+        backend: "firestore" or "local" (defaults to the firestore.backend setting)
+
+    Returns:
+        Shared FirestoreClient
+    """
+    backend = backend or get_config().get(FIRESTORE_BACKEND_CONFIG_KEY) or BACKEND_FIRESTORE
+    key = (backend, project_id)
+
+    with _shared_clients_lock:
+        shared = _shared_clients.get(key)
+    if shared is None:
+        shared = FirestoreClient(project_id=project_id, backend=backend)
+        with _shared_clients_lock:
+            shared = _shared_clients.setdefault(key, shared)
+    return shared
+
+
+def get_firestore_client() -> typing.Any:
+    """Gets the shared underlying Firestore client for the default project
+
+    Returns:
+        google.cloud.firestore.Client, or the local store for the local backend
+    """
+    return create_firestore_client().client
@@ -0,0 +1,991 @@
+"""
+Google Cloud Storage client for the self-healing data pipeline.
+
+Wraps the Google Cloud Storage client with retry handling, error mapping and transfers
+built for throughput:
+- Objects above the sliced download threshold are fetched as parallel byte-range
+  slices written straight into a preallocated buffer, or into a memory-mapped file
+  when downloading to disk.
+- Uploads above the composite upload threshold are split into parts uploaded in
+  parallel and combined with a compose request; the temporary parts are then deleted.
+- open_blob returns a seekable, read-only file object that fetches byte ranges on
+  demand, so Parquet and Avro readers only transfer the footers and row groups they need.
+- Transfers are verified against the object's CRC32C checksum, which Cloud Storage
+  keeps for every object including composite ones.
+
+All requests share one pooled HTTP session sized for the transfer workers. Setting
+gcs.backend to "local" in the configuration swaps in a local-filesystem store with the
+same interface, so extractors and benchmarks can run without network access.
+"""
+
+import base64
+import concurrent.futures
+import fnmatch
+import hashlib
+import io
+import math
+import mmap
+import os
+import threading
+import typing
+import uuid
+
+from google.api_core.exceptions import (  # version 2.10.0+
+    GoogleAPICallError,
+    NotFound,
+    Forbidden,
+    BadRequest,
+    Conflict,
+    ServiceUnavailable,
+    DeadlineExceeded,
+    TooManyRequests,
+    InternalServerError
+)
+
+from ...constants import FileFormat
+from ...config import get_config
+from ..auth.gcp_auth import get_project_id
+from ..logging.logger import get_logger
+from ..retry.retry_decorator import retry
+from ..errors.error_types import (
+    PipelineError,
+    ResourceError,
+    ConnectionError,
+    ErrorCategory,
+    ErrorRecoverability
+)
+
+try:
+    from google.cloud import storage  # version 2.10.0+
+except ImportError:  # pragma: no cover - only needed for the gcs backend
+    storage = None
+
+try:
+    import google_crc32c  # version 1.5.0+
+except ImportError:  # pragma: no cover - optional dependency
+    google_crc32c = None
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Configuration keys
+GCS_BACKEND_CONFIG_KEY = "gcs.backend"
+GCS_LOCAL_ROOT_CONFIG_KEY = "gcs.local_root"
+GCS_MAX_WORKERS_CONFIG_KEY = "gcs.max_workers"
+GCS_HTTP_POOL_SIZE_CONFIG_KEY = "gcs.http_pool_size"
+GCS_SLICED_DOWNLOAD_THRESHOLD_CONFIG_KEY = "gcs.sliced_download_threshold_bytes"
+GCS_SLICE_SIZE_CONFIG_KEY = "gcs.slice_size_bytes"
+GCS_COMPOSITE_UPLOAD_THRESHOLD_CONFIG_KEY = "gcs.composite_upload_threshold_bytes"
+GCS_COMPOSITE_PART_SIZE_CONFIG_KEY = "gcs.composite_part_size_bytes"
+GCS_RANGE_BLOCK_SIZE_CONFIG_KEY = "gcs.range_block_size_bytes"
+
+# Default settings
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_HTTP_POOL_SIZE = 32
+DEFAULT_SLICED_DOWNLOAD_THRESHOLD_BYTES = 32 * 1024 * 1024
+DEFAULT_SLICE_SIZE_BYTES = 8 * 1024 * 1024
+DEFAULT_COMPOSITE_UPLOAD_THRESHOLD_BYTES = 150 * 1024 * 1024
+DEFAULT_COMPOSITE_PART_SIZE_BYTES = 32 * 1024 * 1024
+DEFAULT_RANGE_BLOCK_SIZE_BYTES = 1024 * 1024
+DEFAULT_RANGE_CACHE_BLOCKS = 16
+CHECKSUM_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Cloud Storage accepts at most 32 source objects per compose request
+MAX_COMPOSE_COMPONENTS = 32
+
+# Storage backends
+BACKEND_GCS = "gcs"
+BACKEND_LOCAL = "local"
+
+# Cloud Storage errors that are worth retrying
+RETRYABLE_EXCEPTIONS = (ServiceUnavailable, DeadlineExceeded, TooManyRequests, InternalServerError)
+
+# Content types by file format and by file extension
+FORMAT_CONTENT_TYPES = {
+    FileFormat.CSV: "text/csv",
+    FileFormat.JSON: "application/json",
+    FileFormat.AVRO: "application/avro",
+    FileFormat.PARQUET: "application/parquet",
+    FileFormat.ORC: "application/orc",
+    FileFormat.XML: "application/xml",
+    FileFormat.TEXT: "text/plain"
+}
+EXTENSION_CONTENT_TYPES = {
+    ".csv": "text/csv",
+    ".json": "application/json",
+    ".jsonl": "application/json",
+    ".avro": "application/avro",
+    ".parquet": "application/parquet",
+    ".orc": "application/orc",
+    ".xml": "application/xml",
+    ".txt": "text/plain",
+    ".gz": "application/gzip",
+    ".zip": "application/zip"
+}
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# Clients shared per (backend, project) so transfers reuse one connection pool
+_shared_clients: typing.Dict[tuple, "GCSClient"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def map_gcs_exception_to_pipeline_error(exception: Exception, resource_name: str = None) -> PipelineError:
+    """Maps a Cloud Storage API exception to the pipeline error hierarchy
+
+    Args:
+        exception: Exception raised by the Cloud Storage client
+        resource_name: Bucket or object the operation targeted
+
+    Returns:
+        PipelineError subclass describing the failure
+    """
+    message = f"GCS operation failed: {str(exception)}"
+    context = {"resource_name": resource_name, "original_error": exception.__class__.__name__}
+
+    if isinstance(exception, NotFound):
+        error = ResourceError(message, resource_type="gcs", resource_name=resource_name,
+                              resource_details={"error": str(exception)}, retryable=False)
+    elif isinstance(exception, RETRYABLE_EXCEPTIONS):
+        error = ConnectionError(message, service_name="gcs",
+                                connection_details={"error": str(exception)}, retryable=True)
+    elif isinstance(exception, Forbidden):
+        error = PipelineError(message, category=ErrorCategory.AUTHORIZATION_ERROR,
+                              recoverability=ErrorRecoverability.MANUAL_RECOVERABLE, retryable=False)
+    elif isinstance(exception, (BadRequest, Conflict)):
+        error = PipelineError(message, category=ErrorCategory.VALIDATION_ERROR,
+                              recoverability=ErrorRecoverability.MANUAL_RECOVERABLE, retryable=False)
+    else:
+        error = PipelineError(message, category=ErrorCategory.UNKNOWN, retryable=False)
+
+    error.add_context(context)
+    return error
+
+
+def get_content_type(file_format: FileFormat = None, file_path: str = None) -> str:
+    """Determines the content type of a file from its format or extension
+
+    Args:
+        file_format: File format, takes precedence over the path
+        file_path: File path or object name
+
+    Returns:
+        MIME content type, application/octet-stream if unknown
+    """
+    if file_format is not None:
+        return FORMAT_CONTENT_TYPES.get(file_format, DEFAULT_CONTENT_TYPE)
+    if file_path:
+        extension = os.path.splitext(file_path)[1].lower()
+        return EXTENSION_CONTENT_TYPES.get(extension, DEFAULT_CONTENT_TYPE)
+    return DEFAULT_CONTENT_TYPE
+
+
+def compute_crc32c(data: typing.Union[bytes, bytearray, memoryview, mmap.mmap, typing.BinaryIO]) -> typing.Optional[str]:
+    """Computes a CRC32C checksum in the base64 form Cloud Storage reports
+
+    Args:
+        data: Bytes or a buffer, or a binary file object read to its end
+
+    Returns:
+        Base64-encoded big-endian CRC32C, or None if google-crc32c is not installed
+    """
+    if google_crc32c is None:
+        return None
+    checksum = google_crc32c.Checksum()
+    if isinstance(data, bytes):
+        checksum.update(data)
+    elif isinstance(data, (bytearray, memoryview, mmap.mmap)):
+        # The C extension only accepts immutable bytes, so writable buffers are copied in chunks
+        view = memoryview(data).cast("B")
+        for offset in range(0, len(view), CHECKSUM_CHUNK_BYTES):
+            checksum.update(bytes(view[offset:offset + CHECKSUM_CHUNK_BYTES]))
+    else:
+        for chunk in iter(lambda: data.read(CHECKSUM_CHUNK_BYTES), b""):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode("ascii")
+
+
+def compute_md5(data: typing.Union[bytes, bytearray, memoryview]) -> str:
+    """Computes an MD5 hash in the base64 form Cloud Storage reports
+
+    Args:
+        data: Bytes to hash
+
+    Returns:
+        Base64-encoded MD5 digest
+    """
+    return base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+
+
+def verify_crc32c(data: typing.Union[bytes, bytearray, memoryview, typing.BinaryIO],
+                  expected: typing.Optional[str], resource_name: str = None) -> bool:
+    """Checks data against an object's CRC32C checksum
+
+    Args:
+        data: Bytes, or a binary file object read to its end
+        expected: Base64 CRC32C reported for the object
+        resource_name: Object the data belongs to, for error reporting
+
+    Returns:
+        True if the checksum matched, False if it could not be checked
+
+    Raises:
+        PipelineError: If the checksums differ
+    """
+    if not expected:
+        return False
+    actual = compute_crc32c(data)
+    if actual is None:
+        return False
+    if actual != expected:
+        error = PipelineError(
+            f"CRC32C mismatch for {resource_name}: expected {expected}, got {actual}",
+            category=ErrorCategory.DATA_ERROR, recoverability=ErrorRecoverability.AUTO_RECOVERABLE, retryable=True
+        )
+        error.add_context({"resource_name": resource_name, "expected_crc32c": expected, "actual_crc32c": actual})
+        raise error
+    return True
+
+
+class GCSRangeReader(io.RawIOBase):
+    """Seekable read-only file object over a Cloud Storage object
+
+    Small reads are served from cached fixed-size blocks, so a reader that looks at a
+    file footer and then at its metadata issues a single request. Reads spanning many
+    blocks are fetched in one ranged request and not cached.
+    """
+
+    def __init__(self, blob: typing.Any, size: int, block_size: int = DEFAULT_RANGE_BLOCK_SIZE_BYTES,
+                 cache_blocks: int = DEFAULT_RANGE_CACHE_BLOCKS):
+        """Initializes the reader
+
+        Args:
+            blob: Object to read, pinned to a generation so every range sees the same data
+            size: Object size in bytes
+            block_size: Size of cached blocks
+            cache_blocks: Number of blocks kept in the cache
+        """
+        super().__init__()
+        self._blob = blob
+        self._size = size
+        self._block_size = block_size
+        self._cache_blocks = cache_blocks
+        self._cache: typing.Dict[int, bytes] = {}
+        self._position = 0
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    @property
+    def name(self) -> str:
+        """Object name"""
+        return self._blob.name
+
+    @property
+    def size(self) -> int:
+        """Object size in bytes"""
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: typing.Any) -> int:
+        view = memoryview(buffer).cast("B")
+        length = min(len(view), max(self._size - self._position, 0))
+        if length == 0:
+            return 0
+
+        start = self._position
+        first_block = start // self._block_size
+        last_block = (start + length - 1) // self._block_size
+        uncached = sum(1 for index in range(first_block, last_block + 1) if index not in self._cache)
+
+        if uncached > 2:
+            view[:length] = self._fetch(start, start + length - 1)
+        else:
+            written = 0
+            while written < length:
+                position = start + written
+                block = self._get_block(position // self._block_size)
+                offset = position % self._block_size
+                chunk = block[offset:offset + length - written]
+                view[written:written + len(chunk)] = chunk
+                written += len(chunk)
+
+        self._position += length
+        return length
+
+    def readall(self) -> bytes:
+        return self.read(max(self._size - self._position, 0))
+
+    def _get_block(self, index: int) -> bytes:
+        """Returns a cached block, fetching it on a miss"""
+        block = self._cache.pop(index, None)
+        if block is None:
+            start = index * self._block_size
+            block = self._fetch(start, min(start + self._block_size, self._size) - 1)
+        # Re-inserting keeps the dictionary in least recently used order
+        self._cache[index] = block
+        while len(self._cache) > self._cache_blocks:
+            self._cache.pop(next(iter(self._cache)))
+        return block
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        """Downloads the inclusive byte range start..end"""
+        data = self._blob.download_as_bytes(start=start, end=end, checksum=None)
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        return data
+
+
+class GCSClient:
+    """Client for Cloud Storage buckets, objects and parallel transfers"""
+
+    def __init__(self, project_id: str = None, location: str = None, client: typing.Any = None,
+                 backend: str = None):
+        """Initializes the Cloud Storage client
+
+        Args:
+            project_id: GCP project ID (defaults to the detected project)
+            location: Location for new buckets (defaults to the configured location)
+            client: Existing storage client to share instead of creating one
+            backend: "gcs" or "local" (defaults to the gcs.backend setting)
+        """
+        config = get_config()
+        self._backend = backend or config.get(GCS_BACKEND_CONFIG_KEY) or BACKEND_GCS
+        self._location = location or config.get("location")
+        self._max_workers = int(config.get(GCS_MAX_WORKERS_CONFIG_KEY) or DEFAULT_MAX_WORKERS)
+        self._sliced_download_threshold = int(
+            config.get(GCS_SLICED_DOWNLOAD_THRESHOLD_CONFIG_KEY) or DEFAULT_SLICED_DOWNLOAD_THRESHOLD_BYTES)
+        self._slice_size = int(config.get(GCS_SLICE_SIZE_CONFIG_KEY) or DEFAULT_SLICE_SIZE_BYTES)
+        self._composite_upload_threshold = int(
+            config.get(GCS_COMPOSITE_UPLOAD_THRESHOLD_CONFIG_KEY) or DEFAULT_COMPOSITE_UPLOAD_THRESHOLD_BYTES)
+        self._composite_part_size = int(config.get(GCS_COMPOSITE_PART_SIZE_CONFIG_KEY) or DEFAULT_COMPOSITE_PART_SIZE_BYTES)
+        self._range_block_size = int(config.get(GCS_RANGE_BLOCK_SIZE_CONFIG_KEY) or DEFAULT_RANGE_BLOCK_SIZE_BYTES)
+
+        if client is not None:
+            self._project_id = project_id or getattr(client, "project", None)
+            self._client = client
+        elif self._backend == BACKEND_LOCAL:
+            from .local_gcs import LocalStorageClient
+            self._client = LocalStorageClient(project=project_id, root_path=config.get(GCS_LOCAL_ROOT_CONFIG_KEY),
+                                              location=self._location)
+            self._project_id = self._client.project
+        else:
+            self._project_id = project_id or get_project_id()
+            self._client = storage.Client(project=self._project_id)
+            self._configure_http_pool(int(config.get(GCS_HTTP_POOL_SIZE_CONFIG_KEY) or DEFAULT_HTTP_POOL_SIZE))
+
+        self._buckets: typing.Dict[str, typing.Any] = {}
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        logger.info(f"Initialized GCS client for project {self._project_id} ({self._backend} backend)")
+
+    @property
+    def project_id(self) -> str:
+        """GCP project ID used for new buckets"""
+        return self._project_id
+
+    @property
+    def client(self) -> typing.Any:
+        """Underlying storage client"""
+        return self._client
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def get_bucket(self, bucket_name: str) -> typing.Any:
+        """Gets a bucket, caching it for later operations
+
+        Args:
+            bucket_name: Bucket name
+
+        Returns:
+            Bucket
+        """
+        bucket = self._buckets.get(bucket_name)
+        if bucket is not None:
+            return bucket
+        try:
+            bucket = self._client.get_bucket(bucket_name)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, bucket_name) from e
+        self._buckets[bucket_name] = bucket
+        return bucket
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        """Checks whether a bucket exists
+
+        Args:
+            bucket_name: Bucket name
+
+        Returns:
+            True if the bucket exists
+        """
+        try:
+            self.get_bucket(bucket_name)
+            return True
+        except (NotFound, ResourceError):
+            return False
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def create_bucket(self, bucket_name: str, location: str = None, storage_class: str = None,
+                      labels: dict = None) -> typing.Any:
+        """Creates a bucket, or returns it if it already exists
+
+        Args:
+            bucket_name: Bucket name
+            location: Bucket location (defaults to the client location)
+            storage_class: Storage class such as STANDARD or NEARLINE
+            labels: Bucket labels
+
+        Returns:
+            Bucket
+        """
+        try:
+            bucket = self._client.bucket(bucket_name)
+            if storage_class:
+                bucket.storage_class = storage_class
+            if labels:
+                bucket.labels = labels
+            bucket = self._client.create_bucket(bucket, location=location or self._location)
+        except Conflict:
+            return self.get_bucket(bucket_name)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, bucket_name) from e
+        self._buckets[bucket_name] = bucket
+        logger.info(f"Created GCS bucket {bucket_name}")
+        return bucket
+
+    def delete_bucket(self, bucket_name: str, force: bool = False) -> bool:
+        """Deletes a bucket
+
+        Args:
+            bucket_name: Bucket name
+            force: Delete the objects in the bucket first
+
+        Returns:
+            True once the bucket is deleted
+        """
+        try:
+            self.get_bucket(bucket_name).delete(force=force)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, bucket_name) from e
+        finally:
+            self._buckets.pop(bucket_name, None)
+        return True
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def list_buckets(self, max_results: int = None, prefix: str = None) -> typing.List[str]:
+        """Lists bucket names
+
+        Args:
+            max_results: Maximum number of buckets
+            prefix: Only list buckets whose names start with this prefix
+
+        Returns:
+            List of bucket names
+        """
+        try:
+            return [bucket.name for bucket in self._client.list_buckets(max_results=max_results, prefix=prefix)]
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, "buckets") from e
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def list_blobs(self, bucket_name: str, prefix: str = None, delimiter: str = None,
+                   pattern: str = None) -> typing.List[str]:
+        """Lists object names in a bucket
+
+        Args:
+            bucket_name: Bucket name
+            prefix: Only list names starting with this prefix
+            delimiter: Leave out names containing the delimiter after the prefix
+            pattern: Optional glob pattern the names must match
+
+        Returns:
+            List of object names
+        """
+        try:
+            names = [blob.name for blob in self.get_bucket(bucket_name).list_blobs(prefix=prefix, delimiter=delimiter)]
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, bucket_name) from e
+        if pattern and pattern != "*":
+            names = [name for name in names if fnmatch.fnmatchcase(name, pattern)
+                     or fnmatch.fnmatchcase(name.rsplit("/", 1)[-1], pattern)]
+        return names
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def get_blob(self, bucket_name: str, blob_name: str) -> typing.Any:
+        """Gets an object with its properties loaded
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+
+        Returns:
+            Blob
+
+        Raises:
+            ResourceError: If the object does not exist
+        """
+        resource_name = f"{bucket_name}/{blob_name}"
+        try:
+            blob = self.get_bucket(bucket_name).get_blob(blob_name)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, resource_name) from e
+        if blob is None:
+            raise map_gcs_exception_to_pipeline_error(NotFound(f"Object {resource_name} not found"), resource_name)
+        return blob
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def blob_exists(self, bucket_name: str, blob_name: str) -> bool:
+        """Checks whether an object exists
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+
+        Returns:
+            True if the object exists
+        """
+        try:
+            return bool(self.get_bucket(bucket_name).blob(blob_name).exists())
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, f"{bucket_name}/{blob_name}") from e
+
+    def get_blob_metadata(self, bucket_name: str, blob_name: str) -> dict:
+        """Gets object properties together with its custom metadata
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+
+        Returns:
+            Dictionary of name, size, content type, checksums and generation, plus custom metadata keys
+        """
+        return self._describe_blob(self.get_blob(bucket_name, blob_name))
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def update_blob_metadata(self, bucket_name: str, blob_name: str, metadata: dict) -> dict:
+        """Merges custom metadata into an object
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+            metadata: Custom metadata to set
+
+        Returns:
+            Updated object properties as returned by get_blob_metadata
+        """
+        blob = self.get_blob(bucket_name, blob_name)
+        try:
+            blob.metadata = {**(blob.metadata or {}), **metadata}
+            blob.patch()
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, f"{bucket_name}/{blob_name}") from e
+        return self._describe_blob(blob)
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def upload_file(self, bucket_name: str, source_file_path: str, destination_blob_name: str,
+                    content_type: str = None, metadata: dict = None) -> typing.Any:
+        """Uploads a local file, as a parallel composite upload when it is large
+
+        Args:
+            bucket_name: Bucket name
+            source_file_path: Local file to upload
+            destination_blob_name: Object name
+            content_type: Content type of the object
+            metadata: Custom metadata
+
+        Returns:
+            Uploaded blob
+        """
+        resource_name = f"{bucket_name}/{destination_blob_name}"
+        try:
+            bucket = self.get_bucket(bucket_name)
+            size = os.path.getsize(source_file_path) if os.path.isfile(source_file_path) else 0
+            if size >= self._composite_upload_threshold:
+                return self._upload_composite(bucket, destination_blob_name, source_file_path, size,
+                                              content_type, metadata)
+
+            blob = bucket.blob(destination_blob_name)
+            if metadata:
+                blob.metadata = metadata
+            blob.upload_from_filename(source_file_path, content_type=content_type)
+            return blob
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, resource_name) from e
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def upload_from_string(self, bucket_name: str, contents: typing.Union[str, bytes], destination_blob_name: str,
+                           content_type: str = None, metadata: dict = None) -> typing.Any:
+        """Uploads a string or bytes, as a parallel composite upload when it is large
+
+        Args:
+            bucket_name: Bucket name
+            contents: Data to upload
+            destination_blob_name: Object name
+            content_type: Content type of the object
+            metadata: Custom metadata
+
+        Returns:
+            Uploaded blob
+        """
+        resource_name = f"{bucket_name}/{destination_blob_name}"
+        try:
+            bucket = self.get_bucket(bucket_name)
+            if isinstance(contents, (bytes, bytearray)) and len(contents) >= self._composite_upload_threshold:
+                return self._upload_composite(bucket, destination_blob_name, bytes(contents), len(contents),
+                                              content_type, metadata)
+
+            blob = bucket.blob(destination_blob_name)
+            if metadata:
+                blob.metadata = metadata
+            blob.upload_from_string(contents, content_type=content_type)
+            return blob
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, resource_name) from e
+
+    def upload_string(self, bucket_name: str, destination_blob_name: str, contents: typing.Union[str, bytes],
+                      content_type: str = None) -> typing.Any:
+        """Uploads a string, taking the object name before the contents
+
+        Args:
+            bucket_name: Bucket name
+            destination_blob_name: Object name
+            contents: Data to upload
+            content_type: Content type (defaults to one derived from the object name)
+
+        Returns:
+            Uploaded blob
+        """
+        return self.upload_from_string(bucket_name, contents, destination_blob_name,
+                                       content_type=content_type or get_content_type(file_path=destination_blob_name))
+
+    def upload_blob(self, bucket_name: str, source_data: typing.Any, destination_blob_name: str,
+                    content_type: str = None, metadata: dict = None) -> dict:
+        """Uploads bytes, a string or a local file path and describes the result
+
+        Args:
+            bucket_name: Bucket name
+            source_data: Bytes or string data, or the path of a local file
+            destination_blob_name: Object name
+            content_type: Content type (defaults to one derived from the object name)
+            metadata: Custom metadata
+
+        Returns:
+            Dictionary with name, size, md5_hash, crc32c and generation of the object
+        """
+        content_type = content_type or get_content_type(file_path=destination_blob_name)
+        if isinstance(source_data, str) and os.path.isfile(source_data):
+            blob = self.upload_file(bucket_name, source_data, destination_blob_name, content_type, metadata)
+        else:
+            blob = self.upload_from_string(bucket_name, source_data, destination_blob_name, content_type, metadata)
+        return self._describe_blob(blob)
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def download_as_string(self, bucket_name: str, blob_name: str, encoding: str = "utf-8") -> str:
+        """Downloads an object as text
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+            encoding: Text encoding
+
+        Returns:
+            Object contents
+        """
+        try:
+            return self.get_bucket(bucket_name).blob(blob_name).download_as_text(encoding=encoding)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, f"{bucket_name}/{blob_name}") from e
+
+    def download_blob_as_bytes(self, bucket_name: str, blob_name: str, start: int = None, end: int = None,
+                               verify_checksum: bool = True) -> bytes:
+        """Downloads an object, or a byte range of it, as bytes
+
+        Whole large objects are downloaded as parallel slices into a preallocated buffer.
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+            start: First byte of the range to download
+            end: Last byte (inclusive) of the range to download
+            verify_checksum: Check whole-object downloads against the object's CRC32C
+
+        Returns:
+            Object contents
+        """
+        if start is not None or end is not None:
+            blob = self.get_bucket(bucket_name).blob(blob_name)
+            return self._download_range(blob, start or 0, end)
+
+        blob = self.get_blob(bucket_name, blob_name)
+        buffer = bytearray(blob.size or 0)
+        self._download_into(blob, memoryview(buffer))
+        if verify_checksum:
+            verify_crc32c(buffer, blob.crc32c, f"{bucket_name}/{blob_name}")
+        return bytes(buffer)
+
+    def download_blob(self, bucket_name: str, blob_name: str, destination_file_path: str = None,
+                      verify_checksum: bool = True) -> typing.Union[bytes, str]:
+        """Downloads an object into memory or into a local file
+
+        Large objects are downloaded as parallel slices. File downloads preallocate the
+        destination and write the slices through a memory map, so no slice is buffered twice.
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+            destination_file_path: Local file to write; the contents are returned when omitted
+            verify_checksum: Check the download against the object's CRC32C
+
+        Returns:
+            Object contents, or the destination path
+        """
+        if destination_file_path is None:
+            return self.download_blob_as_bytes(bucket_name, blob_name, verify_checksum=verify_checksum)
+
+        resource_name = f"{bucket_name}/{blob_name}"
+        blob = self.get_blob(bucket_name, blob_name)
+        size = blob.size or 0
+        with open(destination_file_path, "w+b") as handle:
+            handle.truncate(size)
+            if size:
+                with mmap.mmap(handle.fileno(), size) as mapped:
+                    self._download_into(blob, memoryview(mapped))
+                    if verify_checksum:
+                        verify_crc32c(mapped, blob.crc32c, resource_name)
+        return destination_file_path
+
+    def open_blob(self, bucket_name: str, blob_name: str, block_size: int = None) -> GCSRangeReader:
+        """Opens an object as a seekable file object that reads byte ranges on demand
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+            block_size: Size of cached read blocks (defaults to the configured block size)
+
+        Returns:
+            GCSRangeReader, usable with pyarrow.parquet, fastavro and similar readers
+        """
+        blob = self.get_blob(bucket_name, blob_name)
+        pinned = self.get_bucket(bucket_name).blob(blob_name, generation=blob.generation)
+        return GCSRangeReader(pinned, blob.size or 0, block_size or self._range_block_size)
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def copy_blob(self, bucket_name: str, blob_name: str, destination_bucket_name: str,
+                  destination_blob_name: str = None) -> dict:
+        """Copies an object within Cloud Storage
+
+        Args:
+            bucket_name: Source bucket name
+            blob_name: Source object name
+            destination_bucket_name: Destination bucket name
+            destination_blob_name: Destination object name (defaults to the source name)
+
+        Returns:
+            Destination object properties as returned by get_blob_metadata, plus a metadata key
+        """
+        try:
+            source_bucket = self.get_bucket(bucket_name)
+            copied = source_bucket.copy_blob(source_bucket.blob(blob_name), self.get_bucket(destination_bucket_name),
+                                             destination_blob_name or blob_name)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, f"{bucket_name}/{blob_name}") from e
+        description = self._describe_blob(copied)
+        description["metadata"] = dict(copied.metadata or {})
+        return description
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def delete_blob(self, bucket_name: str, blob_name: str) -> bool:
+        """Deletes an object
+
+        Args:
+            bucket_name: Bucket name
+            blob_name: Object name
+
+        Returns:
+            True once the object is deleted
+        """
+        try:
+            self.get_bucket(bucket_name).blob(blob_name).delete()
+            return True
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, f"{bucket_name}/{blob_name}") from e
+
+    def close(self) -> None:
+        """Stops the transfer worker threads"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Returns the shared transfer thread pool, creating it on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="gcs-transfer"
+                )
+            return self._executor
+
+    @retry(max_attempts=3, exceptions_to_retry=[ConnectionError])
+    def _download_range(self, blob: typing.Any, start: int, end: typing.Optional[int]) -> bytes:
+        """Downloads the inclusive byte range start..end of an object"""
+        try:
+            # Ranged responses carry no whole-object checksum to validate
+            return blob.download_as_bytes(start=start, end=end, checksum=None)
+        except GoogleAPICallError as e:
+            raise map_gcs_exception_to_pipeline_error(e, f"{blob.bucket.name}/{blob.name}") from e
+
+    def _download_into(self, blob: typing.Any, target: memoryview) -> None:
+        """Fills a preallocated buffer with an object, in parallel slices when it is large"""
+        size = len(target)
+        if size == 0:
+            return
+        if size < self._sliced_download_threshold:
+            target[:] = self._download_range(blob, 0, size - 1)
+            return
+
+        # Pin the generation so every slice reads the same version of the object
+        pinned = blob.bucket.blob(blob.name, generation=blob.generation)
+
+        def download_slice(start: int) -> None:
+            end = min(start + self._slice_size, size) - 1
+            data = self._download_range(pinned, start, end)
+            if len(data) != end - start + 1:
+                raise ConnectionError(f"Short read of {blob.name} bytes {start}-{end}", service_name="gcs",
+                                      connection_details={"received": len(data)}, retryable=True)
+            target[start:end + 1] = data
+
+        futures = [self._get_executor().submit(download_slice, start) for start in range(0, size, self._slice_size)]
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+        logger.debug(f"Downloaded {blob.name} ({size} bytes) in {len(futures)} parallel slices")
+
+    def _upload_composite(self, bucket: typing.Any, destination_blob_name: str,
+                          source: typing.Union[str, bytes], size: int, content_type: str = None,
+                          metadata: dict = None) -> typing.Any:
+        """Uploads parts in parallel and composes them into the destination object"""
+        part_size = max(self._composite_part_size, math.ceil(size / MAX_COMPOSE_COMPONENTS))
+        prefix = f"{destination_blob_name}.parts-{uuid.uuid4().hex}/"
+
+        def upload_part(index: int) -> typing.Any:
+            start = index * part_size
+            length = min(part_size, size - start)
+            if isinstance(source, bytes):
+                data = source[start:start + length]
+            else:
+                with open(source, "rb") as handle:
+                    handle.seek(start)
+                    data = handle.read(length)
+            part = bucket.blob(f"{prefix}{index:02d}")
+            part.upload_from_string(data, content_type=DEFAULT_CONTENT_TYPE)
+            return part
+
+        part_count = math.ceil(size / part_size)
+        futures = [self._get_executor().submit(upload_part, index) for index in range(part_count)]
+        parts = []
+        try:
+            for future in futures:
+                parts.append(future.result())
+            destination = bucket.blob(destination_blob_name)
+            destination.content_type = content_type or DEFAULT_CONTENT_TYPE
+            if metadata:
+                destination.metadata = metadata
+            destination.compose(parts)
+        finally:
+            concurrent.futures.wait(futures)
+            uploaded = [future.result() for future in futures if future.exception() is None]
+            if uploaded:
+                bucket.delete_blobs(uploaded, on_error=lambda blob: None)
+
+        # Composite objects have no MD5 hash, so the CRC32C is the integrity check
+        destination.reload()
+        if isinstance(source, bytes):
+            verify_crc32c(source, destination.crc32c, f"{bucket.name}/{destination_blob_name}")
+        else:
+            with open(source, "rb") as handle:
+                verify_crc32c(handle, destination.crc32c, f"{bucket.name}/{destination_blob_name}")
+        logger.info(f"Uploaded {destination_blob_name} ({size} bytes) as a composite of {part_count} parts")
+        return destination
+
+    def _describe_blob(self, blob: typing.Any) -> dict:
+        """Summarizes object properties, followed by its custom metadata"""
+        return {
+            "name": blob.name,
+            "bucket": blob.bucket.name,
+            "size": blob.size,
+            "content_type": blob.content_type,
+            "md5_hash": blob.md5_hash,
+            "crc32c": blob.crc32c,
+            "generation": blob.generation,
+            "updated": blob.updated,
+            **(blob.metadata or {})
+        }
+
+    def _configure_http_pool(self, pool_size: int) -> None:
+        """Sizes the shared HTTP connection pool for parallel transfers
+
+        Args:
+            pool_size: Maximum number of pooled connections per host
+        """
+        http = getattr(self._client, "_http", None)
+        if http is None or not hasattr(http, "mount"):
+            return
+        try:
+            import requests.adapters  # version 2.31.0+
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size,
+                                                    pool_maxsize=max(pool_size, self._max_workers))
+            http.mount("https://", adapter)
+        except Exception as e:
+            logger.debug(f"Could not resize GCS HTTP connection pool: {str(e)}")
+
+
+def create_gcs_client(project_id: str = None, backend: str = None) -> GCSClient:
+    """Gets the shared Cloud Storage client for a project
+
+    Args:
+        project_id: GCP project ID (defaults to the detected project)
+        backend: "gcs" or "local" (defaults to the gcs.backend setting)
+
+    Returns:
+        Shared GCSClient
+    """
+    backend = backend or get_config().get(GCS_BACKEND_CONFIG_KEY) or BACKEND_GCS
+    key = (backend, project_id)
+
+    with _shared_clients_lock:
+        shared = _shared_clients.get(key)
+    if shared is None:
+        shared = GCSClient(project_id=project_id, backend=backend)
+        with _shared_clients_lock:
+            shared = _shared_clients.setdefault(key, shared)
+    return shared
+
+
+def get_gcs_client() -> typing.Any:
+    """Gets the shared underlying storage client for the default project
+
+    Returns:
+        google.cloud.storage.Client, or the local store for the local backend
+    """
+    return create_gcs_client().client
@@ -0,0 +1,242 @@
+"""
+Keyset (cursor) pagination for repository list queries.
+
+LIMIT/OFFSET pagination makes BigQuery scan and discard every row before the requested
+page, so deep pages get slower linearly. Keyset pagination instead resumes after the last
+row of the previous page:
+- Pages are ordered by a sort column plus a unique tiebreaker column, so the order is total.
+- The last row's sort value and tiebreaker ID are encoded into an opaque URL-safe
+  cursor token that clients pass back unchanged to fetch the next page.
+- Repositories decode the cursor into a predicate selecting only rows after that position.
+  BigQuery cannot compare row tuples with < or >, so (sort_key, id) < (x, y) is expanded
+  to sort_key < x OR (sort_key = x AND id < y).
+"""
+
+import base64
+import binascii
+import datetime
+import enum
+import json
+import typing
+
+from ..logging.logger import get_logger
+from ..errors.error_types import ValidationError
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Cursor token format version, bumped if the encoded payload changes
+CURSOR_VERSION = 1
+
+# Query parameter names used by keyset predicates
+CURSOR_SORT_KEY_PARAM = "cursor_sort_key"
+CURSOR_ID_PARAM = "cursor_id"
+
+# Cursor specification: an encoded token or a (sort_value, tiebreaker_id) tuple
+Cursor = typing.Union[str, typing.Tuple[typing.Any, typing.Any]]
+
+
+def _encode_value(value: typing.Any) -> typing.List[typing.Any]:
+    """Encodes a sort value as a [type, value] pair that survives a JSON round trip"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return ["ts", value.isoformat()]
+    if isinstance(value, datetime.date):
+        return ["date", value.isoformat()]
+    if isinstance(value, enum.Enum):
+        return _encode_value(value.value)
+    return ["v", value]
+
+
+def _decode_value(encoded: typing.List[typing.Any]) -> typing.Any:
+    """Decodes a [type, value] pair produced by _encode_value"""
+    value_type, value = encoded
+    if value_type == "ts":
+        return datetime.datetime.fromisoformat(value)
+    if value_type == "date":
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(sort_value: typing.Any, tiebreaker_id: typing.Any, sort_by: str = None) -> str:
+    """Encodes the position of a row into an opaque cursor token
+
+    Args:
+        sort_value: Value of the sort column for the last row of a page
+        tiebreaker_id: Unique ID of that row
+        sort_by: Name of the sort column, checked when the cursor is decoded
+
+    Returns:
+        URL-safe cursor token
+    """
+    payload = {"v": CURSOR_VERSION, "k": _encode_value(sort_value), "i": tiebreaker_id}
+    if sort_by:
+        payload["s"] = sort_by
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str = None) -> typing.Tuple[typing.Any, typing.Any]:
+    """Decodes a cursor token into the position it encodes
+
+    Args:
+        cursor: Cursor token produced by encode_cursor
+        sort_by: Expected sort column; cursors issued for another sort order are rejected
+
+    Returns:
+        Tuple of (sort_value, tiebreaker_id)
+
+    Raises:
+        ValidationError: If the token is malformed or was issued for another sort column
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        if payload.get("v") != CURSOR_VERSION:
+            raise ValueError(f"unsupported cursor version {payload.get('v')}")
+        position = (_decode_value(payload["k"]), payload["i"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValidationError("Invalid pagination cursor", validation_details={"cursor": cursor, "reason": str(e)})
+
+    if sort_by and payload.get("s") and payload["s"] != sort_by:
+        raise ValidationError(
+            "Pagination cursor does not match the requested sort order",
+            validation_details={"cursor_sort_by": payload["s"], "sort_by": sort_by}
+        )
+    return position
+
+
+def resolve_cursor(after: typing.Optional[Cursor], sort_by: str = None) -> typing.Optional[typing.Tuple[typing.Any, typing.Any]]:
+    """Normalizes a cursor token or position tuple into a position tuple
+
+    Args:
+        after: Cursor token, (sort_value, tiebreaker_id) tuple, or None
+        sort_by: Expected sort column for cursor tokens
+
+    Returns:
+        Tuple of (sort_value, tiebreaker_id), or None for the first page
+    """
+    if after is None or after == "":
+        return None
+    if isinstance(after, str):
+        return decode_cursor(after, sort_by)
+    sort_value, tiebreaker_id = after
+    return sort_value, tiebreaker_id
+
+
+def _parameter_type(value: typing.Any) -> str:
+    """Maps a sort value to its BigQuery parameter type"""
+    if isinstance(value, datetime.datetime):
+        return "TIMESTAMP"
+    if isinstance(value, datetime.date):
+        return "DATE"
+    if isinstance(value, bool):
+        return "BOOL"
+    if isinstance(value, int):
+        return "INT64"
+    if isinstance(value, float):
+        return "FLOAT64"
+    return "STRING"
+
+
+def _parameter_value(value: typing.Any) -> typing.Any:
+    """Formats a sort value for a REST-style query parameter"""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def build_keyset_condition(
+    sort_column: str,
+    id_column: str,
+    after: typing.Optional[Cursor],
+    descending: bool = True,
+    sort_by: str = None
+) -> typing.Tuple[str, typing.List[dict]]:
+    """Builds the predicate selecting rows after a cursor position
+
+    Rows with a NULL sort value never satisfy the predicate, so the sort column should be
+    non-nullable.
+
+    Args:
+        sort_column: Column the page is ordered by
+        id_column: Unique tiebreaker column
+        after: Cursor token or (sort_value, tiebreaker_id) tuple; None for the first page
+        descending: Whether the page is ordered descending
+        sort_by: Expected sort column recorded in cursor tokens (defaults to sort_column)
+
+    Returns:
+        Tuple of (SQL predicate without a leading AND/WHERE, REST-style query parameters);
+        an empty predicate and no parameters for the first page
+    """
+    position = resolve_cursor(after, sort_by or sort_column)
+    if position is None:
+        return "", []
+
+    sort_value, tiebreaker_id = position
+    operator = "<" if descending else ">"
+    condition = (
+        f"({sort_column} {operator} @{CURSOR_SORT_KEY_PARAM} OR "
+        f"({sort_column} = @{CURSOR_SORT_KEY_PARAM} AND {id_column} {operator} @{CURSOR_ID_PARAM}))"
+    )
+    parameters = [
+        {
+            "name": CURSOR_SORT_KEY_PARAM,
+            "parameterType": {"type": _parameter_type(sort_value)},
+            "parameterValue": {"value": _parameter_value(sort_value)}
+        },
+        {
+            "name": CURSOR_ID_PARAM,
+            "parameterType": {"type": _parameter_type(tiebreaker_id)},
+            "parameterValue": {"value": _parameter_value(tiebreaker_id)}
+        }
+    ]
+    return condition, parameters
+
+
+def build_keyset_order_by(sort_column: str, id_column: str, descending: bool = True) -> str:
+    """Builds an ORDER BY clause that is total thanks to the tiebreaker column
+
+    Args:
+        sort_column: Column the page is ordered by
+        id_column: Unique tiebreaker column
+        descending: Whether the page is ordered descending
+
+    Returns:
+        ORDER BY clause
+    """
+    direction = "DESC" if descending else "ASC"
+    return f"ORDER BY {sort_column} {direction}, {id_column} {direction}"
+
+
+def _get_field(item: typing.Any, field: str) -> typing.Any:
+    """Reads a field from a row dictionary or a model object"""
+    if isinstance(item, dict):
+        return item.get(field)
+    return getattr(item, field, None)
+
+
+def get_next_cursor(
+    items: typing.Sequence[typing.Any],
+    sort_field: str,
+    id_field: str,
+    limit: int,
+    sort_by: str = None
+) -> typing.Optional[str]:
+    """Builds the cursor for the page following a list of results
+
+    Args:
+        items: Rows or model objects of the current page, in page order
+        sort_field: Attribute or key holding the sort value
+        id_field: Attribute or key holding the tiebreaker ID
+        limit: Page size the items were fetched with
+        sort_by: Sort column to record in the cursor (defaults to sort_field)
+
+    Returns:
+        Cursor token, or None if the page was the last one
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(_get_field(last, sort_field), _get_field(last, id_field), sort_by or sort_field)
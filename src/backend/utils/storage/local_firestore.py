@@ -0,0 +1,663 @@
+"""
+In-process Firestore stand-in implementing the subset of google.cloud.firestore the
+pipeline uses.
+
+Documents live in a dictionary keyed by collection path and document ID. Setting
+firestore.local_database to a file path also persists every committed write to SQLite,
+so local tools keep their state across restarts; ":memory:" (the default) keeps
+everything in the process. Queries support where filters, order_by with the implicit
+document ID tie-breaker, limit, offset, start_at/start_after cursors and select
+projections, following Firestore's semantics for documents missing a filtered or
+ordered field. Batches are applied atomically and are limited to 500 writes.
+
+FirestoreClient selects this backend when firestore.backend is "local", so trackers and
+repositories can be tested and benchmarked without network access.
+"""
+
+import base64
+import collections
+import copy
+import datetime
+import functools
+import json
+import sqlite3
+import threading
+import typing
+import uuid
+
+from google.api_core.exceptions import NotFound, Conflict, InvalidArgument  # version 2.10.0+
+
+from ..logging.logger import get_logger
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_LOCAL_PROJECT = "local-project"
+DEFAULT_LOCAL_DATABASE = ":memory:"
+MAX_BATCH_WRITES = 500
+
+# Query directions, matching google.cloud.firestore.Query
+ASCENDING = "ASCENDING"
+DESCENDING = "DESCENDING"
+
+# Filter operators that only match values of the same type as the operand
+RANGE_OPERATORS = {"<", "<=", ">", ">=", "!=", "not-in"}
+
+# Marker for fields missing from a document
+_MISSING = object()
+
+# Firestore's cross-type ordering: null < boolean < number < timestamp < string < bytes < array < map
+_TYPE_RANKS = (
+    (type(None), 0),
+    (bool, 1),
+    ((int, float), 2),
+    (datetime.datetime, 3),
+    (str, 4),
+    (bytes, 5),
+    ((list, tuple), 6),
+    (dict, 7)
+)
+
+
+def _get_field(data: dict, field_path: str) -> typing.Any:
+    """Reads a dotted field path, returning _MISSING if any part is absent"""
+    value = data
+    for part in field_path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _set_field(data: dict, field_path: str, value: typing.Any) -> None:
+    """Writes a dotted field path, creating intermediate maps"""
+    parts = field_path.split(".")
+    for part in parts[:-1]:
+        child = data.get(part)
+        if not isinstance(child, dict):
+            child = data[part] = {}
+        data = child
+    data[parts[-1]] = value
+
+
+def _merge_maps(target: dict, source: dict) -> None:
+    """Merges nested maps the way set(..., merge=True) does"""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_maps(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def _project(data: dict, field_paths: typing.Iterable[str]) -> dict:
+    """Keeps only the given field paths of a document"""
+    projected = {}
+    for field_path in field_paths:
+        value = _get_field(data, field_path)
+        if value is not _MISSING:
+            _set_field(projected, field_path, copy.deepcopy(value))
+    return projected
+
+
+def _sort_value(value: typing.Any) -> tuple:
+    """Converts a value to a key ordered like Firestore orders mixed-type values"""
+    for types, rank in _TYPE_RANKS:
+        if isinstance(value, types):
+            break
+    else:
+        return 8, str(value)
+
+    if rank == 3:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return rank, value.timestamp()
+    if rank == 6:
+        return rank, tuple(_sort_value(item) for item in value)
+    if rank == 7:
+        return rank, tuple((key, _sort_value(item)) for key, item in sorted(value.items()))
+    return rank, value
+
+
+def _compare_positions(left: typing.Sequence[tuple], right: typing.Sequence[tuple],
+                       directions: typing.Sequence[str]) -> int:
+    """Compares two sort positions field by field, honouring each field's direction"""
+    for left_value, right_value, direction in zip(left, right, directions):
+        if left_value != right_value:
+            result = -1 if left_value < right_value else 1
+            return -result if direction == DESCENDING else result
+    return 0
+
+
+def _matches(value: typing.Any, op: str, operand: typing.Any) -> bool:
+    """Evaluates one where filter against a field value"""
+    if value is _MISSING:
+        return False
+
+    key = _sort_value(value)
+    if op == "==":
+        return key == _sort_value(operand)
+    if op == "in":
+        return key in {_sort_value(item) for item in operand}
+    if op == "array_contains":
+        return isinstance(value, list) and _sort_value(operand) in {_sort_value(item) for item in value}
+    if op == "array_contains_any":
+        wanted = {_sort_value(item) for item in operand}
+        return isinstance(value, list) and any(_sort_value(item) in wanted for item in value)
+
+    if value is None:
+        return False
+    if op == "!=":
+        return key != _sort_value(operand)
+    if op == "not-in":
+        return key not in {_sort_value(item) for item in operand}
+
+    operand_key = _sort_value(operand)
+    if key[0] != operand_key[0]:
+        return False
+    if op == "<":
+        return key < operand_key
+    if op == "<=":
+        return key <= operand_key
+    if op == ">":
+        return key > operand_key
+    if op == ">=":
+        return key >= operand_key
+    raise InvalidArgument(f"Unsupported filter operator: {op}")
+
+
+def _encode_value(value: typing.Any) -> typing.Any:
+    """JSON encoder hook for values JSON cannot represent"""
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Unsupported Firestore value type: {type(value).__name__}")
+
+
+def _decode_value(value: dict) -> typing.Any:
+    """JSON decoder hook reversing _encode_value"""
+    if len(value) == 1:
+        if "__datetime__" in value:
+            return datetime.datetime.fromisoformat(value["__datetime__"])
+        if "__bytes__" in value:
+            return base64.b64decode(value["__bytes__"])
+    return value
+
+
+class LocalDocumentSnapshot:
+    """Point-in-time view of a local document"""
+
+    def __init__(self, reference: "LocalDocumentReference", data: typing.Optional[dict],
+                 read_time: datetime.datetime = None):
+        self._reference = reference
+        self._data = data
+        self.read_time = read_time
+
+    @property
+    def id(self) -> str:
+        """Document ID"""
+        return self._reference.id
+
+    @property
+    def reference(self) -> "LocalDocumentReference":
+        """Reference to the document"""
+        return self._reference
+
+    @property
+    def exists(self) -> bool:
+        """Whether the document existed when it was read"""
+        return self._data is not None
+
+    def to_dict(self) -> typing.Optional[dict]:
+        """Returns a copy of the document data, or None if it does not exist"""
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field_path: str) -> typing.Any:
+        """Returns one field of the document
+
+        Args:
+            field_path: Dotted path of the field
+
+        Returns:
+            Field value
+
+        Raises:
+            KeyError: If the field does not exist
+        """
+        value = _get_field(self._data or {}, field_path)
+        if value is _MISSING:
+            raise KeyError(field_path)
+        return copy.deepcopy(value)
+
+
+class LocalDocumentReference:
+    """Reference to a document in the local store"""
+
+    def __init__(self, client: "LocalFirestoreClient", collection_path: str, document_id: str):
+        self._client = client
+        self._collection_path = collection_path
+        self.id = document_id
+
+    @property
+    def path(self) -> str:
+        """Slash-separated path of the document"""
+        return f"{self._collection_path}/{self.id}"
+
+    @property
+    def parent(self) -> "LocalCollectionReference":
+        """Collection containing the document"""
+        return LocalCollectionReference(self._client, self._collection_path)
+
+    def collection(self, collection_id: str) -> "LocalCollectionReference":
+        """Returns a subcollection of the document"""
+        return LocalCollectionReference(self._client, f"{self.path}/{collection_id}")
+
+    def get(self, field_paths: typing.Iterable[str] = None, transaction: typing.Any = None) -> LocalDocumentSnapshot:
+        """Reads the document
+
+        Args:
+            field_paths: Optional fields to return instead of the whole document
+            transaction: Unused, accepted for interface compatibility
+
+        Returns:
+            Document snapshot
+        """
+        return next(iter(self._client.get_all([self], field_paths=field_paths)))
+
+    def set(self, document_data: dict, merge: bool = False) -> datetime.datetime:
+        """Creates or overwrites the document, or merges into it when merge is True"""
+        return self._client._commit([("set", self, document_data, merge)])
+
+    def create(self, document_data: dict) -> datetime.datetime:
+        """Creates the document, failing if it already exists"""
+        return self._client._commit([("create", self, document_data, False)])
+
+    def update(self, field_updates: dict) -> datetime.datetime:
+        """Updates fields, given as dotted paths, of an existing document"""
+        return self._client._commit([("update", self, field_updates, False)])
+
+    def delete(self) -> datetime.datetime:
+        """Deletes the document; deleting a missing document is not an error"""
+        return self._client._commit([("delete", self, None, False)])
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, LocalDocumentReference) and other.path == self.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+
+class LocalQuery:
+    """Immutable query over one local collection"""
+
+    def __init__(self, client: "LocalFirestoreClient", collection_path: str,
+                 filters: typing.Tuple[tuple, ...] = (), orders: typing.Tuple[tuple, ...] = (),
+                 limit: int = None, offset: int = 0, cursor: tuple = None,
+                 projection: typing.Tuple[str, ...] = None):
+        self._client = client
+        self._collection_path = collection_path
+        self._filters = filters
+        self._orders = orders
+        self._limit = limit
+        self._offset = offset
+        self._cursor = cursor
+        self._projection = projection
+
+    def _copy(self, **changes) -> "LocalQuery":
+        """Returns a copy of the query with some attributes replaced"""
+        settings = {
+            "filters": self._filters,
+            "orders": self._orders,
+            "limit": self._limit,
+            "offset": self._offset,
+            "cursor": self._cursor,
+            "projection": self._projection
+        }
+        settings.update(changes)
+        return LocalQuery(self._client, self._collection_path, **settings)
+
+    def where(self, field_path: str = None, op_string: str = None, value: typing.Any = None,
+              filter: typing.Any = None) -> "LocalQuery":
+        """Adds a filter, given positionally or as a FieldFilter-like object"""
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        if op_string not in {"==", "!=", "<", "<=", ">", ">=", "in", "not-in",
+                             "array_contains", "array_contains_any"}:
+            raise InvalidArgument(f"Unsupported filter operator: {op_string}")
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path: str, direction: str = ASCENDING) -> "LocalQuery":
+        """Adds a sort order"""
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count: int) -> "LocalQuery":
+        """Limits the number of returned documents"""
+        return self._copy(limit=count)
+
+    def offset(self, num_to_skip: int) -> "LocalQuery":
+        """Skips documents before returning results"""
+        return self._copy(offset=num_to_skip)
+
+    def select(self, field_paths: typing.Iterable[str]) -> "LocalQuery":
+        """Returns only the given fields of each document"""
+        return self._copy(projection=tuple(field_paths))
+
+    def start_after(self, document_fields_or_snapshot: typing.Any) -> "LocalQuery":
+        """Starts results after a snapshot or a mapping of order-by field values"""
+        return self._copy(cursor=(document_fields_or_snapshot, False))
+
+    def start_at(self, document_fields_or_snapshot: typing.Any) -> "LocalQuery":
+        """Starts results at a snapshot or a mapping of order-by field values"""
+        return self._copy(cursor=(document_fields_or_snapshot, True))
+
+    def get(self, transaction: typing.Any = None) -> typing.List[LocalDocumentSnapshot]:
+        """Runs the query and returns all snapshots"""
+        return list(self.stream())
+
+    def stream(self, transaction: typing.Any = None) -> typing.Iterator[LocalDocumentSnapshot]:
+        """Runs the query and yields document snapshots in order"""
+        orders = self._effective_orders()
+        directions = [direction for _, direction in orders] + [orders[-1][1] if orders else ASCENDING]
+
+        documents = []
+        for document_id, data in self._client._read_collection(self._collection_path):
+            if not all(_matches(_get_field(data, field), op, value) for field, op, value in self._filters):
+                continue
+            position = [_get_field(data, field) for field, _ in orders]
+            if _MISSING in position:
+                # Firestore leaves out documents that lack an ordered field
+                continue
+            documents.append((tuple(_sort_value(value) for value in position) + ((4, document_id),),
+                              document_id, data))
+
+        documents.sort(key=functools.cmp_to_key(lambda a, b: _compare_positions(a[0], b[0], directions)))
+
+        if self._cursor is not None:
+            cursor_position, inclusive = self._cursor_position(orders)
+            documents = [
+                document for document in documents
+                if _compare_positions(document[0], cursor_position, directions) > (-1 if inclusive else 0)
+            ]
+
+        documents = documents[self._offset or 0:]
+        if self._limit is not None:
+            documents = documents[:self._limit]
+
+        self._client._stats["documents_read"] += max(len(documents), 1)
+        read_time = datetime.datetime.now(datetime.timezone.utc)
+        for _, document_id, data in documents:
+            reference = LocalDocumentReference(self._client, self._collection_path, document_id)
+            if self._projection is not None:
+                data = _project(data, self._projection)
+            yield LocalDocumentSnapshot(reference, data, read_time)
+
+    def _effective_orders(self) -> typing.List[tuple]:
+        """Explicit orders, or the inequality field first as Firestore orders implicitly"""
+        if self._orders:
+            return list(self._orders)
+        for field, op, _ in self._filters:
+            if op in RANGE_OPERATORS:
+                return [(field, ASCENDING)]
+        return []
+
+    def _cursor_position(self, orders: typing.List[tuple]) -> typing.Tuple[tuple, bool]:
+        """Converts the cursor to a sort position comparable with document positions"""
+        cursor, inclusive = self._cursor
+        if isinstance(cursor, LocalDocumentSnapshot):
+            data = cursor._data or {}
+            values = [_get_field(data, field) for field, _ in orders]
+            if _MISSING in values:
+                raise InvalidArgument("Cursor snapshot is missing an order_by field")
+            return tuple(_sort_value(value) for value in values) + ((4, cursor.id),), inclusive
+
+        # Field values only position on the explicit orders, like a partial cursor
+        values = [cursor[field] for field, _ in orders if field in cursor]
+        return tuple(_sort_value(value) for value in values), inclusive
+
+
+class LocalCollectionReference(LocalQuery):
+    """Reference to a collection in the local store"""
+
+    def __init__(self, client: "LocalFirestoreClient", collection_path: str):
+        super().__init__(client, collection_path)
+
+    @property
+    def id(self) -> str:
+        """Collection ID, the last segment of its path"""
+        return self._collection_path.rsplit("/", 1)[-1]
+
+    def document(self, document_id: str = None) -> LocalDocumentReference:
+        """Returns a reference to a document, generating an ID if none is given"""
+        return LocalDocumentReference(self._client, self._collection_path, document_id or uuid.uuid4().hex[:20])
+
+    def add(self, document_data: dict, document_id: str = None) -> typing.Tuple[datetime.datetime, LocalDocumentReference]:
+        """Creates a document and returns its write time and reference"""
+        reference = self.document(document_id)
+        return reference.create(document_data), reference
+
+    def list_documents(self, page_size: int = None) -> typing.Iterator[LocalDocumentReference]:
+        """Yields references to every document in the collection"""
+        for document_id, _ in self._client._read_collection(self._collection_path):
+            yield self.document(document_id)
+
+
+class LocalWriteBatch:
+    """Collects writes and applies them atomically on commit"""
+
+    def __init__(self, client: "LocalFirestoreClient"):
+        self._client = client
+        self._writes: typing.List[tuple] = []
+
+    def set(self, reference: LocalDocumentReference, document_data: dict, merge: bool = False) -> None:
+        """Adds a set of a document"""
+        self._writes.append(("set", reference, document_data, merge))
+
+    def create(self, reference: LocalDocumentReference, document_data: dict) -> None:
+        """Adds a create of a document that must not exist"""
+        self._writes.append(("create", reference, document_data, False))
+
+    def update(self, reference: LocalDocumentReference, field_updates: dict) -> None:
+        """Adds an update of an existing document"""
+        self._writes.append(("update", reference, field_updates, False))
+
+    def delete(self, reference: LocalDocumentReference) -> None:
+        """Adds a delete of a document"""
+        self._writes.append(("delete", reference, None, False))
+
+    def commit(self) -> typing.List[datetime.datetime]:
+        """Applies every write, or none of them if one fails
+
+        Returns:
+            One write time per write
+        """
+        if len(self._writes) > MAX_BATCH_WRITES:
+            raise InvalidArgument(f"A batch can contain at most {MAX_BATCH_WRITES} writes")
+        writes, self._writes = self._writes, []
+        write_time = self._client._commit(writes)
+        return [write_time] * len(writes)
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+    def __enter__(self) -> "LocalWriteBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+
+class LocalFirestoreClient:
+    """In-process document store with the google.cloud.firestore.Client interface"""
+
+    def __init__(self, project: str = None, database_path: str = None):
+        """Initializes the local store
+
+        Args:
+            project: Project ID reported to callers
+            database_path: SQLite file persisting documents, or ":memory:" to keep them in process
+        """
+        self.project = project or DEFAULT_LOCAL_PROJECT
+        self._database_path = database_path or DEFAULT_LOCAL_DATABASE
+        self._documents: typing.Dict[str, typing.Dict[str, dict]] = {}
+        self._lock = threading.RLock()
+        self._stats = collections.Counter()
+
+        self._connection = None
+        if self._database_path != DEFAULT_LOCAL_DATABASE:
+            self._connection = sqlite3.connect(self._database_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "collection TEXT NOT NULL, document_id TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (collection, document_id))"
+            )
+            for collection_path, document_id, data in self._connection.execute(
+                    "SELECT collection, document_id, data FROM documents"):
+                self._documents.setdefault(collection_path, {})[document_id] = json.loads(
+                    data, object_hook=_decode_value)
+
+        logger.info(f"Initialized local Firestore backend on {self._database_path}")
+
+    def collection(self, *collection_path: str) -> LocalCollectionReference:
+        """Returns a reference to a collection, given as one path or path segments"""
+        path = "/".join(collection_path)
+        if path.count("/") % 2:
+            raise InvalidArgument(f"Invalid collection path: {path}")
+        return LocalCollectionReference(self, path)
+
+    def document(self, *document_path: str) -> LocalDocumentReference:
+        """Returns a reference to a document, given as one path or path segments"""
+        path = "/".join(document_path)
+        if not path.count("/") % 2:
+            raise InvalidArgument(f"Invalid document path: {path}")
+        collection_path, document_id = path.rsplit("/", 1)
+        return LocalDocumentReference(self, collection_path, document_id)
+
+    def collections(self) -> typing.Iterator[LocalCollectionReference]:
+        """Yields the top-level collections containing documents"""
+        with self._lock:
+            paths = sorted(path for path, documents in self._documents.items() if documents and "/" not in path)
+        for path in paths:
+            yield LocalCollectionReference(self, path)
+
+    def batch(self) -> LocalWriteBatch:
+        """Returns a new write batch"""
+        return LocalWriteBatch(self)
+
+    def get_all(self, references: typing.Iterable[LocalDocumentReference], field_paths: typing.Iterable[str] = None,
+                transaction: typing.Any = None) -> typing.Iterator[LocalDocumentSnapshot]:
+        """Reads several documents in one call
+
+        Args:
+            references: Documents to read
+            field_paths: Optional fields to return instead of whole documents
+            transaction: Unused, accepted for interface compatibility
+
+        Returns:
+            Iterator of snapshots, including ones for missing documents
+        """
+        references = list(references)
+        with self._lock:
+            found = [self._documents.get(ref._collection_path, {}).get(ref.id) for ref in references]
+            self._stats["documents_read"] += len(references)
+            self._stats["read_calls"] += 1
+
+        read_time = datetime.datetime.now(datetime.timezone.utc)
+        for reference, data in zip(references, found):
+            if data is not None and field_paths is not None:
+                data = _project(data, field_paths)
+            yield LocalDocumentSnapshot(reference, data, read_time)
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        """Returns read and write counters, useful when benchmarking access patterns
+
+        Returns:
+            Dictionary with documents_read, documents_written, read_calls and commits
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["documents"] = sum(len(documents) for documents in self._documents.values())
+        return stats
+
+    def close(self) -> None:
+        """Closes the SQLite connection, if any"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _read_collection(self, collection_path: str) -> typing.List[typing.Tuple[str, dict]]:
+        """Returns the documents of a collection as (document ID, data) pairs"""
+        with self._lock:
+            self._stats["read_calls"] += 1
+            return list(self._documents.get(collection_path, {}).items())
+
+    def _commit(self, writes: typing.List[tuple]) -> datetime.datetime:
+        """Applies writes atomically
+
+        Args:
+            writes: (operation, reference, data, merge) tuples
+
+        Returns:
+            Write time
+        """
+        write_time = datetime.datetime.now(datetime.timezone.utc)
+        with self._lock:
+            # Writes build on copies of the touched documents so a failing write leaves
+            # the store unchanged; stored documents are replaced, never mutated, which
+            # lets snapshots share them until to_dict is called
+            staged: typing.Dict[typing.Tuple[str, str], typing.Optional[dict]] = {}
+            for operation, reference, data, merge in writes:
+                key = (reference._collection_path, reference.id)
+                current = staged[key] if key in staged else self._documents.get(key[0], {}).get(key[1])
+
+                if operation == "create":
+                    if current is not None:
+                        raise Conflict(f"Document already exists: {reference.path}")
+                    staged[key] = copy.deepcopy(data)
+                elif operation == "set":
+                    if merge and current is not None:
+                        current = copy.deepcopy(current)
+                        _merge_maps(current, data)
+                        staged[key] = current
+                    else:
+                        staged[key] = copy.deepcopy(data)
+                elif operation == "update":
+                    if current is None:
+                        raise NotFound(f"No document to update: {reference.path}")
+                    current = copy.deepcopy(current)
+                    for field_path, value in data.items():
+                        _set_field(current, field_path, copy.deepcopy(value))
+                    staged[key] = current
+                else:
+                    staged[key] = None
+
+            for (collection_path, document_id), data in staged.items():
+                documents = self._documents.setdefault(collection_path, {})
+                if data is None:
+                    documents.pop(document_id, None)
+                else:
+                    documents[document_id] = data
+
+            if self._connection is not None:
+                self._persist(staged)
+
+            self._stats["documents_written"] += len(writes)
+            self._stats["commits"] += 1
+        return write_time
+
+    def _persist(self, staged: typing.Dict[typing.Tuple[str, str], typing.Optional[dict]]) -> None:
+        """Writes committed changes to SQLite in one transaction"""
+        with self._connection:
+            for (collection_path, document_id), data in staged.items():
+                if data is None:
+                    self._connection.execute(
+                        "DELETE FROM documents WHERE collection = ? AND document_id = ?",
+                        (collection_path, document_id)
+                    )
+                else:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO documents (collection, document_id, data) VALUES (?, ?, ?)",
+                        (collection_path, document_id, json.dumps(data, default=_encode_value))
+                    )
@@ -0,0 +1,418 @@
+"""
+Local-filesystem stand-in implementing the subset of google.cloud.storage the pipeline uses.
+
+Buckets are directories under a root directory and objects are files within them, so
+fixtures can be dropped in with ordinary file tools. Object properties (content type,
+custom metadata, checksums and generation) are kept in JSON sidecar files under
+<root>/.gcs_metadata. Uploads are written to a temporary file and renamed into place,
+so readers never see partial objects. Ranged downloads, compose and copy behave like
+their Cloud Storage counterparts, including inclusive byte ranges and composite objects
+carrying only a CRC32C checksum.
+
+GCSClient selects this backend when gcs.backend is "local", which lets the file
+extractor, staging service and benchmarks run without network access.
+"""
+
+import datetime
+import fnmatch
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import typing
+
+from google.api_core.exceptions import NotFound, Conflict, BadRequest  # version 2.10.0+
+
+from ..logging.logger import get_logger
+from .gcs_client import compute_crc32c, compute_md5, MAX_COMPOSE_COMPONENTS
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Default settings
+DEFAULT_LOCAL_PROJECT = "local-project"
+METADATA_DIRECTORY = ".gcs_metadata"
+COPY_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class LocalBlob:
+    """Object in a local bucket"""
+
+    def __init__(self, name: str, bucket: "LocalBucket", generation: int = None, chunk_size: int = None):
+        self.name = name
+        self.bucket = bucket
+        self.content_type: typing.Optional[str] = None
+        self.metadata: typing.Optional[dict] = None
+        self.size: typing.Optional[int] = None
+        self.md5_hash: typing.Optional[str] = None
+        self.crc32c: typing.Optional[str] = None
+        self.generation: typing.Optional[int] = generation
+        self.updated: typing.Optional[datetime.datetime] = None
+        self.time_created: typing.Optional[datetime.datetime] = None
+        self.component_count: typing.Optional[int] = None
+        self.chunk_size = chunk_size
+
+    @property
+    def path(self) -> str:
+        """Local file holding the object data"""
+        return os.path.join(self.bucket.path, *self.name.split("/"))
+
+    @property
+    def _metadata_path(self) -> str:
+        return os.path.join(self.bucket.client.root_path, METADATA_DIRECTORY, self.bucket.name,
+                            *self.name.split("/")) + ".json"
+
+    def exists(self, client: typing.Any = None) -> bool:
+        """Checks whether the object exists"""
+        return os.path.isfile(self.path)
+
+    def reload(self, client: typing.Any = None) -> None:
+        """Loads the object properties
+
+        Raises:
+            NotFound: If the object does not exist
+        """
+        if not self.exists():
+            raise NotFound(f"No such object: {self.bucket.name}/{self.name}")
+
+        properties = {}
+        if os.path.isfile(self._metadata_path):
+            with open(self._metadata_path, "r", encoding="utf-8") as handle:
+                properties = json.load(handle)
+
+        stat = os.stat(self.path)
+        self.size = stat.st_size
+        self.content_type = properties.get("content_type")
+        self.metadata = properties.get("metadata")
+        self.md5_hash = properties.get("md5_hash")
+        self.crc32c = properties.get("crc32c")
+        self.generation = properties.get("generation") or int(stat.st_mtime_ns // 1000)
+        self.component_count = properties.get("component_count")
+        self.updated = datetime.datetime.fromtimestamp(stat.st_mtime, tz=datetime.timezone.utc)
+        self.time_created = self.updated
+
+    def upload_from_string(self, data: typing.Union[str, bytes], content_type: str = None, **kwargs) -> None:
+        """Writes the object from a string or bytes"""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+            content_type = content_type or "text/plain"
+        self._write(lambda handle: handle.write(data), content_type, compute_md5(data), compute_crc32c(data))
+
+    def upload_from_filename(self, filename: str, content_type: str = None, **kwargs) -> None:
+        """Writes the object from a local file"""
+        with open(filename, "rb") as source:
+            self.upload_from_file(source, content_type=content_type)
+
+    def upload_from_file(self, file_obj: typing.BinaryIO, size: int = None, content_type: str = None, **kwargs) -> None:
+        """Writes the object from a binary file object, reading at most size bytes"""
+        data = file_obj.read() if size is None else file_obj.read(size)
+        self.upload_from_string(bytes(data), content_type=content_type or "application/octet-stream")
+
+    def download_as_bytes(self, start: int = None, end: int = None, **kwargs) -> bytes:
+        """Reads the object, or the inclusive byte range start..end of it"""
+        if not self.exists():
+            raise NotFound(f"No such object: {self.bucket.name}/{self.name}")
+        with open(self.path, "rb") as handle:
+            handle.seek(start or 0)
+            if end is None:
+                return handle.read()
+            return handle.read(max(end - (start or 0) + 1, 0))
+
+    def download_as_string(self, start: int = None, end: int = None, **kwargs) -> bytes:
+        """Alias of download_as_bytes kept by the Cloud Storage library"""
+        return self.download_as_bytes(start=start, end=end)
+
+    def download_as_text(self, start: int = None, end: int = None, encoding: str = "utf-8", **kwargs) -> str:
+        """Reads the object as text"""
+        return self.download_as_bytes(start=start, end=end).decode(encoding)
+
+    def download_to_file(self, file_obj: typing.BinaryIO, start: int = None, end: int = None, **kwargs) -> None:
+        """Copies the object, or a byte range of it, into a file object"""
+        file_obj.write(self.download_as_bytes(start=start, end=end))
+
+    def download_to_filename(self, filename: str, start: int = None, end: int = None, **kwargs) -> None:
+        """Copies the object, or a byte range of it, into a local file"""
+        if start is None and end is None:
+            if not self.exists():
+                raise NotFound(f"No such object: {self.bucket.name}/{self.name}")
+            shutil.copyfile(self.path, filename)
+            return
+        with open(filename, "wb") as handle:
+            self.download_to_file(handle, start=start, end=end)
+
+    def patch(self, client: typing.Any = None) -> None:
+        """Saves changed content type and custom metadata"""
+        if not self.exists():
+            raise NotFound(f"No such object: {self.bucket.name}/{self.name}")
+        properties = self._read_properties()
+        properties["content_type"] = self.content_type
+        properties["metadata"] = self.metadata
+        self._write_properties(properties)
+
+    def compose(self, sources: typing.List["LocalBlob"], client: typing.Any = None, **kwargs) -> None:
+        """Concatenates source objects of the same bucket into this object
+
+        Raises:
+            BadRequest: If there are too many sources or one is in another bucket
+        """
+        if not sources or len(sources) > MAX_COMPOSE_COMPONENTS:
+            raise BadRequest(f"compose takes 1 to {MAX_COMPOSE_COMPONENTS} source objects")
+        if any(source.bucket.name != self.bucket.name for source in sources):
+            raise BadRequest("compose sources must be in the destination bucket")
+
+        def write_sources(handle):
+            for source in sources:
+                if not source.exists():
+                    raise NotFound(f"No such object: {source.bucket.name}/{source.name}")
+                with open(source.path, "rb") as part:
+                    shutil.copyfileobj(part, handle, COPY_CHUNK_BYTES)
+
+        component_count = sum((source._read_properties().get("component_count") or 1) for source in sources)
+        # Composite objects only carry a CRC32C checksum, like in Cloud Storage
+        self._write(write_sources, self.content_type or sources[0]._read_properties().get("content_type"),
+                    None, None, component_count=component_count)
+
+    def delete(self, client: typing.Any = None) -> None:
+        """Deletes the object
+
+        Raises:
+            NotFound: If the object does not exist
+        """
+        if not self.exists():
+            raise NotFound(f"No such object: {self.bucket.name}/{self.name}")
+        os.remove(self.path)
+        if os.path.isfile(self._metadata_path):
+            os.remove(self._metadata_path)
+
+    def _read_properties(self) -> dict:
+        """Returns the stored sidecar properties"""
+        if not os.path.isfile(self._metadata_path):
+            return {}
+        with open(self._metadata_path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _write_properties(self, properties: dict) -> None:
+        """Atomically replaces the sidecar properties"""
+        os.makedirs(os.path.dirname(self._metadata_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self._metadata_path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(properties, handle)
+        os.replace(temp_path, self._metadata_path)
+
+    def _write(self, writer: typing.Callable[[typing.BinaryIO], typing.Any], content_type: typing.Optional[str],
+               md5_hash: typing.Optional[str], crc32c: typing.Optional[str], component_count: int = None) -> None:
+        """Writes object data to a temporary file and renames it into place"""
+        if not self.bucket.exists():
+            raise NotFound(f"No such bucket: {self.bucket.name}")
+
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                writer(handle)
+            if crc32c is None:
+                with open(temp_path, "rb") as handle:
+                    crc32c = compute_crc32c(handle)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._write_properties({
+            "content_type": content_type or self.content_type or "application/octet-stream",
+            "metadata": self.metadata,
+            "md5_hash": md5_hash,
+            "crc32c": crc32c,
+            "generation": time.time_ns() // 1000,
+            "component_count": component_count
+        })
+        self.reload()
+
+
+class LocalBucket:
+    """Bucket backed by a local directory"""
+
+    def __init__(self, client: "LocalStorageClient", name: str):
+        self.client = client
+        self.name = name
+        self.location = client.location
+        self.storage_class = "STANDARD"
+        self.labels: dict = {}
+
+    @property
+    def path(self) -> str:
+        """Directory holding the bucket objects"""
+        return os.path.join(self.client.root_path, self.name)
+
+    def exists(self, client: typing.Any = None) -> bool:
+        """Checks whether the bucket exists"""
+        return os.path.isdir(self.path)
+
+    def blob(self, blob_name: str, generation: int = None, chunk_size: int = None, **kwargs) -> LocalBlob:
+        """Returns a reference to an object without reading it"""
+        return LocalBlob(blob_name, self, generation=generation, chunk_size=chunk_size)
+
+    def get_blob(self, blob_name: str, generation: int = None, **kwargs) -> typing.Optional[LocalBlob]:
+        """Returns an object with its properties loaded, or None if it does not exist"""
+        blob = self.blob(blob_name)
+        if not blob.exists():
+            return None
+        blob.reload()
+        return blob
+
+    def list_blobs(self, prefix: str = None, delimiter: str = None, max_results: int = None,
+                   match_glob: str = None, **kwargs) -> typing.List[LocalBlob]:
+        """Lists objects in name order
+
+        Args:
+            prefix: Only list names starting with this prefix
+            delimiter: Leave out names containing the delimiter after the prefix
+            max_results: Maximum number of objects
+            match_glob: Only list names matching this glob pattern
+
+        Returns:
+            List of objects with their properties loaded
+        """
+        if not self.exists():
+            raise NotFound(f"No such bucket: {self.name}")
+
+        names = []
+        for directory, subdirectories, files in os.walk(self.path):
+            for filename in files:
+                if filename.startswith(".upload-"):
+                    continue
+                relative = os.path.relpath(os.path.join(directory, filename), self.path)
+                names.append(relative.replace(os.sep, "/"))
+
+        blobs = []
+        for name in sorted(names):
+            if prefix and not name.startswith(prefix):
+                continue
+            if delimiter and delimiter in name[len(prefix or ""):]:
+                continue
+            if match_glob and not fnmatch.fnmatchcase(name, match_glob):
+                continue
+            blob = self.blob(name)
+            blob.reload()
+            blobs.append(blob)
+            if max_results is not None and len(blobs) >= max_results:
+                break
+        return blobs
+
+    def copy_blob(self, blob: LocalBlob, destination_bucket: "LocalBucket", new_name: str = None,
+                  **kwargs) -> LocalBlob:
+        """Copies an object, keeping its properties"""
+        if not blob.exists():
+            raise NotFound(f"No such object: {self.name}/{blob.name}")
+        properties = blob._read_properties()
+        destination = destination_bucket.blob(new_name or blob.name)
+        destination.metadata = properties.get("metadata")
+
+        def copy_data(handle):
+            with open(blob.path, "rb") as source:
+                shutil.copyfileobj(source, handle, COPY_CHUNK_BYTES)
+
+        destination._write(copy_data, properties.get("content_type"), properties.get("md5_hash"),
+                           properties.get("crc32c"), component_count=properties.get("component_count"))
+        return destination
+
+    def delete_blob(self, blob_name: str, **kwargs) -> None:
+        """Deletes an object by name"""
+        self.blob(blob_name).delete()
+
+    def delete_blobs(self, blobs: typing.Iterable[typing.Union[str, LocalBlob]],
+                     on_error: typing.Callable = None, **kwargs) -> None:
+        """Deletes several objects, calling on_error for missing ones if given"""
+        for blob in blobs:
+            blob = self.blob(blob) if isinstance(blob, str) else blob
+            try:
+                blob.delete()
+            except NotFound:
+                if on_error is None:
+                    raise
+                on_error(blob)
+
+    def delete(self, force: bool = False, client: typing.Any = None) -> None:
+        """Deletes the bucket
+
+        Raises:
+            NotFound: If the bucket does not exist
+            Conflict: If the bucket is not empty and force is False
+        """
+        if not self.exists():
+            raise NotFound(f"No such bucket: {self.name}")
+        if os.listdir(self.path) and not force:
+            raise Conflict(f"Bucket {self.name} is not empty")
+        shutil.rmtree(self.path)
+        shutil.rmtree(os.path.join(self.client.root_path, METADATA_DIRECTORY, self.name), ignore_errors=True)
+
+
+class LocalStorageClient:
+    """Local-filesystem object store with the google.cloud.storage.Client interface"""
+
+    def __init__(self, project: str = None, root_path: str = None, location: str = None):
+        """Initializes the local store
+
+        Args:
+            project: Project ID reported to callers
+            root_path: Directory holding one subdirectory per bucket (defaults to a new temporary directory)
+            location: Location reported for buckets
+        """
+        self.project = project or DEFAULT_LOCAL_PROJECT
+        self.location = location or "US"
+        self.root_path = root_path or tempfile.mkdtemp(prefix="local-gcs-")
+        os.makedirs(self.root_path, exist_ok=True)
+        self._lock = threading.Lock()
+        logger.info(f"Initialized local GCS backend in {self.root_path}")
+
+    def bucket(self, bucket_name: str, user_project: str = None) -> LocalBucket:
+        """Returns a reference to a bucket without checking that it exists"""
+        return LocalBucket(self, bucket_name)
+
+    def get_bucket(self, bucket_or_name: typing.Union[str, LocalBucket], **kwargs) -> LocalBucket:
+        """Returns an existing bucket
+
+        Raises:
+            NotFound: If the bucket does not exist
+        """
+        bucket = self.bucket(getattr(bucket_or_name, "name", bucket_or_name))
+        if not bucket.exists():
+            raise NotFound(f"No such bucket: {bucket.name}")
+        return bucket
+
+    def lookup_bucket(self, bucket_name: str, **kwargs) -> typing.Optional[LocalBucket]:
+        """Returns an existing bucket, or None"""
+        bucket = self.bucket(bucket_name)
+        return bucket if bucket.exists() else None
+
+    def create_bucket(self, bucket_or_name: typing.Union[str, LocalBucket], location: str = None,
+                      **kwargs) -> LocalBucket:
+        """Creates a bucket
+
+        Raises:
+            Conflict: If the bucket already exists
+        """
+        bucket = self.bucket(getattr(bucket_or_name, "name", bucket_or_name))
+        if bucket_or_name is not None and hasattr(bucket_or_name, "labels"):
+            bucket.labels = dict(bucket_or_name.labels or {})
+        with self._lock:
+            if bucket.exists():
+                raise Conflict(f"Bucket {bucket.name} already exists")
+            os.makedirs(bucket.path)
+        bucket.location = location or self.location
+        return bucket
+
+    def list_buckets(self, max_results: int = None, prefix: str = None, **kwargs) -> typing.List[LocalBucket]:
+        """Lists buckets in name order"""
+        names = sorted(
+            name for name in os.listdir(self.root_path)
+            if name != METADATA_DIRECTORY and os.path.isdir(os.path.join(self.root_path, name))
+            and (not prefix or name.startswith(prefix))
+        )
+        if max_results is not None:
+            names = names[:max_results]
+        return [self.bucket(name) for name in names]
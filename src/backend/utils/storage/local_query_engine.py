@@ -0,0 +1,863 @@
+"""
+Embedded local query engine implementing the BigQueryClient interface on DuckDB.
+
+Datasets map to DuckDB schemas and tables to DuckDB tables. Parquet files found under
+the configured data directory (<data_path>/<dataset>/<table>.parquet, or a directory of
+Parquet files per table) are attached as views and materialized on first write, so
+benchmark fixtures can be dropped in as files. Queries written for BigQuery are
+translated for the common constructs the repositories use: backtick table references,
+@name parameters and a handful of BigQuery-specific functions.
+
+The engine runs fully in process with no network access, which makes it suitable for
+repository tests, local development and performance benchmarks.
+"""
+
+import datetime
+import decimal
+import glob
+import os
+import re
+import threading
+import typing
+
+from google.api_core.exceptions import NotFound  # version 2.10.0+
+
+from ...constants import FileFormat
+from ...config import get_config
+from ..logging.logger import get_logger
+from ..errors.error_types import ConfigurationError
+from .bigquery_client import (
+    QueryParameter,
+    get_table_schema,
+    normalize_query_parameters,
+    resolve_table_reference
+)
+
+try:
+    import duckdb  # version 0.9.0+
+except ImportError:  # pragma: no cover - optional dependency
+    duckdb = None
+
+try:
+    import pyarrow  # version 12.0.0+
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Configuration keys
+LOCAL_DATABASE_CONFIG_KEY = "bigquery.local_database"
+LOCAL_DATA_PATH_CONFIG_KEY = "bigquery.local_data_path"
+
+# Default settings
+DEFAULT_LOCAL_PROJECT = "local-project"
+DEFAULT_LOCAL_DATABASE = ":memory:"
+DEFAULT_BATCH_ROWS = 65536
+
+# BigQuery to DuckDB column types
+DUCKDB_TYPES = {
+    "STRING": "VARCHAR",
+    "INTEGER": "BIGINT",
+    "INT64": "BIGINT",
+    "FLOAT": "DOUBLE",
+    "FLOAT64": "DOUBLE",
+    "NUMERIC": "DECIMAL(38, 9)",
+    "BIGNUMERIC": "DOUBLE",
+    "BOOLEAN": "BOOLEAN",
+    "BOOL": "BOOLEAN",
+    "TIMESTAMP": "TIMESTAMPTZ",
+    "DATETIME": "TIMESTAMP",
+    "DATE": "DATE",
+    "TIME": "TIME",
+    "BYTES": "BLOB",
+    "JSON": "VARCHAR",
+    "GEOGRAPHY": "VARCHAR"
+}
+
+# DuckDB to BigQuery column types, matched by prefix
+BIGQUERY_TYPES = [
+    ("VARCHAR", "STRING"), ("BIGINT", "INT64"), ("INTEGER", "INT64"), ("DOUBLE", "FLOAT64"),
+    ("DECIMAL", "NUMERIC"), ("BOOLEAN", "BOOL"), ("TIMESTAMP WITH TIME ZONE", "TIMESTAMP"),
+    ("TIMESTAMP", "DATETIME"), ("DATE", "DATE"), ("TIME", "TIME"), ("BLOB", "BYTES"), ("STRUCT", "RECORD")
+]
+
+# Macros standing in for BigQuery functions
+BIGQUERY_COMPAT_MACROS = [
+    "CREATE OR REPLACE MACRO safe_divide(a, b) AS CASE WHEN b = 0 THEN NULL ELSE a / b END",
+    "CREATE OR REPLACE MACRO timestamp_sub(ts, delta) AS ts - delta",
+    "CREATE OR REPLACE MACRO timestamp_add(ts, delta) AS ts + delta",
+    "CREATE OR REPLACE MACRO datetime_sub(ts, delta) AS ts - delta",
+    "CREATE OR REPLACE MACRO datetime_add(ts, delta) AS ts + delta",
+    "CREATE OR REPLACE MACRO date_sub(d, delta) AS CAST(d - delta AS DATE)",
+    "CREATE OR REPLACE MACRO date_add(d, delta) AS CAST(d + delta AS DATE)",
+    "CREATE OR REPLACE MACRO json_extract_scalar(j, path) AS json_extract_string(j, path)",
+    "CREATE OR REPLACE MACRO json_value(j, path) AS json_extract_string(j, path)",
+    "CREATE OR REPLACE MACRO ifnull(a, b) AS coalesce(a, b)",
+    "CREATE OR REPLACE MACRO unix_seconds(ts) AS CAST(epoch(ts) AS BIGINT)",
+    "CREATE OR REPLACE MACRO timestamp_seconds(seconds) AS to_timestamp(seconds)",
+    "CREATE OR REPLACE MACRO div(a, b) AS a // b",
+    "CREATE OR REPLACE MACRO is_nan(x) AS isnan(x)",
+    "CREATE OR REPLACE MACRO is_inf(x) AS isinf(x)"
+]
+
+# Query rewrites applied before execution
+_TABLE_REFERENCE_PATTERN = re.compile(r"`([^`]+)`")
+_PARAMETER_PATTERN = re.compile(r"(?<![@\w])@(\w+)")
+_TIMESTAMP_DIFF_PATTERN = re.compile(r"\b(?:TIMESTAMP|DATETIME|DATE)_DIFF\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*(\w+)\s*\)",
+                                     re.IGNORECASE)
+_FUNCTION_RENAMES = [
+    (re.compile(r"\bCOUNTIF\(", re.IGNORECASE), "count_if("),
+    (re.compile(r"\bSAFE_CAST\(", re.IGNORECASE), "TRY_CAST("),
+    (re.compile(r"\bCURRENT_TIMESTAMP\(\)", re.IGNORECASE), "CURRENT_TIMESTAMP"),
+    (re.compile(r"\bCURRENT_DATE\(\)", re.IGNORECASE), "CURRENT_DATE"),
+    (re.compile(r"\bFLOAT64\b", re.IGNORECASE), "DOUBLE"),
+    (re.compile(r"\bINT64\b", re.IGNORECASE), "BIGINT"),
+    (re.compile(r"\bIN\s+UNNEST\(\s*(\$\w+)\s*\)", re.IGNORECASE), r"= ANY(\1)"),
+    (re.compile(r"\bAPPROX_QUANTILES\(\s*([^,()]+?)\s*,\s*(\d+)\s*\)\s*\[\s*OFFSET\(\s*(\d+)\s*\)\s*\]", re.IGNORECASE),
+     lambda m: f"quantile_disc({m.group(1)}, {int(m.group(3)) / int(m.group(2))})"),
+    (re.compile(r"\bAPPROX_TOP_COUNT\(\s*([^,()]+?)\s*,\s*1\s*\)\s*\[\s*OFFSET\(\s*0\s*\)\s*\]\.value\b",
+                re.IGNORECASE), r"mode(\1)"),
+]
+
+
+def translate_query(query: str) -> str:
+    """Translates BigQuery SQL into the DuckDB dialect
+
+    Args:
+        query: BigQuery Standard SQL query
+
+    Returns:
+        Equivalent DuckDB query
+    """
+    def replace_reference(match):
+        segments = match.group(1).split(".")
+        # project.dataset.table and dataset.table both map to schema.table
+        return ".".join(f'"{segment}"' for segment in segments[-2:])
+
+    translated = _TABLE_REFERENCE_PATTERN.sub(replace_reference, query)
+    translated = _PARAMETER_PATTERN.sub(r"$\1", translated)
+    translated = _TIMESTAMP_DIFF_PATTERN.sub(lambda m: f"date_diff('{m.group(3).lower()}', {m.group(2)}, {m.group(1)})",
+                                             translated)
+    for pattern, replacement in _FUNCTION_RENAMES:
+        translated = pattern.sub(replacement, translated)
+    return translated
+
+
+def to_duckdb_type(field: typing.Any) -> str:
+    """Maps a BigQuery schema field to a DuckDB column type
+
+    Args:
+        field: bigquery.SchemaField
+
+    Returns:
+        DuckDB type declaration
+    """
+    field_type = field.field_type.upper()
+    if field_type in ("RECORD", "STRUCT"):
+        members = ", ".join(f'"{child.name}" {to_duckdb_type(child)}' for child in field.fields)
+        column_type = f"STRUCT({members})"
+    else:
+        column_type = DUCKDB_TYPES.get(field_type, "VARCHAR")
+    if field.mode == "REPEATED":
+        column_type = f"{column_type}[]"
+    return column_type
+
+
+def to_parameter_value(parameter: QueryParameter) -> typing.Any:
+    """Converts a typed query parameter into a DuckDB parameter value
+
+    Args:
+        parameter: Typed query parameter
+
+    Returns:
+        Python value with the parameter's type
+    """
+    def convert(value, parameter_type):
+        if value is None or not isinstance(value, str):
+            return value
+        if parameter_type == "INT64":
+            return int(value)
+        if parameter_type == "FLOAT64":
+            return float(value)
+        if parameter_type == "NUMERIC":
+            return decimal.Decimal(value)
+        if parameter_type == "BOOL":
+            return value.lower() == "true"
+        if parameter_type in ("TIMESTAMP", "DATETIME"):
+            return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parameter_type == "DATE":
+            return datetime.date.fromisoformat(value)
+        return value
+
+    if parameter.parameter_type == "ARRAY":
+        return [convert(item, parameter.array_type) for item in parameter.value or []]
+    return convert(parameter.value, parameter.parameter_type)
+
+
+class LocalQueryResult:
+    """Query result mirroring the parts of the BigQuery RowIterator used by callers"""
+
+    def __init__(self, table: typing.Any):
+        """Initializes the result
+
+        Args:
+            table: pyarrow.Table with the query results
+        """
+        self._table = table
+        self._rows = None
+
+    @property
+    def total_rows(self) -> int:
+        """Number of result rows"""
+        return self._table.num_rows
+
+    @property
+    def schema(self) -> typing.Any:
+        """Arrow schema of the result"""
+        return self._table.schema
+
+    def to_arrow(self, **kwargs) -> typing.Any:
+        """Returns the results as a pyarrow.Table"""
+        return self._table
+
+    def to_arrow_iterable(self, **kwargs) -> typing.Iterator[typing.Any]:
+        """Returns the results as an iterator of pyarrow.RecordBatch objects"""
+        return iter(self._table.to_batches(max_chunksize=DEFAULT_BATCH_ROWS))
+
+    def to_dataframe(self, **kwargs) -> typing.Any:
+        """Returns the results as a pandas DataFrame"""
+        return self._table.to_pandas()
+
+    def _get_rows(self) -> typing.List[dict]:
+        if self._rows is None:
+            self._rows = self._table.to_pylist()
+        return self._rows
+
+    def __iter__(self):
+        return iter(self._get_rows())
+
+    def __len__(self):
+        return self._table.num_rows
+
+    def __getitem__(self, index):
+        return self._get_rows()[index]
+
+
+class LocalTable:
+    """Table metadata returned by LocalBigQueryClient.get_table"""
+
+    def __init__(self, project: str, dataset_id: str, table_id: str, schema: typing.List[typing.Any], num_rows: int):
+        self.project = project
+        self.dataset_id = dataset_id
+        self.table_id = table_id
+        self.schema = schema
+        self.num_rows = num_rows
+
+    @property
+    def full_table_id(self) -> str:
+        """Fully qualified table ID"""
+        return f"{self.project}.{self.dataset_id}.{self.table_id}"
+
+
+class LocalBigQueryClient:
+    """In-process DuckDB query engine with the BigQueryClient interface"""
+
+    def __init__(self, project_id: str = None, database_path: str = None, data_path: str = None):
+        """Initializes the local engine
+
+        Args:
+            project_id: Project ID reported to callers (table references ignore it)
+            database_path: DuckDB database file, or ":memory:" (defaults to configuration)
+            data_path: Directory of Parquet files to attach as tables (defaults to configuration)
+        """
+        if duckdb is None or pyarrow is None:
+            raise ConfigurationError(
+                "The local BigQuery backend requires the duckdb and pyarrow packages",
+                config_details={"backend": "local"}
+            )
+
+        config = get_config()
+        self._project_id = project_id or DEFAULT_LOCAL_PROJECT
+        self._database_path = database_path or config.get(LOCAL_DATABASE_CONFIG_KEY) or DEFAULT_LOCAL_DATABASE
+        self._data_path = data_path or config.get(LOCAL_DATA_PATH_CONFIG_KEY)
+        self._ddl_lock = threading.Lock()
+        self._insert_ids: typing.Dict[str, typing.Set[str]] = {}
+
+        self._connection = duckdb.connect(self._database_path)
+        for macro in BIGQUERY_COMPAT_MACROS:
+            self._connection.execute(macro)
+        if self._data_path:
+            self.attach_parquet_directory(self._data_path)
+
+        logger.info(f"Initialized local query engine on {self._database_path}")
+
+    @property
+    def project_id(self) -> str:
+        """Project ID used for table references"""
+        return self._project_id
+
+    @property
+    def project(self) -> str:
+        """Alias of project_id matching the BigQuery client"""
+        return self._project_id
+
+    @property
+    def location(self) -> str:
+        """Location of the local engine"""
+        return "local"
+
+    @property
+    def client(self) -> typing.Any:
+        """Underlying DuckDB connection"""
+        return self._connection
+
+    def execute_query(self, query: str, parameters: typing.Any = None, timeout: int = None,
+                      job_config: typing.Any = None) -> LocalQueryResult:
+        """Executes a query and returns its results
+
+        Args:
+            query: BigQuery SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Ignored by the local engine
+            job_config: Job configuration whose query_parameters are used when parameters are omitted
+
+        Returns:
+            LocalQueryResult with the query results
+        """
+        if parameters is None and job_config is not None:
+            parameters = getattr(job_config, "query_parameters", None)
+
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(translate_query(query), self._to_duckdb_parameters(parameters))
+            if cursor.description is None:
+                return LocalQueryResult(pyarrow.table({}))
+            return LocalQueryResult(cursor.fetch_arrow_table())
+        finally:
+            cursor.close()
+
+    def query(self, query: str, parameters: typing.Any = None, timeout: int = None) -> typing.List[dict]:
+        """Executes a query and returns its rows as dictionaries
+
+        Args:
+            query: BigQuery SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Ignored by the local engine
+
+        Returns:
+            List of rows as dictionaries
+        """
+        return list(self.execute_query(query, parameters=parameters))
+
+    def iter_query_batches(self, query: str, parameters: typing.Any = None, timeout: int = None,
+                           max_streams: int = None) -> typing.Iterator[typing.Any]:
+        """Executes a query and streams its results as Arrow record batches
+
+        Args:
+            query: BigQuery SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Ignored by the local engine
+            max_streams: Ignored by the local engine
+
+        Returns:
+            Iterator of pyarrow.RecordBatch objects
+        """
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(translate_query(query), self._to_duckdb_parameters(parameters))
+            if cursor.description is None:
+                return
+            reader = cursor.fetch_record_batch(DEFAULT_BATCH_ROWS)
+            for batch in reader:
+                yield batch
+        finally:
+            cursor.close()
+
+    def iter_query(self, query: str, parameters: typing.Any = None, timeout: int = None) -> typing.Iterator[dict]:
+        """Executes a query and streams its rows as dictionaries
+
+        Args:
+            query: BigQuery SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Ignored by the local engine
+
+        Returns:
+            Iterator of rows as dictionaries
+        """
+        for batch in self.iter_query_batches(query, parameters=parameters):
+            yield from batch.to_pylist()
+
+    def query_to_arrow(self, query: str, parameters: typing.Any = None, timeout: int = None) -> typing.Any:
+        """Executes a query and returns its results as an Arrow table
+
+        Args:
+            query: BigQuery SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Ignored by the local engine
+
+        Returns:
+            pyarrow.Table with the query results
+        """
+        return self.execute_query(query, parameters=parameters).to_arrow()
+
+    def execute_query_to_dataframe(self, query: str, parameters: typing.Any = None, timeout: int = None,
+                                   job_config: typing.Any = None) -> typing.Any:
+        """Executes a query and returns its results as a pandas DataFrame
+
+        Args:
+            query: BigQuery SQL query using @name placeholders for parameters
+            parameters: Query parameters
+            timeout: Ignored by the local engine
+            job_config: Optional job configuration
+
+        Returns:
+            pandas.DataFrame with the query results
+        """
+        return self.execute_query(query, job_config=job_config, parameters=parameters).to_dataframe()
+
+    def read_table_batches(self, dataset: str, table: str, columns: typing.List[str] = None, row_filter: str = None,
+                           max_streams: int = None) -> typing.Iterator[typing.Any]:
+        """Reads a table with optional projection and filter as Arrow record batches
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            columns: Columns to read (all columns when omitted)
+            row_filter: SQL boolean expression restricting the rows
+            max_streams: Ignored by the local engine
+
+        Returns:
+            Iterator of pyarrow.RecordBatch objects
+        """
+        column_list = ", ".join(f'"{column}"' for column in columns) if columns else "*"
+        where_clause = f" WHERE {row_filter}" if row_filter else ""
+        return self.iter_query_batches(f"SELECT {column_list} FROM {self._quote(dataset, table)}{where_clause}")
+
+    def insert_rows(self, *args, row_ids: typing.List[str] = None,
+                    return_errors: bool = False) -> typing.Union[bool, typing.List[dict]]:
+        """Inserts rows into a table
+
+        Accepts (table_ref, rows), (dataset, table, rows) or (project, dataset, table, rows).
+
+        Args:
+            args: Table reference parts followed by the list of row dictionaries
+            row_ids: Optional insert IDs; rows whose ID was already inserted are skipped
+            return_errors: Return an empty error list instead of True; the local engine
+                inserts all rows or raises
+
+        Returns:
+            True if the rows were inserted, or an empty list with return_errors
+        """
+        if len(args) < 2:
+            raise ValueError("insert_rows requires a table reference and a list of rows")
+        rows = args[-1]
+        _, dataset, table = resolve_table_reference(self._project_id, *args[:-1]).split(".")
+        seen = None
+        if row_ids is not None:
+            # Mirrors BigQuery's best-effort insert ID deduplication
+            seen = self._insert_ids.setdefault(f"{dataset}.{table}", set())
+            fresh = [(row, row_id) for row, row_id in zip(rows, row_ids) if row_id not in seen]
+            rows = [row for row, _ in fresh]
+        if not rows:
+            return [] if return_errors else True
+
+        self._insert_arrow(dataset, table, pyarrow.Table.from_pylist([dict(row) for row in rows]))
+        if seen is not None:
+            seen.update(row_id for _, row_id in fresh)
+        return [] if return_errors else True
+
+    def update_rows(self, dataset: str, table: str, rows: typing.List[dict], key_column: str) -> bool:
+        """Updates existing rows by key
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            rows: Rows with updated values, including the key column
+            key_column: Column identifying the rows to update
+
+        Returns:
+            True if the update succeeded
+        """
+        if not rows:
+            return True
+        self._ensure_writable(dataset, table)
+
+        updates = pyarrow.Table.from_pylist([dict(row) for row in rows])
+        columns = [name for name in updates.column_names if name != key_column]
+        assignments = ", ".join(f'"{column}" = updates."{column}"' for column in columns)
+        cursor = self._connection.cursor()
+        try:
+            cursor.register("updates", updates)
+            cursor.execute(
+                f'UPDATE {self._quote(dataset, table)} SET {assignments} FROM updates '
+                f'WHERE {self._quote(dataset, table)}."{key_column}" = updates."{key_column}"'
+            )
+        finally:
+            cursor.close()
+        return True
+
+    def load_table_from_dataframe(self, dataset: str, table: str, dataframe: typing.Any, schema: typing.List = None,
+                                  job_config_args: dict = None, wait_for_completion: bool = True,
+                                  timeout: int = None) -> LocalTable:
+        """Loads a DataFrame (or list of row dictionaries) into a table, creating it if needed
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            dataframe: pandas.DataFrame or list of row dictionaries
+            schema: Optional schema definition used when the table is created
+            job_config_args: Supports write_disposition WRITE_TRUNCATE
+            wait_for_completion: Ignored by the local engine
+            timeout: Ignored by the local engine
+
+        Returns:
+            Metadata of the loaded table
+        """
+        if isinstance(dataframe, list):
+            data = pyarrow.Table.from_pylist([dict(row) for row in dataframe])
+        else:
+            data = pyarrow.Table.from_pandas(dataframe, preserve_index=False)
+
+        if not self.table_exists(dataset, table):
+            if schema:
+                self.create_table(dataset, table, schema)
+            else:
+                self._create_table_from_arrow(dataset, table, data)
+        elif (job_config_args or {}).get("write_disposition") == "WRITE_TRUNCATE":
+            self._ensure_writable(dataset, table)
+            self._execute(f"DELETE FROM {self._quote(dataset, table)}")
+
+        self._insert_arrow(dataset, table, data)
+        return self.get_table(dataset, table)
+
+    def load_table_from_gcs(self, uri: str, dataset: str, table: str, schema: typing.List = None,
+                            source_format: FileFormat = FileFormat.CSV, write_disposition: str = "WRITE_APPEND",
+                            skip_leading_rows: int = None, timeout: int = None) -> LocalTable:
+        """Loads local files into a table; gs:// URIs are not reachable from the local engine
+
+        Args:
+            uri: Local file path or glob (file:// prefix allowed)
+            dataset: Dataset ID
+            table: Table ID
+            schema: Optional schema definition used when the table is created
+            source_format: Format of the source files
+            write_disposition: WRITE_APPEND or WRITE_TRUNCATE
+            skip_leading_rows: Header rows to skip for CSV files
+            timeout: Ignored by the local engine
+
+        Returns:
+            Metadata of the loaded table
+        """
+        if uri.startswith("gs://"):
+            raise ValueError(f"The local query engine cannot read Cloud Storage URIs: {uri}")
+        path = uri[len("file://"):] if uri.startswith("file://") else uri
+
+        format_name = source_format.value if isinstance(source_format, FileFormat) else str(source_format)
+        readers = {
+            FileFormat.CSV.value: f"read_csv_auto('{path}', header={'true' if skip_leading_rows else 'false'})",
+            FileFormat.JSON.value: f"read_json_auto('{path}')",
+            FileFormat.PARQUET.value: f"read_parquet('{path}')"
+        }
+        if format_name not in readers:
+            raise ValueError(f"Unsupported source format for the local query engine: {format_name}")
+
+        cursor = self._connection.cursor()
+        try:
+            data = cursor.execute(f"SELECT * FROM {readers[format_name]}").fetch_arrow_table()
+        finally:
+            cursor.close()
+        return self.load_table_from_dataframe(dataset, table, data.to_pandas(), schema=schema,
+                                              job_config_args={"write_disposition": write_disposition})
+
+    def create_dataset(self, dataset: str, location: str = None, exists_ok: bool = True) -> str:
+        """Creates a dataset as a DuckDB schema
+
+        Args:
+            dataset: Dataset ID
+            location: Ignored by the local engine
+            exists_ok: Whether an existing dataset is acceptable
+
+        Returns:
+            The dataset ID
+        """
+        if not exists_ok and self.dataset_exists(dataset):
+            raise ValueError(f"Dataset already exists: {dataset}")
+        self._execute(f'CREATE SCHEMA IF NOT EXISTS "{dataset}"')
+        return dataset
+
+    def dataset_exists(self, dataset: str) -> bool:
+        """Checks whether a dataset exists
+
+        Args:
+            dataset: Dataset ID
+
+        Returns:
+            True if the dataset exists
+        """
+        rows = self._fetch("SELECT 1 FROM information_schema.schemata WHERE schema_name = ?", [dataset])
+        return bool(rows)
+
+    def create_table(self, *args, dataset: str = None, table: str = None, schema: typing.List = None,
+                     time_partitioning_field: str = None, clustering_fields: typing.List[str] = None,
+                     description: str = None, exists_ok: bool = False) -> LocalTable:
+        """Creates a table; partitioning and clustering settings are accepted and ignored
+
+        Args:
+            args: Table reference parts, optionally followed by the schema
+            dataset: Dataset ID
+            table: Table ID
+            schema: Schema definition
+            time_partitioning_field: Ignored by the local engine
+            clustering_fields: Ignored by the local engine
+            description: Ignored by the local engine
+            exists_ok: Whether an existing table is acceptable
+
+        Returns:
+            Metadata of the created table
+        """
+        parts = list(args)
+        if schema is None and parts and isinstance(parts[-1], list):
+            schema = parts.pop()
+        parts.extend(part for part in (dataset, table) if part)
+        _, dataset_id, table_id = resolve_table_reference(self._project_id, *parts).split(".")
+
+        columns = ", ".join(f'"{field.name}" {to_duckdb_type(field)}' for field in get_table_schema(schema))
+        if_not_exists = "IF NOT EXISTS " if exists_ok else ""
+        with self._ddl_lock:
+            self._execute(f'CREATE SCHEMA IF NOT EXISTS "{dataset_id}"')
+            self._execute(f"CREATE TABLE {if_not_exists}{self._quote(dataset_id, table_id)} ({columns})")
+        return self.get_table(dataset_id, table_id)
+
+    def table_exists(self, *args, dataset: str = None, table: str = None) -> bool:
+        """Checks whether a table or attached Parquet view exists
+
+        Args:
+            args: Table reference parts
+            dataset: Dataset ID
+            table: Table ID
+
+        Returns:
+            True if the table exists
+        """
+        parts = list(args) + [part for part in (dataset, table) if part]
+        _, dataset_id, table_id = resolve_table_reference(self._project_id, *parts).split(".")
+        return self._table_type(dataset_id, table_id) is not None
+
+    def get_table(self, *args) -> LocalTable:
+        """Gets table metadata
+
+        Args:
+            args: Table reference parts
+
+        Returns:
+            Table metadata; raises NotFound if the table does not exist
+        """
+        _, dataset_id, table_id = resolve_table_reference(self._project_id, *args).split(".")
+        if self._table_type(dataset_id, table_id) is None:
+            raise NotFound(f"Table {dataset_id}.{table_id} not found")
+
+        columns = self._fetch(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_schema = ? AND table_name = ? ORDER BY ordinal_position",
+            [dataset_id, table_id]
+        )
+        schema = get_table_schema([{"name": name, "type": _to_bigquery_type(data_type)} for name, data_type in columns])
+        return LocalTable(self._project_id, dataset_id, table_id, schema, self.get_table_rows_count(dataset_id, table_id))
+
+    def get_table_rows_count(self, dataset: str, table: str) -> int:
+        """Counts the rows of a table
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+
+        Returns:
+            Number of rows
+        """
+        rows = self._fetch(f"SELECT COUNT(*) FROM {self._quote(dataset, table)}")
+        return rows[0][0] if rows else 0
+
+    def attach_parquet_directory(self, data_path: str) -> int:
+        """Attaches Parquet files laid out as <dataset>/<table>.parquet or <dataset>/<table>/*.parquet
+
+        Args:
+            data_path: Root directory of the Parquet files
+
+        Returns:
+            Number of tables attached
+        """
+        attached = 0
+        for dataset_dir in sorted(glob.glob(os.path.join(data_path, "*"))):
+            if not os.path.isdir(dataset_dir):
+                continue
+            dataset = os.path.basename(dataset_dir)
+            self._execute(f'CREATE SCHEMA IF NOT EXISTS "{dataset}"')
+            for entry in sorted(os.listdir(dataset_dir)):
+                entry_path = os.path.join(dataset_dir, entry)
+                if entry.endswith(".parquet"):
+                    table, source = entry[:-len(".parquet")], entry_path
+                elif os.path.isdir(entry_path):
+                    table, source = entry, os.path.join(entry_path, "*.parquet")
+                else:
+                    continue
+                if self._table_type(dataset, table) is None:
+                    self._execute(f"CREATE VIEW {self._quote(dataset, table)} AS SELECT * FROM read_parquet('{source}')")
+                    attached += 1
+
+        logger.info(f"Attached {attached} Parquet tables from {data_path}")
+        return attached
+
+    def export_table_to_parquet(self, dataset: str, table: str, file_path: str) -> str:
+        """Writes a table to a Parquet file, e.g. to snapshot benchmark fixtures
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            file_path: Destination Parquet file
+
+        Returns:
+            The destination file path
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._execute(f"COPY {self._quote(dataset, table)} TO '{file_path}' (FORMAT PARQUET)")
+        return file_path
+
+    def close(self) -> None:
+        """Closes the DuckDB connection"""
+        self._connection.close()
+
+    def _insert_arrow(self, dataset: str, table: str, data: typing.Any) -> None:
+        """Appends an Arrow table to a table, matching columns by name
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            data: pyarrow.Table with the rows to append
+        """
+        self._ensure_writable(dataset, table)
+        cursor = self._connection.cursor()
+        try:
+            cursor.register("incoming_rows", data)
+            cursor.execute(f"INSERT INTO {self._quote(dataset, table)} BY NAME SELECT * FROM incoming_rows")
+        finally:
+            cursor.close()
+
+    def _create_table_from_arrow(self, dataset: str, table: str, data: typing.Any) -> None:
+        """Creates an empty table with the columns of an Arrow table
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+            data: pyarrow.Table providing the column types
+        """
+        with self._ddl_lock:
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{dataset}"')
+                cursor.register("template_rows", data)
+                cursor.execute(f"CREATE TABLE {self._quote(dataset, table)} AS SELECT * FROM template_rows LIMIT 0")
+            finally:
+                cursor.close()
+
+    def _ensure_writable(self, dataset: str, table: str) -> None:
+        """Materializes an attached Parquet view into a table before it is modified
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+        """
+        table_type = self._table_type(dataset, table)
+        if table_type is None:
+            raise NotFound(f"Table {dataset}.{table} not found")
+        if table_type != "VIEW":
+            return
+
+        with self._ddl_lock:
+            if self._table_type(dataset, table) != "VIEW":
+                return
+            staging = self._quote(dataset, f"{table}__materialized")
+            self._execute(f"CREATE TABLE {staging} AS SELECT * FROM {self._quote(dataset, table)}")
+            self._execute(f"DROP VIEW {self._quote(dataset, table)}")
+            self._execute(f'ALTER TABLE {staging} RENAME TO "{table}"')
+
+    def _table_type(self, dataset: str, table: str) -> typing.Optional[str]:
+        """Gets the type of a table
+
+        Args:
+            dataset: Dataset ID
+            table: Table ID
+
+        Returns:
+            "BASE TABLE", "VIEW", or None if it does not exist
+        """
+        rows = self._fetch(
+            "SELECT table_type FROM information_schema.tables WHERE table_schema = ? AND table_name = ?",
+            [dataset, table]
+        )
+        return rows[0][0] if rows else None
+
+    def _execute(self, statement: str) -> None:
+        """Executes a statement on a fresh cursor
+
+        Args:
+            statement: DuckDB statement
+        """
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    def _fetch(self, statement: str, parameters: list = None) -> typing.List[tuple]:
+        """Executes a DuckDB query on a fresh cursor and fetches all rows
+
+        Args:
+            statement: DuckDB query
+            parameters: Positional parameters
+
+        Returns:
+            List of row tuples
+        """
+        cursor = self._connection.cursor()
+        try:
+            return cursor.execute(statement, parameters or []).fetchall()
+        finally:
+            cursor.close()
+
+    def _to_duckdb_parameters(self, parameters: typing.Any) -> typing.Optional[dict]:
+        """Converts query parameters into DuckDB named parameters
+
+        Args:
+            parameters: Query parameters in any format accepted by BigQueryClient
+
+        Returns:
+            Mapping of parameter names to values, or None without parameters
+        """
+        typed = normalize_query_parameters(parameters)
+        if not typed:
+            return None
+        return {name: to_parameter_value(parameter) for name, parameter in typed.items()}
+
+    @staticmethod
+    def _quote(dataset: str, table: str) -> str:
+        """Quotes a dataset and table as a DuckDB schema-qualified name"""
+        return f'"{dataset}"."{table}"'
+
+
+def _to_bigquery_type(duckdb_type: str) -> str:
+    """Maps a DuckDB column type to the closest BigQuery type
+
+    Args:
+        duckdb_type: DuckDB type name
+
+    Returns:
+        BigQuery type name
+    """
+    upper = duckdb_type.upper()
+    for prefix, bigquery_type in BIGQUERY_TYPES:
+        if upper.startswith(prefix):
+            return bigquery_type
+    return "STRING"
@@ -0,0 +1,330 @@
+"""
+Read-through query result cache for the repository layer.
+
+Dashboard endpoints poll the same aggregation queries many times per minute. This module
+caches their result rows keyed by normalized SQL and query parameters:
+- Every entry records the write generation of each table it reads. Repositories bump a
+  table's generation from their create/update/delete methods, so a write invalidates
+  exactly the cached queries that read that table.
+- Entries also expire after a TTL, which bounds staleness for writes made by other
+  processes, and the cache evicts least recently used entries beyond its size limit.
+- Hits, misses, evictions and invalidations are counted per query name and can be
+  reported through a buffered MetricClient.
+"""
+
+import collections
+import datetime
+import hashlib
+import json
+import re
+import threading
+import time
+import typing
+
+from ...config import get_config
+from ..logging.logger import get_logger
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Configuration keys
+QUERY_CACHE_ENABLED_CONFIG_KEY = "storage.query_cache.enabled"
+QUERY_CACHE_MAX_ENTRIES_CONFIG_KEY = "storage.query_cache.max_entries"
+QUERY_CACHE_TTL_CONFIG_KEY = "storage.query_cache.default_ttl_seconds"
+QUERY_CACHE_TTL_OVERRIDES_CONFIG_KEY = "storage.query_cache.ttl_overrides"
+QUERY_CACHE_REPORT_METRICS_CONFIG_KEY = "storage.query_cache.report_metrics"
+
+# Default settings
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_QUERY_NAME = "unnamed"
+QUERY_CACHE_METRIC_TYPE = "storage/query_cache/requests"
+
+# Query normalization pattern: quoted literals and identifiers (group 1) are kept verbatim,
+# runs of line comments and whitespace outside them collapse to a single space
+_QUERY_TOKEN_PATTERN = re.compile(
+    r"('''(?:\\.|[^\\])*?'''"
+    r'|"""(?:\\.|[^\\])*?"""'
+    r"|'(?:\\.|[^'\\])*'"
+    r'|"(?:\\.|[^"\\])*"'
+    r"|`[^`]*`)"
+    r"|(?:--[^\n]*|\s)+"
+)
+_TABLE_REFERENCE_PATTERN = re.compile(r"`([^`]+)`")
+
+# Shared cache instance
+_query_cache = None
+_query_cache_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """Normalizes a SQL query so formatting differences map to the same cache key
+
+    Args:
+        query: SQL query text
+
+    Returns:
+        Query with comments removed and whitespace collapsed outside string literals
+    """
+    return _QUERY_TOKEN_PATTERN.sub(lambda match: match.group(1) or " ", query).strip()
+
+
+def normalize_table_reference(table_id: str) -> str:
+    """Normalizes a table reference used to track write generations
+
+    Args:
+        table_id: Table reference such as project.dataset.table
+
+    Returns:
+        Lower-cased reference without backticks
+    """
+    return table_id.strip("` ").lower()
+
+
+def extract_table_references(query: str) -> typing.List[str]:
+    """Extracts the backtick-quoted table references read by a query
+
+    Args:
+        query: SQL query text
+
+    Returns:
+        Sorted list of normalized table references
+    """
+    return sorted({normalize_table_reference(match) for match in _TABLE_REFERENCE_PATTERN.findall(query)})
+
+
+def _canonicalize(value: typing.Any) -> typing.Any:
+    """Converts query parameters into a JSON-serializable, order-independent form"""
+    if isinstance(value, dict):
+        return {str(key): _canonicalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if hasattr(value, "to_api_repr"):
+        return _canonicalize(value.to_api_repr())
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def build_cache_key(query: str, query_params: typing.Any = None) -> str:
+    """Builds the cache key for a query and its parameters
+
+    Args:
+        query: SQL query text
+        query_params: Query parameters as a name-to-value mapping or a list of definitions
+
+    Returns:
+        Hex digest identifying the normalized query and parameters
+    """
+    params = _canonicalize(query_params) if query_params else None
+    payload = json.dumps([normalize_query(query), params], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class QueryResultCache:
+    """Size-bounded LRU cache of query result rows invalidated by table write generations"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, default_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 ttl_overrides: typing.Dict[str, float] = None, enabled: bool = True,
+                 metric_client: typing.Any = None):
+        """Initializes the cache
+
+        Args:
+            max_entries: Maximum number of cached result sets
+            default_ttl_seconds: Lifetime of entries without a per-query TTL
+            ttl_overrides: Per-query-name TTLs that take precedence over the TTL passed by callers
+            enabled: When False every lookup goes straight to the database
+            metric_client: Optional buffered MetricClient used to report hits and misses
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._default_ttl_seconds = default_ttl_seconds
+        self._ttl_overrides = dict(ttl_overrides or {})
+        self._enabled = enabled
+        self._metric_client = metric_client
+
+        # key -> (rows, expires_at, table generations snapshot)
+        self._entries: "collections.OrderedDict[str, tuple]" = collections.OrderedDict()
+        self._generations: typing.Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+        self._stats = collections.Counter()
+        self._stats_by_name: typing.Dict[str, collections.Counter] = collections.defaultdict(collections.Counter)
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if results are being cached"""
+        return self._enabled
+
+    def get_or_query(self, bq_client: typing.Any, query: str, query_params: typing.Any = None,
+                     name: str = None, ttl_seconds: float = None,
+                     tables: typing.List[str] = None) -> typing.List[dict]:
+        """Returns cached rows for a query, running it through the client on a miss
+
+        Args:
+            bq_client: Client exposing query(query, query_params) that returns rows
+            query: SQL query text
+            query_params: Query parameters passed through to the client
+            name: Query name used for TTL overrides and per-query statistics
+            ttl_seconds: Lifetime of this result, defaults to the cache TTL
+            tables: Tables the query reads, defaults to the backtick references in the query
+
+        Returns:
+            List of result rows as dictionaries
+        """
+        name = name or DEFAULT_QUERY_NAME
+        if not self._enabled:
+            return [dict(row) for row in bq_client.query(query, query_params)]
+
+        key = build_cache_key(query, query_params)
+        table_ids = [normalize_table_reference(table) for table in tables] if tables else \
+            extract_table_references(query)
+
+        with self._lock:
+            rows = self._lookup(key)
+            # Snapshot generations before querying so a concurrent write marks this result stale
+            generations = tuple((table_id, self._generations.get(table_id, 0)) for table_id in table_ids)
+
+        if rows is not None:
+            self._record(name, "hits")
+            return [dict(row) for row in rows]
+
+        self._record(name, "misses")
+        rows = [dict(row) for row in bq_client.query(query, query_params)]
+
+        ttl = self._ttl_overrides.get(name, ttl_seconds if ttl_seconds is not None else self._default_ttl_seconds)
+        if ttl > 0:
+            with self._lock:
+                self._entries[key] = (rows, time.monotonic() + ttl, generations)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats["evictions"] += 1
+
+        return [dict(row) for row in rows]
+
+    def _lookup(self, key: str) -> typing.Optional[typing.List[dict]]:
+        """Returns the rows for a live entry, dropping it if expired or invalidated (lock held)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        rows, expires_at, generations = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            return None
+        if any(self._generations.get(table_id, 0) != generation for table_id, generation in generations):
+            del self._entries[key]
+            self._stats["invalidations"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return rows
+
+    def invalidate_table(self, table_id: str) -> int:
+        """Records a write to a table, invalidating cached queries that read it
+
+        Args:
+            table_id: Table reference such as project.dataset.table
+
+        Returns:
+            New write generation of the table
+        """
+        table_id = normalize_table_reference(table_id)
+        with self._lock:
+            generation = self._generations.get(table_id, 0) + 1
+            self._generations[table_id] = generation
+            return generation
+
+    def get_table_generation(self, table_id: str) -> int:
+        """Returns the current write generation of a table
+
+        Args:
+            table_id: Table reference such as project.dataset.table
+
+        Returns:
+            Number of writes recorded for the table
+        """
+        with self._lock:
+            return self._generations.get(normalize_table_reference(table_id), 0)
+
+    def clear(self) -> None:
+        """Removes all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def _record(self, name: str, outcome: str) -> None:
+        """Counts a cache hit or miss and reports it when a metric client is configured"""
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats_by_name[name][outcome] += 1
+
+        if self._metric_client is not None:
+            try:
+                self._metric_client.record_counter(
+                    QUERY_CACHE_METRIC_TYPE,
+                    1,
+                    labels={"query": name, "result": "hit" if outcome == "hits" else "miss"}
+                )
+            except Exception as e:
+                logger.debug(f"Failed to report query cache metric: {e}")
+
+    def get_stats(self) -> typing.Dict[str, typing.Any]:
+        """Returns cache statistics
+
+        Returns:
+            Dictionary with entry counts, hit/miss totals, hit ratio and per-query counts
+        """
+        with self._lock:
+            hits = self._stats["hits"]
+            misses = self._stats["misses"]
+            return {
+                "enabled": self._enabled,
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "evictions": self._stats["evictions"],
+                "expirations": self._stats["expirations"],
+                "invalidations": self._stats["invalidations"],
+                "by_query": {name: dict(counts) for name, counts in self._stats_by_name.items()}
+            }
+
+
+def get_query_cache() -> QueryResultCache:
+    """Gets or creates the shared query result cache configured from application settings
+
+    Returns:
+        Shared QueryResultCache instance
+    """
+    global _query_cache
+
+    with _query_cache_lock:
+        if _query_cache is None:
+            config = get_config()
+
+            metric_client = None
+            if config.get(QUERY_CACHE_REPORT_METRICS_CONFIG_KEY, False):
+                try:
+                    # Imported lazily so storage utilities do not depend on monitoring at import time
+                    from ..monitoring.metric_client import MetricClient
+                    metric_client = MetricClient()
+                    if not metric_client.is_buffered:
+                        logger.warning("Query cache metrics require buffered MetricClient mode; not reporting")
+                        metric_client = None
+                except Exception as e:
+                    logger.warning(f"Query cache metrics disabled, could not create MetricClient: {e}")
+
+            _query_cache = QueryResultCache(
+                max_entries=int(config.get(QUERY_CACHE_MAX_ENTRIES_CONFIG_KEY, DEFAULT_MAX_ENTRIES)),
+                default_ttl_seconds=float(config.get(QUERY_CACHE_TTL_CONFIG_KEY, DEFAULT_TTL_SECONDS)),
+                ttl_overrides=config.get(QUERY_CACHE_TTL_OVERRIDES_CONFIG_KEY, None),
+                enabled=bool(config.get(QUERY_CACHE_ENABLED_CONFIG_KEY, True)),
+                metric_client=metric_client
+            )
+        return _query_cache
@@ -0,0 +1,484 @@
+"""
+Micro-batching write buffer for BigQuery streaming inserts.
+
+Repository create methods append rows to a shared buffer instead of calling
+insert_rows once per row. Rows are coalesced per destination table and flushed:
+- by a background thread every flush interval,
+- as soon as a table has a full batch pending,
+- or explicitly through flush(), e.g. at shutdown or before a read-after-write.
+
+Every row carries an insert ID (derived from the record's own ID where possible), so a
+batch can be retried after a partial failure or timeout without creating duplicates.
+Failed requests are retried with the utils/retry backoff strategies and stay queued if
+all attempts fail, giving at-least-once delivery. When BigQuery rejects individual rows,
+only those rows are retried; a row that keeps failing, or is rejected as invalid, is
+moved to a bounded dead-letter list so it cannot block the rows queued behind it.
+
+The buffer holds at most max_pending_rows; appends beyond that flush in the caller's
+thread and are refused if the rows still do not fit. Callers that need durability
+append with wait=True and block until their rows are written. Shared buffers are
+flushed at interpreter exit.
+"""
+
+import atexit
+import collections
+import threading
+import typing
+import uuid
+
+from ...config import get_config
+from ..logging.logger import get_logger
+from ..retry.backoff_strategy import get_backoff_strategy
+
+# Initialize module logger
+logger = get_logger(__name__)
+
+# Configuration keys
+WRITE_BUFFER_CONFIG_KEY = "storage.write_buffer"
+
+# Default settings
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_BATCH_ROWS = 500
+DEFAULT_MAX_PENDING_ROWS = 50000
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_WAIT_TIMEOUT_SECONDS = 60.0
+DEFAULT_DEAD_LETTER_MAX_ROWS = 1000
+
+# Row error reasons that mean the row can never be inserted as it is
+PERMANENT_ROW_ERROR_REASONS = frozenset(["invalid"])
+
+# Row error reason for valid rows that were not inserted because another row failed
+STOPPED_ROW_ERROR_REASON = "stopped"
+
+TableKey = typing.Tuple[str, ...]
+
+# Shared buffers, one per client
+_write_buffers: typing.Dict[int, typing.Tuple[typing.Any, "WriteBuffer"]] = {}
+_write_buffers_lock = threading.Lock()
+_exit_flush_registered = False
+
+
+class _WriteTicket:
+    """Tracks delivery of the rows from one append call"""
+
+    __slots__ = ("remaining", "failed", "rejected", "event", "callback", "rejected_callback")
+
+    def __init__(self, row_count: int, callback: typing.Callable[[], None] = None,
+                 rejected_callback: typing.Callable[[typing.List[str]], None] = None):
+        self.remaining = row_count
+        self.failed = False
+        self.rejected = False
+        self.event = threading.Event()
+        self.callback = callback
+        self.rejected_callback = rejected_callback
+
+
+class _PendingRow:
+    """A buffered row with its insert ID, delivery ticket and count of row-level failures"""
+
+    __slots__ = ("row", "insert_id", "ticket", "attempts")
+
+    def __init__(self, row: dict, insert_id: str, ticket: _WriteTicket):
+        self.row = row
+        self.insert_id = insert_id
+        self.ticket = ticket
+        self.attempts = 0
+
+
+class WriteBuffer:
+    """Coalesces streaming inserts per table and writes them in batches"""
+
+    def __init__(self, bq_client: typing.Any, config: typing.Dict[str, typing.Any] = None,
+                 start_thread: bool = True):
+        """Initializes the buffer
+
+        Args:
+            bq_client: Client exposing insert_rows(*table_ref, rows, row_ids=..., return_errors=True)
+            config: Optional settings: enabled, flush_interval_seconds, max_batch_rows,
+                max_pending_rows, max_attempts, dead_letter_max_rows, backoff_strategy,
+                base_delay, max_delay
+            start_thread: Whether to start the background flush thread
+        """
+        config = config or {}
+        self._bq_client = bq_client
+        self._enabled = bool(config.get("enabled", True))
+        self._flush_interval = float(config.get("flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS))
+        self._max_batch_rows = int(config.get("max_batch_rows", DEFAULT_MAX_BATCH_ROWS))
+        self._max_pending_rows = int(config.get("max_pending_rows", DEFAULT_MAX_PENDING_ROWS))
+        self._max_attempts = int(config.get("max_attempts", DEFAULT_MAX_ATTEMPTS))
+        self._backoff = get_backoff_strategy(
+            config.get("backoff_strategy", "exponential"),
+            base_delay=config.get("base_delay", 0.5),
+            max_delay=config.get("max_delay", 10.0)
+        )
+
+        self._pending: typing.Dict[TableKey, typing.Deque[_PendingRow]] = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+        self._stats = collections.Counter()
+        self._dead_letters: typing.Deque[dict] = collections.deque(
+            maxlen=int(config.get("dead_letter_max_rows", DEFAULT_DEAD_LETTER_MAX_ROWS))
+        )
+
+        self._thread: typing.Optional[threading.Thread] = None
+        if start_thread and self._enabled:
+            self._thread = threading.Thread(target=self._flush_loop, name="write-buffer-flush", daemon=True)
+            self._thread.start()
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if rows are buffered rather than written immediately"""
+        return self._enabled
+
+    def append(self, dataset: str, table: str, rows: typing.List[dict],
+               insert_ids: typing.List[str] = None, project: str = None, wait: bool = False,
+               timeout: float = DEFAULT_WAIT_TIMEOUT_SECONDS,
+               on_delivered: typing.Callable[[], None] = None,
+               on_rejected: typing.Callable[[typing.List[str]], None] = None) -> bool:
+        """Buffers rows for a table
+
+        Args:
+            dataset: Dataset of the destination table
+            table: Destination table name
+            rows: Rows to insert
+            insert_ids: One deduplication ID per row, generated when not provided
+            project: Project of the destination table, defaults to the client project
+            wait: Block until the rows are written, for callers that read after writing
+            timeout: Maximum seconds to block when wait is True
+            on_delivered: Called once all of the rows have been written
+            on_rejected: Called with the insert IDs of rows that are dead-lettered instead
+
+        Returns:
+            True if the rows were buffered, or written when wait is True; False if the
+            buffer is full or, with wait, the rows could not be written
+        """
+        if not rows:
+            return True
+        if insert_ids is not None and len(insert_ids) != len(rows):
+            raise ValueError("insert_ids must contain one ID per row")
+
+        insert_ids = list(insert_ids) if insert_ids is not None else [uuid.uuid4().hex for _ in rows]
+        key = (project, dataset, table) if project else (dataset, table)
+        ticket = _WriteTicket(len(rows), on_delivered, on_rejected)
+        pending = [_PendingRow(row, insert_id, ticket) for row, insert_id in zip(rows, insert_ids)]
+
+        if not self._enabled or len(pending) > self._max_pending_rows:
+            # Unbuffered mode, and appends that could never fit, write in the caller's thread
+            _, unwritten = self._write_batch(key, pending)
+            return not unwritten and not ticket.rejected
+
+        batch_ready = self._enqueue(key, pending)
+        if batch_ready is None:
+            # Backpressure: write what is pending in the caller's thread, then refuse if still full
+            self.flush()
+            batch_ready = self._enqueue(key, pending)
+            if batch_ready is None:
+                with self._lock:
+                    self._stats["rows_refused"] += len(pending)
+                logger.warning(f"Write buffer full, refused {len(pending)} rows for {'.'.join(key)}")
+                return False
+
+        if wait:
+            # Durable writes flush in the caller's thread
+            self.flush(key)
+            ticket.event.wait(timeout)
+            return ticket.event.is_set() and not ticket.failed
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def _enqueue(self, key: TableKey, pending: typing.List[_PendingRow]) -> typing.Optional[bool]:
+        """Queues rows if they fit within max_pending_rows
+
+        Returns:
+            Whether the table now has a full batch pending, or None if the rows did not fit
+        """
+        with self._lock:
+            if self._pending_count + len(pending) > self._max_pending_rows:
+                return None
+            queue = self._pending.setdefault(key, collections.deque())
+            queue.extend(pending)
+            self._pending_count += len(pending)
+            self._stats["rows_buffered"] += len(pending)
+            return len(queue) >= self._max_batch_rows
+
+    def flush(self, table_key: TableKey = None) -> int:
+        """Writes pending rows
+
+        Args:
+            table_key: Only flush this table, as (dataset, table) or (project, dataset, table)
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        with self._flush_lock:
+            with self._lock:
+                keys = [table_key] if table_key is not None else list(self._pending)
+
+            for key in keys:
+                while True:
+                    with self._lock:
+                        queue = self._pending.get(key)
+                        if not queue:
+                            self._pending.pop(key, None)
+                            break
+                        batch = [queue.popleft() for _ in range(min(self._max_batch_rows, len(queue)))]
+                        self._pending_count -= len(batch)
+
+                    batch_written, unwritten = self._write_batch(key, batch, holds_flush_lock=True)
+                    written += batch_written
+                    if not unwritten:
+                        continue
+
+                    # Keep the rows at the head of the queue for the next flush
+                    with self._lock:
+                        self._pending.setdefault(key, collections.deque()).extendleft(reversed(unwritten))
+                        self._pending_count += len(unwritten)
+                    break
+
+        if written:
+            logger.debug(f"Flushed {written} buffered rows")
+        return written
+
+    def close(self, flush: bool = True) -> None:
+        """Stops the background thread and optionally flushes remaining rows
+
+        Args:
+            flush: Whether to flush pending rows before returning
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self._flush_interval + 5)
+        if flush:
+            self.flush()
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        """Returns buffer statistics
+
+        Returns:
+            Dictionary with buffered, written and failed row counts and batch totals
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending_rows"] = self._pending_count
+            stats["pending_tables"] = len(self._pending)
+        return stats
+
+    def get_dead_letters(self) -> typing.List[dict]:
+        """Returns the most recent rows that were dropped after failing to insert
+
+        Returns:
+            List of dictionaries with table, row, insert_id and errors
+        """
+        with self._lock:
+            return list(self._dead_letters)
+
+    def _write_batch(self, key: TableKey, batch: typing.List[_PendingRow],
+                     holds_flush_lock: bool = False) -> typing.Tuple[int, typing.List[_PendingRow]]:
+        """Writes one batch, retrying failed requests with backoff and failed rows individually
+
+        Args:
+            key: Destination table reference parts
+            batch: Rows to write
+            holds_flush_lock: Whether the caller holds the flush lock, which is released
+                while backing off so that other tables and durable appends are not blocked
+
+        Returns:
+            Number of rows written, and the rows to keep queued because every attempt failed
+        """
+        remaining = batch
+        written = 0
+
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                # Retried rows reuse their insert IDs, so rows accepted by an earlier
+                # attempt are deduplicated by BigQuery
+                errors = self._bq_client.insert_rows(*key, [pending.row for pending in remaining],
+                                                     row_ids=[pending.insert_id for pending in remaining],
+                                                     return_errors=True)
+            except Exception as e:
+                error = str(e)
+            else:
+                written_rows, remaining = self._handle_row_errors(key, remaining, errors or [])
+                written += written_rows
+                if not remaining:
+                    return written, []
+                error = f"{len(remaining)} rows reported errors"
+
+            with self._lock:
+                self._stats["failed_attempts"] += 1
+            if attempt < self._max_attempts:
+                logger.warning(
+                    f"Write of {len(remaining)} rows to {'.'.join(key)} failed ({error}), "
+                    f"retrying (attempt {attempt}/{self._max_attempts})"
+                )
+                if holds_flush_lock:
+                    self._flush_lock.release()
+                try:
+                    self._backoff.wait(attempt)
+                finally:
+                    if holds_flush_lock:
+                        self._flush_lock.acquire()
+            else:
+                logger.error(f"Write of {len(remaining)} rows to {'.'.join(key)} failed after {attempt} attempts: {error}")
+
+        with self._lock:
+            self._stats["failed_batches"] += 1
+        for ticket in {id(pending.ticket): pending.ticket for pending in remaining}.values():
+            # Rows stay queued, but waiting callers learn that the write has not happened
+            ticket.failed = True
+            ticket.event.set()
+        return written, remaining
+
+    def _handle_row_errors(self, key: TableKey, batch: typing.List[_PendingRow],
+                           errors: typing.List[dict]) -> typing.Tuple[int, typing.List[_PendingRow]]:
+        """Completes the rows an insert accepted and sorts the rejected ones
+
+        Rows stopped only because another row failed are retried as they are. Rows rejected as
+        invalid, or that have failed max_attempts times, are dead-lettered; the rest are retried.
+
+        Args:
+            key: Destination table reference parts
+            batch: Rows sent in the insert
+            errors: Per-row errors reported by the insert
+
+        Returns:
+            Number of rows written, and the rows to retry
+        """
+        row_errors = {entry.get("index"): entry.get("errors") or [] for entry in errors}
+        if None in row_errors:
+            # Errors that cannot be attributed to a row fail the whole request
+            row_errors = {index: row_errors[None] for index in range(len(batch))}
+
+        delivered = [pending for index, pending in enumerate(batch) if index not in row_errors]
+        retry = []
+        dead = []
+        for index, reported in row_errors.items():
+            if index >= len(batch):
+                continue
+            pending = batch[index]
+            reasons = {error.get("reason") for error in reported}
+            if reasons and reasons <= {STOPPED_ROW_ERROR_REASON}:
+                retry.append(pending)
+                continue
+            pending.attempts += 1
+            if reasons & PERMANENT_ROW_ERROR_REASONS or pending.attempts >= self._max_attempts:
+                dead.append((pending, reported))
+            else:
+                retry.append(pending)
+
+        if delivered:
+            self._on_batch_written(delivered)
+        if dead:
+            self._dead_letter(key, dead)
+        return len(delivered), retry
+
+    def _dead_letter(self, key: TableKey, rows: typing.List[typing.Tuple[_PendingRow, typing.List[dict]]]) -> None:
+        """Drops rows that cannot be inserted, keeping them in the dead-letter list"""
+        table = ".".join(key)
+        logger.error(f"Dropping {len(rows)} rows rejected by {table}: {[errors for _, errors in rows[:5]]}")
+
+        settled = []
+        rejected_ids = collections.defaultdict(list)
+        with self._lock:
+            self._stats["rows_dead_lettered"] += len(rows)
+            for pending, errors in rows:
+                self._dead_letters.append({"table": table, "row": pending.row,
+                                           "insert_id": pending.insert_id, "errors": errors})
+                pending.ticket.rejected = True
+                pending.ticket.remaining -= 1
+                if pending.ticket.rejected_callback is not None:
+                    rejected_ids[pending.ticket].append(pending.insert_id)
+                if pending.ticket.remaining == 0:
+                    settled.append(pending.ticket)
+
+        for ticket, insert_ids in rejected_ids.items():
+            try:
+                ticket.rejected_callback(insert_ids)
+            except Exception as e:
+                logger.warning(f"Write buffer rejection callback failed: {e}")
+        for ticket in settled:
+            self._complete_ticket(ticket)
+
+    def _on_batch_written(self, batch: typing.List[_PendingRow]) -> None:
+        """Completes tickets whose rows have all been written"""
+        completed = []
+        with self._lock:
+            self._stats["rows_written"] += len(batch)
+            self._stats["batches_written"] += 1
+            for pending in batch:
+                ticket = pending.ticket
+                ticket.remaining -= 1
+                if ticket.remaining == 0:
+                    completed.append(ticket)
+
+        for ticket in completed:
+            self._complete_ticket(ticket)
+
+    def _complete_ticket(self, ticket: _WriteTicket) -> None:
+        """Runs the delivery callback and wakes waiters once every row of an append is settled"""
+        # Dead-lettered rows leave the append failed even though the rest were written
+        ticket.failed = ticket.rejected
+        if ticket.callback is not None:
+            try:
+                ticket.callback()
+            except Exception as e:
+                logger.warning(f"Write buffer delivery callback failed: {e}")
+        ticket.event.set()
+
+    def _flush_loop(self) -> None:
+        """Background thread flushing on interval or when a batch is full"""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Unexpected error in write buffer flush thread: {e}")
+
+
+def get_write_buffer(bq_client: typing.Any) -> WriteBuffer:
+    """Gets or creates the shared write buffer for a client, configured from application settings
+
+    Args:
+        bq_client: Client the buffer writes through
+
+    Returns:
+        Shared WriteBuffer instance
+    """
+    with _write_buffers_lock:
+        entry = _write_buffers.get(id(bq_client))
+        if entry is None or entry[0] is not bq_client:
+            config = get_config().get(WRITE_BUFFER_CONFIG_KEY, None) or {}
+            entry = (bq_client, WriteBuffer(bq_client, config))
+            _write_buffers[id(bq_client)] = entry
+            _register_exit_flush()
+        return entry[1]
+
+
+def _register_exit_flush() -> None:
+    """Registers flush_write_buffers to run at interpreter exit, once"""
+    global _exit_flush_registered
+    if not _exit_flush_registered:
+        # The flush threads are daemons, so rows still buffered at exit are written here
+        atexit.register(flush_write_buffers)
+        _exit_flush_registered = True
+
+
+def flush_write_buffers() -> int:
+    """Flushes every shared write buffer, e.g. before shutdown
+
+    Returns:
+        Number of rows written
+    """
+    with _write_buffers_lock:
+        buffers = [buffer for _, buffer in _write_buffers.values()]
+    return sum(buffer.flush() for buffer in buffers)
@@ -0,0 +1,141 @@
+"""
+Performance benchmark for root cause queries on the causality graph.
+Streams 100k synthetic events through lineage of raw, staging and mart tables (plus explicit
+causes between recent events) and answers "candidate root causes of X" and "common
+ancestors of A..N" while ingesting, once by rebuilding a networkx graph of the window per
+query and once from the incremental CausalityGraph with cached ancestor indexes.
+"""
+import logging
+import random
+import statistics
+import time
+
+import networkx as nx
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from src.backend.self_healing.ai.causality_graph import CausalityGraph
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+EVENT_COUNT = 100000
+EVENT_SPACING_SECONDS = 0.2
+WINDOW_MINUTES = 240
+MAX_DEPTH = 3
+QUERY_EVERY = 250
+BASELINE_QUERIES = 20
+COMMON_ANCESTOR_FANOUT = 5
+
+
+def build_events(count: int) -> list:
+    """Builds events of raw, staging and mart tables, each depending on the layer above
+
+    Args:
+        count: Number of events
+
+    Returns:
+        List of event dictionaries in time order
+    """
+    rng = random.Random(5)
+    raw = [f"raw.table_{index}" for index in range(40)]
+    staging = {f"staging.table_{index}": rng.sample(raw, 2) for index in range(160)}
+    marts = {f"mart.table_{index}": rng.sample(sorted(staging), 2) for index in range(400)}
+    events = []
+    for index in range(count):
+        layer = rng.random()
+        if layer < 0.1:
+            component, depends_on = rng.choice(raw), []
+        elif layer < 0.4:
+            component = rng.choice(sorted(staging))
+            depends_on = staging[component]
+        else:
+            component = rng.choice(sorted(marts))
+            depends_on = marts[component]
+        event = {"event_id": f"event-{index}", "timestamp": index * EVENT_SPACING_SECONDS,
+                 "component": component, "depends_on": depends_on}
+        if index > 50 and rng.random() < 0.2:
+            event["caused_by"] = [f"event-{index - rng.randint(1, 50)}"]
+        events.append(event)
+    return events
+
+
+def rebuild_window(graph: CausalityGraph) -> nx.DiGraph:
+    """Rebuilds a networkx graph of the live window from the event edges, as done per query before"""
+    rebuilt = nx.DiGraph()
+    for event_id in graph._timestamps:
+        rebuilt.add_node(event_id)
+        for parent in graph._parents[event_id]:
+            rebuilt.add_edge(parent, event_id)
+    return rebuilt
+
+
+def rebuilt_ancestors(rebuilt: nx.DiGraph, event_id: str) -> dict:
+    """Gets ancestors within the maximum depth from a rebuilt graph"""
+    distances = nx.single_source_shortest_path_length(rebuilt.reverse(copy=False), event_id, cutoff=MAX_DEPTH)
+    distances.pop(event_id)
+    return distances
+
+
+def rebuilt_query(graph: CausalityGraph, target: str, group: list) -> tuple:
+    """Answers both queries by rebuilding the window graph
+
+    Returns:
+        Tuple of candidate root cause IDs and common ancestor IDs
+    """
+    rebuilt = rebuild_window(graph)
+    index = rebuilt_ancestors(rebuilt, target)
+    candidates = {ancestor for ancestor, hops in index.items() if rebuilt.in_degree(ancestor) == 0 or hops == MAX_DEPTH}
+    shared = None
+    for event_id in group:
+        ancestors = set(rebuilt_ancestors(rebuilt, event_id))
+        shared = ancestors if shared is None else shared & ancestors
+    return candidates, shared
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_incremental_graph_against_rebuild():
+    """Streams events with interleaved queries and compares per-query latency"""
+    events = build_events(EVENT_COUNT)
+    graph = CausalityGraph(window_minutes=WINDOW_MINUTES, max_depth=MAX_DEPTH)
+    rng = random.Random(9)
+    candidate_latencies, common_latencies, baseline_latencies = [], [], []
+
+    started = time.perf_counter()
+    for index, event in enumerate(events):
+        graph.ingest(event)
+        if index % QUERY_EVERY or index < QUERY_EVERY:
+            continue
+        target = event["event_id"]
+        group = [f"event-{index - rng.randint(0, 200)}" for _ in range(COMMON_ANCESTOR_FANOUT)]
+
+        query_started = time.perf_counter()
+        candidates = graph.candidate_root_causes(target)
+        candidate_latencies.append(time.perf_counter() - query_started)
+        query_started = time.perf_counter()
+        common = graph.common_ancestors(group)
+        common_latencies.append(time.perf_counter() - query_started)
+
+        if len(baseline_latencies) < BASELINE_QUERIES and index >= EVENT_COUNT // 2:
+            query_started = time.perf_counter()
+            expected_candidates, expected_common = rebuilt_query(graph, target, group)
+            baseline_latencies.append(time.perf_counter() - query_started)
+            assert {candidate["event_id"] for candidate in candidates} == expected_candidates
+            assert {ancestor["event_id"] for ancestor in common} == expected_common
+    elapsed = time.perf_counter() - started
+
+    stats = graph.get_stats()
+    incremental = [candidate + common for candidate, common in zip(candidate_latencies, common_latencies)]
+    logger.info(f"events={EVENT_COUNT} live={stats['live_events']} expired={stats['expired']} edges={stats['edges']} "
+                f"queries={len(incremental)} total={elapsed:.2f}s")
+    logger.info(f"rebuild per query:   mean={statistics.mean(baseline_latencies) * 1000:.1f}ms")
+    logger.info(f"incremental queries: mean={statistics.mean(incremental) * 1000:.3f}ms "
+                f"p99={sorted(incremental)[int(len(incremental) * 0.99)] * 1000:.3f}ms "
+                f"(candidates {statistics.mean(candidate_latencies) * 1000:.3f}ms, "
+                f"common ancestors {statistics.mean(common_latencies) * 1000:.3f}ms)")
+    logger.info(f"cache hits={stats['cache_hits']} misses={stats['cache_misses']} invalidations={stats['invalidations']}")
+
+    assert stats["expired"] > 0
+    assert statistics.mean(incremental) * 10 < statistics.mean(baseline_latencies)
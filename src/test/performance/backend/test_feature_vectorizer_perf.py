@@ -0,0 +1,91 @@
+"""
+Performance benchmark for issue feature vectorization.
+Encodes 10k synthetic, mostly near-identical issues with the dict-based path (features
+rebuilt per issue, then encoded one issue at a time without memoization) and with the
+compiled vectorizer encoding the whole batch with memoized signatures.
+"""
+import logging
+import random
+import time
+
+import numpy
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from src.backend.self_healing.ai.feature_vectorizer import HashedFeatureVectorizer, ISSUE_FEATURE_SPEC
+from src.backend.self_healing.ai.issue_classifier import extract_features_from_error
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+ISSUE_COUNT = 10000
+TEMPLATES = [
+    "Query job {id} timed out after {n}s on table `analytics.events_{n}`",
+    "Table proj.sales.orders_{n} not found in location US (job {id})",
+    "Permission denied on bucket raw-landing-{n} for service account loader@{id}",
+    "Row {n} of file gs://landing/batch_{n}.csv has {n} columns, expected 12",
+    "Memory limit of {n} MiB exceeded by task transform_{n}",
+    "Schema mismatch: column amount_{n} changed from INT64 to STRING",
+]
+
+
+def build_issues(count: int) -> list:
+    """Builds synthetic failures from a few templates with volatile IDs and numbers
+
+    Args:
+        count: Number of issues
+
+    Returns:
+        List of issue data dictionaries
+    """
+    rng = random.Random(7)
+    issues = []
+    for _ in range(count):
+        template = rng.choice(TEMPLATES)
+        issues.append({
+            "error_message": template.format(id=f"{rng.getrandbits(48):012x}", n=rng.randint(1, 500)),
+            "stack_trace": "Traceback: pipeline/run.py line {}".format(rng.randint(1, 900)),
+            "pipeline": rng.choice(["ingest_sales", "ingest_events", "quality_checks"]),
+            "task": rng.choice(["load", "transform", "validate"]),
+            "dataset": rng.choice(["sales", "events", "finance"]),
+            "resources": {"cpu": rng.random()}
+        })
+    return issues
+
+
+def time_call(function) -> tuple:
+    """Times one call
+
+    Args:
+        function: Function without arguments
+
+    Returns:
+        Tuple of elapsed seconds and the function result
+    """
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_vectorizer_against_dict_path():
+    """Compares the dict-based per-issue path with compiled batch vectorization"""
+    issues = build_issues(ISSUE_COUNT)
+
+    def dict_path():
+        uncached = HashedFeatureVectorizer(ISSUE_FEATURE_SPEC, cache_size=0)
+        return numpy.vstack([uncached.transform_one(extract_features_from_error(issue)) for issue in issues])
+
+    vectorizer = HashedFeatureVectorizer(ISSUE_FEATURE_SPEC)
+    dict_seconds, dict_matrix = time_call(dict_path)
+    batch_seconds, batch_matrix = time_call(lambda: vectorizer.transform(issues))
+
+    logger.info(f"dict path: {dict_seconds * 1000:.0f} ms, compiled batch: {batch_seconds * 1000:.0f} ms, "
+                f"speedup {dict_seconds / batch_seconds:.1f}x, stats {vectorizer.get_stats()}")
+
+    # The dict path lowercases messages and adds the environment, which only shift hashed values
+    assert batch_matrix.shape == dict_matrix.shape == (ISSUE_COUNT, vectorizer.dimension)
+    assert vectorizer.get_stats()["hit_rate"] > 0.5
+    assert batch_seconds < dict_seconds
@@ -0,0 +1,126 @@
+"""
+Load test replaying a synthetic issue storm through issue coalescing.
+A few upstream breakages are each reported by hundreds of downstream checks with volatile
+IDs, timestamps and counts. Every report is submitted from a pool of concurrent workers, once
+without coalescing (one analysis and recovery per report) and once through the
+IssueCoalescer used by HealingService and RecoveryOrchestrator.
+"""
+import concurrent.futures
+import logging
+import random
+import threading
+import time
+import uuid
+
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from src.backend.self_healing.correction.issue_coalescer import IssueCoalescer, TargetLocks, issue_fingerprint, recovery_target
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+BREAKAGES = [
+    ("sales", "orders", "missing_table", "Table proj.sales.orders not found in location US (job {id})"),
+    ("sales", "customers", "schema_drift", "Schema mismatch: column amount_{n} changed from INT64 to STRING"),
+    ("finance", "ledger", "missing_table", "Table proj.finance.ledger not found in location US (job {id})"),
+    ("marketing", "events", "timeout", "Query job {id} timed out after {n}s on table `marketing.events`"),
+]
+REPORTS_PER_BREAKAGE = 250
+WORKERS = 32
+ANALYSIS_SECONDS = 0.01
+RECOVERY_SECONDS = 0.02
+
+
+def build_storm() -> list:
+    """Builds the interleaved reports of every breakage
+
+    Returns:
+        List of issue data dictionaries
+    """
+    rng = random.Random(11)
+    issues = []
+    for dataset, table, issue_type, template in BREAKAGES:
+        for _ in range(REPORTS_PER_BREAKAGE):
+            issues.append({
+                "issue_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "issue_type": issue_type,
+                "dataset": dataset,
+                "table": table,
+                "error_message": template.format(id=uuid.UUID(int=rng.getrandbits(128)), n=rng.randint(1, 9999)),
+                "row_count": rng.randint(0, 10 ** 6)
+            })
+    rng.shuffle(issues)
+    return issues
+
+
+class TargetOverlapProbe:
+    """Simulated analysis and recovery that records overlapping recoveries per target"""
+
+    def __init__(self):
+        self.calls = 0
+        self.overlaps = 0
+        self._active = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, issue: dict) -> dict:
+        target = recovery_target(issue)
+        with self._lock:
+            self.calls += 1
+            self.overlaps += target in self._active
+            self._active.add(target)
+        time.sleep(ANALYSIS_SECONDS + RECOVERY_SECONDS)
+        with self._lock:
+            self._active.discard(target)
+        return {"recovered": target}
+
+
+def replay(issues: list, coalesce: bool) -> dict:
+    """Replays the storm from a pool of workers
+
+    Args:
+        issues: Reports to submit
+        coalesce: Whether reports go through an IssueCoalescer
+
+    Returns:
+        Dictionary with elapsed seconds, executions, overlapping recoveries and coalescer stats
+    """
+    probe = TargetOverlapProbe()
+    coalescer = IssueCoalescer(name="storm", window_seconds=60, target_locks=TargetLocks())
+
+    def submit(issue):
+        if not coalesce:
+            return probe(issue)
+        return coalescer.run(issue_fingerprint(issue), probe, issue, issue_id=issue["issue_id"],
+                             target=recovery_target(issue)).result
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(submit, issues))
+    elapsed = time.perf_counter() - started
+    assert len(results) == len(issues)
+    return {"elapsed": elapsed, "executions": probe.calls, "overlaps": probe.overlaps,
+            "stats": coalescer.get_stats() if coalesce else None}
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_issue_storm_is_coalesced():
+    """Replays a storm with and without coalescing and compares the work done"""
+    issues = build_storm()
+    baseline = replay(issues, coalesce=False)
+    coalesced = replay(issues, coalesce=True)
+
+    stats = coalesced["stats"]
+    logger.info(f"reports={len(issues)} breakages={len(BREAKAGES)}")
+    logger.info(f"baseline:  executions={baseline['executions']} overlapping_recoveries={baseline['overlaps']} "
+                f"elapsed={baseline['elapsed']:.2f}s")
+    logger.info(f"coalesced: executions={coalesced['executions']} overlapping_recoveries={coalesced['overlaps']} "
+                f"elapsed={coalesced['elapsed']:.2f}s ratio={stats['coalescing_ratio']:.3f} "
+                f"largest_storm={stats['largest_storm']}")
+
+    assert coalesced["executions"] == len(BREAKAGES)
+    assert coalesced["overlaps"] == 0
+    assert stats["coalescing_ratio"] == pytest.approx(1 - len(BREAKAGES) / len(issues))
+    assert coalesced["elapsed"] < baseline["elapsed"]
@@ -0,0 +1,92 @@
+"""
+Performance benchmark for dynamic micro-batching in model serving.
+Many concurrent callers run predictions against a tiny local Keras model through the
+DynamicBatcher used by ModelServer, and throughput is compared across maximum batch sizes.
+"""
+import logging
+import threading
+import time
+
+import numpy
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from src.backend.self_healing.models.inference_batcher import DynamicBatcher
+from src.backend.self_healing.models.model_serving import run_model_batch
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+FEATURE_COUNT = 32
+CONCURRENT_CALLERS = 64
+REQUESTS_PER_CALLER = 20
+MAX_BATCH_SIZES = [1, 4, 16, 64]
+
+
+def build_tiny_model() -> object:
+    """Builds a small dense classifier comparable to the issue classifier head
+
+    Returns:
+        Compiled Keras model
+    """
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(FEATURE_COUNT,)),
+        tf.keras.layers.Dense(64, activation="relu"),
+        tf.keras.layers.Dense(8, activation="softmax")
+    ])
+    model(tf.zeros((1, FEATURE_COUNT)))
+    return model
+
+
+def measure_throughput(model: object, max_batch_size: int) -> dict:
+    """Runs concurrent single-input predictions through a batcher
+
+    Args:
+        model: Keras model to serve
+        max_batch_size: Maximum batch size of the batcher
+
+    Returns:
+        Dictionary with predictions per second and the batcher statistics
+    """
+    batcher = DynamicBatcher(lambda inputs: run_model_batch(model, inputs),
+                             max_batch_size=max_batch_size, max_latency_ms=2, name=f"bench-{max_batch_size}")
+    rows = numpy.random.default_rng(0).random((CONCURRENT_CALLERS, FEATURE_COUNT), dtype=numpy.float32)
+    barrier = threading.Barrier(CONCURRENT_CALLERS + 1)
+
+    def caller(index):
+        barrier.wait()
+        for _ in range(REQUESTS_PER_CALLER):
+            batcher.predict(rows[index], timeout=60)
+
+    threads = [threading.Thread(target=caller, args=(index,)) for index in range(CONCURRENT_CALLERS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stats = batcher.get_stats()
+    batcher.close()
+    return {"throughput": CONCURRENT_CALLERS * REQUESTS_PER_CALLER / elapsed, "stats": stats}
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_throughput_by_max_batch_size():
+    """Measures prediction throughput for increasing maximum batch sizes"""
+    model = build_tiny_model()
+    results = {size: measure_throughput(model, size) for size in MAX_BATCH_SIZES}
+
+    logger.info("max_batch_size  predictions/s  mean_batch  mean_batch_latency_ms")
+    for size, result in results.items():
+        stats = result["stats"]
+        logger.info(f"{size:>14}  {result['throughput']:>13.0f}  {stats['batch_size']['mean']:>10.1f}  "
+                    f"{stats['batch_latency_ms']['mean']:>21.2f}")
+
+    # One forward pass per request is the unbatched baseline
+    assert results[1]["stats"]["batch_size"]["mean"] == 1
+    assert results[max(MAX_BATCH_SIZES)]["stats"]["batch_size"]["mean"] > 1
+    assert results[max(MAX_BATCH_SIZES)]["throughput"] > results[1]["throughput"]
@@ -0,0 +1,191 @@
+"""
+Performance benchmark for incremental model training from the columnar feedback store.
+Loads 200k synthetic feedback records once by rebuilding feature rows from feedback
+dictionaries and once by slicing the memory-mapped store, then compares a from-scratch
+training run with a warm-started update on the 5% of feedback collected since the last
+version (plus a replay sample), and a sequential hyperparameter sweep with the parallel
+successive halving search.
+"""
+import copy
+import functools
+import logging
+import os
+import time
+
+import numpy as np
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+from src.backend.self_healing.learning.feedback_store import ColumnarFeedbackStore, records_to_columns, FEEDBACK_FEATURE_SPEC
+from src.backend.self_healing.learning.hyperparameter_search import HyperparameterSearch, generate_candidates
+from src.backend.self_healing.ai.feature_vectorizer import HashedFeatureVectorizer
+from src.backend.self_healing.learning import model_trainer
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+RECORD_COUNT = 200000
+NEW_FRACTION = 0.05
+SEGMENT_ROWS = 10000
+ISSUE_TYPES = ["data_quality", "pipeline", "resource", "schema", "dependency"]
+ERROR_TEMPLATES = {
+    "data_quality": "Null values found in column {} of table {}",
+    "pipeline": "Task {} failed with exit code {}",
+    "resource": "Memory limit exceeded on worker {} after {} retries",
+    "schema": "Field {} has type mismatch in table {}",
+    "dependency": "Upstream job {} did not finish before deadline {}"
+}
+FULL_EPOCHS = 10
+WARM_START_EPOCHS = 2
+SEARCH_CANDIDATES = 9
+SEARCH_RECORDS = 20000
+
+
+def build_feedback(count: int, seed: int = 3) -> list:
+    """Builds feedback dictionaries whose error messages depend on the issue type
+
+    Args:
+        count: Number of records
+        seed: Random seed
+
+    Returns:
+        List of feedback dictionaries
+    """
+    rng = np.random.default_rng(seed)
+    records = []
+    for index in range(count):
+        issue_type = ISSUE_TYPES[int(rng.integers(len(ISSUE_TYPES)))]
+        records.append({
+            "feedback_id": f"feedback-{index}",
+            "action_id": f"action-{index % 977}",
+            "action_type": ["retry", "resize", "backfill", "reroute"][int(rng.integers(4))],
+            "issue_type": issue_type,
+            "confidence_score": float(rng.random()),
+            "successful": bool(rng.random() < 0.8),
+            "feedback_type": "automatic",
+            "feedback_source": ["system", "operator"][int(rng.integers(2))],
+            "context": {"error_message": ERROR_TEMPLATES[issue_type].format(int(rng.integers(100)), int(rng.integers(1000))),
+                        "pipeline": f"pipeline-{int(rng.integers(40))}", "dataset": f"dataset-{int(rng.integers(80))}"},
+            "metrics": {},
+            "comments": None,
+            "timestamp": "2024-03-01T00:00:00"
+        })
+    return records
+
+
+def fill_store(path: str, records: list) -> ColumnarFeedbackStore:
+    """Appends records to a new store in collector-sized segments, then compacts it"""
+    store = ColumnarFeedbackStore(path)
+    for start in range(0, len(records), SEGMENT_ROWS):
+        store.append(records[start:start + SEGMENT_ROWS])
+    store.compact()
+    return store
+
+
+def train_network(X: np.ndarray, y: np.ndarray, config: model_trainer.TrainingConfig, initial_model=None, class_count: int = None):
+    """Trains the default network, from scratch or from a copy of initial_model"""
+    if initial_model is not None:
+        model = tf.keras.models.clone_model(initial_model)
+        model.set_weights(initial_model.get_weights())
+        model_trainer.compile_network(model, config)
+    else:
+        model = model_trainer.build_network(X.shape[1], class_count, config)
+    return model_trainer.fit_network(model, X, y, config)
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_store_load_against_rebuilding_records(tmp_path):
+    """Compares encoding feedback dictionaries per training run with slicing the store"""
+    records = build_feedback(RECORD_COUNT)
+    store = fill_store(str(tmp_path / "feedback"), records)
+
+    started = time.perf_counter()
+    rebuilt = records_to_columns([copy.deepcopy(record) for record in records], HashedFeatureVectorizer(FEEDBACK_FEATURE_SPEC))
+    rebuild_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    loaded = ColumnarFeedbackStore(store.root_path).load(columns=["issue_type", "features"])
+    load_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    new_start = int(RECORD_COUNT * (1 - NEW_FRACTION))
+    ColumnarFeedbackStore(store.root_path).load(new_start, columns=["issue_type", "features"])
+    new_load_seconds = time.perf_counter() - started
+
+    stats = store.get_stats()
+    logger.info(f"records={RECORD_COUNT} segments={stats['segments']} size={stats['size_bytes'] / 2 ** 20:.0f}MiB")
+    logger.info(f"rebuild from dictionaries: {rebuild_seconds:.2f}s")
+    logger.info(f"load from store:           {load_seconds:.3f}s speedup={rebuild_seconds / load_seconds:.0f}x")
+    logger.info(f"load new {NEW_FRACTION:.0%} from store:    {new_load_seconds:.3f}s")
+
+    np.testing.assert_array_equal(loaded["features"], rebuilt["features"])
+    assert load_seconds * 10 < rebuild_seconds
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_warm_start_against_full_retrain(tmp_path):
+    """Compares retraining from scratch with a warm-started update on the newest feedback"""
+    records = build_feedback(RECORD_COUNT)
+    store = fill_store(str(tmp_path / "feedback"), records)
+    model_trainer.hide_gpus()
+    config = model_trainer.TrainingConfig({"epochs": FULL_EPOCHS, "early_stopping": False, "batch_size": 256})
+    classes = sorted(ISSUE_TYPES)
+    new_start = int(RECORD_COUNT * (1 - NEW_FRACTION))
+
+    # Previous version, trained on the feedback collected before the new records
+    X_old, y_old, _, _ = model_trainer.prepare_training_data(store.load(stop=new_start), "classification", None, 0.0)
+    previous = train_network(X_old, model_trainer.encode_labels(y_old, classes), config, class_count=len(classes))
+
+    all_columns = store.load()
+    started = time.perf_counter()
+    X_all, y_all, X_val, y_val = model_trainer.prepare_training_data(all_columns, "classification", None, 0.1)
+    full_model = train_network(X_all, model_trainer.encode_labels(y_all, classes), config, class_count=len(classes))
+    full_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    new_records = RECORD_COUNT - new_start
+    replay = np.sort(np.random.default_rng(1).choice(new_start, size=new_records, replace=False))
+    replayed, fresh = store.take(replay), store.load(new_start)
+    columns = {column: np.concatenate([replayed[column], fresh[column]]) for column in fresh}
+    X_new, y_new, _, _ = model_trainer.prepare_training_data(columns, "classification", None, 0.0)
+    warm_config = model_trainer.TrainingConfig(dict(config.to_dict(), epochs=WARM_START_EPOCHS))
+    warm_model = train_network(X_new, model_trainer.encode_labels(y_new, classes), warm_config, initial_model=previous)
+    warm_seconds = time.perf_counter() - started
+
+    y_val = model_trainer.encode_labels(y_val, classes)
+    full_accuracy = model_trainer.evaluate_model_performance(full_model, X_val, y_val, "classification")["accuracy"]
+    warm_accuracy = model_trainer.evaluate_model_performance(warm_model, X_val, y_val, "classification")["accuracy"]
+    logger.info(f"full retrain on {len(X_all)} records: {full_seconds:.2f}s accuracy={full_accuracy:.3f}")
+    logger.info(f"warm start on {len(X_new)} records:  {warm_seconds:.2f}s accuracy={warm_accuracy:.3f} "
+                f"speedup={full_seconds / warm_seconds:.1f}x")
+
+    assert warm_accuracy >= full_accuracy - 0.02
+    assert warm_seconds * 3 < full_seconds
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_parallel_search_against_sequential_sweep(tmp_path):
+    """Compares training every candidate to the full budget in turn with parallel successive halving"""
+    store = fill_store(str(tmp_path / "feedback"), build_feedback(SEARCH_RECORDS))
+    config = model_trainer.TrainingConfig({"epochs": 9, "early_stopping": False, "batch_size": 128})
+    candidates = generate_candidates(model_trainer.DEFAULT_SEARCH_SPACE, SEARCH_CANDIDATES, seed=2)
+    trial = functools.partial(model_trainer.run_search_trial, "classification", store.root_path, store.sequence, config.to_dict())
+
+    started = time.perf_counter()
+    sequential = [trial(params, config.epochs, str(tmp_path / f"sequential-{index}")) for index, params in enumerate(candidates)]
+    sequential_seconds = time.perf_counter() - started
+
+    search = HyperparameterSearch(trial, max_workers=min(os.cpu_count() or 1, SEARCH_CANDIDATES), min_budget=1, max_budget=config.epochs)
+    result = search.run(candidates)
+
+    logger.info(f"candidates={SEARCH_CANDIDATES} budgets={result['budgets']} workers={result['workers']}")
+    logger.info(f"sequential sweep: {sequential_seconds:.2f}s best accuracy={max(sequential):.3f}")
+    logger.info(f"parallel search:  {result['elapsed_seconds']:.2f}s best accuracy={result['best_score']:.3f} "
+                f"speedup={sequential_seconds / result['elapsed_seconds']:.1f}x")
+
+    assert result["best_score"] >= max(sequential) - 0.02
+    assert result["elapsed_seconds"] < sequential_seconds
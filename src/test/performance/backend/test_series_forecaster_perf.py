@@ -0,0 +1,119 @@
+"""
+Performance benchmark for a prediction sweep over many series.
+Forecasts 5k synthetic hourly series (two weeks each, with trends, daily cycles, noise and
+gaps) against a threshold, once per series in pandas (resample, least squares fit of trend
+and hourly levels, then a step-by-step horizon check) and once with the SeriesForecaster
+aligning every series into one matrix, solving all models in closed form and evaluating the
+horizon as one matrix. Also times folding one new point per series into the models.
+"""
+import logging
+import math
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from src.backend.self_healing.ai.series_forecaster import SeriesForecaster
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+SERIES_COUNT = 5000
+HOURS = 14 * 24
+HORIZON_STEPS = 24
+THRESHOLD = 90.0
+MIN_CONFIDENCE = 0.8
+START = pd.Timestamp("2024-03-01")
+
+
+def build_frame(count: int) -> pd.DataFrame:
+    """Builds a long-format frame of hourly utilization series, as read from the metrics repository
+
+    Args:
+        count: Number of series
+
+    Returns:
+        DataFrame with resource_id, timestamp and value columns
+    """
+    rng = np.random.default_rng(21)
+    steps = np.arange(HOURS)
+    slopes = rng.choice([0.0, 0.02, 0.08], size=count, p=[0.6, 0.3, 0.1])
+    levels = rng.uniform(40, 75, count)
+    amplitudes = rng.uniform(0, 6, count)
+    values = (levels[:, None] + slopes[:, None] * steps + amplitudes[:, None] * np.sin(2 * np.pi * steps / 24)
+              + rng.normal(0, 1.5, (count, HOURS)))
+    keep = rng.random(values.shape) > 0.03
+    rows, columns = np.nonzero(keep)
+    return pd.DataFrame({
+        "resource_id": np.array([f"resource-{index}" for index in range(count)])[rows],
+        "timestamp": START + pd.to_timedelta(columns, unit="h"),
+        "value": values[rows, columns]
+    })
+
+
+def per_series_sweep(frame: pd.DataFrame) -> set:
+    """Forecasts each series on its own, as the per-entity path does
+
+    Returns:
+        Set of resource IDs forecast to cross the threshold
+    """
+    alerts = set()
+    end = frame["timestamp"].max()
+    for resource_id, group in frame.groupby("resource_id"):
+        series = group.set_index("timestamp")["value"].resample("h").mean().dropna()
+        steps = ((series.index - START) // pd.Timedelta(hours=1)).to_numpy()
+        design = np.column_stack([steps] + [(steps % 24 == phase).astype(float) for phase in range(24)])
+        coefficients, residuals, _, _ = np.linalg.lstsq(design, series.to_numpy(), rcond=None)
+        dof = len(steps) - 25
+        sigma = math.sqrt(residuals[0] / dof)
+        last = int((end - START) // pd.Timedelta(hours=1))
+        mean_step = steps.mean()
+        spread = ((steps - mean_step) ** 2).sum()
+        for step in range(last + 1, last + 1 + HORIZON_STEPS):
+            forecast = coefficients[0] * step + coefficients[1 + step % 24]
+            std = sigma * math.sqrt(1 + 1 / len(steps) + (step - mean_step) ** 2 / spread)
+            if 0.5 * math.erfc((THRESHOLD - forecast) / (std * math.sqrt(2))) >= MIN_CONFIDENCE:
+                alerts.add(resource_id)
+                break
+    return alerts
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_batch_forecasting_against_per_series():
+    """Compares a per-series sweep with batch fitting, horizon evaluation and incremental updates"""
+    frame = build_frame(SERIES_COUNT)
+
+    started = time.perf_counter()
+    expected = per_series_sweep(frame)
+    per_series_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    forecaster = SeriesForecaster(step_seconds=3600, season_length=24, origin=START.timestamp())
+    forecaster.fit_frame(frame, "resource_id")
+    fit_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    alerts = forecaster.predict_exceedance(THRESHOLD, HORIZON_STEPS, MIN_CONFIDENCE)
+    horizon_seconds = time.perf_counter() - started
+
+    # One new point per series arrives; fold it in without refitting
+    new_time = START + pd.Timedelta(hours=HOURS)
+    entity_ids = forecaster.entity_ids
+    values = np.random.default_rng(5).uniform(40, 80, len(entity_ids))
+    started = time.perf_counter()
+    forecaster.update(entity_ids, np.full(len(entity_ids), new_time.timestamp()), values)
+    forecaster.predict_exceedance(THRESHOLD, HORIZON_STEPS, MIN_CONFIDENCE)
+    update_seconds = time.perf_counter() - started
+
+    batch_seconds = fit_seconds + horizon_seconds
+    logger.info(f"series={SERIES_COUNT} points={len(frame)} horizon={HORIZON_STEPS} alerts={len(alerts)}")
+    logger.info(f"per-series sweep: {per_series_seconds:.2f}s")
+    logger.info(f"batch sweep:      {batch_seconds:.3f}s (fit {fit_seconds:.3f}s, horizon {horizon_seconds:.3f}s) "
+                f"speedup={per_series_seconds / batch_seconds:.0f}x")
+    logger.info(f"incremental update of one point per series and new sweep: {update_seconds:.3f}s")
+
+    assert {alert.entity_id for alert in alerts} == expected
+    assert batch_seconds * 10 < per_series_seconds
@@ -0,0 +1,89 @@
+"""
+Performance benchmark for strategy applicability checks.
+Evaluates 200 synthetic strategies against 5000 issue contexts once by looking up every
+strategy by name and interpreting its rule tree with evaluate_rules, as is_strategy_applicable
+did, and once with a single get_applicable_strategies call per context on the compiled set.
+"""
+import logging
+import random
+import time
+
+import pytest
+
+from src.backend.self_healing.config.rule_compiler import CompiledStrategySet
+from src.backend.self_healing.config.strategy_config import evaluate_rules
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+STRATEGY_COUNT = 200
+CONTEXT_COUNT = 5000
+ISSUE_TYPES = ["data_quality", "pipeline", "resource", "schema", "dependency"]
+TABLES = [f"table_{index}" for index in range(20)]
+
+
+def build_strategies(count: int, seed: int = 5) -> list:
+    """Builds strategies that gate on the issue type before checking metrics and sources"""
+    rng = random.Random(seed)
+    strategies = []
+    for index in range(count):
+        conditions = [
+            {"field": "issue.details.row_count", "operator": ">", "value": rng.choice([0, 100, 10000])},
+            {"operator": "OR", "conditions": [
+                {"field": "issue.source.table", "operator": "in", "value": rng.sample(TABLES, 4)},
+                {"field": "issue.details.null_ratio", "operator": ">=", "value": rng.choice([0.1, 0.3, 0.5])}
+            ]},
+            {"field": "issue.severity", "operator": ">=", "value": rng.randint(1, 4)},
+            {"field": "issue.issue_type", "value": rng.choice(ISSUE_TYPES)}
+        ]
+        strategies.append({"name": f"strategy-{index}", "action_type": "DATA_CORRECTION",
+                           "applicability_rules": {"operator": "AND", "conditions": conditions}})
+    return strategies
+
+
+def build_contexts(count: int, seed: int = 6) -> list:
+    """Builds issue contexts with nested details"""
+    rng = random.Random(seed)
+    return [{"issue": {"issue_type": rng.choice(ISSUE_TYPES), "severity": rng.randint(1, 4),
+                       "source": {"table": rng.choice(TABLES)},
+                       "details": {"row_count": rng.choice([50, 5000, 50000]), "null_ratio": rng.random()}}}
+            for _ in range(count)]
+
+
+def interpret_applicable(config: dict, strategy_names: list, context: dict) -> list:
+    """Checks every strategy by name with the rule interpreter"""
+    applicable = []
+    for name in strategy_names:
+        strategy = next((s for s in config["strategies"] if s.get("name") == name), None)
+        if strategy and (not strategy["applicability_rules"] or evaluate_rules(strategy["applicability_rules"], context)):
+            applicable.append(name)
+    return applicable
+
+
+@pytest.mark.performance
+@pytest.mark.healing
+def test_compiled_strategy_set_against_rule_interpreter():
+    """Compares per-strategy rule interpretation with one compiled evaluation per context"""
+    config = {"strategies": build_strategies(STRATEGY_COUNT)}
+    names = [strategy["name"] for strategy in config["strategies"]]
+    contexts = build_contexts(CONTEXT_COUNT)
+
+    started = time.perf_counter()
+    interpreted = [interpret_applicable(config, names, context) for context in contexts]
+    interpret_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled_set = CompiledStrategySet(config)
+    compile_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled = [compiled_set.get_applicable_strategies(context) for context in contexts]
+    compiled_seconds = time.perf_counter() - started
+
+    logger.info(f"strategies={STRATEGY_COUNT} contexts={CONTEXT_COUNT} stats={compiled_set.get_stats()}")
+    logger.info(f"interpreted: {interpret_seconds:.2f}s")
+    logger.info(f"compiled:    {compiled_seconds:.2f}s (+{compile_seconds * 1000:.1f}ms to compile) "
+                f"speedup={interpret_seconds / compiled_seconds:.1f}x")
+
+    assert compiled == interpreted
+    assert compiled_seconds * 3 < interpret_seconds
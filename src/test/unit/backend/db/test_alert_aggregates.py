@@ -0,0 +1,261 @@
+"""
+Unit tests for incrementally maintained alert aggregates.
+Tests that status transitions move counts instead of double counting, that late updates
+are ignored, that window queries agree with results computed from raw alert rows, that
+checkpoints and the consistency check round trip, and that AlertRepository rolls back
+alerts the write buffer rejects and keeps its aggregates caught up with the table.
+"""
+
+import datetime  # package_version: standard library
+import json  # package_version: standard library
+import random  # package_version: standard library
+from collections import Counter  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.constants import AlertSeverity  # Module(src.backend.constants)
+from src.backend.db.models.alert import Alert  # Module(src.backend.db.models.alert)
+from src.backend.db.repositories import alert_repository  # Module(src.backend.db.repositories.alert_repository)
+from src.backend.db.repositories.alert_aggregates import AlertAggregateStore  # Module(src.backend.db.repositories.alert_aggregates)
+from src.backend.db.repositories.alert_repository import AlertRepository  # Module(src.backend.db.repositories.alert_repository)
+from src.backend.utils.storage.write_buffer import WriteBuffer  # Module(src.backend.utils.storage.write_buffer)
+
+NOW = datetime.datetime(2023, 3, 10, 12, 30)
+SEVERITIES = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+COMPONENTS = ["ingestion", "quality", None]
+
+
+def make_row(alert_id, created_at, status="NEW", severity="HIGH", component="ingestion",
+             updated_at=None, resolved_at=None, notifications=None):
+    """Builds an alert row as stored in BigQuery"""
+    return {
+        "alert_id": alert_id,
+        "created_at": created_at.isoformat(),
+        "updated_at": (updated_at or created_at).isoformat(),
+        "resolved_at": resolved_at.isoformat() if resolved_at else None,
+        "status": status,
+        "severity": severity,
+        "component": component,
+        "notifications": json.dumps(notifications or [])
+    }
+
+
+@pytest.fixture
+def rows():
+    """Alert rows spread over three days, some resolved and notified"""
+    rng = random.Random(11)
+    rows = []
+    for index in range(400):
+        created_at = NOW - datetime.timedelta(minutes=rng.randint(0, 72 * 60))
+        status = rng.choice(["NEW", "ACKNOWLEDGED", "RESOLVED", "SUPPRESSED"])
+        resolved_at = created_at + datetime.timedelta(seconds=rng.randint(30, 7200)) if status == "RESOLVED" else None
+        notifications = [{"channel": rng.choice(["EMAIL", "TEAMS"]), "success": rng.random() < 0.8}
+                         for _ in range(rng.randint(0, 2))]
+        rows.append(make_row(f"alert-{index}", created_at, status, rng.choice(SEVERITIES),
+                             rng.choice(COMPONENTS), resolved_at=resolved_at, notifications=notifications))
+    return rows
+
+
+@pytest.fixture
+def store(rows):
+    """Store loaded from the rows with a fixed clock"""
+    store = AlertAggregateStore(retention_hours=96, clock=lambda: NOW)
+    store.rebuild(rows)
+    return store
+
+
+class FakeAlertTable:
+    """BigQuery client stub holding alert rows and answering the aggregate queries"""
+
+    def __init__(self, bad_ids=()):
+        self.rows = {}
+        self.bad_ids = set(bad_ids)
+
+    def insert_rows(self, *args, row_ids=None, return_errors=False):
+        if self.bad_ids & set(row_ids):
+            return [{"index": index, "errors": [{"reason": "invalid" if row_id in self.bad_ids else "stopped"}]}
+                    for index, row_id in enumerate(row_ids)]
+        for row in args[-1]:
+            self.rows[row["alert_id"]] = row
+        return []
+
+    def query(self, query, query_params=None):
+        if "GROUP BY" in query:
+            counts = Counter((row["status"], row["severity"], row["component"]) for row in self.rows.values())
+            return [{"status": status, "severity": severity, "component": component, "count": count}
+                    for (status, severity, component), count in counts.items()]
+        watermark = next((param["parameterValue"]["value"] for param in query_params or []
+                          if param["name"] == "watermark"), None)
+        return [row for row in self.rows.values() if watermark is None or str(row["updated_at"]) >= watermark]
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Alert repository over a fake table with a manually flushed write buffer"""
+    monkeypatch.setattr(alert_repository, "get_config", lambda: {})
+    monkeypatch.setattr(AlertRepository, "ensure_table_exists", lambda self: True)
+    table = FakeAlertTable(bad_ids=["bad"])
+    buffer = WriteBuffer(table, {"max_attempts": 2, "backoff_strategy": "constant", "base_delay": 0.001},
+                         start_thread=False)
+    repository = AlertRepository(table, dataset_id="ds", project_id="proj", write_buffer=buffer,
+                                 aggregates=AlertAggregateStore(retention_hours=96))
+    assert repository._load_aggregates()
+    return repository
+
+
+def make_alert(alert_id, component="ingestion"):
+    """Creates a new high severity alert"""
+    return Alert("pipeline_failure", "Pipeline failed", AlertSeverity.HIGH, {}, component=component, alert_id=alert_id)
+
+
+def in_window(rows, hours):
+    """Returns the rows created within a window ending now"""
+    start = NOW - datetime.timedelta(hours=hours)
+    return [row for row in rows if datetime.datetime.fromisoformat(row["created_at"]) >= start]
+
+
+def test_transitions_move_counts_without_double_counting():
+    """Acknowledging and resolving moves an alert between status counters"""
+    store = AlertAggregateStore(clock=lambda: NOW)
+    store.rebuild([])
+    created_at = NOW - datetime.timedelta(minutes=90)
+
+    store.apply(make_row("a-1", created_at))
+    store.apply(make_row("a-2", created_at, severity="LOW"))
+    store.apply(make_row("a-1", created_at, status="ACKNOWLEDGED",
+                         updated_at=created_at + datetime.timedelta(minutes=5)))
+    store.apply(make_row("a-1", created_at, status="RESOLVED",
+                         updated_at=created_at + datetime.timedelta(minutes=20),
+                         resolved_at=created_at + datetime.timedelta(minutes=20)))
+
+    assert store.count_by("status", 24) == {"NEW": 1, "RESOLVED": 1}
+    assert store.count_by("severity", 24) == {"HIGH": 1, "LOW": 1}
+    assert store.resolution_stats(24)["by_severity"]["HIGH"]["avg_seconds"] == 1200
+
+    # A late, out-of-order acknowledgement does not undo the resolution
+    assert not store.apply(make_row("a-1", created_at, status="ACKNOWLEDGED",
+                                    updated_at=created_at + datetime.timedelta(minutes=10)))
+    assert store.count_by("status", 24) == {"NEW": 1, "RESOLVED": 1}
+
+    # Reopening retracts the resolution time from the rebuilt bucket
+    store.apply(make_row("a-1", created_at, status="NEW", updated_at=created_at + datetime.timedelta(minutes=30)))
+    assert store.resolution_stats(24)["total_resolved"] == 0
+    assert store.count_by("status", 24) == {"NEW": 2}
+
+
+@pytest.mark.parametrize("hours", [1, 5, 24, 50])
+def test_window_counts_match_raw_rows(store, rows, hours):
+    """Counts over windows with partial boundary buckets equal counts over raw rows"""
+    selected = in_window(rows, hours)
+
+    for dimension in ("status", "severity", "component"):
+        assert store.count_by(dimension, hours) == Counter(row[dimension] for row in selected)
+    assert list(store.count_by("severity", hours)) == [s for s in SEVERITIES if s in store.count_by("severity", hours)]
+
+
+@pytest.mark.parametrize("interval,num_intervals", [("hourly", 6), ("daily", 2), ("weekly", 1)])
+def test_trend_matches_raw_rows(store, rows, interval, num_intervals):
+    """Trend labels and counts follow the raw query's formatting"""
+    hours = {"hourly": 1, "daily": 24, "weekly": 168}[interval] * num_intervals
+    expected = Counter()
+    for row in in_window(rows, hours):
+        if row["severity"] != "HIGH":
+            continue
+        created_at = datetime.datetime.fromisoformat(row["created_at"])
+        if interval == "hourly":
+            label = created_at.strftime("%Y-%m-%d %H:00:00")
+        elif interval == "daily":
+            label = created_at.strftime("%Y-%m-%d")
+        else:
+            label = (created_at - datetime.timedelta(days=(created_at.weekday() + 1) % 7)).strftime("%Y-%m-%d")
+        expected[label] += 1
+
+    assert store.trend(interval, num_intervals, severity="HIGH") == sorted(expected.items())
+
+
+def test_notification_and_resolution_stats_match_raw_rows(store, rows):
+    """Notification outcomes and resolution times agree with the raw rows"""
+    selected = in_window(rows, 30)
+
+    outcomes = Counter()
+    for row in selected:
+        for notification in json.loads(row["notifications"]):
+            outcomes[(notification["channel"], notification["success"])] += 1
+    notification_stats = store.notification_stats(30)
+    assert notification_stats["channels"]["EMAIL"]["success"] == outcomes[("EMAIL", True)]
+    assert notification_stats["channels"]["TEAMS"]["failure"] == outcomes[("TEAMS", False)]
+    assert notification_stats["total_notifications"] == sum(outcomes.values())
+
+    resolution_times = [
+        (datetime.datetime.fromisoformat(row["resolved_at"]) - datetime.datetime.fromisoformat(row["created_at"]))
+        .total_seconds() for row in selected if row["status"] == "RESOLVED"
+    ]
+    resolution_stats = store.resolution_stats(30)
+    assert resolution_stats["total_resolved"] == len(resolution_times)
+    assert resolution_stats["overall_avg_seconds"] == pytest.approx(sum(resolution_times) / len(resolution_times))
+    assert resolution_stats["overall_max_seconds"] == max(resolution_times)
+
+
+def test_checkpoint_round_trip_and_consistency_check(store, tmp_path):
+    """A checkpoint restores identical aggregates and the check reports drift"""
+    path = str(tmp_path / "alerts" / "aggregates.json")
+    store.save_checkpoint(path)
+
+    restored = AlertAggregateStore(retention_hours=96, clock=lambda: NOW)
+    assert restored.load_checkpoint(path)
+    assert restored.watermark == store.watermark
+    assert restored.window_counts(72) == store.window_counts(72)
+    assert restored.resolution_stats(72)["total_resolved"] == store.resolution_stats(72)["total_resolved"]
+
+    raw_rows = [{"status": status, "severity": severity, "component": component, "count": count}
+                for (status, severity, component), count in store.window_counts(24).items()]
+    assert store.compare_counts(raw_rows, 24)["consistent"]
+
+    raw_rows[0]["count"] += 1
+    report = store.compare_counts(raw_rows, 24)
+    assert not report["consistent"]
+    assert report["expected_total"] - report["actual_total"] == 1
+    assert len(report["mismatches"]) == 1
+
+
+def test_retention_and_deletions(store):
+    """Windows beyond the retention are not covered and deleted alerts are dropped"""
+    assert store.covers(96) and not store.covers(97) and not store.covers(None)
+
+    total = sum(store.window_counts(96).values())
+    removed = store.drop_before(NOW - datetime.timedelta(hours=24))
+    assert sum(store.window_counts(96).values()) == total - removed
+    assert store.window_counts(96) == store.window_counts(24)
+
+
+def test_repository_rolls_back_rejected_alerts(repository):
+    """Alerts the buffer refuses or dead-letters are removed from the aggregates again"""
+    repository.create_alert(make_alert("good"))
+    repository.create_alert(make_alert("bad"))
+    assert sum(repository._aggregates.window_counts(24).values()) == 2
+
+    repository._write_buffer.flush()
+    assert sum(repository._aggregates.window_counts(24).values()) == 1
+    assert set(repository._bq_client.rows) == {"good"}
+
+    with pytest.raises(RuntimeError):
+        repository.create_alert(make_alert("bad"), durable=True)
+    assert sum(repository._aggregates.window_counts(24).values()) == 1
+
+
+def test_repository_catches_up_and_verifies(repository):
+    """Alerts written elsewhere are caught up, and drift is repaired by the scheduled verification"""
+    table = repository._bq_client
+    repository.create_alert(make_alert("local"), durable=True)
+    table.insert_rows("proj", "ds", "alerts", [make_alert("remote", "quality").to_bigquery_row()], row_ids=["remote"])
+
+    # Within the refresh interval the aggregates are served as they are
+    assert repository._get_aggregates(24).count_by("component", 24) == {"ingestion": 1}
+    repository._refresh_interval = 0
+    assert repository._get_aggregates(24).count_by("component", 24) == {"ingestion": 1, "quality": 1}
+
+    # Deleted elsewhere without a newer update: only the verification notices
+    del table.rows["remote"]
+    assert repository._get_aggregates(24).count_by("component", 24) == {"ingestion": 1, "quality": 1}
+    repository._verify_interval = 0
+    assert repository._get_aggregates(24).count_by("component", 24) == {"ingestion": 1}
@@ -0,0 +1,259 @@
+"""
+Unit tests for multi-resolution metric rollups.
+Tests quantile sketch accuracy and merging, rollup row building, segment planning
+across rollup tiers, MetricsRepository reads that combine rollups with raw rows, including
+series for many label values read at once, and the maintenance that records rollup coverage.
+"""
+
+import datetime  # package_version: standard library
+import random  # package_version: standard library
+from unittest import mock  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.db.models.pipeline_metric import PipelineMetric  # Module(src.backend.db.models.pipeline_metric)
+from src.backend.db.repositories.metric_rollups import (  # Module(src.backend.db.repositories.metric_rollups)
+    ROLLUP_TIERS,
+    QuantileSketch,
+    RollupSegment,
+    build_rollup_rows,
+    plan_rollup_segments
+)
+
+BASE_TIME = datetime.datetime(2023, 1, 1)
+TIERS = {tier.name: tier for tier in ROLLUP_TIERS}
+
+
+def make_metric(name, value, timestamp, labels=None):
+    """Builds a pipeline metric recorded at a fixed time"""
+    metric = PipelineMetric(execution_id="exec-1", metric_name=name, metric_value=value, labels=labels)
+    metric.timestamp = timestamp
+    return metric
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    """Sketch quantiles stay within the configured relative error of exact quantiles"""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1.5) for _ in range(20000)] + [-v for v in (1.0, 2.0, 3.0)] + [0.0]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.0201)
+    assert sketch.quantile(0) == ordered[0]
+    assert sketch.quantile(1) == ordered[-1]
+
+
+def test_sketch_merge_and_serialization_match_single_sketch():
+    """Merged partial sketches and their serialized form answer like one sketch"""
+    rng = random.Random(11)
+    values = [rng.uniform(-50, 500) for _ in range(5000)]
+    whole = QuantileSketch()
+    parts = [QuantileSketch() for _ in range(4)]
+    for index, value in enumerate(values):
+        whole.add(value)
+        parts[index % 4].add(value)
+
+    merged = QuantileSketch.from_dict(parts[0].to_dict())
+    for part in parts[1:]:
+        merged.merge(QuantileSketch.from_dict(part.to_dict()))
+
+    assert merged.count == whole.count
+    for q in (0.1, 0.5, 0.95):
+        assert merged.quantile(q) == whole.quantile(q)
+
+
+def test_build_rollup_rows_aggregates_per_tier_and_skips_non_numeric():
+    """Rollup rows are keyed by metric, canonical labels and tier-aligned bucket"""
+    metrics = [
+        make_metric("latency", 10, BASE_TIME + datetime.timedelta(seconds=5), {"b": "2", "a": "1"}),
+        make_metric("latency", 30, BASE_TIME + datetime.timedelta(seconds=65), {"a": "1", "b": "2"}),
+        make_metric("latency", "fast", BASE_TIME),
+        make_metric("latency", True, BASE_TIME)
+    ]
+
+    rows = build_rollup_rows(metrics)
+
+    minute_rows = sorted(rows[TIERS["1m"].table_name], key=lambda row: row["bucket_start"])
+    assert [row["count"] for row in minute_rows] == [1, 1]
+    hour_rows = rows[TIERS["1h"].table_name]
+    assert len(hour_rows) == 1
+    assert hour_rows[0]["labels"] == '{"a":"1","b":"2"}'
+    assert hour_rows[0]["bucket_start"] == BASE_TIME.isoformat()
+    assert (hour_rows[0]["count"], hour_rows[0]["sum"], hour_rows[0]["min"], hour_rows[0]["max"]) == (2, 40.0, 10.0, 30.0)
+
+
+def test_plan_uses_coarsest_tier_and_finer_edges():
+    """Whole days come from the daily tier, edges from hourly, minute and raw segments"""
+    start = datetime.datetime(2023, 1, 1, 22, 30, 15)
+    end = datetime.datetime(2023, 1, 4, 1, 45)
+
+    segments = plan_rollup_segments(start, end, coverage_start=BASE_TIME)
+
+    assert segments == [
+        RollupSegment(None, start, datetime.datetime(2023, 1, 1, 22, 31)),
+        RollupSegment(TIERS["1m"], datetime.datetime(2023, 1, 1, 22, 31), datetime.datetime(2023, 1, 1, 23)),
+        RollupSegment(TIERS["1h"], datetime.datetime(2023, 1, 1, 23), datetime.datetime(2023, 1, 2)),
+        RollupSegment(TIERS["1d"], datetime.datetime(2023, 1, 2), datetime.datetime(2023, 1, 4)),
+        RollupSegment(TIERS["1h"], datetime.datetime(2023, 1, 4), datetime.datetime(2023, 1, 4, 1)),
+        RollupSegment(TIERS["1m"], datetime.datetime(2023, 1, 4, 1), end)
+    ]
+
+
+def test_plan_respects_resolution_and_coverage_start():
+    """Tiers coarser than the resolution and time before coverage are not read from rollups"""
+    start = datetime.datetime(2023, 1, 1)
+    end = datetime.datetime(2023, 1, 3)
+    coverage_start = datetime.datetime(2023, 1, 1, 12)
+
+    segments = plan_rollup_segments(start, end, resolution_seconds=3600, coverage_start=coverage_start)
+
+    assert segments == [
+        RollupSegment(None, start, coverage_start),
+        RollupSegment(TIERS["1h"], coverage_start, end)
+    ]
+    assert plan_rollup_segments(start, end) == [RollupSegment(None, start, end)]
+
+
+class TestMetricsRepositoryRollups:
+    """Tests for MetricsRepository reads against a local DuckDB-backed client"""
+
+    @pytest.fixture
+    def make_repository(self):
+        pytest.importorskip("duckdb")
+        from src.backend.db.repositories import metrics_repository
+        from src.backend.utils.storage.local_query_engine import LocalBigQueryClient
+        from src.backend.utils.storage.query_cache import QueryResultCache
+
+        client = LocalBigQueryClient(project_id="test-project")
+
+        def make(settings):
+            config = mock.MagicMock()
+            config.get.side_effect = lambda key, default=None: settings.get(key, default)
+            with mock.patch.object(metrics_repository, "get_config", return_value=config):
+                return metrics_repository.MetricsRepository(
+                    client,
+                    dataset_id="metrics",
+                    project_id="test-project",
+                    query_cache=QueryResultCache()
+                )
+        return make
+
+    @pytest.fixture
+    def repository(self, make_repository):
+        from src.backend.db.repositories import metrics_repository
+        return make_repository({metrics_repository.ROLLUPS_COVERAGE_START_CONFIG_KEY: "2023-01-01T06:00:00"})
+
+    @pytest.fixture
+    def metrics(self):
+        # Two hours before rollup coverage starts, then two days with rollups
+        rng = random.Random(3)
+        metrics = []
+        for minute in range(0, 54 * 60, 7):
+            timestamp = datetime.datetime(2023, 1, 1, 4) + datetime.timedelta(minutes=minute)
+            labels = {"pipeline": "orders" if minute % 2 else "billing"}
+            metrics.append(make_metric("latency", round(rng.uniform(1, 100), 3), timestamp, labels))
+        return metrics
+
+    def test_reads_combine_rollups_and_raw_rows(self, repository, metrics):
+        """Time series, percentiles and comparisons agree with values computed from raw metrics"""
+        # Rollups are only written for metrics recorded once coverage starts
+        repository._rollups_enabled = False
+        repository.batch_create_metrics([m for m in metrics if m.timestamp < repository._rollup_coverage_start])
+        repository._rollups_enabled = True
+        repository.batch_create_metrics([m for m in metrics if m.timestamp >= repository._rollup_coverage_start])
+
+        start = datetime.datetime(2023, 1, 1, 4, 30)
+        end = datetime.datetime(2023, 1, 3, 5, 15)
+        selected = [m for m in metrics if start <= m.timestamp <= end and m.labels["pipeline"] == "orders"]
+
+        series = repository.get_metric_time_series("latency", start, end, {"pipeline": "orders"}, aggregation="sum")
+        expected = {}
+        for metric in selected:
+            bucket = metric.timestamp.replace(minute=0, second=0)
+            expected[bucket] = expected.get(bucket, 0.0) + metric.metric_value
+        assert {ts.replace(tzinfo=None): value for ts, value in series["value"].items()} == pytest.approx(expected)
+
+        values = sorted(m.metric_value for m in selected)
+        percentiles = repository.get_metric_percentiles("latency", start, end, [50, 90], {"pipeline": "orders"})
+        assert percentiles[50] == pytest.approx(values[int(0.5 * (len(values) - 1))], rel=0.0201)
+        assert percentiles[90] == pytest.approx(values[int(0.9 * (len(values) - 1))], rel=0.0201)
+
+        comparison = repository.compare_metric_periods(
+            "latency", start, end, datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2), aggregation="count"
+        )
+        assert comparison["period1_value"] == len([m for m in metrics if start <= m.timestamp <= end])
+        assert comparison["period2_value"] == 0
+
+    def test_series_by_label_match_series_per_label(self, repository, metrics):
+        """One grouped read returns the same series as reading each label value separately"""
+        repository._rollups_enabled = False
+        repository.batch_create_metrics([m for m in metrics if m.timestamp < repository._rollup_coverage_start])
+        repository._rollups_enabled = True
+        repository.batch_create_metrics([m for m in metrics if m.timestamp >= repository._rollup_coverage_start])
+
+        start = datetime.datetime(2023, 1, 1, 4, 30)
+        end = datetime.datetime(2023, 1, 2, 5, 15)
+        grouped = repository.get_metric_time_series_by_label(
+            "latency", start, end, "pipeline", ["orders", "billing", "unknown"], aggregation="max"
+        )
+
+        assert sorted(grouped) == ["billing", "orders"]
+        for pipeline, frame in grouped.items():
+            single = repository.get_metric_time_series("latency", start, end, {"pipeline": pipeline}, aggregation="max")
+            assert list(frame.index) == list(single.index)
+            assert list(frame["value"]) == pytest.approx(list(single["value"]))
+        assert repository.get_metric_time_series_by_label("latency", start, end, "pipeline", []) == {}
+
+    def test_compact_and_backfill_preserve_aggregates(self, repository, metrics):
+        """Compaction merges partial rows and backfill rebuilds rollups from raw rows"""
+        for index in range(0, len(metrics), 50):
+            repository.batch_create_metrics(metrics[index:index + 50])
+
+        start = datetime.datetime(2023, 1, 1, 6)
+        end = datetime.datetime(2023, 1, 3, 9, 59)
+        before = repository.get_metric_time_series("latency", start, end, aggregation="avg")
+
+        hour_table = f"`test-project.metrics.{TIERS['1h'].table_name}`"
+        count_query = f"SELECT COUNT(*) AS rows FROM {hour_table}"
+        partial_rows = repository._bq_client.query(count_query)[0]["rows"]
+        compacted_rows = repository.compact_metric_rollups("1h", start, end)
+        assert compacted_rows < partial_rows
+
+        repository.backfill_metric_rollups(start, end)
+        after = repository.get_metric_time_series("latency", start, end, aggregation="avg")
+
+        assert list(after.index) == list(before.index)
+        assert list(after["value"]) == pytest.approx(list(before["value"]))
+
+    def test_maintenance_establishes_coverage_and_compacts(self, make_repository, metrics):
+        """Rollups are read once maintenance has backfilled history and recorded their coverage"""
+        repository = make_repository({})
+        for index in range(0, len(metrics), 50):
+            repository.batch_create_metrics(metrics[index:index + 50])
+        start = datetime.datetime(2023, 1, 1, 4, 30)
+        end = datetime.datetime(2023, 1, 3, 9, 59)
+        raw = repository.get_metric_time_series("latency", start, end, aggregation="avg")
+        assert repository._get_rollup_coverage_start() is None
+
+        # The first day of rollups written on insert has not settled yet
+        assert repository.maintain_metric_rollups(now=datetime.datetime(2023, 1, 2, 1))["coverage_start"] is None
+
+        hour_table = f"`test-project.metrics.{TIERS['1h'].table_name}`"
+        count_query = f"SELECT COUNT(*) AS rows FROM {hour_table} WHERE bucket_start >= '2023-01-02'"
+        partial_rows = repository._bq_client.query(count_query)[0]["rows"]
+        result = repository.maintain_metric_rollups(now=datetime.datetime(2023, 1, 4, 12))
+
+        assert result["coverage_start"] == datetime.datetime(2022, 12, 5)
+        assert result["backfilled"]["1h"] > 0
+        assert repository._bq_client.query(count_query)[0]["rows"] < partial_rows
+
+        # Other repositories read the recorded coverage
+        reader = make_repository({})
+        assert reader._get_rollup_coverage_start() == datetime.datetime(2022, 12, 5)
+        series = reader.get_metric_time_series("latency", start, end, aggregation="avg")
+        assert list(series.index) == list(raw.index)
+        assert list(series["value"]) == pytest.approx(list(raw["value"]))
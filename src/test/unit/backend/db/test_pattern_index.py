@@ -0,0 +1,117 @@
+"""
+Unit tests for the resident issue pattern index used by HealingRepository.
+Tests that indexed matching agrees with IssuePattern.matches_issue, incremental
+refresh by updated_at, write-through upserts and removals, and top-k selection.
+"""
+
+import datetime  # package_version: standard library
+import random  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.db.models.issue_pattern import IssuePattern  # Module(src.backend.db.models.issue_pattern)
+from src.backend.db.repositories.pattern_index import IssuePatternIndex  # Module(src.backend.db.repositories.pattern_index)
+
+BASE_TIME = datetime.datetime(2023, 1, 1)
+
+
+def make_pattern(index, features, threshold=0.7, updated_at=None):
+    """Builds an issue pattern with deterministic timestamps"""
+    created_at = BASE_TIME + datetime.timedelta(minutes=index)
+    return IssuePattern(
+        pattern_id=f"pattern-{index}",
+        name=f"Pattern {index}",
+        pattern_type="pipeline",
+        description="",
+        features=features,
+        confidence_threshold=threshold,
+        created_at=created_at,
+        updated_at=updated_at or created_at
+    )
+
+
+def linear_scan(patterns, issue, min_confidence=None, limit=10):
+    """Reference implementation: the previous full scan in created_at DESC order"""
+    ordered = sorted(patterns, key=lambda p: p.created_at, reverse=True)
+    matches = []
+    for pattern in ordered:
+        matched, score = pattern.matches_issue(issue, min_confidence)
+        if matched:
+            matches.append((pattern.pattern_id, score))
+    matches.sort(key=lambda item: item[1], reverse=True)
+    return matches[:limit]
+
+
+@pytest.fixture
+def patterns():
+    """Provides randomized patterns over a small feature vocabulary"""
+    rng = random.Random(7)
+    keys = ["issue_type", "component", "error_code", "table", "severity"]
+    result = []
+    for index in range(300):
+        chosen = rng.sample(keys, rng.randint(1, len(keys)))
+        features = {key: f"{key}-{rng.randint(0, 3)}" for key in chosen}
+        result.append(make_pattern(index, features, threshold=rng.choice([0.3, 0.5, 0.7, 0.9])))
+    return result
+
+
+def test_matches_agree_with_linear_scan(patterns):
+    """Tests that indexed matching returns the same patterns and scores as a full scan"""
+    index = IssuePatternIndex(lambda since: patterns)
+    index.ensure_fresh()
+
+    rng = random.Random(11)
+    for _ in range(50):
+        issue = {"issue_type": f"issue_type-{rng.randint(0, 3)}", "component": f"component-{rng.randint(0, 3)}",
+                 "error_code": f"error_code-{rng.randint(0, 3)}"}
+        for min_confidence in (None, 0.4, 0.8):
+            expected = linear_scan(patterns, issue, min_confidence, limit=5)
+            actual = [(pattern.pattern_id, score) for pattern, score in index.find_matches(issue, min_confidence, 5)]
+            assert [score for _, score in actual] == pytest.approx([score for _, score in expected])
+            assert actual == expected
+
+
+def test_incremental_refresh_uses_watermark():
+    """Tests that refreshes request patterns updated since the newest indexed pattern"""
+    calls = []
+    stored = {"pattern-1": make_pattern(1, {"component": "bigquery"})}
+
+    def loader(since):
+        calls.append(since)
+        return [pattern for pattern in stored.values() if since is None or pattern.updated_at >= since]
+
+    index = IssuePatternIndex(loader, refresh_interval_seconds=0)
+    index.ensure_fresh()
+    stored["pattern-2"] = make_pattern(2, {"component": "gcs"}, updated_at=BASE_TIME + datetime.timedelta(days=1))
+    index.ensure_fresh()
+
+    assert calls == [None, BASE_TIME + datetime.timedelta(minutes=1)]
+    assert len(index) == 2
+    assert index.get_stats()["watermark"] == (BASE_TIME + datetime.timedelta(days=1)).isoformat()
+
+
+def test_upsert_and_remove_update_postings():
+    """Tests that write-through updates replace old postings and removals drop them"""
+    pattern = make_pattern(1, {"component": "bigquery", "error_code": "quota"})
+    index = IssuePatternIndex(lambda since: [pattern])
+    index.ensure_fresh()
+    assert index.find_matches({"component": "bigquery", "error_code": "quota"})
+
+    # Features mutated in place must not leave stale postings behind
+    pattern.features["component"] = "gcs"
+    index.upsert(pattern)
+    assert not index.find_matches({"component": "bigquery", "error_code": "other"}, min_confidence=0.6)
+    assert index.find_matches({"component": "gcs", "error_code": "quota"})[0][1] == pytest.approx(1.0)
+
+    assert index.remove("pattern-1")
+    assert index.find_matches({"component": "gcs", "error_code": "quota"}) == []
+    assert index.get_stats()["feature_values"] == 0
+
+
+def test_unhashable_feature_values():
+    """Tests that list and dict feature values are matched by equality"""
+    pattern = make_pattern(1, {"columns": ["a", "b"], "context": {"table": "orders"}})
+    index = IssuePatternIndex(lambda since: [pattern])
+    index.ensure_fresh()
+
+    matches = index.find_matches({"columns": ["a", "b"], "context": {"table": "orders"}})
+    assert [(match.pattern_id, score) for match, score in matches] == [("pattern-1", 1.0)]
@@ -0,0 +1,125 @@
+"""
+Unit tests for the time-decayed success rate store.
+Tests that outcomes decay with their age, that replaying history in any order gives the
+same counters, that sparse keys are shrunk towards their pattern and action type, that
+snapshots round trip, and that the process shares one store.
+"""
+
+import datetime  # package_version: standard library
+import random  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.db.repositories import success_rate_store  # Module(src.backend.db.repositories.success_rate_store)
+from src.backend.db.repositories.success_rate_store import DecayedSuccessRateStore, get_success_rate_store  # Module(src.backend.db.repositories.success_rate_store)
+
+NOW = datetime.datetime(2023, 3, 10, 12, 0)
+
+
+def make_store(**kwargs):
+    """Store with a fixed clock and a one-day half-life"""
+    kwargs.setdefault("half_life_days", 1.0)
+    return DecayedSuccessRateStore(clock=lambda: NOW, **kwargs)
+
+
+def outcome(successful, days_ago, action_type="DATA_CORRECTION", pattern_id="p1", issue_category="data_quality"):
+    """Builds an execution outcome row as read from BigQuery"""
+    return {
+        "action_type": action_type,
+        "pattern_id": pattern_id,
+        "issue_category": issue_category,
+        "successful": successful,
+        "completion_time": (NOW - datetime.timedelta(days=days_ago)).isoformat()
+    }
+
+
+def test_outcomes_decay_with_age():
+    """An outcome one half-life old counts half"""
+    store = make_store()
+    store.record("DATA_CORRECTION", "p1", "data_quality", True, NOW)
+    store.record("DATA_CORRECTION", "p1", "data_quality", False, NOW - datetime.timedelta(days=1))
+
+    successes, failures = store.get_counts("DATA_CORRECTION", "p1", "data_quality")
+    assert successes == pytest.approx(1.0)
+    assert failures == pytest.approx(0.5)
+
+
+def test_replay_order_does_not_matter():
+    """Rebuilding from shuffled history matches recording in time order"""
+    rng = random.Random(3)
+    history = [outcome(rng.random() < 0.7, rng.uniform(0, 10), pattern_id=rng.choice(["p1", "p2"]))
+               for _ in range(200)]
+
+    ordered = make_store()
+    ordered.rebuild(sorted(history, key=lambda row: row["completion_time"]))
+    shuffled = make_store()
+    rng.shuffle(history)
+    shuffled.rebuild(history)
+
+    for pattern_id in ("p1", "p2"):
+        assert shuffled.get_counts("DATA_CORRECTION", pattern_id, "data_quality") == \
+            pytest.approx(ordered.get_counts("DATA_CORRECTION", pattern_id, "data_quality"))
+        assert shuffled.get_success_rate("DATA_CORRECTION", pattern_id, "data_quality") == \
+            pytest.approx(ordered.get_success_rate("DATA_CORRECTION", pattern_id, "data_quality"))
+    assert shuffled.watermark == ordered.watermark
+
+
+def test_unknown_action_type_returns_prior():
+    """Without history the configured prior is returned"""
+    store = make_store(prior_success_rate=0.6)
+
+    assert store.get_success_rate("PIPELINE_RETRY", "p9", "pipeline") == 0.6
+
+
+def test_sparse_keys_shrink_towards_parents():
+    """A key with one outcome stays near its pattern's rate instead of jumping to 0 or 1"""
+    store = make_store(prior_strength=5.0)
+    store.record_all([outcome(True, 0.0, issue_category="pipeline") for _ in range(50)])
+    store.record("DATA_CORRECTION", "p1", "data_quality", False, NOW)
+
+    sparse_rate = store.get_success_rate("DATA_CORRECTION", "p1", "data_quality")
+    pattern_rate = store.get_success_rate("DATA_CORRECTION", "p1")
+    assert 0.5 < sparse_rate < pattern_rate < 1.0
+
+    # Plenty of evidence overrides the parents
+    store.record_all([outcome(False, 0.0) for _ in range(200)])
+    assert store.get_success_rate("DATA_CORRECTION", "p1", "data_quality") < 0.1
+
+
+def test_rows_without_outcome_are_skipped():
+    """Executions that have not completed are not counted"""
+    store = make_store()
+
+    assert store.record_all([outcome(None, 0.0), outcome(True, 0.0)]) == 1
+
+
+def test_snapshot_round_trip(tmp_path):
+    """A snapshot restores the counters and the watermark"""
+    store = make_store()
+    store.record_all([outcome(index % 3 != 0, index / 10.0) for index in range(30)])
+    path = str(tmp_path / "success_rates.json")
+    store.save_snapshot(path)
+
+    restored = make_store()
+    assert restored.load_snapshot(path)
+    assert restored.watermark == store.watermark
+    assert restored.get_success_rate("DATA_CORRECTION", "p1", "data_quality") == \
+        pytest.approx(store.get_success_rate("DATA_CORRECTION", "p1", "data_quality"))
+
+    # A snapshot taken with another half-life is not comparable
+    assert not make_store(half_life_days=7.0).load_snapshot(path)
+
+
+def test_process_shares_one_store(monkeypatch):
+    """Every caller in a process reads and updates the same store and load schedule"""
+    monkeypatch.setattr(success_rate_store, "_success_rate_store", None)
+
+    store = get_success_rate_store(half_life_days=3.0)
+    store.record("DATA_CORRECTION", "p1", "data_quality", True)
+    store.synced_at = 1.0
+
+    shared = get_success_rate_store(half_life_days=7.0)
+    assert shared is store
+    assert shared.half_life_days == 3.0
+    assert shared.synced_at == 1.0
+    assert shared.get_counts("DATA_CORRECTION")[0] == pytest.approx(1.0)
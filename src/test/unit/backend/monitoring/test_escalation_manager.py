@@ -0,0 +1,135 @@
+"""
+Unit tests for the deadline-scheduled EscalationManager.
+Tests that alerts written through the repository are scheduled and that acknowledging them
+cancels their escalation, that due alerts escalate and schedule their next level, and that
+rebuilding the schedule picks up alerts written elsewhere and prunes stale escalation state.
+"""
+
+from datetime import datetime, timedelta  # package_version: standard library
+from types import SimpleNamespace  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.constants import AlertSeverity  # Module(src.backend.constants)
+from src.backend.db.models.alert import Alert  # Module(src.backend.db.models.alert)
+from src.backend.monitoring.alerting import escalation_manager  # Module(src.backend.monitoring.alerting.escalation_manager)
+from src.backend.monitoring.alerting.escalation_manager import EscalationManager  # Module(src.backend.monitoring.alerting.escalation_manager)
+
+CONFIG = {
+    "escalation_policies": {"default": {"levels": [1, 2], "timeframes": {1: 15, 2: 60}}},
+    "escalation_targets": {}
+}
+
+
+class FakeAlertRepository:
+    """Alert repository holding alerts in memory and notifying listeners on writes"""
+
+    def __init__(self):
+        self.alerts = {}
+        self.listeners = []
+
+    def add_alert_listener(self, listener):
+        self.listeners.append(listener)
+
+    def write(self, alert):
+        self.alerts[alert.alert_id] = alert
+        for listener in self.listeners:
+            listener(alert)
+
+    def get_alert(self, alert_id):
+        return self.alerts.get(alert_id)
+
+    def get_active_alerts(self, limit=100, offset=0):
+        active = [alert for alert in self.alerts.values() if alert.is_active()]
+        return active[offset:offset + limit]
+
+
+class FakeNotificationRouter:
+    """Router that records escalation messages and reports successful delivery"""
+
+    def __init__(self):
+        self.messages = []
+
+    def send_notification(self, message, channels):
+        self.messages.append(message)
+        return {"email": SimpleNamespace(success=True)}
+
+
+def make_alert(alert_id, minutes_ago=0):
+    """Creates a new alert created the given number of minutes ago"""
+    alert = Alert("pipeline_failure", "Pipeline failed", AlertSeverity.HIGH, {}, alert_id=alert_id)
+    alert.created_at = datetime.now() - timedelta(minutes=minutes_ago)
+    return alert
+
+
+@pytest.fixture
+def repository():
+    """In-memory alert repository"""
+    return FakeAlertRepository()
+
+
+@pytest.fixture
+def router():
+    """Recording notification router"""
+    return FakeNotificationRouter()
+
+
+@pytest.fixture
+def manager(monkeypatch, repository, router):
+    """Escalation manager with a two-level default policy"""
+    monkeypatch.setattr(escalation_manager, "get_config", lambda: CONFIG)
+    return EscalationManager(alert_repository=repository, notification_router=router)
+
+
+def test_created_alert_is_scheduled_and_acknowledgement_cancels(manager, repository):
+    """Tests that repository writes schedule and cancel escalations without a restart"""
+    alert = make_alert("alert-1")
+    repository.write(alert)
+
+    assert "alert-1" in manager._scheduler
+    assert manager._scheduler.next_deadline() == alert.created_at + timedelta(minutes=15)
+
+    manager.update_escalation_state("alert-1", 1, datetime.now())
+    alert.acknowledge("on-call")
+    repository.write(alert)
+
+    assert "alert-1" not in manager._scheduler
+    assert manager.get_alert_escalation_state("alert-1") is None
+
+
+def test_due_alert_escalates_and_schedules_next_level(manager, repository, router):
+    """Tests that a due alert is escalated once and its next level is scheduled"""
+    alert = make_alert("alert-2", minutes_ago=20)
+    repository.write(alert)
+
+    due = manager._scheduler.pop_due(datetime.now())
+    assert due == ["alert-2"]
+    manager._process_due_alert("alert-2")
+
+    assert [message["escalation_level"] for message in router.messages] == [1]
+    assert manager.get_alert_escalation_state("alert-2")["level"] == 1
+    assert manager._scheduler.next_deadline() == alert.created_at + timedelta(minutes=60)
+
+    # A due alert that was resolved in another process is cancelled instead of escalated
+    alert.resolve("on-call")
+    manager._scheduler.schedule("alert-2", datetime.now())
+    manager._process_due_alert(manager._scheduler.pop_due(datetime.now())[0])
+    assert len(router.messages) == 1
+    assert "alert-2" not in manager._scheduler
+
+
+def test_rebuild_schedule_picks_up_alerts_and_prunes_state(manager, repository):
+    """Tests reconciling with alerts written by other processes"""
+    # Written by another process, so no listener saw them
+    repository.alerts = {alert_id: make_alert(alert_id) for alert_id in ("alert-3", "alert-4")}
+    manager.update_escalation_state("closed-elsewhere", 2, datetime.now())
+    manager.update_escalation_state("alert-3", 0, datetime.now())
+
+    assert manager.rebuild_schedule() == 2
+    assert len(manager._scheduler) == 2
+    assert manager.get_alert_escalation_state("closed-elsewhere") is None
+    assert manager.get_alert_escalation_state("alert-3") is not None
+
+    # Reconciling again reschedules in place
+    assert manager.rebuild_schedule() == 2
+    assert len(manager._scheduler) == 2
@@ -0,0 +1,153 @@
+"""
+Unit tests for the incremental log template miner used by the logs analyzer.
+Tests template extraction, cluster merging, bounded memory, per-template counts, persistence
+and template anomaly detection.
+"""
+
+import datetime  # package_version: standard library
+
+from src.backend.monitoring.integrations.log_template_miner import (  # Module(src.backend.monitoring.integrations.log_template_miner)
+    LogTemplateMiner,
+    WILDCARD_TOKEN,
+    tokenize_log_message,
+    compile_masking_patterns,
+    detect_template_anomalies
+)
+
+
+def test_tokenize_log_message_masks_variables():
+    """Tests that numbers, IPs and UUIDs are masked before tokenization"""
+    tokens = tokenize_log_message(
+        "Connection to 10.0.0.1:5432 failed after 3 retries (id=123e4567-e89b-12d3-a456-426614174000)",
+        compile_masking_patterns()
+    )
+
+    assert tokens == ["Connection", "to", "<IP>", "failed", "after", "<NUM>", "retries", "id", "<UUID>"]
+
+
+def test_similar_messages_share_template():
+    """Tests that messages differing in variable tokens merge into one template"""
+    miner = LogTemplateMiner()
+
+    cluster_a, change_a = miner.add_log_message("Table project.dataset.orders not found")
+    cluster_b, change_b = miner.add_log_message("Table project.dataset.customers not found")
+
+    assert change_a == "created"
+    assert change_b == "updated"
+    assert cluster_a.cluster_id == cluster_b.cluster_id
+    assert cluster_b.template == f"Table {WILDCARD_TOKEN} not found"
+    assert cluster_b.size == 2
+
+
+def test_different_messages_create_separate_templates():
+    """Tests that unrelated messages produce different templates"""
+    miner = LogTemplateMiner()
+
+    miner.add_log_message("Table project.dataset.orders not found")
+    miner.add_log_message("Quota exceeded for project analytics")
+    miner.add_log_message("Task load_data failed with error code 42")
+
+    assert len(miner.get_clusters()) == 3
+    assert miner.match("Task load_data failed with error code 7") is not None
+    assert miner.match("Completely unrelated message") is None
+
+
+def test_cluster_count_is_bounded():
+    """Tests that the least recently used templates are evicted beyond max_clusters"""
+    miner = LogTemplateMiner({"max_clusters": 5})
+
+    for index in range(20):
+        miner.add_log_message(f"component_{chr(97 + index)} raised unexpected failure_{chr(97 + index)}")
+
+    assert len(miner.get_clusters()) == 5
+    assert miner.total_messages == 20
+
+
+def test_evicted_templates_are_pruned_from_the_tree():
+    """Tests that template churn does not grow the parse tree beyond the resident clusters"""
+    miner = LogTemplateMiner({"max_clusters": 5})
+
+    def word(index: int) -> str:
+        return "".join("abcdefghij"[int(digit)] for digit in f"{index:03d}")
+
+    for index in range(200):
+        miner.add_log_message(f"worker_{word(index)} stopped")
+    for index in range(200):
+        miner.add_log_message(f"partition {word(index)} of table orders was skipped")
+
+    assert len(miner.get_clusters()) == 5
+    # Two token-count nodes and one leaf per resident cluster; 200 worker branches were pruned
+    assert miner.get_tree_size() == 7
+
+
+def test_leaf_keeps_most_recently_used_clusters():
+    """Tests that a full leaf evicts its least recently used cluster"""
+    miner = LogTemplateMiner({"max_clusters_per_leaf": 2, "similarity_threshold": 0.9})
+
+    first, _ = miner.add_log_message("Job alpha failed")
+    second, _ = miner.add_log_message("Job beta failed")
+    miner.add_log_message("Job alpha failed")
+    third, _ = miner.add_log_message("Job gamma failed")
+
+    assert miner.get_cluster(first.cluster_id) is first
+    assert miner.get_cluster(second.cluster_id) is None
+    assert miner.get_cluster(third.cluster_id) is third
+
+
+def test_detect_template_anomalies_reports_new_templates_and_spikes():
+    """Tests new template and volume spike detection against the miner baseline"""
+    miner = LogTemplateMiner({"bucket_seconds": 60})
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    baseline = [("Job failed on step 1", start + datetime.timedelta(minutes=minute))
+                for minute in range(10) for _ in range(2 + minute % 2)]
+
+    # Without a baseline nothing is new
+    assert detect_template_anomalies(miner, baseline) == []
+
+    spike_time = start + datetime.timedelta(minutes=10)
+    anomalies = detect_template_anomalies(
+        miner,
+        [("Job failed on step 2", spike_time)] * 20 + [("Disk quota exceeded on node 3", spike_time)]
+    )
+    by_type = {anomaly["anomaly_type"]: anomaly for anomaly in anomalies}
+
+    assert set(by_type) == {"log_volume_spike", "new_log_pattern"}
+    assert by_type["log_volume_spike"]["value"] == 20
+    assert by_type["log_volume_spike"]["expected_value"] == 2.5
+    assert by_type["log_volume_spike"]["timestamp"] == spike_time
+    assert by_type["new_log_pattern"]["cluster"].template == "Disk quota exceeded on node <NUM>"
+
+    # A normal bucket is not a spike
+    assert detect_template_anomalies(miner, [("Job failed on step 4", spike_time + datetime.timedelta(minutes=1))] * 3) == []
+
+
+def test_template_counts_over_time():
+    """Tests per-template counts are bucketed by time"""
+    miner = LogTemplateMiner({"bucket_seconds": 60})
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+    for minute in range(3):
+        for _ in range(minute + 1):
+            cluster, _ = miner.add_log_message("Job failed on step 1", start + datetime.timedelta(minutes=minute))
+
+    counts = miner.get_template_counts()[cluster.cluster_id]
+    assert [count for _, count in counts] == [1, 2, 3]
+    assert counts[0][0] == start
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Tests that the template tree and clusters survive persistence"""
+    miner = LogTemplateMiner()
+    cluster, _ = miner.add_log_message("Table project.dataset.orders not found")
+    miner.add_log_message("Table project.dataset.customers not found")
+
+    state_path = str(tmp_path / "templates.json")
+    assert miner.save(state_path)
+
+    restored = LogTemplateMiner.load(state_path)
+    matched = restored.match("Table project.dataset.products not found")
+
+    assert matched is not None
+    assert matched.cluster_id == cluster.cluster_id
+    assert matched.size == 2
+    assert restored.total_messages == 2
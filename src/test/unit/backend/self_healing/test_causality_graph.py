@@ -0,0 +1,134 @@
+"""
+Unit tests for the incremental causality graph.
+Tests explicit and lineage-based causal links, candidate root causes and common ancestors,
+that cached ancestor indexes stay correct as edges are added and events expire, that only
+indexes downstream of a change are invalidated, and the networkx export.
+"""
+import random  # package_version: standard library
+
+import networkx as nx  # package_version: 3.1.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.ai.causality_graph import CausalityGraph  # Module: src.backend.self_healing.ai.causality_graph
+
+
+@pytest.fixture
+def storm_graph():
+    """Provides a dropped upstream table that broke two loads and their downstream checks"""
+    graph = CausalityGraph(window_minutes=60)
+    graph.ingest_many([
+        {"event_id": "drop", "timestamp": 0, "component": "raw.orders"},
+        {"event_id": "load_a", "timestamp": 10, "component": "staging.orders", "depends_on": ["raw.orders"]},
+        {"event_id": "load_b", "timestamp": 12, "component": "staging.returns", "depends_on": ["raw.orders"]},
+        {"event_id": "check_a", "timestamp": 20, "caused_by": ["load_a"]},
+        {"event_id": "check_b", "timestamp": 21, "caused_by": ["load_b"]},
+        {"event_id": "quota", "timestamp": 5},
+        {"event_id": "report", "timestamp": 30, "caused_by": ["check_a", "quota"]}
+    ])
+    return graph
+
+
+def test_candidate_root_causes(storm_graph):
+    """Tests that candidates are the most upstream ancestors ranked by distance"""
+    candidates = storm_graph.candidate_root_causes("report")
+
+    assert [candidate["event_id"] for candidate in candidates] == ["quota", "drop"]
+    assert candidates[0]["hops"] == 1
+    assert candidates[1]["hops"] == 3
+    assert candidates[1]["confidence"] == pytest.approx(0.8 ** 2)
+    assert storm_graph.candidate_root_causes("drop") == []
+    assert storm_graph.candidate_root_causes("unknown") == []
+
+
+def test_common_ancestors(storm_graph):
+    """Tests that shared ancestors are returned nearest first"""
+    common = storm_graph.common_ancestors(["check_a", "check_b"])
+
+    assert [ancestor["event_id"] for ancestor in common] == ["drop"]
+    assert common[0]["hops"] == 2
+    assert common[0]["total_hops"] == 4
+    assert common[0]["is_root"] is True
+    assert [ancestor["event_id"] for ancestor in storm_graph.common_ancestors(["report", "check_a"])] == ["load_a", "drop"]
+    assert storm_graph.common_ancestors(["report", "quota"]) == []
+
+
+def test_rejects_edges_against_time_and_cycles():
+    """Tests that causes cannot follow their effects and simultaneous events cannot form cycles"""
+    graph = CausalityGraph(window_minutes=None)
+    graph.add_event("a", 0)
+    graph.add_event("b", 5)
+    graph.add_event("c", 5)
+
+    assert graph.add_edge("b", "a") is False
+    assert graph.add_edge("b", "c") is True
+    assert graph.add_edge("c", "b") is False
+    assert graph.get_stats()["rejected_edges"] == 2
+
+
+def test_max_depth_limits_indexes():
+    """Tests that ancestors beyond the maximum depth are not indexed"""
+    graph = CausalityGraph(window_minutes=None, max_depth=2)
+    for index in range(5):
+        graph.add_event(f"e{index}", index, causes=[f"e{index - 1}"] if index else [])
+
+    assert graph.get_ancestors("e4") == {"e3": 1, "e2": 2}
+    assert [candidate["event_id"] for candidate in graph.candidate_root_causes("e4")] == ["e2"]
+
+
+def test_expiry_removes_old_events(storm_graph):
+    """Tests that events older than the window expire and downstream indexes update"""
+    assert "drop" in storm_graph.get_ancestors("check_a")
+
+    storm_graph.add_event("late", 0 + 60 * 60 + 11)
+
+    assert "drop" not in storm_graph
+    assert "load_a" not in storm_graph
+    assert storm_graph.get_ancestors("check_a") == {}
+    assert storm_graph.get_ancestors("report") == {"check_a": 1}
+    assert storm_graph.add_event("stale", 1) is False
+    assert "load_b" in storm_graph
+    assert storm_graph.get_stats()["expired"] == 3
+
+
+def test_invalidation_only_downstream_of_change(storm_graph):
+    """Tests that new edges only invalidate the cached indexes downstream of them"""
+    for event_id in ["report", "check_b"]:
+        storm_graph.get_ancestors(event_id)
+    misses = storm_graph.get_stats()["cache_misses"]
+
+    storm_graph.add_event("retry", 25, causes=["check_a"])
+    storm_graph.get_ancestors("report")
+    storm_graph.get_ancestors("check_b")
+    assert storm_graph.get_stats()["cache_misses"] == misses
+
+    assert storm_graph.add_edge("quota", "check_b") is True
+    storm_graph.get_ancestors("report")
+    assert storm_graph.get_stats()["cache_misses"] == misses
+    assert storm_graph.get_ancestors("check_b") == {"load_b": 1, "drop": 2, "quota": 1}
+    assert storm_graph.get_stats()["cache_misses"] == misses + 1
+
+
+def test_cached_indexes_match_networkx_ancestors():
+    """Tests cached indexes against networkx after random edges and expiry"""
+    rng = random.Random(3)
+    graph = CausalityGraph(window_minutes=5)
+    for index in range(400):
+        earlier = [f"e{other}" for other in rng.sample(range(max(index - 30, 0), index), min(index, 2))] if index else []
+        graph.add_event(f"e{index}", index * 3, causes=earlier)
+        if index % 7 == 0:
+            for probe in rng.sample(range(max(index - 40, 0), index + 1), min(index + 1, 5)):
+                graph.get_ancestors(f"e{probe}")
+
+    exported = graph.to_networkx()
+    for node in rng.sample(sorted(exported.nodes), 50):
+        expected = {ancestor: nx.shortest_path_length(exported, ancestor, node) for ancestor in nx.ancestors(exported, node)}
+        assert graph.get_ancestors(node) == expected
+
+
+def test_to_networkx_exports_ancestry(storm_graph):
+    """Tests exporting the ancestry of selected events"""
+    exported = storm_graph.to_networkx(["check_b"])
+
+    assert set(exported.nodes) == {"check_b", "load_b", "drop"}
+    assert set(exported.edges) == {("drop", "load_b"), ("load_b", "check_b")}
+    assert exported.nodes["load_b"]["component"] == "staging.returns"
@@ -0,0 +1,263 @@
+"""
+Unit tests for the vectorized correction engine.
+Tests imputation and outlier capping of all columns in one pass, before/after statistics
+recorded by the pass, the chunked two-pass mode, and compiling corrections into one SQL
+UPDATE statement that is previewed, validated, backed up and executed against the local
+DuckDB query engine.
+"""
+import numpy as np  # package_version: 1.24.x
+import pandas as pd  # package_version: 2.0.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.correction.correction_engine import (  # Module: src.backend.self_healing.correction.correction_engine
+    CorrectionPlan,
+    compile_backup_sql,
+    compile_correction_sql,
+    compile_preview_sql,
+    compile_profile_sql,
+    compute_statistics,
+    correct_dataframe,
+    correct_out_of_core,
+    parse_preview_row,
+    parse_profile_row,
+    summarize_pushdown,
+    validate_report
+)
+
+
+@pytest.fixture
+def sample_df():
+    """Provides numeric, integer and categorical columns with missing values and outliers"""
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        "value1": rng.normal(50, 5, 1000),
+        "value2": rng.uniform(0, 100, 1000),
+        "count": rng.integers(0, 10, 1000),
+        "category": rng.choice(["A", "B", "C"], 1000, p=[0.6, 0.3, 0.1]).astype(object)
+    })
+    df.loc[[3, 40, 500], "value1"] = np.nan
+    df.loc[[10, 11], "value1"] = [500.0, -400.0]
+    df.loc[[7, 8], "value2"] = np.nan
+    df.loc[[5, 6], "category"] = None
+    return df
+
+
+def test_plan_from_strategy():
+    """Tests mapping strategy names and parameters to plans"""
+    plan = CorrectionPlan.from_strategy("winsorization", {"limits": [0.1, 0.2]}, ["a"])
+    assert plan.outlier_method == "winsorization"
+    assert plan.impute_strategy is None
+    assert plan.quantile_levels() == [0.1, 0.8]
+
+    assert CorrectionPlan.from_strategy("iqr_filtering", {}, ["a"]).quantile_levels() == [0.25, 0.75]
+    assert CorrectionPlan.from_strategy("median_imputation", {}, ["a"]).quantile_levels() == [0.5]
+    with pytest.raises(ValueError):
+        CorrectionPlan.from_strategy("isolation_forest", {}, ["a"])
+
+
+def test_mean_imputation_of_all_columns(sample_df):
+    """Tests imputing numeric columns with their means in one pass"""
+    plan = CorrectionPlan(["value1", "value2"], impute_strategy="mean")
+    corrected, report = correct_dataframe(sample_df, plan)
+    details = report.get_column_details()
+
+    assert not corrected[["value1", "value2"]].isna().any().any()
+    assert sample_df["value1"].isna().sum() == 3  # input is not modified
+    assert corrected.loc[3, "value1"] == pytest.approx(sample_df["value1"].mean())
+    assert details["value1"]["missing_count"] == 3
+    assert details["value1"]["imputed_count"] == 3
+    assert details["value2"]["after"]["missing"] == 0
+    assert details["value1"]["before"]["mean"] == pytest.approx(sample_df["value1"].mean())
+    assert details["value1"]["after"]["mean"] == pytest.approx(corrected["value1"].mean())
+
+
+def test_mode_imputation_of_categorical_column(sample_df):
+    """Tests most frequent imputation of a non-numeric column"""
+    plan = CorrectionPlan(["category"], impute_strategy="most_frequent")
+    corrected, report = correct_dataframe(sample_df, plan)
+
+    assert corrected.loc[[5, 6], "category"].tolist() == ["A", "A"]
+    assert report.get_column_details()["category"]["imputed_count"] == 2
+
+
+def test_winsorization_caps_to_quantiles(sample_df):
+    """Tests capping outliers to quantiles computed once for all columns"""
+    plan = CorrectionPlan.from_strategy("winsorization", {"limits": [0.05, 0.05]}, ["value1", "value2", "count"])
+    statistics = compute_statistics(sample_df, plan)
+    corrected, report = correct_dataframe(sample_df, plan)
+    details = report.get_column_details()
+
+    lower, upper = np.nanquantile(sample_df["value1"], [0.05, 0.95])
+    assert statistics["value1"]["quantiles"][0.05] == pytest.approx(lower)
+    assert corrected["value1"].max() == pytest.approx(upper)
+    assert corrected["value1"].min() == pytest.approx(lower)
+    assert len(corrected) == len(sample_df)
+    # Missing values are left alone by an outlier-only plan
+    assert corrected["value1"].isna().sum() == 3
+    assert details["value1"]["outlier_count"] == int(((sample_df["value1"] < lower) | (sample_df["value1"] > upper)).sum())
+    assert corrected["count"].dtype == sample_df["count"].dtype
+
+
+def test_validate_report_uses_recorded_statistics(sample_df):
+    """Tests validation from the before/after statistics of the correction pass"""
+    plan = CorrectionPlan(["value1"], impute_strategy="median", outlier_method="z_score_filtering")
+    _, report = correct_dataframe(sample_df, plan)
+
+    success, results = validate_report(report.get_column_details())
+    assert success is True
+    assert results["value1"]["missing_resolved"] is True
+    assert results["value1"]["within_bounds"] is True
+
+    success, results = validate_report(report.get_column_details(), {"max_mean_shift": 0.0})
+    assert success is False
+    assert results["value1"]["mean_shift_ok"] is False
+
+
+def test_out_of_core_matches_in_memory(sample_df):
+    """Tests that the chunked two-pass mode reproduces the in-memory correction"""
+    plan = CorrectionPlan(["value1", "value2"], impute_strategy="median", outlier_method="iqr_filtering")
+    expected, expected_report = correct_dataframe(sample_df, plan)
+    written = []
+
+    report = correct_out_of_core(lambda: (sample_df.iloc[start:start + 128] for start in range(0, len(sample_df), 128)),
+                                 plan, written.append)
+
+    pd.testing.assert_frame_equal(pd.concat(written), expected)
+    details, expected_details = report.get_column_details(), expected_report.get_column_details()
+    assert details["value1"]["outlier_count"] == expected_details["value1"]["outlier_count"]
+    assert details["value1"]["after"]["mean"] == pytest.approx(expected_details["value1"]["after"]["mean"])
+
+
+def test_out_of_core_samples_quantiles(sample_df):
+    """Tests that quantiles of data larger than the sample come from a bounded sample"""
+    plan = CorrectionPlan.from_strategy("winsorization", {}, ["value2"])
+    report = correct_out_of_core(lambda: (sample_df.iloc[start:start + 100] for start in range(0, len(sample_df), 100)),
+                                 plan, lambda chunk: None, sample_size=200)
+    details = report.get_column_details()["value2"]
+
+    assert details["lower_bound"] == pytest.approx(5.0, abs=5.0)
+    assert details["upper_bound"] == pytest.approx(95.0, abs=5.0)
+    assert report.rows == len(sample_df)
+
+
+def test_compile_correction_sql():
+    """Tests compiling a plan into one parameterized UPDATE statement"""
+    plan = CorrectionPlan(["value1", "count"], impute_strategy="mean", outlier_method="winsorization")
+    resolved = {"value1": {"fill": 50.0, "lower": 40.0, "upper": 60.0},
+                "count": {"fill": 4.5, "lower": 1.0, "upper": 8.0}}
+
+    statement, parameters = compile_correction_sql("project.dataset.table", plan, resolved,
+                                                   column_types={"value1": "FLOAT64", "count": "INT64"})
+
+    assert statement.startswith("UPDATE `project.dataset.table` SET")
+    assert "`value1` = LEAST(GREATEST(COALESCE(`value1`, @fill_0), @lower_0), @upper_0)" in statement
+    assert "CAST(ROUND(" in statement
+    assert "WHERE `value1` IS NULL OR `value1` < @lower_0" in statement
+    assert parameters == {"fill_0": 50.0, "lower_0": 40.0, "upper_0": 60.0,
+                          "fill_1": 4.5, "lower_1": 1.0, "upper_1": 8.0}
+    assert "APPROX_QUANTILES(`value1`, 1000)[OFFSET(50)]" in compile_profile_sql("project.dataset.table", plan)
+
+
+def test_corrected_values_are_cast_back_to_the_column_type():
+    """Tests that every corrected non-FLOAT64 value is cast back, whichever bounds apply"""
+    plan = CorrectionPlan(["count", "amount", "total"], impute_strategy="mean", outlier_method="winsorization")
+    resolved = {"count": {"upper": 8.0}, "amount": {"lower": 1.0, "upper": 8.0}, "total": {"fill": 3}}
+    column_types = {"count": "INT64", "amount": "NUMERIC", "total": "BIGNUMERIC"}
+
+    statement, _ = compile_correction_sql("project.dataset.table", plan, resolved, column_types)
+
+    assert "`count` = CAST(ROUND(LEAST(`count`, @upper_0)) AS INT64)" in statement
+    assert "`amount` = CAST(LEAST(GREATEST(`amount`, @lower_1), @upper_1) AS NUMERIC)" in statement
+    assert "`total` = CAST(COALESCE(`total`, @fill_2) AS BIGNUMERIC)" in statement
+    # An integer column with only an integer fill value is cast back as well
+    statement, _ = compile_correction_sql("project.dataset.table", CorrectionPlan(["count"], impute_strategy="median"),
+                                          {"count": {"fill": 4}}, {"count": "INTEGER"})
+    assert "`count` = CAST(ROUND(COALESCE(`count`, @fill_0)) AS INT64)" in statement
+    # FLOAT64 and untyped columns are left as they are
+    statement, _ = compile_correction_sql("project.dataset.table", plan, resolved, {"count": "FLOAT64"})
+    assert "`count` = LEAST(`count`, @upper_0)" in statement
+    assert "`total` = COALESCE(`total`, @fill_2)" in statement
+
+
+def test_preview_counts_outliers_against_resolved_bounds_only():
+    """Tests that a bound that did not resolve is left out of the preview outlier count"""
+    plan = CorrectionPlan(["value1", "value2"], outlier_method="winsorization")
+    resolved = {"value1": {"lower": 40.0, "upper": None}, "value2": {"lower": None, "upper": 90.0}}
+
+    query, parameters = compile_preview_sql("project.dataset.table", plan, resolved)
+
+    assert "COUNTIF(`value1` < @lower_0) AS c0_outliers" in query
+    assert "COUNTIF(`value2` > @upper_1) AS c1_outliers" in query
+    assert parameters == {"lower_0": 40.0, "upper_1": 90.0}
+
+
+@pytest.fixture
+def local_client(sample_df):
+    """Provides a local DuckDB query engine holding the numeric sample columns"""
+    pytest.importorskip("duckdb")
+    from src.backend.utils.storage.local_query_engine import LocalBigQueryClient  # Module: src.backend.utils.storage.local_query_engine
+
+    client = LocalBigQueryClient(project_id="test-project", database_path=":memory:")
+    client.create_table("quality", "readings", [
+        {"name": "value1", "type": "FLOAT64", "mode": "NULLABLE"},
+        {"name": "count", "type": "INT64", "mode": "NULLABLE"}
+    ])
+    client.load_table_from_dataframe("quality", "readings", sample_df[["value1", "count"]])
+    yield client
+    client.close()
+
+
+def test_pushdown_against_local_engine(sample_df, local_client):
+    """Tests profiling, previewing and correcting a table in place with the local DuckDB engine"""
+    table_ref = "test-project.quality.readings"
+    plan = CorrectionPlan(["value1"], impute_strategy="mean", outlier_method="winsorization")
+
+    statistics = parse_profile_row(local_client.query(compile_profile_sql(table_ref, plan))[0], plan)
+    resolved = plan.resolve(statistics)
+    preview_sql, preview_parameters = compile_preview_sql(table_ref, plan, resolved)
+    corrected = parse_preview_row(local_client.query(preview_sql, preview_parameters)[0], plan)
+    details = summarize_pushdown(plan, statistics, resolved, corrected)
+
+    statement, parameters = compile_correction_sql(table_ref, plan, resolved)
+    local_client.execute_query(statement, parameters=parameters)
+    after = local_client.query(f"SELECT COUNTIF(value1 IS NULL) AS missing, MIN(value1) AS low, MAX(value1) AS high, "
+                               f"AVG(value1) AS mean, COUNT(*) AS total FROM `{table_ref}`")[0]
+
+    assert statistics["value1"]["missing"] == 3
+    assert statistics["value1"]["mean"] == pytest.approx(sample_df["value1"].mean())
+    assert after["missing"] == 0
+    assert after["total"] == len(sample_df)
+    assert after["low"] == pytest.approx(resolved["value1"]["lower"])
+    assert after["high"] == pytest.approx(resolved["value1"]["upper"])
+    # The preview computed the statistics the UPDATE produced
+    assert details["value1"]["after"]["mean"] == pytest.approx(after["mean"])
+    assert details["value1"]["after"]["max"] == pytest.approx(after["high"])
+    assert details["value1"]["imputed_count"] == 3
+    assert details["value1"]["outlier_count"] > 0
+    valid, results = validate_report(details, {"max_mean_shift": 0.5})
+    assert valid is True
+    assert "mean_shift" in results["value1"]
+
+
+def test_pushdown_validation_gates_update_and_backs_up_rows(sample_df, local_client):
+    """Tests that a failing preview is caught before the UPDATE and that the backup holds the changed rows"""
+    table_ref = "test-project.quality.readings"
+    plan = CorrectionPlan(["value1"], impute_strategy="mean", outlier_method="winsorization")
+    statistics = parse_profile_row(local_client.query(compile_profile_sql(table_ref, plan))[0], plan)
+    resolved = plan.resolve(statistics)
+    preview_sql, preview_parameters = compile_preview_sql(table_ref, plan, resolved)
+    details = summarize_pushdown(plan, statistics, resolved,
+                                 parse_preview_row(local_client.query(preview_sql, preview_parameters)[0], plan))
+
+    # Capping the extreme values shifts the mean by more than a tiny tolerance
+    assert validate_report(details, {"max_mean_shift": 1e-6})[0] is False
+    unchanged = local_client.query(f"SELECT COUNTIF(value1 IS NULL) AS missing FROM `{table_ref}`")[0]
+    assert unchanged["missing"] == 3
+
+    backup_sql, backup_parameters = compile_backup_sql(table_ref, "test-project.quality.readings_backup", plan, resolved)
+    assert "fill_0" not in backup_parameters
+    local_client.execute_query(backup_sql, parameters=backup_parameters)
+    backup = local_client.query("SELECT COUNT(*) AS total, COUNTIF(value1 IS NULL) AS missing "
+                                "FROM `test-project.quality.readings_backup`")[0]
+    assert backup["total"] == 3 + details["value1"]["outlier_count"]
+    assert backup["missing"] == 3
@@ -0,0 +1,103 @@
+"""
+Unit tests for the compiled, cached feature vectorizer.
+Tests error signature normalization, hashed encoding of text and categorical fields into
+fixed column ranges, numeric features from nested fields, batch encoding into one dense
+matrix, memoization on raw values and normalized signatures, and spec validation.
+"""
+import numpy as np  # package_version: 1.24.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.ai.feature_vectorizer import HashedFeatureVectorizer, normalize_error_signature  # Module: src.backend.self_healing.ai.feature_vectorizer
+
+SPEC = [
+    {"name": "error_message", "type": "text", "buckets": 256},
+    {"name": "dataset", "type": "categorical", "buckets": 16},
+    {"name": "resources.memory_utilization", "type": "numeric"},
+    {"name": "related_events", "type": "numeric"}
+]
+
+
+def test_normalize_error_signature_replaces_volatile_parts():
+    """IDs, timestamps, hex values and numbers become placeholders"""
+    signature = normalize_error_signature(
+        "Job 123e4567-e89b-12d3-a456-426614174000 failed at 2024-03-01T10:00:00Z after 42 retries (0x1F)")
+
+    assert signature == "job <uuid> failed at <ts> after <num> retries ( <hex> )"
+    assert normalize_error_signature("Timeout after 30s") == normalize_error_signature("timeout after 45s")
+
+
+def test_columns_follow_the_spec():
+    """Hashed blocks come first in spec order, numeric columns last"""
+    vectorizer = HashedFeatureVectorizer(SPEC)
+
+    assert vectorizer.dimension == 256 + 16 + 2
+    assert vectorizer.get_feature_ranges() == {
+        "error_message": (0, 256),
+        "dataset": (256, 272),
+        "resources.memory_utilization": (272, 273),
+        "related_events": (273, 274)
+    }
+
+
+def test_batch_encoding():
+    """A batch is encoded into one dense float32 matrix"""
+    vectorizer = HashedFeatureVectorizer(SPEC)
+    matrix = vectorizer.transform([
+        {"error_message": "Table orders not found", "dataset": "Sales",
+         "resources": {"memory_utilization": 0.75}, "related_events": [1, 2, 3]},
+        {"error_message": "", "dataset": None},
+        {}
+    ])
+
+    assert matrix.shape == (3, vectorizer.dimension)
+    assert matrix.dtype == np.float32
+    assert np.isclose(np.linalg.norm(matrix[0, :256]), 1.0)
+    assert np.count_nonzero(matrix[0, 256:272]) == 1
+    assert list(matrix[0, 272:]) == [0.75, 3.0]
+    assert not matrix[1:].any()
+
+
+def test_encoding_is_stable_across_instances():
+    """Hashing does not depend on the process or instance"""
+    issue = {"error_message": "Permission denied on bucket raw-data", "dataset": "finance"}
+
+    first = HashedFeatureVectorizer(SPEC).transform_one(issue)
+    second = HashedFeatureVectorizer(SPEC, cache_size=0).transform_one(issue)
+
+    assert np.array_equal(first, second)
+
+
+def test_near_identical_issues_share_memoized_encodings():
+    """Repeats hit the raw cache and variants of a failure hit the signature cache"""
+    vectorizer = HashedFeatureVectorizer(SPEC)
+    issues = [{"error_message": f"Query timed out after {seconds}s", "dataset": "sales"} for seconds in (30, 30, 45, 60)]
+
+    matrix = vectorizer.transform(issues)
+    stats = vectorizer.get_stats()
+
+    assert (matrix == matrix[0]).all()
+    assert stats["misses"] == 1
+    assert stats["raw_hits"] == 1
+    assert stats["signature_hits"] == 2
+    assert stats["hit_rate"] == 0.75
+
+
+def test_cache_is_bounded():
+    """The least recently used encodings are dropped past the cache size"""
+    vectorizer = HashedFeatureVectorizer(SPEC, cache_size=2)
+    vectorizer.transform([{"dataset": name} for name in ("a", "b", "c")])
+
+    stats = vectorizer.get_stats()
+    assert stats["cached_raw"] == 2
+    assert stats["cached_signatures"] == 2
+
+
+@pytest.mark.parametrize("spec", [
+    [{"type": "text"}],
+    [{"name": "error_message", "type": "embedding"}],
+    [{"name": "dataset", "type": "categorical", "buckets": 0}]
+])
+def test_invalid_spec_is_rejected(spec):
+    """Entries without a name, with an unknown type or without buckets are rejected"""
+    with pytest.raises(ValueError):
+        HashedFeatureVectorizer(spec)
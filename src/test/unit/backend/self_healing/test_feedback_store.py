@@ -0,0 +1,114 @@
+"""
+Unit tests for the columnar feedback store.
+Tests that appended feedback is encoded once into label columns and a feature matrix, that
+ranges and sequence samples load across segments, that a reopened store and a second reader
+see the same records, and that compaction keeps every record.
+"""
+import datetime  # package_version: standard library
+
+import numpy as np  # package_version: 1.24.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.learning.feedback_store import ColumnarFeedbackStore, FEATURES_COLUMN  # Module: src.backend.self_healing.learning.feedback_store
+
+
+def make_feedback(index: int) -> dict:
+    """Builds a feedback dictionary as produced by Feedback.to_dict"""
+    return {
+        "feedback_id": f"feedback-{index}",
+        "action_id": f"action-{index % 7}",
+        "action_type": ["retry", "resize", "backfill"][index % 3],
+        "issue_type": ["data_quality", "pipeline"][index % 2],
+        "confidence_score": 0.5 + (index % 5) / 10,
+        "successful": index % 4 != 0,
+        "feedback_type": "automatic",
+        "feedback_source": "system",
+        "context": {"error_message": f"Timeout after {index} seconds", "pipeline": f"pipeline-{index % 3}",
+                    "root_cause": "" if index % 6 == 0 else f"cause-{index % 2}"},
+        "metrics": {},
+        "comments": None,
+        "timestamp": datetime.datetime(2024, 1, 1, 12, 0, index % 60).isoformat()
+    }
+
+
+def make_store(tmp_path, sizes=(5, 3, 4)) -> ColumnarFeedbackStore:
+    """Store with one segment per entry of sizes"""
+    store = ColumnarFeedbackStore(str(tmp_path / "feedback"))
+    index = 0
+    for size in sizes:
+        store.append([make_feedback(index + offset) for offset in range(size)])
+        index += size
+    return store
+
+
+def test_append_encodes_labels_and_features(tmp_path):
+    """Tests that label fields become columns and the inputs a feature matrix"""
+    store = ColumnarFeedbackStore(str(tmp_path / "feedback"))
+    assert store.append([make_feedback(0), make_feedback(1)]) == (0, 2)
+    assert store.append([]) == (2, 2)
+
+    columns = store.load()
+    assert columns["feedback_id"].tolist() == ["feedback-0", "feedback-1"]
+    assert columns["issue_type"].tolist() == ["data_quality", "pipeline"]
+    assert columns["root_cause"].tolist() == ["", "cause-1"]
+    assert columns["successful"].tolist() == [False, True]
+    assert columns[FEATURES_COLUMN].shape == (2, store.feature_dimension)
+    assert columns[FEATURES_COLUMN].dtype == np.float32
+    assert columns["timestamp"][0] == datetime.datetime(2024, 1, 1, 12, 0, 0).timestamp()
+    # The confidence score is the trailing numeric feature
+    assert columns[FEATURES_COLUMN][:, -1].tolist() == pytest.approx([0.5, 0.6])
+
+
+def test_load_ranges_across_segments(tmp_path):
+    """Tests that a range spanning segments returns exactly its records"""
+    store = make_store(tmp_path)
+
+    assert store.sequence == 12
+    assert store.load(4, 9, columns=["feedback_id"])["feedback_id"].tolist() == [f"feedback-{index}" for index in range(4, 9)]
+    assert store.load(start=8)["features"].shape[0] == 4
+    empty = store.load(12)
+    assert empty["feedback_id"].tolist() == []
+    assert empty[FEATURES_COLUMN].shape == (0, store.feature_dimension)
+    with pytest.raises(ValueError):
+        store.load(columns=["unknown"])
+
+
+def test_take_returns_records_in_requested_order(tmp_path):
+    """Tests loading a sample of sequence numbers from several segments"""
+    store = make_store(tmp_path)
+    sequences = [11, 0, 6, 4, 7]
+
+    sample = store.take(sequences, columns=["feedback_id", FEATURES_COLUMN])
+
+    assert sample["feedback_id"].tolist() == [f"feedback-{index}" for index in sequences]
+    np.testing.assert_array_equal(sample[FEATURES_COLUMN], store.load()[FEATURES_COLUMN][sequences])
+    with pytest.raises(IndexError):
+        store.take([12])
+
+
+def test_reopened_store_and_second_reader_see_appends(tmp_path):
+    """Tests that the manifest is the shared source of truth for readers"""
+    store = make_store(tmp_path)
+    reader = ColumnarFeedbackStore(store.root_path)
+    assert reader.sequence == 12
+
+    store.append([make_feedback(12)])
+    assert reader.sequence == 13
+    assert reader.load(12)["feedback_id"].tolist() == ["feedback-12"]
+    with pytest.raises(ValueError):
+        ColumnarFeedbackStore(store.root_path, feature_spec=[{"name": "confidence_score", "type": "numeric"}])
+
+
+def test_compaction_merges_segments_and_keeps_records(tmp_path):
+    """Tests that compaction rewrites small segments without changing the data"""
+    store = make_store(tmp_path, sizes=(2, 2, 2, 2, 5))
+    before = store.load()
+    reader = ColumnarFeedbackStore(store.root_path)
+    reader.load()
+
+    assert store.compact(target_rows=4) == 2
+    assert store.get_stats()["segments"] == 3
+    assert store.compact(target_rows=4) == 0
+    for loaded in [store.load(), reader.load()]:
+        for column, values in before.items():
+            np.testing.assert_array_equal(loaded[column], values)
@@ -0,0 +1,87 @@
+"""
+Unit tests for the parallel hyperparameter search.
+Tests candidate sampling from choices and ranges, that successive halving stops weak
+trials after early rungs and resumes survivors from their checkpoints, and that failing
+trials are recorded without stopping the search.
+"""
+import json  # package_version: standard library
+import os  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.learning.hyperparameter_search import HyperparameterSearch, generate_candidates  # Module: src.backend.self_healing.learning.hyperparameter_search
+
+
+def quadratic_trial(params: dict, budget: int, checkpoint_path: str) -> float:
+    """Scores x by its distance to 3, recording the budgets a checkpoint has seen"""
+    budgets = []
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            budgets = json.load(f)
+    budgets.append(budget)
+    with open(checkpoint_path, "w") as f:
+        json.dump(budgets, f)
+    if os.environ.get("CUDA_VISIBLE_DEVICES") != "-1":
+        raise RuntimeError("worker is not restricted to the CPU")
+    if params.get("fail"):
+        raise RuntimeError("diverged")
+    return -(params["x"] - 3) ** 2 + len(budgets) * 0.001
+
+
+def make_search(**kwargs) -> HyperparameterSearch:
+    """Search with forked workers and budgets 1, 3 and 9"""
+    options = {"max_workers": 3, "reduction_factor": 3, "min_budget": 1, "max_budget": 9, "start_method": "fork"}
+    options.update(kwargs)
+    return HyperparameterSearch(quadratic_trial, **options)
+
+
+def test_generate_candidates_samples_the_space():
+    """Tests sampling of choices, int ranges and log-uniform float ranges"""
+    space = {"units": [32, 64], "layers": (1, 3), "learning_rate": (0.0001, 0.1), "dropout": (0.0, 0.5), "optimizer": "adam"}
+    candidates = generate_candidates(space, 20, seed=4)
+
+    assert len(candidates) == 20
+    assert len({tuple(sorted(candidate.items())) for candidate in candidates}) == 20
+    for candidate in candidates:
+        assert candidate["units"] in (32, 64)
+        assert candidate["layers"] in (1, 2, 3)
+        assert 0.0001 <= candidate["learning_rate"] <= 0.1
+        assert 0.0 <= candidate["dropout"] <= 0.5
+        assert candidate["optimizer"] == "adam"
+    assert generate_candidates(space, 5, seed=4) == candidates[:5]
+    # Only two distinct candidates exist
+    assert len(generate_candidates({"units": [32, 64]}, 10, seed=1)) == 2
+
+
+def test_successive_halving_stops_weak_trials():
+    """Tests that each rung keeps the best third and that survivors reach the full budget"""
+    search = make_search()
+    assert search.get_budgets() == [1, 3, 9]
+
+    result = search.run([{"x": x} for x in range(9)])
+
+    assert result["best_params"] == {"x": 3}
+    stopped = [trial["stopped_at_budget"] for trial in result["trials"]]
+    assert stopped.count(1) == 6
+    assert stopped.count(3) == 2
+    assert stopped.count(None) == 1
+    best = result["trials"][3]
+    assert sorted(best["scores"]) == [1, 3, 9]
+    # The checkpoint path is stable across rungs: the third rung saw two earlier calls
+    assert best["scores"][9] == pytest.approx(0.003)
+    assert result["workers"] == 3
+
+
+def test_failed_trials_are_recorded_and_skipped():
+    """Tests that an exception in one trial does not stop the others"""
+    result = make_search(max_budget=3).run([{"x": 3, "fail": True}, {"x": 1}, {"x": 6}])
+
+    failed = result["trials"][0]
+    assert failed["error"] == "diverged"
+    assert failed["stopped_at_budget"] == 1
+    assert result["best_params"] == {"x": 1}
+
+    with pytest.raises(RuntimeError):
+        make_search().run([{"x": 1, "fail": True}])
+    with pytest.raises(ValueError):
+        HyperparameterSearch(quadratic_trial, reduction_factor=1)
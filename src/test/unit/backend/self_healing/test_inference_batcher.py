@@ -0,0 +1,163 @@
+"""
+Unit tests for dynamic micro-batching of model inference.
+Tests that concurrent requests are gathered into batched calls with outputs scattered back
+in order, that batches respect the size limit and latency window, that a failed batch is
+bisected so only failing inputs reach their callers, and that batch size and latency
+histograms are recorded.
+"""
+import threading  # package_version: standard library
+import time  # package_version: standard library
+
+import numpy as np  # package_version: 1.24.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.models.inference_batcher import DynamicBatcher, Histogram  # Module: src.backend.self_healing.models.inference_batcher
+
+
+class RecordingModel:
+    """Vectorized fake model that records the size of every forward pass"""
+
+    def __init__(self, delay: float = 0.0):
+        self.batch_sizes = []
+        self.delay = delay
+
+    def __call__(self, inputs):
+        self.batch_sizes.append(len(inputs))
+        time.sleep(self.delay)
+        return list(np.asarray(inputs, dtype=float) * 2)
+
+
+def run_concurrently(batcher, count):
+    """Issues one predict call per thread, released at the same moment"""
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def call(index):
+        barrier.wait()
+        results[index] = batcher.predict(index, timeout=5)
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_requests_share_forward_passes():
+    """Concurrent callers are batched and each receives its own output"""
+    model = RecordingModel(delay=0.01)
+    batcher = DynamicBatcher(model, max_batch_size=8, max_latency_ms=20, name="classifier")
+    try:
+        results = run_concurrently(batcher, 32)
+    finally:
+        batcher.close()
+
+    assert results == [index * 2.0 for index in range(32)]
+    assert sum(model.batch_sizes) == 32
+    assert max(model.batch_sizes) <= 8
+    assert len(model.batch_sizes) < 32
+
+
+def test_predict_many_is_split_into_full_batches():
+    """Inputs queued together are run in batches of at most max_batch_size"""
+    model = RecordingModel()
+    batcher = DynamicBatcher(model, max_batch_size=16, max_latency_ms=50)
+    try:
+        outputs = batcher.predict_many(list(range(40)), timeout=5)
+        stats = batcher.get_stats()
+    finally:
+        batcher.close()
+
+    assert outputs == [value * 2.0 for value in range(40)]
+    assert model.batch_sizes == [16, 16, 8]
+    assert stats["requests"] == 40
+    assert stats["batches"] == 3
+    assert stats["batch_size"]["buckets"]["8"] == 1
+    assert stats["batch_size"]["buckets"]["16"] == 2
+    assert stats["batch_latency_ms"]["count"] == 3
+    assert stats["queue_wait_ms"]["count"] == 40
+
+
+def test_lone_request_waits_at_most_the_latency_window():
+    """A single request is not held back longer than the latency window"""
+    batcher = DynamicBatcher(RecordingModel(), max_batch_size=64, max_latency_ms=10)
+    try:
+        started = time.perf_counter()
+        assert batcher.predict(21, timeout=5) == 42.0
+        assert time.perf_counter() - started < 0.5
+    finally:
+        batcher.close()
+
+
+def test_failed_batch_only_fails_the_bad_input():
+    """A batch failing on one input is bisected so the other callers still get outputs"""
+    calls = []
+
+    def model(inputs):
+        calls.append(len(inputs))
+        if "bad" in inputs:
+            raise ValueError("cannot parse input")
+        return [value * 2 for value in inputs]
+
+    batcher = DynamicBatcher(model, max_batch_size=8, max_latency_ms=50)
+    try:
+        futures = [batcher.submit(value) for value in (0, 1, 2, "bad", 4, 5, 6, 7)]
+        for value, future in zip((0, 1, 2, None, 4, 5, 6, 7), futures):
+            if value is None:
+                with pytest.raises(ValueError, match="cannot parse input"):
+                    future.result(5)
+            else:
+                assert future.result(5) == value * 2
+        stats = batcher.get_stats()
+    finally:
+        batcher.close()
+
+    # Only the halves containing the bad input are split again
+    assert calls == [8, 4, 2, 2, 1, 1, 4]
+    assert stats["failed_batches"] == 1
+    assert stats["failed_requests"] == 1
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(1)
+
+
+def test_transient_batch_failure_is_retried_and_batcher_recovers():
+    """A batch that fails once is retried in halves instead of failing its callers"""
+    calls = []
+
+    def flaky_model(inputs):
+        calls.append(len(inputs))
+        if len(calls) == 1:
+            raise RuntimeError("out of memory")
+        return inputs
+
+    batcher = DynamicBatcher(flaky_model, max_batch_size=4, max_latency_ms=50)
+    try:
+        futures = [batcher.submit(index) for index in range(4)]
+        assert [future.result(5) for future in futures] == [0, 1, 2, 3]
+        assert batcher.predict("ok", timeout=5) == "ok"
+        assert batcher.get_stats()["failed_requests"] == 0
+    finally:
+        batcher.close()
+
+
+def test_output_count_mismatch_is_reported():
+    """A model returning the wrong number of outputs fails the requests it cannot serve"""
+    batcher = DynamicBatcher(lambda inputs: [], max_batch_size=2, max_latency_ms=50)
+    try:
+        futures = [batcher.submit(index) for index in range(2)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(5)
+    finally:
+        batcher.close()
+
+
+def test_histogram_buckets():
+    """Values land in the first bucket whose upper bound covers them"""
+    histogram = Histogram([1, 10])
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    assert histogram.to_dict() == {"buckets": {"1": 2, "10": 1, "+Inf": 1}, "count": 4, "sum": 56.5, "mean": 14.125}
@@ -578,6 +578,30 @@ def test_predict_with_local_model():
     assert "issue_type" in prediction
     assert "probability" in prediction
 
+def test_classify_issues_uses_one_model_call():
+    """Test that a batch of issues is encoded together and classified with one model call"""
+    # Mock a local model scoring every row with the probabilities of two classes
+    mock_model = unittest.mock.MagicMock()
+    mock_model.predict.side_effect = lambda model_input: [[0.2, 0.8]] * len(model_input)
+
+    # Skip loading a model into the shared pool; the mock is assigned after construction
+    with unittest.mock.patch.object(IssueClassifier, "_load_model"):
+        classifier = IssueClassifier({"model_classes": ["missing_values", "timeout"]})
+    classifier._model = mock_model
+
+    issues = [{"issue_id": "test-issue-001", "data_quality": 0.8, "error_message": "Nulls in column"},
+              {"issue_id": "test-issue-002", "error_message": "Job timed out"}]
+    classifications = classifier.classify_issues(issues)
+
+    # Verify the encoded feature matrix of both issues was passed to one predict call
+    mock_model.predict.assert_called_once()
+    assert mock_model.predict.call_args[0][0].shape == (2, classifier._vectorizer.dimension)
+
+    # Verify each issue gets the most probable class
+    assert [c.issue_id for c in classifications] == ["test-issue-001", "test-issue-002"]
+    assert [c.issue_category for c in classifications] == ["data_quality", "pipeline"]
+    assert all(c.issue_type == "timeout" for c in classifications)
+
 def test_predict_with_vertex():
     """Test prediction using Vertex AI"""
     # Mock the predict_with_vertex function
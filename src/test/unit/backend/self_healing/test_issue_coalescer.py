@@ -0,0 +1,177 @@
+"""
+Unit tests for coalescing issue storms.
+Tests that fingerprints ignore IDs, timestamps and counts, that duplicates arriving while an
+analysis runs or within its window share its result, that failures reach the attached
+duplicates without being cached, that recoveries of one target never overlap, and that
+coalescing ratios are reported.
+"""
+import threading  # package_version: standard library
+import time  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.correction.issue_coalescer import IssueCoalescer, TargetLocks, issue_fingerprint, recovery_target  # Module: src.backend.self_healing.correction.issue_coalescer
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_issue(index, table="orders", error="Table sales.orders not found (job 1a2b3c4d-0000-1111-2222-333344445555)"):
+    """Builds one copy of an upstream failure as reported by a downstream check"""
+    return {
+        "issue_id": f"issue-{index}",
+        "issue_type": "missing_table",
+        "dataset": "sales",
+        "table": table,
+        "error_message": error.replace("1a2b3c4d", f"{index:08x}"),
+        "detected_at": f"2023-01-01T00:00:{index % 60:02d}Z",
+        "row_count": index
+    }
+
+
+def run_concurrently(coalescer, issues, work, target=None):
+    """Submits every issue from its own thread, released at the same moment"""
+    barrier = threading.Barrier(len(issues))
+    results = [None] * len(issues)
+
+    def submit(position, issue):
+        barrier.wait()
+        results[position] = coalescer.run(issue_fingerprint(issue), work, issue, issue_id=issue["issue_id"], target=target)
+
+    threads = [threading.Thread(target=submit, args=(position, issue)) for position, issue in enumerate(issues)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_fingerprint_ignores_volatile_fields():
+    """Tests that copies of one failure share a fingerprint and other failures do not"""
+    assert issue_fingerprint(make_issue(1)) == issue_fingerprint(make_issue(2))
+    assert issue_fingerprint(make_issue(1)) != issue_fingerprint(make_issue(1, table="customers"))
+    assert issue_fingerprint(make_issue(1)) != issue_fingerprint(make_issue(1, error="Permission denied on sales.orders"))
+
+
+def test_recovery_target():
+    """Tests that recoveries target the dataset, falling back to the pipeline"""
+    assert recovery_target(make_issue(1)) == "dataset:sales"
+    assert recovery_target({"data_location": "project.sales.orders"}) == "dataset:sales"
+    assert recovery_target({"dag_id": "daily_load"}) == "pipeline:daily_load"
+    assert recovery_target({}) is None
+
+
+def test_concurrent_duplicates_share_one_execution():
+    """Tests that a storm of duplicates runs the work once and shares its result"""
+    coalescer = IssueCoalescer(window_seconds=60)
+    calls = []
+
+    def analyze(issue):
+        calls.append(issue["issue_id"])
+        time.sleep(0.05)
+        return {"root_cause": "upstream table dropped"}
+
+    results = run_concurrently(coalescer, [make_issue(index) for index in range(20)], analyze)
+
+    assert len(calls) == 1
+    assert all(result.result == {"root_cause": "upstream table dropped"} for result in results)
+    assert sum(result.coalesced for result in results) == 19
+    assert {result.leader_id for result in results} == {calls[0]}
+    stats = coalescer.get_stats()
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 19
+    assert stats["coalescing_ratio"] == pytest.approx(0.95)
+    assert stats["largest_storm"] == 20
+
+
+def test_results_are_shared_within_window():
+    """Tests that duplicates after completion share the result until the window passes"""
+    clock = FakeClock()
+    coalescer = IssueCoalescer(window_seconds=30, clock=clock)
+    counter = iter(range(100))
+
+    def analyze(issue):
+        return next(counter)
+
+    first = coalescer.run(issue_fingerprint(make_issue(1)), analyze, make_issue(1), issue_id="issue-1")
+    clock.now = 29
+    second = coalescer.run(issue_fingerprint(make_issue(2)), analyze, make_issue(2), issue_id="issue-2")
+    clock.now = 31
+    third = coalescer.run(issue_fingerprint(make_issue(3)), analyze, make_issue(3), issue_id="issue-3")
+
+    assert (first.result, first.coalesced) == (0, False)
+    assert (second.result, second.coalesced, second.leader_id) == (0, True, "issue-1")
+    assert (third.result, third.coalesced) == (1, False)
+
+
+def test_failures_reach_duplicates_and_are_not_cached():
+    """Tests that attached duplicates receive the failure and later issues retry"""
+    coalescer = IssueCoalescer(window_seconds=60)
+    attempts = []
+
+    def failing(issue):
+        attempts.append(issue["issue_id"])
+        time.sleep(0.05)
+        raise RuntimeError("analysis failed")
+
+    barrier = threading.Barrier(5)
+    errors = []
+
+    def submit(index):
+        barrier.wait()
+        try:
+            coalescer.run(issue_fingerprint(make_issue(index)), failing, make_issue(index), issue_id=f"issue-{index}")
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=submit, args=(index,)) for index in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == ["analysis failed"] * 5
+    assert len(attempts) == 1
+    assert coalescer.run(issue_fingerprint(make_issue(9)), lambda issue: "recovered", make_issue(9)).result == "recovered"
+    assert coalescer.get_stats()["failures"] == 1
+
+
+def test_recoveries_of_one_target_never_overlap():
+    """Tests that distinct issues on one dataset recover one at a time"""
+    locks = TargetLocks()
+    coalescer = IssueCoalescer(window_seconds=60, target_locks=locks)
+    active, peak = [0], [0]
+    guard = threading.Lock()
+
+    def recover(issue):
+        with guard:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with guard:
+            active[0] -= 1
+        return issue["table"]
+
+    issues = [make_issue(index, table=f"table_{index}") for index in range(6)]
+    results = run_concurrently(coalescer, issues, recover, target="dataset:sales")
+
+    assert peak[0] == 1
+    assert sorted(result.result for result in results) == [f"table_{index}" for index in range(6)]
+    assert locks.get_stats()["waits"] >= 1
+    assert not locks.is_locked("dataset:sales")
+
+
+def test_target_locks_are_reentrant():
+    """Tests that a recovery started inside an analysis of the same target does not deadlock"""
+    locks = TargetLocks()
+    with locks.hold("dataset:sales"):
+        with locks.hold("dataset:sales"):
+            assert locks.is_locked("dataset:sales")
+    assert not locks.is_locked("dataset:sales")
@@ -0,0 +1,164 @@
+"""
+Unit tests for the process-wide model pool.
+Tests that loaded models are shared and evicted least recently used first to stay within
+the memory budget, that concurrent misses load a model once, that background swaps keep
+serving the previous version until the new one is loaded and never replace a later activation,
+that model names resolve to registry IDs, and that metrics are recorded.
+"""
+import threading  # package_version: standard library
+import time  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.models.model_pool import ModelPool  # Module: src.backend.self_healing.models.model_pool
+
+
+class FakeLoader:
+    """Loader returning the artifact path as the model and counting loads per path"""
+
+    def __init__(self, delay: float = 0.0, fail_paths: tuple = ()):
+        self.loads = {}
+        self.delay = delay
+        self.fail_paths = fail_paths
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, model_path, model_format):
+        self.release.wait(5)
+        time.sleep(self.delay)
+        if model_path in self.fail_paths:
+            raise IOError(f"cannot read {model_path}")
+        self.loads[model_path] = self.loads.get(model_path, 0) + 1
+        return f"model:{model_path}"
+
+
+def make_pool(max_memory_bytes: int = 300, loader: FakeLoader = None) -> ModelPool:
+    """Pool whose models each take 100 bytes"""
+    return ModelPool(max_memory_bytes=max_memory_bytes, loader=loader or FakeLoader(),
+                     size_estimator=lambda model, path: 100)
+
+
+def test_hits_share_the_loaded_model():
+    """A second get returns the cached model without loading again"""
+    loader = FakeLoader()
+    pool = make_pool(loader=loader)
+
+    first = pool.get("classifier", "v1", "/models/classifier/v1")
+    second = pool.get("classifier", "v1", "/models/classifier/v1")
+
+    assert first is second
+    assert loader.loads == {"/models/classifier/v1": 1}
+    stats = pool.get_stats()
+    assert (stats["hits"], stats["misses"], stats["loads"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["memory_bytes"] == 100
+
+
+def test_least_recently_used_model_is_evicted_over_budget():
+    """Loading past the budget evicts the least recently used model"""
+    pool = make_pool(max_memory_bytes=200)
+    pool.get("a", "v1", "/a")
+    pool.get("b", "v1", "/b")
+    pool.get("a", "v1", "/a")
+    pool.get("c", "v1", "/c")
+
+    assert pool.is_loaded("a", "v1")
+    assert not pool.is_loaded("b", "v1")
+    assert pool.is_loaded("c", "v1")
+    assert [model["model_id"] for model in pool.get_loaded_models()] == ["a", "c"]
+    assert pool.get_stats()["evictions"] == 1
+    assert pool.get_stats()["memory_bytes"] == 200
+
+
+def test_concurrent_misses_load_once():
+    """Threads missing on the same model wait for a single load"""
+    loader = FakeLoader(delay=0.05)
+    pool = make_pool(loader=loader)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(pool.get("rca", "v1", "/rca")))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.loads == {"/rca": 1}
+    assert len(set(results)) == 1 and len(results) == 8
+
+
+def test_swap_serves_previous_version_until_loaded():
+    """The active version changes only after the new version has loaded"""
+    loader = FakeLoader()
+    pool = make_pool(loader=loader)
+    pool.activate("classifier", "v1", "/v1")
+
+    loader.release.clear()
+    future = pool.swap("classifier", "v2", "/v2")
+    assert pool.get_active("classifier") == "model:/v1"
+    assert pool.get_active_version("classifier") == "v1"
+
+    loader.release.set()
+    assert future.result(5) == "model:/v2"
+    assert pool.get_active("classifier") == "model:/v2"
+    assert pool.get_stats()["swaps"] == 1
+    pool.close()
+
+
+def test_failed_swap_keeps_previous_version():
+    """A version that fails to load does not replace the active version"""
+    pool = make_pool(loader=FakeLoader(fail_paths=("/broken",)))
+    pool.activate("predictor", "v1", "/v1")
+
+    with pytest.raises(IOError):
+        pool.swap("predictor", "v2", "/broken").result(5)
+
+    assert pool.get_active_version("predictor") == "v1"
+    assert pool.get_stats()["load_failures"] == 1
+    pool.close()
+
+
+def test_preload_activates_models():
+    """Preloading loads and activates every model and reports failures"""
+    pool = make_pool(loader=FakeLoader(fail_paths=("/broken",)))
+
+    loaded = pool.preload([("a", "v1", "/a", None), ("b", "v3", "/b", None), ("c", "v1", "/broken", None)])
+
+    assert loaded == 2
+    assert pool.get_active_version("a") == "v1"
+    assert pool.get_active_version("b") == "v3"
+    assert pool.get_active("c") is None
+    assert all(model["active"] for model in pool.get_loaded_models())
+    pool.close()
+
+
+def test_superseded_swap_does_not_become_active():
+    """A slow swap finishing after a later activation is ignored"""
+    loader = FakeLoader()
+    pool = make_pool(loader=loader)
+    pool.activate("classifier", "v1", "/v1")
+
+    loader.release.clear()
+    future = pool.swap("classifier", "v2", "/v2")
+    time.sleep(0.05)
+    threading.Timer(0.05, loader.release.set).start()
+    pool.activate("classifier", "v3", "/v3")
+
+    assert future.result(5) == "model:/v2"
+    assert pool.get_active_version("classifier") == "v3"
+    assert pool.get_stats()["stale_activations"] == 1
+    assert pool.get_stats()["swaps"] == 1
+    pool.close()
+
+
+def test_model_names_resolve_to_registry_ids():
+    """Models activated under a registry ID are found by name"""
+    pool = make_pool()
+    pool.register_name("issue_classifier", "model-1")
+    pool.activate("model-1", "version-7", "/registry/model-1/version-7")
+
+    assert pool.get_active_version("issue_classifier") == "version-7"
+    assert pool.get_active("issue_classifier") == "model:/registry/model-1/version-7"
+    assert pool.is_loaded("issue_classifier", "version-7")
+    assert pool.resolve("unregistered") == "unregistered"
+    pool.close()
@@ -0,0 +1,202 @@
+"""
+Unit tests for incremental model training from the columnar feedback store.
+Tests with a registered fake model builder that a model without a version trained from the
+store is trained from scratch, that too few new records skip the update, that updates warm
+start from the last version on the new records plus a replay sample of older ones, and that
+unseen labels or a large share of new records trigger a full retrain.
+"""
+import datetime  # package_version: standard library
+import sys  # package_version: standard library
+from types import SimpleNamespace  # package_version: standard library
+from unittest import mock  # package_version: standard library
+
+import numpy as np  # package_version: 1.24.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.learning.feedback_store import ColumnarFeedbackStore  # Module: src.backend.self_healing.learning.feedback_store
+
+# model_manager imports Vertex AI helpers and a serving factory that do not exist yet, so it is
+# replaced while model_trainer is imported; the tests use the in-memory FakeModelManager below
+with mock.patch.dict(sys.modules, {"src.backend.self_healing.models.model_manager": mock.MagicMock(DEFAULT_MODEL_BASE_PATH="models")}):
+    from src.backend.self_healing.learning import model_trainer  # Module: src.backend.self_healing.learning.model_trainer
+    from src.backend.self_healing.learning.model_trainer import ModelTrainer, TrainingConfig  # Module: src.backend.self_healing.learning.model_trainer
+
+
+def make_feedback(index: int, issue_type: str = None) -> dict:
+    """Builds a feedback dictionary as produced by Feedback.to_dict"""
+    return {
+        "feedback_id": f"feedback-{index}",
+        "action_id": f"action-{index % 7}",
+        "action_type": ["retry", "resize", "backfill"][index % 3],
+        "issue_type": issue_type or ["data_quality", "pipeline"][index % 2],
+        "confidence_score": 0.5 + (index % 5) / 10,
+        "successful": index % 4 != 0,
+        "feedback_type": "automatic",
+        "feedback_source": "system",
+        "context": {"error_message": f"Timeout after {index} seconds", "pipeline": f"pipeline-{index % 3}"},
+        "metrics": {},
+        "comments": None,
+        "timestamp": datetime.datetime(2024, 1, 1, 12, 0, index % 60).isoformat()
+    }
+
+
+def append_feedback(store: ColumnarFeedbackStore, count: int, issue_type: str = None) -> None:
+    """Appends count feedback records after the ones already in the store"""
+    start = store.sequence
+    store.append([make_feedback(start + offset, issue_type) for offset in range(count)])
+
+
+class FakeModel:
+    """Model predicting the first class for every record"""
+
+    def __init__(self, class_count: int):
+        self.class_count = class_count
+
+    def predict(self, features, verbose=0):
+        return np.eye(self.class_count)[np.zeros(len(features), dtype=int)]
+
+
+class RecordingBuilder:
+    """Model builder recording what every training run was given"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, X_train, y_train, training_config, initial_model=None, class_count=None, validation_data=None):
+        self.calls.append({"records": len(X_train) + len(validation_data[0]), "initial_model": initial_model,
+                           "class_count": class_count, "epochs": training_config.epochs})
+        return FakeModel(class_count)
+
+
+class FakeModelManager:
+    """Model manager keeping one model and its versions in memory"""
+
+    def __init__(self):
+        self.model_id = None
+        self.versions = []
+        self.saved_models = {}
+
+    def get_model_by_type(self, model_type):
+        return [SimpleNamespace(model_id=self.model_id)] if self.model_id else []
+
+    def register_model(self, name, description, model_type, metadata):
+        self.model_id = "model-1"
+        return self.model_id
+
+    def get_model(self, model_id):
+        return SimpleNamespace(get_latest_version=lambda: self.versions[-1] if self.versions else None)
+
+    def register_model_version(self, model_id, artifact_path, model_format, parameters, metrics, description):
+        version = SimpleNamespace(version_id=f"v{len(self.versions) + 1}", artifact_path=artifact_path,
+                                  metadata=SimpleNamespace(parameters=parameters))
+        self.versions.append(version)
+        return version.version_id
+
+    def load_model(self, model_id, version_id):
+        version = next(version for version in self.versions if version.version_id == version_id)
+        return self.saved_models[version.artifact_path]
+
+
+@pytest.fixture
+def manager():
+    """In-memory model manager"""
+    return FakeModelManager()
+
+
+@pytest.fixture
+def builder():
+    """Recording classification model builder"""
+    return RecordingBuilder()
+
+
+@pytest.fixture
+def trainer(monkeypatch, tmp_path, manager, builder):
+    """Model trainer with the fake builder that saves models in memory"""
+    def save_model(model, model_path, model_format, metadata=None):
+        manager.saved_models[model_path] = model
+        return model_path
+
+    monkeypatch.setattr(model_trainer.model_utils, "save_model", save_model)
+    monkeypatch.setattr(model_trainer.model_utils, "create_model_path",
+                        lambda model_id, version_id=None, base_dir=None: f"{base_dir}/{model_id}/{version_id}")
+    monkeypatch.setattr(ModelTrainer, "_copy_model", lambda self, model: model)
+    trainer = ModelTrainer({"models_path": str(tmp_path / "models"), "training": {"cpu_only": False}}, manager, None)
+    trainer.register_model_builder("classification", builder)
+    return trainer
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Feedback store holding 40 records with two issue types"""
+    store = ColumnarFeedbackStore(str(tmp_path / "feedback"))
+    append_feedback(store, 40)
+    return store
+
+
+def make_config(**params) -> TrainingConfig:
+    """Training configuration with small update thresholds"""
+    return TrainingConfig(dict({"cpu_only": False, "min_new_records": 10, "full_retrain_ratio": 0.5,
+                                "replay_fraction": 0.5, "warm_start_epochs": 3}, **params))
+
+
+def test_model_without_store_version_is_trained_from_scratch(trainer, store, manager, builder):
+    """Tests that the first incremental run trains on the whole store"""
+    model, metrics, training_run = trainer.train_incremental("classification", store, make_config())
+
+    assert training_run.dataset_info["training_mode"] == model_trainer.TRAINING_MODE_FULL
+    assert builder.calls == [{"records": 40, "initial_model": None, "class_count": 2, "epochs": 50}]
+    assert manager.versions[-1].metadata.parameters["feedback_sequence"] == 40
+    assert manager.versions[-1].metadata.parameters["classes"] == ["data_quality", "pipeline"]
+    assert metrics["speedup"] == 1.0
+
+
+def test_too_few_new_records_skip_the_update(trainer, store, manager, builder):
+    """Tests that an update waits for min_new_records new records"""
+    trainer.train_incremental("classification", store, make_config())
+    append_feedback(store, 9)
+
+    assert trainer.train_incremental("classification", store, make_config()) == (None, {"new_records": 9}, None)
+    assert len(builder.calls) == 1
+    assert len(manager.versions) == 1
+
+
+def test_update_warm_starts_on_new_records_and_a_replay_sample(monkeypatch, trainer, store, manager, builder):
+    """Tests mixing replayed older records into a warm-started update"""
+    first_model, _, _ = trainer.train_incremental("classification", store, make_config())
+    append_feedback(store, 12)
+    replayed = []
+    take = store.take
+    monkeypatch.setattr(store, "take", lambda sequences: replayed.extend(sequences) or take(sequences))
+
+    model, metrics, training_run = trainer.train_incremental("classification", store, make_config())
+
+    assert training_run.dataset_info["training_mode"] == model_trainer.TRAINING_MODE_WARM_START
+    assert builder.calls[-1] == {"records": 18, "initial_model": first_model, "class_count": 2, "epochs": 3}
+    assert len(replayed) == len(set(replayed)) == 6
+    assert all(sequence < 40 for sequence in replayed)
+    assert manager.versions[-1].metadata.parameters["feedback_sequence"] == 52
+
+    # Without replay the update trains on the new records only
+    append_feedback(store, 10)
+    online_model, metrics, training_run = trainer.train_incremental("classification", store, make_config(replay_fraction=0.0))
+    assert training_run.dataset_info["training_mode"] == model_trainer.TRAINING_MODE_ONLINE
+    assert builder.calls[-1] == {"records": 10, "initial_model": model, "class_count": 2, "epochs": 3}
+    assert len(replayed) == 6
+
+
+def test_new_labels_or_many_new_records_retrain_from_scratch(trainer, store, manager, builder):
+    """Tests the full retrain triggers of an update"""
+    trainer.train_incremental("classification", store, make_config())
+
+    # Records with an unseen issue type need a new output class
+    append_feedback(store, 12, issue_type="schema")
+    model, metrics, training_run = trainer.train_incremental("classification", store, make_config())
+    assert training_run.dataset_info["training_mode"] == model_trainer.TRAINING_MODE_FULL
+    assert builder.calls[-1] == {"records": 52, "initial_model": None, "class_count": 3, "epochs": 50}
+
+    # More than full_retrain_ratio of the store is new
+    append_feedback(store, 60)
+    model, metrics, training_run = trainer.train_incremental("classification", store, make_config())
+    assert training_run.dataset_info["training_mode"] == model_trainer.TRAINING_MODE_FULL
+    assert builder.calls[-1]["records"] == 112
+    assert builder.calls[-1]["initial_model"] is None
@@ -0,0 +1,191 @@
+"""
+Unit tests for the compiled strategy applicability rules.
+Tests that compiled rules agree with evaluate_rules on random rule trees and contexts while
+they reorder their conditions, that conditions with an explicit comparison operator are not
+mistaken for groups, that one call evaluates every strategy with shared conditions and
+disabled action types, and that reloading either configuration swaps in a new snapshot.
+"""
+import random  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+import yaml  # package_version: 6.0
+
+from src.backend.self_healing.config import healing_config, strategy_config  # Module: src.backend.self_healing.config
+from src.backend.self_healing.config.rule_compiler import CompiledStrategySet, compile_rules  # Module: src.backend.self_healing.config.rule_compiler
+from src.backend.self_healing.config.strategy_config import evaluate_rules  # Module: src.backend.self_healing.config.strategy_config
+
+FIELDS = ["issue_type", "severity", "metrics.row_count", "metrics.null_ratio", "source.table.name", "missing.field"]
+VALUES = {
+    "issue_type": ["data_quality", "pipeline", "resource"],
+    "severity": [1, 2, 3, 4],
+    "metrics.row_count": [0, 10, 1000],
+    "metrics.null_ratio": [0.0, 0.2, 0.5],
+    "source.table.name": ["orders", "orders_raw", "customers"],
+    "missing.field": [1]
+}
+OPERATORS = ["==", "!=", ">", ">=", "<", "<=", "eq", "ne", "gt", "lt", "in", "not_in",
+             "startswith", "endswith", "matches", "unknown"]
+
+
+class CountingDict(dict):
+    """Context that counts field lookups"""
+
+    lookups = 0
+
+    def get(self, key, default=None):
+        CountingDict.lookups += 1
+        return super().get(key, default)
+
+
+def random_condition(rng: random.Random) -> dict:
+    """Condition on a random field with comparable operands"""
+    field = rng.choice(FIELDS)
+    operator = rng.choice(OPERATORS)
+    choices = VALUES[field]
+    if operator in ("in", "not_in"):
+        value = rng.sample(choices, rng.randint(1, len(choices)))
+    elif operator in ("startswith", "endswith", "matches"):
+        value = str(rng.choice(choices))[:rng.randint(1, 4)]
+    else:
+        value = rng.choice(choices)
+    condition = {"field": field, "value": value}
+    if operator != "==" or rng.random() < 0.5:
+        condition["operator"] = operator
+    return condition
+
+
+def random_rules(rng: random.Random, depth: int = 0):
+    """Random rule tree mixing groups, lists and conditions"""
+    if depth >= 3 or rng.random() < 0.4:
+        return random_condition(rng)
+    kind = rng.choice(["AND", "OR", "NOT", "list"])
+    if kind == "NOT":
+        return {"operator": "NOT", "conditions": [random_rules(rng, depth + 1)]}
+    children = [random_rules(rng, depth + 1) for _ in range(rng.randint(1, 4))]
+    return children if kind == "list" else {"operator": kind, "conditions": children}
+
+
+def random_context(rng: random.Random) -> dict:
+    """Context in which each field may be missing"""
+    context = {}
+    for field in FIELDS[:-1]:
+        if rng.random() < 0.85:
+            target = context
+            parts = field.split(".")
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = rng.choice(VALUES[field])
+    return context
+
+
+def make_config(strategies: list) -> dict:
+    """Valid strategy configuration with the given strategies"""
+    return {"strategy_types": {}, "strategy_parameters": {}, "applicability_rules": {},
+            "execution_settings": {}, "strategies": strategies}
+
+
+@pytest.fixture
+def config_caches():
+    """Restores the module configuration caches after a test"""
+    saved = (strategy_config._strategy_config_cache, healing_config._healing_config_cache)
+    yield
+    strategy_config._strategy_config_cache, healing_config._healing_config_cache = saved
+    strategy_config._compiled_strategy_cache.clear()
+
+
+def test_compiled_rules_agree_with_evaluate_rules():
+    """Tests random rule trees against random contexts while the condition order is learned"""
+    rng = random.Random(7)
+    strategies = [{"name": f"strategy-{index}", "action_type": "DATA_CORRECTION",
+                   "applicability_rules": random_rules(rng)} for index in range(60)]
+    strategies.append({"name": "always", "action_type": "DATA_CORRECTION", "applicability_rules": {}})
+    compiled = CompiledStrategySet(make_config(strategies), sample_interval=3, reorder_samples=4)
+    assert compiled.get_stats()["shared_conditions"] > 0
+
+    for _ in range(400):
+        context = random_context(rng)
+        expected = [strategy["name"] for strategy in strategies
+                    if not strategy["applicability_rules"] or evaluate_rules(strategy["applicability_rules"], context)]
+        assert compiled.get_applicable_strategies(context) == expected
+        strategy = rng.choice(strategies)
+        assert compiled.is_applicable(strategy["name"], context) == (strategy["name"] in expected)
+        assert compile_rules(strategy["applicability_rules"])(context) == (strategy["name"] in expected)
+    assert compiled.is_applicable("unknown", {}) is False
+
+
+def test_condition_with_explicit_operator_is_not_a_group():
+    """Tests that a comparison operator on a condition is evaluated instead of passing vacuously"""
+    rules = {"field": "metrics.null_ratio", "operator": ">", "value": 0.1}
+
+    assert evaluate_rules(rules, {"metrics": {"null_ratio": 0.05}}) is False
+    assert evaluate_rules(rules, {"metrics": {"null_ratio": 0.5}}) is True
+    assert compile_rules(rules)({"metrics": {"null_ratio": 0.05}}) is False
+    assert compile_rules({"operator": "OR", "conditions": [rules, {"field": "severity", "value": 4}]})({"severity": 4}) is True
+    # Values that cannot be compared fail the condition
+    assert compile_rules(rules)({"metrics": {"null_ratio": "high"}}) is False
+
+
+def test_and_group_learns_to_check_the_failing_condition_first():
+    """Tests that sampled pass rates move the most selective condition to the front"""
+    rules = {"operator": "AND", "conditions": [{"field": "a", "value": 1}, {"field": "b", "value": 1},
+                                               {"field": "c", "value": 1}]}
+    compiled = CompiledStrategySet(make_config([{"name": "selective", "applicability_rules": rules}]),
+                                   sample_interval=1, reorder_samples=8)
+    for _ in range(16):
+        assert compiled.is_applicable("selective", CountingDict(a=1, b=1, c=0)) is False
+
+    compiled = CompiledStrategySet(make_config([{"name": "selective", "applicability_rules": rules}]),
+                                   sample_interval=2, reorder_samples=8)
+    for _ in range(32):
+        compiled.is_applicable("selective", CountingDict(a=1, b=1, c=0))
+    CountingDict.lookups = 0
+    compiled.is_applicable("selective", CountingDict(a=1, b=1, c=0))
+    assert CountingDict.lookups == 1
+
+
+def test_applicable_strategies_share_conditions_and_skip_disabled_types():
+    """Tests evaluating every strategy in one call"""
+    shared = {"field": "issue_type", "value": "data_quality"}
+    strategies = [
+        {"name": "impute", "action_type": "DATA_CORRECTION",
+         "applicability_rules": [shared, {"field": "metrics.null_ratio", "operator": "<", "value": 0.3}]},
+        {"name": "quarantine", "action_type": "DATA_CORRECTION",
+         "applicability_rules": [shared, {"field": "metrics.null_ratio", "operator": ">=", "value": 0.3}]},
+        {"name": "retry", "action_type": "PIPELINE_RETRY", "applicability_rules": {}},
+        {"name": "scale", "action_type": "RESOURCE_SCALING", "applicability_rules": {"field": "issue_type", "value": "resource"}}
+    ]
+    healing = {"action_types": {"PIPELINE_RETRY": {"enabled": False}, "DATA_CORRECTION": {"enabled": True}}}
+    compiled = CompiledStrategySet(make_config(strategies), healing)
+    context = {"issue_type": "data_quality", "metrics": {"null_ratio": 0.1}}
+
+    assert compiled.get_stats()["shared_conditions"] == 1
+    assert compiled.get_applicable_strategies(context) == ["impute"]
+    assert compiled.get_applicable_strategies(context, include_disabled=True) == ["impute", "retry"]
+    assert compiled.get_applicable_strategies(context, action_type="RESOURCE_SCALING") == []
+    assert compiled.is_applicable("retry", context) is True
+
+
+def test_reloading_either_configuration_swaps_the_snapshot(tmp_path, config_caches):
+    """Tests that the compiled snapshot follows the cached configurations"""
+    strategies = [{"name": "retry", "action_type": "PIPELINE_RETRY",
+                   "applicability_rules": {"field": "issue_type", "value": "pipeline"}}]
+    path = tmp_path / "healing_strategies.yaml"
+    path.write_text(yaml.safe_dump(make_config(strategies)))
+    healing_config._healing_config_cache = {"action_types": {"PIPELINE_RETRY": {"enabled": True}}}
+    strategy_config.reload_strategy_config(str(path))
+    context = {"issue_type": "pipeline"}
+
+    snapshot = strategy_config.get_compiled_strategies()
+    assert strategy_config.get_compiled_strategies() is snapshot
+    assert strategy_config.get_applicable_strategies(context) == ["retry"]
+    assert strategy_config.is_strategy_applicable("retry", context) is True
+
+    healing_config._healing_config_cache = {"action_types": {"PIPELINE_RETRY": {"enabled": False}}}
+    assert strategy_config.get_applicable_strategies(context) == []
+    assert strategy_config.get_compiled_strategies() is not snapshot
+
+    strategies[0]["applicability_rules"]["value"] = "data_quality"
+    path.write_text(yaml.safe_dump(make_config(strategies)))
+    strategy_config.reload_strategy_config(str(path))
+    assert strategy_config.is_strategy_applicable("retry", context) is False
+    assert strategy_config.get_compiled_strategies().strategy_config is strategy_config.get_strategy_config()
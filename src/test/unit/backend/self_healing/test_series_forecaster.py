@@ -0,0 +1,151 @@
+"""
+Unit tests for vectorized multi-series forecasting.
+Tests aligning series onto one grid, that the closed-form solution matches a per-series
+least squares fit of trend and seasonal levels, that incremental updates (with and without
+a half-life) match a full refit, and that the horizon only yields series forecast to cross
+their threshold.
+"""
+import datetime  # package_version: standard library
+
+import numpy as np  # package_version: 1.24.x
+import pandas as pd  # package_version: 2.0.x
+import pytest  # package_version: 7.3.1
+
+from src.backend.self_healing.ai.series_forecaster import SeriesForecaster, align_series  # Module: src.backend.self_healing.ai.series_forecaster
+
+START = 1_700_000_000.0 - 1_700_000_000.0 % 3600
+HOURS = 14 * 24
+
+
+def make_series(count=50, hours=HOURS, seed=1, missing=0.05):
+    """Builds hourly series with a linear trend, a daily cycle, noise and missing points"""
+    rng = np.random.default_rng(seed)
+    steps = np.arange(hours)
+    slopes = rng.normal(0, 0.02, count)
+    amplitudes = rng.uniform(0, 3, count)
+    values = (10 + slopes[:, None] * steps + amplitudes[:, None] * np.sin(2 * np.pi * steps / 24)
+              + rng.normal(0, 0.2, (count, hours)))
+    values[rng.random(values.shape) < missing] = np.nan
+    timestamps = START + steps * 3600.0
+    return {f"series-{index}": (timestamps, values[index]) for index in range(count)}, slopes
+
+
+def test_align_series_averages_steps_and_marks_gaps():
+    """Tests that points are averaged per step and missing steps are NaN"""
+    series = {
+        "a": ([START, START + 600, START + 7200], [1.0, 3.0, 5.0]),
+        "b": ([datetime.datetime.fromtimestamp(START + 3600, datetime.timezone.utc)], [7.0])
+    }
+    entity_ids, steps, matrix = align_series(series, 3600, origin=START)
+
+    assert entity_ids == ["a", "b"]
+    assert steps.tolist() == [0, 1, 2]
+    np.testing.assert_allclose(matrix, [[2.0, np.nan, 5.0], [np.nan, 7.0, np.nan]])
+
+
+def test_solution_matches_least_squares_per_series():
+    """Tests the batch closed form against a joint least squares fit of each series"""
+    series, slopes = make_series()
+    forecaster = SeriesForecaster(season_length=24)
+    forecaster.fit(series)
+    solution = forecaster.solve()
+
+    assert np.abs(solution["slope"] - slopes).max() < 0.002
+    for row in [0, 17, 42]:
+        timestamps, values = series[f"series-{row}"]
+        observed = np.isfinite(values)
+        steps = ((timestamps - forecaster.origin) / 3600).astype(int)[observed]
+        design = np.column_stack([steps] + [(steps % 24 == phase).astype(float) for phase in range(24)])
+        coefficients, residuals, _, _ = np.linalg.lstsq(design, values[observed], rcond=None)
+        assert solution["slope"][row] == pytest.approx(coefficients[0], rel=1e-8)
+        levels = coefficients[1:] - solution["intercept"][row]
+        np.testing.assert_allclose(solution["seasonal"][row], levels, atol=1e-8)
+        assert solution["sigma"][row] == pytest.approx(np.sqrt(residuals[0] / (observed.sum() - 25)), rel=1e-6)
+
+
+@pytest.mark.parametrize("half_life_steps", [None, 48])
+def test_incremental_updates_match_refit(half_life_steps):
+    """Tests that adding points one batch at a time gives the model of a full refit"""
+    series, _ = make_series(count=20)
+    refit = SeriesForecaster(half_life_steps=half_life_steps, origin=START)
+    refit.fit(series)
+
+    incremental = SeriesForecaster(half_life_steps=half_life_steps, origin=START)
+    incremental.fit({entity_id: (timestamps[:200], values[:200]) for entity_id, (timestamps, values) in series.items()})
+    for step in range(200, HOURS, 12):
+        entity_ids = [entity_id for entity_id in series for _ in range(len(series[entity_id][0][step:step + 12]))]
+        timestamps = np.concatenate([series[entity_id][0][step:step + 12] for entity_id in series])
+        values = np.concatenate([series[entity_id][1][step:step + 12] for entity_id in series])
+        incremental.update(entity_ids, timestamps, values)
+
+    expected, actual = refit.solve(), incremental.solve()
+    for key in ["slope", "intercept", "sigma", "seasonal"]:
+        np.testing.assert_allclose(actual[key], expected[key], rtol=1e-7, atol=1e-9)
+    assert incremental.get_model("series-3")["last_value"] == refit.get_model("series-3")["last_value"]
+
+
+def test_update_adds_new_series():
+    """Tests that points of unknown series start new models"""
+    forecaster = SeriesForecaster(season_length=1, min_points=3, origin=START)
+    forecaster.update("fresh", START + np.arange(5) * 3600.0, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    assert "fresh" in forecaster
+    assert forecaster.get_model("fresh")["slope_per_hour"] == pytest.approx(1.0)
+    assert forecaster.get_model("unknown") is None
+
+
+def test_exceedance_only_returns_crossing_series():
+    """Tests that only series forecast to cross within the horizon are returned, with their first crossing"""
+    steps = np.arange(48)
+    timestamps = START + steps * 3600.0
+    rng = np.random.default_rng(3)
+    series = {
+        "rising": (timestamps, 50 + 0.5 * steps + rng.normal(0, 0.2, 48)),
+        "flat": (timestamps, 50 + rng.normal(0, 0.2, 48)),
+        "falling": (timestamps, 80 - 0.5 * steps + rng.normal(0, 0.2, 48))
+    }
+    forecaster = SeriesForecaster(season_length=1, origin=START)
+    forecaster.fit(series)
+
+    alerts = forecaster.predict_exceedance(80.0, horizon_steps=24, min_confidence=0.9)
+
+    # The rising line reaches 80 at step 60, 13 steps after its last point
+    assert [alert.entity_id for alert in alerts] == ["rising"]
+    alert = alerts[0]
+    assert 13 <= alert.steps_ahead <= 15
+    assert alert.forecast_value >= 80.0
+    assert alert.confidence >= 0.9
+    # It reaches 90 at step 80, beyond the horizon
+    assert forecaster.predict_exceedance(90.0, horizon_steps=24, min_confidence=0.9) == []
+    assert alert.predicted_time == datetime.datetime.fromtimestamp(
+        forecaster.origin + (47 + alert.steps_ahead) * 3600, datetime.timezone.utc).replace(tzinfo=None)
+
+    below = forecaster.predict_exceedance({"falling": 50.0, "flat": 45.0}, horizon_steps=24, min_confidence=0.9, direction="below")
+    assert [alert.entity_id for alert in below] == ["falling"]
+    with pytest.raises(ValueError):
+        forecaster.predict_exceedance(90.0, horizon_steps=24, min_confidence=0.9, direction="sideways")
+
+
+def test_series_with_too_few_points_are_not_forecast():
+    """Tests that series below the minimum point count never alert"""
+    forecaster = SeriesForecaster(season_length=1, min_points=12, origin=START)
+    forecaster.fit({"short": (START + np.arange(6) * 3600.0, [10.0, 20.0, 30.0, 40.0, 50.0, 60.0])})
+
+    assert forecaster.predict_exceedance(70.0, horizon_steps=24, min_confidence=0.5) == []
+
+
+def test_fit_frame_matches_fit():
+    """Tests that fitting a long-format frame gives the models of fitting its series"""
+    series, _ = make_series(count=10)
+    frame = pd.DataFrame({
+        "dataset_id": np.repeat(list(series), HOURS),
+        "timestamp": pd.to_datetime(np.concatenate([timestamps for timestamps, _ in series.values()]), unit="s"),
+        "value": np.concatenate([values for _, values in series.values()])
+    })
+    from_series = SeriesForecaster(origin=START)
+    from_series.fit(series)
+    from_frame = SeriesForecaster(origin=START)
+    from_frame.fit_frame(frame, "dataset_id")
+
+    assert from_frame.entity_ids == from_series.entity_ids
+    np.testing.assert_allclose(from_frame.solve()["slope"], from_series.solve()["slope"])
@@ -0,0 +1,34 @@
+"""
+Unit tests for atomic JSON checkpoint writes.
+Tests that files are replaced in one step, missing directories are created and a
+failed write leaves the previous file and no temporary files behind.
+"""
+
+import json  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.storage.atomic_file import write_json_atomic  # Module(src.backend.utils.storage.atomic_file)
+
+
+def test_write_creates_directory_and_replaces_file(tmp_path):
+    """Tests that the file is written compactly and overwritten on the next write"""
+    path = tmp_path / "state" / "checkpoint.json"
+
+    write_json_atomic(str(path), {"version": 1, "items": [1, 2]})
+    assert path.read_text() == '{"version":1,"items":[1,2]}'
+
+    write_json_atomic(str(path), {"version": 2})
+    assert json.loads(path.read_text()) == {"version": 2}
+    assert [entry.name for entry in path.parent.iterdir()] == ["checkpoint.json"]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    """Tests that unserializable data leaves the old file intact and removes the temporary file"""
+    path = tmp_path / "checkpoint.json"
+    write_json_atomic(str(path), {"version": 1}, prefix=".checkpoint.")
+
+    with pytest.raises(TypeError):
+        write_json_atomic(str(path), {"version": object()}, prefix=".checkpoint.")
+
+    assert json.loads(path.read_text()) == {"version": 1}
+    assert [entry.name for entry in tmp_path.iterdir()] == ["checkpoint.json"]
@@ -0,0 +1,153 @@
+"""
+Unit tests for the Firestore client against the in-process local backend.
+Tests call-site compatible reads and writes, query filters, batched document fetches,
+cursor-based streaming with resumption, field projection, the bulk writer and SQLite
+persistence of the local store.
+"""
+
+import datetime  # package_version: standard library
+from unittest import mock  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+from google.api_core.exceptions import ServiceUnavailable  # package_version: 2.10.0
+
+from src.backend.utils.storage import firestore_client  # Module(src.backend.utils.storage.firestore_client)
+from src.backend.utils.storage.firestore_client import FirestoreClient  # Module(src.backend.utils.storage.firestore_client)
+from src.backend.utils.storage.local_firestore import LocalFirestoreClient, LocalQuery  # Module(src.backend.utils.storage.local_firestore)
+
+
+@pytest.fixture
+def client():
+    """FirestoreClient on a fresh local store with small pages"""
+    return FirestoreClient(client=LocalFirestoreClient(), config={"page_size": 3, "get_all_chunk_size": 2})
+
+
+@pytest.fixture
+def runs(client):
+    """Ten run documents with nested details"""
+    documents = {
+        f"run-{index:02d}": {
+            "index": index,
+            "status": "failed" if index % 3 == 0 else "success",
+            "details": {"pipeline": "orders" if index % 2 else "billing", "rows": index * 100}
+        }
+        for index in range(10)
+    }
+    client.batch_create("runs", documents)
+    return documents
+
+
+def test_document_calls_accept_paths_and_keyword_aliases(client):
+    """Tests the collection/ID, path and collection= call styles used across the pipeline"""
+    assert client.set_document("actions/a1", {"status": "pending", "attempts": 0})
+    client.set_document(collection="actions", document_id="a2", data={"status": "done"})
+    client.update_document("actions", "a1", {"attempts": 1, "result.code": 200})
+
+    assert client.get_document("actions/a1") == {"status": "pending", "attempts": 1, "result": {"code": 200}}
+    assert client.get_document(collection="actions", document_id="a2") == {"status": "done"}
+    assert client.get_document("actions", "a1", field_paths=["result.code"]) == {"result": {"code": 200}}
+    assert client.add_document("actions", {"status": "new"}) in {
+        snapshot.id for snapshot in client.collection("actions").stream()
+    }
+
+    client.delete_document("actions/a2")
+    assert client.get_document("actions", "a2") is None
+    assert not client.document_exists("actions", "a2")
+
+
+def test_query_filters_orders_and_limits(client, runs):
+    """Tests tuple, equality-mapping and Mongo-style filters on nested fields"""
+    failed = client.query_documents(collection="runs", query_params=[("status", "==", "failed")])
+    assert sorted(doc["index"] for doc in failed) == [0, 3, 6, 9]
+
+    recent_orders = client.query_documents(
+        "runs", {"details.pipeline": "orders", "index": {"$gte": 3, "$lt": 9}},
+        order_by=[("index", "desc")], limit=2
+    )
+    assert [doc["index"] for doc in recent_orders] == [7, 5]
+
+    assert len(client.query_collection("runs", {}, limit=10000)) == len(runs)
+    assert [doc.to_dict()["index"] for doc in client.query("runs", filters={"index": 4}).limit(1).stream()] == [4]
+
+
+def test_get_documents_uses_batched_get_all(client, runs):
+    """Tests that many documents are read in chunked get_all calls, skipping missing ones"""
+    ids = ["run-01", "run-02", "run-03", "run-01", "missing"]
+
+    with mock.patch.object(client.client, "get_all", wraps=client.client.get_all) as get_all:
+        documents = client.get_documents("runs", ids, field_paths=["index"])
+
+    assert documents == {"run-01": {"index": 1}, "run-02": {"index": 2}, "run-03": {"index": 3}}
+    assert get_all.call_count == 2
+
+
+def test_stream_documents_pages_with_cursors_and_resumes(client, runs):
+    """Tests cursor paging, resuming after a document ID and retrying a failed page"""
+    assert [doc["index"] for doc in client.stream_documents("runs", order_by="index")] == list(range(10))
+    assert [doc["index"] for doc in client.stream_documents("runs", order_by="index", start_after="run-06")] == [7, 8, 9]
+
+    original_stream = LocalQuery.stream
+    calls = []
+
+    def flaky_stream(query, transaction=None):
+        calls.append(query)
+        if len(calls) == 2:
+            raise ServiceUnavailable("Simulated outage")
+        return original_stream(query)
+
+    backoff = mock.MagicMock()
+    with mock.patch.object(LocalQuery, "stream", flaky_stream), \
+            mock.patch.object(firestore_client, "get_backoff_strategy", return_value=backoff):
+        indexes = [doc["index"] for doc in client.stream_documents("runs", filters={"index": {"$gte": 2}})]
+
+    assert indexes == list(range(2, 10))
+    assert backoff.wait.call_count == 1
+
+
+def test_projection_keeps_cursor_fields(client, runs):
+    """Tests that projected streams return selected fields plus the fields cursors need"""
+    documents = list(client.stream_documents("runs", order_by=[("index", "desc")], field_paths=["status"], limit=4))
+
+    assert documents == [{"status": runs[f"run-{i:02d}"]["status"], "index": i} for i in (9, 8, 7, 6)]
+
+
+def test_bulk_writer_isolates_failed_writes(client):
+    """Tests that the bulk writer commits in parallel batches and isolates a failing write"""
+    config = {"batch_size": 10, "max_concurrency": 4, "initial_ops_per_second": 10000}
+
+    with client.bulk_writer(config) as writer:
+        for index in range(95):
+            writer.set(client.document("events", f"e{index}"), {"index": index})
+        writer.update(client.document("events", "missing"), {"index": -1})
+
+    assert writer.get_stats()["writes_succeeded"] == 95
+    assert [write[1].id for write, _ in writer.get_failures()] == ["missing"]
+    assert len(client.query_documents("events")) == 95
+
+
+def test_bulk_writer_ramps_up_rate():
+    """Tests the 500/50/5 ramp-up schedule"""
+    writer = FirestoreClient(client=LocalFirestoreClient()).bulk_writer({"max_ops_per_second": 2000})
+    try:
+        assert writer.get_stats()["ops_per_second"] == 500
+        writer._started_at -= 600
+        assert writer.get_stats()["ops_per_second"] == 500 * 1.5 ** 2
+        writer._started_at -= 600
+        assert writer.get_stats()["ops_per_second"] == 2000
+    finally:
+        writer.close()
+
+
+def test_local_store_persists_to_sqlite(tmp_path):
+    """Tests that committed writes survive reopening a file-backed local store"""
+    path = str(tmp_path / "firestore.db")
+    created_at = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+    store = LocalFirestoreClient(database_path=path)
+    FirestoreClient(client=store).batch_create("states", {"s1": {"created_at": created_at}, "s2": {"tags": ["a"]}})
+    store.document("states/s2").delete()
+    store.close()
+
+    reopened = FirestoreClient(client=LocalFirestoreClient(database_path=path))
+    assert reopened.get_document("states", "s1") == {"created_at": created_at}
+    assert reopened.get_document("states", "s2") is None
@@ -0,0 +1,130 @@
+"""
+Unit tests for the Cloud Storage client against the local-filesystem backend.
+Tests parallel sliced downloads into memory and into files, parallel composite uploads,
+the seekable range reader, CRC32C verification, metadata handling and copies.
+"""
+
+import io  # package_version: standard library
+import os  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.storage.gcs_client import GCSClient, GCSRangeReader, compute_crc32c  # Module(src.backend.utils.storage.gcs_client)
+from src.backend.utils.storage.local_gcs import LocalStorageClient  # Module(src.backend.utils.storage.local_gcs)
+from src.backend.utils.errors.error_types import PipelineError, ResourceError  # Module(src.backend.utils.errors.error_types)
+
+BUCKET = "pipeline-data"
+
+
+@pytest.fixture
+def client(tmp_path):
+    """GCSClient on a local store with small slice and part sizes"""
+    gcs = GCSClient(client=LocalStorageClient(project="test-project", root_path=str(tmp_path / "gcs")))
+    gcs._sliced_download_threshold = 1000
+    gcs._slice_size = 256
+    gcs._composite_upload_threshold = 2000
+    gcs._composite_part_size = 300
+    gcs.create_bucket(BUCKET)
+    yield gcs
+    gcs.close()
+
+
+@pytest.fixture
+def payload():
+    """Payload large enough to be sliced and composed"""
+    return os.urandom(5000)
+
+
+def test_sliced_download_matches_object(client, payload, tmp_path):
+    """Tests parallel slice downloads into memory and into a memory-mapped file"""
+    client.upload_blob(BUCKET, payload, "raw/data.bin")
+    blob = client.get_bucket(BUCKET).get_blob("raw/data.bin")
+
+    ranges = []
+    original = type(blob).download_as_bytes
+
+    def recording_download(self, start=None, end=None, **kwargs):
+        ranges.append((start, end))
+        return original(self, start=start, end=end, **kwargs)
+
+    type(blob).download_as_bytes = recording_download
+    try:
+        assert client.download_blob_as_bytes(BUCKET, "raw/data.bin") == payload
+    finally:
+        type(blob).download_as_bytes = original
+
+    assert len(ranges) == 20
+    assert sorted(ranges)[-1] == (4864, 4999)
+
+    destination = str(tmp_path / "data.bin")
+    assert client.download_blob(BUCKET, "raw/data.bin", destination_file_path=destination) == destination
+    with open(destination, "rb") as handle:
+        assert handle.read() == payload
+
+
+def test_range_download_is_inclusive(client):
+    """Tests byte-range downloads with an inclusive end offset"""
+    client.upload_string(BUCKET, "sample.csv", "id,name\n1,a\n")
+
+    assert client.download_blob_as_bytes(BUCKET, "sample.csv", start=0, end=6) == b"id,name"
+    assert client.get_blob_metadata(BUCKET, "sample.csv")["content_type"] == "text/csv"
+
+
+def test_composite_upload_verifies_and_cleans_up(client, payload, tmp_path):
+    """Tests that large uploads are composed from parallel parts that are then deleted"""
+    source = tmp_path / "large.parquet"
+    source.write_bytes(payload)
+
+    blob = client.upload_file(BUCKET, str(source), "curated/large.parquet")
+
+    assert blob.component_count == 17
+    assert blob.crc32c == compute_crc32c(payload)
+    assert client.list_blobs(BUCKET, prefix="curated/") == ["curated/large.parquet"]
+    assert client.download_blob(BUCKET, "curated/large.parquet") == payload
+
+
+def test_range_reader_fetches_only_requested_blocks(client, payload):
+    """Tests that footer reads through the seekable reader only fetch the last block"""
+    client.upload_blob(BUCKET, payload, "table.parquet")
+
+    with client.open_blob(BUCKET, "table.parquet", block_size=512) as reader:
+        assert isinstance(reader, GCSRangeReader)
+        reader.seek(-8, io.SEEK_END)
+        assert reader.read(8) == payload[-8:]
+        reader.seek(-100, io.SEEK_END)
+        assert reader.read(50) == payload[-100:-50]
+        assert reader.requests == 1 and reader.bytes_fetched == 5000 - 9 * 512
+
+        reader.seek(0)
+        assert reader.read() == payload
+        assert reader.tell() == len(payload)
+
+
+def test_crc32c_mismatch_is_detected(client, payload):
+    """Tests that a download not matching the stored CRC32C is rejected"""
+    client.upload_blob(BUCKET, payload, "corrupt.bin")
+    with open(client.get_bucket(BUCKET).blob("corrupt.bin").path, "r+b") as handle:
+        handle.write(b"\x00" * 16)
+
+    with pytest.raises(PipelineError, match="CRC32C mismatch"):
+        client.download_blob_as_bytes(BUCKET, "corrupt.bin")
+    assert len(client.download_blob_as_bytes(BUCKET, "corrupt.bin", verify_checksum=False)) == len(payload)
+
+
+def test_metadata_copy_and_delete(client):
+    """Tests custom metadata, copies between buckets, listing patterns and deletes"""
+    result = client.upload_blob(BUCKET, b"{}", "events/2023.json", metadata={"content_format": "json"})
+    assert result["size"] == 2 and result["md5_hash"]
+
+    client.update_blob_metadata(BUCKET, "events/2023.json", {"source": "api"})
+    assert client.get_blob_metadata(BUCKET, "events/2023.json")["content_format"] == "json"
+
+    client.create_bucket("archive")
+    copied = client.copy_blob(BUCKET, "events/2023.json", "archive", "events/copy.json")
+    assert copied["metadata"] == {"content_format": "json", "source": "api"}
+    assert client.list_blobs("archive", prefix="events/", pattern="*.json") == ["events/copy.json"]
+
+    client.delete_blob(BUCKET, "events/2023.json")
+    assert not client.blob_exists(BUCKET, "events/2023.json")
+    with pytest.raises(ResourceError):
+        client.get_blob(BUCKET, "events/2023.json")
@@ -0,0 +1,100 @@
+"""
+Unit tests for keyset (cursor) pagination helpers.
+Tests cursor encoding round trips, rejection of malformed or mismatched cursors, the
+generated predicates, and paging through the local query engine with duplicate sort keys.
+"""
+
+import datetime  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.errors.error_types import ValidationError  # Module(src.backend.utils.errors.error_types)
+from src.backend.utils.storage.keyset_pagination import (  # Module(src.backend.utils.storage.keyset_pagination)
+    build_keyset_condition,
+    build_keyset_order_by,
+    decode_cursor,
+    encode_cursor,
+    get_next_cursor
+)
+
+CREATED_AT = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def test_cursor_round_trip():
+    """Tests that timestamps, numbers and IDs survive encoding into an opaque token"""
+    cursor = encode_cursor(CREATED_AT, "alert-7", sort_by="created_at")
+
+    assert "=" not in cursor and "alert" not in cursor
+    assert decode_cursor(cursor, sort_by="created_at") == (CREATED_AT, "alert-7")
+    assert decode_cursor(encode_cursor(12.5, 3)) == (12.5, 3)
+    assert decode_cursor(encode_cursor(datetime.datetime(2023, 1, 1), "x"))[0] == CREATED_AT
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(CREATED_AT, "a")[:-4], "e30"])
+def test_invalid_cursor_is_rejected(cursor):
+    """Tests that malformed tokens raise a validation error"""
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def test_cursor_for_other_sort_column_is_rejected():
+    """Tests that a cursor cannot be replayed against a different sort order"""
+    with pytest.raises(ValidationError):
+        build_keyset_condition("severity", "alert_id", encode_cursor(CREATED_AT, "a", sort_by="created_at"))
+
+
+def test_keyset_condition_and_order():
+    """Tests the expanded tuple comparison and its typed parameters"""
+    assert build_keyset_condition("created_at", "alert_id", None) == ("", [])
+
+    condition, params = build_keyset_condition("created_at", "alert_id", (CREATED_AT, "alert-3"))
+    assert condition == ("(created_at < @cursor_sort_key OR "
+                         "(created_at = @cursor_sort_key AND alert_id < @cursor_id))")
+    assert [(p["name"], p["parameterType"]["type"]) for p in params] == [
+        ("cursor_sort_key", "TIMESTAMP"), ("cursor_id", "STRING")
+    ]
+    assert ">" in build_keyset_condition("count", "alert_id", (3, "a"), descending=False)[0]
+    assert build_keyset_order_by("created_at", "alert_id") == "ORDER BY created_at DESC, alert_id DESC"
+
+
+def test_next_cursor_only_for_full_pages():
+    """Tests that a short page ends pagination"""
+    rows = [{"created_at": CREATED_AT, "alert_id": "a"}, {"created_at": CREATED_AT, "alert_id": "b"}]
+
+    assert get_next_cursor(rows, "created_at", "alert_id", limit=3) is None
+    assert decode_cursor(get_next_cursor(rows, "created_at", "alert_id", limit=2)) == (CREATED_AT, "b")
+
+
+def test_pages_cover_rows_with_duplicate_sort_keys():
+    """Tests paging through the local engine when many rows share a sort key"""
+    pytest.importorskip("duckdb")  # package_version: 0.9.0+
+    from src.backend.utils.storage.local_query_engine import LocalBigQueryClient  # Module(src.backend.utils.storage.local_query_engine)
+
+    client = LocalBigQueryClient(project_id="test-project", database_path=":memory:")
+    client.create_table("test_dataset", "alerts", [
+        {"name": "alert_id", "type": "STRING", "mode": "REQUIRED"},
+        {"name": "created_at", "type": "TIMESTAMP", "mode": "REQUIRED"}
+    ])
+    client.insert_rows("test-project", "test_dataset", "alerts", [
+        {"alert_id": f"alert-{index:02d}", "created_at": CREATED_AT + datetime.timedelta(hours=index // 4)}
+        for index in range(23)
+    ])
+
+    seen, cursor = [], None
+    try:
+        while True:
+            condition, params = build_keyset_condition("created_at", "alert_id", cursor)
+            rows = client.query(
+                "SELECT alert_id, created_at FROM `test-project.test_dataset.alerts` "
+                f"{'WHERE ' + condition if condition else ''} "
+                f"{build_keyset_order_by('created_at', 'alert_id')} LIMIT 5",
+                params
+            )
+            seen.extend(row["alert_id"] for row in rows)
+            cursor = get_next_cursor(rows, "created_at", "alert_id", limit=5)
+            if cursor is None:
+                break
+    finally:
+        client.close()
+
+    assert seen == sorted((f"alert-{index:02d}" for index in range(23)),
+                          key=lambda alert_id: (int(alert_id[-2:]) // 4, alert_id), reverse=True)
@@ -0,0 +1,149 @@
+"""
+Unit tests for the embedded DuckDB query engine that stands in for BigQuery.
+Tests table creation, typed and REST-style query parameters, streaming Arrow reads,
+row updates, attaching Parquet files as tables and selecting the backend from configuration.
+"""
+
+import datetime  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+duckdb = pytest.importorskip("duckdb")  # package_version: 0.9.0+
+pyarrow = pytest.importorskip("pyarrow")  # package_version: 12.0.0+
+
+from src.backend.utils.storage import bigquery_client  # Module(src.backend.utils.storage.bigquery_client)
+from src.backend.utils.storage.local_query_engine import (  # Module(src.backend.utils.storage.local_query_engine)
+    LocalBigQueryClient,
+    translate_query
+)
+
+ALERT_SCHEMA = [
+    {"name": "alert_id", "type": "STRING", "mode": "REQUIRED"},
+    {"name": "severity", "type": "STRING", "mode": "NULLABLE"},
+    {"name": "count", "type": "INT64", "mode": "NULLABLE"},
+    {"name": "created_at", "type": "TIMESTAMP", "mode": "NULLABLE"}
+]
+
+
+@pytest.fixture
+def client():
+    """Provides an in-memory local engine with a populated alerts table"""
+    client = LocalBigQueryClient(project_id="test-project", database_path=":memory:")
+    client.create_table("test_dataset", "alerts", ALERT_SCHEMA)
+    created_at = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    client.insert_rows("test-project", "test_dataset", "alerts", [
+        {"alert_id": f"alert-{index}", "severity": "HIGH" if index % 2 else "LOW", "count": index,
+         "created_at": created_at + datetime.timedelta(hours=index)}
+        for index in range(10)
+    ])
+    yield client
+    client.close()
+
+
+def test_translate_query():
+    """Tests translation of BigQuery table references, parameters and functions"""
+    translated = translate_query(
+        "SELECT COUNTIF(x > 0) FROM `project.dataset.table` WHERE ts > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), "
+        "INTERVAL 1 DAY) AND id = @id"
+    )
+
+    assert '"dataset"."table"' in translated
+    assert "$id" in translated
+    assert "count_if(" in translated
+    assert "CURRENT_TIMESTAMP," in translated
+
+
+def test_translate_approximate_aggregates():
+    """Tests translation of APPROX_QUANTILES offsets and APPROX_TOP_COUNT values"""
+    translated = translate_query(
+        "SELECT APPROX_QUANTILES(`value`, 1000)[OFFSET(50)] AS q, APPROX_TOP_COUNT(`value`, 1)[OFFSET(0)].value AS m "
+        "FROM `project.dataset.table`"
+    )
+
+    assert 'quantile_disc("value", 0.05)' in translated
+    assert 'mode("value")' in translated
+
+
+def test_query_with_dict_parameters(client):
+    """Tests parameterized queries with a name-to-value mapping"""
+    rows = client.query(
+        "SELECT severity, COUNT(*) AS total FROM `test-project.test_dataset.alerts` "
+        "WHERE count >= @min_count GROUP BY severity ORDER BY severity",
+        {"min_count": 4}
+    )
+
+    assert rows == [{"severity": "HIGH", "total": 3}, {"severity": "LOW", "total": 3}]
+
+
+def test_query_with_rest_parameters(client):
+    """Tests the REST-style parameter definitions the repositories build"""
+    rows = client.query(
+        "SELECT alert_id FROM `test_dataset.alerts` WHERE created_at >= @since AND alert_id IN UNNEST(@ids)",
+        [
+            {"name": "since", "parameterType": {"type": "TIMESTAMP"},
+             "parameterValue": {"value": "2023-01-01T05:00:00+00:00"}},
+            {"name": "ids", "parameterType": {"type": "ARRAY", "arrayType": {"type": "STRING"}},
+             "parameterValue": {"arrayValues": [{"value": "alert-1"}, {"value": "alert-7"}]}}
+        ]
+    )
+
+    assert [row["alert_id"] for row in rows] == ["alert-7"]
+
+
+def test_execute_query_with_positional_string_value_parameters(client):
+    """Tests the positional REST parameters with stringValue that the collectors pass"""
+    rows = list(client.execute_query(
+        "SELECT alert_id FROM `test_dataset.alerts` WHERE severity = @severity AND alert_id IN UNNEST(@ids)",
+        [
+            {"name": "severity", "parameterType": {"type": "STRING"}, "parameterValue": {"stringValue": "HIGH"}},
+            {"name": "ids", "parameterType": {"type": "ARRAY", "arrayType": {"type": "STRING"}},
+             "parameterValue": {"arrayValues": [{"stringValue": "alert-3"}, {"stringValue": "alert-4"}]}}
+        ]
+    ))
+
+    assert [row["alert_id"] for row in rows] == ["alert-3"]
+
+
+def test_configured_local_backend_is_shared(monkeypatch):
+    """Tests that bigquery.backend=local makes the shared client factory return the local engine"""
+    monkeypatch.setattr(bigquery_client, "get_config", lambda: {"bigquery.backend": "local"})
+    monkeypatch.setattr(bigquery_client, "_shared_clients", {})
+
+    local = bigquery_client.create_bigquery_client()
+    try:
+        assert isinstance(local, LocalBigQueryClient)
+        assert bigquery_client.create_bigquery_client() is local
+    finally:
+        local.close()
+
+
+def test_iter_query_batches_streams_arrow(client):
+    """Tests that query results stream as Arrow record batches"""
+    batches = list(client.iter_query_batches("SELECT * FROM `test_dataset.alerts`"))
+
+    assert all(isinstance(batch, pyarrow.RecordBatch) for batch in batches)
+    assert sum(batch.num_rows for batch in batches) == 10
+    assert client.get_table_rows_count("test_dataset", "alerts") == 10
+
+
+def test_update_rows(client):
+    """Tests updating rows by key column"""
+    client.update_rows("test_dataset", "alerts", [{"alert_id": "alert-3", "severity": "CRITICAL"}], "alert_id")
+
+    rows = client.query("SELECT severity FROM `test_dataset.alerts` WHERE alert_id = @id", {"id": "alert-3"})
+    assert rows[0]["severity"] == "CRITICAL"
+
+
+def test_parquet_tables_are_attached_and_writable(client, tmp_path):
+    """Tests that Parquet files are attached as tables and materialized on write"""
+    client.export_table_to_parquet("test_dataset", "alerts", str(tmp_path / "archive" / "alerts.parquet"))
+
+    local = LocalBigQueryClient(project_id="test-project", data_path=str(tmp_path))
+    try:
+        assert local.table_exists("archive", "alerts")
+        assert local.get_table_rows_count("archive", "alerts") == 10
+
+        local.insert_rows("archive.alerts", [{"alert_id": "alert-new", "severity": "LOW", "count": 0}])
+        assert local.get_table_rows_count("archive", "alerts") == 11
+        assert [field.name for field in local.get_table("archive", "alerts").schema][:2] == ["alert_id", "severity"]
+    finally:
+        local.close()
@@ -0,0 +1,149 @@
+"""
+Unit tests for the buffered metric writer used by MetricClient in buffered mode.
+Tests per-series aggregation of gauges, counters and distributions, batch flushing,
+backpressure handling and retry of failed flushes using the in-memory backend.
+"""
+
+import datetime  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.monitoring.metric_buffer import (  # Module(src.backend.utils.monitoring.metric_buffer)
+    MetricBuffer,
+    InMemoryMetricBackend,
+    AGGREGATION_GAUGE,
+    AGGREGATION_COUNTER,
+    AGGREGATION_DISTRIBUTION
+)
+from src.backend.utils.monitoring.metric_client import (  # Module(src.backend.utils.monitoring.metric_client)
+    METRIC_KIND_CUMULATIVE,
+    VALUE_TYPE_DISTRIBUTION
+)
+
+
+@pytest.fixture
+def backend():
+    """Provides an in-memory metric backend"""
+    return InMemoryMetricBackend()
+
+
+@pytest.fixture
+def buffer(backend):
+    """Provides a metric buffer without a background thread"""
+    buffer = MetricBuffer(backend, {"max_batch_series": 2, "max_pending_series": 3}, start_thread=False)
+    yield buffer
+    buffer.close(flush=False)
+
+
+def test_gauge_keeps_last_value(buffer, backend):
+    """Tests that repeated gauge points collapse into the last value"""
+    for value in [1.0, 2.0, 3.0]:
+        buffer.record("custom.googleapis.com/test/gauge", value, AGGREGATION_GAUGE, {"mode": "batch"})
+
+    assert buffer.flush() == 1
+    series = backend.get_latest("custom.googleapis.com/test/gauge", {"mode": "batch"})
+    assert series.value == 3.0
+
+
+def test_counter_is_summed_and_cumulative(buffer, backend):
+    """Tests that counters sum increments and keep totals across flushes"""
+    buffer.record("custom.googleapis.com/test/counter", 2, AGGREGATION_COUNTER)
+    buffer.record("custom.googleapis.com/test/counter", 3, AGGREGATION_COUNTER)
+    buffer.flush()
+    buffer.record("custom.googleapis.com/test/counter", 5, AGGREGATION_COUNTER)
+    buffer.flush()
+
+    series = backend.get_latest("custom.googleapis.com/test/counter")
+    assert series.value == 10
+    assert series.metric_kind == METRIC_KIND_CUMULATIVE
+    assert series.timestamp > series.start_time
+
+
+def test_distribution_is_bucketed(buffer, backend):
+    """Tests that distribution samples are bucketed with exact mean"""
+    for value in [0.5, 1.5, 2.0, 100.0]:
+        buffer.record("custom.googleapis.com/test/latency", value, AGGREGATION_DISTRIBUTION)
+    buffer.flush()
+
+    series = backend.get_latest("custom.googleapis.com/test/latency")
+    assert series.value_type == VALUE_TYPE_DISTRIBUTION
+    assert series.value["count"] == 4
+    assert series.value["mean"] == pytest.approx(26.0)
+    assert sum(series.value["bucket_counts"]) == 4
+
+
+def test_unchanged_series_are_not_rewritten(buffer, backend):
+    """Tests that only series changed since the last flush are written"""
+    buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER)
+    assert buffer.flush() == 1
+    assert buffer.flush() == 0
+
+
+def test_backpressure_drops_new_series_but_merges_existing(buffer):
+    """Tests that new series are dropped once max_pending_series is reached"""
+    for index in range(3):
+        assert buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER, {"id": str(index)})
+
+    assert not buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER, {"id": "overflow"})
+    assert buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER, {"id": "0"})
+    assert buffer.get_stats()["points_dropped"] == 1
+
+
+def test_flush_evicts_series_to_make_room(buffer, backend):
+    """Tests that written series are evicted once the buffer is full so new series are accepted"""
+    for index in range(3):
+        buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER, {"id": str(index)})
+    assert not buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER, {"id": "new"})
+
+    buffer.flush()
+
+    assert buffer.get_stats()["series_evicted"] == 1
+    assert buffer.record("custom.googleapis.com/test/counter", 1, AGGREGATION_COUNTER, {"id": "new"})
+
+
+def test_idle_cumulative_series_are_evicted(backend):
+    """Tests that idle counters are forgotten after a flush and restart as new cumulative series"""
+    buffer = MetricBuffer(backend, {"idle_series_seconds": 0}, start_thread=False)
+    buffer.record("custom.googleapis.com/test/counter", 2, AGGREGATION_COUNTER)
+    buffer.flush()
+    first = backend.get_latest("custom.googleapis.com/test/counter")
+
+    assert buffer.get_stats()["tracked_series"] == 0
+    buffer.record("custom.googleapis.com/test/counter", 5, AGGREGATION_COUNTER)
+    buffer.flush()
+    second = backend.get_latest("custom.googleapis.com/test/counter")
+    assert second.value == 5
+    assert second.start_time >= first.start_time
+
+
+def test_failed_flush_is_retried(backend):
+    """Tests that series from a failed flush are written by the next flush"""
+    buffer = MetricBuffer(backend, start_thread=False)
+    backend.fail_writes = True
+    buffer.record("custom.googleapis.com/test/gauge", 7, AGGREGATION_GAUGE)
+
+    assert buffer.flush() == 0
+    assert buffer.get_stats()["flush_errors"] == 1
+
+    backend.fail_writes = False
+    assert buffer.flush() == 1
+    assert backend.get_latest("custom.googleapis.com/test/gauge").value == 7
+
+
+def test_flush_splits_into_batches(backend):
+    """Tests that flushes respect the maximum batch size"""
+    buffer = MetricBuffer(backend, {"max_batch_series": 2}, start_thread=False)
+    for index in range(5):
+        buffer.record("custom.googleapis.com/test/gauge", index, AGGREGATION_GAUGE, {"id": str(index)})
+
+    assert buffer.flush() == 5
+    assert [len(batch) for batch in backend.batches] == [2, 2, 1]
+
+
+def test_close_flushes_pending_series(backend):
+    """Tests that closing the buffer flushes remaining series"""
+    buffer = MetricBuffer(backend, {"flush_interval_seconds": 60})
+    buffer.record("custom.googleapis.com/test/gauge", 1, AGGREGATION_GAUGE,
+                  timestamp=datetime.datetime.now(datetime.timezone.utc))
+    buffer.close()
+
+    assert len(backend.written_series) == 1
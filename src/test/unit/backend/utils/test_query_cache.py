@@ -0,0 +1,123 @@
+"""
+Unit tests for the repository query result cache.
+Tests key normalization, write-generation invalidation, TTL expiry, LRU eviction
+and hit/miss statistics.
+"""
+
+import time  # package_version: standard library
+from unittest.mock import MagicMock  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.storage.query_cache import (  # Module(src.backend.utils.storage.query_cache)
+    QueryResultCache,
+    build_cache_key,
+    extract_table_references,
+    normalize_query
+)
+
+ALERTS_QUERY = "SELECT severity, COUNT(*) AS count FROM `proj.ds.alerts` WHERE created_at >= @since GROUP BY severity"
+PARAMS = [{"name": "since", "parameterType": {"type": "TIMESTAMP"}, "parameterValue": {"value": "2023-01-01"}}]
+
+
+@pytest.fixture
+def bq_client():
+    """Provides a mock client returning one row per query"""
+    client = MagicMock()
+    client.query.side_effect = lambda query, params=None: [{"severity": "HIGH", "count": client.query.call_count}]
+    return client
+
+
+def test_cache_key_normalizes_formatting():
+    """Tests that whitespace and comments do not change the cache key but parameters do"""
+    formatted = """
+        SELECT severity, COUNT(*) AS count  -- per severity
+        FROM `proj.ds.alerts`
+        WHERE created_at >= @since GROUP BY severity
+    """
+    assert build_cache_key(formatted, PARAMS) == build_cache_key(ALERTS_QUERY, PARAMS)
+    assert build_cache_key(ALERTS_QUERY, {"since": "2023-01-02"}) != build_cache_key(ALERTS_QUERY, {"since": "2023-01-01"})
+    assert extract_table_references("SELECT * FROM `Proj.ds.a` JOIN `proj.ds.b` ON TRUE") == ["proj.ds.a", "proj.ds.b"]
+
+
+def test_normalization_keeps_string_literals():
+    """Tests that comment markers and whitespace inside quoted literals are part of the cache key"""
+    assert normalize_query("SELECT 'a  b', \"x -- y\"  -- note\n  FROM `t`") == "SELECT 'a  b', \"x -- y\" FROM `t`"
+    assert normalize_query(r"SELECT 'it\'s  --here'") == r"SELECT 'it\'s  --here'"
+    assert normalize_query("SELECT '''a\n  b'''  ") == "SELECT '''a\n  b'''"
+
+    # Literals differing only in whitespace or a comment-like suffix are different queries
+    query = "SELECT AVG(value) FROM `proj.ds.metrics` WHERE metric_name = '{}'"
+    assert build_cache_key(query.format("cpu -- host a"), None) != build_cache_key(query.format("cpu -- host b"), None)
+    assert build_cache_key(query.format("disk  io"), None) != build_cache_key(query.format("disk io"), None)
+
+
+def test_repeated_queries_are_served_from_cache(bq_client):
+    """Tests that identical queries hit the cache and results are copies"""
+    cache = QueryResultCache()
+
+    first = cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS, name="alerts")
+    first[0]["count"] = 99
+    second = cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS, name="alerts")
+
+    assert bq_client.query.call_count == 1
+    assert second == [{"severity": "HIGH", "count": 1}]
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["by_query"]["alerts"] == {"hits": 1, "misses": 1}
+
+
+def test_table_write_invalidates_only_dependent_queries(bq_client):
+    """Tests that bumping a table generation invalidates queries reading that table"""
+    cache = QueryResultCache()
+    other_query = "SELECT COUNT(*) AS count FROM `proj.ds.metrics`"
+
+    cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS)
+    cache.get_or_query(bq_client, other_query)
+    cache.invalidate_table("proj.ds.alerts")
+    cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS)
+    cache.get_or_query(bq_client, other_query)
+
+    assert bq_client.query.call_count == 3
+    assert cache.get_stats()["invalidations"] == 1
+    assert cache.get_table_generation("`proj.ds.alerts`") == 1
+
+
+def test_ttl_and_overrides(bq_client):
+    """Tests TTL expiry and that configured per-query overrides take precedence"""
+    cache = QueryResultCache(default_ttl_seconds=60, ttl_overrides={"uncached": 0})
+
+    cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS, ttl_seconds=0.01)
+    time.sleep(0.02)
+    cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS)
+    assert bq_client.query.call_count == 2
+    assert cache.get_stats()["expirations"] == 1
+
+    cache.get_or_query(bq_client, "SELECT 1", name="uncached", ttl_seconds=60)
+    cache.get_or_query(bq_client, "SELECT 1", name="uncached", ttl_seconds=60)
+    assert bq_client.query.call_count == 4
+
+
+def test_lru_eviction(bq_client):
+    """Tests that the least recently used entry is evicted beyond max_entries"""
+    cache = QueryResultCache(max_entries=2)
+
+    cache.get_or_query(bq_client, "SELECT 1")
+    cache.get_or_query(bq_client, "SELECT 2")
+    cache.get_or_query(bq_client, "SELECT 1")
+    cache.get_or_query(bq_client, "SELECT 3")
+    cache.get_or_query(bq_client, "SELECT 1")
+
+    assert bq_client.query.call_count == 3
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_disabled_cache_always_queries(bq_client):
+    """Tests that a disabled cache passes every call through"""
+    cache = QueryResultCache(enabled=False)
+
+    cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS)
+    cache.get_or_query(bq_client, ALERTS_QUERY, PARAMS)
+
+    assert bq_client.query.call_count == 2
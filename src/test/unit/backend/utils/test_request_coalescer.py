@@ -0,0 +1,158 @@
+"""
+Unit tests for request coalescing primitives.
+Tests that concurrent identical calls share one execution, that failures reach every
+waiter without poisoning later calls, and the fresh, stale-while-revalidate and expired
+paths of the result cache for blocking and asyncio callers.
+"""
+
+import asyncio  # package_version: standard library
+import threading  # package_version: standard library
+import time  # package_version: standard library
+
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.concurrency.request_coalescer import (  # Module(src.backend.utils.concurrency.request_coalescer)
+    SingleFlight,
+    StaleWhileRevalidateCache
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def singleflight():
+    """SingleFlight with its own worker threads"""
+    flight = SingleFlight(max_workers=4)
+    yield flight
+    flight.close()
+
+
+def test_concurrent_callers_share_one_call(singleflight):
+    """Tests that callers arriving during a call wait for and share its result"""
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return {"status": "OK"}
+
+    futures = [singleflight.submit("summary", load) for _ in range(10)]
+    release.set()
+
+    assert [future.result(5) for future in futures] == [{"status": "OK"}] * 10
+    assert len(calls) == 1
+    assert singleflight.get_stats() == {"calls": 1, "coalesced": 9, "in_flight": 0}
+
+    # Once finished, the next caller starts a fresh call
+    assert singleflight.do("summary", load) == {"status": "OK"}
+    assert len(calls) == 2
+
+
+def test_failure_reaches_all_waiters_then_clears(singleflight):
+    """Tests that an error is shared by the waiting callers but not cached"""
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError("backend unavailable")
+
+    futures = [singleflight.submit("stats", fail) for _ in range(3)]
+    release.set()
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(5)
+
+    assert singleflight.do("stats", lambda: 42) == 42
+
+
+def test_independent_keys_run_concurrently(singleflight):
+    """Tests that a fan-out over distinct keys takes about as long as its slowest call"""
+    started = time.monotonic()
+    futures = [singleflight.submit(name, time.sleep, 0.2) for name in ("health", "alerts", "anomalies", "runs")]
+    for future in futures:
+        future.result(5)
+
+    assert time.monotonic() - started < 0.6
+
+
+def test_stale_while_revalidate(singleflight):
+    """Tests fresh hits, stale hits with a background refresh, and expired entries"""
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(max_age_seconds=10, stale_while_revalidate_seconds=30,
+                                      singleflight=singleflight, clock=clock)
+    versions = iter(range(1, 100))
+    refresh_started, release = threading.Event(), threading.Event()
+    release.set()
+
+    def load():
+        refresh_started.set()
+        release.wait(5)
+        return next(versions)
+
+    assert cache.get("summary", load) == 1
+    clock.now += 5
+    assert cache.get("summary", load) == 1
+
+    # Stale: served immediately while one refresh runs in the background
+    clock.now += 10
+    release.clear()
+    refresh_started.clear()
+    assert cache.get("summary", load) == 1
+    assert cache.get("summary", load) == 1
+    assert refresh_started.wait(5)
+    release.set()
+    while singleflight.in_flight("summary"):
+        time.sleep(0.01)
+    assert cache.get("summary", load) == 2
+
+    # Expired beyond the stale window: the caller waits for a new load
+    clock.now += 100
+    assert cache.get("summary", load) == 3
+    assert cache.get_stats()["stale_hits"] == 2
+    assert cache.get_stats()["calls"] == 3
+
+
+def test_failed_refresh_keeps_serving_stale_value(singleflight):
+    """Tests that a refresh error leaves the previous value in place"""
+    clock = FakeClock()
+    cache = StaleWhileRevalidateCache(max_age_seconds=1, stale_while_revalidate_seconds=60,
+                                      singleflight=singleflight, clock=clock)
+    cache.get("summary", lambda: "cached")
+
+    def fail():
+        raise RuntimeError("query timed out")
+
+    clock.now += 5
+    assert cache.get("summary", fail) == "cached"
+    while singleflight.in_flight("summary"):
+        time.sleep(0.01)
+    assert cache.get("summary", fail) == "cached"
+    assert cache.get_stats()["refresh_errors"] >= 1
+
+
+def test_async_callers_share_one_load(singleflight):
+    """Tests that concurrent asyncio viewers coalesce onto one backend call"""
+    cache = StaleWhileRevalidateCache(singleflight=singleflight)
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"pipeline_health": "OK"}
+
+    async def viewers():
+        return await asyncio.gather(*(cache.get_async("summary", load) for _ in range(20)))
+
+    results = asyncio.run(viewers())
+
+    assert results == [{"pipeline_health": "OK"}] * 20
+    assert len(calls) == 1
@@ -0,0 +1,160 @@
+"""
+Unit tests for the statistical sampling profiler in the monitoring utilities.
+Tests stack collection per logging context, top-N hot functions, folded and
+speedscope exports, bounded context cardinality, and release of the context
+published by threads that exit.
+"""
+
+import gc  # package_version: standard library
+import json  # package_version: standard library
+import signal  # package_version: standard library
+import threading  # package_version: standard library
+import time  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.logging.logger import set_context, clear_context, get_thread_context  # Module(src.backend.utils.logging.logger)
+from src.backend.utils.monitoring.profiler import (  # Module(src.backend.utils.monitoring.profiler)
+    SamplingProfiler,
+    OVERFLOW_CONTEXT,
+    format_context_key
+)
+from src.backend.utils.monitoring import profiler as profiler_module  # Module(src.backend.utils.monitoring.profiler)
+
+
+def busy_task_function(stop_event):
+    """Spins until stopped so samples land in this function"""
+    while not stop_event.is_set():
+        sum(range(100))
+
+
+@pytest.fixture
+def worker():
+    """Provides a thread running busy_task_function under a pipeline logging context"""
+    stop_event = threading.Event()
+    ready = threading.Event()
+
+    def run():
+        set_context({"pipeline_id": "pipeline-1", "task_id": "load"})
+        ready.set()
+        try:
+            busy_task_function(stop_event)
+        finally:
+            clear_context()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    ready.wait(5)
+    yield thread
+    stop_event.set()
+    thread.join(5)
+
+
+def test_samples_are_attributed_to_context(worker):
+    """Tests that stacks are grouped by the sampled thread's logging context"""
+    profiler = SamplingProfiler({"context_keys": ["pipeline_id", "task_id"]})
+    for _ in range(20):
+        profiler.sample_once()
+
+    context_key = (("pipeline_id", "pipeline-1"), ("task_id", "load"))
+    assert profiler.get_contexts()[context_key] == 20
+
+    top = profiler.get_top_functions(5, context_key=context_key)
+    assert any("busy_task_function" in entry["function"] for entry in top)
+
+
+def test_folded_export(worker, tmp_path):
+    """Tests that folded stacks are written root first with the context prefix"""
+    profiler = SamplingProfiler({"context_keys": ["pipeline_id"]})
+    for _ in range(5):
+        profiler.sample_once()
+
+    output = tmp_path / "profile.folded"
+    assert profiler.export_folded(str(output))
+
+    lines = [line for line in output.read_text().splitlines() if line.startswith("pipeline_id=pipeline-1;")]
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert "busy_task_function" in stack
+    assert int(count) > 0
+
+
+def test_speedscope_export(worker, tmp_path):
+    """Tests that the speedscope document has one sampled profile per context"""
+    profiler = SamplingProfiler({"context_keys": ["pipeline_id"]})
+    for _ in range(5):
+        profiler.sample_once()
+
+    output = tmp_path / "profile.speedscope.json"
+    assert profiler.export_speedscope(str(output))
+
+    document = json.loads(output.read_text())
+    names = [profile["name"] for profile in document["profiles"]]
+    assert "pipeline_id=pipeline-1" in names
+    for profile in document["profiles"]:
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert all(index < len(document["shared"]["frames"]) for sample in profile["samples"] for index in sample)
+
+
+def test_context_cardinality_is_bounded():
+    """Tests that new contexts beyond max_contexts share the overflow bucket"""
+    profiler = SamplingProfiler({"max_contexts": 2})
+    for index in range(5):
+        profiler._record((("correlation_id", str(index)),), ("main (app.py:1)",))
+
+    contexts = profiler.get_contexts()
+    assert len(contexts) == 3
+    assert contexts[OVERFLOW_CONTEXT] == 3
+    assert format_context_key(OVERFLOW_CONTEXT) == "context=other"
+
+
+def test_background_sampling_start_stop(worker):
+    """Tests that the background sampler collects samples and stops cleanly"""
+    profiler = SamplingProfiler({"hz": 200, "report_interval_seconds": 0})
+    assert profiler.start()
+    threading.Event().wait(0.2)
+    profiler.stop()
+
+    stats = profiler.get_stats()
+    assert not stats["running"]
+    assert stats["samples"] > 0
+    assert stats["recorded_stacks"] > 0
+
+
+@pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="requires interval timers")
+def test_signal_sampling_applies_overhead_budget(monkeypatch):
+    """Tests that signal mode lowers the sampling rate once the overhead exceeds its budget"""
+    monkeypatch.setattr(profiler_module, "DEFAULT_SIGNAL_MAINTENANCE_INTERVAL", 0.05)
+    profiler = SamplingProfiler({"mode": "signal", "hz": 200, "max_overhead": 0.0, "report_interval_seconds": 0})
+    assert profiler.start()
+    deadline = time.monotonic() + 2.0
+    while profiler.current_hz == 200 and time.monotonic() < deadline:
+        sum(range(1000))
+    profiler.stop()
+
+    assert profiler.mode == "signal"
+    assert profiler.get_stats()["samples"] >= 10
+    assert profiler.current_hz < 200
+
+
+def test_invalid_mode_is_rejected():
+    """Tests that unknown sampling modes raise an error"""
+    with pytest.raises(ValueError):
+        SamplingProfiler({"mode": "perf"})
+
+
+def test_exited_thread_context_is_released():
+    """Tests that a thread exiting with its context still set does not leave it published"""
+    thread_ids = []
+
+    def run():
+        set_context({"pipeline_id": "pipeline-2"})
+        thread_ids.append(threading.get_ident())
+        assert get_thread_context(thread_ids[0]) == {"pipeline_id": "pipeline-2"}
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join(5)
+    gc.collect()
+
+    assert get_thread_context(thread_ids[0]) == {}
@@ -0,0 +1,175 @@
+"""
+Unit tests for the batching span processor used by TraceClient.
+Tests deterministic head sampling, tail sampling of error and slow traces,
+bounded queueing, batched export and propagation of the sampling decision.
+"""
+
+import datetime  # package_version: standard library
+
+from src.backend.utils.monitoring.span_processor import (  # Module(src.backend.utils.monitoring.span_processor)
+    BatchSpanProcessor,
+    should_sample_trace
+)
+from src.backend.utils.monitoring import tracer  # Module(src.backend.utils.monitoring.tracer)
+from src.backend.utils.monitoring.tracer import Span, TraceContext, generate_trace_id, generate_span_id  # Module(src.backend.utils.monitoring.tracer)
+
+
+def create_ended_span(trace_id: str, parent_span_id: str = None, duration_ms: float = 1.0,
+                      error: bool = False, remote_parent: bool = False) -> Span:
+    """Creates an ended span without a trace client"""
+    start_time = datetime.datetime(2023, 1, 1, 12, 0, 0)
+    span = Span(name="test_operation", trace_id=trace_id, span_id=generate_span_id(),
+                parent_span_id=parent_span_id, start_time=start_time, remote_parent=remote_parent)
+    if error:
+        span.add_attribute("error", True)
+    span.end(start_time + datetime.timedelta(milliseconds=duration_ms))
+    return span
+
+
+class ExportRecorder:
+    """Collects exported batches"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, spans):
+        self.batches.append(list(spans))
+        return True
+
+    @property
+    def spans(self):
+        return [span for batch in self.batches for span in batch]
+
+
+def test_should_sample_trace_is_deterministic():
+    """Tests that head sampling gives the same decision for the same trace ID"""
+    trace_ids = [generate_trace_id() for _ in range(2000)]
+
+    decisions = [should_sample_trace(trace_id, 0.25) for trace_id in trace_ids]
+
+    assert decisions == [should_sample_trace(trace_id, 0.25) for trace_id in trace_ids]
+    assert 0.15 < sum(decisions) / len(decisions) < 0.35
+    assert should_sample_trace(trace_ids[0], 1.0)
+    assert not should_sample_trace(trace_ids[0], 0.0)
+
+
+def test_head_sampled_spans_are_exported_in_batches():
+    """Tests that sampled spans are queued and exported in batches of the configured size"""
+    recorder = ExportRecorder()
+    processor = BatchSpanProcessor(recorder, {"sampling_rate": 1.0, "max_export_batch_size": 2}, start_thread=False)
+    trace_id = generate_trace_id()
+
+    for _ in range(5):
+        processor.on_end(create_ended_span(trace_id, parent_span_id="parent"))
+
+    assert recorder.batches == []
+    assert processor.force_flush()
+    assert [len(batch) for batch in recorder.batches] == [2, 2, 1]
+
+
+def test_tail_sampling_keeps_error_traces():
+    """Tests that unsampled traces containing an error are kept in full"""
+    recorder = ExportRecorder()
+    processor = BatchSpanProcessor(recorder, {"sampling_rate": 0.0}, start_thread=False)
+    trace_id = generate_trace_id()
+
+    processor.on_end(create_ended_span(trace_id, parent_span_id="root", error=True))
+    processor.on_end(create_ended_span(trace_id, parent_span_id=None))
+    processor.force_flush()
+
+    assert len(recorder.spans) == 2
+
+
+def test_tail_sampling_keeps_slow_traces_and_discards_others():
+    """Tests that slow traces are kept while fast, successful traces are discarded"""
+    recorder = ExportRecorder()
+    processor = BatchSpanProcessor(recorder, {"sampling_rate": 0.0, "slow_span_threshold_ms": 500},
+                                   start_thread=False)
+    slow_trace_id = generate_trace_id()
+    fast_trace_id = generate_trace_id()
+
+    processor.on_end(create_ended_span(slow_trace_id, duration_ms=800))
+    processor.on_end(create_ended_span(fast_trace_id, duration_ms=10))
+    processor.force_flush()
+
+    assert [span.trace_id for span in recorder.spans] == [slow_trace_id]
+    assert processor.get_stats()["spans_discarded"] == 1
+
+
+def test_span_with_remote_parent_completes_the_trace():
+    """Tests that the local root of a trace continued from another process triggers the tail decision"""
+    recorder = ExportRecorder()
+    processor = BatchSpanProcessor(recorder, {"sampling_rate": 0.0}, start_thread=False)
+    trace_id = generate_trace_id()
+
+    processor.on_end(create_ended_span(trace_id, parent_span_id="local-root", error=True))
+    processor.on_end(create_ended_span(trace_id, parent_span_id="remote-parent", remote_parent=True))
+
+    assert processor._pending_traces == {}
+    processor.force_flush()
+    assert len(recorder.spans) == 2
+
+
+def test_queue_is_bounded():
+    """Tests that spans beyond the queue capacity are dropped and counted"""
+    recorder = ExportRecorder()
+    processor = BatchSpanProcessor(recorder, {"sampling_rate": 1.0, "max_queue_size": 3}, start_thread=False)
+    trace_id = generate_trace_id()
+
+    for _ in range(5):
+        processor.on_end(create_ended_span(trace_id))
+
+    assert processor.get_stats()["spans_dropped"] == 2
+    processor.force_flush()
+    assert len(recorder.spans) == 3
+
+
+def test_shutdown_exports_pending_spans():
+    """Tests that shutdown flushes queued spans from the background thread"""
+    recorder = ExportRecorder()
+    processor = BatchSpanProcessor(recorder, {"sampling_rate": 1.0, "schedule_delay_seconds": 60})
+
+    processor.on_end(create_ended_span(generate_trace_id()))
+    processor.shutdown()
+
+    assert len(recorder.spans) == 1
+
+
+class SamplingTraceClient:
+    """Trace client stand-in that creates spans and applies a fixed head sampling decision"""
+
+    def __init__(self, sampled: bool):
+        self.sampled = sampled
+
+    def is_sampled(self, trace_id):
+        return self.sampled
+
+    def create_span(self, name, trace_id, parent_span_id=None, attributes=None, remote_parent=False):
+        return Span(name=name, trace_id=trace_id, span_id=generate_span_id(), parent_span_id=parent_span_id,
+                    remote_parent=remote_parent)
+
+
+def test_trace_context_propagates_sampling_decision(monkeypatch):
+    """Tests that the trace options of a TraceContext follow the head sampling decision"""
+    monkeypatch.setattr(tracer, "is_tracing_enabled", lambda: True)
+    monkeypatch.setattr(tracer, "set_correlation_id", lambda correlation_id: None)
+    for sampled, expected_options in [(True, "1"), (False, "0")]:
+        monkeypatch.setattr(tracer, "_trace_client", SamplingTraceClient(sampled))
+        with TraceContext("operation", trace_id=generate_trace_id()) as span:
+            context = tracer.extract_current_trace_data()
+            assert context["trace_id"] == span.trace_id
+            assert context["trace_options"] == expected_options
+        assert tracer.extract_current_trace_data() == {}
+
+
+def test_trace_context_with_explicit_parent_is_local_root(monkeypatch):
+    """Tests that a TraceContext continuing a remote trace marks its parent as remote, unlike nested spans"""
+    monkeypatch.setattr(tracer, "is_tracing_enabled", lambda: True)
+    monkeypatch.setattr(tracer, "set_correlation_id", lambda correlation_id: None)
+    monkeypatch.setattr(tracer, "_trace_client", SamplingTraceClient(False))
+
+    with TraceContext("handler", trace_id=generate_trace_id(), parent_span_id=generate_span_id()) as root_span:
+        context = TraceContext("step")
+        assert context._span.parent_span_id == root_span.span_id
+        assert not context._span.remote_parent
+    assert root_span.remote_parent
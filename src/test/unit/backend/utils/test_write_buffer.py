@@ -0,0 +1,205 @@
+"""
+Unit tests for the micro-batching write buffer.
+Tests per-table coalescing, size-triggered flushes, durable waits, retries with
+stable insert IDs, requeueing after exhausted retries, retrying and dead-lettering
+rows rejected individually, the pending row limit and unbuffered mode.
+"""
+
+import threading  # package_version: standard library
+import pytest  # package_version: 7.3.1
+
+from src.backend.utils.storage.write_buffer import WriteBuffer  # Module(src.backend.utils.storage.write_buffer)
+
+FAST_RETRY = {"max_attempts": 3, "backoff_strategy": "constant", "base_delay": 0.001, "max_delay": 0.001}
+
+
+class RecordingClient:
+    """Client stub recording insert_rows calls, optionally failing the first attempts"""
+
+    def __init__(self, failures=0, raise_errors=False, bad_ids=()):
+        self.calls = []
+        self.failures = failures
+        self.raise_errors = raise_errors
+        self.bad_ids = set(bad_ids)
+        self.inserted_ids = set()
+        self.lock = threading.Lock()
+
+    def insert_rows(self, *args, row_ids=None, return_errors=False):
+        with self.lock:
+            self.calls.append((args[:-1], list(args[-1]), list(row_ids)))
+            if self.failures:
+                self.failures -= 1
+                if self.raise_errors:
+                    raise ConnectionError("Simulated streaming insert failure")
+                return [{"index": index, "errors": [{"reason": "backendError"}]} for index in range(len(row_ids))]
+            if self.bad_ids & set(row_ids):
+                # Like BigQuery, one invalid row stops the whole request
+                return [{"index": index, "errors": [{"reason": "invalid" if row_id in self.bad_ids else "stopped"}]}
+                        for index, row_id in enumerate(row_ids)]
+            self.inserted_ids.update(row_ids)
+            return []
+
+
+def test_rows_are_coalesced_per_table():
+    """Tests that single-row appends are written as one insert per table on flush"""
+    client = RecordingClient()
+    buffer = WriteBuffer(client, start_thread=False)
+
+    for index in range(3):
+        buffer.append("ds", "alerts", [{"id": index}], insert_ids=[f"alert-{index}"])
+    buffer.append("ds", "metrics", [{"id": 9}], project="proj")
+
+    assert client.calls == []
+    assert buffer.flush() == 4
+    assert sorted(call[0] for call in client.calls) == [("ds", "alerts"), ("proj", "ds", "metrics")]
+    alert_call = next(call for call in client.calls if call[0] == ("ds", "alerts"))
+    assert alert_call[2] == ["alert-0", "alert-1", "alert-2"]
+    assert buffer.get_stats()["pending_rows"] == 0
+
+
+def test_full_batch_wakes_flush_thread():
+    """Tests that reaching the batch size flushes without waiting for the interval"""
+    client = RecordingClient()
+    buffer = WriteBuffer(client, {"flush_interval_seconds": 60, "max_batch_rows": 5})
+    delivered = threading.Event()
+
+    try:
+        for index in range(5):
+            buffer.append("ds", "alerts", [{"id": index}], on_delivered=delivered.set if index == 4 else None)
+        assert delivered.wait(5)
+        assert len(client.calls) == 1 and len(client.calls[0][1]) == 5
+    finally:
+        buffer.close()
+
+
+def test_durable_append_blocks_until_written():
+    """Tests that wait=True writes pending rows of the table and reports success"""
+    client = RecordingClient()
+    buffer = WriteBuffer(client, {"flush_interval_seconds": 60})
+    delivered = []
+
+    try:
+        buffer.append("ds", "alerts", [{"id": 1}])
+        assert buffer.append("ds", "alerts", [{"id": 2}], wait=True, on_delivered=lambda: delivered.append(True))
+        assert delivered == [True]
+        assert [row["id"] for row in client.calls[0][1]] == [1, 2]
+    finally:
+        buffer.close()
+
+
+@pytest.mark.parametrize("raise_errors", [False, True])
+def test_failed_batches_retry_with_same_insert_ids(raise_errors):
+    """Tests that retries resend identical insert IDs so partial successes deduplicate"""
+    client = RecordingClient(failures=2, raise_errors=raise_errors)
+    buffer = WriteBuffer(client, FAST_RETRY, start_thread=False)
+
+    buffer.append("ds", "alerts", [{"id": 1}, {"id": 2}], insert_ids=["a", "b"])
+
+    assert buffer.flush() == 2
+    assert len(client.calls) == 3
+    assert all(call[2] == ["a", "b"] for call in client.calls)
+    assert buffer.get_stats()["failed_attempts"] == 2
+
+
+class GatedBackoff:
+    """Backoff strategy that blocks until released, signalling when a retry is waiting"""
+
+    def __init__(self):
+        self.waiting = threading.Event()
+        self.release = threading.Event()
+
+    def wait(self, attempt):
+        self.waiting.set()
+        self.release.wait(5)
+
+
+def test_backoff_does_not_block_other_flushes():
+    """Tests that a batch backing off before a retry does not hold up flushes of other tables"""
+    client = RecordingClient(failures=1)
+    buffer = WriteBuffer(client, FAST_RETRY, start_thread=False)
+    buffer._backoff = backoff = GatedBackoff()
+    buffer.append("ds", "alerts", [{"id": 1}], insert_ids=["a"])
+    buffer.append("ds", "metrics", [{"id": 2}], insert_ids=["m"])
+
+    retrying = threading.Thread(target=buffer.flush, args=(("ds", "alerts"),))
+    retrying.start()
+    assert backoff.waiting.wait(5)
+
+    assert buffer.flush(("ds", "metrics")) == 1
+    assert client.inserted_ids == {"m"}
+
+    backoff.release.set()
+    retrying.join(5)
+    assert client.inserted_ids == {"a", "m"}
+    stats = buffer.get_stats()
+    assert stats["failed_attempts"] == 1
+    assert stats["rows_written"] == 2
+
+
+def test_exhausted_retries_keep_rows_queued():
+    """Tests at-least-once delivery: rows stay pending after failed requests and are written later"""
+    client = RecordingClient(failures=3, raise_errors=True)
+    buffer = WriteBuffer(client, FAST_RETRY, start_thread=False)
+
+    assert buffer.append("ds", "alerts", [{"id": 1}], insert_ids=["a"], wait=True, timeout=1) is False
+    assert buffer.get_stats()["pending_rows"] == 1
+    assert buffer.get_stats()["failed_batches"] == 1
+
+    assert buffer.flush() == 1
+    assert client.inserted_ids == {"a"}
+
+
+def test_rejected_rows_are_dead_lettered_without_blocking_the_batch():
+    """Tests that only the invalid row is dropped and the rows stopped with it are written"""
+    client = RecordingClient(bad_ids=["b"])
+    buffer = WriteBuffer(client, FAST_RETRY, start_thread=False)
+
+    assert buffer.append("ds", "alerts", [{"id": 1}, {"id": 2}, {"id": 3}], insert_ids=["a", "b", "c"],
+                         wait=True, timeout=1) is False
+    assert buffer.append("ds", "alerts", [{"id": 4}], insert_ids=["d"], wait=True, timeout=1)
+
+    assert client.inserted_ids == {"a", "c", "d"}
+    assert client.calls[1][2] == ["a", "c"]
+    assert [letter["insert_id"] for letter in buffer.get_dead_letters()] == ["b"]
+    stats = buffer.get_stats()
+    assert stats["pending_rows"] == 0
+    assert stats["rows_dead_lettered"] == 1
+
+
+def test_rows_failing_every_attempt_are_dead_lettered():
+    """Tests that row errors are retried at most max_attempts times"""
+    client = RecordingClient(failures=3)
+    buffer = WriteBuffer(client, FAST_RETRY, start_thread=False)
+
+    buffer.append("ds", "alerts", [{"id": 1}], insert_ids=["a"])
+
+    assert buffer.flush() == 0
+    assert len(client.calls) == 3
+    assert buffer.get_stats()["pending_rows"] == 0
+    assert buffer.get_dead_letters()[0]["errors"] == [{"reason": "backendError"}]
+
+
+def test_pending_rows_are_bounded():
+    """Tests that appends are refused once the buffer is full and cannot be flushed"""
+    client = RecordingClient(failures=100, raise_errors=True)
+    buffer = WriteBuffer(client, {**FAST_RETRY, "max_pending_rows": 3}, start_thread=False)
+
+    assert buffer.append("ds", "alerts", [{"id": 1}, {"id": 2}])
+    assert buffer.append("ds", "alerts", [{"id": 3}, {"id": 4}]) is False
+    assert buffer.get_stats()["pending_rows"] == 2
+    assert buffer.get_stats()["rows_refused"] == 2
+
+    client.failures = 0
+    assert buffer.append("ds", "alerts", [{"id": 3}, {"id": 4}])
+    assert buffer.get_stats()["pending_rows"] == 2
+    assert len(client.inserted_ids) == 2
+
+
+def test_disabled_buffer_writes_immediately():
+    """Tests that a disabled buffer inserts synchronously"""
+    client = RecordingClient()
+    buffer = WriteBuffer(client, {"enabled": False})
+
+    assert buffer.append("ds", "alerts", [{"id": 1}])
+    assert len(client.calls) == 1
+    assert buffer.get_stats()["pending_rows"] == 0